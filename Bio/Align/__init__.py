@@ -22,6 +22,7 @@ import types
 import warnings
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from itertools import zip_longest
 
 try:
@@ -3971,6 +3972,28 @@ class PairwiseAlignments(AlignmentsAbstractBaseClass):
         self._index = -1
 
 
+class _PathList:
+    """Iterator over a list of alignment paths, as used by PairwiseAlignments (PRIVATE)."""
+
+    def __init__(self, paths):
+        self._paths = paths
+        self._index = 0
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __next__(self):
+        try:
+            path = self._paths[self._index]
+        except IndexError:
+            raise StopIteration from None
+        self._index += 1
+        return path
+
+    def reset(self):
+        self._index = 0
+
+
 class PairwiseAligner(_pairwisealigner.PairwiseAligner):
     """Performs pairwise sequence alignment using dynamic programming.
 
@@ -4003,6 +4026,16 @@ class PairwiseAligner(_pairwisealigner.PairwiseAligner):
     will return a generator yielding the alignments between the two
     sequences.
 
+    For similar sequences, the alignment can be restricted to a band around the
+    diagonal of the dynamic programming matrix by setting the "band_width"
+    attribute to a non-negative integer w. Only alignment paths passing through
+    cells (i, j) with -w <= j - i <= w are then considered, where the band is
+    widened by the difference in length between the two sequences, so that the
+    calculation time is proportional to the length of the first sequence times
+    the width of the band. With a band, the "align" method returns a single
+    optimal alignment within the band. Gap score functions cannot be used with
+    a band.
+
     Some examples:
 
     >>> from Bio import Align
@@ -4260,114 +4293,153 @@ AlignmentCounts object returned by the .counts method of an Alignment object."""
             key = new_key
         return _pairwisealigner.PairwiseAligner.__getattribute__(self, key)
 
-    def align(self, seqA, seqB, strand="+"):
-        """Return the alignments of two sequences using PairwiseAligner."""
-        self.warn_defaults_changed()  # FIXME remove this after 1.87 is out
-        if isinstance(seqA, (bytes, Seq, MutableSeq, SeqRecord)):
-            sA = bytes(seqA)
-            sA = np.frombuffer(sA, dtype=np.uint8).astype(np.int32)
-        elif isinstance(seqA, str):
-            sA = np.frombuffer(bytearray(seqA, self.codec), dtype=np.int32)
-        else:
-            try:
-                memoryview(seqA)
-            except TypeError:
-                substitution_matrix = self.substitution_matrix
-                if substitution_matrix is None:
-                    alphabet = []
-                    for item in seqA:
-                        if not any(item == letter for letter in alphabet):
-                            alphabet.append(item)
-                else:
-                    alphabet = substitution_matrix.alphabet
-                sA = np.fromiter(
-                    map(alphabet.index, seqA), dtype=np.int32, count=len(seqA)
-                )
+    def _encode_sequence(self, sequence, alphabet):
+        """Return the sequence as an array of indices for the C code (PRIVATE).
+
+        For sequences of arbitrary objects, the indices refer to the alphabet
+        of the substitution matrix, if defined, or otherwise to the alphabet
+        list, which is extended with any new letters found in the sequence.
+        """
+        if isinstance(sequence, (bytes, Seq, MutableSeq, SeqRecord)):
+            sequence = bytes(sequence)
+            return np.frombuffer(sequence, dtype=np.uint8).astype(np.int32)
+        elif isinstance(sequence, str):
+            return np.frombuffer(bytearray(sequence, self.codec), dtype=np.int32)
+        try:
+            memoryview(sequence)
+        except TypeError:
+            substitution_matrix = self.substitution_matrix
+            if substitution_matrix is None:
+                for item in sequence:
+                    if not any(item == letter for letter in alphabet):
+                        alphabet.append(item)
             else:
-                sA = seqA  # C code will check the dtype
+                alphabet = substitution_matrix.alphabet
+            return np.fromiter(
+                map(alphabet.index, sequence), dtype=np.int32, count=len(sequence)
+            )
+        else:
+            return sequence  # C code will check the dtype
+
+    def align(self, seqA, seqB, strand="+", linear_memory=False):
+        """Return the alignments of two sequences using PairwiseAligner.
+
+        By default, the traceback matrix is stored to find all optimal
+        alignments, requiring memory proportional to the product of the
+        sequence lengths. If linear_memory is True, a single optimal alignment
+        is found using the divide-and-conquer algorithm of Hirschberg (as
+        extended to affine gap scores by Myers and Miller), which requires
+        memory proportional to the sum of the sequence lengths only, at the
+        cost of about twice the calculation time. This is useful to align long
+        sequences such as complete genomes. Gap score functions are not
+        supported in this case, and in "fogsaa" mode a global alignment is
+        calculated.
+
+        If the band_width attribute of the aligner is set, a single optimal
+        alignment within the band is returned (see the band_width attribute
+        for details), using memory proportional to the length of the first
+        sequence times the width of the band. The linear_memory argument is
+        then ignored.
+
+        >>> from Bio.Align import PairwiseAligner
+        >>> aligner = PairwiseAligner(match_score=2, mismatch_score=-1)
+        >>> aligner.open_gap_score = -2
+        >>> aligner.extend_gap_score = -0.5
+        >>> alignments = aligner.align("GAACTTGCAGTCAG", "GAACTGCATCAG", linear_memory=True)
+        >>> len(alignments)
+        1
+        >>> print(alignments[0])
+        target            0 GAACTTGCAGTCAG 14
+                          0 ||||-||||-|||| 14
+        query             0 GAAC-TGCA-TCAG 12
+        <BLANKLINE>
+        >>> alignments.score
+        20.0
+        """
+        self.warn_defaults_changed()  # FIXME remove this after 1.87 is out
+        alphabet = []
+        sA = self._encode_sequence(seqA, alphabet)
         if strand == "+":
             sB = seqB
         else:  # strand == "-":
             sB = reverse_complement(seqB)
-        if isinstance(seqB, (bytes, Seq, MutableSeq, SeqRecord)):
-            sB = bytes(sB)
-            sB = np.frombuffer(sB, dtype=np.uint8).astype(np.int32)
-        elif isinstance(seqB, str):
-            sB = np.frombuffer(bytearray(sB, self.codec), dtype=np.int32)
+        sB = self._encode_sequence(sB, alphabet)
+        if self.band_width is None and not linear_memory:
+            score, paths = super().align(sA, sB, strand)
         else:
-            try:
-                memoryview(seqB)
-            except TypeError:
-                substitution_matrix = self.substitution_matrix
-                if substitution_matrix is None:
-                    try:
-                        alphabet
-                    except NameError:
-                        alphabet = []
-                    for item in seqB:
-                        if not any(item == letter for letter in alphabet):
-                            alphabet.append(item)
-                else:
-                    alphabet = substitution_matrix.alphabet
-                sB = np.fromiter(
-                    map(alphabet.index, seqB), dtype=np.int32, count=len(seqB)
-                )
+            if self.band_width is None:
+                score, path = super().align_linear(sA, sB, strand)
             else:
-                sB = seqB  # C code will test the dtype
-        score, paths = super().align(sA, sB, strand)
+                score, path = super().align_banded(sA, sB, strand)
+            paths = _PathList([] if path is None else [path])
         alignments = PairwiseAlignments(seqA, seqB, score, paths)
         return alignments
 
     def score(self, seqA, seqB, strand="+"):
         """Return the alignment score of two sequences using PairwiseAligner."""
         self.warn_defaults_changed()  # FIXME remove this after 1.87 is out
-        if isinstance(seqA, (bytes, Seq, MutableSeq, SeqRecord)):
-            seqA = bytes(seqA)
-            seqA = np.frombuffer(seqA, dtype=np.uint8).astype(np.int32)
-        elif isinstance(seqA, str):
-            seqA = np.frombuffer(bytearray(seqA, self.codec), dtype="i")
-        else:
-            try:
-                memoryview(seqA)
-            except TypeError:
-                substitution_matrix = self.substitution_matrix
-                if substitution_matrix is None:
-                    alphabet = []
-                    for item in seqA:
-                        if not any(item == letter for letter in alphabet):
-                            alphabet.append(item)
-                else:
-                    alphabet = substitution_matrix.alphabet
-                seqA = np.fromiter(
-                    map(alphabet.index, seqA), dtype=np.int32, count=len(seqA)
-                )
+        alphabet = []
+        seqA = self._encode_sequence(seqA, alphabet)
         if strand == "-":
             seqB = reverse_complement(seqB)
-        if isinstance(seqB, (bytes, Seq, MutableSeq, SeqRecord)):
-            seqB = bytes(seqB)
-            seqB = np.frombuffer(seqB, dtype=np.uint8).astype(np.int32)
-        elif isinstance(seqB, str):
-            seqB = np.frombuffer(bytearray(seqB, self.codec), dtype="i")
-        else:
-            try:
-                memoryview(seqB)
-            except TypeError:
-                substitution_matrix = self.substitution_matrix
-                if substitution_matrix is None:
-                    try:
-                        alphabet
-                    except NameError:
-                        alphabet = []
-                    for item in seqB:
-                        if not any(item == letter for letter in alphabet):
-                            alphabet.append(item)
-                else:
-                    alphabet = substitution_matrix.alphabet
-                seqB = np.fromiter(
-                    map(alphabet.index, seqB), dtype=np.int32, count=len(seqB)
-                )
+        seqB = self._encode_sequence(seqB, alphabet)
         return super().score(seqA, seqB, strand)
 
+    def score_many(self, seqA, seqsB, strand="+", threads=1):
+        """Return the alignment scores of one sequence against many sequences.
+
+        Arguments:
+         - seqA - the target sequence.
+         - seqsB - an iterable of query sequences.
+         - strand - "+" (default) or "-"; the strand of the query sequences
+           to align to the target sequence, as for the score method.
+         - threads - the number of threads used to calculate the scores.
+
+        This returns a NumPy array with the same scores as calling the score
+        method on seqA and each sequence in seqsB, but the target sequence is
+        encoded only once, and the scores are calculated in C without holding
+        the global interpreter lock. With threads larger than 1, the query
+        sequences are split into chunks that are scored in parallel in a
+        pool of threads, so that multiple cores are used without the cost of
+        pickling the sequences for a pool of processes. The
+        Waterman-Smith-Beyer algorithm (used with gap score functions) and
+        the FOGSAA algorithm hold the global interpreter lock.
+
+        >>> from Bio.Align import PairwiseAligner
+        >>> aligner = PairwiseAligner(mode="local", match_score=2, mismatch_score=-1)
+        >>> aligner.gap_score = -2
+        >>> scores = aligner.score_many("GAACT", ["GAT", "AACTG", "TTTT"])
+        >>> scores.tolist()
+        [4.0, 8.0, 2.0]
+        >>> aligner.score("GAACT", "AACTG")
+        8.0
+        """
+        self.warn_defaults_changed()  # FIXME remove this after 1.87 is out
+        alphabet = []
+        sA = self._encode_sequence(seqA, alphabet)
+        if strand == "-":
+            seqsB = [reverse_complement(seqB) for seqB in seqsB]
+        sB = [self._encode_sequence(seqB, alphabet) for seqB in seqsB]
+        n = len(sB)
+        scores = np.empty(n)
+        score_many = super().score_many
+        if threads is None or threads <= 1 or n < 2:
+            score_many(sA, sB, scores, strand)
+        else:
+            # use several chunks per thread to balance the load if the query
+            # sequences differ in length
+            boundaries = np.linspace(0, n, min(n, 4 * threads) + 1).astype(int)
+            with ThreadPoolExecutor(threads) as executor:
+                futures = [
+                    executor.submit(
+                        score_many, sA, sB[start:end], scores[start:end], strand
+                    )
+                    for start, end in zip(boundaries[:-1], boundaries[1:])
+                ]
+                for future in futures:
+                    future.result()
+        return scores
+
     def __getstate__(self):
         state = {
             "wildcard": self.wildcard,
@@ -4386,6 +4458,8 @@ AlignmentCounts object returned by the .counts method of an Alignment object."""
             "mode": self.mode,
             "epsilon": self.epsilon,
         }
+        if self.band_width is not None:
+            state["band_width"] = self.band_width
         if self.substitution_matrix is None:
             state["match_score"] = self.match_score
             state["mismatch_score"] = self.mismatch_score
@@ -4409,6 +4483,7 @@ AlignmentCounts object returned by the .counts method of an Alignment object."""
         self.extend_right_deletion_score = state["extend_right_deletion_score"]
         self.mode = state["mode"]
         self.epsilon = state["epsilon"]
+        self.band_width = state.get("band_width")
         substitution_matrix = state.get("substitution_matrix")
         if substitution_matrix is None:
             self.match_score = state["match_score"]
@@ -4627,6 +4702,7 @@ class CodonAligner(_codonaligner.CodonAligner):
 # fmt: off
 formats = (
     "a2m",        # A2M files created by align2model or hmmscore
+    "bam",        # Binary Sequence Alignment/Map (BAM) format
     "bed",        # BED (Browser Extensible Data) files
     "bigbed",     # bigBed format
     "bigmaf",     # MAF file saved as a bigBed file
@@ -1800,6 +1800,7 @@ Aligner_init(Aligner *self, PyObject *args, PyObject *kwds)
     self->algorithm = Unknown;
     self->alphabet = NULL;
     self->wildcard = -1;
+    self->band_width = -1;
     return 0;
 }
 
@@ -1950,6 +1951,8 @@ Aligner_str(Aligner* self)
         p += sprintf(p, "  extend_right_deletion_score: %s\n", value);
         PyMem_Free(value);
     }
+    if (self->band_width >= 0)
+        p += sprintf(p, "  band_width: %d\n", self->band_width);
     switch (self->mode) {
         case Global: sprintf(p, "  mode: global\n"); break;
         case Local: sprintf(p, "  mode: local\n"); break;
@@ -3856,6 +3859,43 @@ Aligner_set_wildcard(Aligner* self, PyObject* value, void* closure)
     return 0;
 }
 
+static char Aligner_band_width__doc__[] =
+"maximum distance of the alignment path from the diagonal, or None";
+
+static PyObject*
+Aligner_get_band_width(Aligner* self, void* closure)
+{
+    if (self->band_width == -1) {
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    return PyLong_FromLong(self->band_width);
+}
+
+static int
+Aligner_set_band_width(Aligner* self, PyObject* value, void* closure)
+{
+    long band_width;
+    if (value == Py_None) {
+        self->band_width = -1;
+        return 0;
+    }
+    if (!PyLong_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "band_width should be a non-negative integer, or None");
+        return -1;
+    }
+    band_width = PyLong_AsLong(value);
+    if (band_width == -1 && PyErr_Occurred()) return -1;
+    if (band_width < 0 || band_width > INT_MAX) {
+        PyErr_SetString(PyExc_ValueError,
+                        "band_width should be a non-negative integer, or None");
+        return -1;
+    }
+    self->band_width = (int)band_width;
+    return 0;
+}
+
 static char Aligner_algorithm__doc__[] = "alignment algorithm";
 
 static PyObject*
@@ -4128,6 +4168,10 @@ static PyGetSetDef Aligner_getset[] = {
         (getter)Aligner_get_wildcard,
         (setter)Aligner_set_wildcard,
         Aligner_wildcard__doc__, NULL},
+    {"band_width",
+        (getter)Aligner_get_band_width,
+        (setter)Aligner_set_band_width,
+        Aligner_band_width__doc__, NULL},
     {"algorithm",
         (getter)Aligner_get_algorithm,
         (setter)NULL,
@@ -4585,13 +4629,12 @@ static struct fogsaa_queue_node fogsaa_queue_pop(struct fogsaa_queue *queue) {
             right_gap_extend_B = self->extend_left_deletion_score; \
             break; \
         default: \
-            PyErr_SetString(PyExc_RuntimeError, "strand was neither '+' nor '-'"); \
-            return NULL; \
+            return -2; \
     } \
 \
     /* Needleman-Wunsch algorithm */ \
-    row = PyMem_Malloc((nB+1)*sizeof(double)); \
-    if (!row) return PyErr_NoMemory(); \
+    row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
+    if (!row) return -1; \
 \
     /* The top row of the score matrix is a special case, \
      * as there are no previously aligned characters. \
@@ -4632,8 +4675,9 @@ static struct fogsaa_queue_node fogsaa_queue_pop(struct fogsaa_queue *queue) {
     SELECT_SCORE_GLOBAL(temp + (align_score), \
                         row[nB] + right_gap_extend_B, \
                         row[nB-1] + right_gap_extend_A); \
-    PyMem_Free(row); \
-    return PyFloat_FromDouble(score);
+    PyMem_RawFree(row); \
+    *result = score; \
+    return 0;
 
 
 #define SMITHWATERMAN_SCORE(align_score) \
@@ -4649,8 +4693,8 @@ static struct fogsaa_queue_node fogsaa_queue_pop(struct fogsaa_queue *queue) {
     double maximum = 0; \
 \
     /* Smith-Waterman algorithm */ \
-    row = PyMem_Malloc((nB+1)*sizeof(double)); \
-    if (!row) return PyErr_NoMemory(); \
+    row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
+    if (!row) return -1; \
 \
     /* The top row of the score matrix is a special case, \
      * as there are no previously aligned characters. \
@@ -4683,8 +4727,9 @@ static struct fogsaa_queue_node fogsaa_queue_pop(struct fogsaa_queue *queue) {
     } \
     kB = sB[nB-1]; \
     SELECT_SCORE_LOCAL1(temp + (align_score)); \
-    PyMem_Free(row); \
-    return PyFloat_FromDouble(maximum);
+    PyMem_RawFree(row); \
+    *result = maximum; \
+    return 0;
 
 
 #define NEEDLEMANWUNSCH_ALIGN(align_score) \
@@ -4890,16 +4935,15 @@ static struct fogsaa_queue_node fogsaa_queue_pop(struct fogsaa_queue *queue) {
             right_gap_extend_B = self->extend_left_deletion_score; \
             break; \
         default: \
-            PyErr_SetString(PyExc_RuntimeError, "strand was neither '+' nor '-'"); \
-            return NULL; \
+            return -2; \
     } \
 \
     /* Gotoh algorithm with three states */ \
-    M_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    M_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!M_row) goto exit; \
-    Ix_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    Ix_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!Ix_row) goto exit; \
-    Iy_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    Iy_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!Iy_row) goto exit; \
 \
     /* The top row of the score matrix is a special case, \
@@ -5000,16 +5044,17 @@ static struct fogsaa_queue_node fogsaa_queue_pop(struct fogsaa_queue *queue) {
     Iy_row[nB] = score; \
 \
     SELECT_SCORE_GLOBAL(M_row[nB], Ix_row[nB], Iy_row[nB]); \
-    PyMem_Free(M_row); \
-    PyMem_Free(Ix_row); \
-    PyMem_Free(Iy_row); \
-    return PyFloat_FromDouble(score); \
+    PyMem_RawFree(M_row); \
+    PyMem_RawFree(Ix_row); \
+    PyMem_RawFree(Iy_row); \
+    *result = score; \
+    return 0; \
 \
 exit: \
-    if (M_row) PyMem_Free(M_row); \
-    if (Ix_row) PyMem_Free(Ix_row); \
-    if (Iy_row) PyMem_Free(Iy_row); \
-    return PyErr_NoMemory(); \
+    if (M_row) PyMem_RawFree(M_row); \
+    if (Ix_row) PyMem_RawFree(Ix_row); \
+    if (Iy_row) PyMem_RawFree(Iy_row); \
+    return -1; \
 
 
 #define GOTOH_LOCAL_SCORE(align_score) \
@@ -5032,11 +5077,11 @@ exit: \
     double maximum = 0.0; \
 \
     /* Gotoh algorithm with three states */ \
-    M_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    M_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!M_row) goto exit; \
-    Ix_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    Ix_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!Ix_row) goto exit; \
-    Iy_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    Iy_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!Iy_row) goto exit; \
  \
     /* The top row of the score matrix is a special case, \
@@ -5112,15 +5157,16 @@ exit: \
                                    Ix_temp, \
                                    Iy_temp, \
                                    (align_score)); \
-    PyMem_Free(M_row); \
-    PyMem_Free(Ix_row); \
-    PyMem_Free(Iy_row); \
-    return PyFloat_FromDouble(maximum); \
+    PyMem_RawFree(M_row); \
+    PyMem_RawFree(Ix_row); \
+    PyMem_RawFree(Iy_row); \
+    *result = maximum; \
+    return 0; \
 exit: \
-    if (M_row) PyMem_Free(M_row); \
-    if (Ix_row) PyMem_Free(Ix_row); \
-    if (Iy_row) PyMem_Free(Iy_row); \
-    return PyErr_NoMemory(); \
+    if (M_row) PyMem_RawFree(M_row); \
+    if (Ix_row) PyMem_RawFree(Ix_row); \
+    if (Iy_row) PyMem_RawFree(Iy_row); \
+    return -1; \
 
 
 #define GOTOH_GLOBAL_ALIGN(align_score) \
@@ -6680,11 +6726,12 @@ exit:
 #define COMPARE_SCORE (kA == wildcard || kB == wildcard) ? 0 : (kA == kB) ? match : mismatch
 
 
-static PyObject*
-Aligner_needlemanwunsch_score_compare(Aligner* self,
+static int
+Aligner_needlemanwunsch_score_compare(const Aligner* self,
                                       const int* sA, int nA,
                                       const int* sB, int nB,
-                                      unsigned char strand)
+                                      unsigned char strand,
+                                      double* result)
 {
     const double match = self->match;
     const double mismatch = self->mismatch;
@@ -6692,21 +6739,24 @@ Aligner_needlemanwunsch_score_compare(Aligner* self,
     NEEDLEMANWUNSCH_SCORE(COMPARE_SCORE);
 }
 
-static PyObject*
-Aligner_needlemanwunsch_score_matrix(Aligner* self,
+static int
+Aligner_needlemanwunsch_score_matrix(const Aligner* self,
                                      const int* sA, int nA,
                                      const int* sB, int nB,
-                                     unsigned char strand)
+                                     unsigned char strand,
+                                     double* result)
 {
     const Py_ssize_t n = self->substitution_matrix.shape[0];
     const double* substitution_matrix = self->substitution_matrix.buf;
     NEEDLEMANWUNSCH_SCORE(MATRIX_SCORE);
 }
 
-static PyObject*
-Aligner_smithwaterman_score_compare(Aligner* self,
+static int
+Aligner_smithwaterman_score_compare(const Aligner* self,
                                     const int* sA, int nA,
-                                    const int* sB, int nB)
+                                    const int* sB, int nB,
+                                    unsigned char strand,
+                                    double* result)
 {
     const double match = self->match;
     const double mismatch = self->mismatch;
@@ -6714,10 +6764,12 @@ Aligner_smithwaterman_score_compare(Aligner* self,
     SMITHWATERMAN_SCORE(COMPARE_SCORE);
 }
 
-static PyObject*
-Aligner_smithwaterman_score_matrix(Aligner* self,
+static int
+Aligner_smithwaterman_score_matrix(const Aligner* self,
                                    const int* sA, int nA,
-                                   const int* sB, int nB)
+                                   const int* sB, int nB,
+                                   unsigned char strand,
+                                   double* result)
 {
     const Py_ssize_t n = self->substitution_matrix.shape[0];
     const double* substitution_matrix = self->substitution_matrix.buf;
@@ -6770,11 +6822,12 @@ Aligner_smithwaterman_align_matrix(Aligner* self,
     SMITHWATERMAN_ALIGN(MATRIX_SCORE);
 }
 
-static PyObject*
-Aligner_gotoh_global_score_compare(Aligner* self,
+static int
+Aligner_gotoh_global_score_compare(const Aligner* self,
                                    const int* sA, int nA,
                                    const int* sB, int nB,
-                                   unsigned char strand)
+                                   unsigned char strand,
+                                   double* result)
 {
     const double match = self->match;
     const double mismatch = self->mismatch;
@@ -6782,21 +6835,24 @@ Aligner_gotoh_global_score_compare(Aligner* self,
     GOTOH_GLOBAL_SCORE(COMPARE_SCORE);
 }
 
-static PyObject*
-Aligner_gotoh_global_score_matrix(Aligner* self,
+static int
+Aligner_gotoh_global_score_matrix(const Aligner* self,
                                   const int* sA, int nA,
                                   const int* sB, int nB,
-                                  unsigned char strand)
+                                  unsigned char strand,
+                                  double* result)
 {
     const Py_ssize_t n = self->substitution_matrix.shape[0];
     const double* substitution_matrix = self->substitution_matrix.buf;
     GOTOH_GLOBAL_SCORE(MATRIX_SCORE);
 }
 
-static PyObject*
-Aligner_gotoh_local_score_compare(Aligner* self,
+static int
+Aligner_gotoh_local_score_compare(const Aligner* self,
                                   const int* sA, int nA,
-                                  const int* sB, int nB)
+                                  const int* sB, int nB,
+                                  unsigned char strand,
+                                  double* result)
 {
     const double match = self->match;
     const double mismatch = self->mismatch;
@@ -6804,10 +6860,12 @@ Aligner_gotoh_local_score_compare(Aligner* self,
     GOTOH_LOCAL_SCORE(COMPARE_SCORE);
 }
 
-static PyObject*
-Aligner_gotoh_local_score_matrix(Aligner* self,
+static int
+Aligner_gotoh_local_score_matrix(const Aligner* self,
                                  const int* sA, int nA,
-                                 const int* sB, int nB)
+                                 const int* sB, int nB,
+                                 unsigned char strand,
+                                 double* result)
 {
     const Py_ssize_t n = self->substitution_matrix.shape[0];
     const double* substitution_matrix = self->substitution_matrix.buf;
@@ -7230,10 +7288,7 @@ Aligner_fogsaa_align_matrix(Aligner* self,
     FOGSAA_EXIT_ALIGN
 }
 
-static bool _check_indices(Py_buffer* view, Py_buffer* substitution_matrix) {
-    const Py_ssize_t m = substitution_matrix->shape[0];
-    const int* indices = view->buf;
-    const Py_ssize_t n = view->len / view->itemsize;
+static bool _check_indices(const int* indices, Py_ssize_t n, Py_ssize_t m) {
     Py_ssize_t i;
     for (i = 0; i < n; i++) {
         const int index = indices[i];
@@ -7253,10 +7308,8 @@ static bool _check_indices(Py_buffer* view, Py_buffer* substitution_matrix) {
     return true;
 }
 
-static bool _map_indices(Py_buffer* view, const int* mapping, Py_ssize_t m) {
+static bool _map_indices(int* indices, Py_ssize_t n, const int* mapping, Py_ssize_t m) {
     Py_ssize_t i;
-    const Py_ssize_t n = view->len / view->itemsize;
-    int* const indices = view->buf;
     for (i = 0; i < n; i++) {
         int index = indices[i];
         if (index < 0) {
@@ -7282,7 +7335,7 @@ static bool _map_indices(Py_buffer* view, const int* mapping, Py_ssize_t m) {
     return true;
 }
 
-static bool _prepare_indices(Py_buffer* substitution_matrix, Py_buffer* bA, Py_buffer* bB)
+static bool _prepare_sequence(Py_buffer* substitution_matrix, int* indices, Py_ssize_t n)
 {
     if (PyObject_IsInstance(substitution_matrix->obj,
                             (PyObject*)Array_Type)) {
@@ -7293,13 +7346,18 @@ static bool _prepare_indices(Py_buffer* substitution_matrix, Py_buffer* bA, Py_b
         const int* mapping = buffer->buf;
         if (mapping) {
             const Py_ssize_t m = buffer->len / buffer->itemsize;
-            if (!_map_indices(bA, mapping, m)) return false;
-            if (!_map_indices(bB, mapping, m)) return false;
-            return true;
+            return _map_indices(indices, n, mapping, m);
         }
     }
-    if (!_check_indices(bA, substitution_matrix)) return false;
-    if (!_check_indices(bB, substitution_matrix)) return false;
+    return _check_indices(indices, n, substitution_matrix->shape[0]);
+}
+
+static bool _prepare_indices(Py_buffer* substitution_matrix, Py_buffer* bA, Py_buffer* bB)
+{
+    if (!_prepare_sequence(substitution_matrix, bA->buf, bA->len / bA->itemsize))
+        return false;
+    if (!_prepare_sequence(substitution_matrix, bB->buf, bB->len / bB->itemsize))
+        return false;
     return true;
 }
 
@@ -7365,199 +7423,2019 @@ error:
     return 0;
 }
 
-static const char Aligner_score__doc__[] = "calculates the alignment score";
+typedef int (*ScoreFunction)(const Aligner* self,
+                             const int* sA, int nA,
+                             const int* sB, int nB,
+                             unsigned char strand,
+                             double* result);
 
-static PyObject*
-Aligner_score(Aligner* self, PyObject* args, PyObject* keywords)
+static ScoreFunction _get_scalar_score_function(const Aligner* self)
+/* Return the function calculating the alignment score without calling the
+ * Python C API, so that it can run without holding the GIL, or NULL if the
+ * alignment score is calculated by a function that requires the GIL. The
+ * algorithm of the aligner must have been set by calling _get_algorithm.
+ */
 {
-    const int* sA;
-    const int* sB;
-    int nA;
-    int nB;
-    Py_buffer bA = {0};
-    Py_buffer bB = {0};
-    const Mode mode = self->mode;
-    const Algorithm algorithm = _get_algorithm(self);
-    char strand = '+';
-    PyObject* result = NULL;
-    PyObject* substitution_matrix = self->substitution_matrix.obj;
-
-    static char *kwlist[] = {"sequenceA", "sequenceB", "strand", NULL};
-
-    if (!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
-                                     sequence_converter, &bA,
-                                     sequence_converter, &bB,
-                                     strand_converter, &strand))
-        return NULL;
-
-    if (substitution_matrix) {
-        if (!_prepare_indices(&self->substitution_matrix, &bA, &bB)) goto exit;
-    }
-
-    nA = (int) (bA.len / bA.itemsize);
-    nB = (int) (bB.len / bB.itemsize);
-    if (nA != bA.len / bA.itemsize || nB != bB.len / bB.itemsize) {
-        PyErr_SetString(PyExc_ValueError, "sequences too long");
-        goto exit;
-    }
-    sA = bA.buf;
-    sB = bB.buf;
-
-    switch (algorithm) {
+    const bool matrix = (self->substitution_matrix.obj != NULL);
+    switch (self->algorithm) {
         case NeedlemanWunschSmithWaterman:
-            switch (mode) {
+            switch (self->mode) {
                 case Global:
-                    if (substitution_matrix)
-                        result = Aligner_needlemanwunsch_score_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_needlemanwunsch_score_compare(self, sA, nA, sB, nB, strand);
-                    break;
+                    if (matrix) return Aligner_needlemanwunsch_score_matrix;
+                    else return Aligner_needlemanwunsch_score_compare;
                 case Local:
-                    if (substitution_matrix)
-                        result = Aligner_smithwaterman_score_matrix(self, sA, nA, sB, nB);
-                    else
-                        result = Aligner_smithwaterman_score_compare(self, sA, nA, sB, nB);
-                    break;
+                    if (matrix) return Aligner_smithwaterman_score_matrix;
+                    else return Aligner_smithwaterman_score_compare;
                 default:
-                    ERR_UNEXPECTED_MODE
-                    goto exit;
+                    return NULL;
             }
-            break;
         case Gotoh:
-            switch (mode) {
-                case Global:
-                    if (substitution_matrix)
-                        result = Aligner_gotoh_global_score_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_gotoh_global_score_compare(self, sA, nA, sB, nB, strand);
-                    break;
-                case Local:
-                    if (substitution_matrix)
-                        result = Aligner_gotoh_local_score_matrix(self, sA, nA, sB, nB);
-                    else
-                        result = Aligner_gotoh_local_score_compare(self, sA, nA, sB, nB);
-                    break;
-                default:
-                    ERR_UNEXPECTED_MODE
-                    goto exit;
-            }
-            break;
-        case WatermanSmithBeyer:
-            switch (mode) {
+            switch (self->mode) {
                 case Global:
-                    if (substitution_matrix)
-                        result = Aligner_watermansmithbeyer_global_score_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_watermansmithbeyer_global_score_compare(self, sA, nA, sB, nB, strand);
-                    break;
+                    if (matrix) return Aligner_gotoh_global_score_matrix;
+                    else return Aligner_gotoh_global_score_compare;
                 case Local:
-                    if (substitution_matrix)
-                        result = Aligner_watermansmithbeyer_local_score_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_watermansmithbeyer_local_score_compare(self, sA, nA, sB, nB, strand);
-                    break;
+                    if (matrix) return Aligner_gotoh_local_score_matrix;
+                    else return Aligner_gotoh_local_score_compare;
                 default:
-                    ERR_UNEXPECTED_MODE
-                    goto exit;
-            }
-            break;
-        case FOGSAA:
-            if (mode != FOGSAA_Mode) {
-                ERR_UNEXPECTED_MODE
-                goto exit;
+                    return NULL;
             }
-            if (substitution_matrix)
-                result = Aligner_fogsaa_score_matrix(self, sA, nA, sB, nB, strand);
-            else
-                result = Aligner_fogsaa_score_compare(self, sA, nA, sB, nB, strand);
-            break;
-        case Unknown:
         default:
-            ERR_UNEXPECTED_ALGORITHM
-            break;
+            return NULL;
     }
+}
 
-exit:
-    sequence_converter(NULL, &bA);
-    sequence_converter(NULL, &bB);
+/* ----------------- striped SIMD score kernels ----------------- */
 
-    return result;
-}
+/* Farrar's striped algorithm (Bioinformatics 23: 156-161 (2007)) calculates
+ * the score of an alignment using SIMD instructions on 16 (8-bit) or 8
+ * (16-bit) cells of the dynamic programming matrix at a time. It is used
+ * for the Needleman-Wunsch, Smith-Waterman, and Gotoh algorithms if all
+ * scores are integers; for global alignments, the end gap scores must be
+ * equal to the internal gap scores. Local alignments are first calculated
+ * with 8-bit and then with 16-bit saturated arithmetic; if the score
+ * overflows, or if a global alignment score may overflow, the scalar
+ * algorithm is used instead.
+ */
 
-static const char Aligner_align__doc__[] = "align two sequences";
+#if defined(__SSE2__) || defined(_M_X64) || (defined(_M_IX86_FP) && _M_IX86_FP >= 2)
+#define STRIPED_SIMD
+#include <emmintrin.h>
+#endif
 
-static PyObject*
-Aligner_align(Aligner* self, PyObject* args, PyObject* keywords)
-{
-    const int* sA;
-    const int* sB;
-    int nA;
-    int nB;
-    Py_buffer bA = {0};
-    Py_buffer bB = {0};
-    const Mode mode = self->mode;
-    const Algorithm algorithm = _get_algorithm(self);
-    char strand = '+';
-    PyObject* result = NULL;
-    PyObject* substitution_matrix = self->substitution_matrix.obj;
+#ifdef STRIPED_SIMD
 
-    static char *kwlist[] = {"sequenceA", "sequenceB", "strand", NULL};
+#define STRIPED_MAXIMUM_SCORE 1000
 
-    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
-                                    sequence_converter, &bA,
-                                    sequence_converter, &bB,
-                                    strand_converter, &strand))
-        return NULL;
+typedef struct {
+    int open_A;  /* penalty of opening a gap in sequence A (insertion) */
+    int extend_A;
+    int open_B;  /* penalty of opening a gap in sequence B (deletion) */
+    int extend_B;
+    int minimum;  /* smallest substitution score */
+    int maximum;  /* largest substitution score */
+    int* letters;  /* sorted distinct letters in sequence B */
+    int* indices;  /* index of each letter of sequence B in letters */
+    int n;  /* number of distinct letters in sequence B */
+} StripedParameters;
+
+static bool _striped_integer(double value, int* result)
+{
+    if (value < -STRIPED_MAXIMUM_SCORE || value > STRIPED_MAXIMUM_SCORE)
+        return false;
+    *result = (int)value;
+    return (*result == value);
+}
 
-    if (substitution_matrix) {
-        if (!_prepare_indices(&self->substitution_matrix, &bA, &bB)) goto exit;
-    }
+static bool _striped_gap_scores(double open, double extend, int* p_open, int* p_extend)
+{
+    /* gap penalties are stored as positive numbers */
+    if (!_striped_integer(-open, p_open)) return false;
+    if (!_striped_integer(-extend, p_extend)) return false;
+    /* the lazy F loop requires opening a gap to cost at least as much as
+     * extending it */
+    if (*p_extend < 0 || *p_open < *p_extend) return false;
+    return true;
+}
 
-    nA = (int) (bA.len / bA.itemsize);
-    nB = (int) (bB.len / bB.itemsize);
-    if (nA != bA.len / bA.itemsize || nB != bB.len / bB.itemsize) {
-        PyErr_SetString(PyExc_ValueError, "sequences too long");
-        goto exit;
-    }
-    sA = bA.buf;
-    sB = bB.buf;
+static bool _striped_parameters(const Aligner* self, StripedParameters* p)
+{
+    double open_A = self->open_internal_insertion_score;
+    double open_B = self->open_internal_deletion_score;
+    const double extend_A = self->extend_internal_insertion_score;
+    const double extend_B = self->extend_internal_deletion_score;
+    int score;
+    Py_ssize_t i;
 
-    switch (algorithm) {
+    switch (self->algorithm) {
         case NeedlemanWunschSmithWaterman:
-            switch (mode) {
-                case Global:
-                    if (substitution_matrix)
-                        result = Aligner_needlemanwunsch_align_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_needlemanwunsch_align_compare(self, sA, nA, sB, nB, strand);
-                    break;
-                case Local:
-                    if (substitution_matrix)
-                        result = Aligner_smithwaterman_align_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_smithwaterman_align_compare(self, sA, nA, sB, nB, strand);
-                    break;
-                default:
-                    ERR_UNEXPECTED_MODE
-                    goto exit;
-            }
+            /* open gap scores are ignored */
+            open_A = extend_A;
+            open_B = extend_B;
             break;
         case Gotoh:
-            switch (mode) {
-                case Global:
-                    if (substitution_matrix)
-                        result = Aligner_gotoh_global_align_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_gotoh_global_align_compare(self, sA, nA, sB, nB, strand);
-                    break;
-                case Local:
-                    if (substitution_matrix)
-                        result = Aligner_gotoh_local_align_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_gotoh_local_align_compare(self, sA, nA, sB, nB, strand);
-                    break;
-                default:
-                    ERR_UNEXPECTED_MODE
+            break;
+        default:
+            return false;
+    }
+    switch (self->mode) {
+        case Global:
+            if (self->open_left_insertion_score != open_A
+             || self->open_right_insertion_score != open_A
+             || self->extend_left_insertion_score != extend_A
+             || self->extend_right_insertion_score != extend_A
+             || self->open_left_deletion_score != open_B
+             || self->open_right_deletion_score != open_B
+             || self->extend_left_deletion_score != extend_B
+             || self->extend_right_deletion_score != extend_B) return false;
+            break;
+        case Local:
+            break;
+        default:
+            return false;
+    }
+    if (!_striped_gap_scores(open_A, extend_A, &p->open_A, &p->extend_A))
+        return false;
+    if (!_striped_gap_scores(open_B, extend_B, &p->open_B, &p->extend_B))
+        return false;
+    if (self->substitution_matrix.obj) {
+        const Py_ssize_t n = self->substitution_matrix.shape[0];
+        const double* substitution_matrix = self->substitution_matrix.buf;
+        if (!_striped_integer(substitution_matrix[0], &score)) return false;
+        p->minimum = score;
+        p->maximum = score;
+        for (i = 1; i < n*n; i++) {
+            if (!_striped_integer(substitution_matrix[i], &score)) return false;
+            if (score < p->minimum) p->minimum = score;
+            else if (score > p->maximum) p->maximum = score;
+        }
+    }
+    else {
+        if (!_striped_integer(self->match, &p->maximum)) return false;
+        if (!_striped_integer(self->mismatch, &p->minimum)) return false;
+        if (p->minimum > p->maximum) {
+            score = p->minimum;
+            p->minimum = p->maximum;
+            p->maximum = score;
+        }
+        if (self->wildcard != -1) {
+            if (p->minimum > 0) p->minimum = 0;
+            if (p->maximum < 0) p->maximum = 0;
+        }
+    }
+    return true;
+}
+
+static int _striped_compare(const void* a, const void* b)
+{
+    const int x = *(const int*)a;
+    const int y = *(const int*)b;
+    return (x > y) - (x < y);
+}
+
+static bool _striped_letters(const int* sB, int nB, StripedParameters* p)
+/* Find the distinct letters in sequence B, so that the query profile is
+ * calculated for those letters only. */
+{
+    int i;
+    int n = 0;
+    int* letters = PyMem_RawMalloc(nB*sizeof(int));
+    int* indices = PyMem_RawMalloc(nB*sizeof(int));
+    if (!letters || !indices) {
+        PyMem_RawFree(letters);
+        PyMem_RawFree(indices);
+        return false;
+    }
+    memcpy(letters, sB, nB*sizeof(int));
+    qsort(letters, nB, sizeof(int), _striped_compare);
+    for (i = 0; i < nB; i++) {
+        if (n == 0 || letters[i] != letters[n-1]) letters[n++] = letters[i];
+    }
+    for (i = 0; i < nB; i++) {
+        const int* letter = bsearch(&sB[i], letters, n, sizeof(int), _striped_compare);
+        indices[i] = (int)(letter - letters);
+    }
+    p->letters = letters;
+    p->indices = indices;
+    p->n = n;
+    return true;
+}
+
+static void* _striped_aligned(void* memory)
+{
+    return (void*)(((uintptr_t)memory + 15) & ~(uintptr_t)15);
+}
+
+#define STRIPED_SCORE(kA, kB) \
+    (substitution_matrix ? (int)substitution_matrix[(kA)*n+(kB)] \
+     : ((kA) == wildcard || (kB) == wildcard) ? 0 \
+     : ((kA) == (kB)) ? match : mismatch)
+
+#define STRIPED_PROFILE(type, lanes, bias, padding) \
+    { \
+        type* values = (type*)profile; \
+        int c, s, l; \
+        for (c = 0; c < p->n; c++) { \
+            const int kB = p->letters[c]; \
+            for (s = 0; s < segLen; s++) { \
+                for (l = 0; l < lanes; l++) { \
+                    const int i = l * segLen + s; \
+                    *values++ = (type)((i < nA) ? STRIPED_SCORE(sA[i], kB) + bias : padding); \
+                } \
+            } \
+        } \
+    }
+
+#define STRIPED_ENTER(lanes) \
+    const Py_ssize_t n = self->substitution_matrix.obj ? self->substitution_matrix.shape[0] : 0; \
+    const double* substitution_matrix = self->substitution_matrix.obj ? self->substitution_matrix.buf : NULL; \
+    const int match = (int)self->match; \
+    const int mismatch = (int)self->mismatch; \
+    const int wildcard = self->wildcard; \
+    const int segLen = (nA + lanes - 1) / lanes; \
+    void* memory; \
+    __m128i* profile; \
+    __m128i* pvHStore; \
+    __m128i* pvHLoad; \
+    __m128i* pvE; \
+    __m128i* vP; \
+    __m128i* pv; \
+    __m128i vH; \
+    __m128i vE; \
+    __m128i vF; \
+    int i; \
+    int j; \
+    int k; \
+\
+    memory = PyMem_RawMalloc(((size_t)p->n + 3) * segLen * sizeof(__m128i) + 15); \
+    if (!memory) return -1; \
+    profile = _striped_aligned(memory); \
+    pvHStore = profile + (size_t)p->n * segLen; \
+    pvHLoad = pvHStore + segLen; \
+    pvE = pvHLoad + segLen;
+
+static int
+_striped_local_byte(const Aligner* self,
+                    const int* sA, int nA,
+                    int nB,
+                    const StripedParameters* p,
+                    double* result)
+/* Return 0 if successful, -1 if out of memory, 1 if the score overflows. */
+{
+    STRIPED_ENTER(16)
+    const int bias = -(p->minimum < 0 ? p->minimum : 0);
+    const __m128i vZero = _mm_setzero_si128();
+    const __m128i vBias = _mm_set1_epi8((char)bias);
+    const __m128i vOpenA = _mm_set1_epi8((char)p->open_A);
+    const __m128i vExtendA = _mm_set1_epi8((char)p->extend_A);
+    const __m128i vOpenB = _mm_set1_epi8((char)p->open_B);
+    const __m128i vExtendB = _mm_set1_epi8((char)p->extend_B);
+    /* any score at or above this limit may have been saturated */
+    const __m128i vLimit = _mm_set1_epi8((char)(255 - bias - p->maximum));
+    __m128i vMax = vZero;
+    int status = 0;
+
+    STRIPED_PROFILE(unsigned char, 16, bias, bias)
+    for (i = 0; i < segLen; i++) {
+        _mm_store_si128(pvHStore + i, vZero);
+        _mm_store_si128(pvE + i, vZero);
+    }
+    for (j = 0; j < nB; j++) {
+        vP = profile + (size_t)p->indices[j] * segLen;
+        vF = vZero;
+        vH = _mm_slli_si128(_mm_load_si128(pvHStore + segLen - 1), 1);
+        pv = pvHLoad;
+        pvHLoad = pvHStore;
+        pvHStore = pv;
+        for (i = 0; i < segLen; i++) {
+            vH = _mm_adds_epu8(vH, _mm_load_si128(vP + i));
+            vH = _mm_subs_epu8(vH, vBias);
+            vE = _mm_load_si128(pvE + i);
+            vH = _mm_max_epu8(vH, vE);
+            vH = _mm_max_epu8(vH, vF);
+            vMax = _mm_max_epu8(vMax, vH);
+            _mm_store_si128(pvHStore + i, vH);
+            vE = _mm_max_epu8(_mm_subs_epu8(vE, vExtendA), _mm_subs_epu8(vH, vOpenA));
+            _mm_store_si128(pvE + i, vE);
+            vF = _mm_max_epu8(_mm_subs_epu8(vF, vExtendB), _mm_subs_epu8(vH, vOpenB));
+            vH = _mm_load_si128(pvHLoad + i);
+        }
+        /* lazy F loop */
+        for (k = 0; k < 16; k++) {
+            vF = _mm_slli_si128(vF, 1);
+            for (i = 0; i < segLen; i++) {
+                vH = _mm_load_si128(pvHStore + i);
+                vE = _mm_max_epu8(vH, vF);
+                vMax = _mm_max_epu8(vMax, vE);
+                _mm_store_si128(pvHStore + i, vE);
+                vE = _mm_max_epu8(_mm_load_si128(pvE + i), _mm_subs_epu8(vE, vOpenA));
+                _mm_store_si128(pvE + i, vE);
+                /* continue while F exceeds the F calculated in the main loop */
+                vH = _mm_subs_epu8(vH, vOpenB);
+                vF = _mm_subs_epu8(vF, vExtendB);
+                if (_mm_movemask_epi8(_mm_cmpeq_epi8(_mm_subs_epu8(vF, vH), vZero)) == 0xffff)
+                    goto next;
+            }
+        }
+next:
+        if (_mm_movemask_epi8(_mm_cmpeq_epi8(_mm_subs_epu8(vLimit, vMax), vZero))) {
+            status = 1;
+            break;
+        }
+    }
+    if (status == 0) {
+        vMax = _mm_max_epu8(vMax, _mm_srli_si128(vMax, 8));
+        vMax = _mm_max_epu8(vMax, _mm_srli_si128(vMax, 4));
+        vMax = _mm_max_epu8(vMax, _mm_srli_si128(vMax, 2));
+        vMax = _mm_max_epu8(vMax, _mm_srli_si128(vMax, 1));
+        *result = _mm_extract_epi16(vMax, 0) & 0xff;
+    }
+    PyMem_RawFree(memory);
+    return status;
+}
+
+static int
+_striped_local_word(const Aligner* self,
+                    const int* sA, int nA,
+                    int nB,
+                    const StripedParameters* p,
+                    double* result)
+/* Return 0 if successful, -1 if out of memory, 1 if the score overflows. */
+{
+    STRIPED_ENTER(8)
+    const __m128i vZero = _mm_setzero_si128();
+    const __m128i vOpenA = _mm_set1_epi16((short)p->open_A);
+    const __m128i vExtendA = _mm_set1_epi16((short)p->extend_A);
+    const __m128i vOpenB = _mm_set1_epi16((short)p->open_B);
+    const __m128i vExtendB = _mm_set1_epi16((short)p->extend_B);
+    const __m128i vLimit = _mm_set1_epi16((short)(SHRT_MAX - p->maximum));
+    __m128i vMax = vZero;
+    int status = 0;
+
+    STRIPED_PROFILE(short, 8, 0, 0)
+    for (i = 0; i < segLen; i++) {
+        _mm_store_si128(pvHStore + i, vZero);
+        _mm_store_si128(pvE + i, vZero);
+    }
+    for (j = 0; j < nB; j++) {
+        vP = profile + (size_t)p->indices[j] * segLen;
+        vF = vZero;
+        vH = _mm_slli_si128(_mm_load_si128(pvHStore + segLen - 1), 2);
+        pv = pvHLoad;
+        pvHLoad = pvHStore;
+        pvHStore = pv;
+        for (i = 0; i < segLen; i++) {
+            /* vH may become negative, but vE and vF are non-negative */
+            vH = _mm_adds_epi16(vH, _mm_load_si128(vP + i));
+            vE = _mm_load_si128(pvE + i);
+            vH = _mm_max_epi16(vH, vE);
+            vH = _mm_max_epi16(vH, vF);
+            vMax = _mm_max_epi16(vMax, vH);
+            _mm_store_si128(pvHStore + i, vH);
+            vE = _mm_max_epi16(_mm_subs_epu16(vE, vExtendA), _mm_subs_epu16(vH, vOpenA));
+            _mm_store_si128(pvE + i, vE);
+            vF = _mm_max_epi16(_mm_subs_epu16(vF, vExtendB), _mm_subs_epu16(vH, vOpenB));
+            vH = _mm_load_si128(pvHLoad + i);
+        }
+        /* lazy F loop */
+        for (k = 0; k < 8; k++) {
+            vF = _mm_slli_si128(vF, 2);
+            for (i = 0; i < segLen; i++) {
+                vH = _mm_load_si128(pvHStore + i);
+                vE = _mm_max_epi16(vH, vF);
+                vMax = _mm_max_epi16(vMax, vE);
+                _mm_store_si128(pvHStore + i, vE);
+                vE = _mm_max_epi16(_mm_load_si128(pvE + i), _mm_subs_epu16(vE, vOpenA));
+                _mm_store_si128(pvE + i, vE);
+                /* continue while F exceeds the F calculated in the main loop */
+                vH = _mm_subs_epu16(vH, vOpenB);
+                vF = _mm_subs_epu16(vF, vExtendB);
+                if (_mm_movemask_epi8(_mm_cmpeq_epi16(_mm_subs_epu16(vF, vH), vZero)) == 0xffff)
+                    goto next;
+            }
+        }
+next:
+        if (_mm_movemask_epi8(_mm_cmpgt_epi16(vMax, vLimit))) {
+            status = 1;
+            break;
+        }
+    }
+    if (status == 0) {
+        vMax = _mm_max_epi16(vMax, _mm_srli_si128(vMax, 8));
+        vMax = _mm_max_epi16(vMax, _mm_srli_si128(vMax, 4));
+        vMax = _mm_max_epi16(vMax, _mm_srli_si128(vMax, 2));
+        *result = (short)_mm_extract_epi16(vMax, 0);
+    }
+    PyMem_RawFree(memory);
+    return status;
+}
+
+static int
+_striped_global_word(const Aligner* self,
+                     const int* sA, int nA,
+                     int nB,
+                     const StripedParameters* p,
+                     double* result)
+/* Return 0 if successful, or -1 if out of memory. The caller must check
+ * that the scores cannot overflow. */
+{
+    STRIPED_ENTER(8)
+    const __m128i vOpenA = _mm_set1_epi16((short)p->open_A);
+    const __m128i vExtendA = _mm_set1_epi16((short)p->extend_A);
+    const __m128i vOpenB = _mm_set1_epi16((short)p->open_B);
+    const __m128i vExtendB = _mm_set1_epi16((short)p->extend_B);
+    const __m128i vNegInf = _mm_set1_epi16(SHRT_MIN);
+    short* values;
+    int top;  /* score in the top row of the previous column */
+    int l;
+
+    STRIPED_PROFILE(short, 8, 0, 0)
+    /* the first column consists of deletions only */
+    values = (short*)pvHStore;
+    for (i = 0; i < segLen; i++) {
+        for (l = 0; l < 8; l++) {
+            *values++ = (short)(-p->open_B - (l * segLen + i) * p->extend_B);
+        }
+        vH = _mm_load_si128(pvHStore + i);
+        _mm_store_si128(pvE + i, _mm_subs_epi16(vH, vOpenA));
+    }
+    top = 0;
+    for (j = 0; j < nB; j++) {
+        vP = profile + (size_t)p->indices[j] * segLen;
+        vH = _mm_slli_si128(_mm_load_si128(pvHStore + segLen - 1), 2);
+        vH = _mm_insert_epi16(vH, top, 0);
+        /* the top row consists of insertions only */
+        top = -p->open_A - j * p->extend_A;
+        vF = _mm_insert_epi16(vNegInf, top - p->open_B, 0);
+        pv = pvHLoad;
+        pvHLoad = pvHStore;
+        pvHStore = pv;
+        for (i = 0; i < segLen; i++) {
+            vH = _mm_adds_epi16(vH, _mm_load_si128(vP + i));
+            vE = _mm_load_si128(pvE + i);
+            vH = _mm_max_epi16(vH, vE);
+            vH = _mm_max_epi16(vH, vF);
+            _mm_store_si128(pvHStore + i, vH);
+            vE = _mm_max_epi16(_mm_subs_epi16(vE, vExtendA), _mm_subs_epi16(vH, vOpenA));
+            _mm_store_si128(pvE + i, vE);
+            vF = _mm_max_epi16(_mm_subs_epi16(vF, vExtendB), _mm_subs_epi16(vH, vOpenB));
+            vH = _mm_load_si128(pvHLoad + i);
+        }
+        /* lazy F loop */
+        for (k = 0; k < 8; k++) {
+            vF = _mm_insert_epi16(_mm_slli_si128(vF, 2), SHRT_MIN, 0);
+            for (i = 0; i < segLen; i++) {
+                vH = _mm_load_si128(pvHStore + i);
+                vE = _mm_max_epi16(vH, vF);
+                _mm_store_si128(pvHStore + i, vE);
+                vE = _mm_max_epi16(_mm_load_si128(pvE + i), _mm_subs_epi16(vE, vOpenA));
+                _mm_store_si128(pvE + i, vE);
+                /* continue while F exceeds the F calculated in the main loop */
+                vH = _mm_subs_epi16(vH, vOpenB);
+                vF = _mm_subs_epi16(vF, vExtendB);
+                if (!_mm_movemask_epi8(_mm_cmpgt_epi16(vF, vH))) goto next;
+            }
+        }
+next:
+        ;
+    }
+    i = nA - 1;
+    values = (short*)(pvHStore + i % segLen);
+    *result = values[i / segLen];
+    PyMem_RawFree(memory);
+    return 0;
+}
+
+static int
+Aligner_striped_score(const Aligner* self,
+                      const int* sA, int nA,
+                      const int* sB, int nB,
+                      unsigned char strand,
+                      double* result)
+{
+    StripedParameters p;
+    ScoreFunction function;
+    int status = 1;
+
+    if (_striped_parameters(self, &p)) {
+        if (self->mode == Local) {
+            if (!_striped_letters(sB, nB, &p)) return -1;
+            if (p.maximum - (p.minimum < 0 ? p.minimum : 0) < 255
+             && p.open_A < 256 && p.open_B < 256)
+                status = _striped_local_byte(self, sA, nA, nB, &p, result);
+            if (status == 1)
+                status = _striped_local_word(self, sA, nA, nB, &p, result);
+            PyMem_RawFree(p.letters);
+            PyMem_RawFree(p.indices);
+        }
+        else {
+            /* Each cell, including the padding cells, scores at least as
+             * high as the path consisting of gaps only, and at most the
+             * number of diagonal steps times the largest score; use the
+             * scalar algorithm if the scores may not fit in 16 bits. */
+            double lower = (double)p.open_A + p.open_B
+                         + (double)nB * p.extend_A + (double)(nA + 8) * p.extend_B
+                         + (p.open_A > p.open_B ? p.open_A : p.open_B)
+                         + (p.minimum < 0 ? -p.minimum : 0);
+            double upper = (double)(nA + 8 < nB ? nA + 8 : nB)
+                         * (p.maximum > 0 ? p.maximum : 0);
+            if (lower < SHRT_MAX && upper < SHRT_MAX) {
+                if (!_striped_letters(sB, nB, &p)) return -1;
+                status = _striped_global_word(self, sA, nA, nB, &p, result);
+                PyMem_RawFree(p.letters);
+                PyMem_RawFree(p.indices);
+            }
+        }
+        if (status != 1) return status;
+    }
+    function = _get_scalar_score_function(self);
+    if (!function) return -2;
+    return function(self, sA, nA, sB, nB, strand, result);
+}
+
+#endif
+
+static int
+Aligner_banded_score(const Aligner* self,
+                     const int* sA, int nA,
+                     const int* sB, int nB,
+                     unsigned char strand,
+                     double* result);
+
+static ScoreFunction _get_score_function(Aligner* self)
+/* As _get_scalar_score_function, but use the banded algorithm if band_width
+ * is set, or otherwise the striped SIMD algorithm if available; it falls
+ * back to the scalar algorithm if needed.
+ */
+{
+    const Algorithm algorithm = _get_algorithm(self);
+    if (self->band_width >= 0 && algorithm != WatermanSmithBeyer)
+        return Aligner_banded_score;
+#ifdef STRIPED_SIMD
+    if ((algorithm == NeedlemanWunschSmithWaterman || algorithm == Gotoh)
+     && (self->mode == Global || self->mode == Local))
+        return Aligner_striped_score;
+#endif
+    return _get_scalar_score_function(self);
+}
+
+static bool _copy_aligner(Aligner* self, Aligner* copy)
+/* Copy the scoring parameters of the aligner, so that the alignment score
+ * can be calculated while another thread modifies the aligner. The copy
+ * holds its own view of the substitution matrix, which must be released
+ * by calling _release_aligner.
+ */
+{
+    *copy = *self;
+    if (self->substitution_matrix.obj) {
+        const int flag = PyBUF_FORMAT | PyBUF_ND;
+        if (PyObject_GetBuffer(self->substitution_matrix.obj,
+                               &copy->substitution_matrix, flag) != 0)
+            return false;
+    }
+    return true;
+}
+
+static void _release_aligner(Aligner* copy)
+{
+    if (copy->substitution_matrix.obj)
+        PyBuffer_Release(&copy->substitution_matrix);
+}
+
+static bool _check_score_status(int status)
+{
+    switch (status) {
+        case 0:
+            return true;
+        case -1:
+            PyErr_NoMemory();
+            return false;
+        default:
+            PyErr_SetString(PyExc_RuntimeError, "strand was neither '+' nor '-'");
+            return false;
+    }
+}
+
+static PyObject*
+_score_with_gil(Aligner* self,
+                const int* sA, int nA,
+                const int* sB, int nB,
+                unsigned char strand)
+/* Calculate the alignment score for the algorithms that call the Python
+ * C API, and therefore require the GIL.
+ */
+{
+    const Mode mode = self->mode;
+    const Algorithm algorithm = _get_algorithm(self);
+    PyObject* substitution_matrix = self->substitution_matrix.obj;
+    PyObject* result = NULL;
+
+    if (self->band_width >= 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "banded alignment requires affine gap scores");
+        return NULL;
+    }
+    switch (algorithm) {
+        case WatermanSmithBeyer:
+            switch (mode) {
+                case Global:
+                    if (substitution_matrix)
+                        result = Aligner_watermansmithbeyer_global_score_matrix(self, sA, nA, sB, nB, strand);
+                    else
+                        result = Aligner_watermansmithbeyer_global_score_compare(self, sA, nA, sB, nB, strand);
+                    break;
+                case Local:
+                    if (substitution_matrix)
+                        result = Aligner_watermansmithbeyer_local_score_matrix(self, sA, nA, sB, nB, strand);
+                    else
+                        result = Aligner_watermansmithbeyer_local_score_compare(self, sA, nA, sB, nB, strand);
+                    break;
+                default:
+                    ERR_UNEXPECTED_MODE
+                    break;
+            }
+            break;
+        case FOGSAA:
+            if (mode != FOGSAA_Mode) {
+                ERR_UNEXPECTED_MODE
+                break;
+            }
+            if (substitution_matrix)
+                result = Aligner_fogsaa_score_matrix(self, sA, nA, sB, nB, strand);
+            else
+                result = Aligner_fogsaa_score_compare(self, sA, nA, sB, nB, strand);
+            break;
+        case NeedlemanWunschSmithWaterman:
+        case Gotoh:
+            ERR_UNEXPECTED_MODE
+            break;
+        case Unknown:
+        default:
+            ERR_UNEXPECTED_ALGORITHM
+            break;
+    }
+    return result;
+}
+
+static const char Aligner_score__doc__[] = "calculates the alignment score";
+
+static PyObject*
+Aligner_score(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    const int* sA;
+    const int* sB;
+    int nA;
+    int nB;
+    Py_buffer bA = {0};
+    Py_buffer bB = {0};
+    char strand = '+';
+    PyObject* result = NULL;
+    PyObject* substitution_matrix = self->substitution_matrix.obj;
+    ScoreFunction function;
+    Aligner aligner;
+    double score;
+    int status;
+
+    static char *kwlist[] = {"sequenceA", "sequenceB", "strand", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
+                                     sequence_converter, &bA,
+                                     sequence_converter, &bB,
+                                     strand_converter, &strand))
+        return NULL;
+
+    if (substitution_matrix) {
+        if (!_prepare_indices(&self->substitution_matrix, &bA, &bB)) goto exit;
+    }
+
+    nA = (int) (bA.len / bA.itemsize);
+    nB = (int) (bB.len / bB.itemsize);
+    if (nA != bA.len / bA.itemsize || nB != bB.len / bB.itemsize) {
+        PyErr_SetString(PyExc_ValueError, "sequences too long");
+        goto exit;
+    }
+    sA = bA.buf;
+    sB = bB.buf;
+
+    function = _get_score_function(self);
+    if (function) {
+        if (!_copy_aligner(self, &aligner)) goto exit;
+        Py_BEGIN_ALLOW_THREADS
+        status = function(&aligner, sA, nA, sB, nB, strand, &score);
+        Py_END_ALLOW_THREADS
+        _release_aligner(&aligner);
+        if (_check_score_status(status)) result = PyFloat_FromDouble(score);
+    }
+    else
+        result = _score_with_gil(self, sA, nA, sB, nB, strand);
+
+exit:
+    sequence_converter(NULL, &bA);
+    sequence_converter(NULL, &bB);
+
+    return result;
+}
+
+static const char Aligner_score_many__doc__[] =
+"calculates the alignment scores of one sequence against many sequences";
+
+static PyObject*
+Aligner_score_many(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    int* sA = NULL;
+    int* sB = NULL;
+    int nA;
+    Py_ssize_t* offsets = NULL;
+    Py_ssize_t i;
+    Py_ssize_t n;
+    Py_ssize_t total = 0;
+    Py_buffer bA = {0};
+    Py_buffer bB = {0};
+    Py_buffer bS = {0};
+    double* scores;
+    char strand = '+';
+    PyObject* targets = NULL;
+    PyObject* sequences;
+    PyObject* output;
+    PyObject* substitution_matrix = self->substitution_matrix.obj;
+    PyObject* result = NULL;
+    PyObject* score;
+    ScoreFunction function;
+    Aligner aligner;
+    int status = 0;
+    const int flag = PyBUF_WRITABLE | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS;
+
+    static char *kwlist[] = {"sequenceA", "sequencesB", "scores", "strand", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, keywords, "O&OOO&", kwlist,
+                                     sequence_converter, &bA,
+                                     &sequences,
+                                     &output,
+                                     strand_converter, &strand))
+        return NULL;
+
+    if (PyObject_GetBuffer(output, &bS, flag) != 0) goto exit;
+    if (bS.ndim != 1 || strcmp(bS.format, "d") != 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "scores should be a one-dimensional array of doubles");
+        goto exit;
+    }
+    targets = PySequence_Fast(sequences, "sequencesB should be a sequence");
+    if (!targets) goto exit;
+    n = PySequence_Fast_GET_SIZE(targets);
+    if (bS.len / bS.itemsize != n) {
+        PyErr_Format(PyExc_ValueError,
+                     "scores has incorrect size (%zd, expected %zd)",
+                     bS.len / bS.itemsize, n);
+        goto exit;
+    }
+    scores = bS.buf;
+
+    /* Copy the sequences, as mapping the indices modifies them in place */
+    nA = (int) (bA.len / bA.itemsize);
+    if (nA != bA.len / bA.itemsize) {
+        PyErr_SetString(PyExc_ValueError, "sequences too long");
+        goto exit;
+    }
+    sA = PyMem_Malloc(bA.len);
+    offsets = PyMem_Malloc((n+1)*sizeof(Py_ssize_t));
+    if (!sA || !offsets) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+    memcpy(sA, bA.buf, bA.len);
+    offsets[0] = 0;
+    for (i = 0; i < n; i++) {
+        PyObject* target = PySequence_Fast_GET_ITEM(targets, i);
+        if (!sequence_converter(target, &bB)) goto exit;
+        total += bB.len / bB.itemsize;
+        offsets[i+1] = total;
+        sequence_converter(NULL, &bB);
+        if (offsets[i+1] - offsets[i] > INT_MAX) {
+            PyErr_SetString(PyExc_ValueError, "sequences too long");
+            goto exit;
+        }
+    }
+    sB = PyMem_Malloc(total*sizeof(int));
+    if (!sB) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+    for (i = 0; i < n; i++) {
+        PyObject* target = PySequence_Fast_GET_ITEM(targets, i);
+        if (!sequence_converter(target, &bB)) goto exit;
+        if (bB.len / bB.itemsize != offsets[i+1] - offsets[i]) {
+            PyErr_SetString(PyExc_RuntimeError, "sequence changed size");
+            sequence_converter(NULL, &bB);
+            goto exit;
+        }
+        memcpy(sB + offsets[i], bB.buf, bB.len);
+        sequence_converter(NULL, &bB);
+    }
+    if (substitution_matrix) {
+        if (!_prepare_sequence(&self->substitution_matrix, sA, nA)) goto exit;
+        for (i = 0; i < n; i++) {
+            if (!_prepare_sequence(&self->substitution_matrix,
+                                   sB + offsets[i],
+                                   offsets[i+1] - offsets[i])) goto exit;
+        }
+    }
+
+    function = _get_score_function(self);
+    if (function) {
+        if (!_copy_aligner(self, &aligner)) goto exit;
+        Py_BEGIN_ALLOW_THREADS
+        for (i = 0; i < n; i++) {
+            status = function(&aligner,
+                              sA, nA,
+                              sB + offsets[i], (int)(offsets[i+1] - offsets[i]),
+                              strand,
+                              &scores[i]);
+            if (status != 0) break;
+        }
+        Py_END_ALLOW_THREADS
+        _release_aligner(&aligner);
+        if (!_check_score_status(status)) goto exit;
+    }
+    else {
+        for (i = 0; i < n; i++) {
+            score = _score_with_gil(self,
+                                    sA, nA,
+                                    sB + offsets[i], (int)(offsets[i+1] - offsets[i]),
+                                    strand);
+            if (!score) goto exit;
+            scores[i] = PyFloat_AS_DOUBLE(score);
+            Py_DECREF(score);
+        }
+    }
+
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+exit:
+    sequence_converter(NULL, &bA);
+    if (bS.obj) PyBuffer_Release(&bS);
+    Py_XDECREF(targets);
+    if (sA) PyMem_Free(sA);
+    if (sB) PyMem_Free(sB);
+    if (offsets) PyMem_Free(offsets);
+
+    return result;
+}
+
+/* Alignment in linear memory
+ * --------------------------
+ *
+ * The divide-and-conquer algorithm of Hirschberg, extended to affine gap
+ * scores by Myers and Miller, finds one optimal alignment without storing
+ * the traceback matrix. The middle row of the dynamic programming matrix
+ * is calculated from the top left corner (forward) and from the bottom
+ * right corner (backward); the cell and state in the middle row through
+ * which the optimal path passes splits the problem into two subproblems,
+ * which are solved recursively. Subproblems small enough to store their
+ * traceback matrix are solved directly.
+ *
+ * The three states are named after the direction of the last step of the
+ * path: M (DIAGONAL; aligned letters), Ix (VERTICAL; gap in sequence B),
+ * and Iy (HORIZONTAL; gap in sequence A). The score of a gap step depends
+ * on the previous state (open or extend) and on its position (left end,
+ * internal, or right end of the sequence).
+ */
+
+#define LINEAR_M 0
+#define LINEAR_Ix 1
+#define LINEAR_Iy 2
+#define LINEAR_ANY 3
+
+/* Subproblems with at most this many cells are solved with a traceback
+ * matrix of one byte per cell. */
+#define LINEAR_BASE_CELLS 65536
+
+typedef struct {
+    const int* sA;
+    const int* sB;
+    int nA;
+    int nB;
+    const double* substitution_matrix;
+    Py_ssize_t n;
+    double match;
+    double mismatch;
+    int wildcard;
+    /* gap scores indexed by position: 0 (left), 1 (internal), 2 (right) */
+    double open_A[3];
+    double extend_A[3];
+    double open_B[3];
+    double extend_B[3];
+    /* scores of the forward and backward passes, nB+1 values each */
+    double* fM;
+    double* fIx;
+    double* fIy;
+    double* bM;
+    double* bIx;
+    double* bIy;
+    /* the steps of the alignment path found so far */
+    unsigned char* steps;
+    Py_ssize_t nsteps;
+} LinearAligner;
+
+#define LINEAR_POSITION(k, n) ((k) == 0 ? 0 : (k) == (n) ? 2 : 1)
+
+#define MAX3(a, b, c) \
+    ((a) >= (b) ? ((a) >= (c) ? (a) : (c)) : ((b) >= (c) ? (b) : (c)))
+
+static inline double
+_linear_pair_score(const LinearAligner* p, int kA, int kB)
+{
+    if (p->substitution_matrix) return p->substitution_matrix[kA * p->n + kB];
+    if (kA == p->wildcard || kB == p->wildcard) return 0;
+    return (kA == kB) ? p->match : p->mismatch;
+}
+
+static void
+_linear_forward_init(const LinearAligner* p, int i0, int j0, int j1, int s,
+                     double* M, double* Ix, double* Iy)
+/* Initialize the scores in row i0, for paths starting at (i0, j0) in
+ * state s. */
+{
+    int j;
+    const int k = LINEAR_POSITION(i0, p->nA);
+    const double open = p->open_A[k];
+    const double extend = p->extend_A[k];
+    M[j0] = (s == LINEAR_M) ? 0 : -DBL_MAX;
+    Ix[j0] = (s == LINEAR_Ix) ? 0 : -DBL_MAX;
+    Iy[j0] = (s == LINEAR_Iy) ? 0 : -DBL_MAX;
+    for (j = j0 + 1; j <= j1; j++) {
+        Iy[j] = MAX3(M[j-1] + open, Ix[j-1] + open, Iy[j-1] + extend);
+        M[j] = -DBL_MAX;
+        Ix[j] = -DBL_MAX;
+    }
+}
+
+static void
+_linear_forward_row(const LinearAligner* p, int i, int j0, int j1,
+                    double* M, double* Ix, double* Iy)
+/* Update the scores from row i-1 to row i. */
+{
+    int j;
+    int k;
+    const int kA = p->sA[i-1];
+    const int* sB = p->sB;
+    const int nB = p->nB;
+    const int kAi = LINEAR_POSITION(i, p->nA);
+    const double open_A = p->open_A[kAi];
+    const double extend_A = p->extend_A[kAi];
+    double diagonal;
+    double score;
+    double M_temp;
+    double Ix_temp;
+
+    k = LINEAR_POSITION(j0, nB);
+    diagonal = MAX3(M[j0], Ix[j0], Iy[j0]);
+    Ix[j0] = MAX3(M[j0] + p->open_B[k], Ix[j0] + p->extend_B[k],
+                  Iy[j0] + p->open_B[k]);
+    M[j0] = -DBL_MAX;
+    Iy[j0] = -DBL_MAX;
+    for (j = j0 + 1; j <= j1; j++) {
+        k = LINEAR_POSITION(j, nB);
+        score = diagonal + _linear_pair_score(p, kA, sB[j-1]);
+        M_temp = M[j];
+        Ix_temp = Ix[j];
+        diagonal = MAX3(M_temp, Ix_temp, Iy[j]);
+        Ix[j] = MAX3(M_temp + p->open_B[k], Ix_temp + p->extend_B[k],
+                     Iy[j] + p->open_B[k]);
+        M[j] = score;
+        Iy[j] = MAX3(M[j-1] + open_A, Ix[j-1] + open_A, Iy[j-1] + extend_A);
+    }
+}
+
+static void
+_linear_backward_init(const LinearAligner* p, int i1, int j0, int j1, int e,
+                      double* M, double* Ix, double* Iy)
+/* Initialize the scores in row i1, for paths ending at (i1, j1) in state e
+ * (or in any state if e is LINEAR_ANY). The score in state X is the score
+ * of the remaining path if the previous step was in state X. */
+{
+    int j;
+    const int k = LINEAR_POSITION(i1, p->nA);
+    const double open = p->open_A[k];
+    const double extend = p->extend_A[k];
+    M[j1] = (e == LINEAR_ANY || e == LINEAR_M) ? 0 : -DBL_MAX;
+    Ix[j1] = (e == LINEAR_ANY || e == LINEAR_Ix) ? 0 : -DBL_MAX;
+    Iy[j1] = (e == LINEAR_ANY || e == LINEAR_Iy) ? 0 : -DBL_MAX;
+    for (j = j1 - 1; j >= j0; j--) {
+        M[j] = open + Iy[j+1];
+        Ix[j] = open + Iy[j+1];
+        Iy[j] = extend + Iy[j+1];
+    }
+}
+
+static void
+_linear_backward_row(const LinearAligner* p, int i, int j0, int j1,
+                     double* M, double* Ix, double* Iy)
+/* Update the scores from row i+1 to row i. */
+{
+    int j;
+    int k;
+    const int kA = p->sA[i];
+    const int* sB = p->sB;
+    const int nB = p->nB;
+    const int kAi = LINEAR_POSITION(i, p->nA);
+    const double open_A = p->open_A[kAi];
+    const double extend_A = p->extend_A[kAi];
+    double diagonal;
+    double M_next;
+    double open;
+    double extend;
+
+    k = LINEAR_POSITION(j1, nB);
+    M_next = M[j1];
+    open = p->open_B[k] + Ix[j1];
+    extend = p->extend_B[k] + Ix[j1];
+    M[j1] = open;
+    Ix[j1] = extend;
+    Iy[j1] = open;
+    for (j = j1 - 1; j >= j0; j--) {
+        k = LINEAR_POSITION(j, nB);
+        diagonal = _linear_pair_score(p, kA, sB[j]) + M_next;
+        M_next = M[j];
+        open = p->open_B[k] + Ix[j];
+        extend = p->extend_B[k] + Ix[j];
+        M[j] = MAX3(diagonal, open, open_A + Iy[j+1]);
+        Ix[j] = MAX3(diagonal, extend, open_A + Iy[j+1]);
+        Iy[j] = MAX3(diagonal, open, extend_A + Iy[j+1]);
+    }
+}
+
+static int
+_linear_base(LinearAligner* p, int i0, int j0, int i1, int j1, int s, int e,
+             double* result)
+/* Align the rectangle from (i0, j0) to (i1, j1) using a traceback matrix,
+ * and append the steps of the path to p->steps. Return 0 if successful,
+ * or -1 if out of memory. */
+{
+    const int nrows = i1 - i0 + 1;
+    const int ncols = j1 - j0 + 1;
+    double* M = p->fM;
+    double* Ix = p->fIx;
+    double* Iy = p->fIy;
+    unsigned char* trace;
+    unsigned char* row;
+    unsigned char* steps;
+    int i, j, k;
+    int state;
+    double score;
+    const double* values[3];
+    /* the traceback matrix stores the previous state of each of the three
+     * states of each cell in two bits */
+    trace = PyMem_RawMalloc((size_t)nrows * ncols);
+    if (!trace) return -1;
+    _linear_forward_init(p, i0, j0, j1, s, M, Ix, Iy);
+    row = trace;
+    row[0] = 0;
+    for (j = j0 + 1; j <= j1; j++) {
+        /* the scores were calculated in _linear_forward_init */
+        const double open = M[j-1] > Ix[j-1] ? M[j-1] : Ix[j-1];
+        const int previous = M[j-1] >= Ix[j-1] ? LINEAR_M : LINEAR_Ix;
+        k = LINEAR_POSITION(i0, p->nA);
+        if (Iy[j-1] + p->extend_A[k] >= open + p->open_A[k])
+            row[j-j0] = LINEAR_Iy << 4;
+        else
+            row[j-j0] = previous << 4;
+    }
+    for (i = i0 + 1; i <= i1; i++) {
+        /* Record the previous states while updating the row. The scores
+         * of the previous row are needed, so repeat the calculation of
+         * _linear_forward_row here. */
+        const int kA = p->sA[i-1];
+        const int kAi = LINEAR_POSITION(i, p->nA);
+        const double open_A = p->open_A[kAi];
+        const double extend_A = p->extend_A[kAi];
+        double diagonal;
+        int diagonal_state;
+        double M_temp, Ix_temp, Iy_temp;
+        double open, extend;
+        unsigned char bits;
+        row += ncols;
+        k = LINEAR_POSITION(j0, p->nB);
+        M_temp = M[j0];
+        Ix_temp = Ix[j0];
+        Iy_temp = Iy[j0];
+        if (M_temp >= Ix_temp && M_temp >= Iy_temp) {
+            diagonal = M_temp;
+            diagonal_state = LINEAR_M;
+        }
+        else if (Ix_temp >= Iy_temp) {
+            diagonal = Ix_temp;
+            diagonal_state = LINEAR_Ix;
+        }
+        else {
+            diagonal = Iy_temp;
+            diagonal_state = LINEAR_Iy;
+        }
+        open = (M_temp >= Iy_temp ? M_temp : Iy_temp) + p->open_B[k];
+        extend = Ix_temp + p->extend_B[k];
+        if (extend >= open) {
+            Ix[j0] = extend;
+            bits = LINEAR_Ix << 2;
+        }
+        else {
+            Ix[j0] = open;
+            bits = (M_temp >= Iy_temp ? LINEAR_M : LINEAR_Iy) << 2;
+        }
+        M[j0] = -DBL_MAX;
+        Iy[j0] = -DBL_MAX;
+        row[0] = bits;
+        for (j = j0 + 1; j <= j1; j++) {
+            const double pair = _linear_pair_score(p, kA, p->sB[j-1]);
+            k = LINEAR_POSITION(j, p->nB);
+            bits = diagonal_state;
+            score = diagonal + pair;
+            M_temp = M[j];
+            Ix_temp = Ix[j];
+            Iy_temp = Iy[j];
+            if (M_temp >= Ix_temp && M_temp >= Iy_temp) {
+                diagonal = M_temp;
+                diagonal_state = LINEAR_M;
+            }
+            else if (Ix_temp >= Iy_temp) {
+                diagonal = Ix_temp;
+                diagonal_state = LINEAR_Ix;
+            }
+            else {
+                diagonal = Iy_temp;
+                diagonal_state = LINEAR_Iy;
+            }
+            M[j] = score;
+            open = (M_temp >= Iy_temp ? M_temp : Iy_temp) + p->open_B[k];
+            extend = Ix_temp + p->extend_B[k];
+            if (extend >= open) {
+                Ix[j] = extend;
+                bits |= LINEAR_Ix << 2;
+            }
+            else {
+                Ix[j] = open;
+                bits |= (M_temp >= Iy_temp ? LINEAR_M : LINEAR_Iy) << 2;
+            }
+            open = (M[j-1] >= Ix[j-1] ? M[j-1] : Ix[j-1]) + open_A;
+            extend = Iy[j-1] + extend_A;
+            if (extend >= open) {
+                Iy[j] = extend;
+                bits |= LINEAR_Iy << 4;
+            }
+            else {
+                Iy[j] = open;
+                bits |= (M[j-1] >= Ix[j-1] ? LINEAR_M : LINEAR_Ix) << 4;
+            }
+            row[j-j0] = bits;
+        }
+    }
+    values[LINEAR_M] = M;
+    values[LINEAR_Ix] = Ix;
+    values[LINEAR_Iy] = Iy;
+    if (e == LINEAR_ANY) {
+        state = LINEAR_M;
+        if (Ix[j1] > M[j1]) state = LINEAR_Ix;
+        if (Iy[j1] > values[state][j1]) state = LINEAR_Iy;
+    }
+    else state = e;
+    *result = values[state][j1];
+    /* trace back from the end, storing the steps in reverse order */
+    steps = p->steps + p->nsteps;
+    i = i1;
+    j = j1;
+    k = 0;
+    while (i > i0 || j > j0) {
+        const unsigned char bits = trace[(size_t)(i - i0) * ncols + (j - j0)];
+        switch (state) {
+            case LINEAR_M:
+                steps[k++] = DIAGONAL;
+                state = bits & 0x3;
+                i--;
+                j--;
+                break;
+            case LINEAR_Ix:
+                steps[k++] = VERTICAL;
+                state = (bits >> 2) & 0x3;
+                i--;
+                break;
+            case LINEAR_Iy:
+                steps[k++] = HORIZONTAL;
+                state = (bits >> 4) & 0x3;
+                j--;
+                break;
+        }
+    }
+    PyMem_RawFree(trace);
+    for (i = 0, j = k - 1; i < j; i++, j--) {
+        const unsigned char step = steps[i];
+        steps[i] = steps[j];
+        steps[j] = step;
+    }
+    p->nsteps += k;
+    return 0;
+}
+
+static int
+_linear_align(LinearAligner* p, int i0, int j0, int i1, int j1, int s, int e,
+              double* result)
+/* Find an optimal path from (i0, j0), starting in state s, to (i1, j1),
+ * ending in state e, and append its steps to p->steps. Return 0 if
+ * successful, or -1 if out of memory. */
+{
+    int i, j;
+    int im;
+    int jm = j0;
+    int state = LINEAR_M;
+    int status;
+    double score;
+    double best = -DBL_MAX;
+    double top;
+    double bottom;
+
+    if (i1 - i0 <= 1
+     || (double)(i1 - i0 + 1) * (j1 - j0 + 1) <= LINEAR_BASE_CELLS)
+        return _linear_base(p, i0, j0, i1, j1, s, e, result);
+
+    im = (i0 + i1) / 2;
+    _linear_forward_init(p, i0, j0, j1, s, p->fM, p->fIx, p->fIy);
+    for (i = i0 + 1; i <= im; i++)
+        _linear_forward_row(p, i, j0, j1, p->fM, p->fIx, p->fIy);
+    _linear_backward_init(p, i1, j0, j1, e, p->bM, p->bIx, p->bIy);
+    for (i = i1 - 1; i >= im; i--)
+        _linear_backward_row(p, i, j0, j1, p->bM, p->bIx, p->bIy);
+    for (j = j0; j <= j1; j++) {
+        score = p->fM[j] + p->bM[j];
+        if (score > best) {
+            best = score;
+            jm = j;
+            state = LINEAR_M;
+        }
+        score = p->fIx[j] + p->bIx[j];
+        if (score > best) {
+            best = score;
+            jm = j;
+            state = LINEAR_Ix;
+        }
+        score = p->fIy[j] + p->bIy[j];
+        if (score > best) {
+            best = score;
+            jm = j;
+            state = LINEAR_Iy;
+        }
+    }
+    status = _linear_align(p, i0, j0, im, jm, s, state, &top);
+    if (status < 0) return status;
+    status = _linear_align(p, im, jm, i1, j1, state, e, &bottom);
+    if (status < 0) return status;
+    *result = top + bottom;
+    return 0;
+}
+
+static void
+_linear_local_end(LinearAligner* p, int* iend, int* jend, double* result)
+/* Find the end point of an optimal local alignment, and its score. */
+{
+    int i, j;
+    const int nA = p->nA;
+    const int nB = p->nB;
+    const int* sA = p->sA;
+    const int* sB = p->sB;
+    const double open_A = p->open_A[1];
+    const double extend_A = p->extend_A[1];
+    const double open_B = p->open_B[1];
+    const double extend_B = p->extend_B[1];
+    double* M = p->fM;
+    double* Ix = p->fIx;
+    double* Iy = p->fIy;
+    double diagonal;
+    double score;
+    double M_temp;
+    double Ix_temp;
+    double best = 0;
+
+    *iend = 0;
+    *jend = 0;
+    for (j = 0; j <= nB; j++) {
+        M[j] = 0;
+        Ix[j] = -DBL_MAX;
+        Iy[j] = -DBL_MAX;
+    }
+    for (i = 1; i <= nA; i++) {
+        const int kA = sA[i-1];
+        diagonal = MAX3(M[0], Ix[0], Iy[0]);
+        if (diagonal < 0) diagonal = 0;
+        for (j = 1; j <= nB; j++) {
+            score = diagonal + _linear_pair_score(p, kA, sB[j-1]);
+            M_temp = M[j];
+            Ix_temp = Ix[j];
+            diagonal = MAX3(M_temp, Ix_temp, Iy[j]);
+            if (diagonal < 0) diagonal = 0;
+            Ix[j] = MAX3(M_temp + open_B, Ix_temp + extend_B, Iy[j] + open_B);
+            M[j] = score;
+            Iy[j] = MAX3(M[j-1] + open_A, Ix[j-1] + open_A, Iy[j-1] + extend_A);
+            if (score > best) {
+                best = score;
+                *iend = i;
+                *jend = j;
+            }
+        }
+    }
+    *result = best;
+}
+
+static void
+_linear_local_start(LinearAligner* p, int iend, int jend, int* istart, int* jstart)
+/* Find the start point of an optimal local alignment ending at
+ * (iend, jend), such that the alignment starts with aligned letters. */
+{
+    int i, j;
+    const int* sA = p->sA;
+    const int* sB = p->sB;
+    double* M = p->bM;
+    double* Ix = p->bIx;
+    double* Iy = p->bIy;
+    double score;
+    double best = -DBL_MAX;
+
+    _linear_backward_init(p, iend, 0, jend, LINEAR_M, M, Ix, Iy);
+    for (i = iend - 1; i >= 0; i--) {
+        const int kA = sA[i];
+        for (j = jend - 1; j >= 0; j--) {
+            score = _linear_pair_score(p, kA, sB[j]) + M[j+1];
+            if (score > best) {
+                best = score;
+                *istart = i;
+                *jstart = j;
+            }
+        }
+        if (i > 0) _linear_backward_row(p, i, 0, jend, M, Ix, Iy);
+    }
+}
+
+static bool
+_linear_init(LinearAligner* p, const Aligner* self,
+             const int* sA, int nA,
+             const int* sB, int nB,
+             unsigned char strand)
+/* Store the sequences and scores in p. Return false if strand is invalid. */
+{
+    int k;
+
+    p->sA = sA;
+    p->sB = sB;
+    p->nA = nA;
+    p->nB = nB;
+    if (self->substitution_matrix.obj) {
+        p->substitution_matrix = self->substitution_matrix.buf;
+        p->n = self->substitution_matrix.shape[0];
+    }
+    else p->substitution_matrix = NULL;
+    p->match = self->match;
+    p->mismatch = self->mismatch;
+    p->wildcard = self->wildcard;
+    for (k = 0; k < 3; k++) {
+        p->open_A[k] = self->open_internal_insertion_score;
+        p->extend_A[k] = self->extend_internal_insertion_score;
+        p->open_B[k] = self->open_internal_deletion_score;
+        p->extend_B[k] = self->extend_internal_deletion_score;
+    }
+    switch (strand) {
+        case '+':
+            if (self->mode == Local) break;
+            p->open_A[0] = self->open_left_insertion_score;
+            p->extend_A[0] = self->extend_left_insertion_score;
+            p->open_B[0] = self->open_left_deletion_score;
+            p->extend_B[0] = self->extend_left_deletion_score;
+            p->open_A[2] = self->open_right_insertion_score;
+            p->extend_A[2] = self->extend_right_insertion_score;
+            p->open_B[2] = self->open_right_deletion_score;
+            p->extend_B[2] = self->extend_right_deletion_score;
+            break;
+        case '-':
+            if (self->mode == Local) break;
+            p->open_A[0] = self->open_right_insertion_score;
+            p->extend_A[0] = self->extend_right_insertion_score;
+            p->open_B[0] = self->open_right_deletion_score;
+            p->extend_B[0] = self->extend_right_deletion_score;
+            p->open_A[2] = self->open_left_insertion_score;
+            p->extend_A[2] = self->extend_left_insertion_score;
+            p->open_B[2] = self->open_left_deletion_score;
+            p->extend_B[2] = self->extend_left_deletion_score;
+            break;
+        default:
+            return false;
+    }
+    return true;
+}
+
+static int
+_align_linear(const Aligner* self,
+              const int* sA, int nA,
+              const int* sB, int nB,
+              unsigned char strand,
+              unsigned char** steps, Py_ssize_t* nsteps,
+              int* iA, int* iB,
+              double* result)
+/* Find one optimal alignment in linear memory. On success, return 0 and
+ * store the steps of the path, starting at (iA, iB), in steps (which the
+ * caller must free) and its score in result. Return -1 if out of memory,
+ * and -2 if strand is invalid. For a local alignment with a score of zero
+ * or less, no steps are stored and *steps is set to NULL.
+ */
+{
+    LinearAligner p;
+    double* rows;
+    int status = 0;
+
+    *steps = NULL;
+    *nsteps = 0;
+    if (!_linear_init(&p, self, sA, nA, sB, nB, strand)) return -2;
+
+    rows = PyMem_RawMalloc(6 * (size_t)(nB + 1) * sizeof(double));
+    if (!rows) return -1;
+    p.fM = rows;
+    p.fIx = p.fM + nB + 1;
+    p.fIy = p.fIx + nB + 1;
+    p.bM = p.fIy + nB + 1;
+    p.bIx = p.bM + nB + 1;
+    p.bIy = p.bIx + nB + 1;
+    p.steps = PyMem_RawMalloc((size_t)nA + nB);
+    if (!p.steps) {
+        PyMem_RawFree(rows);
+        return -1;
+    }
+    p.nsteps = 0;
+
+    if (self->mode == Local) {
+        int iend, jend;
+        int istart = 0, jstart = 0;
+        double score;
+        _linear_local_end(&p, &iend, &jend, result);
+        if (*result <= 0) {
+            PyMem_RawFree(p.steps);
+            p.steps = NULL;
+        }
+        else {
+            _linear_local_start(&p, iend, jend, &istart, &jstart);
+            p.steps[p.nsteps++] = DIAGONAL;
+            status = _linear_align(&p, istart + 1, jstart + 1, iend, jend,
+                                   LINEAR_M, LINEAR_M, &score);
+            *iA = istart;
+            *iB = jstart;
+        }
+    }
+    else {
+        status = _linear_align(&p, 0, 0, nA, nB, LINEAR_M, LINEAR_ANY, result);
+        *iA = 0;
+        *iB = 0;
+    }
+    PyMem_RawFree(rows);
+    if (status < 0) {
+        PyMem_RawFree(p.steps);
+        return status;
+    }
+    *steps = p.steps;
+    *nsteps = p.nsteps;
+    return 0;
+}
+
+static PyObject*
+_create_linear_path(const unsigned char* steps, Py_ssize_t nsteps,
+                    int i, int j, int nB, unsigned char strand)
+/* Convert the steps of an alignment path, starting at (i, j), to a tuple
+ * of the target and query coordinates, as returned by PathGenerator. */
+{
+    PyObject* tuple;
+    PyObject* target_row;
+    PyObject* query_row;
+    PyObject* value;
+    Py_ssize_t k;
+    Py_ssize_t l;
+    Py_ssize_t n = 1;
+    unsigned char direction = 0;
+
+    for (k = 0; k < nsteps; k++) {
+        if (steps[k] != direction) {
+            n++;
+            direction = steps[k];
+        }
+    }
+    target_row = PyTuple_New(n);
+    query_row = PyTuple_New(n);
+    if (!target_row || !query_row) goto error;
+    direction = 0;
+    l = 0;
+    for (k = 0; k <= nsteps; k++) {
+        if (k == nsteps || steps[k] != direction) {
+            value = PyLong_FromLong(i);
+            if (!value) goto error;
+            PyTuple_SET_ITEM(target_row, l, value);
+            value = PyLong_FromLong(strand == '+' ? j : nB - j);
+            if (!value) goto error;
+            PyTuple_SET_ITEM(query_row, l, value);
+            l++;
+            if (k == nsteps) break;
+            direction = steps[k];
+        }
+        switch (steps[k]) {
+            case HORIZONTAL: j++; break;
+            case VERTICAL: i++; break;
+            case DIAGONAL: i++; j++; break;
+        }
+    }
+    tuple = PyTuple_New(2);
+    if (!tuple) goto error;
+    PyTuple_SET_ITEM(tuple, 0, target_row);
+    PyTuple_SET_ITEM(tuple, 1, query_row);
+    return tuple;
+error:
+    Py_XDECREF(target_row);
+    Py_XDECREF(query_row);
+    return NULL;
+}
+
+/* Banded alignment
+ * ----------------
+ *
+ * If band_width is set, the dynamic programming is restricted to the cells
+ * (i, j) with kmin <= j - i <= kmax, where the band is widened by the
+ * difference in sequence length so that it always contains both corners of
+ * the matrix. The three states are as for the linear-memory alignment; the
+ * traceback matrix stores the previous state of each state of each cell in
+ * the band in two bits, with 3 denoting the start of a local alignment.
+ */
+
+#define BANDED_START 3
+
+static void
+_banded_limits(const Aligner* self, int nA, int nB, int* kmin, int* kmax)
+{
+    const int d = nB - nA;
+    *kmin = (d < 0 ? d : 0) - self->band_width;
+    *kmax = (d > 0 ? d : 0) + self->band_width;
+}
+
+static void
+_banded_fill(const LinearAligner* p, bool local, int kmin, int kmax,
+             unsigned char* trace,
+             int* iend, int* jend, int* state, double* result)
+/* Fill the band of the dynamic programming matrix row by row, using the rows
+ * p->fM, p->fIx, and p->fIy. If trace is not NULL, store the traceback in
+ * it, using kmax - kmin + 1 bytes per row. For a global alignment, the end
+ * point is (nA, nB); for a local alignment, it is the cell with the highest
+ * score in M. The end point, its state, and its score are stored in iend,
+ * jend, state, and result.
+ */
+{
+    int i, j;
+    int jlo, jhi;
+    int k;
+    const int nA = p->nA;
+    const int nB = p->nB;
+    const int width = kmax - kmin + 1;
+    double* M = p->fM;
+    double* Ix = p->fIx;
+    double* Iy = p->fIy;
+    double open_A, extend_A;
+    double dM, dX, dY;  /* scores of the cell at (i-1, j-1) */
+    double uM, uX, uY;  /* scores of the cell at (i-1, j) */
+    double score, open, extend;
+    double best = 0;
+    unsigned char* row = trace;
+    unsigned char bits;
+
+    *iend = 0;
+    *jend = 0;
+    *state = LINEAR_M;
+    k = local ? 1 : LINEAR_POSITION(0, nA);
+    open_A = p->open_A[k];
+    extend_A = p->extend_A[k];
+    jhi = nB < kmax ? nB : kmax;
+    M[0] = local ? -DBL_MAX : 0;
+    Ix[0] = -DBL_MAX;
+    Iy[0] = -DBL_MAX;
+    if (row) row[-kmin] = 0;
+    for (j = 1; j <= jhi; j++) {
+        M[j] = -DBL_MAX;
+        Ix[j] = -DBL_MAX;
+        if (local) {
+            Iy[j] = -DBL_MAX;
+            bits = 0;
+        }
+        else {
+            open = (M[j-1] >= Ix[j-1] ? M[j-1] : Ix[j-1]) + open_A;
+            extend = Iy[j-1] + extend_A;
+            if (extend >= open) {
+                Iy[j] = extend;
+                bits = LINEAR_Iy << 4;
+            }
+            else {
+                Iy[j] = open;
+                bits = (M[j-1] >= Ix[j-1] ? LINEAR_M : LINEAR_Ix) << 4;
+            }
+        }
+        if (row) row[j-kmin] = bits;
+    }
+    for (i = 1; i <= nA; i++) {
+        const int kA = p->sA[i-1];
+        jlo = i + kmin > 0 ? i + kmin : 0;
+        jhi = i + kmax < nB ? i + kmax : nB;
+        if (row) row += width;
+        k = local ? 1 : LINEAR_POSITION(i, nA);
+        open_A = p->open_A[k];
+        extend_A = p->extend_A[k];
+        if (jlo > 0) {
+            dM = M[jlo-1];
+            dX = Ix[jlo-1];
+            dY = Iy[jlo-1];
+        }
+        else dM = dX = dY = -DBL_MAX;
+        for (j = jlo; j <= jhi; j++) {
+            if (j < i + kmax) {
+                uM = M[j];
+                uX = Ix[j];
+                uY = Iy[j];
+            }
+            else uM = uX = uY = -DBL_MAX;
+            /* aligned letters */
+            if (j == 0) {
+                M[j] = -DBL_MAX;
+                bits = 0;
+            }
+            else {
+                if (dM >= dX && dM >= dY) {
+                    score = dM;
+                    bits = LINEAR_M;
+                }
+                else if (dX >= dY) {
+                    score = dX;
+                    bits = LINEAR_Ix;
+                }
+                else {
+                    score = dY;
+                    bits = LINEAR_Iy;
+                }
+                if (local && score <= 0) {
+                    score = 0;
+                    bits = BANDED_START;
+                }
+                score += _linear_pair_score(p, kA, p->sB[j-1]);
+                M[j] = score;
+                if (local && score > best) {
+                    best = score;
+                    *iend = i;
+                    *jend = j;
+                }
+            }
+            /* gap in sequence B */
+            if (local && j == 0) Ix[j] = -DBL_MAX;
+            else {
+                k = local ? 1 : LINEAR_POSITION(j, nB);
+                open = (uM >= uY ? uM : uY) + p->open_B[k];
+                extend = uX + p->extend_B[k];
+                if (extend >= open) {
+                    Ix[j] = extend;
+                    bits |= LINEAR_Ix << 2;
+                }
+                else {
+                    Ix[j] = open;
+                    bits |= (uM >= uY ? LINEAR_M : LINEAR_Iy) << 2;
+                }
+            }
+            /* gap in sequence A */
+            if (j == jlo) Iy[j] = -DBL_MAX;
+            else {
+                open = (M[j-1] >= Ix[j-1] ? M[j-1] : Ix[j-1]) + open_A;
+                extend = Iy[j-1] + extend_A;
+                if (extend >= open) {
+                    Iy[j] = extend;
+                    bits |= LINEAR_Iy << 4;
+                }
+                else {
+                    Iy[j] = open;
+                    bits |= (M[j-1] >= Ix[j-1] ? LINEAR_M : LINEAR_Ix) << 4;
+                }
+            }
+            if (row) row[j-i-kmin] = bits;
+            dM = uM;
+            dX = uX;
+            dY = uY;
+        }
+    }
+    if (local) {
+        *result = best;
+        return;
+    }
+    *iend = nA;
+    *jend = nB;
+    if (M[nB] >= Ix[nB] && M[nB] >= Iy[nB]) {
+        *state = LINEAR_M;
+        *result = M[nB];
+    }
+    else if (Ix[nB] >= Iy[nB]) {
+        *state = LINEAR_Ix;
+        *result = Ix[nB];
+    }
+    else {
+        *state = LINEAR_Iy;
+        *result = Iy[nB];
+    }
+}
+
+static int
+Aligner_banded_score(const Aligner* self,
+                     const int* sA, int nA,
+                     const int* sB, int nB,
+                     unsigned char strand,
+                     double* result)
+{
+    LinearAligner p;
+    int kmin, kmax;
+    int iend, jend, state;
+    double* rows;
+
+    if (!_linear_init(&p, self, sA, nA, sB, nB, strand)) return -2;
+    rows = PyMem_RawMalloc(3 * (size_t)(nB + 1) * sizeof(double));
+    if (!rows) return -1;
+    p.fM = rows;
+    p.fIx = p.fM + nB + 1;
+    p.fIy = p.fIx + nB + 1;
+    _banded_limits(self, nA, nB, &kmin, &kmax);
+    _banded_fill(&p, self->mode == Local, kmin, kmax, NULL,
+                 &iend, &jend, &state, result);
+    PyMem_RawFree(rows);
+    return 0;
+}
+
+static int
+_align_banded(const Aligner* self,
+              const int* sA, int nA,
+              const int* sB, int nB,
+              unsigned char strand,
+              unsigned char** steps, Py_ssize_t* nsteps,
+              int* iA, int* iB,
+              double* result)
+/* Find one optimal alignment within the band. The arguments and return
+ * value are as for _align_linear.
+ */
+{
+    LinearAligner p;
+    const bool local = (self->mode == Local);
+    int kmin, kmax;
+    int i, j, k;
+    int state;
+    int width;
+    unsigned char* trace;
+    unsigned char* path;
+    unsigned char bits;
+    double* rows;
+
+    *steps = NULL;
+    *nsteps = 0;
+    if (!_linear_init(&p, self, sA, nA, sB, nB, strand)) return -2;
+    _banded_limits(self, nA, nB, &kmin, &kmax);
+    width = kmax - kmin + 1;
+    rows = PyMem_RawMalloc(3 * (size_t)(nB + 1) * sizeof(double));
+    if (!rows) return -1;
+    p.fM = rows;
+    p.fIx = p.fM + nB + 1;
+    p.fIy = p.fIx + nB + 1;
+    trace = PyMem_RawMalloc((size_t)(nA + 1) * width);
+    if (!trace) {
+        PyMem_RawFree(rows);
+        return -1;
+    }
+    _banded_fill(&p, local, kmin, kmax, trace, &i, &j, &state, result);
+    PyMem_RawFree(rows);
+    if (local && *result <= 0) {
+        PyMem_RawFree(trace);
+        return 0;
+    }
+    path = PyMem_RawMalloc((size_t)nA + nB);
+    if (!path) {
+        PyMem_RawFree(trace);
+        return -1;
+    }
+    /* trace back from the end, storing the steps in reverse order */
+    k = 0;
+    while (i > 0 || j > 0) {
+        bits = trace[(size_t)i * width + (j - i - kmin)];
+        switch (state) {
+            case LINEAR_M:
+                path[k++] = DIAGONAL;
+                state = bits & 0x3;
+                i--;
+                j--;
+                break;
+            case LINEAR_Ix:
+                path[k++] = VERTICAL;
+                state = (bits >> 2) & 0x3;
+                i--;
+                break;
+            case LINEAR_Iy:
+                path[k++] = HORIZONTAL;
+                state = (bits >> 4) & 0x3;
+                j--;
+                break;
+        }
+        if (state == BANDED_START) break;
+    }
+    PyMem_RawFree(trace);
+    *iA = i;
+    *iB = j;
+    for (i = 0, j = k - 1; i < j; i++, j--) {
+        const unsigned char step = path[i];
+        path[i] = path[j];
+        path[j] = step;
+    }
+    *steps = path;
+    *nsteps = k;
+    return 0;
+}
+
+typedef int (*PathFunction)(const Aligner*, const int*, int, const int*, int,
+                            unsigned char, unsigned char**, Py_ssize_t*,
+                            int*, int*, double*);
+
+static PyObject*
+_align_path(Aligner* self, PyObject* args, PyObject* keywords,
+            PathFunction function)
+/* Align two sequences using _align_linear or _align_banded, and return a
+ * tuple of the score and the path, or None if there is no alignment.
+ */
+{
+    const int* sA;
+    const int* sB;
+    int nA;
+    int nB;
+    int iA = 0;
+    int iB = 0;
+    Py_buffer bA = {0};
+    Py_buffer bB = {0};
+    const Algorithm algorithm = _get_algorithm(self);
+    char strand = '+';
+    PyObject* path = NULL;
+    PyObject* result = NULL;
+    PyObject* substitution_matrix = self->substitution_matrix.obj;
+    unsigned char* steps;
+    Py_ssize_t nsteps;
+    Aligner aligner;
+    double score;
+    int status;
+
+    static char *kwlist[] = {"sequenceA", "sequenceB", "strand", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
+                                     sequence_converter, &bA,
+                                     sequence_converter, &bB,
+                                     strand_converter, &strand))
+        return NULL;
+
+    if (algorithm == WatermanSmithBeyer) {
+        if (function == _align_banded)
+            PyErr_SetString(PyExc_ValueError,
+                "banded alignment requires affine gap scores");
+        else
+            PyErr_SetString(PyExc_ValueError,
+                "alignment in linear memory requires affine gap scores");
+        goto exit;
+    }
+
+    if (substitution_matrix) {
+        if (!_prepare_indices(&self->substitution_matrix, &bA, &bB)) goto exit;
+    }
+
+    nA = (int) (bA.len / bA.itemsize);
+    nB = (int) (bB.len / bB.itemsize);
+    if (nA != bA.len / bA.itemsize || nB != bB.len / bB.itemsize) {
+        PyErr_SetString(PyExc_ValueError, "sequences too long");
+        goto exit;
+    }
+    sA = bA.buf;
+    sB = bB.buf;
+
+    if (!_copy_aligner(self, &aligner)) goto exit;
+    if (aligner.mode == FOGSAA_Mode) aligner.mode = Global;
+    Py_BEGIN_ALLOW_THREADS
+    status = function(&aligner, sA, nA, sB, nB, strand,
+                      &steps, &nsteps, &iA, &iB, &score);
+    Py_END_ALLOW_THREADS
+    _release_aligner(&aligner);
+    if (!_check_score_status(status)) goto exit;
+    if (steps) {
+        path = _create_linear_path(steps, nsteps, iA, iB, nB, strand);
+        PyMem_RawFree(steps);
+        if (!path) goto exit;
+    }
+    else {
+        path = Py_None;
+        Py_INCREF(path);
+    }
+    result = Py_BuildValue("(dN)", score, path);
+
+exit:
+    sequence_converter(NULL, &bA);
+    sequence_converter(NULL, &bB);
+
+    return result;
+}
+
+static const char Aligner_align_linear__doc__[] =
+"find one optimal alignment of two sequences in linear memory";
+
+static PyObject*
+Aligner_align_linear(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    return _align_path(self, args, keywords, _align_linear);
+}
+
+static const char Aligner_align_banded__doc__[] =
+"find one optimal alignment of two sequences within the band";
+
+static PyObject*
+Aligner_align_banded(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    if (self->band_width < 0) {
+        PyErr_SetString(PyExc_ValueError, "band_width has not been set");
+        return NULL;
+    }
+    return _align_path(self, args, keywords, _align_banded);
+}
+
+static const char Aligner_align__doc__[] = "align two sequences";
+
+static PyObject*
+Aligner_align(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    const int* sA;
+    const int* sB;
+    int nA;
+    int nB;
+    Py_buffer bA = {0};
+    Py_buffer bB = {0};
+    const Mode mode = self->mode;
+    const Algorithm algorithm = _get_algorithm(self);
+    char strand = '+';
+    PyObject* result = NULL;
+    PyObject* substitution_matrix = self->substitution_matrix.obj;
+
+    static char *kwlist[] = {"sequenceA", "sequenceB", "strand", NULL};
+
+    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
+                                    sequence_converter, &bA,
+                                    sequence_converter, &bB,
+                                    strand_converter, &strand))
+        return NULL;
+
+    if (substitution_matrix) {
+        if (!_prepare_indices(&self->substitution_matrix, &bA, &bB)) goto exit;
+    }
+
+    nA = (int) (bA.len / bA.itemsize);
+    nB = (int) (bB.len / bB.itemsize);
+    if (nA != bA.len / bA.itemsize || nB != bB.len / bB.itemsize) {
+        PyErr_SetString(PyExc_ValueError, "sequences too long");
+        goto exit;
+    }
+    sA = bA.buf;
+    sB = bB.buf;
+
+    switch (algorithm) {
+        case NeedlemanWunschSmithWaterman:
+            switch (mode) {
+                case Global:
+                    if (substitution_matrix)
+                        result = Aligner_needlemanwunsch_align_matrix(self, sA, nA, sB, nB, strand);
+                    else
+                        result = Aligner_needlemanwunsch_align_compare(self, sA, nA, sB, nB, strand);
+                    break;
+                case Local:
+                    if (substitution_matrix)
+                        result = Aligner_smithwaterman_align_matrix(self, sA, nA, sB, nB, strand);
+                    else
+                        result = Aligner_smithwaterman_align_compare(self, sA, nA, sB, nB, strand);
+                    break;
+                default:
+                    ERR_UNEXPECTED_MODE
+                    goto exit;
+            }
+            break;
+        case Gotoh:
+            switch (mode) {
+                case Global:
+                    if (substitution_matrix)
+                        result = Aligner_gotoh_global_align_matrix(self, sA, nA, sB, nB, strand);
+                    else
+                        result = Aligner_gotoh_global_align_compare(self, sA, nA, sB, nB, strand);
+                    break;
+                case Local:
+                    if (substitution_matrix)
+                        result = Aligner_gotoh_local_align_matrix(self, sA, nA, sB, nB, strand);
+                    else
+                        result = Aligner_gotoh_local_align_compare(self, sA, nA, sB, nB, strand);
+                    break;
+                default:
+                    ERR_UNEXPECTED_MODE
                     goto exit;
             }
             break;
@@ -7657,11 +9535,26 @@ static PyMethodDef Aligner_methods[] = {
      METH_VARARGS | METH_KEYWORDS,
      Aligner_score__doc__
     },
+    {"score_many",
+     (PyCFunction)Aligner_score_many,
+     METH_VARARGS | METH_KEYWORDS,
+     Aligner_score_many__doc__
+    },
     {"align",
      (PyCFunction)Aligner_align,
      METH_VARARGS | METH_KEYWORDS,
      Aligner_align__doc__
     },
+    {"align_linear",
+     (PyCFunction)Aligner_align_linear,
+     METH_VARARGS | METH_KEYWORDS,
+     Aligner_align_linear__doc__
+    },
+    {"align_banded",
+     (PyCFunction)Aligner_align_banded,
+     METH_VARARGS | METH_KEYWORDS,
+     Aligner_align_banded__doc__
+    },
     {"warn_defaults_changed",
      (PyCFunction)Aligner_warn_defaults_changed,
      METH_NOARGS,
@@ -57,4 +57,5 @@ typedef struct {
     Py_buffer substitution_matrix;
     PyObject* alphabet;
     int wildcard;
+    int band_width;  /* -1 if the alignment is not restricted to a band */
 } Aligner;
@@ -0,0 +1,820 @@
+# Copyright 2026 by the Biopython contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Bio.Align support for the "bam" pairwise alignment format.
+
+The BAM format is the binary, BGZF compressed version of the Sequence
+Alignment/Map (SAM) format. It stores the same information as a SAM file,
+and the alignments are returned as the same Alignment objects as for the
+"sam" format; see ``Bio.Align.sam`` for a description of the attributes
+stored on each alignment.
+
+A BAM file sorted by coordinate can be indexed by a BAI (.bai) or CSI (.csi)
+index file, as created by ``samtools index`` or by the ``write_index``
+function in this module. The ``search`` method of the alignment iterator
+uses the index to read only the BGZF blocks that may contain alignments
+overlapping the requested region.
+
+See http://www.htslib.org/ for more information.
+
+You are expected to use this module via the Bio.Align functions.
+"""
+
+import os
+import re
+import struct
+from io import StringIO
+
+import numpy as np
+
+from Bio import bgzf
+from Bio import StreamModeError
+from Bio.Align import Alignments
+from Bio.Align import sam
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+
+_CIGAR_OPERATIONS = "MIDNSHP=X"
+_SEQUENCE_LETTERS = "=ACMGRSVTWYHKDBN"
+
+# refID, pos, l_read_name, mapq, bin, n_cigar_op, flag, l_seq, next_refID,
+# next_pos, tlen
+_record_formatter = struct.Struct("<iiBBHHHiiii")
+
+_tag_formats = {
+    "c": struct.Struct("<b"),
+    "C": struct.Struct("<B"),
+    "s": struct.Struct("<h"),
+    "S": struct.Struct("<H"),
+    "i": struct.Struct("<i"),
+    "I": struct.Struct("<I"),
+    "f": struct.Struct("<f"),
+}
+
+_array_dtypes = {
+    "c": np.dtype("int8"),
+    "C": np.dtype("uint8"),
+    "s": np.dtype("<i2"),
+    "S": np.dtype("<u2"),
+    "i": np.dtype("<i4"),
+    "I": np.dtype("<u4"),
+    "f": np.dtype("<f4"),
+}
+
+_sequence_letters = np.frombuffer(_SEQUENCE_LETTERS.encode(), np.uint8)
+_sequence_codes = np.full(256, 15, np.uint8)
+for _code, _letter in enumerate(_SEQUENCE_LETTERS):
+    _sequence_codes[ord(_letter)] = _code
+    _sequence_codes[ord(_letter.lower())] = _code
+
+
+def _reg2bin(beg, end, min_shift=14, depth=5):
+    """Return the bin of the region from beg to end (PRIVATE).
+
+    This follows the binning scheme of the SAM/BAM specification; the BAI
+    index uses min_shift=14 and depth=5.
+    """
+    end -= 1
+    shift = min_shift
+    t = ((1 << depth * 3) - 1) // 7
+    for level in range(depth, 0, -1):
+        if beg >> shift == end >> shift:
+            return t + (beg >> shift)
+        shift += 3
+        t -= 1 << (level - 1) * 3
+    return 0
+
+
+def _reg2bins(beg, end, min_shift=14, depth=5):
+    """Return the bins that may contain alignments overlapping a region (PRIVATE)."""
+    end -= 1
+    bins = []
+    shift = min_shift + depth * 3
+    t = 0
+    for level in range(depth + 1):
+        bins.extend(range(t + (beg >> shift), t + (end >> shift) + 1))
+        shift -= 3
+        t += 1 << level * 3
+    return bins
+
+
+def _reference_end(data):
+    """Return the reference start and end position of a BAM record (PRIVATE).
+
+    The end position is calculated from the CIGAR string. Unmapped reads and
+    alignments without reference bases are taken to span one position, as
+    in samtools. The argument is the record without its block_size field.
+    """
+    pos = _record_formatter.unpack_from(data)[1]
+    l_read_name = data[8]
+    n_cigar_op = int.from_bytes(data[12:14], "little")
+    start = _record_formatter.size + l_read_name
+    cigar = np.frombuffer(data, "<u4", n_cigar_op, start)
+    operations = cigar & 0xF
+    # M, D, N, =, X consume reference bases
+    consumes = (operations == 0) | (operations == 2) | (operations == 3)
+    consumes |= (operations == 7) | (operations == 8)
+    length = int(np.sum(cigar[consumes] >> 4))
+    if length == 0:
+        length = 1
+    return pos, pos + length
+
+
+class _Index:
+    """Bins and linear index of a BAI or CSI index file (PRIVATE)."""
+
+    def __init__(self, filename):
+        with open(filename, "rb") as stream:
+            data = stream.read(4)
+            if data == b"BAI\1":
+                csi = False
+                self.min_shift = 14
+                self.depth = 5
+                data = stream.read()
+                offset = 0
+            else:
+                stream.seek(0)
+                with bgzf.BgzfReader(fileobj=stream, mode="rb") as handle:
+                    data = b"".join(iter(lambda: handle.read(65536), b""))
+                if data[:4] != b"CSI\1":
+                    raise ValueError(f"{filename} is not a BAI or CSI index file")
+                csi = True
+                self.min_shift, self.depth, l_aux = struct.unpack_from("<iii", data, 4)
+                offset = 16 + l_aux
+        pseudo_bin = ((1 << (self.depth * 3 + 3)) - 1) // 7 + 1
+        (n_ref,) = struct.unpack_from("<i", data, offset)
+        offset += 4
+        self.references = []
+        for i in range(n_ref):
+            (n_bin,) = struct.unpack_from("<i", data, offset)
+            offset += 4
+            bins = {}
+            for j in range(n_bin):
+                if csi:
+                    bin, loffset, n_chunk = struct.unpack_from("<IQi", data, offset)
+                    offset += 16
+                else:
+                    bin, n_chunk = struct.unpack_from("<Ii", data, offset)
+                    loffset = 0
+                    offset += 8
+                chunks = struct.unpack_from("<%dQ" % (2 * n_chunk), data, offset)
+                offset += 16 * n_chunk
+                if bin != pseudo_bin:
+                    bins[bin] = (loffset, list(zip(chunks[::2], chunks[1::2])))
+            if csi:
+                linear = None
+            else:
+                (n_intv,) = struct.unpack_from("<i", data, offset)
+                offset += 4
+                linear = struct.unpack_from("<%dQ" % n_intv, data, offset)
+                offset += 8 * n_intv
+            self.references.append((bins, linear))
+
+    def query(self, refID, beg, end):
+        """Return the merged chunks that may contain alignments in a region."""
+        if refID >= len(self.references):
+            return []
+        bins, linear = self.references[refID]
+        min_shift = self.min_shift
+        depth = self.depth
+        if linear is None:
+            # use the lowest virtual offset stored for the smallest bin
+            # containing beg
+            bin = ((1 << depth * 3) - 1) // 7 + (beg >> min_shift)
+            while bin > 0 and bin not in bins:
+                bin = (bin - 1) >> 3
+            min_offset = bins[bin][0] if bin in bins else 0
+        elif linear:
+            min_offset = linear[min(beg >> min_shift, len(linear) - 1)]
+        else:
+            min_offset = 0
+        chunks = []
+        for bin in _reg2bins(beg, end, min_shift, depth):
+            try:
+                loffset, bin_chunks = bins[bin]
+            except KeyError:
+                continue
+            chunks.extend(chunk for chunk in bin_chunks if chunk[1] > min_offset)
+        chunks.sort()
+        merged = []
+        for chunk_beg, chunk_end in chunks:
+            if merged and chunk_beg <= merged[-1][1]:
+                if chunk_end > merged[-1][1]:
+                    merged[-1][1] = chunk_end
+            else:
+                merged.append([chunk_beg, chunk_end])
+        return merged
+
+
+def _read_binary_header(stream):
+    """Read the header of a BAM file (PRIVATE).
+
+    Return the header text, and a list of the names and lengths of the
+    reference sequences.
+    """
+    magic = stream.read(4)
+    if magic != b"BAM\1":
+        raise ValueError("file does not start with the BAM magic string")
+    (l_text,) = struct.unpack("<i", stream.read(4))
+    text = stream.read(l_text).rstrip(b"\0").decode()
+    (n_ref,) = struct.unpack("<i", stream.read(4))
+    references = []
+    for i in range(n_ref):
+        (l_name,) = struct.unpack("<i", stream.read(4))
+        name = stream.read(l_name).rstrip(b"\0").decode()
+        (l_ref,) = struct.unpack("<I", stream.read(4))
+        references.append((name, l_ref))
+    return text, references
+
+
+def write_index(filename, fmt="bai", min_shift=14, depth=5):
+    """Create a BAI or CSI index for a BAM file sorted by coordinate.
+
+    Arguments:
+     - filename  - name of the BAM file.
+     - fmt       - "bai" (default) or "csi".
+     - min_shift - the size of the smallest bin is 2**min_shift. For the BAI
+                   format, this must be 14 (default value).
+     - depth     - the number of levels of bins. For the BAI format, this must
+                   be 5 (default value).
+
+    The index is written to a file with ".bai" or ".csi" appended to the name
+    of the BAM file. A ValueError is raised if the BAM file is not sorted by
+    coordinate.
+    """
+    fmt = fmt.lower()
+    if fmt == "bai":
+        if min_shift != 14 or depth != 5:
+            raise ValueError("the BAI format requires min_shift=14 and depth=5")
+    elif fmt != "csi":
+        raise ValueError(f"unknown index format '{fmt}'; expected 'bai' or 'csi'")
+    pseudo_bin = ((1 << (depth * 3 + 3)) - 1) // 7 + 1
+    with bgzf.BgzfReader(filename, "rb") as stream:
+        text, references = _read_binary_header(stream)
+        indices = [None] * len(references)
+        n_no_coor = 0
+        previous = (0, -1)
+        offset = stream.tell()
+        while True:
+            data = stream.read(4)
+            if not data:
+                break
+            (block_size,) = struct.unpack("<i", data)
+            data = stream.read(block_size)
+            end_offset = stream.tell()
+            values = _record_formatter.unpack_from(data)
+            refID = values[0]
+            flag = values[6]
+            if refID < 0:
+                n_no_coor += 1
+                previous = (len(references), 0)
+                offset = end_offset
+                continue
+            beg, end = _reference_end(data)
+            if (refID, beg) < previous:
+                raise ValueError("BAM file is not sorted by coordinate")
+            previous = (refID, beg)
+            index = indices[refID]
+            if index is None:
+                # bins, linear index, first and last offset, mapped, unmapped
+                index = indices[refID] = [{}, [], offset, end_offset, 0, 0]
+            bins, linear = index[:2]
+            chunks = bins.setdefault(_reg2bin(beg, end, min_shift, depth), [])
+            if chunks and chunks[-1][1] == offset:
+                chunks[-1][1] = end_offset
+            else:
+                chunks.append([offset, end_offset])
+            last = (end - 1) >> min_shift
+            if last >= len(linear):
+                linear.extend([None] * (last + 1 - len(linear)))
+            for window in range(beg >> min_shift, last + 1):
+                if linear[window] is None:
+                    linear[window] = offset
+            index[3] = end_offset
+            if flag & 0x4:
+                index[5] += 1
+            else:
+                index[4] += 1
+            offset = end_offset
+    if fmt == "bai":
+        stream = open(filename + ".bai", "wb")
+        stream.write(b"BAI\1")
+    else:
+        stream = bgzf.BgzfWriter(filename + ".csi", "wb")
+        stream.write(b"CSI\1")
+        stream.write(struct.pack("<iii", min_shift, depth, 0))
+    with stream:
+        stream.write(struct.pack("<i", len(references)))
+        for index in indices:
+            if index is None:
+                stream.write(struct.pack("<i", 0))
+                if fmt == "bai":
+                    stream.write(struct.pack("<i", 0))
+                continue
+            bins, linear, first, last, n_mapped, n_unmapped = index
+            # windows without alignments get the offset of the previous window
+            value = first
+            for window, window_offset in enumerate(linear):
+                if window_offset is None:
+                    linear[window] = value
+                else:
+                    value = window_offset
+            stream.write(struct.pack("<i", len(bins) + 1))
+            for bin, chunks in sorted(bins.items()):
+                if fmt == "bai":
+                    stream.write(struct.pack("<Ii", bin, len(chunks)))
+                else:
+                    # the linear index offset at the start of the bin
+                    level = 0
+                    while bin >= ((1 << (level + 1) * 3) - 1) // 7:
+                        level += 1
+                    start = (bin - ((1 << level * 3) - 1) // 7) << (
+                        min_shift + 3 * (depth - level)
+                    )
+                    loffset = linear[start >> min_shift]
+                    stream.write(struct.pack("<IQi", bin, loffset, len(chunks)))
+                for chunk in chunks:
+                    stream.write(struct.pack("<QQ", *chunk))
+            if fmt == "bai":
+                stream.write(struct.pack("<Ii", pseudo_bin, 2))
+            else:
+                stream.write(struct.pack("<IQi", pseudo_bin, 0, 2))
+            stream.write(struct.pack("<QQQQ", first, last, n_mapped, n_unmapped))
+            if fmt == "bai":
+                stream.write(struct.pack("<i", len(linear)))
+                stream.write(struct.pack("<%dQ" % len(linear), *linear))
+        stream.write(struct.pack("<Q", n_no_coor))
+
+
+class AlignmentWriter(sam.AlignmentWriter):
+    """Alignment file writer for the binary Sequence Alignment/Map (BAM) format."""
+
+    fmt = "BAM"
+    mode = "b"
+
+    def __init__(self, target, md=False, targets=None):
+        """Create an AlignmentWriter object.
+
+        Arguments:
+         - target  - output stream or file name.
+         - md      - If True, calculate the MD tag from the alignment and
+                     include it in the output.
+                     If False (default), do not include the MD tag in the
+                     output.
+         - targets - A list of SeqRecord objects with the reference sequences.
+                     The sequence contents in each SeqRecord may be undefined,
+                     but the sequence length must be defined.
+                     If targets is None (the default value), the alignments
+                     must have an attribute .targets providing the list of
+                     SeqRecord objects.
+
+        The alignments are written in the order given; to create an index
+        with ``write_index``, they must be sorted by coordinate.
+        """
+        super().__init__(target, md=md)
+        self.targets = targets
+
+    def write_header(self, stream, alignments):
+        """Write the BAM header, including the SAM header text."""
+        if self.targets is None:
+            try:
+                targets = alignments.targets
+            except AttributeError:
+                raise ValueError(
+                    "targets must be provided if the alignments do not have a "
+                    ".targets attribute"
+                ) from None
+        else:
+            targets = self.targets
+        header = Alignments()
+        header.targets = targets
+        try:
+            header.metadata = alignments.metadata
+        except AttributeError:
+            pass
+        text = StringIO()
+        super().write_header(text, header)
+        text = text.getvalue().encode()
+        stream.write(b"BAM\1")
+        stream.write(struct.pack("<i", len(text)))
+        stream.write(text)
+        stream.write(struct.pack("<i", len(targets)))
+        for record in targets:
+            name = record.id.encode() + b"\0"
+            stream.write(struct.pack("<i", len(name)))
+            stream.write(name)
+            stream.write(struct.pack("<I", len(record.seq)))
+        self._target_indices = {record.id: i for i, record in enumerate(targets)}
+
+    def format_alignment(self, alignment, md=None):
+        """Return a bytes object with a single alignment as a BAM record."""
+        line = super().format_alignment(alignment, md)
+        fields = line.rstrip("\n").split("\t")
+        qname = fields[0].encode() + b"\0"
+        flag = int(fields[1])
+        refID = self._get_reference_index(fields[2])
+        pos = int(fields[3]) - 1
+        mapq = int(fields[4])
+        cigar = [
+            int(number) << 4 | _CIGAR_OPERATIONS.index(letter)
+            for number, letter in re.findall(r"(\d+)([MIDNSHP=X])", fields[5])
+        ]
+        rnext = fields[6]
+        if rnext == "=":
+            next_refID = refID
+        else:
+            next_refID = self._get_reference_index(rnext)
+        next_pos = int(fields[7]) - 1
+        tlen = int(fields[8])
+        query = fields[9]
+        qual = fields[10]
+        tags = fields[11:]
+        if query == "*":
+            l_seq = 0
+            seq = b""
+        else:
+            l_seq = len(query)
+            codes = np.zeros(l_seq + l_seq % 2, np.uint8)
+            codes[:l_seq] = _sequence_codes[np.frombuffer(query.encode(), np.uint8)]
+            seq = ((codes[0::2] << 4) | codes[1::2]).tobytes()
+        if qual == "*":
+            qual = b"\xff" * l_seq
+        else:
+            qual = (np.frombuffer(qual.encode(), np.uint8) - 33).tobytes()
+        length = 0
+        for value in cigar:
+            if value & 0xF in (0, 2, 3, 7, 8):
+                length += value >> 4
+        if length == 0:
+            length = 1
+        if len(cigar) > 0xFFFF:
+            # store the CIGAR in the CG tag, as in the SAM/BAM specification
+            tags.append("CG:B:I," + ",".join(map(str, cigar)))
+            cigar = [l_seq << 4 | 4, length << 4 | 3]
+        data = _record_formatter.pack(
+            refID,
+            pos,
+            len(qname),
+            mapq,
+            _reg2bin(pos, pos + length),
+            len(cigar),
+            flag,
+            l_seq,
+            next_refID,
+            next_pos,
+            tlen,
+        )
+        data += qname
+        data += struct.pack("<%dI" % len(cigar), *cigar)
+        data += seq + qual
+        for tag in tags:
+            data += self._format_tag(tag)
+        return struct.pack("<i", len(data)) + data
+
+    def _get_reference_index(self, rname):
+        if rname == "*":
+            return -1
+        try:
+            return self._target_indices[rname]
+        except KeyError:
+            raise ValueError(f"target '{rname}' is not in the targets") from None
+
+    def _format_tag(self, field):
+        tag, datatype, value = field.split(":", 2)
+        data = tag.encode()
+        if datatype == "i":
+            value = int(value)
+            # use the smallest integer type, as samtools does
+            for letter in "CSI" if value >= 0 else "csi":
+                formatter = _tag_formats[letter]
+                try:
+                    return data + letter.encode() + formatter.pack(value)
+                except struct.error:
+                    continue
+            raise ValueError(f"integer value out of range in tag '{field}'")
+        elif datatype == "f":
+            return data + b"f" + _tag_formats["f"].pack(float(value))
+        elif datatype == "A":
+            return data + b"A" + value.encode()
+        elif datatype in "ZH":
+            return data + datatype.encode() + value.encode() + b"\0"
+        elif datatype == "B":
+            letter, *values = value.split(",")
+            values = np.array(values, _array_dtypes[letter].type)
+            return (
+                data
+                + b"B"
+                + letter.encode()
+                + struct.pack("<i", len(values))
+                + values.astype(_array_dtypes[letter]).tobytes()
+            )
+        raise ValueError(f"Unknown datatype '{datatype}' in tag '{field}'")
+
+    def write_file(self, stream, alignments):
+        """Write the alignments to the file stream, and return the number of alignments.
+
+        alignments - A list or iterator returning Alignment objects
+        stream     - Output file stream.
+        """
+        output = bgzf.BgzfWriter(fileobj=stream)
+        count = super().write_file(output, alignments)
+        output.flush()
+        # write the BGZF end-of-file marker without closing the stream
+        stream.write(bgzf._bgzf_eof)
+        return count
+
+
+class AlignmentIterator(sam.AlignmentIterator):
+    """Alignment iterator for binary Sequence Alignment/Map (BAM) files.
+
+    Each record in the file contains one genomic alignment, which is loaded
+    and returned incrementally as for SAM files.  The ``search`` method uses
+    a BAI or CSI index file to find alignments overlapping a region of a
+    reference sequence.
+    """
+
+    fmt = "BAM"
+    mode = "b"
+
+    def __init__(self, source, index=None):
+        """Create an AlignmentIterator object.
+
+        Arguments:
+         - source - input file stream, or path to input file
+         - index  - path to the BAI or CSI index file. If None (default), the
+                    index file is found by appending ".bai" or ".csi" to the
+                    path of the input file, or by replacing its ".bam"
+                    extension by ".bai". The index is needed for the search
+                    method only.
+
+        """
+        self.source = source
+        try:
+            stream = open(source, "rb")
+        except TypeError:  # not a path, assume we received a stream
+            if source.read(0) != b"":
+                raise StreamModeError(
+                    f"{self.fmt} files must be opened in binary mode."
+                ) from None
+            stream = source
+        self._close = stream is not source
+        self._stream = bgzf.BgzfReader(fileobj=stream, mode="rb")
+        self._index_filename = index
+        self._index = 0
+        self._read_header(self._stream)
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        try:
+            stream = self._stream
+        except AttributeError:
+            return
+        if self._close:
+            stream.close()
+        del self._stream
+
+    def _read_header(self, stream):
+        text, references = _read_binary_header(stream)
+        sam.AlignmentIterator._read_header(self, StringIO(text))
+        # the reference sequences in the binary header define the refID
+        # values; the @SQ lines in the header text are optional in BAM
+        targets = []
+        for name, length in references:
+            index = self._target_indices.get(name)
+            if index is None:
+                record = SeqRecord(Seq(None, length=length), id=name, description="")
+            else:
+                record = self.targets[index]
+            targets.append(record)
+        self.targets = targets
+        self._target_indices = {
+            record.id: index for index, record in enumerate(self.targets)
+        }
+
+    def _read_next_alignment(self, stream):
+        data = stream.read(4)
+        if not data:
+            return None
+        (block_size,) = struct.unpack("<i", data)
+        data = stream.read(block_size)
+        if len(data) < block_size:
+            raise ValueError("BAM file is truncated")
+        return self._parse_record(data)
+
+    def _parse_record(self, data):
+        (
+            refID,
+            pos,
+            l_read_name,
+            mapq,
+            bin,
+            n_cigar_op,
+            flag,
+            l_seq,
+            next_refID,
+            next_pos,
+            tlen,
+        ) = _record_formatter.unpack_from(data)
+        offset = _record_formatter.size
+        qname = data[offset : offset + l_read_name - 1].decode()
+        offset += l_read_name
+        cigar = np.frombuffer(data, "<u4", n_cigar_op, offset)
+        offset += 4 * n_cigar_op
+        size = (l_seq + 1) // 2
+        codes = np.frombuffer(data, np.uint8, size, offset)
+        offset += size
+        if l_seq == 0:
+            query = "*"
+        else:
+            letters = np.empty(2 * size, np.uint8)
+            letters[0::2] = codes >> 4
+            letters[1::2] = codes & 0xF
+            query = _sequence_letters[letters[:l_seq]].tobytes().decode()
+        qual = data[offset : offset + l_seq]
+        offset += l_seq
+        if l_seq == 0 or qual[0] == 0xFF:
+            qual = None
+        else:
+            qual = list(qual)
+        md = None
+        score = None
+        annotations = {}
+        n = len(data)
+        while offset < n:
+            tag = data[offset : offset + 2].decode()
+            datatype = chr(data[offset + 2])
+            offset += 3
+            if datatype in _tag_formats:
+                formatter = _tag_formats[datatype]
+                (value,) = formatter.unpack_from(data, offset)
+                offset += formatter.size
+            elif datatype == "A":
+                value = chr(data[offset])
+                offset += 1
+            elif datatype in "ZH":
+                end = data.index(0, offset)
+                value = data[offset:end].decode()
+                offset = end + 1
+                if datatype == "H":
+                    value = bytes.fromhex(value)
+            elif datatype == "B":
+                letter = chr(data[offset])
+                (count,) = struct.unpack_from("<i", data, offset + 1)
+                offset += 5
+                dtype = _array_dtypes[letter]
+                value = np.frombuffer(data, dtype, count, offset)
+                offset += count * dtype.itemsize
+                if letter == "f":
+                    value = value.astype(float)
+                else:
+                    value = value.astype(int)
+            else:
+                raise ValueError(f"Unknown datatype '{datatype}' in tag '{tag}'")
+            if tag == "AS":
+                score = value
+            elif tag == "MD":
+                md = value
+            else:
+                annotations[tag] = value
+        if (
+            n_cigar_op == 2
+            and cigar[0] == (l_seq << 4 | 4)
+            and cigar[1] & 0xF == 3
+            and "CG" in annotations
+        ):
+            # the CIGAR string was too long to be stored in the record
+            cigar = annotations.pop("CG")
+        cigar = "".join(
+            "%d%s" % (value >> 4, _CIGAR_OPERATIONS[value & 0xF]) for value in cigar
+        )
+        if not cigar:
+            cigar = "*"
+        if refID < 0:
+            rname = "*"
+        else:
+            rname = self.targets[refID].id
+        if next_refID < 0:
+            rnext = "*"
+        elif next_refID == refID:
+            rnext = "="
+        else:
+            rnext = self.targets[next_refID].id
+        return self._create_alignment(
+            qname,
+            flag,
+            rname,
+            pos,
+            mapq,
+            cigar,
+            rnext,
+            next_pos,
+            tlen,
+            query,
+            qual,
+            md,
+            score,
+            annotations,
+        )
+
+    def _load_index(self):
+        filename = self._index_filename
+        if filename is None:
+            try:
+                path = os.fspath(self.source)
+            except TypeError:
+                path = getattr(self.source, "name", None)
+                if not isinstance(path, str):
+                    raise ValueError(
+                        "index file name must be given if the BAM file is a stream"
+                    ) from None
+            candidates = [path + ".bai", path + ".csi"]
+            if path.endswith(".bam"):
+                candidates.append(path[:-4] + ".bai")
+            for filename in candidates:
+                if os.path.exists(filename):
+                    break
+            else:
+                raise ValueError(f"failed to find a BAI or CSI index for {path}")
+        return _Index(filename)
+
+    def search(self, chromosome=None, start=None, end=None):
+        """Iterate over alignments overlapping the specified chromosome region.
+
+        This method uses the BAI or CSI index to find alignments to the
+        specified chromosome that fully or partially overlap the chromosome
+        region between start and end. Only the BGZF blocks that may contain
+        such alignments are read. As in samtools, unmapped reads placed at a
+        position in the region are included.
+
+        Arguments:
+         - chromosome - chromosome name. If None (default value), include all
+           alignments.
+         - start      - starting position on the chromosome. If None (default
+           value), use 0 as the starting position.
+         - end        - end position on the chromosome. If None (default value),
+           use the length of the chromosome as the end position.
+
+        Searching does not change the position of the iterator in the file.
+        """
+        stream = self._stream
+        position = stream.tell()
+        if chromosome is None:
+            if start is not None or end is not None:
+                raise ValueError(
+                    "start and end must both be None if chromosome is None"
+                )
+            stream.seek(0)
+            _read_binary_header(stream)
+            while True:
+                alignment = self._read_next_alignment(stream)
+                if alignment is None:
+                    break
+                offset = stream.tell()
+                stream.seek(position)
+                yield alignment
+                position = stream.tell()
+                stream.seek(offset)
+            stream.seek(position)
+            return
+        try:
+            refID = self._target_indices[chromosome]
+        except KeyError:
+            raise ValueError("Failed to find %s in alignments" % chromosome) from None
+        if start is None:
+            if end is None:
+                start = 0
+                end = len(self.targets[refID])
+            else:
+                raise ValueError("end must be None if start is None")
+        elif end is None:
+            end = start + 1
+        try:
+            index = self._bam_index
+        except AttributeError:
+            index = self._bam_index = self._load_index()
+        for chunk_beg, chunk_end in index.query(refID, start, end):
+            stream.seek(chunk_beg)
+            while stream.tell() < chunk_end:
+                data = stream.read(4)
+                if not data:
+                    break
+                (block_size,) = struct.unpack("<i", data)
+                data = stream.read(block_size)
+                if _record_formatter.unpack_from(data)[0] != refID:
+                    break
+                beg, stop = _reference_end(data)
+                if beg >= end:
+                    # the file is sorted, so no later alignments overlap
+                    stream.seek(position)
+                    return
+                if stop <= start:
+                    continue
+                alignment = self._parse_record(data)
+                offset = stream.tell()
+                stream.seek(position)
+                yield alignment
+                position = stream.tell()
+                stream.seek(offset)
+        stream.seek(position)
@@ -242,7 +242,10 @@ class AlignmentWriter(interfaces.AlignmentWriter):
             pnext = 0
         else:
             pnext += 1  # 1-based coordinates
-        tLen = 0
+        try:
+            tLen = alignment.tlen
+        except AttributeError:
+            tLen = 0
         fields = [
             qName,
             str(flag),
@@ -517,249 +520,288 @@ class AlignmentIterator(interfaces.AlignmentIterator):
                             )
                         value = np.array(value, dtype)
                     annotations[tag] = value
-            if flag & 0x10:
-                strand = "-"
+            if qual == "*":
+                qual = None
             else:
-                strand = "+"
-            hard_clip_left = None
-            hard_clip_right = None
-            store_operations = False
-            if flag & 0x4:  # unmapped
-                target = None
-                coordinates = None
-            elif md is None:
-                query_pos = 0
-                coordinates = [[target_pos, query_pos]]
-                number = ""
-                operations = bytearray()
-                for letter in cigar:
-                    if letter == "M":
-                        # M: alignment match
-                        length = int(number)
-                        target_pos += length
-                        query_pos += length
-                    elif letter in "=X":
-                        # =: sequence match
-                        # X: sequence mismatch
-                        length = int(number)
-                        target_pos += length
-                        query_pos += length
-                        store_operations = True
-                    elif letter == "I":
-                        # I: insertion to the reference
-                        length = int(number)
-                        query_pos += length
-                    elif letter == "S":
-                        # S: soft clipping
-                        length = int(number)
-                        if query_pos == 0:
-                            coordinates[0][1] += length
-                        query_pos += length
-                        number = ""
-                        continue
-                    elif letter == "D":
-                        # D: deletion from the reference
-                        length = int(number)
-                        target_pos += length
-                    elif letter == "N":
-                        # N: skipped region from the reference
-                        length = int(number)
-                        target_pos += length
-                        store_operations = True
-                    elif letter == "H":  # hard clipping
-                        if query_pos == 0:
-                            hard_clip_left = int(number)
-                        else:
-                            hard_clip_right = int(number)
-                        number = ""
-                        continue
-                    elif letter == "P":  # padding
-                        raise NotImplementedError(
-                            "padding operator is not yet implemented"
-                        )
+                qual = [ord(c) - 33 for c in qual]
+            return self._create_alignment(
+                qname,
+                flag,
+                rname,
+                target_pos,
+                mapq,
+                cigar,
+                rnext,
+                pnext,
+                tlen,
+                query,
+                qual,
+                md,
+                score,
+                annotations,
+            )
+
+    def _create_alignment(
+        self,
+        qname,
+        flag,
+        rname,
+        target_pos,
+        mapq,
+        cigar,
+        rnext,
+        pnext,
+        tlen,
+        query,
+        qual,
+        md,
+        score,
+        annotations,
+    ):
+        """Create an Alignment from the fields of a SAM record (PRIVATE).
+
+        The arguments are the values of the mandatory SAM fields, with the
+        zero-based target position and next position, the quality scores as
+        a list of integers (or None if not available), the values of the MD
+        and AS tags (None if absent), and a dictionary with all other tags.
+        """
+        if flag & 0x10:
+            strand = "-"
+        else:
+            strand = "+"
+        hard_clip_left = None
+        hard_clip_right = None
+        store_operations = False
+        if flag & 0x4:  # unmapped
+            target = None
+            coordinates = None
+        elif md is None:
+            query_pos = 0
+            coordinates = [[target_pos, query_pos]]
+            number = ""
+            operations = bytearray()
+            for letter in cigar:
+                if letter == "M":
+                    # M: alignment match
+                    length = int(number)
+                    target_pos += length
+                    query_pos += length
+                elif letter in "=X":
+                    # =: sequence match
+                    # X: sequence mismatch
+                    length = int(number)
+                    target_pos += length
+                    query_pos += length
+                    store_operations = True
+                elif letter == "I":
+                    # I: insertion to the reference
+                    length = int(number)
+                    query_pos += length
+                elif letter == "S":
+                    # S: soft clipping
+                    length = int(number)
+                    if query_pos == 0:
+                        coordinates[0][1] += length
+                    query_pos += length
+                    number = ""
+                    continue
+                elif letter == "D":
+                    # D: deletion from the reference
+                    length = int(number)
+                    target_pos += length
+                elif letter == "N":
+                    # N: skipped region from the reference
+                    length = int(number)
+                    target_pos += length
+                    store_operations = True
+                elif letter == "H":  # hard clipping
+                    if query_pos == 0:
+                        hard_clip_left = int(number)
                     else:
-                        number += letter
-                        continue
-                    coordinates.append([target_pos, query_pos])
-                    operations.append(ord(letter))
+                        hard_clip_right = int(number)
                     number = ""
-                index = self._target_indices.get(rname)
-                if index is None:
-                    if self.targets:
-                        raise ValueError(f"Found target {rname} missing from header")
-                    target = SeqRecord(None, id=rname, description="")
+                    continue
+                elif letter == "P":  # padding
+                    raise NotImplementedError("padding operator is not yet implemented")
                 else:
-                    target = self.targets[index]
-            else:
-                query_pos = 0
-                coordinates = [[target_pos, query_pos]]
-                seq = query
-                target = ""
-                starts = [target_pos]
-                size = 0
-                sizes = []
+                    number += letter
+                    continue
+                coordinates.append([target_pos, query_pos])
+                operations.append(ord(letter))
                 number = ""
-                operations = bytearray()
-                for letter in cigar:
-                    if letter in "M":
-                        # M: alignment match
-                        length = int(number)
-                        target_pos += length
-                        query_pos += length
-                        target += seq[:length]
-                        seq = seq[length:]
-                        size += length
-                    elif letter in "=X":
-                        # =: sequence match
-                        # X: sequence mismatch
-                        length = int(number)
-                        target_pos += length
-                        query_pos += length
-                        target += seq[:length]
-                        seq = seq[length:]
-                        size += length
-                        store_operations = True
-                    elif letter == "I":
-                        # I: insertion to the reference
-                        length = int(number)
-                        query_pos += length
-                        seq = seq[length:]
-                    elif letter == "S":
-                        # S: soft clipping
-                        length = int(number)
-                        if query_pos == 0:
-                            coordinates[0][1] += length
-                        query_pos += length
-                        seq = seq[length:]
-                        number = ""
-                        continue
-                    elif letter == "D":  # deletion from the reference
-                        length = int(number)
-                        target_pos += length
-                        size += length
-                        starts.append(target_pos)
-                        sizes.append(size)
-                        size = 0
-                    elif letter == "N":  # skipped region from the reference
-                        length = int(number)
-                        target_pos += length
-                        starts.append(target_pos)
-                        sizes.append(size)
-                        size = 0
-                        store_operations = True
-                    elif letter == "H":
-                        # hard clipping (clipped sequences not present in sequence)
-                        if query_pos == 0:
-                            hard_clip_left = int(number)
-                        else:
-                            hard_clip_right = int(number)
-                        number = ""
-                        continue
-                    elif letter == "P":  # padding
-                        raise NotImplementedError(
-                            "padding operator is not yet implemented"
-                        )
+            index = self._target_indices.get(rname)
+            if index is None:
+                if self.targets:
+                    raise ValueError(f"Found target {rname} missing from header")
+                target = SeqRecord(None, id=rname, description="")
+            else:
+                target = self.targets[index]
+        else:
+            query_pos = 0
+            coordinates = [[target_pos, query_pos]]
+            seq = query
+            target = ""
+            starts = [target_pos]
+            size = 0
+            sizes = []
+            number = ""
+            operations = bytearray()
+            for letter in cigar:
+                if letter in "M":
+                    # M: alignment match
+                    length = int(number)
+                    target_pos += length
+                    query_pos += length
+                    target += seq[:length]
+                    seq = seq[length:]
+                    size += length
+                elif letter in "=X":
+                    # =: sequence match
+                    # X: sequence mismatch
+                    length = int(number)
+                    target_pos += length
+                    query_pos += length
+                    target += seq[:length]
+                    seq = seq[length:]
+                    size += length
+                    store_operations = True
+                elif letter == "I":
+                    # I: insertion to the reference
+                    length = int(number)
+                    query_pos += length
+                    seq = seq[length:]
+                elif letter == "S":
+                    # S: soft clipping
+                    length = int(number)
+                    if query_pos == 0:
+                        coordinates[0][1] += length
+                    query_pos += length
+                    seq = seq[length:]
+                    number = ""
+                    continue
+                elif letter == "D":  # deletion from the reference
+                    length = int(number)
+                    target_pos += length
+                    size += length
+                    starts.append(target_pos)
+                    sizes.append(size)
+                    size = 0
+                elif letter == "N":  # skipped region from the reference
+                    length = int(number)
+                    target_pos += length
+                    starts.append(target_pos)
+                    sizes.append(size)
+                    size = 0
+                    store_operations = True
+                elif letter == "H":
+                    # hard clipping (clipped sequences not present in sequence)
+                    if query_pos == 0:
+                        hard_clip_left = int(number)
                     else:
-                        number += letter
-                        continue
-                    coordinates.append([target_pos, query_pos])
-                    operations.append(ord(letter))
+                        hard_clip_right = int(number)
                     number = ""
-                sizes.append(size)
-                seq = target
-                target = ""
+                    continue
+                elif letter == "P":  # padding
+                    raise NotImplementedError("padding operator is not yet implemented")
+                else:
+                    number += letter
+                    continue
+                coordinates.append([target_pos, query_pos])
+                operations.append(ord(letter))
                 number = ""
-                letters = iter(md)
-                for letter in letters:
-                    if letter in "ACGTNacgtn":
-                        if number:
-                            number = int(number)
-                            target += seq[:number]
-                            seq = seq[number:]
-                            number = ""
-                        target += letter
-                        seq = seq[1:]
-                    elif letter == "^":
-                        if number:
-                            number = int(number)
-                            target += seq[:number]
-                            seq = seq[number:]
-                            number = ""
-                        for letter in letters:
-                            if letter not in "ACGTNacgtn":
-                                break
-                            target += letter
-                        else:
+            sizes.append(size)
+            seq = target
+            target = ""
+            number = ""
+            letters = iter(md)
+            for letter in letters:
+                if letter in "ACGTNacgtn":
+                    if number:
+                        number = int(number)
+                        target += seq[:number]
+                        seq = seq[number:]
+                        number = ""
+                    target += letter
+                    seq = seq[1:]
+                elif letter == "^":
+                    if number:
+                        number = int(number)
+                        target += seq[:number]
+                        seq = seq[number:]
+                        number = ""
+                    for letter in letters:
+                        if letter not in "ACGTNacgtn":
                             break
-                        number = letter
+                        target += letter
                     else:
-                        number += letter
-                if number:
-                    number = int(number)
-                    target += seq[:number]
-                seq = target
-                rname_target = self.targets[self._target_indices[rname]]
-                length = len(rname_target.seq)
-                data = {}
-                index = 0
-                for start, size in zip(starts, sizes):
-                    data[start] = seq[index : index + size]
-                    index += size
+                        break
+                    number = letter
+                else:
+                    number += letter
+            if number:
+                number = int(number)
+                target += seq[:number]
+            seq = target
+            rname_target = self.targets[self._target_indices[rname]]
+            length = len(rname_target.seq)
+            data = {}
+            index = 0
+            for start, size in zip(starts, sizes):
+                data[start] = seq[index : index + size]
+                index += size
 
-                target = SeqRecord._from_validated(
-                    Seq(data, length=length),
-                    rname_target.id,
-                    rname_target.name,
-                    rname_target.description,
-                    annotations={
-                        key: copy.copy(val)
-                        for key, val in rname_target.annotations.items()
-                    },
-                )
-            if coordinates is not None:
-                coordinates = np.array(coordinates, np.intp).transpose()
-                if strand == "-":
-                    coordinates[1, :] = query_pos - coordinates[1, :]
-            if query == "*":
-                length = query_pos
-                sequence = Seq(None, length=length)
-            else:
-                sequence = Seq(query)
-                if not (flag & 0x4):  # not unmapped
-                    assert len(query) == query_pos
-                    if strand == "-":
-                        sequence = sequence.reverse_complement()
-            query = SeqRecord(sequence, id=qname, description="")
+            target = SeqRecord._from_validated(
+                Seq(data, length=length),
+                rname_target.id,
+                rname_target.name,
+                rname_target.description,
+                annotations={
+                    key: copy.copy(val) for key, val in rname_target.annotations.items()
+                },
+            )
+        if coordinates is not None:
+            coordinates = np.array(coordinates, np.intp).transpose()
             if strand == "-":
-                hard_clip_left, hard_clip_right = hard_clip_right, hard_clip_left
-            if hard_clip_left is not None:
-                query.annotations["hard_clip_left"] = hard_clip_left
-            if hard_clip_right is not None:
-                query.annotations["hard_clip_right"] = hard_clip_right
-            if qual != "*":
-                phred = [ord(c) - 33 for c in qual]
-                query.letter_annotations["phred_quality"] = phred
-            records = [target, query]
-            alignment = Alignment(records, coordinates)
-            alignment.flag = flag
-            if mapq != 255:
-                alignment.mapq = mapq
-            if rnext == "=":
-                alignment.rnext = rname
-            elif rnext != "*":
-                alignment.rnext = rnext
-            if pnext >= 0:
-                alignment.pnext = pnext
-            if tlen != 0:
-                alignment.tlen = tlen
-            if score is not None:
-                alignment.score = score
-            if annotations:
-                alignment.annotations = annotations
-            if hard_clip_left is not None:
-                alignment.hard_clip_left = hard_clip_left
-            if hard_clip_right is not None:
-                alignment.hard_clip_right = hard_clip_right
-            if store_operations:
-                alignment.operations = operations
-            return alignment
+                coordinates[1, :] = query_pos - coordinates[1, :]
+        if query == "*":
+            length = query_pos
+            sequence = Seq(None, length=length)
+        else:
+            sequence = Seq(query)
+            if not (flag & 0x4):  # not unmapped
+                assert len(query) == query_pos
+                if strand == "-":
+                    sequence = sequence.reverse_complement()
+        query = SeqRecord(sequence, id=qname, description="")
+        if strand == "-":
+            hard_clip_left, hard_clip_right = hard_clip_right, hard_clip_left
+        if hard_clip_left is not None:
+            query.annotations["hard_clip_left"] = hard_clip_left
+        if hard_clip_right is not None:
+            query.annotations["hard_clip_right"] = hard_clip_right
+        if qual is not None:
+            query.letter_annotations["phred_quality"] = qual
+        records = [target, query]
+        alignment = Alignment(records, coordinates)
+        alignment.flag = flag
+        if mapq != 255:
+            alignment.mapq = mapq
+        if rnext == "=":
+            alignment.rnext = rname
+        elif rnext != "*":
+            alignment.rnext = rnext
+        if pnext >= 0:
+            alignment.pnext = pnext
+        if tlen != 0:
+            alignment.tlen = tlen
+        if score is not None:
+            alignment.score = score
+        if annotations:
+            alignment.annotations = annotations
+        if hard_clip_left is not None:
+            alignment.hard_clip_left = hard_clip_left
+        if hard_clip_right is not None:
+            alignment.hard_clip_right = hard_clip_right
+        if store_operations:
+            alignment.operations = operations
+        return alignment
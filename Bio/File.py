@@ -14,7 +14,11 @@ indexing files. These are not intended for direct use.
 import collections.abc
 import contextlib
 import itertools
+import mmap
 import os
+import struct
+import uuid
+import weakref
 from abc import ABC
 from abc import abstractmethod
 
@@ -106,6 +110,46 @@ def _open_for_random_access(filename):
     return handle
 
 
+class _MappedFile(mmap.mmap):
+    """Read-only memory map of a file, pickled by its file name (PRIVATE).
+
+    Use _map_file to create these objects. Unpickling a _MappedFile maps the
+    file again, reusing an existing mapping of the file in the same process.
+    Sequence data that refer to the mapping can therefore be sent cheaply to
+    worker processes, which then share the file contents through the page
+    cache of the operating system.
+    """
+
+    def __new__(cls, filename):
+        """Map the file with the given name."""
+        with open(filename, "rb") as handle:
+            mapping = super().__new__(cls, handle.fileno(), 0, access=mmap.ACCESS_READ)
+        mapping.filename = filename
+        return mapping
+
+    def __reduce__(self):
+        return (_map_file, (self.filename,))
+
+
+_mapped_files = weakref.WeakValueDictionary()  # type: ignore
+
+
+def _map_file(filename):
+    """Return a read-only memory map of the file (PRIVATE).
+
+    Mappings are shared within the process for as long as they are in use,
+    unless the file was modified in the meantime.
+    """
+    filename = os.path.abspath(filename)
+    info = os.stat(filename)
+    key = (filename, info.st_size, info.st_mtime_ns)
+    mapping = _mapped_files.get(key)
+    if mapping is None:
+        mapping = _MappedFile(filename)
+        _mapped_files[key] = mapping
+    return mapping
+
+
 # The rest of this file defines code used in Bio.SeqIO and Bio.SearchIO
 # for indexing
 
@@ -264,6 +308,261 @@ class _IndexedSeqFileDict(collections.abc.Mapping):
         self._proxy._handle.close()
 
 
+# Header of the index files used by _MappedSeqFileDict: magic, file format,
+# number of records, size and modification time (in nanoseconds) of the
+# indexed file, the total size of the keys, and the size of the name of the
+# key function, which follows the header
+_mapped_index_magic = b"BioIdx\x00\x02"
+_mapped_index_header = struct.Struct("<8s24sQQqQQ")
+
+
+def _key_function_name(key_function):
+    """Return the name identifying a key function in an index file (PRIVATE)."""
+    if key_function is None:
+        return ""
+    qualname = getattr(key_function, "__qualname__", None)
+    if qualname is None:
+        # e.g. functools.partial objects
+        return repr(key_function)
+    module = getattr(key_function, "__module__", None)
+    if module is None:
+        return qualname
+    return f"{module}.{qualname}"
+
+
+class _MappedSeqFileDict(_IndexedSeqFileDict):
+    """Read only dictionary interface using a memory-mapped index file.
+
+    This code is used in Bio.SeqIO for indexing as SeqRecord objects.
+
+    Instead of keeping the keys and offsets in a Python dictionary, these
+    are stored in a compact binary index file, which is memory-mapped and
+    binary-searched. The index file is created the first time, and reused
+    afterwards, unless the indexed file has been modified since (based on
+    its size and modification time) in which case the index is rebuilt.
+
+    The index file contains the header, followed by four arrays of unsigned
+    64-bit integers, and finally the UTF-8 encoded keys in sorted order.
+    The arrays are the start of each key (plus the end of the last key),
+    the file offset and the length of each record in order of the keys,
+    and the position in the sorted keys of each record in file order.
+
+    The name of the key_function (if any) is stored in the index file as
+    well, and the index is rebuilt if it was created with a different key
+    function. Note that all lambda functions defined in the same scope have
+    the same name.
+
+    The keys must be strings. As the index file is memory-mapped read only,
+    it can be shared between processes, and pickling this object (e.g. to
+    send it to a worker process) only stores the file names, not the index.
+    """
+
+    def __init__(
+        self,
+        random_access_proxy,
+        key_function,
+        repr,
+        obj_repr,
+        index_filename,
+        filename,
+        fmt,
+    ):
+        """Initialize the class."""
+        # Use key_function=None for default value
+        self._proxy = random_access_proxy
+        self._key_function = key_function
+        self._repr = repr
+        self._obj_repr = obj_repr
+        self._cached_prev_record = (None, None)  # (key, record)
+        self._index_filename = index_filename
+        self._format = fmt
+        self._filename = filename
+        if not self._load_index():
+            self._build_index()
+            if not self._load_index():
+                raise RuntimeError(f"Failed to load the new index {index_filename!r}")
+
+    def _file_stat(self):
+        """Return the size and modification time of the indexed file (PRIVATE)."""
+        stat = os.stat(self._filename)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load_index(self):
+        """Memory-map the index file, return False if it is missing or outdated (PRIVATE)."""
+        try:
+            handle = open(self._index_filename, "rb")
+        except FileNotFoundError:
+            return False
+        with handle:
+            data = handle.read(_mapped_index_header.size)
+            if not data:
+                # e.g. an empty temporary file, treat it as missing
+                return False
+            magic = data[: len(_mapped_index_magic)]
+            if magic[:-1] != _mapped_index_magic[:-1]:
+                raise ValueError(f"Not a Biopython index file {self._index_filename!r}")
+            if magic != _mapped_index_magic:
+                # index file written by another version; rebuild it
+                return False
+            if len(data) != _mapped_index_header.size:
+                raise ValueError(f"Not a Biopython index file {self._index_filename!r}")
+            magic, fmt, count, size, mtime, keys_size, name_size = (
+                _mapped_index_header.unpack(data)
+            )
+            fmt = fmt.rstrip(b"\x00").decode()
+            if fmt != self._format or (size, mtime) != self._file_stat():
+                return False
+            name = handle.read(name_size).decode()
+            if name != _key_function_name(self._key_function):
+                return False
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._length = count
+        self._key_starts = _mapped_index_header.size + name_size
+        self._offsets = self._key_starts + 8 * (count + 1)
+        self._lengths = self._offsets + 8 * count
+        self._order = self._lengths + 8 * count
+        self._keys = self._order + 8 * count
+        return True
+
+    def _build_index(self):
+        """Scan the indexed file and write the index file (PRIVATE)."""
+        key_function = self._key_function
+        entries = []
+        for key, offset, length in self._proxy:
+            if key_function:
+                key = key_function(key)
+            if not isinstance(key, str):
+                raise TypeError(f"Keys must be strings to write an index, not {key!r}")
+            entries.append((key.encode(), offset, length))
+        # sort the records by key, and remember their position in the file
+        order = sorted(range(len(entries)), key=lambda i: entries[i][0])
+        positions = [0] * len(entries)
+        key_starts = [0]
+        for position, i in enumerate(order):
+            positions[i] = position
+            key_starts.append(key_starts[-1] + len(entries[i][0]))
+            if position and entries[i][0] == entries[order[position - 1]][0]:
+                self._proxy._handle.close()
+                raise ValueError(f"Duplicate key '{entries[i][0].decode()}'")
+        count = len(entries)
+        size, mtime = self._file_stat()
+        name = _key_function_name(key_function).encode()
+        header = _mapped_index_header.pack(
+            _mapped_index_magic,
+            self._format.encode(),
+            count,
+            size,
+            mtime,
+            key_starts[-1],
+            len(name),
+        )
+        # Write to a temporary file first, and then move it into place, so
+        # that other processes never see a partially written index file.
+        temp_filename = f"{self._index_filename}.{uuid.uuid4().hex}.tmp"
+        handle = open(temp_filename, "xb")
+        try:
+            with handle:
+                handle.write(header)
+                handle.write(name)
+                handle.write(struct.pack(f"<{count + 1}Q", *key_starts))
+                handle.write(struct.pack(f"<{count}Q", *(entries[i][1] for i in order)))
+                handle.write(struct.pack(f"<{count}Q", *(entries[i][2] for i in order)))
+                handle.write(struct.pack(f"<{count}Q", *positions))
+                handle.write(b"".join(entries[i][0] for i in order))
+            os.replace(temp_filename, self._index_filename)
+        except BaseException:
+            os.remove(temp_filename)
+            raise
+
+    def _key(self, position):
+        """Return the key at the given position in sorted order, as bytes (PRIVATE)."""
+        start, end = struct.unpack_from(
+            "<QQ", self._mmap, self._key_starts + 8 * position
+        )
+        return self._mmap[self._keys + start : self._keys + end]
+
+    def _find(self, key):
+        """Return the position of the key in sorted order, or raise KeyError (PRIVATE)."""
+        try:
+            target = key.encode()
+        except AttributeError:
+            raise KeyError(key) from None
+        low, high = 0, self._length
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self._length or self._key(low) != target:
+            raise KeyError(key)
+        return low
+
+    def __getstate__(self):
+        """Return the state for pickling, without the open files (PRIVATE)."""
+        state = self.__dict__.copy()
+        del state["_mmap"]
+        state["_proxy"] = type(self._proxy)
+        state["_cached_prev_record"] = (None, None)
+        return state
+
+    def __setstate__(self, state):
+        """Reopen the indexed file and the index file after unpickling (PRIVATE)."""
+        self.__dict__.update(state)
+        self._proxy = self._proxy(self._filename, self._format)
+        if not self._load_index():
+            raise ValueError(f"Index file {self._index_filename!r} is out of date")
+
+    def __len__(self):
+        """Return the number of records."""
+        return self._length
+
+    def __iter__(self):
+        """Iterate over the keys, in the order of the records in the file."""
+        order = self._order
+        for i in range(self._length):
+            (position,) = struct.unpack_from("<Q", self._mmap, order + 8 * i)
+            yield self._key(position).decode()
+
+    def __contains__(self, key):
+        """Return True if the key is in the index."""
+        try:
+            self._find(key)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, key):
+        """Return record for the specified key."""
+        if key == self._cached_prev_record[0]:
+            return self._cached_prev_record[1]
+        position = self._find(key)
+        (offset,) = struct.unpack_from("<Q", self._mmap, self._offsets + 8 * position)
+        record = self._proxy.get(offset)
+        if self._key_function:
+            key2 = self._key_function(record.id)
+        else:
+            key2 = record.id
+        if key != key2:
+            raise ValueError(f"Key did not match ({key} vs {key2})")
+        self._cached_prev_record = (key, record)
+        return record
+
+    def get_raw(self, key):
+        """Return the raw record from the file as a bytes string.
+
+        If the key is not found, a KeyError exception is raised.
+        """
+        position = self._find(key)
+        (offset,) = struct.unpack_from("<Q", self._mmap, self._offsets + 8 * position)
+        return self._proxy.get_raw(offset)
+
+    def close(self):
+        """Close the file handles and the memory map of the index."""
+        self._proxy._handle.close()
+        self._mmap.close()
+
+
 class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
     """Read only dictionary interface to many sequential record files.
 
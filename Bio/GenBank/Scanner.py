@@ -143,7 +143,7 @@ class InsdcScanner:
         self.line = line
         return header_lines
 
-    def parse_features(self, skip=False):
+    def parse_features(self, skip=False, feature_types=None, lazy=False):
         """Return list of tuples for the features (if present).
 
         Each feature is returned as a tuple (key, location, qualifiers)
@@ -151,6 +151,11 @@ class InsdcScanner:
         "complement(join(490883..490885,1..879))") while qualifiers
         is a list of two string tuples (feature qualifier keys and values).
 
+        If feature_types is given, only features with a key in feature_types
+        are returned; the lines of any other features are skipped without
+        parsing them. If lazy is True, each feature is returned as a tuple
+        (key, lines) instead, which can be passed to parse_feature later.
+
         Assumes you have already read to the start of the features table.
         """
         if self.line.rstrip() not in self.FEATURE_START_MARKERS:
@@ -217,6 +222,15 @@ class InsdcScanner:
                     feature_key = line[2 : self.FEATURE_QUALIFIER_INDENT].strip()
                     feature_lines = [line[self.FEATURE_QUALIFIER_INDENT :]]
                 line = self.handle.readline()
+                if feature_types is not None and feature_key not in feature_types:
+                    # Skip the remaining lines of this feature
+                    while line[
+                        : self.FEATURE_QUALIFIER_INDENT
+                    ] == self.FEATURE_QUALIFIER_SPACER or (
+                        line != "" and line.rstrip() == ""
+                    ):
+                        line = self.handle.readline()
+                    continue
                 while line[
                     : self.FEATURE_QUALIFIER_INDENT
                 ] == self.FEATURE_QUALIFIER_SPACER or (
@@ -226,7 +240,10 @@ class InsdcScanner:
                     # white space (e.g. out of spec files with too much indentation)
                     feature_lines.append(line[self.FEATURE_QUALIFIER_INDENT :].strip())
                     line = self.handle.readline()
-                features.append(self.parse_feature(feature_key, feature_lines))
+                if lazy:
+                    features.append((feature_key, feature_lines))
+                else:
+                    features.append(self.parse_feature(feature_key, feature_lines))
         self.line = line
         return features
 
@@ -429,7 +446,7 @@ class InsdcScanner:
         Used by the parse_records() and parse() methods.
         """
 
-    def feed(self, handle, consumer, do_features=True):
+    def feed(self, handle, consumer, do_features=True, feature_types=None, lazy=False):
         """Feed a set of data into the consumer.
 
         This method is intended for use with the "old" code in Bio.GenBank
@@ -439,6 +456,11 @@ class InsdcScanner:
          - consumer - The consumer that should be informed of events.
          - do_features - Boolean, should the features be parsed?
            Skipping the features can be much faster.
+         - feature_types - Optional collection of feature keys (e.g. "CDS");
+           if given, features of any other type are skipped.
+         - lazy - Boolean, should the features be parsed only when they
+           are first accessed? This requires a consumer with a
+           lazy_feature_table method, such as Bio.GenBank._FeatureConsumer.
 
         Return values:
          - true  - Passed a record
@@ -462,10 +484,17 @@ class InsdcScanner:
         self._feed_header_lines(consumer, self.parse_header())
 
         # Features (common to both EMBL and GenBank):
-        if do_features:
-            self._feed_feature_table(consumer, self.parse_features(skip=False))
-        else:
+        if not do_features:
             self.parse_features(skip=True)  # ignore the data
+        elif lazy:
+            features = self.parse_features(feature_types=feature_types, lazy=True)
+            # A new scanner without a handle parses the features later
+            consumer.lazy_feature_table(features, self.__class__(debug=self.debug))
+        elif feature_types is not None:
+            features = self.parse_features(feature_types=feature_types)
+            self._feed_feature_table(consumer, features)
+        else:
+            self._feed_feature_table(consumer, self.parse_features(skip=False))
 
         # Footer and sequence
         misc_lines, sequence_string = self.parse_footer()
@@ -480,9 +509,12 @@ class InsdcScanner:
         # And we are done
         return True
 
-    def parse(self, handle, do_features=True):
+    def parse(self, handle, do_features=True, feature_types=None, lazy=False):
         """Return a SeqRecord (with SeqFeatures if do_features=True).
 
+        The optional arguments feature_types and lazy are as for the feed
+        method; with lazy=True, the features are parsed when first accessed.
+
         See also the method parse_records() for use on multi-record files.
         """
         from Bio.GenBank import _FeatureConsumer
@@ -492,24 +524,26 @@ class InsdcScanner:
             use_fuzziness=1, feature_cleaner=FeatureValueCleaner()
         )
 
-        if self.feed(handle, consumer, do_features):
+        if self.feed(handle, consumer, do_features, feature_types, lazy):
             return consumer.data
         else:
             return None
 
-    def parse_records(self, handle, do_features=True):
+    def parse_records(self, handle, do_features=True, feature_types=None, lazy=False):
         """Parse records, return a SeqRecord object iterator.
 
         Each record (from the ID/LOCUS line to the // line) becomes a SeqRecord
 
-        The SeqRecord objects include SeqFeatures if do_features=True
+        The SeqRecord objects include SeqFeatures if do_features=True,
+        restricted to the feature keys in feature_types if given. With
+        lazy=True, the features are parsed when first accessed.
 
         This method is intended for use in Bio.SeqIO
         """
         # This is a generator function
         with as_handle(handle) as handle:
             while True:
-                record = self.parse(handle, do_features)
+                record = self.parse(handle, do_features, feature_types, lazy)
                 if record is None:
                     break
                 if record.id is None:
@@ -39,6 +39,7 @@ Exceptions:
 
 import re
 import warnings
+from collections.abc import MutableSequence
 
 from Bio import BiopythonParserWarning
 from Bio.Seq import Seq
@@ -293,6 +294,91 @@ class _BaseGenBankConsumer:
         return new_start, new_end
 
 
+class _LazyFeatureList(MutableSequence):
+    """List of SeqFeature objects which are parsed when first accessed (PRIVATE).
+
+    This is used as the features attribute of the SeqRecord objects returned
+    by the GenBank and EMBL parsers with lazy feature parsing. The features
+    are stored as (key, lines) tuples from the scanner, and each one is
+    converted into a SeqFeature object when it is first accessed. Slicing
+    or adding returns an ordinary list.
+    """
+
+    def __init__(self, features, scanner, consumer):
+        """Initialize with a list of (key, lines) tuples, a scanner and a consumer."""
+        self._items = features
+        self._scanner = scanner
+        self._consumer = consumer
+
+    def _parse(self, index):
+        """Return the feature at index, parsing it if needed (PRIVATE)."""
+        item = self._items[index]
+        if type(item) is tuple:
+            key, lines = item
+            feature_tuple = self._scanner.parse_feature(key, lines)
+            self._scanner._feed_feature_table(self._consumer, [feature_tuple])
+            item = self._consumer.data.features.pop()
+            self._items[index] = item
+        return item
+
+    def __len__(self):
+        """Return the number of features."""
+        return len(self._items)
+
+    def __getitem__(self, index):
+        """Return a feature, or a list of features for a slice."""
+        if isinstance(index, slice):
+            return [self._parse(i) for i in range(*index.indices(len(self._items)))]
+        return self._parse(index)
+
+    def __setitem__(self, index, value):
+        """Replace a feature, or the features in a slice."""
+        self._items[index] = value
+
+    def __delitem__(self, index):
+        """Remove a feature, or the features in a slice."""
+        del self._items[index]
+
+    def insert(self, index, value):
+        """Insert a feature before index."""
+        self._items.insert(index, value)
+
+    def __iter__(self):
+        """Iterate over the features, parsing them as needed."""
+        for i in range(len(self._items)):
+            yield self._parse(i)
+
+    def __eq__(self, other):
+        """Compare the features to those in another list."""
+        if isinstance(other, (list, _LazyFeatureList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        """Return a list of these features followed by those in other."""
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        """Return a list of the features in other followed by these features."""
+        return list(other) + list(self)
+
+    def __repr__(self):
+        """Return the list of features as a string."""
+        return repr(list(self))
+
+    def __reduce__(self):
+        """Pickle and copy the features as an ordinary list."""
+        return list, (list(self),)
+
+    def copy(self):
+        """Return a shallow copy of the features as a list."""
+        return list(self)
+
+    def sort(self, *, key=None, reverse=False):
+        """Sort the features in place, as for list.sort."""
+        self._items[:] = sorted(self, key=key, reverse=reverse)
+
+
 class _FeatureConsumer(_BaseGenBankConsumer):
     """Create a SeqRecord object with Features to return (PRIVATE).
 
@@ -688,6 +774,22 @@ class _FeatureConsumer(_BaseGenBankConsumer):
             self.data.annotations["references"].append(self._cur_reference)
             self._cur_reference = None
 
+    def lazy_feature_table(self, features, scanner):
+        """Store the features, to be parsed by the scanner when first accessed.
+
+        Argument features is a list of (key, lines) tuples, as returned by the
+        parse_features method of the scanner with lazy=True.
+        """
+        self.start_feature_table()
+        # Parse the features using a separate consumer, so that they don't
+        # keep a reference to this record
+        consumer = _FeatureConsumer(self._use_fuzziness, self._feature_cleaner)
+        consumer._expected_size = self._expected_size
+        consumer._seq_type = self._seq_type
+        if "topology" in self.data.annotations:
+            consumer.data.annotations["topology"] = self.data.annotations["topology"]
+        self.data.features = _LazyFeatureList(features, scanner, consumer)
+
     def feature_key(self, content):
         # start a new feature
         self._cur_feature = SeqFeature()
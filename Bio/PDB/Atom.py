@@ -36,6 +36,9 @@ class Atom:
     atomic charge and radius.
     """
 
+    # Set by Entity.make_columnar, the coord attribute is then a view
+    _columns = None
+
     def __init__(
         self,
         name: str,
@@ -312,6 +315,46 @@ class Atom:
         """Set coordinates."""
         self.coord = coord
 
+    @property
+    def coord(self) -> np.ndarray:
+        """Atomic coordinates (x, y, z) as a NumPy array.
+
+        If the structure is in columnar mode (see Entity.make_columnar), the
+        array is a view on the columns, and assigning new coordinates copies
+        them into the columns.
+        """
+        return self._coord
+
+    @coord.setter
+    def coord(self, coord: np.ndarray):
+        if self._columns is not None:
+            self._coord[:] = coord
+        else:
+            self._coord = coord
+
+    def _detach_columns(self):
+        """Stop using the columns for this atom and its parents (PRIVATE).
+
+        Called before the coord attribute is replaced by a view on another
+        array, such as the atomArray of internal_coords.
+        """
+        if self._columns is not None:
+            if self.parent is not None:
+                self.parent._invalidate_columns()
+            self._columns = None
+
+    def __getstate__(self):
+        """Return the state for copying and pickling, without the columns."""
+        state = self.__dict__.copy()
+        state.pop("_columns", None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state, also from pickles storing coord directly."""
+        if "coord" in state:
+            state["_coord"] = state.pop("coord")
+        self.__dict__.update(state)
+
     def set_altloc(self, altloc: str):
         """Set alternative location specifier."""
         self.altloc = altloc
@@ -475,7 +518,7 @@ class Atom:
             atom.transform(rotation, translation)
 
         """
-        self.coord = np.dot(self.coord, rot) + tran
+        self.set_coord(np.dot(self.coord, rot) + tran)
 
     def get_vector(self) -> Vector:
         """Return coordinates as Vector.
@@ -564,6 +607,8 @@ class DisorderedAtom(DisorderedEntityWrapper):
         # set the residue parent of the added atom
         residue = self.get_parent()
         atom.set_parent(residue)
+        if residue is not None:
+            residue._invalidate_columns()
         altloc = atom.get_altloc()
         occupancy = atom.get_occupancy()
         self[altloc] = atom
@@ -583,6 +628,8 @@ class DisorderedAtom(DisorderedEntityWrapper):
         is_selected = self.selected_child is atom
 
         # Detach
+        if self.parent is not None:
+            self.parent._invalidate_columns()
         del self.child_dict[altloc]
         atom.detach_parent()
 
@@ -599,4 +646,4 @@ class DisorderedAtom(DisorderedEntityWrapper):
         See the documentation of Atom.transform for details.
         """
         for child in self:
-            child.coord = np.dot(child.coord, rot) + tran
+            child.transform(rot, tran)
@@ -0,0 +1,224 @@
+# Copyright 2026 by the Biopython contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+
+"""Column-wise (NumPy array) storage of the atoms of a structure.
+
+An :class:`AtomColumns` object is created by calling the ``make_columnar``
+method of a Structure, Model, Chain or Residue. It keeps the coordinates
+of all atoms below that entity in a single contiguous array, and the
+``coord`` attribute of each Atom becomes a view on its row of that array.
+Transformations, selections and distance queries on the whole entity then
+run as single NumPy operations instead of one Python call per atom.
+
+>>> from Bio.PDB.PDBParser import PDBParser
+>>> parser = PDBParser()
+>>> structure = parser.get_structure("1A8O", "PDB/1A8O.pdb")
+>>> columns = structure.make_columnar()
+>>> len(columns)
+644
+>>> atom = structure[0]["A"][("H_MSE", 151, " ")]["CA"]
+>>> print("%.3f %.3f %.3f" % tuple(atom.coord))
+20.255 33.101 26.891
+>>> i = columns.atoms.index(atom)
+>>> print("%.3f %.3f %.3f" % tuple(columns.coord[i]))
+20.255 33.101 26.891
+
+Moving the structure moves all atoms with a single NumPy operation:
+
+>>> import numpy as np
+>>> structure.transform(np.identity(3), np.array((1.0, 0.0, 0.0)))
+>>> print("%.3f %.3f %.3f" % tuple(atom.coord))
+21.255 33.101 26.891
+
+Selections are boolean masks or index arrays on the columns:
+
+>>> selenium = columns.select(columns.element == "SE")
+>>> sorted({atom.get_parent().get_resname() for atom in selenium})
+['MSE']
+>>> len(columns.within(atom.coord, 4.0))
+11
+
+"""
+
+import numpy as np
+
+
+class AtomColumns:
+    """Per-atom data of a Structure, Model, Chain or Residue in NumPy arrays.
+
+    The atoms are stored in the order of the hierarchy, with all alternative
+    locations of disordered atoms and all residues of point mutations, so that
+    the atoms of each Residue, Chain and Model are a contiguous block. The
+    following attributes are arrays with one entry (or row) per atom:
+
+     - coord - N x 3 array of coordinates. The ``coord`` attribute of each
+       Atom is a view on its row of this array, so both stay in sync.
+     - element - element symbols (empty string if unknown).
+     - bfactor, occupancy, mass - float arrays; NaN for missing values.
+     - residue_index, chain_index, model_index - index of the parent Residue,
+       Chain and Model in the residues, chains and models lists (-1 if the
+       columns were created below that level).
+
+    Except for the coordinates, these are taken from the atoms when the
+    columns are created. The residues, chains and models lists, and the atoms
+    list, hold the corresponding Bio.PDB objects.
+
+    Adding or removing atoms or residues switches the entities involved back
+    to working atom by atom; call ``make_columnar`` again to rebuild the
+    columns. The same happens to the parents of an entity if
+    ``make_columnar`` is called on the entity itself. Copying or pickling a
+    structure does not copy the columns.
+
+    The coordinates are stored as float32, like the coordinates created by
+    the parsers, and keep this type when the atoms are transformed. Without
+    columns, Atom.transform replaces the coordinates of each atom by a new
+    array, which is float64 if the rotation matrix or translation is.
+    """
+
+    def __init__(self, entity):
+        """Create the columns for the atoms of the given entity.
+
+        Arguments:
+         - entity - Structure, Model, Chain or Residue object.
+
+        """
+        self.atoms = []
+        self.residues = []
+        self.chains = []
+        self.models = []
+        residue_index = []
+        chain_index = []
+        model_index = []
+        # Index of the current model, chain and residue during the traversal
+        indices = {"M": -1, "C": -1, "R": -1}
+        levels = {"M": self.models, "C": self.chains, "R": self.residues}
+        entities = []
+
+        def visit(entity):
+            level = entity.level
+            indices[level] = len(levels[level])
+            levels[level].append(entity)
+            start = len(self.atoms)
+            if level == "R":
+                atoms = entity.get_unpacked_list()
+                self.atoms.extend(atoms)
+                residue_index.extend([indices["R"]] * len(atoms))
+                chain_index.extend([indices["C"]] * len(atoms))
+                model_index.extend([indices["M"]] * len(atoms))
+            elif level == "C":
+                for residue in entity.get_unpacked_list():
+                    visit(residue)
+            else:
+                for child in entity:
+                    visit(child)
+            entities.append((entity, slice(start, len(self.atoms))))
+
+        if entity.level == "S":
+            for model in entity:
+                visit(model)
+            entities.append((entity, slice(0, len(self.atoms))))
+        else:
+            visit(entity)
+
+        atoms = self.atoms
+        self.coord = np.array([atom.coord for atom in atoms], dtype=np.float32).reshape(
+            -1, 3
+        )
+        self.element = np.array([atom.element or "" for atom in atoms], dtype=str)
+        self.bfactor = np.array([atom.bfactor for atom in atoms], dtype=float)
+        self.occupancy = np.array([atom.occupancy for atom in atoms], dtype=float)
+        self.mass = np.array([atom.mass for atom in atoms], dtype=float)
+        self.residue_index = np.array(residue_index, dtype=np.intp)
+        self.chain_index = np.array(chain_index, dtype=np.intp)
+        self.model_index = np.array(model_index, dtype=np.intp)
+        if entity.parent is not None:
+            # The atoms no longer use the columns of the parents, if any
+            entity.parent._invalidate_columns()
+        for atom, coord in zip(atoms, self.coord):
+            # bind the view directly, as the atom may still use other columns
+            atom._coord = coord
+            atom._columns = self
+        for child, atom_slice in entities:
+            child._columns = self
+            child._atom_slice = atom_slice
+
+    def __len__(self):
+        """Return the number of atoms."""
+        return len(self.atoms)
+
+    def __repr__(self):
+        """Return a string representation of the columns."""
+        return f"<AtomColumns atoms={len(self.atoms)}>"
+
+    def index(self, entity):
+        """Return the slice of the columns holding the atoms of an entity.
+
+        Raise a ValueError if the entity is not (or no longer) part of these
+        columns, for example because atoms were added to it.
+        """
+        if entity.level == "A":
+            if entity._columns is self:
+                return self.atoms.index(entity)
+        elif entity._columns is self:
+            return entity._atom_slice
+        raise ValueError(f"{entity!r} is not part of these columns")
+
+    def select(self, index):
+        """Return the list of atoms selected by a boolean mask or index array."""
+        atoms = self.atoms
+        index = np.arange(len(atoms))[index]
+        return [atoms[i] for i in index]
+
+    def within(self, center, radius, index=None):
+        """Return the indices of the atoms within radius of center.
+
+        Arguments:
+         - center - NumPy array of the (x, y, z) coordinates of the center.
+         - radius - float
+         - index - optional slice, boolean mask or index array restricting
+           the search to some atoms.
+
+        The indices are positions in these columns; pass them to the select
+        method to get the corresponding atoms.
+        """
+        positions = np.arange(len(self.atoms))
+        coord = self.coord
+        if index is not None:
+            positions = positions[index]
+            coord = coord[index]
+        center = np.asarray(center, dtype=float)
+        distances = np.sum((coord - center) ** 2, axis=1)
+        return positions[distances <= radius * radius]
+
+    def transform(self, rot, tran, index=None):
+        """Apply rotation and translation to the coordinates of the atoms.
+
+        See the documentation of Atom.transform for details. If index is
+        given (a slice, boolean mask or index array), only those atoms are
+        transformed. The coordinates are updated in place, and therefore
+        remain float32.
+        """
+        if index is None:
+            index = slice(None)
+        coord = self.coord
+        coord[index] = np.dot(coord[index], rot) + tran
+
+    def center_of_mass(self, index=None, geometric=False):
+        """Return the center of mass of the atoms as a numpy array.
+
+        If geometric is True, returns the center of geometry instead.
+        """
+        if index is None:
+            index = slice(None)
+        coords = self.coord[index]
+        if not len(coords):
+            raise ValueError(f"{self} does not have atoms")
+        if geometric:
+            masses = None
+        else:
+            masses = self.mass[index].astype(np.float32)
+        return np.average(coords, axis=0, weights=masses)
@@ -22,6 +22,7 @@ from typing import Union
 import numpy as np
 
 from Bio import BiopythonWarning
+from Bio.PDB.AtomColumns import AtomColumns
 from Bio.PDB.PDBExceptions import PDBConstructionException
 
 if TYPE_CHECKING:
@@ -43,6 +44,9 @@ class Entity(Generic[_Parent, _Child]):
     child_list: list[_Child]
     child_dict: dict[Any, _Child]
     level: str
+    # Set by make_columnar
+    _columns: AtomColumns | None = None
+    _atom_slice: slice | None = None
 
     def __init__(self, id):
         """Initialize the class."""
@@ -142,6 +146,13 @@ class Entity(Generic[_Parent, _Child]):
         """Hash method to allow uniqueness (set)."""
         return hash(self.full_id)
 
+    def __getstate__(self):
+        """Return the state for copying and pickling, without the columns."""
+        state = self.__dict__.copy()
+        state.pop("_columns", None)
+        state.pop("_atom_slice", None)
+        return state
+
     # Private methods
 
     def _reset_full_id(self):
@@ -157,6 +168,17 @@ class Entity(Generic[_Parent, _Child]):
                 pass  # Atoms do not cache their full ids.
         self.full_id = self._generate_full_id()
 
+    def _invalidate_columns(self):
+        """Stop using the columns for this entity and its parents (PRIVATE).
+
+        Called when children are added or removed, as the atoms of the entity
+        then no longer match its block in the columns.
+        """
+        entity = self
+        while entity is not None and entity._columns is not None:
+            entity._columns = None
+            entity = entity.parent
+
     def _generate_full_id(self):
         """Generate full_id (PRIVATE).
 
@@ -260,6 +282,7 @@ class Entity(Generic[_Parent, _Child]):
     def detach_child(self, id):
         """Remove a child."""
         child = self.child_dict[id]
+        self._invalidate_columns()
         child.detach_parent()
         del self.child_dict[id]
         self.child_list.remove(child)
@@ -269,6 +292,7 @@ class Entity(Generic[_Parent, _Child]):
         entity_id = entity.get_id()
         if self.has_id(entity_id):
             raise PDBConstructionException(f"{entity_id} defined twice")
+        self._invalidate_columns()
         entity.set_parent(self)
         self.child_list.append(entity)
         self.child_dict[entity_id] = entity
@@ -278,6 +302,7 @@ class Entity(Generic[_Parent, _Child]):
         entity_id = entity.get_id()
         if self.has_id(entity_id):
             raise PDBConstructionException(f"{entity_id} defined twice")
+        self._invalidate_columns()
         entity.set_parent(self)
         self.child_list[pos:pos] = [entity]
         self.child_dict[entity_id] = entity
@@ -346,6 +371,9 @@ class Entity(Generic[_Parent, _Child]):
             entity.transform(rotation, translation)
 
         """
+        if self._columns is not None:
+            self._columns.transform(rot, tran, self._atom_slice)
+            return
         for o in self.get_list():
             o.transform(rot, tran)
 
@@ -359,6 +387,9 @@ class Entity(Generic[_Parent, _Child]):
         if not len(self):
             raise ValueError(f"{self} does not have children")
 
+        if self._columns is not None:
+            return self._columns.center_of_mass(self._atom_slice, geometric)
+
         maybe_disordered = {"R", "C"}  # to know when to use get_unpacked_list
         only_atom_level = {"A"}
 
@@ -382,6 +413,16 @@ class Entity(Generic[_Parent, _Child]):
 
         return np.average(coords, axis=0, weights=masses)
 
+    def make_columnar(self):
+        """Store the atoms of the entity in NumPy arrays, and return them.
+
+        After this, the coord attribute of each atom is a view on a row of
+        a single coordinate array, and methods such as transform and
+        center_of_mass work on the whole array at once. See the
+        :class:`~Bio.PDB.AtomColumns.AtomColumns` class for details.
+        """
+        return AtomColumns(self)
+
     def copy(self):
         """Copy entity recursively."""
         shallow = copy(self)
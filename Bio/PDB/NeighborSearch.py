@@ -129,3 +129,59 @@ class NeighborSearch:
             next_level_pair_list = self._get_unique_parent_pairs(next_level_pair_list)
             if level == next_level:
                 return next_level_pair_list
+
+    def update(self, coords=None):
+        """Update the coordinates of the atoms, and rebuild the KD tree.
+
+        Arguments:
+         - coords - Nx3 NumPy array with the new coordinates of the atoms,
+           in the order of the atom list. If None (default), the coordinates
+           are taken from the atoms.
+
+        The memory of the KD tree is reused, so this is faster than creating
+        a new NeighborSearch object, for example for each model of an NMR
+        structure or each frame of a trajectory.
+        """
+        if coords is None:
+            coords = [a.get_coord() for a in self.atom_list]
+        coords = np.array(coords, dtype="d")
+        self.kdt.update(coords)
+        self.coords = coords
+
+    def contacts(self, radius, other=None):
+        """Return the indices of all atom pairs within radius as a NumPy array.
+
+        Arguments:
+         - radius - float
+         - other - list of atoms, or Mx3 NumPy array of coordinates (optional)
+
+        If other is None, all pairs of atoms in the atom list within radius
+        of each other are found, as for search_all. The pairs are returned as
+        a Kx2 array of indices in the atom list, with the smaller index first.
+
+        Otherwise, all pairs of an atom in other and an atom in the atom list
+        within radius of each other are found. Column 0 of the returned Kx2
+        array holds the indices in other, and column 1 the indices in the
+        atom list.
+
+        No Python objects are created for the pairs, so this is much faster
+        than search_all for large structures. A sparse contact matrix can be
+        created from the result, for example with SciPy::
+
+            from scipy.sparse import coo_array
+            pairs = ns.contacts(5.0, atoms)
+            values = np.ones(len(pairs), bool)
+            shape = (len(atoms), len(ns.atom_list))
+            matrix = coo_array((values, (pairs[:, 0], pairs[:, 1])), shape)
+
+        """
+        if other is None:
+            pairs = self.kdt.neighbor_search_indices(radius)
+        else:
+            if not isinstance(other, np.ndarray):
+                other = [a.get_coord() for a in other]
+            coords = np.require(other, dtype="d", requirements="C")
+            if coords.ndim != 2 or coords.shape[1] != 3:
+                raise ValueError("Expected a Mx3 NumPy array")
+            pairs = self.kdt.search_indices(coords, radius)
+        return np.frombuffer(pairs, dtype=np.intp).reshape(-1, 2)
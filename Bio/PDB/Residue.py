@@ -158,6 +158,14 @@ class DisorderedResidue(DisorderedEntityWrapper):
         for residue in self.disordered_get_list():
             residue.sort()
 
+    def transform(self, rot, tran):
+        """Apply rotation and translation to all child residues.
+
+        See the documentation of Entity.transform for details.
+        """
+        for residue in self.disordered_get_list():
+            residue.transform(rot, tran)
+
     def disordered_add(self, residue):
         """Add a residue object and use its resname as key.
 
@@ -168,6 +176,8 @@ class DisorderedResidue(DisorderedEntityWrapper):
         resname = residue.get_resname()
         # add chain parent to residue
         chain = self.get_parent()
+        if chain is not None:
+            chain._invalidate_columns()
         residue.set_parent(chain)
         assert not self.disordered_has_id(resname)
         self[resname] = residue
@@ -185,6 +195,8 @@ class DisorderedResidue(DisorderedEntityWrapper):
         is_selected = self.selected_child is residue
 
         # Detach
+        if self.parent is not None:
+            self.parent._invalidate_columns()
         del self.child_dict[resname]
         residue.detach_parent()
 
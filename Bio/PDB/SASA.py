@@ -19,6 +19,7 @@ Reference:
 import collections
 import math
 from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 
@@ -69,6 +70,67 @@ ATOMIC_RADII.update(
     }
 )
 
+# Maximum number of (neighbor pair, sphere point) tests held in memory at
+# once while testing the sphere points of a block of atoms.
+_BLOCK_SIZE = 2**22
+
+
+def _atom_blocks(pairs, n_atoms, n_points, workers):
+    """Split the atoms into blocks of consecutive atoms (PRIVATE).
+
+    The atoms are split such that the number of sphere point tests in each
+    block stays below _BLOCK_SIZE, and that there are at least as many
+    blocks as workers.
+    """
+    # pairs are sorted by the first atom; offsets[i] is the first pair of atom i
+    offsets = np.searchsorted(pairs[:, 0], np.arange(n_atoms + 1))
+    size = min(_BLOCK_SIZE, max(1, len(pairs) * n_points // max(1, workers)))
+    blocks = []
+    start = 0
+    while start < n_atoms:
+        # include at least one atom, and then as many as fit in the block
+        limit = offsets[start] + size // n_points
+        stop = max(start + 1, np.searchsorted(offsets, limit, "right") - 1)
+        stop = min(stop, n_atoms)
+        blocks.append((start, stop, offsets[start], offsets[stop]))
+        start = stop
+    return blocks
+
+
+def _count_accessible(sphere, coords, radii, pairs, start, stop):
+    """Count the accessible sphere points of atoms start to stop (PRIVATE).
+
+    Arguments:
+     - sphere - n_points x 3 array of points on the unit sphere.
+     - coords, radii - coordinates and radii (including the probe) of all atoms.
+     - pairs - K x 2 array of the overlapping atom pairs of which the first
+       atom is one of atoms start to stop, sorted by the first atom.
+
+    Returns an array with the number of sphere points of each atom that is
+    not inside any overlapping atom.
+    """
+    n_points = len(sphere)
+    counts = np.full(stop - start, n_points, dtype=np.int64)
+    if not len(pairs):
+        return counts
+    i = pairs[:, 0]
+    j = pairs[:, 1]
+    # A point c_i + r_i * u on the sphere of atom i lies within atom j if
+    # |c_i + r_i * u - c_j|**2 <= r_j**2, or equivalently if the projection
+    # of u on c_j - c_i is at least (r_i**2 + d**2 - r_j**2) / (2 * r_i),
+    # where d is the distance between c_i and c_j.
+    delta = coords[j] - coords[i]
+    r_i = radii[i]
+    r_j = radii[j]
+    squared = np.einsum("ij,ij->i", delta, delta)
+    threshold = (r_i * r_i + squared - r_j * r_j) / (2 * r_i)
+    buried = np.dot(delta, sphere.T) >= threshold[:, np.newaxis]
+    # Combine the buried points over all neighbors of each atom
+    atoms, index = np.unique(i, return_index=True)
+    buried = np.logical_or.reduceat(buried, index, axis=0)
+    counts[atoms - start] -= np.count_nonzero(buried, axis=1)
+    return counts
+
 
 class ShrakeRupley:
     """Calculates SASAs using the Shrake-Rupley algorithm."""
@@ -141,7 +203,7 @@ class ShrakeRupley:
 
         return coords
 
-    def compute(self, entity, level="A"):
+    def compute(self, entity, level="A", workers=None):
         """Calculate surface accessibility surface area for an entity.
 
         The resulting atomic surface accessibility values are attached to the
@@ -158,6 +220,11 @@ class ShrakeRupley:
             values of its children. Defaults to "A".
         :type entity: Bio.PDB.Entity
 
+        :param workers: if given, the atoms are split into blocks that are
+            calculated in a pool of this many processes. By default, all
+            atoms are calculated in the current process.
+        :type workers: int
+
         >>> from Bio.PDB import PDBParser
         >>> from Bio.PDB.SASA import ShrakeRupley
         >>> p = PDBParser(QUIET=1)
@@ -194,41 +261,49 @@ class ShrakeRupley:
         # We trust DisorderedAtom and friends to pick representatives.
         coords = np.array([a.coord for a in atoms], dtype=np.float64)
 
-        # Pre-compute atom neighbors using KDTree
-        kdt = KDTree(coords, 10)
-
         # Pre-compute radius * probe table
         radii_dict = self.radii_dict
         radii = np.array([radii_dict[a.element] for a in atoms], dtype=np.float64)
         radii += self.probe_radius
         twice_maxradii = np.max(radii) * 2
 
-        # Calculate ASAs
-        asa_array = np.zeros((n_atoms, 1), dtype=np.int64)
-        ptset = set(range(self.n_points))
-        for i in range(n_atoms):
-            r_i = radii[i]
-
-            # Move sphere to atom
-            s_on_i = (np.array(self._sphere, copy=True) * r_i) + coords[i]
-            available_set = ptset.copy()
-
-            # KDtree for sphere points
-            kdt_sphere = KDTree(s_on_i, 10)
-
-            # Iterate over neighbors of atom i
-            for jj in kdt.search(coords[i], twice_maxradii):
-                j = jj.index
-                if i == j:
-                    continue
-
-                if jj.radius < (r_i + radii[j]):
-                    # Remove overlapping points on sphere from available set
-                    available_set -= {
-                        pt.index for pt in kdt_sphere.search(coords[j], radii[j])
-                    }
-
-            asa_array[i] = len(available_set)  # update counts
+        # Pre-compute the pairs of overlapping atoms using KDTree
+        kdt = KDTree(coords, 10)
+        pairs = kdt.neighbor_search_indices(twice_maxradii)
+        pairs = np.frombuffer(pairs, dtype=np.intp).reshape(-1, 2)
+        delta = coords[pairs[:, 0]] - coords[pairs[:, 1]]
+        distances = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        pairs = pairs[distances < radii[pairs[:, 0]] + radii[pairs[:, 1]]]
+        # Each atom of a pair can hide sphere points of the other
+        pairs = np.concatenate([pairs, pairs[:, ::-1]])
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+        # Count the accessible sphere points of each atom, one block of atoms
+        # at a time to limit the memory used
+        sphere = self._sphere.astype(np.float64)
+        if workers is None or workers <= 1:
+            blocks = _atom_blocks(pairs, n_atoms, self.n_points, 1)
+            counts = [
+                _count_accessible(sphere, coords, radii, pairs[first:last], start, stop)
+                for start, stop, first, last in blocks
+            ]
+        else:
+            blocks = _atom_blocks(pairs, n_atoms, self.n_points, workers)
+            with ProcessPoolExecutor(workers) as executor:
+                futures = [
+                    executor.submit(
+                        _count_accessible,
+                        sphere,
+                        coords,
+                        radii,
+                        pairs[first:last],
+                        start,
+                        stop,
+                    )
+                    for start, stop, first, last in blocks
+                ]
+                counts = [future.result() for future in futures]
+        asa_array = np.concatenate(counts)[:, np.newaxis]
 
         # Convert accessible point count to surface area in A**2
         f = radii * radii * (4 * np.pi / self.n_points)
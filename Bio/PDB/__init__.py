@@ -36,6 +36,9 @@ except ImportError:
 # from a list of Atoms.
 from . import Selection
 
+# Column-wise NumPy storage of the atoms of a structure
+from .AtomColumns import AtomColumns
+
 # CEAlign structural alignment
 from .cealign import CEAligner
 
@@ -541,6 +541,7 @@ class IC_Chain:
         def setAtomVw(res, atm):
             ak = AtomKey(res.internal_coord, atm)
             ndx = dup.atomArrayIndex[ak]
+            atm._detach_columns()
             atm.coord = dup.atomArray[ndx, 0:3]  # make view on atomArray
 
             dup.bpAtomArray[ndx] = atm  # rtm
@@ -801,6 +802,7 @@ class IC_Chain:
             except KeyError:
                 return
             self.atomArray[ndx, 0:3] = atm.coord
+            atm._detach_columns()
             atm.coord = self.atomArray[ndx, 0:3]  # make view on atomArray
             self.atomArrayValid[ndx] = True
             self.bpAtomArray[ndx] = atm  # rtm
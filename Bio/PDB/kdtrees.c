@@ -383,6 +383,12 @@ typedef struct {
     double _neighbor_radius;
     double _neighbor_radius_sq;
     double _center_coord[DIM];
+    /* Index pairs found during a search, if they are not stored as Python
+     * objects in a list. */
+    Py_ssize_t* _pairs;
+    Py_ssize_t _pairs_size;
+    Py_ssize_t _pairs_allocated;
+    Py_ssize_t _query_index;
 } KDTree;
 
 static double KDTree_dist(double *coord1, double *coord2)
@@ -398,6 +404,39 @@ static double KDTree_dist(double *coord1, double *coord2)
     return sum;
 }
 
+static int
+KDTree_add_pair(KDTree* self, Py_ssize_t index1, Py_ssize_t index2)
+{
+    Py_ssize_t n = self->_pairs_size;
+    if (n == self->_pairs_allocated) {
+        Py_ssize_t* pairs;
+        const Py_ssize_t allocated = 2 * n + 1024;
+        if (allocated > PY_SSIZE_T_MAX / (Py_ssize_t)(2 * sizeof(Py_ssize_t)))
+            return 0;
+        pairs = PyMem_Realloc(self->_pairs, 2 * allocated * sizeof(Py_ssize_t));
+        if (!pairs) return 0;
+        self->_pairs = pairs;
+        self->_pairs_allocated = allocated;
+    }
+    self->_pairs[2*n] = index1;
+    self->_pairs[2*n+1] = index2;
+    self->_pairs_size = n + 1;
+    return 1;
+}
+
+static PyObject*
+KDTree_get_pairs(KDTree* self)
+{
+    /* Return the index pairs as a bytes object, and free the memory */
+    PyObject* pairs = PyBytes_FromStringAndSize((const char*)self->_pairs,
+                          2 * self->_pairs_size * sizeof(Py_ssize_t));
+    PyMem_Free(self->_pairs);
+    self->_pairs = NULL;
+    self->_pairs_size = 0;
+    self->_pairs_allocated = 0;
+    return pairs;
+}
+
 static int
 KDTree_report_point(KDTree* self, DataPoint* data_point, PyObject* points)
 {
@@ -408,6 +447,9 @@ KDTree_report_point(KDTree* self, DataPoint* data_point, PyObject* points)
     if (r <= self->_radius_sq)
     {
         Point* point;
+        if (points == NULL)
+            /* store (query index, index) instead of a Point object */
+            return KDTree_add_pair(self, self->_query_index, index);
         point = (Point*) PointType.tp_alloc(&PointType, 0);
         if (!point) return 0;
         point->index = index;
@@ -429,6 +471,13 @@ KDTree_test_neighbors(KDTree* self, DataPoint* p1, DataPoint* p2, PyObject* neig
         /* we found a neighbor pair! */
         Neighbor* neighbor;
         Py_ssize_t index1, index2;
+        if (neighbors == NULL) {
+            /* store the index pair instead of a Neighbor object */
+            index1 = p1->_index;
+            index2 = p2->_index;
+            if (index1 < index2) return KDTree_add_pair(self, index1, index2);
+            else return KDTree_add_pair(self, index2, index1);
+        }
         neighbor = (Neighbor*) NeighborType.tp_alloc(&NeighborType, 0);
         if (!neighbor) return 0;
         index1 = p1->_index;
@@ -963,22 +1012,43 @@ KDTree_dealloc(KDTree* self)
 {
     Node_destroy(self->_root);
     if (self->_data_point_list) PyMem_Free(self->_data_point_list);
+    if (self->_pairs) PyMem_Free(self->_pairs);
     Py_TYPE(self)->tp_free((PyObject*)self);
 }
 
+static int
+KDTree_set_coordinates(DataPoint* data_point_list, Py_ssize_t n, const double* coords)
+{
+    Py_ssize_t i;
+    int j;
+    double value;
+    for (i = 0; i < DIM * n; i++) {
+        value = coords[i];
+        if (value <= -1e6 || value >= 1e6) {
+            PyErr_SetString(PyExc_ValueError,
+                "coordinate values should lie between -1e6 and 1e6");
+            return 0;
+        }
+    }
+    for (i = 0; i < n; i++) {
+        DataPoint* data_point = &data_point_list[i];
+        const double* coord = coords + DIM * data_point->_index;
+        for (j = 0; j < DIM; j++) data_point->_coord[j] = coord[j];
+    }
+    return 1;
+}
+
 static PyObject*
 KDTree_new(PyTypeObject* type, PyObject* args, PyObject* kwds)
 {
     int bucket_size = 1;
-    double* coords;
-    Py_ssize_t n, i, j;
+    Py_ssize_t n, i;
     PyObject *obj;
     const int flags = PyBUF_ND | PyBUF_C_CONTIGUOUS;
 
     Py_buffer view;
     KDTree* self;
     DataPoint* data_point_list;
-    double value;
 
     if (!PyArg_ParseTuple(args, "O|i:KDTree_new" , &obj, &bucket_size))
         return NULL;
@@ -1009,20 +1079,11 @@ KDTree_new(PyTypeObject* type, PyObject* args, PyObject* kwds)
         return PyErr_NoMemory();
     }
 
-    coords = view.buf;
-    for (i = 0; i < n; i++) {
-        data_point_list[i]._index = i;
-        for (j = 0; j < DIM; j++, coords++) {
-            value = *coords;
-            if (value <= -1e6 || value >= 1e6) {
-                PyMem_Free(data_point_list);
-                PyBuffer_Release(&view);
-                PyErr_SetString(PyExc_ValueError,
-                    "coordinate values should lie between -1e6 and 1e6");
-                return NULL;
-            }
-            data_point_list[i]._coord[j] = value;
-        }
+    for (i = 0; i < n; i++) data_point_list[i]._index = i;
+    if (!KDTree_set_coordinates(data_point_list, n, view.buf)) {
+        PyMem_Free(data_point_list);
+        PyBuffer_Release(&view);
+        return NULL;
     }
     PyBuffer_Release(&view);
 
@@ -1078,6 +1139,10 @@ PyKDTree_search(KDTree* self, PyObject* args)
         PyErr_SetString(PyExc_ValueError, "Radius must be positive.");
         return NULL;
     }
+    if (!self->_root) {
+        PyErr_SetString(PyExc_RuntimeError, "KD tree was not built");
+        return NULL;
+    }
 
     if (PyObject_GetBuffer(obj, &view, flags) == -1) return NULL;
     if (view.itemsize != sizeof(double)) {
@@ -1159,6 +1224,10 @@ PyKDTree_neighbor_search(KDTree* self, PyObject* args)
         PyErr_SetString(PyExc_ValueError, "Radius must be positive.");
         return NULL;
     }
+    if (!self->_root) {
+        PyErr_SetString(PyExc_RuntimeError, "KD tree was not built");
+        return NULL;
+    }
 
     neighbors = PyList_New(0);
 
@@ -1250,6 +1319,198 @@ PyKDTree_neighbor_simple_search(KDTree* self, PyObject* args)
     return neighbors;
 }
 
+PyDoc_STRVAR(PyKDTree_update__doc__,
+"Update the coordinates of the points, and rebuild the KD tree.\n\
+\n\
+Arguments:\n\
+ - coordinates: Nx3 NumPy array with the new coordinates of the N points.\n\
+\n\
+The number of points must be the same as when the KDTree was created.\n\
+Memory allocated for the points is reused.");
+
+static PyObject*
+PyKDTree_update(KDTree* self, PyObject* args)
+{
+    PyObject *obj;
+    const int flags = PyBUF_ND | PyBUF_C_CONTIGUOUS;
+    Py_buffer view;
+    Node* root;
+    int ok;
+
+    if (!PyArg_ParseTuple(args, "O:update", &obj)) return NULL;
+
+    if (PyObject_GetBuffer(obj, &view, flags) == -1) return NULL;
+    if (view.itemsize != sizeof(double)) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_RuntimeError,
+                        "coords array has incorrect data type");
+        return NULL;
+    }
+    if (view.ndim != 2 || view.shape[1] != 3
+     || view.shape[0] != self->_data_point_list_size) {
+        PyBuffer_Release(&view);
+        PyErr_Format(PyExc_ValueError, "expected a %zdx3 numpy array",
+                     self->_data_point_list_size);
+        return NULL;
+    }
+    ok = KDTree_set_coordinates(self->_data_point_list,
+                                self->_data_point_list_size, view.buf);
+    PyBuffer_Release(&view);
+    if (!ok) return NULL;
+
+    root = KDTree_build_tree(self, 0, 0, 0);
+    Node_destroy(self->_root);
+    self->_root = root;
+    if (!root) return PyErr_NoMemory();
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(PyKDTree_search_indices__doc__,
+"Search all points within the given radius of each query point.\n\
+\n\
+Arguments:\n\
+ - coordinates: Mx3 NumPy array with the M query points.\n\
+ - radius: float>0\n\
+\n\
+Returns a bytes object with pairs of indices (each of type Py_ssize_t):\n\
+the index of the query point, followed by the index of a point in the\n\
+KDTree within the radius of that query point.");
+
+static PyObject*
+PyKDTree_search_indices(KDTree* self, PyObject* args)
+{
+    PyObject *obj;
+    double radius;
+    const double* coords;
+    const int flags = PyBUF_ND | PyBUF_C_CONTIGUOUS;
+    Py_buffer view;
+    Py_ssize_t i, n;
+    int j;
+    int ok = 1;
+    double left[DIM];
+    double right[DIM];
+
+    if (!PyArg_ParseTuple(args, "Od:search_indices", &obj, &radius))
+        return NULL;
+
+    if (radius <= 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "Radius must be positive.");
+        return NULL;
+    }
+    if (!self->_root) {
+        PyErr_SetString(PyExc_RuntimeError, "KD tree was not built");
+        return NULL;
+    }
+
+    if (PyObject_GetBuffer(obj, &view, flags) == -1) return NULL;
+    if (view.itemsize != sizeof(double)) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_RuntimeError,
+                        "coords array has incorrect data type");
+        return NULL;
+    }
+    if (view.ndim != 2 || view.shape[1] != 3) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_ValueError, "expected a Nx3 numpy array");
+        return NULL;
+    }
+    n = view.shape[0];
+    coords = view.buf;
+
+    self->_radius = radius;
+    /* use of r^2 to avoid sqrt use */
+    self->_radius_sq = radius*radius;
+
+    for (i = 0; ok && i < n; i++, coords += DIM) {
+        Region* query_region;
+        for (j = 0; j < DIM; j++) {
+            left[j] = coords[j] - radius;
+            right[j] = coords[j] + radius;
+            /* set center of query */
+            self->_center_coord[j] = coords[j];
+        }
+        query_region = Region_create(left, right);
+        if (!query_region) {
+            ok = 0;
+            break;
+        }
+        self->_query_index = i;
+        /* a NULL list means that the index pairs are stored in self */
+        ok = KDTree_search(self, NULL, NULL, 0, query_region, NULL);
+        Region_destroy(query_region);
+    }
+    PyBuffer_Release(&view);
+
+    if (!ok) {
+        PyMem_Free(self->_pairs);
+        self->_pairs = NULL;
+        self->_pairs_size = 0;
+        self->_pairs_allocated = 0;
+        return PyErr_NoMemory();
+    }
+    return KDTree_get_pairs(self);
+}
+
+PyDoc_STRVAR(PyKDTree_neighbor_search_indices__doc__,
+"All fixed neighbor search, returning indices.\n\
+\n\
+Find all point pairs that are within radius of each other.\n\
+\n\
+Arguments:\n\
+ - radius: float (>0)\n\
+\n\
+Returns a bytes object with pairs of indices (each of type Py_ssize_t)\n\
+of the points that are within radius of each other, with the smaller\n\
+index first in each pair.");
+
+static PyObject*
+PyKDTree_neighbor_search_indices(KDTree* self, PyObject* args)
+{
+    int ok = 0;
+    double radius;
+
+    if (!PyArg_ParseTuple(args, "d:neighbor_search_indices", &radius))
+        return NULL;
+
+    if (radius <= 0) {
+        PyErr_SetString(PyExc_ValueError, "Radius must be positive.");
+        return NULL;
+    }
+    if (!self->_root) {
+        PyErr_SetString(PyExc_RuntimeError, "KD tree was not built");
+        return NULL;
+    }
+
+    /* note the use of r^2 to avoid use of sqrt */
+    self->_neighbor_radius = radius;
+    self->_neighbor_radius_sq = radius*radius;
+
+    /* a NULL list means that the index pairs are stored in self */
+    if (Node_is_leaf(self->_root)) {
+        /* this is a boundary condition */
+        /* bucket_size > nr of points */
+        ok = KDTree_search_neighbors_in_bucket(self, self->_root, NULL);
+    }
+    else {
+        /* "normal" situation */
+        /* start with [-INF, INF] */
+        Region *region = Region_create(NULL, NULL);
+        if (region) {
+            ok = KDTree_neighbor_search(self, self->_root, region, 0, NULL);
+            Region_destroy(region);
+        }
+    }
+    if (!ok) {
+        PyMem_Free(self->_pairs);
+        self->_pairs = NULL;
+        self->_pairs_size = 0;
+        self->_pairs_allocated = 0;
+        return PyErr_NoMemory();
+    }
+    return KDTree_get_pairs(self);
+}
+
 static PyMethodDef KDTree_methods[] = {
     {"search",
      (PyCFunction)PyKDTree_search,
@@ -1263,6 +1524,18 @@ static PyMethodDef KDTree_methods[] = {
      (PyCFunction)PyKDTree_neighbor_simple_search,
       METH_VARARGS,
       PyKDTree_neighbor_simple_search__doc__},
+    {"search_indices",
+     (PyCFunction)PyKDTree_search_indices,
+      METH_VARARGS,
+      PyKDTree_search_indices__doc__},
+    {"neighbor_search_indices",
+     (PyCFunction)PyKDTree_neighbor_search_indices,
+      METH_VARARGS,
+      PyKDTree_neighbor_search_indices__doc__},
+    {"update",
+     (PyCFunction)PyKDTree_update,
+      METH_VARARGS,
+      PyKDTree_update__doc__},
     {NULL, NULL, 0, NULL}  /* Sentinel */
 };
 
@@ -13,26 +13,35 @@ adam consensus.
 """
 
 import itertools
+import os
 import random
-from ast import literal_eval
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
+
+from Bio.Align import Alignment
 from Bio.Align import MultipleSeqAlignment
 from Bio.Phylo import BaseTree
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
 
 
-class _BitString(str):
+class _BitString(int):
     """Helper class for binary string data (PRIVATE).
 
     Assistant class of binary string data used for storing and
     counting compatible clades in consensus tree searching. It includes
     some binary manipulation(&|^~) methods.
 
-    _BitString is a sub-class of ``str`` object that only accepts two
-    characters('0' and '1'), with additional functions for binary-like
-    manipulation(&|^~). It is used to count and store the clades in
-    multiple trees in consensus tree searching. During counting, the
-    clades will be considered the same if their terminals(in terms of
-    ``name`` attribute) are the same.
+    _BitString is a sub-class of ``int`` that is created from a string of
+    the two characters '0' and '1', and remembers the length of that string.
+    The first character corresponds to the most significant bit, so that
+    bitwise manipulation(&|^~) and comparisons are done directly on the
+    integer value, and its ``str`` is the binary string. It is used to count
+    and store the clades in multiple trees in consensus tree searching.
+    During counting, the clades will be considered the same if their
+    terminals(in terms of ``name`` attribute) are the same.
 
     For example, let's say two trees are provided as below to search
     their strict consensus tree::
@@ -124,58 +133,70 @@ class _BitString(str):
         if isinstance(strdata, str) and len(strdata) == strdata.count(
             "0"
         ) + strdata.count("1"):
-            return str.__new__(cls, strdata)
+            return cls._from_int(int(strdata, 2) if strdata else 0, len(strdata))
         else:
             raise TypeError(
                 "The input should be a binary string composed of '0' and '1'"
             )
 
+    @classmethod
+    def _from_int(cls, value, length):
+        """Create a _BitString from an integer and the number of bits (PRIVATE)."""
+        bitstr = int.__new__(cls, value)
+        bitstr._length = length
+        return bitstr
+
+    def __getnewargs__(self):
+        return (str(self),)
+
+    def _coerce(self, other):
+        """Return the other operand as a _BitString (PRIVATE)."""
+        if isinstance(other, str):
+            other = _BitString(other)
+        return other
+
     def __and__(self, other):
-        selfint = literal_eval("0b" + self)
-        otherint = literal_eval("0b" + other)
-        resultint = selfint & otherint
-        return _BitString(bin(resultint)[2:].zfill(len(self)))
+        other = self._coerce(other)
+        return _BitString._from_int(int(self) & int(other), len(self))
 
     def __or__(self, other):
-        selfint = literal_eval("0b" + self)
-        otherint = literal_eval("0b" + other)
-        resultint = selfint | otherint
-        return _BitString(bin(resultint)[2:].zfill(len(self)))
+        other = self._coerce(other)
+        return _BitString._from_int(int(self) | int(other), len(self))
 
     def __xor__(self, other):
-        selfint = literal_eval("0b" + self)
-        otherint = literal_eval("0b" + other)
-        resultint = selfint ^ otherint
-        return _BitString(bin(resultint)[2:].zfill(len(self)))
-
-    def __rand__(self, other):
-        selfint = literal_eval("0b" + self)
-        otherint = literal_eval("0b" + other)
-        resultint = otherint & selfint
-        return _BitString(bin(resultint)[2:].zfill(len(self)))
-
-    def __ror__(self, other):
-        selfint = literal_eval("0b" + self)
-        otherint = literal_eval("0b" + other)
-        resultint = otherint | selfint
-        return _BitString(bin(resultint)[2:].zfill(len(self)))
-
-    def __rxor__(self, other):
-        selfint = literal_eval("0b" + self)
-        otherint = literal_eval("0b" + other)
-        resultint = otherint ^ selfint
-        return _BitString(bin(resultint)[2:].zfill(len(self)))
+        other = self._coerce(other)
+        return _BitString._from_int(int(self) ^ int(other), len(self))
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        if self._length == 0:
+            return ""
+        return format(int(self), "0%db" % self._length)
 
     def __repr__(self):
-        return "_BitString(" + str.__repr__(self) + ")"
+        return "_BitString(" + repr(str(self)) + ")"
+
+    def count(self, sub):
+        """Return the number of occurrences of '0' or '1' in the binary string."""
+        if sub == "1":
+            return int(self).bit_count()
+        if sub == "0":
+            return self._length - int(self).bit_count()
+        return str(self).count(sub)
 
     def index_one(self):
         """Return a list of positions where the element is '1'."""
-        return [i for i, n in enumerate(self) if n == "1"]
+        return [i for i, n in enumerate(str(self)) if n == "1"]
 
     def index_zero(self):
         """Return a list of positions where the element is '0'."""
-        return [i for i, n in enumerate(self) if n == "0"]
+        return [i for i, n in enumerate(str(self)) if n == "0"]
 
     def contains(self, other):
         """Check if current bitstr1 contains another one bitstr2.
@@ -190,8 +211,8 @@ class _BitString(str):
         objects contain all-zero _BitString of the same length.
 
         """
-        xorbit = self ^ other
-        return xorbit.count("1") == self.count("1") - other.count("1")
+        other = int(self._coerce(other))
+        return int(self) & other == other
 
     def independent(self, other):
         """Check if current bitstr1 is independent of another one bitstr2.
@@ -202,8 +223,7 @@ class _BitString(str):
         Be careful, all _BitString objects are independent of all-zero _BitString
         of the same length.
         """
-        xorbit = self ^ other
-        return xorbit.count("1") == self.count("1") + other.count("1")
+        return int(self) & int(self._coerce(other)) == 0
 
     def iscompatible(self, other):
         """Check if current bitstr1 is compatible with another bitstr2.
@@ -217,7 +237,11 @@ class _BitString(str):
 
     @classmethod
     def from_bool(cls, bools):
-        return cls("".join(map(str, map(int, bools))))
+        bools = list(bools)
+        value = 0
+        for b in bools:
+            value = (value << 1) | bool(b)
+        return cls._from_int(value, len(bools))
 
 
 def strict_consensus(trees):
@@ -295,7 +319,7 @@ def majority_consensus(trees, cutoff=0):
     # Sort bitstrs by descending #occurrences, then #tips, then tip order
     bitstrs = sorted(
         bitstr_counts.keys(),
-        key=lambda bitstr: (bitstr_counts[bitstr][0], bitstr.count("1"), str(bitstr)),
+        key=lambda bitstr: (bitstr_counts[bitstr][0], bitstr.count("1"), int(bitstr)),
         reverse=True,
     )
     root = BaseTree.Clade()
@@ -476,25 +500,36 @@ def _count_clades(trees):
     Return a tuple first a dict of bitstring (representing clade) and a tuple of its count of
     occurrences and sum of branch length for that clade, second the number of trees processed.
 
+    The bits of the bitstrings follow the order of the terminals of the first
+    tree, and are counted as integers while processing the trees.
+
     :Parameters:
         trees : iterable
             An iterable that returns the trees to count
 
     """
-    bitstrs = {}
+    counts = {}
     tree_count = 0
+    term_names = None
     for tree in trees:
         tree_count += 1
-        clade_bitstrs = _tree_to_bitstrs(tree)
-        for clade in tree.find_clades(terminal=False):
-            bitstr = clade_bitstrs[clade]
-            if bitstr in bitstrs:
-                count, sum_bl = bitstrs[bitstr]
-                count += 1
-                sum_bl += clade.branch_length or 0
-                bitstrs[bitstr] = (count, sum_bl)
+        if term_names is None:
+            term_names = [term.name for term in tree.find_clades(terminal=True)]
+        for clade, mask in _clade_masks(tree, term_names):
+            try:
+                count = counts[mask]
+            except KeyError:
+                counts[mask] = [1, clade.branch_length or 0]
             else:
-                bitstrs[bitstr] = (1, clade.branch_length or 0)
+                count[0] += 1
+                count[1] += clade.branch_length or 0
+    if term_names is None:
+        return {}, tree_count
+    length = len(term_names)
+    bitstrs = {
+        _BitString._from_int(mask, length): (count, sum_bl)
+        for mask, (count, sum_bl) in counts.items()
+    }
     return bitstrs, tree_count
 
 
@@ -512,7 +547,6 @@ def get_support(target_tree, trees, len_trees=None):
 
     """
     term_names = sorted(term.name for term in target_tree.find_clades(terminal=True))
-    bitstrs = {}
 
     size = len_trees
     if size is None:
@@ -525,16 +559,18 @@ def get_support(target_tree, trees, len_trees=None):
                 "as the optional parameter len_trees."
             ) from None
 
+    masks = dict(_clade_masks(target_tree, term_names))
+    clades = {}
     for clade in target_tree.find_clades(terminal=False):
-        bitstr = _clade_to_bitstr(clade, term_names)
-        bitstrs[bitstr] = (clade, 0)
+        clades[masks[clade]] = clade
+    counts = dict.fromkeys(clades, 0)
     for tree in trees:
-        for clade in tree.find_clades(terminal=False):
-            bitstr = _clade_to_bitstr(clade, term_names)
-            if bitstr in bitstrs:
-                c, t = bitstrs[bitstr]
-                c.confidence = (t + 1) * 100.0 / size
-                bitstrs[bitstr] = (c, t + 1)
+        for clade, mask in _clade_masks(tree, term_names):
+            if mask in counts:
+                counts[mask] += 1
+    for mask, count in counts.items():
+        if count:
+            clades[mask].confidence = count * 100.0 / size
     return target_tree
 
 
@@ -562,9 +598,16 @@ def bootstrap(msa, times):
         yield item
 
 
-def bootstrap_trees(alignment, times, tree_constructor):
+def bootstrap_trees(
+    alignment, times, tree_constructor, workers=None, executor=None, seed=None
+):
     """Generate bootstrap replicate trees from a multiple sequence alignment.
 
+    Each replicate resamples the alignment columns using its own random
+    number generator, seeded from ``seed`` (or, if ``seed`` is None, from the
+    ``random`` module), so the same seed gives the same replicate trees,
+    whether or not they are built in parallel.
+
     :Parameters:
         alignment : Alignment or MultipleSeqAlignment object
             multiple sequence alignment to generate replicates.
@@ -572,29 +615,112 @@ def bootstrap_trees(alignment, times, tree_constructor):
             number of bootstrap times.
         tree_constructor : TreeConstructor
             tree constructor to be used to build trees.
-
+        workers : int
+            if given, build the trees in a pool of this many processes.
+        executor : concurrent.futures.Executor
+            if given, build the trees using this executor instead; the
+            tree constructor must then be picklable.
+        seed : int
+            seed of the random number generators of the replicates.
+
+    Without ``workers`` or ``executor``, the trees are built and yielded one
+    at a time in the current process. Otherwise, the replicates are split
+    into batches that are built in parallel, and the trees are yielded as soon
+    as their batch has finished, which may differ from the replicate order.
     """
+    data, records, alignment_class = _encode_columns(alignment)
+    if seed is None:
+        seed = random.getrandbits(128)
+    seeds = np.random.SeedSequence(seed).spawn(times)
+    args = (data, records, alignment_class, tree_constructor)
+    if workers is None and executor is None:
+        for replicate_seed in seeds:
+            yield _bootstrap_tree(*args, replicate_seed)
+    elif executor is None:
+        with ProcessPoolExecutor(workers) as pool:
+            yield from _bootstrap_trees_parallel(pool, workers, args, seeds)
+    else:
+        yield from _bootstrap_trees_parallel(executor, workers, args, seeds)
+
+
+def _bootstrap_trees_parallel(executor, workers, args, seeds):
+    """Build bootstrap trees in batches using an executor (PRIVATE)."""
+    # a few batches per worker, so that trees are returned while running
+    batch_count = 4 * (workers or os.cpu_count() or 1)
+    size = max(1, -(-len(seeds) // batch_count))
+    futures = [
+        executor.submit(_bootstrap_tree_batch, *args, seeds[start : start + size])
+        for start in range(0, len(seeds), size)
+    ]
+    try:
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _encode_columns(alignment):
+    """Return the alignment as a 2D byte array, with its records and type (PRIVATE)."""
     if isinstance(alignment, MultipleSeqAlignment):
-        length = len(alignment[0])
-        for i in range(times):
-            bootstrapped_alignment = None
-            for j in range(length):
-                col = random.randint(0, length - 1)
-                if bootstrapped_alignment is None:
-                    bootstrapped_alignment = alignment[:, col : col + 1]
-                else:
-                    bootstrapped_alignment += alignment[:, col : col + 1]
-            tree = tree_constructor.build_tree(bootstrapped_alignment)
-            yield tree
+        records = list(alignment)
+        m = alignment.get_alignment_length() if records else 0
+        data = b"".join(bytes(record.seq) for record in records)
+        data = np.frombuffer(data, np.uint8).reshape(len(records), m)
+    elif isinstance(alignment, Alignment):
+        records = list(alignment.sequences)
+        data = np.array(alignment, "S1")
+        data = data.view(np.uint8).reshape(data.shape)
     else:
-        n, m = alignment.shape
-        for i in range(times):
-            cols = [random.randint(0, m - 1) for j in range(m)]
-            tree = tree_constructor.build_tree(alignment[:, cols])
-            yield tree
+        raise TypeError(
+            "Must provide an Alignment object or a MultipleSeqAlignment object."
+        )
+    # keep the identifiers only, not the full sequences
+    records = [
+        (
+            getattr(record, "id", None),
+            getattr(record, "name", None),
+            getattr(record, "description", None),
+        )
+        for record in records
+    ]
+    return data, records, type(alignment)
+
+
+def _resample_columns(data, records, alignment_class, columns):
+    """Create an alignment from the given columns of an encoded alignment (PRIVATE)."""
+    sequences = [
+        SeqRecord(Seq(row.tobytes()), id=id, name=name, description=description)
+        for row, (id, name, description) in zip(data[:, columns], records)
+    ]
+    return alignment_class(sequences)
+
+
+def _bootstrap_tree(data, records, alignment_class, tree_constructor, seed):
+    """Build the tree of one bootstrap replicate (PRIVATE)."""
+    m = data.shape[1]
+    columns = np.random.default_rng(seed).integers(0, m, m)
+    alignment = _resample_columns(data, records, alignment_class, columns)
+    return tree_constructor.build_tree(alignment)
+
+
+def _bootstrap_tree_batch(data, records, alignment_class, tree_constructor, seeds):
+    """Build the trees of a batch of bootstrap replicates (PRIVATE)."""
+    return [
+        _bootstrap_tree(data, records, alignment_class, tree_constructor, seed)
+        for seed in seeds
+    ]
 
 
-def bootstrap_consensus(alignment, times, tree_constructor, consensus):
+def bootstrap_consensus(
+    alignment,
+    times,
+    tree_constructor,
+    consensus,
+    workers=None,
+    executor=None,
+    seed=None,
+):
     """Consensus tree of a series of bootstrap trees for a multiple sequence alignment.
 
     :Parameters:
@@ -607,9 +733,23 @@ def bootstrap_consensus(alignment, times, tree_constructor, consensus):
         consensus : function
             Consensus method in this module: ``strict_consensus``,
             ``majority_consensus``, ``adam_consensus``.
+        workers : int
+            If given, build the bootstrap trees in a pool of this many
+            processes (see ``bootstrap_trees``).
+        executor : concurrent.futures.Executor
+            If given, build the bootstrap trees using this executor.
+        seed : int
+            Seed of the random number generators of the replicates.
 
     """
-    trees = bootstrap_trees(alignment, times, tree_constructor)
+    trees = bootstrap_trees(
+        alignment,
+        times,
+        tree_constructor,
+        workers=workers,
+        executor=executor,
+        seed=seed,
+    )
     tree = consensus(trees)
     return tree
 
@@ -620,14 +760,49 @@ def _clade_to_bitstr(clade, tree_term_names):
     return _BitString.from_bool((name in clade_term_names) for name in tree_term_names)
 
 
+def _clade_masks(tree, term_names):
+    """Return the nonterminal clades of a tree with their bit masks as integers (PRIVATE).
+
+    Each bit of the mask corresponds to a name in term_names, with the first
+    name as the most significant bit. The masks are calculated bottom-up as
+    the union of the masks of the child clades; terminals whose name is not
+    in term_names are ignored. The clades are returned in postorder.
+    """
+    n = len(term_names)
+    bits = {name: 1 << (n - 1 - i) for i, name in enumerate(term_names)}
+    masks = {}
+    result = []
+    # iterative postorder traversal, to avoid the overhead of find_clades
+    stack = [(tree.root, False)]
+    while stack:
+        clade, visited = stack.pop()
+        children = clade.clades
+        if not children:
+            masks[clade] = bits.get(clade.name, 0)
+        elif visited:
+            mask = 0
+            for child in children:
+                mask |= masks[child]
+            masks[clade] = mask
+            result.append((clade, mask))
+        else:
+            stack.append((clade, True))
+            stack.extend((child, False) for child in reversed(children))
+    return result
+
+
 def _tree_to_bitstrs(tree):
-    """Create a dict of a tree's clades to corresponding BitStrings (PRIVATE)."""
-    clades_bitstrs = {}
-    term_names = [term.name for term in tree.find_clades(terminal=True)]
-    for clade in tree.find_clades(terminal=False):
-        bitstr = _clade_to_bitstr(clade, term_names)
-        clades_bitstrs[clade] = bitstr
-    return clades_bitstrs
+    """Create a dict of a tree's clades to corresponding BitStrings (PRIVATE).
+
+    Bits follow the sorted terminal names, so that trees listing the same
+    terminals in a different order can be compared.
+    """
+    term_names = sorted(term.name for term in tree.find_clades(terminal=True))
+    length = len(term_names)
+    return {
+        clade: _BitString._from_int(mask, length)
+        for clade, mask in _clade_masks(tree, term_names)
+    }
 
 
 def _bitstring_topology(tree):
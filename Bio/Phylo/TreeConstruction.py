@@ -10,11 +10,15 @@
 import itertools
 import copy
 import numbers
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
 from Bio.Phylo import BaseTree
 from Bio.Align import Alignment, MultipleSeqAlignment
 from Bio.Align import substitution_matrices
 
-
 # flake8: noqa
 
 
@@ -89,7 +93,17 @@ class _Matrix:
         Arguments are a list of names, and optionally a list of lower
         triangular matrix data (zero matrix used by default).
         """
-        # check names
+        self._set_names(names)
+        # check matrix
+        if matrix is None:
+            # create a new one with 0 if matrix is not assigned
+            matrix = [[0] * i for i in range(1, len(self) + 1)]
+        else:
+            self._check_matrix(matrix)
+        self.matrix = matrix
+
+    def _set_names(self, names):
+        """Check and store the names of the elements (PRIVATE)."""
         if isinstance(names, list) and all(isinstance(s, str) for s in names):
             if len(set(names)) == len(names):
                 self.names = names
@@ -98,31 +112,23 @@ class _Matrix:
         else:
             raise TypeError("'names' should be a list of strings")
 
-        # check matrix
-        if matrix is None:
-            # create a new one with 0 if matrix is not assigned
-            matrix = [[0] * i for i in range(1, len(self) + 1)]
-            self.matrix = matrix
-        else:
-            # check if all elements are numbers
-            if (
-                isinstance(matrix, list)
-                and all(isinstance(row, list) for row in matrix)
-                and all(
-                    isinstance(item, numbers.Number) for row in matrix for item in row
-                )
-            ):
-                # check if the same length with names
-                if len(matrix) == len(names):
-                    # check if is lower triangle format
-                    if [len(row) for row in matrix] == list(range(1, len(self) + 1)):
-                        self.matrix = matrix
-                    else:
-                        raise ValueError("'matrix' should be in lower triangle format")
-                else:
-                    raise ValueError("'names' and 'matrix' should be the same size")
+    def _check_matrix(self, matrix):
+        """Check if matrix is a lower triangular list of numerical lists (PRIVATE)."""
+        # check if all elements are numbers
+        if (
+            isinstance(matrix, list)
+            and all(isinstance(row, list) for row in matrix)
+            and all(isinstance(item, numbers.Number) for row in matrix for item in row)
+        ):
+            # check if the same length with names
+            if len(matrix) == len(self.names):
+                # check if is lower triangle format
+                if [len(row) for row in matrix] != list(range(1, len(self) + 1)):
+                    raise ValueError("'matrix' should be in lower triangle format")
             else:
-                raise TypeError("'matrix' should be a list of numerical lists")
+                raise ValueError("'names' and 'matrix' should be the same size")
+        else:
+            raise TypeError("'matrix' should be a list of numerical lists")
 
     def __getitem__(self, item):
         """Access value(s) by the index(s) or name(s).
@@ -299,11 +305,10 @@ class _Matrix:
 
     def __str__(self):
         """Get a lower triangular matrix string."""
+        matrix = self.matrix
         matrix_string = "\n".join(
             [
-                self.names[i]
-                + "\t"
-                + "\t".join([format(n, "f") for n in self.matrix[i]])
+                self.names[i] + "\t" + "\t".join([format(n, "f") for n in matrix[i]])
                 for i in range(0, len(self))
             ]
         )
@@ -315,22 +320,244 @@ class DistanceMatrix(_Matrix):
     """Distance matrix class that can be used for distance based tree algorithms.
 
     All diagonal elements will be zero no matter what the users provide.
+
+    The distances are stored in a NumPy array in condensed form, i.e. the
+    upper triangle of the symmetric distance matrix (excluding the diagonal)
+    in row-major order. This is the same layout as used by the distance
+    functions in ``scipy.spatial.distance``. In addition to a lower triangular
+    list of lists, the matrix can therefore be initialized from a condensed
+    one-dimensional array or from a square two-dimensional array:
+
+    >>> import numpy as np
+    >>> from Bio.Phylo.TreeConstruction import DistanceMatrix
+    >>> names = ['Alpha', 'Beta', 'Gamma']
+    >>> dm = DistanceMatrix(names, np.array([1.0, 2.0, 3.0]))
+    >>> dm
+    DistanceMatrix(names=['Alpha', 'Beta', 'Gamma'], matrix=[[0], [1.0, 0], [2.0, 3.0, 0]])
+    >>> dm.condensed.tolist()
+    [1.0, 2.0, 3.0]
+    >>> np.array(dm).tolist()
+    [[0.0, 1.0, 2.0], [1.0, 0.0, 3.0], [2.0, 3.0, 0.0]]
+
+    The ``matrix`` attribute is a list-like view of the distances as a lower
+    triangular matrix. Its rows are created when accessed, and assigning to
+    an element of a row updates the distance matrix:
+
+    >>> dm.matrix[2][1] = 4.0
+    >>> dm["Beta", "Gamma"]
+    4.0
+
+    The rows cannot be resized; use ``del dm[name]`` and ``dm.insert`` to
+    remove or add elements.
     """
 
     def __init__(self, names, matrix=None):
         """Initialize the class."""
-        _Matrix.__init__(self, names, matrix)
-        self._set_zero_diagonal()
+        self._set_names(names)
+        n = len(self)
+        size = n * (n - 1) // 2
+        if matrix is None:
+            self._data = np.zeros(size, int)
+        elif isinstance(matrix, np.ndarray):
+            if matrix.dtype.kind not in "iuf":
+                raise TypeError("'matrix' should be a numerical array")
+            if matrix.ndim == 1:
+                if len(matrix) != size:
+                    raise ValueError(
+                        "condensed 'matrix' should have n * (n - 1) / 2 elements"
+                    )
+                self._data = matrix.copy()
+            elif matrix.ndim == 2:
+                if matrix.shape != (n, n):
+                    raise ValueError("'names' and 'matrix' should be the same size")
+                self._data = _square_to_condensed(matrix)
+            else:
+                raise ValueError("'matrix' should be a one- or two-dimensional array")
+        else:
+            self._check_matrix(matrix)
+            self.matrix = matrix
+
+    @property
+    def matrix(self):
+        """Lower triangular matrix of distances, as a list-like view."""
+        return _DistanceMatrixRows(self)
+
+    @matrix.setter
+    def matrix(self, matrix):
+        n = len(matrix)
+        values = [value for row in matrix for value in row]
+        square = np.zeros((n, n), np.array(values).dtype if values else int)
+        for i, row in enumerate(matrix):
+            square[i, :i] = row[:i]
+        self._data = _square_to_condensed(square.T)
+
+    @property
+    def condensed(self):
+        """Distances as a condensed NumPy array (upper triangle, row-major)."""
+        return self._data
+
+    def __array__(self, dtype=None, copy=None):
+        """Return the distances as a square NumPy array."""
+        square = self._square()
+        if dtype is not None:
+            square = square.astype(dtype, copy=False)
+        return square
+
+    def _square(self):
+        """Return the distances as a square array (PRIVATE)."""
+        return _condensed_to_square(self._data, len(self))
+
+    def _position(self, i, j):
+        """Return the position of element i, j in the condensed array (PRIVATE)."""
+        if i > j:
+            i, j = j, i
+        return len(self) * i - i * (i + 1) // 2 + j - i - 1
+
+    def _index(self, item):
+        """Return the index of a name or index (PRIVATE)."""
+        if isinstance(item, int):
+            index = item
+        elif isinstance(item, str):
+            try:
+                index = self.names.index(item)
+            except ValueError:
+                raise ValueError("Item not found.") from None
+        else:
+            raise TypeError("Invalid index type.")
+        if index < 0:
+            index += len(self)
+        if index < 0 or index > len(self) - 1:
+            raise IndexError("Index out of range.")
+        return index
+
+    def _indices(self, item):
+        """Return the indices of a pair of names or indices (PRIVATE)."""
+        if len(item) != 2:
+            raise TypeError("Invalid index type.")
+        if not (
+            all(isinstance(i, int) for i in item)
+            or all(isinstance(i, str) for i in item)
+        ):
+            raise TypeError("Invalid index type.")
+        return self._index(item[0]), self._index(item[1])
+
+    def __getitem__(self, item):
+        """Access value(s) by the index(s) or name(s).
+
+        For a DistanceMatrix object 'dm'::
+
+            dm[i]                   get a value list from the given 'i' to others;
+            dm[i, j]                get the value between 'i' and 'j';
+            dm['name']              map name to index first
+            dm['name1', 'name2']    map name to index first
+
+        """
+        if isinstance(item, (int, str)):
+            index = self._index(item)
+            row = self._square_row(index).tolist()
+            row[index] = 0
+            return row
+        i, j = self._indices(item)
+        if i == j:
+            return 0
+        return self._data[self._position(i, j)].item()
+
+    def _square_row(self, index):
+        """Return the distances from one element to all others as an array (PRIVATE)."""
+        n = len(self)
+        row = np.zeros(n, self._data.dtype)
+        if index > 0:
+            columns = np.arange(index)
+            row[:index] = self._data[
+                n * columns - columns * (columns + 1) // 2 + index - columns - 1
+            ]
+        start = self._position(index, index + 1)
+        row[index + 1 :] = self._data[start : start + n - index - 1]
+        return row
+
+    def _upcast(self, value):
+        """Make sure that the array can store the given value (PRIVATE)."""
+        dtype = np.result_type(self._data.dtype, np.asarray(value).dtype)
+        if dtype != self._data.dtype:
+            self._data = self._data.astype(dtype)
 
     def __setitem__(self, item, value):
-        """Set Matrix's items to values."""
-        _Matrix.__setitem__(self, item, value)
-        self._set_zero_diagonal()
+        """Set value by the index(s) or name(s).
+
+        Similar to __getitem__::
+
+            dm[1] = [1, 0, 3, 4]    set values from '1' to others;
+            dm[i, j] = 2            set the value from 'i' to 'j'
+
+        Diagonal elements are always zero; any value assigned to them is
+        ignored.
+        """
+        if isinstance(item, (int, str)):
+            index = self._index(item)
+            if not (
+                isinstance(value, list)
+                and all(isinstance(n, numbers.Number) for n in value)
+            ):
+                raise TypeError("Invalid value type.")
+            if len(value) != len(self):
+                raise ValueError("Value not the same size.")
+            n = len(self)
+            self._upcast(value)
+            if index > 0:
+                columns = np.arange(index)
+                positions = (
+                    n * columns - columns * (columns + 1) // 2 + index - columns - 1
+                )
+                self._data[positions] = value[:index]
+            start = self._position(index, index + 1)
+            self._data[start : start + n - index - 1] = value[index + 1 :]
+        else:
+            i, j = self._indices(item)
+            if not isinstance(value, numbers.Number):
+                raise TypeError("Invalid value type.")
+            if i != j:
+                self._upcast(value)
+                self._data[self._position(i, j)] = value
+
+    def __delitem__(self, item):
+        """Delete related distances by the index or name."""
+        index = self._index(item)
+        n = len(self)
+        rows = np.arange(index)
+        start = self._position(index, index + 1)
+        positions = np.concatenate(
+            [
+                n * rows - rows * (rows + 1) // 2 + index - rows - 1,
+                np.arange(start, start + n - index - 1),
+            ]
+        )
+        self._data = np.delete(self._data, positions)
+        del self.names[index]
+
+    def insert(self, name, value, index=None):
+        """Insert distances given the name and value.
+
+        :Parameters:
+            name : str
+                name of a row/col to be inserted
+            value : list
+                a row/col of values to be inserted
 
-    def _set_zero_diagonal(self):
-        """Set all diagonal elements to zero (PRIVATE)."""
-        for i in range(0, len(self)):
-            self.matrix[i][i] = 0
+        """
+        if not isinstance(name, str):
+            raise TypeError("Invalid name type.")
+        if index is None:
+            index = len(self)
+        if not isinstance(index, int):
+            raise TypeError("Invalid index type.")
+        if index < 0:
+            # as for list.insert
+            index = max(index + len(self), 0)
+        square = np.insert(self._square(), index, 0, axis=0)
+        square = np.insert(square, index, 0, axis=1)
+        self.names.insert(index, name)
+        self._data = _square_to_condensed(square)
+        self[index] = value
 
     def format_phylip(self, handle):
         """Write data in Phylip format to a given file-like object or handle.
@@ -348,13 +575,124 @@ class DistanceMatrix(_Matrix):
         handle.write(f"    {len(self.names)}\n")
         # Phylip needs space-separated, vertically aligned columns
         name_width = max(12, max(map(len, self.names)) + 1)
-        value_fmts = ("{" + str(x) + ":.4f}" for x in range(1, len(self.matrix) + 1))
+        value_fmts = ("{" + str(x) + ":.4f}" for x in range(1, len(self) + 1))
         row_fmt = "{0:" + str(name_width) + "s}" + "  ".join(value_fmts) + "\n"
-        for i, (name, values) in enumerate(zip(self.names, self.matrix)):
-            # Mirror the matrix values across the diagonal
-            mirror_values = (self.matrix[j][i] for j in range(i + 1, len(self.matrix)))
-            fields = itertools.chain([name], values, mirror_values)
-            handle.write(row_fmt.format(*fields))
+        for name, values in zip(self.names, self._square().tolist()):
+            handle.write(row_fmt.format(name, *values))
+
+
+class _DistanceMatrixRows(Sequence):
+    """Lower triangular rows of a DistanceMatrix, as a list-like view (PRIVATE).
+
+    Each row is created from the distance matrix when it is accessed.
+    Assigning a row, or an element of a row, updates the distance matrix.
+    """
+
+    def __init__(self, dm):
+        """Initialize the view of the distance matrix."""
+        self._dm = dm
+
+    def __len__(self):
+        """Return the number of rows."""
+        return len(self._dm)
+
+    def _index(self, index):
+        """Return the row index as a non-negative integer (PRIVATE)."""
+        n = len(self._dm)
+        if index < 0:
+            index += n
+        if index < 0 or index >= n:
+            raise IndexError("list index out of range")
+        return index
+
+    def __getitem__(self, index):
+        """Return a row, or a list of rows for a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return _DistanceMatrixRow(self._dm, self._index(index))
+
+    def __setitem__(self, index, row):
+        """Replace the distances in a row."""
+        index = self._index(index)
+        if len(row) != index + 1:
+            raise ValueError("cannot change the size of a distance matrix row")
+        for j in range(index):
+            self._dm[index, j] = row[j]
+
+    def __eq__(self, other):
+        """Compare the rows to those of a list of lists."""
+        if isinstance(other, (list, _DistanceMatrixRows)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        """Return the rows as a string, as for a list of lists."""
+        return repr(list(self))
+
+
+class _DistanceMatrixRow(list):
+    """Row of the lower triangular matrix of a DistanceMatrix (PRIVATE).
+
+    Assigning to an element updates the distance matrix; the size of the
+    row cannot be changed.
+    """
+
+    def __init__(self, dm, index):
+        """Initialize the row from the distance matrix."""
+        row = dm._square_row(index)[: index + 1].tolist()
+        row[index] = 0
+        super().__init__(row)
+        self._dm = dm
+        self._index = index
+
+    def __setitem__(self, index, value):
+        """Set the distance(s), also in the distance matrix."""
+        if isinstance(index, slice):
+            columns = range(*index.indices(len(self)))
+            values = list(value)
+            if len(values) != len(columns):
+                raise ValueError("cannot change the size of a distance matrix row")
+            for j, value in zip(columns, values):
+                self[j] = value
+            return
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("list assignment index out of range")
+        self._dm[self._index, index] = value
+        if index != self._index:
+            list.__setitem__(self, index, value)
+
+    def _resize(self, *args, **kwargs):
+        """Raise a TypeError, as the row cannot be resized (PRIVATE)."""
+        raise TypeError("cannot change the size of a distance matrix row")
+
+    append = extend = insert = pop = remove = clear = _resize
+    __delitem__ = __iadd__ = __imul__ = _resize
+
+    def __reduce__(self):
+        """Pickle and copy the row as an ordinary list."""
+        return list, (list(self),)
+
+
+def _condensed_to_square(data, n):
+    """Convert a condensed distance array to a square array (PRIVATE)."""
+    square = np.zeros((n, n), data.dtype)
+    start = 0
+    for i in range(n - 1):
+        stop = start + n - i - 1
+        square[i, i + 1 :] = data[start:stop]
+        square[i + 1 :, i] = data[start:stop]
+        start = stop
+    return square
+
+
+def _square_to_condensed(square):
+    """Convert the upper triangle of a square array to a condensed array (PRIVATE)."""
+    n = len(square)
+    if n < 2:
+        return np.zeros(0, square.dtype)
+    return np.concatenate([square[i, i + 1 :] for i in range(n - 1)])
 
 
 # Shim for compatibility with Biopython<1.70 (#1304)
@@ -546,33 +884,167 @@ class DistanceCalculator:
             return 1  # max possible scaled distance
         return 1 - (score / max_score)
 
-    def get_distance(self, msa):
+    def get_distance(self, msa, workers=None):
         """Return a DistanceMatrix for an Alignment or MultipleSeqAlignment object.
 
+        The alignment is encoded once as an integer array, and the distances
+        between all pairs of sequences are then calculated in bulk with NumPy.
+
         :Parameters:
             msa : Alignment or MultipleSeqAlignment object representing a
                 DNA or protein multiple sequence alignment.
+            workers : int
+                If given, the rows of the distance matrix are split into
+                blocks that are calculated in a pool of this many processes.
+                By default, all distances are calculated in the current
+                process.
 
         """
         if isinstance(msa, Alignment):
             names = [s.id for s in msa.sequences]
-            dm = DistanceMatrix(names)
-            n = len(names)
-            for i1 in range(n):
-                for i2 in range(i1):
-                    dm[names[i1], names[i2]] = self._pairwise(msa[i1], msa[i2])
         elif isinstance(msa, MultipleSeqAlignment):
             names = [s.id for s in msa]
-            dm = DistanceMatrix(names)
-            for seq1, seq2 in itertools.combinations(msa, 2):
-                dm[seq1.id, seq2.id] = self._pairwise(seq1, seq2)
         else:
             raise TypeError(
                 "Must provide an Alignment object or a MultipleSeqAlignment object."
             )
-
+        if type(self)._pairwise is not DistanceCalculator._pairwise:
+            # A subclass defines its own distance; compare the pairs one by one
+            return self._get_distance_pairwise(msa, names)
+        codes = _encode_alignment(msa)
+        if self.scoring_matrix is None:
+            args = self._encode_identity(codes)
+        else:
+            args = self._encode_scoring_matrix(codes, names)
+        n = len(names)
+        if workers is None or workers <= 1 or n < 2 * workers:
+            distances = _distance_block(0, n, *args)
+        else:
+            blocks = _triangle_blocks(n, workers)
+            distances = np.zeros((n, n))
+            with ProcessPoolExecutor(workers) as executor:
+                futures = [
+                    executor.submit(_distance_block, start, stop, *args)
+                    for start, stop in blocks
+                ]
+                for (start, stop), future in zip(blocks, futures):
+                    distances[start:stop, :stop] = future.result()
+        # the lower triangle has the distance of each sequence to the previous ones
+        return DistanceMatrix(names, distances.T)
+
+    def _get_distance_pairwise(self, msa, names):
+        """Calculate the distance matrix by calling _pairwise on each pair (PRIVATE)."""
+        dm = DistanceMatrix(names)
+        if isinstance(msa, Alignment):
+            n = len(names)
+            for i1 in range(n):
+                for i2 in range(i1):
+                    dm[names[i1], names[i2]] = self._pairwise(msa[i1], msa[i2])
+        else:
+            for seq1, seq2 in itertools.combinations(msa, 2):
+                dm[seq1.id, seq2.id] = self._pairwise(seq1, seq2)
         return dm
 
+    def _encode_identity(self, codes):
+        """Prepare the arguments of _distance_block for the identity model (PRIVATE)."""
+        skip = np.zeros(256, bool)
+        skip[[ord(letter) for letter in self.skip_letters if len(letter) == 1]] = True
+        valid = ~skip[codes]
+        letters = np.unique(codes[valid])
+        return codes, valid, letters, None, None
+
+    def _encode_scoring_matrix(self, codes, names):
+        """Prepare the arguments of _distance_block for a scoring matrix (PRIVATE).
+
+        The letters are mapped to their indices in the alphabet of the scoring
+        matrix; a ValueError is raised for letters missing from the alphabet
+        that would be compared to a letter of another sequence.
+        """
+        alphabet = self.scoring_matrix.alphabet
+        lookup = np.full(256, -1, np.intp)
+        for index, letter in enumerate(alphabet):
+            if len(letter) == 1 and ord(letter) < 256:
+                lookup[ord(letter)] = index
+        skip = np.zeros(256, bool)
+        skip[[ord(letter) for letter in self.skip_letters if len(letter) == 1]] = True
+        valid = ~skip[codes]
+        indices = lookup[codes]
+        bad = valid & (indices < 0)
+        if bad.any():
+            # only letters aligned to a letter in another sequence are compared
+            bad &= valid.sum(axis=0) > 1
+            if bad.any():
+                row, position = np.argwhere(bad)[0]
+                letter = chr(codes[row, position])
+                raise ValueError(
+                    f"Bad letter '{letter}' in sequence '{names[row]}' at position '{position}'"
+                )
+        scores = np.array(self.scoring_matrix, float)
+        letters = np.unique(indices[valid])
+        return indices, valid, letters, scores, np.diagonal(scores)
+
+
+def _encode_alignment(msa):
+    """Return the aligned sequences as a 2D array of byte values (PRIVATE)."""
+    if isinstance(msa, Alignment):
+        data = np.array(msa, "S1")
+        return data.view(np.uint8).reshape(data.shape)
+    n = len(msa)
+    m = msa.get_alignment_length() if n else 0
+    data = b"".join(bytes(record.seq) for record in msa)
+    return np.frombuffer(data, np.uint8).reshape(n, m)
+
+
+def _triangle_blocks(n, count):
+    """Split the rows of a lower triangular n x n matrix into blocks (PRIVATE).
+
+    The blocks contain approximately equal numbers of matrix elements.
+    """
+    bounds = np.sqrt(np.linspace(0, n * n, count + 1)).round().astype(int)
+    bounds = np.unique(bounds)
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+
+def _distance_block(start, stop, codes, valid, letters, scores, diagonal):
+    """Calculate the distances of rows start:stop to rows 0:stop (PRIVATE).
+
+    For each letter, the rows of the alignment containing that letter are
+    encoded as 0/1 vectors, such that summing over all letters of the matrix
+    product of these vectors gives the number of identities (or the total
+    substitution score) between each pair of sequences. Positions with a
+    letter in skip_letters are excluded from the comparison.
+
+    Returns an array with stop - start rows and stop columns.
+    """
+    rows = codes[start:stop]
+    columns = codes[:stop]
+    rows_valid = valid[start:stop]
+    columns_valid = valid[:stop]
+    score = np.zeros((stop - start, stop))
+    if scores is None:
+        # identity model; the maximum score is the alignment length
+        for letter in letters:
+            x = ((rows == letter) & rows_valid).astype(float)
+            y = ((columns == letter) & columns_valid).astype(float)
+            score += x @ y.T
+        max_score = np.full(score.shape, codes.shape[1], float)
+    else:
+        for letter in letters:
+            x = ((rows == letter) & rows_valid).astype(float)
+            y = np.where(columns_valid, scores[letter][columns], 0.0)
+            score += x @ y.T
+        # Take the higher score if the matrix is asymmetrical
+        x = np.where(rows_valid, diagonal[rows], 0.0)
+        y = np.where(columns_valid, diagonal[columns], 0.0)
+        max_score1 = x @ columns_valid.T.astype(float)
+        max_score2 = rows_valid.astype(float) @ y.T
+        max_score = np.maximum(max_score1, max_score2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distances = np.where(max_score == 0, 1.0, 1 - score / max_score)
+    # diagonal elements are always zero
+    distances[np.arange(stop - start), np.arange(start, stop)] = 0
+    return distances
+
 
 class TreeConstructor:
     """Base class for all tree constructor."""
@@ -672,7 +1144,7 @@ class DistanceTreeConstructor(TreeConstructor):
 
     """
 
-    methods = ["nj", "upgma"]
+    methods = ["nj", "upgma", "rapidnj"]
 
     def __init__(self, distance_calculator=None, method="nj"):
         """Initialize the class."""
@@ -699,6 +1171,8 @@ class DistanceTreeConstructor(TreeConstructor):
             tree = None
             if self.method == "upgma":
                 tree = self.upgma(dm)
+            elif self.method == "rapidnj":
+                tree = self.rapidnj(dm)
             else:
                 tree = self.nj(dm)
             return tree
@@ -719,48 +1193,75 @@ class DistanceTreeConstructor(TreeConstructor):
         if not isinstance(distance_matrix, DistanceMatrix):
             raise TypeError("Must provide a DistanceMatrix object.")
 
-        # make a copy of the distance matrix to be used
-        dm = copy.deepcopy(distance_matrix)
+        # work on a square copy of the distances, updated in place; merged
+        # nodes take the position of the second node and the first one is
+        # marked as inactive, which keeps the order of the remaining nodes.
+        dm = np.array(distance_matrix, float)
+        n = len(dm)
+        active = np.ones(n, bool)
+        heights = np.zeros(n)
         # init terminal clades
-        clades = [BaseTree.Clade(None, name) for name in dm.names]
-        # init minimum index
-        min_i = 0
-        min_j = 0
+        clades = [BaseTree.Clade(None, name) for name in distance_matrix.names]
+        if n == 1:
+            return BaseTree.Tree(clades[0])
+        # For each row, cache the minimum distance to the previous nodes, and
+        # the last column where it occurs.
+        row_min = np.full(n, np.inf)
+        row_arg = np.full(n, -1)
+        for i in range(1, n):
+            row_min[i], row_arg[i] = _last_minimum(dm[i, :i], active[:i])
         inner_count = 0
-        while len(dm) > 1:
-            min_dist = dm[1, 0]
-            # find minimum index
-            for i in range(1, len(dm)):
-                for j in range(0, i):
-                    if min_dist >= dm[i, j]:
-                        min_dist = dm[i, j]
-                        min_i = i
-                        min_j = j
+        for inner_count in range(1, n):
+            # find minimum index; the last pair in case of ties
+            candidates = np.where(active, row_min, np.inf)
+            min_i = n - 1 - np.argmin(candidates[::-1])
+            min_j = row_arg[min_i]
+            min_dist = float(dm[min_i, min_j])
 
             # create clade
             clade1 = clades[min_i]
             clade2 = clades[min_j]
-            inner_count += 1
             inner_clade = BaseTree.Clade(None, "Inner" + str(inner_count))
             inner_clade.clades.append(clade1)
             inner_clade.clades.append(clade2)
             # assign branch length
-            clade1.branch_length = min_dist * 1.0 / 2 - self._height_of(clade1)
-            clade2.branch_length = min_dist * 1.0 / 2 - self._height_of(clade2)
+            clade1.branch_length = min_dist * 1.0 / 2 - float(heights[min_i])
+            clade2.branch_length = min_dist * 1.0 / 2 - float(heights[min_j])
+            heights[min_j] = max(
+                heights[min_i] + clade1.branch_length,
+                heights[min_j] + clade2.branch_length,
+            )
 
             # update node list
             clades[min_j] = inner_clade
-            del clades[min_i]
+            clades[min_i] = None
+            active[min_i] = False
 
-            # rebuild distance matrix,
+            # update distance matrix,
             # set the distances of new node at the index of min_j
-            for k in range(0, len(dm)):
-                if k != min_i and k != min_j:
-                    dm[min_j, k] = (dm[min_i, k] + dm[min_j, k]) / 2
-
-            dm.names[min_j] = "Inner" + str(inner_count)
+            values = (dm[min_i] + dm[min_j]) / 2
+            values[min_j] = 0
+            dm[min_j, :] = values
+            dm[:, min_j] = values
+
+            # update the cached row minima affected by the merge
+            row_min[min_j], row_arg[min_j] = _last_minimum(
+                dm[min_j, :min_j], active[:min_j]
+            )
+            rows = np.flatnonzero(active[min_j + 1 :]) + min_j + 1
+            values = values[rows]
+            args = row_arg[rows]
+            stale = (args == min_i) | (args == min_j)
+            # in case of ties, keep the last column, as in a full scan
+            minima = row_min[rows]
+            better = ~stale & (
+                (values < minima) | ((values == minima) & (min_j > args))
+            )
+            row_min[rows[better]] = values[better]
+            row_arg[rows[better]] = min_j
+            for i in rows[stale]:
+                row_min[i], row_arg[i] = _last_minimum(dm[i, :i], active[:i])
 
-            del dm[min_i]
         inner_clade.branch_length = 0
         return BaseTree.Tree(inner_clade)
 
@@ -771,33 +1272,62 @@ class DistanceTreeConstructor(TreeConstructor):
             distance_matrix : DistanceMatrix
                 The distance matrix for tree construction.
 
+        """
+        return self._neighbor_joining(distance_matrix, _NJSearch)
+
+    def rapidnj(self, distance_matrix):
+        """Construct and return a Neighbor Joining tree using a bounded search.
+
+        This gives the same tree as ``nj``, but uses the bounded search of
+        RapidNJ (Simonsen et al., 2008) to find the pair of nodes to be
+        joined. Each row of the distance matrix is kept sorted, and is only
+        scanned as far as the remaining pairs may improve on the best pair
+        found so far. This is much faster than ``nj`` for large matrices
+        (thousands of taxa), at the cost of storing the sort order of the
+        distance matrix. As the row sums are updated incrementally, pairs
+        whose scores differ only by rounding errors may be joined in a
+        different order than by ``nj``.
+
+        :Parameters:
+            distance_matrix : DistanceMatrix
+                The distance matrix for tree construction.
+
+        """
+        return self._neighbor_joining(distance_matrix, _RapidNJSearch)
+
+    def _neighbor_joining(self, distance_matrix, search):
+        """Construct a Neighbor Joining tree with the given search (PRIVATE).
+
+        The distances are copied into a square array that is updated in place.
+        A joined node takes the position of the second node of the pair, and
+        the position of the first node is marked as inactive, such that the
+        order of the remaining nodes is kept. Inactive rows and columns are
+        set to zero, and removed when they make up half of the array.
+
+        The search argument is a class that is initialized with the distance
+        array. Its instances are called with the distance array, the mask of
+        active nodes, and the current number of nodes, and return the indices
+        i, j of the pair to join together with the node distances (the
+        average distance of each node to all other nodes).
         """
         if not isinstance(distance_matrix, DistanceMatrix):
             raise TypeError("Must provide a DistanceMatrix object.")
 
-        # make a copy of the distance matrix to be used
-        dm = copy.deepcopy(distance_matrix)
         # init terminal clades
-        clades = [BaseTree.Clade(None, name) for name in dm.names]
-        # init node distance
-        node_dist = [0] * len(dm)
-        # init minimum index
-        min_i = 0
-        min_j = 0
-        inner_count = 0
+        clades = [BaseTree.Clade(None, name) for name in distance_matrix.names]
         # special cases for Minimum Alignment Matrices
-        if len(dm) == 1:
+        if len(clades) == 1:
             root = clades[0]
 
             return BaseTree.Tree(root, rooted=False)
-        elif len(dm) == 2:
+        elif len(clades) == 2:
             # minimum distance will always be [1,0]
             min_i = 1
             min_j = 0
             clade1 = clades[min_i]
             clade2 = clades[min_j]
-            clade1.branch_length = dm[min_i, min_j] / 2.0
-            clade2.branch_length = dm[min_i, min_j] - clade1.branch_length
+            clade1.branch_length = distance_matrix[min_i, min_j] / 2.0
+            clade2.branch_length = distance_matrix[min_i, min_j] - clade1.branch_length
             inner_clade = BaseTree.Clade(None, "Inner")
             inner_clade.clades.append(clade1)
             inner_clade.clades.append(clade2)
@@ -805,25 +1335,14 @@ class DistanceTreeConstructor(TreeConstructor):
             root = clades[0]
 
             return BaseTree.Tree(root, rooted=False)
-        while len(dm) > 2:
-            # calculate nodeDist
-            for i in range(0, len(dm)):
-                node_dist[i] = 0
-                for j in range(0, len(dm)):
-                    node_dist[i] += dm[i, j]
-                node_dist[i] = node_dist[i] / (len(dm) - 2)
-
-            # find minimum distance pair
-            min_dist = dm[1, 0] - node_dist[1] - node_dist[0]
-            min_i = 0
-            min_j = 1
-            for i in range(1, len(dm)):
-                for j in range(0, i):
-                    temp = dm[i, j] - node_dist[i] - node_dist[j]
-                    if min_dist > temp:
-                        min_dist = temp
-                        min_i = i
-                        min_j = j
+        dm = np.array(distance_matrix, float)
+        active = np.ones(len(dm), bool)
+        search_class = search
+        search = search_class(dm)
+        inner_count = 0
+        m = len(dm)
+        while m > 2:
+            min_i, min_j, node_dist = search(dm, active, m)
             # create clade
             clade1 = clades[min_i]
             clade2 = clades[min_j]
@@ -832,35 +1351,49 @@ class DistanceTreeConstructor(TreeConstructor):
             inner_clade.clades.append(clade1)
             inner_clade.clades.append(clade2)
             # assign branch length
+            distance = float(dm[min_i, min_j])
             clade1.branch_length = (
-                dm[min_i, min_j] + node_dist[min_i] - node_dist[min_j]
+                distance + float(node_dist[min_i]) - float(node_dist[min_j])
             ) / 2.0
-            clade2.branch_length = dm[min_i, min_j] - clade1.branch_length
+            clade2.branch_length = distance - clade1.branch_length
 
             # update node list
             clades[min_j] = inner_clade
-            del clades[min_i]
+            clades[min_i] = None
 
-            # rebuild distance matrix,
+            # update distance matrix,
             # set the distances of new node at the index of min_j
-            for k in range(0, len(dm)):
-                if k != min_i and k != min_j:
-                    dm[min_j, k] = (
-                        dm[min_i, k] + dm[min_j, k] - dm[min_i, min_j]
-                    ) / 2.0
-
-            dm.names[min_j] = "Inner" + str(inner_count)
-            del dm[min_i]
+            values = (dm[min_i] + dm[min_j] - dm[min_i, min_j]) / 2.0
+            active[min_i] = False
+            values[~active] = 0
+            values[min_j] = 0
+            search.update(dm, active, min_i, min_j, values)
+            dm[min_i, :] = 0
+            dm[:, min_i] = 0
+            dm[min_j, :] = values
+            dm[:, min_j] = values
+            m -= 1
+
+            if m <= len(dm) // 2:
+                # remove the inactive rows and columns
+                indices = np.flatnonzero(active)
+                dm = dm[np.ix_(indices, indices)]
+                clades = [clades[i] for i in indices]
+                active = np.ones(m, bool)
+                search = search_class(dm)
 
         # set the last clade as one of the child of the inner_clade
+        i, j = np.flatnonzero(active)
+        distance = float(dm[j, i])
+        clades = [clades[i], clades[j]]
         root = None
         if clades[0] == inner_clade:
             clades[0].branch_length = 0
-            clades[1].branch_length = dm[1, 0]
+            clades[1].branch_length = distance
             clades[0].clades.append(clades[1])
             root = clades[0]
         else:
-            clades[0].branch_length = dm[1, 0]
+            clades[0].branch_length = distance
             clades[1].branch_length = 0
             clades[1].clades.append(clades[0])
             root = clades[1]
@@ -877,6 +1410,143 @@ class DistanceTreeConstructor(TreeConstructor):
         return height
 
 
+def _last_minimum(values, mask):
+    """Return the minimum of the values where mask is True, and its last index (PRIVATE)."""
+    values = np.where(mask, values, np.inf)
+    if len(values) == 0:
+        return np.inf, -1
+    index = len(values) - 1 - np.argmin(values[::-1])
+    return values[index], index
+
+
+def _first_pair_order(min_i, min_j, active):
+    """Return the indices of the pair to join in neighbor joining (PRIVATE).
+
+    The pair is found as the lower triangle element i, j with i > j; however,
+    if this is the pair of the first two active nodes, the nodes are swapped
+    for consistency with the previous implementation of neighbor joining.
+    """
+    first, second = np.flatnonzero(active)[:2]
+    if min_i == second and min_j == first:
+        return int(first), int(second)
+    return int(min_i), int(min_j)
+
+
+class _NJSearch:
+    """Search all pairs for the pair of nodes to join in neighbor joining (PRIVATE)."""
+
+    def __init__(self, dm):
+        """Store the mask of the upper triangle of the distance array (PRIVATE)."""
+        self.upper = np.triu(np.ones(dm.shape, bool))
+
+    def __call__(self, dm, active, m):
+        """Return the pair of nodes to join, and the node distances (PRIVATE)."""
+        # calculate nodeDist
+        node_dist = dm.sum(axis=1) / (m - 2)
+        node_dist[~active] = -np.inf
+        q = np.subtract(dm, node_dist[:, None])
+        q -= node_dist[None, :]
+        # only consider the lower triangle; take the first pair if tied
+        np.copyto(q, np.inf, where=self.upper)
+        min_i, min_j = np.unravel_index(np.argmin(q), q.shape)
+        return _first_pair_order(min_i, min_j, active) + (node_dist,)
+
+    def update(self, dm, active, min_i, min_j, values):
+        """Update the search for a joined pair; nothing to do here (PRIVATE)."""
+
+
+class _RapidNJSearch:
+    """Bounded search for the pair of nodes to join in neighbor joining (PRIVATE).
+
+    The sort order of each row of the distance matrix is stored. For each row
+    i, the columns j are visited in order of increasing distance, and the
+    search of a row stops as soon as the lower bound
+    d(i, j) - u(i) - max(u) of the neighbor joining criterion exceeds the best
+    value found so far, where u is the average distance of a node to all other
+    nodes. Rows are searched simultaneously, one sorted column at a time.
+
+    As the distances between existing nodes do not change in neighbor
+    joining, the sort order remains valid except for the columns of nodes
+    created after the row was sorted; these entries are skipped.
+    """
+
+    def __init__(self, dm):
+        """Sort the rows of the distance array (PRIVATE)."""
+        n = len(dm)
+        self.sums = dm.sum(axis=1)
+        order = dm.copy()
+        np.fill_diagonal(order, np.inf)
+        self.order = np.argsort(order, axis=1, kind="stable").astype(np.int32)
+        # the step at which the node in each position was created, and the
+        # step at which its row was sorted
+        self.created = np.zeros(n, int)
+        self.sorted = np.zeros(n, int)
+        self.step = 0
+        # number of sorted columns to visit at a time
+        self.width = 8
+
+    def __call__(self, dm, active, m):
+        """Return the pair of nodes to join, and the node distances (PRIVATE)."""
+        if m <= 64:
+            # Recalculate the row sums to avoid rounding errors; with few
+            # nodes left, ties are common (e.g. any two disjoint pairs of four
+            # nodes give the same value of the neighbor joining criterion).
+            self.sums = dm.sum(axis=1)
+        node_dist = self.sums / (m - 2)
+        max_dist = node_dist[active].max()
+        best = np.inf
+        best_i = best_j = -1
+        rows = np.flatnonzero(active)
+        n = len(dm)
+        width = self.width
+        for k in range(0, n, width):
+            if not rows.size:
+                break
+            # visit the next few columns of each row in sorted order
+            columns = self.order[rows, k : k + width]
+            starts = np.repeat(rows, columns.shape[1])
+            columns = columns.ravel()
+            valid = (
+                active[columns]
+                & (columns != starts)
+                & (self.created[columns] <= self.sorted[starts])
+            )
+            starts = starts[valid]
+            columns = columns[valid]
+            if not starts.size:
+                continue
+            distances = dm[starts, columns]
+            i = np.maximum(starts, columns)
+            j = np.minimum(starts, columns)
+            q = distances - node_dist[i] - node_dist[j]
+            value = q.min()
+            if value <= best:
+                # in case of ties, take the first pair in the lower triangle
+                indices = np.flatnonzero(q == value)
+                index = indices[np.lexsort((j[indices], i[indices]))[0]]
+                if value < best or (i[index], j[index]) < (best_i, best_j):
+                    best = value
+                    best_i = i[index]
+                    best_j = j[index]
+            # stop searching rows that cannot improve on the best pair
+            done = starts[distances - node_dist[starts] - max_dist > best]
+            if done.size:
+                rows = rows[~np.isin(rows, done, assume_unique=False)]
+        return _first_pair_order(best_i, best_j, active) + (node_dist,)
+
+    def update(self, dm, active, min_i, min_j, values):
+        """Update the row sums and sort order for a joined pair (PRIVATE)."""
+        self.step += 1
+        self.sums += values - dm[min_i] - dm[min_j]
+        self.sums[min_i] = 0
+        self.sums[min_j] = values.sum()
+        order = np.where(active, values, np.inf)
+        order[min_j] = np.inf
+        self.order[min_j] = np.argsort(order, kind="stable")
+        self.created[min_j] = self.step
+        self.sorted[min_j] = self.step
+
+
 # #################### Tree Scoring and Searching Classes #####################
 
 
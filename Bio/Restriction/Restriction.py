@@ -82,9 +82,12 @@ Notes about the diverses class of the restriction enzyme implementation::
 
 """
 
+import collections
+import functools
 import itertools
 import re
 import string
+import threading
 import warnings
 
 from Bio import BiopythonWarning
@@ -627,7 +630,7 @@ class AbstractCut(RestrictionType):
         Equischizomer: same site, same position of restriction.
         """
         if not batch:
-            batch = AllEnzymes
+            batch = _get_batch("AllEnzymes")
         r = [x for x in batch if not cls != x]
         i = r.index(cls)
         del r[i]
@@ -644,7 +647,7 @@ class AbstractCut(RestrictionType):
         Neoschizomer: same site, different position of restriction.
         """
         if not batch:
-            batch = AllEnzymes
+            batch = _get_batch("AllEnzymes")
         r = sorted(x for x in batch if cls >> x)
         return r
 
@@ -656,7 +659,7 @@ class AbstractCut(RestrictionType):
         If batch is supplied it is used instead of the default AllEnzymes.
         """
         if not batch:
-            batch = AllEnzymes
+            batch = _get_batch("AllEnzymes")
         r = [x for x in batch if (cls >> x) or (not cls != x)]
         i = r.index(cls)
         del r[i]
@@ -972,7 +975,18 @@ class Palindromic(AbstractCut):
         Implement the search method for palindromic enzymes.
         """
         siteloc = cls.dna.finditer(cls.compsite, cls.size)
-        cls.results = [r for s, g in siteloc for r in cls._modify(s)]
+        return cls._cut_sites([s for s, g in siteloc], [])
+
+    @classmethod
+    def _cut_sites(cls, starts, rev_starts):
+        """Return the cutting sites for the sites found in the sequence (PRIVATE).
+
+        For internal use only.
+
+        starts is the sorted list of the locations of the recognition site in
+        cls.dna. As the site is palindromic, rev_starts is ignored.
+        """
+        cls.results = [r for s in starts for r in cls._modify(s)]
         if cls.results:
             cls._drop()
         return cls.results
@@ -1001,17 +1015,30 @@ class NonPalindromic(AbstractCut):
         Implement the search method for non palindromic enzymes.
         """
         iterator = cls.dna.finditer(cls.compsite, cls.size)
-        cls.results = []
-        modif = cls._modify
-        revmodif = cls._rev_modify
         s = str(cls)
-        cls.on_minus = []
-
+        starts = []
+        rev_starts = []
         for start, group in iterator:
             if group(s):
-                cls.results += list(modif(start))
+                starts.append(start)
             else:
-                cls.on_minus += list(revmodif(start))
+                rev_starts.append(start)
+        return cls._cut_sites(starts, rev_starts)
+
+    @classmethod
+    def _cut_sites(cls, starts, rev_starts):
+        """Return the cutting sites for the sites found in the sequence (PRIVATE).
+
+        For internal use only.
+
+        starts and rev_starts are the sorted lists of the locations in cls.dna
+        of the recognition site on the current and on the antiparallel strand,
+        respectively. A location should not be in both lists.
+        """
+        modif = cls._modify
+        revmodif = cls._rev_modify
+        cls.results = [r for start in starts for r in modif(start)]
+        cls.on_minus = [r for start in rev_starts for r in revmodif(start)]
         cls.results += cls.on_minus
 
         if cls.results:
@@ -1234,8 +1261,8 @@ class Blunt(AbstractCut):
     def compatible_end(cls, batch=None):
         """List all enzymes that produce compatible ends for the enzyme."""
         if not batch:
-            batch = AllEnzymes
-        r = sorted(x for x in iter(AllEnzymes) if x.is_blunt())
+            batch = _get_batch("AllEnzymes")
+        r = sorted(x for x in iter(batch) if x.is_blunt())
         return r
 
     @staticmethod
@@ -1364,8 +1391,8 @@ class Ov5(AbstractCut):
     def compatible_end(cls, batch=None):
         """List all enzymes that produce compatible ends for the enzyme."""
         if not batch:
-            batch = AllEnzymes
-        r = sorted(x for x in iter(AllEnzymes) if x.is_5overhang() and x % cls)
+            batch = _get_batch("AllEnzymes")
+        r = sorted(x for x in iter(batch) if x.is_5overhang() and x % cls)
         return r
 
     @classmethod
@@ -1497,8 +1524,8 @@ class Ov3(AbstractCut):
     def compatible_end(cls, batch=None):
         """List all enzymes that produce compatible ends for the enzyme."""
         if not batch:
-            batch = AllEnzymes
-        r = sorted(x for x in iter(AllEnzymes) if x.is_3overhang() and x % cls)
+            batch = _get_batch("AllEnzymes")
+        r = sorted(x for x in iter(batch) if x.is_3overhang() and x % cls)
         return r
 
     @classmethod
@@ -1985,13 +2012,260 @@ class Not_available(AbstractCut):
 ###############################################################################
 
 
+def _site_tokens(pattern):
+    """Split the regular expression of a recognition site (PRIVATE).
+
+    Return a list with, for each position of the site, a string with the
+    nucleotides that are allowed at that position, or None if any letter
+    is allowed (the site has an N at that position).
+    """
+    tokens = []
+    for token in re.findall(r"\[[^]]*\]|.", pattern):
+        if token == ".":
+            tokens.append(None)
+            continue
+        letters = token.strip("[]")
+        if not letters or letters.strip("ACGT"):
+            raise ValueError(f"unexpected {token!r} in recognition site {pattern!r}")
+        tokens.append(letters)
+    return tokens
+
+
+def _site_key(tokens, max_expansions=256):
+    """Select the part of a recognition site used as key in the automaton (PRIVATE).
+
+    Return the start and end of the longest stretch of the site without an N
+    which expands to at most max_expansions nucleotide sequences. If all
+    positions are N, start and end are equal.
+    """
+    best = (0, 0)
+    best_count = 0
+    for start in range(len(tokens)):
+        count = 1
+        for end in range(start, len(tokens)):
+            letters = tokens[end]
+            if letters is None:
+                break
+            count *= len(letters)
+            if count > max_expansions:
+                break
+            length = end + 1 - start
+            if length > best[1] - best[0] or (
+                length == best[1] - best[0] and count < best_count
+            ):
+                best = (start, end + 1)
+                best_count = count
+    return best
+
+
+class SiteMatcher:
+    """Find the recognition sites of many enzymes in a single pass.
+
+    Searching a sequence with a ``RestrictionBatch`` runs the regular
+    expression of each enzyme over the sequence separately. Instead,
+    ``SiteMatcher`` builds one Aho-Corasick automaton for the recognition
+    sites of all enzymes, on both strands, expanding the ambiguous
+    nucleotides in the sites. The automaton finds the sites of all enzymes in
+    a single pass over the sequence; the regular expression of an enzyme is
+    then only used to check candidate sites if the site contains an N or
+    many ambiguous nucleotides.
+
+    >>> from Bio.Seq import Seq
+    >>> from Bio.Restriction import EcoRI, BamHI, BsaI, SiteMatcher
+    >>> matcher = SiteMatcher([EcoRI, BamHI, BsaI])
+    >>> seq = Seq("GAATTCAAGGATCCAAAAAAAAGAGACCAAAAAAAAAGGTCTCAAAAAAAAAA")
+    >>> sites = matcher.search(seq)
+    >>> for enzyme in sorted(sites):
+    ...     print(enzyme, sites[enzyme])
+    ...
+    BamHI [10]
+    BsaI [18, 45]
+    EcoRI [2]
+
+    The result is the same as for ``RestrictionBatch.search``, which uses a
+    ``SiteMatcher`` automatically for larger batches of enzymes.
+    """
+
+    # Nucleotide codes in the automaton; anything other than ACGT resets it.
+    _codes = bytes("ACGT".find(chr(c)) if chr(c) in "ACGT" else 4 for c in range(256))
+
+    def __init__(self, enzymes):
+        """Build the automaton for the recognition sites of the enzymes."""
+        self.enzymes = list(enzymes)
+        # enzymes whose sites can not be handled by the automaton
+        self._others = set()
+        # recognition sites, each stored as (enzyme, forward, regex, exact)
+        self._sites = []
+        keys = []
+        for enzyme in self.enzymes:
+            try:
+                keys.extend(self._add_enzyme(enzyme))
+            except (AttributeError, ValueError):
+                self._others.add(enzyme)
+        self._build(keys)
+
+    def _add_enzyme(self, enzyme):
+        """Store the recognition sites of an enzyme (PRIVATE).
+
+        Return a list of (index, tokens, distance) tuples for the keys to be
+        added to the automaton, where index is the index of the site in
+        self._sites, and distance is the distance from the start of the site
+        to the last letter of the key.
+        """
+        name = str(enzyme)
+        groups = re.findall(r"\(\?=\(\?P<(\w+)>([^()]*)\)\)", enzyme.compsite.pattern)
+        if "|".join(f"(?=(?P<{n}>{p}))" for n, p in groups) != enzyme.compsite.pattern:
+            raise ValueError(f"cannot parse recognition site of {name}")
+        keys = []
+        for group, pattern in groups:
+            if group == name:
+                forward = True
+            elif group == name + "_as":
+                forward = False
+            else:
+                raise ValueError(f"cannot parse recognition site of {name}")
+            tokens = _site_tokens(pattern)
+            if len(tokens) != enzyme.size:
+                raise ValueError(f"inconsistent size for {name}")
+            start, end = _site_key(tokens)
+            if start == end:
+                raise ValueError(f"recognition site of {name} has no key")
+            exact = end - start == len(tokens)
+            index = len(self._sites)
+            self._sites.append((enzyme, forward, re.compile(pattern), exact))
+            keys.append((index, tokens[start:end], end - 1))
+        return keys
+
+    def _build(self, keys):
+        """Build the automaton as a transition table (PRIVATE)."""
+        # trie of all keys, with all ambiguous nucleotides expanded
+        children = [{}]
+        outputs = [[]]
+        for index, tokens, distance in keys:
+            for key in itertools.product(*tokens):
+                node = 0
+                for letter in key:
+                    code = "ACGT".index(letter)
+                    child = children[node].get(code)
+                    if child is None:
+                        child = len(children)
+                        children[node][code] = child
+                        children.append({})
+                        outputs.append([])
+                    node = child
+                outputs[node].append((index, distance))
+        # Breadth-first calculation of the failure links, which are folded
+        # into the transition table
+        transitions = [[0] * 5 for node in children]
+        fail = [0] * len(children)
+        queue = collections.deque(children[0].values())
+        for code, child in children[0].items():
+            transitions[0][code] = child
+        while queue:
+            node = queue.popleft()
+            outputs[node].extend(outputs[fail[node]])
+            for code in range(4):
+                child = children[node].get(code)
+                if child is None:
+                    transitions[node][code] = transitions[fail[node]][code]
+                else:
+                    fail[child] = transitions[fail[node]][code]
+                    transitions[node][code] = child
+                    queue.append(child)
+        # Number the states such that all states with output come last,
+        # and store the transitions in a flat list indexed by 5 * state + code
+        order = sorted(range(len(children)), key=lambda node: bool(outputs[node]))
+        number = [0] * len(order)
+        for i, node in enumerate(order):
+            number[node] = 5 * i
+        self._transitions = [
+            number[target] for node in order for target in transitions[node]
+        ]
+        self._outputs = {number[node]: outputs[node] for node in order if outputs[node]}
+        self._first_output = 5 * (len(order) - len(self._outputs))
+        self._max_size = max((len(enzyme) for enzyme in self.enzymes), default=0)
+
+    def search(self, dna, linear=True):
+        """Return a dictionary of the cutting sites in the sequence for all enzymes.
+
+        dna must be a ``Bio.Seq.Seq``, ``Bio.Seq.MutableSeq`` or
+        ``FormattedSeq`` instance. If dna is a ``FormattedSeq``, linear is
+        ignored. The keys of the dictionary are the enzymes, and the values
+        are the lists of cutting sites as returned by the ``search`` method of
+        the enzymes.
+        """
+        if isinstance(dna, FormattedSeq):
+            fseq = dna
+        else:
+            fseq = FormattedSeq(dna, linear)
+        length = len(fseq)
+        if fseq.is_linear():
+            data = fseq.data
+        else:
+            data = fseq.data + fseq.data[1 : self._max_size]
+        codes = data.encode("ASCII").translate(self._codes)
+        transitions = self._transitions
+        first_output = self._first_output
+        state = 0
+        ends = []
+        states = []
+        for end, code in enumerate(codes):
+            state = transitions[state + code]
+            if state >= first_output:
+                ends.append(end)
+                states.append(state)
+        outputs = self._outputs
+        candidates = [[] for site in self._sites]
+        for end, state in zip(ends, states):
+            for index, distance in outputs[state]:
+                candidates[index].append(end - distance)
+        starts = {}
+        for (enzyme, forward, regex, exact), locations in zip(self._sites, candidates):
+            if not fseq.is_linear():
+                # sites may extend at most size - 1 letters beyond the end
+                last = length + min(length, enzyme.size - 1) - enzyme.size + 1
+                locations = [start for start in locations if start <= last]
+            if not exact:
+                locations = [
+                    start
+                    for start in locations
+                    if start >= 0 and regex.match(data, start)
+                ]
+            starts[enzyme, forward] = locations
+        mapping = {}
+        for enzyme in self.enzymes:
+            if enzyme in self._others:
+                mapping[enzyme] = enzyme.search(fseq)
+                continue
+            forward = starts.get((enzyme, True), [])
+            reverse = starts.get((enzyme, False), [])
+            if forward and reverse:
+                # A site found on both strands at the same location is
+                # reported for the current strand only, as for the regular
+                # expression search.
+                found = set(forward)
+                reverse = [start for start in reverse if start not in found]
+            enzyme.dna = fseq
+            mapping[enzyme] = enzyme._cut_sites(forward, reverse)
+        return mapping
+
+
+@functools.lru_cache(maxsize=8)
+def _site_matcher(enzymes):
+    """Return a SiteMatcher for a frozenset of enzymes (PRIVATE).
+
+    Building the automaton for all enzymes takes some time, so it is cached.
+    """
+    return SiteMatcher(enzymes)
+
+
 class RestrictionBatch(set):
     """Class for operations on more than one enzyme."""
 
     def __init__(self, first=(), suppliers=()):
         """Initialize empty RB or pre-fill with enzymes (from supplier)."""
         first = [self.format(x) for x in first]
-        first += [eval(x) for n in suppliers for x in suppliers_dict[n][1]]
+        first += [_get_enzyme(x) for n in suppliers for x in suppliers_dict[n][1]]
         set.__init__(self, first)
         self.mapping = dict.fromkeys(self)
         self.already_mapped = None
@@ -2079,7 +2353,7 @@ class RestrictionBatch(set):
         supplier = suppliers_dict[letter]
         self.suppliers.append(letter)
         for x in supplier[1]:
-            self.add_nocheck(eval(x))
+            self.add_nocheck(_get_enzyme(x))
 
     def current_suppliers(self):
         """List the current suppliers for the restriction batch.
@@ -2134,26 +2408,21 @@ class RestrictionBatch(set):
         """Evaluate enzyme (name) and return it (as RestrictionType).
 
         If y is a RestrictionType return y.
-        If y can be evaluated to a RestrictionType return eval(y).
+        If y is the name of a RestrictionType return the enzyme.
         Raise a ValueError in all other case.
         """
-        try:
-            if isinstance(y, RestrictionType):
-                return y
-            elif isinstance(eval(str(y)), RestrictionType):
-                return eval(y)
-        except (NameError, SyntaxError):
-            pass
+        if isinstance(y, RestrictionType):
+            return y
+        elif str(y) in _enzyme_types:
+            return _get_enzyme(str(y))
         raise ValueError(f"{y.__class__} is not a RestrictionType")
 
     def is_restriction(self, y):
         """Return if enzyme (name) is a known enzyme.
 
-        True if y or eval(y) is a RestrictionType.
+        True if y is a RestrictionType or the name of one.
         """
-        return isinstance(y, RestrictionType) or isinstance(
-            eval(str(y)), RestrictionType
-        )
+        return isinstance(y, RestrictionType) or str(y) in _enzyme_types
 
     def split(self, *classes, **bool):
         """Extract enzymes of a certain class and put in new RestrictionBatch.
@@ -2230,17 +2499,29 @@ class RestrictionBatch(set):
             else:
                 self.already_mapped = str(dna), linear
                 fseq = FormattedSeq(dna, linear)
-                self.mapping = {x: x.search(fseq) for x in self}
+                self.mapping = self._search(fseq)
                 return self.mapping
         elif isinstance(dna, FormattedSeq):
             if (str(dna), dna.linear) == self.already_mapped:
                 return self.mapping
             else:
                 self.already_mapped = str(dna), dna.linear
-                self.mapping = {x: x.search(dna) for x in self}
+                self.mapping = self._search(dna)
                 return self.mapping
         raise TypeError(f"Expected Seq or MutableSeq instance, got {type(dna)} instead")
 
+    def _search(self, fseq):
+        """Return a dict of cutting sites in the FormattedSeq (PRIVATE).
+
+        For a few enzymes, each enzyme searches the sequence on its own. For
+        larger batches, a SiteMatcher finds the sites of all enzymes in a
+        single pass over the sequence.
+        """
+        if len(self) < 4:
+            return {x: x.search(fseq) for x in self}
+        results = _site_matcher(frozenset(self)).search(fseq)
+        return {x: results[x] for x in self}
+
 
 ###############################################################################
 #                                                                             #
@@ -2434,7 +2715,7 @@ class Analysis(RestrictionBatch, PrintFormat):
     def with_name(self, names, dct=None):
         """Return only results from enzymes which names are listed."""
         for i, enzyme in enumerate(names):
-            if enzyme not in AllEnzymes:
+            if enzyme not in _get_batch("AllEnzymes"):
                 warnings.warn(f"no data for the enzyme: {enzyme}", BiopythonWarning)
                 del names[i]
         if not dct:
@@ -2554,9 +2835,8 @@ class Analysis(RestrictionBatch, PrintFormat):
 
 
 #
-#   The restriction enzyme classes are created dynamically when the module is
-#   imported. Here is the magic which allow the creation of the
-#   restriction-enzyme classes.
+#   The restriction enzyme classes are created dynamically. Here is the magic
+#   which allow the creation of the restriction-enzyme classes.
 #
 #   The reason for the two dictionaries in Restriction_Dictionary
 #   one for the types (which will be called pseudo-type as they really
@@ -2564,75 +2844,121 @@ class Analysis(RestrictionBatch, PrintFormat):
 #   and one for the enzymes is efficiency as the bases are evaluated
 #   once per pseudo-type.
 #
-#   However Restriction is still a very inefficient module at import. But
-#   remember that around 660 classes (which is more or less the size of Rebase)
-#   have to be created dynamically. However, this processing take place only
-#   once.
-#   This inefficiency is however largely compensated by the use of metaclass
-#   which provide a very efficient layout for the class themselves mostly
-#   alleviating the need of if/else loops in the class methods.
+#   Creating around 1000 classes (which is more or less the size of Rebase)
+#   takes time, so an enzyme class is only created when it is first used,
+#   through the module __getattr__ below. The batches AllEnzymes, CommOnly
+#   and NonComm are likewise only created on first use. Once created, the
+#   enzymes and batches are stored in the module namespace, so that each
+#   enzyme is a single object which can be compared by identity.
 #
-#   It is essential to run Restriction with doc string optimisation (-OO
-#   switch) as the doc string of 660 classes take a lot of processing.
+#   The metaclass provides a very efficient layout for the class themselves
+#   mostly alleviating the need of if/else loops in the class methods.
 #
-CommOnly = RestrictionBatch()  # commercial enzymes
-NonComm = RestrictionBatch()  # not available commercially
-for TYPE, (bases, enzymes) in typedict.items():
-    #
-    #   The keys are the pseudo-types TYPE (stored as type1, type2...)
-    #   The names are not important and are only present to differentiate
-    #   the keys in the dict. All the pseudo-types are in fact RestrictionType.
-    #   These names will not be used after and the pseudo-types are not
-    #   kept in the locals() dictionary. It is therefore impossible to
-    #   import them.
-    #   Now, if you have look at the dictionary, you will see that not all the
-    #   types are present as those without corresponding enzymes have been
-    #   removed by Dictionary_Builder().
-    #
-    #   The values are tuples which contain
-    #   as first element a tuple of bases (as string) and
-    #   as second element the names of the enzymes.
-    #
-    #   First eval the bases.
-    #
-    bases2 = tuple(eval(x) for x in bases)
-    #
-    #   now create the particular value of RestrictionType for the classes
-    #   in enzymes.
-    #
-    T = type.__new__(RestrictionType, "RestrictionType", bases2, {})
-    for k in enzymes:
+#   The keys of typedict are the pseudo-types TYPE (stored as type1, type2...)
+#   The names are not important and are only present to differentiate the
+#   keys in the dict. The values are tuples which contain as first element a
+#   tuple of bases (as string) and as second element the names of the
+#   enzymes.
+#
+_enzyme_types = {
+    k: TYPE for TYPE, (bases, enzymes) in typedict.items() for k in enzymes
+}
+_pseudo_types = {}
+_batch_names = ("AllEnzymes", "CommOnly", "NonComm")
+_lock = threading.RLock()
+
+
+def _get_enzyme(name):
+    """Return the restriction enzyme with the given name (PRIVATE).
+
+    The enzyme class is created on first use. Raise a KeyError if there is
+    no enzyme with that name.
+    """
+    TYPE = _enzyme_types[name]
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name in globals():  # created by another thread
+            return globals()[name]
+        try:
+            T, bases2 = _pseudo_types[TYPE]
+        except KeyError:
+            #
+            #   Create the particular value of RestrictionType for the
+            #   enzymes of this pseudo-type. These are not kept in the
+            #   module namespace; it is therefore impossible to import them.
+            #
+            bases = typedict[TYPE][0]
+            bases2 = tuple(globals()[x] for x in bases)
+            T = type.__new__(RestrictionType, "RestrictionType", bases2, {})
+            _pseudo_types[TYPE] = (T, bases2)
         #
-        #   Now, we go through all the enzymes and assign them their type.
-        #   enzymedict[k] contains the values of the attributes for this
+        #   enzymedict[name] contains the values of the attributes for this
         #   particular class (self.site, self.ovhg,....).
         #
-        newenz = T(k, bases2, enzymedict[k])
-        #
-        #   we add the enzymes to the corresponding batch.
-        #
-        #   No need to verify the enzyme is a RestrictionType -> add_nocheck
-        #
-        if newenz.is_comm():
-            CommOnly.add_nocheck(newenz)
+        enzyme = T(name, bases2, enzymedict[name])
+        globals()[name] = enzyme
+        return enzyme
+
+
+def _get_batch(name):
+    """Return the batch AllEnzymes, CommOnly, or NonComm (PRIVATE).
+
+    The batch, and all the enzymes in it, are created on first use.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name in globals():  # created by another thread
+            return globals()[name]
+        if name == "AllEnzymes":
+            #
+            #   AllEnzymes is a RestrictionBatch with all the enzymes from
+            #   Rebase.
+            #
+            batch = RestrictionBatch(_get_batch("CommOnly"))
+            batch.update(_get_batch("NonComm"))
         else:
-            NonComm.add_nocheck(newenz)
-#
-#   AllEnzymes is a RestrictionBatch with all the enzymes from Rebase.
-#
-AllEnzymes = RestrictionBatch(CommOnly)
-AllEnzymes.update(NonComm)
-#
-#   Now, place the enzymes in locals so they can be imported.
-#
-names = [str(x) for x in AllEnzymes]
-locals().update(dict(zip(names, AllEnzymes)))
+            #
+            #   CommOnly contains the commercial enzymes, NonComm the
+            #   enzymes not available commercially.
+            #   No need to verify the enzyme is a RestrictionType ->
+            #   add_nocheck
+            #
+            comm = name == "CommOnly"
+            batch = RestrictionBatch()
+            for k in _enzyme_types:
+                enzyme = _get_enzyme(k)
+                if enzyme.is_comm() == comm:
+                    batch.add_nocheck(enzyme)
+        globals()[name] = batch
+        return batch
+
+
+def __getattr__(name):
+    """Create restriction enzymes and the pre-made batches on first use."""
+    if name in _enzyme_types:
+        return _get_enzyme(name)
+    elif name in _batch_names:
+        return _get_batch(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Return the names in the module, including all restriction enzymes."""
+    return sorted(set(globals()).union(_enzyme_types, _batch_names))
+
+
 __all__ = (
     "FormattedSeq",
+    "SiteMatcher",
     "Analysis",
     "RestrictionBatch",
-    "AllEnzymes",
-    "CommOnly",
-    "NonComm",
-) + tuple(names)
-del k, enzymes, TYPE, bases, bases2, names
+    "AllEnzymes",  # noqa: F822
+    "CommOnly",  # noqa: F822
+    "NonComm",  # noqa: F822
+) + tuple(_enzyme_types)
@@ -15,23948 +15,1108 @@
 Used REBASE emboss files version 404 (2024).
 """
 
-rest_dict = {}
-
-rest_dict["AanI"] = {
-    "charac": (3, -3, None, None, "TTATAA"),
-    "compsite": "(?=(?P<AanI>TTATAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 15358,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTATAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:15358",
-}
-
-rest_dict["AarI"] = {
-    "charac": (11, 8, None, None, "CACCTGC"),
-    "compsite": "(?=(?P<AarI>CACCTGC))|(?=(?P<AarI_as>GCAGGTG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": 8,
-    "fst5": 11,
-    "id": 2892,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACCTGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2892",
-}
-
-rest_dict["AasI"] = {
-    "charac": (7, -7, None, None, "GACNNNNNNGTC"),
-    "compsite": "(?=(?P<AasI>GAC......GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 5465,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNNNGTC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:5465",
-}
-
-rest_dict["AatII"] = {
-    "charac": (5, -5, None, None, "GACGTC"),
-    "compsite": "(?=(?P<AatII>GACGTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 7,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "ACGT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACGTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "K", "M", "N", "V"),
-    "uri": "https://identifiers.org/rebase:7",
-}
-
-rest_dict["Aba13301I"] = {
-    "charac": (None, None, None, None, "GCAAAC"),
-    "compsite": "(?=(?P<Aba13301I>GCAAAC))|(?=(?P<Aba13301I_as>GTTTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 375383,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAAAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:375383",
-}
-
-rest_dict["Aba6411II"] = {
-    "charac": (None, None, None, None, "CRRTAAG"),
-    "compsite": "(?=(?P<Aba6411II>C[AG][AG]TAAG))|(?=(?P<Aba6411II_as>CTTA[CT][CT]G))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 101759,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRRTAAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:101759",
-}
-
-rest_dict["AbaB8342IV"] = {
-    "charac": (None, None, None, None, "CATTAG"),
-    "compsite": "(?=(?P<AbaB8342IV>CATTAG))|(?=(?P<AbaB8342IV_as>CTAATG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 126502,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATTAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:126502",
-}
-
-rest_dict["AbaCIII"] = {
-    "charac": (None, None, None, None, "CTATCAV"),
-    "compsite": "(?=(?P<AbaCIII>CTATCA[ACG]))|(?=(?P<AbaCIII_as>[CGT]TGATAG))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 23309,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTATCAV",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:23309",
-}
-
-rest_dict["AbaPBA3II"] = {
-    "charac": (None, None, None, None, "CAYGAC"),
-    "compsite": "(?=(?P<AbaPBA3II>CA[CT]GAC))|(?=(?P<AbaPBA3II_as>GTC[AG]TG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 443064,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAYGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:443064",
-}
-
-rest_dict["AbaSI"] = {
-    "charac": (12, 9, None, None, "C"),
-    "compsite": "(?=(?P<AbaSI>C))|(?=(?P<AbaSI_as>G))",
-    "dna": None,
-    "freq": 4.0,
-    "fst3": 9,
-    "fst5": 12,
-    "id": 23265,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "C",
-    "size": 1,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:23265",
-}
-
-rest_dict["AbaUMB2I"] = {
-    "charac": (None, None, None, None, "YCCGSS"),
-    "compsite": "(?=(?P<AbaUMB2I>[CT]CCG[CG][CG]))|(?=(?P<AbaUMB2I_as>[CG][CG]CGG[AG]))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 30399,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YCCGSS",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:30399",
-}
-
-rest_dict["Abr4036II"] = {
-    "charac": (None, None, None, None, "GRTYGACC"),
-    "compsite": "(?=(?P<Abr4036II>G[AG]T[CT]GACC))|(?=(?P<Abr4036II_as>GGTC[AG]A[CT]C))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 312254,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRTYGACC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:312254",
-}
-
-rest_dict["AbsI"] = {
-    "charac": (2, -2, None, None, "CCTCGAGG"),
-    "compsite": "(?=(?P<AbsI>CCTCGAGG))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 14594,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TCGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTCGAGG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:14594",
-}
-
-rest_dict["Acc16I"] = {
-    "charac": (3, -3, None, None, "TGCGCA"),
-    "compsite": "(?=(?P<Acc16I>TGCGCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2638,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGCGCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2638",
-}
-
-rest_dict["Acc36I"] = {
-    "charac": (10, 8, None, None, "ACCTGC"),
-    "compsite": "(?=(?P<Acc36I>ACCTGC))|(?=(?P<Acc36I_as>GCAGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 8,
-    "fst5": 10,
-    "id": 4162,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCTGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:4162",
-}
-
-rest_dict["Acc65I"] = {
-    "charac": (1, -1, None, None, "GGTACC"),
-    "compsite": "(?=(?P<Acc65I>GGTACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 14,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTACC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:14",
-}
-
-rest_dict["Acc65V"] = {
-    "charac": (None, None, None, None, "GACGCA"),
-    "compsite": "(?=(?P<Acc65V>GACGCA))|(?=(?P<Acc65V_as>TGCGTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 152525,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACGCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:152525",
-}
-
-rest_dict["AccB1I"] = {
-    "charac": (1, -1, None, None, "GGYRCC"),
-    "compsite": "(?=(?P<AccB1I>GG[CT][AG]CC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 15,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GYRC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGYRCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:15",
-}
-
-rest_dict["AccB7I"] = {
-    "charac": (7, -7, None, None, "CCANNNNNTGG"),
-    "compsite": "(?=(?P<AccB7I>CCA.....TGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 16,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCANNNNNTGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:16",
-}
-
-rest_dict["AccBSI"] = {
-    "charac": (3, -3, None, None, "CCGCTC"),
-    "compsite": "(?=(?P<AccBSI>CCGCTC))|(?=(?P<AccBSI_as>GAGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2733,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2733",
-}
-
-rest_dict["AccI"] = {
-    "charac": (2, -2, None, None, "GTMKAC"),
-    "compsite": "(?=(?P<AccI>GT[AC][GT]AC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 18,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "MK",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTMKAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "M", "N", "Q", "X"),
-    "uri": "https://identifiers.org/rebase:18",
-}
-
-rest_dict["AccII"] = {
-    "charac": (2, -2, None, None, "CGCG"),
-    "compsite": "(?=(?P<AccII>CGCG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 19,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("J", "K"),
-    "uri": "https://identifiers.org/rebase:19",
-}
-
-rest_dict["AccIII"] = {
-    "charac": (1, -1, None, None, "TCCGGA"),
-    "compsite": "(?=(?P<AccIII>TCCGGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 20,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "K"),
-    "uri": "https://identifiers.org/rebase:20",
-}
-
-rest_dict["AccIX"] = {
-    "charac": (None, None, None, None, "GACRAC"),
-    "compsite": "(?=(?P<AccIX>GAC[AG]AC))|(?=(?P<AccIX_as>GT[CT]GTC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 278986,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACRAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:278986",
-}
-
-rest_dict["AccX"] = {
-    "charac": (None, None, None, None, "GGARCA"),
-    "compsite": "(?=(?P<AccX>GGA[AG]CA))|(?=(?P<AccX_as>TG[CT]TCC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 278990,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGARCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:278990",
-}
-
-rest_dict["AceIII"] = {
-    "charac": (13, 11, None, None, "CAGCTC"),
-    "compsite": "(?=(?P<AceIII>CAGCTC))|(?=(?P<AceIII_as>GAGCTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 11,
-    "fst5": 13,
-    "id": 2569,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2569",
-}
-
-rest_dict["AchA6III"] = {
-    "charac": (None, None, None, None, "AGCCAG"),
-    "compsite": "(?=(?P<AchA6III>AGCCAG))|(?=(?P<AchA6III_as>CTGGCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 19867,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:19867",
-}
-
-rest_dict["AciI"] = {
-    "charac": (1, -1, None, None, "CCGC"),
-    "compsite": "(?=(?P<AciI>CCGC))|(?=(?P<AciI_as>GCGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 21,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:21",
-}
-
-rest_dict["AclI"] = {
-    "charac": (2, -2, None, None, "AACGTT"),
-    "compsite": "(?=(?P<AclI>AACGTT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2181,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AACGTT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:2181",
-}
-
-rest_dict["AclWI"] = {
-    "charac": (9, 5, None, None, "GGATC"),
-    "compsite": "(?=(?P<AclWI>GGATC))|(?=(?P<AclWI_as>GATCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 9,
-    "id": 2668,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2668",
-}
-
-rest_dict["Aco12261II"] = {
-    "charac": (None, None, None, None, "CCRGAG"),
-    "compsite": "(?=(?P<Aco12261II>CC[AG]GAG))|(?=(?P<Aco12261II_as>CTC[CT]GG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 25209,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCRGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:25209",
-}
-
-rest_dict["AcoI"] = {
-    "charac": (1, -1, None, None, "YGGCCR"),
-    "compsite": "(?=(?P<AcoI>[CT]GGCC[AG]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 11822,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YGGCCR",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:11822",
-}
-
-rest_dict["AcoY31II"] = {
-    "charac": (None, None, None, None, "TAGCRAB"),
-    "compsite": "(?=(?P<AcoY31II>TAGC[AG]A[CGT]))|(?=(?P<AcoY31II_as>[ACG]T[CT]GCTA))",
-    "dna": None,
-    "freq": 2730.6666666666665,
-    "fst3": None,
-    "fst5": None,
-    "id": 250928,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TAGCRAB",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:250928",
-}
-
-rest_dict["AcsI"] = {
-    "charac": (1, -1, None, None, "RAATTY"),
-    "compsite": "(?=(?P<AcsI>[AG]AATT[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2184,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RAATTY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2184",
-}
-
-rest_dict["AcuI"] = {
-    "charac": (22, 14, None, None, "CTGAAG"),
-    "compsite": "(?=(?P<AcuI>CTGAAG))|(?=(?P<AcuI_as>CTTCAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 14,
-    "fst5": 22,
-    "id": 5534,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTGAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:5534",
-}
-
-rest_dict["AcvI"] = {
-    "charac": (3, -3, None, None, "CACGTG"),
-    "compsite": "(?=(?P<AcvI>CACGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 5359,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("Q", "X"),
-    "uri": "https://identifiers.org/rebase:5359",
-}
-
-rest_dict["AcyI"] = {
-    "charac": (2, -2, None, None, "GRCGYC"),
-    "compsite": "(?=(?P<AcyI>G[AG]CG[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 31,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRCGYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J",),
-    "uri": "https://identifiers.org/rebase:31",
-}
-
-rest_dict["AdeI"] = {
-    "charac": (6, -6, None, None, "CACNNNGTG"),
-    "compsite": "(?=(?P<AdeI>CAC...GTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 2991,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACNNNGTG",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2991",
-}
-
-rest_dict["Adh6U21I"] = {
-    "charac": (None, None, None, None, "GAANCAG"),
-    "compsite": "(?=(?P<Adh6U21I>GAA.CAG))|(?=(?P<Adh6U21I_as>CTG.TTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 214041,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAANCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:214041",
-}
-
-rest_dict["AfaI"] = {
-    "charac": (2, -2, None, None, "GTAC"),
-    "compsite": "(?=(?P<AfaI>GTAC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 37,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTAC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:37",
-}
-
-rest_dict["AfeI"] = {
-    "charac": (3, -3, None, None, "AGCGCT"),
-    "compsite": "(?=(?P<AfeI>AGCGCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2669,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCGCT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:2669",
-}
-
-rest_dict["AfiI"] = {
-    "charac": (7, -7, None, None, "CCNNNNNNNGG"),
-    "compsite": "(?=(?P<AfiI>CC.......GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 10489,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNNNNNNNGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:10489",
-}
-
-rest_dict["AflII"] = {
-    "charac": (1, -1, None, None, "CTTAAG"),
-    "compsite": "(?=(?P<AflII>CTTAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 39,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TTAA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "K", "N"),
-    "uri": "https://identifiers.org/rebase:39",
-}
-
-rest_dict["AflIII"] = {
-    "charac": (1, -1, None, None, "ACRYGT"),
-    "compsite": "(?=(?P<AflIII>AC[AG][CT]GT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 40,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CRYG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACRYGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("M", "N", "S"),
-    "uri": "https://identifiers.org/rebase:40",
-}
-
-rest_dict["AgeI"] = {
-    "charac": (1, -1, None, None, "ACCGGT"),
-    "compsite": "(?=(?P<AgeI>ACCGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 42,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCGGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "N", "R"),
-    "uri": "https://identifiers.org/rebase:42",
-}
-
-rest_dict["AgsI"] = {
-    "charac": (3, -3, None, None, "TTSAA"),
-    "compsite": "(?=(?P<AgsI>TT[CG]AA))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 19404,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "S",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTSAA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:19404",
-}
-
-rest_dict["AhaIII"] = {
-    "charac": (3, -3, None, None, "TTTAAA"),
-    "compsite": "(?=(?P<AhaIII>TTTAAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 47,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTTAAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:47",
-}
-
-rest_dict["AhdI"] = {
-    "charac": (6, -6, None, None, "GACNNNNNGTC"),
-    "compsite": "(?=(?P<AhdI>GAC.....GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 48,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNNGTC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:48",
-}
-
-rest_dict["AhlI"] = {
-    "charac": (1, -1, None, None, "ACTAGT"),
-    "compsite": "(?=(?P<AhlI>ACTAGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 4838,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACTAGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4838",
-}
-
-rest_dict["AhyRBAHI"] = {
-    "charac": (None, None, None, None, "GCYYGAC"),
-    "compsite": "(?=(?P<AhyRBAHI>GC[CT][CT]GAC))|(?=(?P<AhyRBAHI_as>GTC[AG][AG]GC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 89839,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCYYGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:89839",
-}
-
-rest_dict["AhyYL17I"] = {
-    "charac": (None, None, None, None, "YAAMGAG"),
-    "compsite": "(?=(?P<AhyYL17I>[CT]AA[AC]GAG))|(?=(?P<AhyYL17I_as>CTC[GT]TT[AG]))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 82738,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YAAMGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:82738",
-}
-
-rest_dict["AjiI"] = {
-    "charac": (3, -3, None, None, "CACGTC"),
-    "compsite": "(?=(?P<AjiI>CACGTC))|(?=(?P<AjiI_as>GACGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 10919,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:10919",
-}
-
-rest_dict["AjnI"] = {
-    "charac": (0, 0, None, None, "CCWGG"),
-    "compsite": "(?=(?P<AjnI>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 7185,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCWGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:7185",
-}
-
-rest_dict["AjuI"] = {
-    "charac": (-7, -26, 25, 6, "GAANNNNNNNTTGG"),
-    "compsite": "(?=(?P<AjuI>GAA.......TTGG))|(?=(?P<AjuI_as>CCAA.......TTC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": -26,
-    "fst5": -7,
-    "id": 7740,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 6,
-    "scd5": 25,
-    "site": "GAANNNNNNNTTGG",
-    "size": 14,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:7740",
-}
-
-rest_dict["AleI"] = {
-    "charac": (5, -5, None, None, "CACNNNNGTG"),
-    "compsite": "(?=(?P<AleI>CAC....GTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 5791,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACNNNNGTG",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:5791",
-}
-
-rest_dict["AlfI"] = {
-    "charac": (-10, -24, 24, 10, "GCANNNNNNTGC"),
-    "compsite": "(?=(?P<AlfI>GCA......TGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -24,
-    "fst5": -10,
-    "id": 6110,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": 10,
-    "scd5": 24,
-    "site": "GCANNNNNNTGC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:6110",
-}
-
-rest_dict["AloI"] = {
-    "charac": (-7, -25, 25, 7, "GAACNNNNNNTCC"),
-    "compsite": "(?=(?P<AloI>GAAC......TCC))|(?=(?P<AloI_as>GGA......GTTC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": -25,
-    "fst5": -7,
-    "id": 2812,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 7,
-    "scd5": 25,
-    "site": "GAACNNNNNNTCC",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2812",
-}
-
-rest_dict["AluBI"] = {
-    "charac": (2, -2, None, None, "AGCT"),
-    "compsite": "(?=(?P<AluBI>AGCT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 16189,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:16189",
-}
-
-rest_dict["AluI"] = {
-    "charac": (2, -2, None, None, "AGCT"),
-    "compsite": "(?=(?P<AluI>AGCT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 61,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:61",
-}
-
-rest_dict["Alw21I"] = {
-    "charac": (5, -5, None, None, "GWGCWC"),
-    "compsite": "(?=(?P<Alw21I>G[AT]GC[AT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 62,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "WGCW",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GWGCWC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:62",
-}
-
-rest_dict["Alw26I"] = {
-    "charac": (6, 5, None, None, "GTCTC"),
-    "compsite": "(?=(?P<Alw26I>GTCTC))|(?=(?P<Alw26I_as>GAGAC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 6,
-    "id": 63,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTCTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:63",
-}
-
-rest_dict["Alw44I"] = {
-    "charac": (1, -1, None, None, "GTGCAC"),
-    "compsite": "(?=(?P<Alw44I>GTGCAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 64,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTGCAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J"),
-    "uri": "https://identifiers.org/rebase:64",
-}
-
-rest_dict["AlwFI"] = {
-    "charac": (None, None, None, None, "GAAAYNNNNNRTG"),
-    "compsite": "(?=(?P<AlwFI>GAAA[CT].....[AG]TG))|(?=(?P<AlwFI_as>CA[CT].....[AG]TTTC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 7655,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAAYNNNNNRTG",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:7655",
-}
-
-rest_dict["AlwI"] = {
-    "charac": (9, 5, None, None, "GGATC"),
-    "compsite": "(?=(?P<AlwI>GGATC))|(?=(?P<AlwI_as>GATCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 9,
-    "id": 65,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:65",
-}
-
-rest_dict["AlwNI"] = {
-    "charac": (6, -6, None, None, "CAGNNNCTG"),
-    "compsite": "(?=(?P<AlwNI>CAG...CTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 66,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAGNNNCTG",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:66",
-}
-
-rest_dict["Ama87I"] = {
-    "charac": (1, -1, None, None, "CYCGRG"),
-    "compsite": "(?=(?P<Ama87I>C[CT]CG[AG]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 68,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "YCGR",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYCGRG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:68",
-}
-
-rest_dict["AmaCSI"] = {
-    "charac": (17, 9, None, None, "GCTCCA"),
-    "compsite": "(?=(?P<AmaCSI>GCTCCA))|(?=(?P<AmaCSI_as>TGGAGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 9,
-    "fst5": 17,
-    "id": 26714,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:26714",
-}
-
-rest_dict["Aod1I"] = {
-    "charac": (None, None, None, None, "GATCNAC"),
-    "compsite": "(?=(?P<Aod1I>GATC.AC))|(?=(?P<Aod1I_as>GT.GATC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 270415,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATCNAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:270415",
-}
-
-rest_dict["Aor13HI"] = {
-    "charac": (1, -1, None, None, "TCCGGA"),
-    "compsite": "(?=(?P<Aor13HI>TCCGGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2453,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:2453",
-}
-
-rest_dict["Aor51HI"] = {
-    "charac": (3, -3, None, None, "AGCGCT"),
-    "compsite": "(?=(?P<Aor51HI>AGCGCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 76,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCGCT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:76",
-}
-
-rest_dict["AoxI"] = {
-    "charac": (0, 0, None, None, "GGCC"),
-    "compsite": "(?=(?P<AoxI>GGCC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 29052,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:29052",
-}
-
-rest_dict["ApaBI"] = {
-    "charac": (8, -8, None, None, "GCANNNNNTGC"),
-    "compsite": "(?=(?P<ApaBI>GCA.....TGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -8,
-    "fst5": 8,
-    "id": 81,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCANNNNNTGC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:81",
-}
-
-rest_dict["ApaI"] = {
-    "charac": (5, -5, None, None, "GGGCCC"),
-    "compsite": "(?=(?P<ApaI>GGGCCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 84,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGCCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "J", "K", "M", "N", "Q", "R", "V", "X"),
-    "uri": "https://identifiers.org/rebase:84",
-}
-
-rest_dict["ApaLI"] = {
-    "charac": (1, -1, None, None, "GTGCAC"),
-    "compsite": "(?=(?P<ApaLI>GTGCAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 85,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTGCAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C", "K", "N"),
-    "uri": "https://identifiers.org/rebase:85",
-}
-
-rest_dict["ApeKI"] = {
-    "charac": (1, -1, None, None, "GCWGC"),
-    "compsite": "(?=(?P<ApeKI>GC[AT]GC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 6397,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "CWG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCWGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:6397",
-}
-
-rest_dict["ApoI"] = {
-    "charac": (1, -1, None, None, "RAATTY"),
-    "compsite": "(?=(?P<ApoI>[AG]AATT[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 89,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RAATTY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:89",
-}
-
-rest_dict["ApyPI"] = {
-    "charac": (26, 18, None, None, "ATCGAC"),
-    "compsite": "(?=(?P<ApyPI>ATCGAC))|(?=(?P<ApyPI_as>GTCGAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 14756,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATCGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:14756",
-}
-
-rest_dict["AquII"] = {
-    "charac": (27, 18, None, None, "GCCGNAC"),
-    "compsite": "(?=(?P<AquII>GCCG.AC))|(?=(?P<AquII_as>GT.CGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 27,
-    "id": 20238,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGNAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:20238",
-}
-
-rest_dict["AquIII"] = {
-    "charac": (26, 18, None, None, "GAGGAG"),
-    "compsite": "(?=(?P<AquIII>GAGGAG))|(?=(?P<AquIII_as>CTCCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 20239,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:20239",
-}
-
-rest_dict["AquIV"] = {
-    "charac": (26, 17, None, None, "GRGGAAG"),
-    "compsite": "(?=(?P<AquIV>G[AG]GGAAG))|(?=(?P<AquIV_as>CTTCC[CT]C))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": 17,
-    "fst5": 26,
-    "id": 20240,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRGGAAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:20240",
-}
-
-rest_dict["ArsI"] = {
-    "charac": (-8, -26, 24, 6, "GACNNNNNNTTYG"),
-    "compsite": "(?=(?P<ArsI>GAC......TT[CT]G))|(?=(?P<ArsI_as>C[AG]AA......GTC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -26,
-    "fst5": -8,
-    "id": 19405,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 6,
-    "scd5": 24,
-    "site": "GACNNNNNNTTYG",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:19405",
-}
-
-rest_dict["AscI"] = {
-    "charac": (2, -2, None, None, "GGCGCGCC"),
-    "compsite": "(?=(?P<AscI>GGCGCGCC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 95,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCGCC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:95",
-}
-
-rest_dict["AseI"] = {
-    "charac": (2, -2, None, None, "ATTAAT"),
-    "compsite": "(?=(?P<AseI>ATTAAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 96,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATTAAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "N"),
-    "uri": "https://identifiers.org/rebase:96",
-}
-
-rest_dict["Asi256I"] = {
-    "charac": (1, -1, None, None, "GATC"),
-    "compsite": "(?=(?P<Asi256I>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 18472,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:18472",
-}
-
-rest_dict["AsiGI"] = {
-    "charac": (1, -1, None, None, "ACCGGT"),
-    "compsite": "(?=(?P<AsiGI>ACCGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 10828,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCGGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:10828",
-}
-
-rest_dict["AsiSI"] = {
-    "charac": (5, -5, None, None, "GCGATCGC"),
-    "compsite": "(?=(?P<AsiSI>GCGATCGC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 4628,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGATCGC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:4628",
-}
-
-rest_dict["Asl11923II"] = {
-    "charac": (None, None, None, None, "GGGABCC"),
-    "compsite": "(?=(?P<Asl11923II>GGGA[CGT]CC))|(?=(?P<Asl11923II_as>GG[ACG]TCCC))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 288754,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGABCC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:288754",
-}
-
-rest_dict["Asp103I"] = {
-    "charac": (None, None, None, None, "CGRAGGC"),
-    "compsite": "(?=(?P<Asp103I>CG[AG]AGGC))|(?=(?P<Asp103I_as>GCCT[CT]CG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 226699,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGRAGGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:226699",
-}
-
-rest_dict["Asp114pII"] = {
-    "charac": (None, None, None, None, "AGCABCC"),
-    "compsite": "(?=(?P<Asp114pII>AGCA[CGT]CC))|(?=(?P<Asp114pII_as>GG[ACG]TGCT))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 183955,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCABCC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:183955",
-}
-
-rest_dict["Asp337I"] = {
-    "charac": (None, None, None, None, "CARABGG"),
-    "compsite": "(?=(?P<Asp337I>CA[AG]A[CGT]GG))|(?=(?P<Asp337I_as>CC[ACG]T[CT]TG))",
-    "dna": None,
-    "freq": 2730.6666666666665,
-    "fst3": None,
-    "fst5": None,
-    "id": 313892,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CARABGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:313892",
-}
-
-rest_dict["Asp700I"] = {
-    "charac": (5, -5, None, None, "GAANNNNTTC"),
-    "compsite": "(?=(?P<Asp700I>GAA....TTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 127,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAANNNNTTC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("M",),
-    "uri": "https://identifiers.org/rebase:127",
-}
-
-rest_dict["Asp718I"] = {
-    "charac": (1, -1, None, None, "GGTACC"),
-    "compsite": "(?=(?P<Asp718I>GGTACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 132,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTACC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("M", "S"),
-    "uri": "https://identifiers.org/rebase:132",
-}
-
-rest_dict["AspA2I"] = {
-    "charac": (1, -1, None, None, "CCTAGG"),
-    "compsite": "(?=(?P<AspA2I>CCTAGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 6959,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTAGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:6959",
-}
-
-rest_dict["AspAMDIV"] = {
-    "charac": (None, None, None, None, "ACCCAC"),
-    "compsite": "(?=(?P<AspAMDIV>ACCCAC))|(?=(?P<AspAMDIV_as>GTGGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 333117,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCCAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:333117",
-}
-
-rest_dict["AspBHI"] = {
-    "charac": (13, 12, None, None, "YSCNS"),
-    "compsite": "(?=(?P<AspBHI>[CT][CG]C.[CG]))|(?=(?P<AspBHI_as>[CG].G[CG][AG]))",
-    "dna": None,
-    "freq": 32.0,
-    "fst3": 12,
-    "fst5": 13,
-    "id": 21321,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YSCNS",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:21321",
-}
-
-rest_dict["AspDUT2V"] = {
-    "charac": (None, None, None, None, "GNGCAAC"),
-    "compsite": "(?=(?P<AspDUT2V>G.GCAAC))|(?=(?P<AspDUT2V_as>GTTGC.C))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 142406,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GNGCAAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:142406",
-}
-
-rest_dict["AspJHL3II"] = {
-    "charac": (None, None, None, None, "CGCCCAG"),
-    "compsite": "(?=(?P<AspJHL3II>CGCCCAG))|(?=(?P<AspJHL3II_as>CTGGGCG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 67384,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCCCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:67384",
-}
-
-rest_dict["AspLEI"] = {
-    "charac": (3, -3, None, None, "GCGC"),
-    "compsite": "(?=(?P<AspLEI>GCGC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2670,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2670",
-}
-
-rest_dict["AspNIH4III"] = {
-    "charac": (None, None, None, None, "AAGAACB"),
-    "compsite": "(?=(?P<AspNIH4III>AAGAAC[CGT]))|(?=(?P<AspNIH4III_as>[ACG]GTTCTT))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 231703,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AAGAACB",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:231703",
-}
-
-rest_dict["AspS9I"] = {
-    "charac": (1, -1, None, None, "GGNCC"),
-    "compsite": "(?=(?P<AspS9I>GG.CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2737,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2737",
-}
-
-rest_dict["AspSLV7III"] = {
-    "charac": (None, None, None, None, "GTCTCA"),
-    "compsite": "(?=(?P<AspSLV7III>GTCTCA))|(?=(?P<AspSLV7III_as>TGAGAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 144656,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTCTCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:144656",
-}
-
-rest_dict["Asu14238IV"] = {
-    "charac": (None, None, None, None, "CGTRAC"),
-    "compsite": "(?=(?P<Asu14238IV>CGT[AG]AC))|(?=(?P<Asu14238IV_as>GT[CT]ACG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 48969,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGTRAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:48969",
-}
-
-rest_dict["AsuC2I"] = {
-    "charac": (2, -2, None, None, "CCSGG"),
-    "compsite": "(?=(?P<AsuC2I>CC[CG]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2901,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "S",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCSGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2901",
-}
-
-rest_dict["AsuHPI"] = {
-    "charac": (13, 7, None, None, "GGTGA"),
-    "compsite": "(?=(?P<AsuHPI>GGTGA))|(?=(?P<AsuHPI_as>TCACC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 7,
-    "fst5": 13,
-    "id": 2811,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTGA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2811",
-}
-
-rest_dict["AsuI"] = {
-    "charac": (1, -1, None, None, "GGNCC"),
-    "compsite": "(?=(?P<AsuI>GG.CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 153,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:153",
-}
-
-rest_dict["AsuII"] = {
-    "charac": (2, -2, None, None, "TTCGAA"),
-    "compsite": "(?=(?P<AsuII>TTCGAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 154,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTCGAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:154",
-}
-
-rest_dict["AsuNHI"] = {
-    "charac": (1, -1, None, None, "GCTAGC"),
-    "compsite": "(?=(?P<AsuNHI>GCTAGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2854,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2854",
-}
-
-rest_dict["AteTI"] = {
-    "charac": (None, None, None, None, "GGGRAG"),
-    "compsite": "(?=(?P<AteTI>GGG[AG]AG))|(?=(?P<AteTI_as>CT[CT]CCC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 21623,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:21623",
-}
-
-rest_dict["AvaI"] = {
-    "charac": (1, -1, None, None, "CYCGRG"),
-    "compsite": "(?=(?P<AvaI>C[CT]CG[AG]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 165,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "YCGR",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYCGRG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "N", "Q", "X"),
-    "uri": "https://identifiers.org/rebase:165",
-}
-
-rest_dict["AvaII"] = {
-    "charac": (1, -1, None, None, "GGWCC"),
-    "compsite": "(?=(?P<AvaII>GG[AT]CC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 166,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGWCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("J", "N", "X"),
-    "uri": "https://identifiers.org/rebase:166",
-}
-
-rest_dict["AvaIII"] = {
-    "charac": (None, None, None, None, "ATGCAT"),
-    "compsite": "(?=(?P<AvaIII>ATGCAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 167,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATGCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:167",
-}
-
-rest_dict["Avi249I"] = {
-    "charac": (None, None, None, None, "CTGCA"),
-    "compsite": "(?=(?P<Avi249I>CTGCA))|(?=(?P<Avi249I_as>TGCAG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 625880,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTGCA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:625880",
-}
-
-rest_dict["AvrII"] = {
-    "charac": (1, -1, None, None, "CCTAGG"),
-    "compsite": "(?=(?P<AvrII>CCTAGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 173,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTAGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:173",
-}
-
-rest_dict["Awo1030IV"] = {
-    "charac": (None, None, None, None, "GCCRAG"),
-    "compsite": "(?=(?P<Awo1030IV>GCC[AG]AG))|(?=(?P<Awo1030IV_as>CT[CT]GGC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 45794,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:45794",
-}
-
-rest_dict["AxyI"] = {
-    "charac": (2, -2, None, None, "CCTNAGG"),
-    "compsite": "(?=(?P<AxyI>CCT.AGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 174,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNAGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("J",),
-    "uri": "https://identifiers.org/rebase:174",
-}
-
-rest_dict["BaeGI"] = {
-    "charac": (5, -5, None, None, "GKGCMC"),
-    "compsite": "(?=(?P<BaeGI>G[GT]GC[AC]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 16983,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "KGCM",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GKGCMC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:16983",
-}
-
-rest_dict["BaeI"] = {
-    "charac": (-10, -26, 23, 7, "ACNNNNGTAYC"),
-    "compsite": "(?=(?P<BaeI>AC....GTA[CT]C))|(?=(?P<BaeI_as>G[AG]TAC....GT))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -26,
-    "fst5": -10,
-    "id": 179,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 7,
-    "scd5": 23,
-    "site": "ACNNNNGTAYC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:179",
-}
-
-rest_dict["Bag18758I"] = {
-    "charac": (None, None, None, None, "CCCGAG"),
-    "compsite": "(?=(?P<Bag18758I>CCCGAG))|(?=(?P<Bag18758I_as>CTCGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 77520,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:77520",
-}
-
-rest_dict["BalI"] = {
-    "charac": (3, -3, None, None, "TGGCCA"),
-    "compsite": "(?=(?P<BalI>TGGCCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 183,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGGCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "Q", "X"),
-    "uri": "https://identifiers.org/rebase:183",
-}
-
-rest_dict["BamHI"] = {
-    "charac": (1, -1, None, None, "GGATCC"),
-    "compsite": "(?=(?P<BamHI>GGATCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 185,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:185",
-}
-
-rest_dict["BanI"] = {
-    "charac": (1, -1, None, None, "GGYRCC"),
-    "compsite": "(?=(?P<BanI>GG[CT][AG]CC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 190,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GYRC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGYRCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:190",
-}
-
-rest_dict["BanII"] = {
-    "charac": (5, -5, None, None, "GRGCYC"),
-    "compsite": "(?=(?P<BanII>G[AG]GC[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 191,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "RGCY",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRGCYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K", "N", "X"),
-    "uri": "https://identifiers.org/rebase:191",
-}
-
-rest_dict["BanLI"] = {
-    "charac": (None, None, None, None, "RTCAGG"),
-    "compsite": "(?=(?P<BanLI>[AG]TCAGG))|(?=(?P<BanLI_as>CCTGA[CT]))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 73422,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RTCAGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:73422",
-}
-
-rest_dict["BarI"] = {
-    "charac": (-7, -25, 25, 7, "GAAGNNNNNNTAC"),
-    "compsite": "(?=(?P<BarI>GAAG......TAC))|(?=(?P<BarI_as>GTA......CTTC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": -25,
-    "fst5": -7,
-    "id": 16190,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 7,
-    "scd5": 25,
-    "site": "GAAGNNNNNNTAC",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:16190",
-}
-
-rest_dict["Bau1417V"] = {
-    "charac": (None, None, None, None, "GTTCAG"),
-    "compsite": "(?=(?P<Bau1417V>GTTCAG))|(?=(?P<Bau1417V_as>CTGAAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 292899,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:292899",
-}
-
-rest_dict["BauI"] = {
-    "charac": (1, -1, None, None, "CACGAG"),
-    "compsite": "(?=(?P<BauI>CACGAG))|(?=(?P<BauI_as>CTCGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 7455,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "ACGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:7455",
-}
-
-rest_dict["Bbr52II"] = {
-    "charac": (None, None, None, None, "GGCGAG"),
-    "compsite": "(?=(?P<Bbr52II>GGCGAG))|(?=(?P<Bbr52II_as>CTCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 163590,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:163590",
-}
-
-rest_dict["Bbr57III"] = {
-    "charac": (None, None, None, None, "GTRAAYG"),
-    "compsite": "(?=(?P<Bbr57III>GT[AG]AA[CT]G))|(?=(?P<Bbr57III_as>C[AG]TT[CT]AC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 184356,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTRAAYG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:184356",
-}
-
-rest_dict["Bbr7017II"] = {
-    "charac": (None, None, None, None, "CGGGAG"),
-    "compsite": "(?=(?P<Bbr7017II>CGGGAG))|(?=(?P<Bbr7017II_as>CTCCCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 63078,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:63078",
-}
-
-rest_dict["Bbr7017III"] = {
-    "charac": (None, None, None, None, "GGRCAG"),
-    "compsite": "(?=(?P<Bbr7017III>GG[AG]CAG))|(?=(?P<Bbr7017III_as>CTG[CT]CC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 62650,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGRCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:62650",
-}
-
-rest_dict["BbrPI"] = {
-    "charac": (3, -3, None, None, "CACGTG"),
-    "compsite": "(?=(?P<BbrPI>CACGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 211,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("M",),
-    "uri": "https://identifiers.org/rebase:211",
-}
-
-rest_dict["BbsI"] = {
-    "charac": (8, 6, None, None, "GAAGAC"),
-    "compsite": "(?=(?P<BbsI>GAAGAC))|(?=(?P<BbsI_as>GTCTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 6,
-    "fst5": 8,
-    "id": 212,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:212",
-}
-
-rest_dict["BbuB31I"] = {
-    "charac": (None, None, None, None, "GNAAYG"),
-    "compsite": "(?=(?P<BbuB31I>G.AA[CT]G))|(?=(?P<BbuB31I_as>C[AG]TT.C))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 4697,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GNAAYG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4697",
-}
-
-rest_dict["BbuB31II"] = {
-    "charac": (None, None, None, None, "CGRKA"),
-    "compsite": "(?=(?P<BbuB31II>CG[AG][GT]A))|(?=(?P<BbuB31II_as>T[AC][CT]CG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 4248,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGRKA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4248",
-}
-
-rest_dict["Bbv12I"] = {
-    "charac": (5, -5, None, None, "GWGCWC"),
-    "compsite": "(?=(?P<Bbv12I>G[AT]GC[AT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 214,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "WGCW",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GWGCWC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:214",
-}
-
-rest_dict["BbvCI"] = {
-    "charac": (2, -2, None, None, "CCTCAGC"),
-    "compsite": "(?=(?P<BbvCI>CCTCAGC))|(?=(?P<BbvCI_as>GCTGAGG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 3098,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTCAGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:3098",
-}
-
-rest_dict["BbvI"] = {
-    "charac": (13, 12, None, None, "GCAGC"),
-    "compsite": "(?=(?P<BbvI>GCAGC))|(?=(?P<BbvI_as>GCTGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 12,
-    "fst5": 13,
-    "id": 220,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:220",
-}
-
-rest_dict["BbvII"] = {
-    "charac": (8, 6, None, None, "GAAGAC"),
-    "compsite": "(?=(?P<BbvII>GAAGAC))|(?=(?P<BbvII_as>GTCTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 6,
-    "fst5": 8,
-    "id": 221,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:221",
-}
-
-rest_dict["BccI"] = {
-    "charac": (9, 5, None, None, "CCATC"),
-    "compsite": "(?=(?P<BccI>CCATC))|(?=(?P<BccI_as>GATGG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 9,
-    "id": 226,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCATC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:226",
-}
-
-rest_dict["Bce10661III"] = {
-    "charac": (None, None, None, None, "TATCNAG"),
-    "compsite": "(?=(?P<Bce10661III>TATC.AG))|(?=(?P<Bce10661III_as>CT.GATA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 420286,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TATCNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:420286",
-}
-
-rest_dict["Bce3081I"] = {
-    "charac": (None, None, None, None, "TAGGAG"),
-    "compsite": "(?=(?P<Bce3081I>TAGGAG))|(?=(?P<Bce3081I_as>CTCCTA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 34295,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TAGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:34295",
-}
-
-rest_dict["Bce83I"] = {
-    "charac": (22, 14, None, None, "CTTGAG"),
-    "compsite": "(?=(?P<Bce83I>CTTGAG))|(?=(?P<Bce83I_as>CTCAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 14,
-    "fst5": 22,
-    "id": 2162,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2162",
-}
-
-rest_dict["BceAI"] = {
-    "charac": (17, 14, None, None, "ACGGC"),
-    "compsite": "(?=(?P<BceAI>ACGGC))|(?=(?P<BceAI_as>GCCGT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 14,
-    "fst5": 17,
-    "id": 4686,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4686",
-}
-
-rest_dict["BceSIV"] = {
-    "charac": (-7, -10, 14, 11, "GCAGC"),
-    "compsite": "(?=(?P<BceSIV>GCAGC))|(?=(?P<BceSIV_as>GCTGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -10,
-    "fst5": -7,
-    "id": 24953,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": 11,
-    "scd5": 14,
-    "site": "GCAGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:24953",
-}
-
-rest_dict["BcefI"] = {
-    "charac": (17, 13, None, None, "ACGGC"),
-    "compsite": "(?=(?P<BcefI>ACGGC))|(?=(?P<BcefI_as>GCCGT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 13,
-    "fst5": 17,
-    "id": 237,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:237",
-}
-
-rest_dict["BcgI"] = {
-    "charac": (-10, -24, 24, 10, "CGANNNNNNTGC"),
-    "compsite": "(?=(?P<BcgI>CGA......TGC))|(?=(?P<BcgI_as>GCA......TCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -24,
-    "fst5": -10,
-    "id": 238,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": 10,
-    "scd5": 24,
-    "site": "CGANNNNNNTGC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:238",
-}
-
-rest_dict["BciT130I"] = {
-    "charac": (2, -2, None, None, "CCWGG"),
-    "compsite": "(?=(?P<BciT130I>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 37575,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "W",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:37575",
-}
-
-rest_dict["BciVI"] = {
-    "charac": (12, 5, None, None, "GTATCC"),
-    "compsite": "(?=(?P<BciVI>GTATCC))|(?=(?P<BciVI_as>GGATAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 5,
-    "fst5": 12,
-    "id": 2885,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTATCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2885",
-}
-
-rest_dict["BclI"] = {
-    "charac": (1, -1, None, None, "TGATCA"),
-    "compsite": "(?=(?P<BclI>TGATCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 242,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGATCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "J", "M", "N", "O", "R", "S"),
-    "uri": "https://identifiers.org/rebase:242",
-}
-
-rest_dict["BcnI"] = {
-    "charac": (2, -2, None, None, "CCSGG"),
-    "compsite": "(?=(?P<BcnI>CC[CG]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 244,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "S",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCSGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:244",
-}
-
-rest_dict["Bco11035III"] = {
-    "charac": (None, None, None, None, "GAAGCY"),
-    "compsite": "(?=(?P<Bco11035III>GAAGC[CT]))|(?=(?P<Bco11035III_as>[AG]GCTTC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 380172,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:380172",
-}
-
-rest_dict["BcoDI"] = {
-    "charac": (6, 5, None, None, "GTCTC"),
-    "compsite": "(?=(?P<BcoDI>GTCTC))|(?=(?P<BcoDI_as>GAGAC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 6,
-    "id": 20174,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTCTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:20174",
-}
-
-rest_dict["BcuI"] = {
-    "charac": (1, -1, None, None, "ACTAGT"),
-    "compsite": "(?=(?P<BcuI>ACTAGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2990,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACTAGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2990",
-}
-
-rest_dict["BdaI"] = {
-    "charac": (-10, -24, 24, 10, "TGANNNNNNTCA"),
-    "compsite": "(?=(?P<BdaI>TGA......TCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -24,
-    "fst5": -10,
-    "id": 7508,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": 10,
-    "scd5": 24,
-    "site": "TGANNNNNNTCA",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:7508",
-}
-
-rest_dict["BetI"] = {
-    "charac": (1, -1, None, None, "WCCGGW"),
-    "compsite": "(?=(?P<BetI>[AT]CCGG[AT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 255,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "WCCGGW",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:255",
-}
-
-rest_dict["BfaI"] = {
-    "charac": (1, -1, None, None, "CTAG"),
-    "compsite": "(?=(?P<BfaI>CTAG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 256,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTAG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:256",
-}
-
-rest_dict["BfaSII"] = {
-    "charac": (None, None, None, None, "GANGGAG"),
-    "compsite": "(?=(?P<BfaSII>GA.GGAG))|(?=(?P<BfaSII_as>CTCC.TC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 11042,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GANGGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:11042",
-}
-
-rest_dict["BfiI"] = {
-    "charac": (11, 4, None, None, "ACTGGG"),
-    "compsite": "(?=(?P<BfiI>ACTGGG))|(?=(?P<BfiI_as>CCCAGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 4,
-    "fst5": 11,
-    "id": 2697,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACTGGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2697",
-}
-
-rest_dict["BfmI"] = {
-    "charac": (1, -1, None, None, "CTRYAG"),
-    "compsite": "(?=(?P<BfmI>CT[AG][CT]AG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2747,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TRYA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTRYAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2747",
-}
-
-rest_dict["BfoI"] = {
-    "charac": (5, -5, None, None, "RGCGCY"),
-    "compsite": "(?=(?P<BfoI>[AG]GCGC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 17995,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "GCGC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGCGCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:17995",
-}
-
-rest_dict["BfrI"] = {
-    "charac": (1, -1, None, None, "CTTAAG"),
-    "compsite": "(?=(?P<BfrI>CTTAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 259,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TTAA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("M", "S"),
-    "uri": "https://identifiers.org/rebase:259",
-}
-
-rest_dict["BfuAI"] = {
-    "charac": (10, 8, None, None, "ACCTGC"),
-    "compsite": "(?=(?P<BfuAI>ACCTGC))|(?=(?P<BfuAI_as>GCAGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 8,
-    "fst5": 10,
-    "id": 4687,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCTGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4687",
-}
-
-rest_dict["BfuI"] = {
-    "charac": (12, 5, None, None, "GTATCC"),
-    "compsite": "(?=(?P<BfuI>GTATCC))|(?=(?P<BfuI_as>GGATAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 5,
-    "fst5": 12,
-    "id": 4107,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTATCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4107",
-}
-
-rest_dict["Bga514I"] = {
-    "charac": (None, None, None, None, "GTRAAG"),
-    "compsite": "(?=(?P<Bga514I>GT[AG]AAG))|(?=(?P<Bga514I_as>CTT[CT]AC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 297545,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTRAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:297545",
-}
-
-rest_dict["BglI"] = {
-    "charac": (7, -7, None, None, "GCCNNNNNGGC"),
-    "compsite": "(?=(?P<BglI>GCC.....GGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 260,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCNNNNNGGC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "N", "O", "Q", "R", "V", "X"),
-    "uri": "https://identifiers.org/rebase:260",
-}
-
-rest_dict["BglII"] = {
-    "charac": (1, -1, None, None, "AGATCT"),
-    "compsite": "(?=(?P<BglII>AGATCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 261,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGATCT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X"),
-    "uri": "https://identifiers.org/rebase:261",
-}
-
-rest_dict["Bhe175II"] = {
-    "charac": (None, None, None, None, "GCCCNA"),
-    "compsite": "(?=(?P<Bhe175II>GCCC.A))|(?=(?P<Bhe175II_as>T.GGGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 628980,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCCNA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:628980",
-}
-
-rest_dict["BinI"] = {
-    "charac": (9, 5, None, None, "GGATC"),
-    "compsite": "(?=(?P<BinI>GGATC))|(?=(?P<BinI_as>GATCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 9,
-    "id": 265,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:265",
-}
-
-rest_dict["BisI"] = {
-    "charac": (2, -2, None, None, "GCNGC"),
-    "compsite": "(?=(?P<BisI>GC.GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10871,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:10871",
-}
-
-rest_dict["BkrAM31DI"] = {
-    "charac": (None, None, None, None, "RTTAAATM"),
-    "compsite": "(?=(?P<BkrAM31DI>[AG]TTAAAT[AC]))|(?=(?P<BkrAM31DI_as>[GT]ATTTAA[CT]))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 198858,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RTTAAATM",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:198858",
-}
-
-rest_dict["Ble402II"] = {
-    "charac": (None, None, None, None, "GRAGCAG"),
-    "compsite": "(?=(?P<Ble402II>G[AG]AGCAG))|(?=(?P<Ble402II_as>CTGCT[CT]C))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 69395,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRAGCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:69395",
-}
-
-rest_dict["BlnI"] = {
-    "charac": (1, -1, None, None, "CCTAGG"),
-    "compsite": "(?=(?P<BlnI>CCTAGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 275,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTAGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K", "M", "S"),
-    "uri": "https://identifiers.org/rebase:275",
-}
-
-rest_dict["BloAII"] = {
-    "charac": (None, None, None, None, "GAGGAC"),
-    "compsite": "(?=(?P<BloAII>GAGGAC))|(?=(?P<BloAII_as>GTCCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 57734,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:57734",
-}
-
-rest_dict["BlpI"] = {
-    "charac": (2, -2, None, None, "GCTNAGC"),
-    "compsite": "(?=(?P<BlpI>GCT.AGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2535,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTNAGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2535",
-}
-
-rest_dict["BlsI"] = {
-    "charac": (3, -3, None, None, "GCNGC"),
-    "compsite": "(?=(?P<BlsI>GC.GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 15186,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:15186",
-}
-
-rest_dict["BmcAI"] = {
-    "charac": (3, -3, None, None, "AGTACT"),
-    "compsite": "(?=(?P<BmcAI>AGTACT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 10484,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGTACT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:10484",
-}
-
-rest_dict["Bme1390I"] = {
-    "charac": (2, -2, None, None, "CCNGG"),
-    "compsite": "(?=(?P<Bme1390I>CC.GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2216,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2216",
-}
-
-rest_dict["Bme18I"] = {
-    "charac": (1, -1, None, None, "GGWCC"),
-    "compsite": "(?=(?P<Bme18I>GG[AT]CC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 286,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGWCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:286",
-}
-
-rest_dict["BmeDI"] = {
-    "charac": (3, 0, None, None, "C"),
-    "compsite": "(?=(?P<BmeDI>C))|(?=(?P<BmeDI_as>G))",
-    "dna": None,
-    "freq": 4.0,
-    "fst3": 0,
-    "fst5": 3,
-    "id": 25281,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "C",
-    "size": 1,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:25281",
-}
-
-rest_dict["BmeRI"] = {
-    "charac": (6, -6, None, None, "GACNNNNNGTC"),
-    "compsite": "(?=(?P<BmeRI>GAC.....GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 10486,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNNGTC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:10486",
-}
-
-rest_dict["BmeT110I"] = {
-    "charac": (1, -1, None, None, "CYCGRG"),
-    "compsite": "(?=(?P<BmeT110I>C[CT]CG[AG]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 11105,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "YCGR",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYCGRG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:11105",
-}
-
-rest_dict["BmgBI"] = {
-    "charac": (3, -3, None, None, "CACGTC"),
-    "compsite": "(?=(?P<BmgBI>CACGTC))|(?=(?P<BmgBI_as>GACGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 5041,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:5041",
-}
-
-rest_dict["BmgI"] = {
-    "charac": (None, None, None, None, "GKGCCC"),
-    "compsite": "(?=(?P<BmgI>G[GT]GCCC))|(?=(?P<BmgI_as>GGGC[AC]C))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 2578,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GKGCCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2578",
-}
-
-rest_dict["BmgT120I"] = {
-    "charac": (1, -1, None, None, "GGNCC"),
-    "compsite": "(?=(?P<BmgT120I>GG.CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 11106,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:11106",
-}
-
-rest_dict["BmiI"] = {
-    "charac": (3, -3, None, None, "GGNNCC"),
-    "compsite": "(?=(?P<BmiI>GG..CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 10481,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNNCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:10481",
-}
-
-rest_dict["BmrFI"] = {
-    "charac": (2, -2, None, None, "CCNGG"),
-    "compsite": "(?=(?P<BmrFI>CC.GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10485,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:10485",
-}
-
-rest_dict["BmrI"] = {
-    "charac": (11, 4, None, None, "ACTGGG"),
-    "compsite": "(?=(?P<BmrI>ACTGGG))|(?=(?P<BmrI_as>CCCAGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 4,
-    "fst5": 11,
-    "id": 2993,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACTGGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2993",
-}
-
-rest_dict["BmsI"] = {
-    "charac": (10, 9, None, None, "GCATC"),
-    "compsite": "(?=(?P<BmsI>GCATC))|(?=(?P<BmsI_as>GATGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 9,
-    "fst5": 10,
-    "id": 17981,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCATC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:17981",
-}
-
-rest_dict["BmtI"] = {
-    "charac": (5, -5, None, None, "GCTAGC"),
-    "compsite": "(?=(?P<BmtI>GCTAGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 6222,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:6222",
-}
-
-rest_dict["BmuI"] = {
-    "charac": (11, 4, None, None, "ACTGGG"),
-    "compsite": "(?=(?P<BmuI>ACTGGG))|(?=(?P<BmuI_as>CCCAGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 4,
-    "fst5": 11,
-    "id": 10875,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACTGGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:10875",
-}
-
-rest_dict["BoxI"] = {
-    "charac": (5, -5, None, None, "GACNNNNGTC"),
-    "compsite": "(?=(?P<BoxI>GAC....GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 3094,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNGTC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3094",
-}
-
-rest_dict["BpiI"] = {
-    "charac": (8, 6, None, None, "GAAGAC"),
-    "compsite": "(?=(?P<BpiI>GAAGAC))|(?=(?P<BpiI_as>GTCTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 6,
-    "fst5": 8,
-    "id": 2447,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2447",
-}
-
-rest_dict["BplI"] = {
-    "charac": (-8, -24, 24, 8, "GAGNNNNNCTC"),
-    "compsite": "(?=(?P<BplI>GAG.....CTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -24,
-    "fst5": -8,
-    "id": 2732,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 8,
-    "scd5": 24,
-    "site": "GAGNNNNNCTC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2732",
-}
-
-rest_dict["BpmI"] = {
-    "charac": (22, 14, None, None, "CTGGAG"),
-    "compsite": "(?=(?P<BpmI>CTGGAG))|(?=(?P<BpmI_as>CTCCAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 14,
-    "fst5": 22,
-    "id": 295,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:295",
-}
-
-rest_dict["Bps6700III"] = {
-    "charac": (None, None, None, None, "TACCNAG"),
-    "compsite": "(?=(?P<Bps6700III>TACC.AG))|(?=(?P<Bps6700III_as>CT.GGTA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 421501,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TACCNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:421501",
-}
-
-rest_dict["Bpu10I"] = {
-    "charac": (2, -2, None, None, "CCTNAGC"),
-    "compsite": "(?=(?P<Bpu10I>CCT.AGC))|(?=(?P<Bpu10I_as>GCT.AGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 298,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNAGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:298",
-}
-
-rest_dict["Bpu1102I"] = {
-    "charac": (2, -2, None, None, "GCTNAGC"),
-    "compsite": "(?=(?P<Bpu1102I>GCT.AGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 299,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTNAGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:299",
-}
-
-rest_dict["Bpu14I"] = {
-    "charac": (2, -2, None, None, "TTCGAA"),
-    "compsite": "(?=(?P<Bpu14I>TTCGAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 301,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTCGAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:301",
-}
-
-rest_dict["BpuEI"] = {
-    "charac": (22, 14, None, None, "CTTGAG"),
-    "compsite": "(?=(?P<BpuEI>CTTGAG))|(?=(?P<BpuEI_as>CTCAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 14,
-    "fst5": 22,
-    "id": 5222,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:5222",
-}
-
-rest_dict["BpuMI"] = {
-    "charac": (2, -2, None, None, "CCSGG"),
-    "compsite": "(?=(?P<BpuMI>CC[CG]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10493,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "S",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCSGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:10493",
-}
-
-rest_dict["Bsa29I"] = {
-    "charac": (2, -2, None, None, "ATCGAT"),
-    "compsite": "(?=(?P<Bsa29I>ATCGAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2671,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATCGAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2671",
-}
-
-rest_dict["BsaAI"] = {
-    "charac": (3, -3, None, None, "YACGTR"),
-    "compsite": "(?=(?P<BsaAI>[CT]ACGT[AG]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 305,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YACGTR",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:305",
-}
-
-rest_dict["BsaBI"] = {
-    "charac": (5, -5, None, None, "GATNNNNATC"),
-    "compsite": "(?=(?P<BsaBI>GAT....ATC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 306,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATNNNNATC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:306",
-}
-
-rest_dict["BsaHI"] = {
-    "charac": (2, -2, None, None, "GRCGYC"),
-    "compsite": "(?=(?P<BsaHI>G[AG]CG[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 312,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRCGYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:312",
-}
-
-rest_dict["BsaI"] = {
-    "charac": (7, 5, None, None, "GGTCTC"),
-    "compsite": "(?=(?P<BsaI>GGTCTC))|(?=(?P<BsaI_as>GAGACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 5,
-    "fst5": 7,
-    "id": 313,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:313",
-}
-
-rest_dict["BsaJI"] = {
-    "charac": (1, -1, None, None, "CCNNGG"),
-    "compsite": "(?=(?P<BsaJI>CC..GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 314,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CNNG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNNGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:314",
-}
-
-rest_dict["BsaWI"] = {
-    "charac": (1, -1, None, None, "WCCGGW"),
-    "compsite": "(?=(?P<BsaWI>[AT]CCGG[AT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 328,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "WCCGGW",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:328",
-}
-
-rest_dict["BsaXI"] = {
-    "charac": (-9, -23, 21, 7, "ACNNNNNCTCC"),
-    "compsite": "(?=(?P<BsaXI>AC.....CTCC))|(?=(?P<BsaXI_as>GGAG.....GT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -23,
-    "fst5": -9,
-    "id": 2194,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": 7,
-    "scd5": 21,
-    "site": "ACNNNNNCTCC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2194",
-}
-
-rest_dict["BsbI"] = {
-    "charac": (27, 19, None, None, "CAACAC"),
-    "compsite": "(?=(?P<BsbI>CAACAC))|(?=(?P<BsbI_as>GTGTTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 19,
-    "fst5": 27,
-    "id": 329,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAACAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:329",
-}
-
-rest_dict["Bsc4I"] = {
-    "charac": (7, -7, None, None, "CCNNNNNNNGG"),
-    "compsite": "(?=(?P<Bsc4I>CC.......GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 2357,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNNNNNNNGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2357",
-}
-
-rest_dict["BscAI"] = {
-    "charac": (9, 6, None, None, "GCATC"),
-    "compsite": "(?=(?P<BscAI>GCATC))|(?=(?P<BscAI_as>GATGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 6,
-    "fst5": 9,
-    "id": 330,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCATC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:330",
-}
-
-rest_dict["BscGI"] = {
-    "charac": (None, None, None, None, "CCCGT"),
-    "compsite": "(?=(?P<BscGI>CCCGT))|(?=(?P<BscGI_as>ACGGG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 2163,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCGT",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2163",
-}
-
-rest_dict["BscXI"] = {
-    "charac": (5, -5, None, None, "GCAGGC"),
-    "compsite": "(?=(?P<BscXI>GCAGGC))|(?=(?P<BscXI_as>GCCTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 11108,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CAGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:11108",
-}
-
-rest_dict["Bse118I"] = {
-    "charac": (1, -1, None, None, "RCCGGY"),
-    "compsite": "(?=(?P<Bse118I>[AG]CCGG[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 337,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RCCGGY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:337",
-}
-
-rest_dict["Bse1I"] = {
-    "charac": (6, -1, None, None, "ACTGG"),
-    "compsite": "(?=(?P<Bse1I>ACTGG))|(?=(?P<Bse1I_as>CCAGT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 6,
-    "id": 2672,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "GN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACTGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2672",
-}
-
-rest_dict["Bse21I"] = {
-    "charac": (2, -2, None, None, "CCTNAGG"),
-    "compsite": "(?=(?P<Bse21I>CCT.AGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 338,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNAGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:338",
-}
-
-rest_dict["Bse3DI"] = {
-    "charac": (8, 0, None, None, "GCAATG"),
-    "compsite": "(?=(?P<Bse3DI>GCAATG))|(?=(?P<Bse3DI_as>CATTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 0,
-    "fst5": 8,
-    "id": 2879,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAATG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2879",
-}
-
-rest_dict["Bse8I"] = {
-    "charac": (5, -5, None, None, "GATNNNNATC"),
-    "compsite": "(?=(?P<Bse8I>GAT....ATC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2366,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATNNNNATC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2366",
-}
-
-rest_dict["BseAI"] = {
-    "charac": (1, -1, None, None, "TCCGGA"),
-    "compsite": "(?=(?P<BseAI>TCCGGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 339,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:339",
-}
-
-rest_dict["BseBI"] = {
-    "charac": (2, -2, None, None, "CCWGG"),
-    "compsite": "(?=(?P<BseBI>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 340,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "W",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:340",
-}
-
-rest_dict["BseCI"] = {
-    "charac": (2, -2, None, None, "ATCGAT"),
-    "compsite": "(?=(?P<BseCI>ATCGAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2160,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATCGAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:2160",
-}
-
-rest_dict["BseDI"] = {
-    "charac": (1, -1, None, None, "CCNNGG"),
-    "compsite": "(?=(?P<BseDI>CC..GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2289,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CNNG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNNGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2289",
-}
-
-rest_dict["BseGI"] = {
-    "charac": (7, 0, None, None, "GGATG"),
-    "compsite": "(?=(?P<BseGI>GGATG))|(?=(?P<BseGI_as>CATCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 0,
-    "fst5": 7,
-    "id": 2988,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2988",
-}
-
-rest_dict["BseJI"] = {
-    "charac": (5, -5, None, None, "GATNNNNATC"),
-    "compsite": "(?=(?P<BseJI>GAT....ATC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 5464,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATNNNNATC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:5464",
-}
-
-rest_dict["BseLI"] = {
-    "charac": (7, -7, None, None, "CCNNNNNNNGG"),
-    "compsite": "(?=(?P<BseLI>CC.......GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 2982,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNNNNNNNGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2982",
-}
-
-rest_dict["BseMI"] = {
-    "charac": (8, 0, None, None, "GCAATG"),
-    "compsite": "(?=(?P<BseMI>GCAATG))|(?=(?P<BseMI_as>CATTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 0,
-    "fst5": 8,
-    "id": 2984,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAATG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2984",
-}
-
-rest_dict["BseMII"] = {
-    "charac": (15, 8, None, None, "CTCAG"),
-    "compsite": "(?=(?P<BseMII>CTCAG))|(?=(?P<BseMII_as>CTGAG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 8,
-    "fst5": 15,
-    "id": 3025,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3025",
-}
-
-rest_dict["BseNI"] = {
-    "charac": (6, -1, None, None, "ACTGG"),
-    "compsite": "(?=(?P<BseNI>ACTGG))|(?=(?P<BseNI_as>CCAGT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 6,
-    "id": 2179,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "GN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACTGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2179",
-}
-
-rest_dict["BsePI"] = {
-    "charac": (1, -1, None, None, "GCGCGC"),
-    "compsite": "(?=(?P<BsePI>GCGCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 344,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGCGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:344",
-}
-
-rest_dict["BseRI"] = {
-    "charac": (16, 8, None, None, "GAGGAG"),
-    "compsite": "(?=(?P<BseRI>GAGGAG))|(?=(?P<BseRI_as>CTCCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 8,
-    "fst5": 16,
-    "id": 2316,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2316",
-}
-
-rest_dict["BseSI"] = {
-    "charac": (5, -5, None, None, "GKGCMC"),
-    "compsite": "(?=(?P<BseSI>G[GT]GC[AC]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 3105,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "KGCM",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GKGCMC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3105",
-}
-
-rest_dict["BseX3I"] = {
-    "charac": (1, -1, None, None, "CGGCCG"),
-    "compsite": "(?=(?P<BseX3I>CGGCCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2960,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGCCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2960",
-}
-
-rest_dict["BseXI"] = {
-    "charac": (13, 12, None, None, "GCAGC"),
-    "compsite": "(?=(?P<BseXI>GCAGC))|(?=(?P<BseXI_as>GCTGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 12,
-    "fst5": 13,
-    "id": 3830,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3830",
-}
-
-rest_dict["BseYI"] = {
-    "charac": (1, -1, None, None, "CCCAGC"),
-    "compsite": "(?=(?P<BseYI>CCCAGC))|(?=(?P<BseYI_as>GCTGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 5309,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:5309",
-}
-
-rest_dict["BsgI"] = {
-    "charac": (22, 14, None, None, "GTGCAG"),
-    "compsite": "(?=(?P<BsgI>GTGCAG))|(?=(?P<BsgI_as>CTGCAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 14,
-    "fst5": 22,
-    "id": 345,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTGCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:345",
-}
-
-rest_dict["Bsh1236I"] = {
-    "charac": (2, -2, None, None, "CGCG"),
-    "compsite": "(?=(?P<Bsh1236I>CGCG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2177,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2177",
-}
-
-rest_dict["Bsh1285I"] = {
-    "charac": (4, -4, None, None, "CGRYCG"),
-    "compsite": "(?=(?P<Bsh1285I>CG[AG][CT]CG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 2178,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "RY",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGRYCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2178",
-}
-
-rest_dict["BshFI"] = {
-    "charac": (2, -2, None, None, "GGCC"),
-    "compsite": "(?=(?P<BshFI>GGCC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 352,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:352",
-}
-
-rest_dict["BshNI"] = {
-    "charac": (1, -1, None, None, "GGYRCC"),
-    "compsite": "(?=(?P<BshNI>GG[CT][AG]CC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2428,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GYRC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGYRCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2428",
-}
-
-rest_dict["BshTI"] = {
-    "charac": (1, -1, None, None, "ACCGGT"),
-    "compsite": "(?=(?P<BshTI>ACCGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 3829,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCGGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3829",
-}
-
-rest_dict["BshVI"] = {
-    "charac": (2, -2, None, None, "ATCGAT"),
-    "compsite": "(?=(?P<BshVI>ATCGAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 8568,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATCGAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:8568",
-}
-
-rest_dict["BsiEI"] = {
-    "charac": (4, -4, None, None, "CGRYCG"),
-    "compsite": "(?=(?P<BsiEI>CG[AG][CT]CG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 363,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "RY",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGRYCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:363",
-}
-
-rest_dict["BsiHKAI"] = {
-    "charac": (5, -5, None, None, "GWGCWC"),
-    "compsite": "(?=(?P<BsiHKAI>G[AT]GC[AT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 367,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "WGCW",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GWGCWC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:367",
-}
-
-rest_dict["BsiHKCI"] = {
-    "charac": (1, -1, None, None, "CYCGRG"),
-    "compsite": "(?=(?P<BsiHKCI>C[CT]CG[AG]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 5362,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "YCGR",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYCGRG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("Q", "X"),
-    "uri": "https://identifiers.org/rebase:5362",
-}
-
-rest_dict["BsiI"] = {
-    "charac": (1, -1, None, None, "CACGAG"),
-    "compsite": "(?=(?P<BsiI>CACGAG))|(?=(?P<BsiI_as>CTCGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 368,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "ACGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:368",
-}
-
-rest_dict["BsiSI"] = {
-    "charac": (1, -1, None, None, "CCGG"),
-    "compsite": "(?=(?P<BsiSI>CCGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 378,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("C", "Y"),
-    "uri": "https://identifiers.org/rebase:378",
-}
-
-rest_dict["BsiWI"] = {
-    "charac": (1, -1, None, None, "CGTACG"),
-    "compsite": "(?=(?P<BsiWI>CGTACG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 382,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGTACG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:382",
-}
-
-rest_dict["BsiYI"] = {
-    "charac": (7, -7, None, None, "CCNNNNNNNGG"),
-    "compsite": "(?=(?P<BsiYI>CC.......GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 384,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNNNNNNNGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:384",
-}
-
-rest_dict["BslFI"] = {
-    "charac": (15, 14, None, None, "GGGAC"),
-    "compsite": "(?=(?P<BslFI>GGGAC))|(?=(?P<BslFI_as>GTCCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 14,
-    "fst5": 15,
-    "id": 7532,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:7532",
-}
-
-rest_dict["BslI"] = {
-    "charac": (7, -7, None, None, "CCNNNNNNNGG"),
-    "compsite": "(?=(?P<BslI>CC.......GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 386,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNNNNNNNGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:386",
-}
-
-rest_dict["BsmAI"] = {
-    "charac": (6, 5, None, None, "GTCTC"),
-    "compsite": "(?=(?P<BsmAI>GTCTC))|(?=(?P<BsmAI_as>GAGAC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 6,
-    "id": 387,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTCTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:387",
-}
-
-rest_dict["BsmBI"] = {
-    "charac": (7, 5, None, None, "CGTCTC"),
-    "compsite": "(?=(?P<BsmBI>CGTCTC))|(?=(?P<BsmBI_as>GAGACG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 5,
-    "fst5": 7,
-    "id": 2415,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGTCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2415",
-}
-
-rest_dict["BsmFI"] = {
-    "charac": (15, 14, None, None, "GGGAC"),
-    "compsite": "(?=(?P<BsmFI>GGGAC))|(?=(?P<BsmFI_as>GTCCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 14,
-    "fst5": 15,
-    "id": 2212,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2212",
-}
-
-rest_dict["BsmI"] = {
-    "charac": (7, -1, None, None, "GAATGC"),
-    "compsite": "(?=(?P<BsmI>GAATGC))|(?=(?P<BsmI_as>GCATTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 7,
-    "id": 389,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "CN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAATGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "M", "N", "S"),
-    "uri": "https://identifiers.org/rebase:389",
-}
-
-rest_dict["BsnI"] = {
-    "charac": (2, -2, None, None, "GGCC"),
-    "compsite": "(?=(?P<BsnI>GGCC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10491,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:10491",
-}
-
-rest_dict["Bso31I"] = {
-    "charac": (7, 5, None, None, "GGTCTC"),
-    "compsite": "(?=(?P<Bso31I>GGTCTC))|(?=(?P<Bso31I_as>GAGACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 5,
-    "fst5": 7,
-    "id": 4069,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4069",
-}
-
-rest_dict["BsoBI"] = {
-    "charac": (1, -1, None, None, "CYCGRG"),
-    "compsite": "(?=(?P<BsoBI>C[CT]CG[AG]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 392,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "YCGR",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYCGRG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:392",
-}
-
-rest_dict["Bsp119I"] = {
-    "charac": (2, -2, None, None, "TTCGAA"),
-    "compsite": "(?=(?P<Bsp119I>TTCGAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 406,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTCGAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:406",
-}
-
-rest_dict["Bsp120I"] = {
-    "charac": (1, -1, None, None, "GGGCCC"),
-    "compsite": "(?=(?P<Bsp120I>GGGCCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 407,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGCCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:407",
-}
-
-rest_dict["Bsp1286I"] = {
-    "charac": (5, -5, None, None, "GDGCHC"),
-    "compsite": "(?=(?P<Bsp1286I>G[AGT]GC[ACT]C))",
-    "dna": None,
-    "freq": 455.1111111111111,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 416,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "DGCH",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GDGCHC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "K", "N"),
-    "uri": "https://identifiers.org/rebase:416",
-}
-
-rest_dict["Bsp13I"] = {
-    "charac": (1, -1, None, None, "TCCGGA"),
-    "compsite": "(?=(?P<Bsp13I>TCCGGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 430,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:430",
-}
-
-rest_dict["Bsp1407I"] = {
-    "charac": (1, -1, None, None, "TGTACA"),
-    "compsite": "(?=(?P<Bsp1407I>TGTACA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2175,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGTACA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:2175",
-}
-
-rest_dict["Bsp143I"] = {
-    "charac": (0, 0, None, None, "GATC"),
-    "compsite": "(?=(?P<Bsp143I>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 434,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:434",
-}
-
-rest_dict["Bsp1720I"] = {
-    "charac": (2, -2, None, None, "GCTNAGC"),
-    "compsite": "(?=(?P<Bsp1720I>GCT.AGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 442,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTNAGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:442",
-}
-
-rest_dict["Bsp19I"] = {
-    "charac": (1, -1, None, None, "CCATGG"),
-    "compsite": "(?=(?P<Bsp19I>CCATGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 446,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCATGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:446",
-}
-
-rest_dict["Bsp24I"] = {
-    "charac": (-8, -25, 24, 7, "GACNNNNNNTGG"),
-    "compsite": "(?=(?P<Bsp24I>GAC......TGG))|(?=(?P<Bsp24I_as>CCA......GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -25,
-    "fst5": -8,
-    "id": 2437,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 7,
-    "scd5": 24,
-    "site": "GACNNNNNNTGG",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2437",
-}
-
-rest_dict["Bsp3004IV"] = {
-    "charac": (None, None, None, None, "CCGCAT"),
-    "compsite": "(?=(?P<Bsp3004IV>CCGCAT))|(?=(?P<Bsp3004IV_as>ATGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 67611,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:67611",
-}
-
-rest_dict["Bsp460III"] = {
-    "charac": (None, None, None, None, "CGCGCAG"),
-    "compsite": "(?=(?P<Bsp460III>CGCGCAG))|(?=(?P<Bsp460III_as>CTGCGCG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 145234,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCGCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:145234",
-}
-
-rest_dict["Bsp68I"] = {
-    "charac": (3, -3, None, None, "TCGCGA"),
-    "compsite": "(?=(?P<Bsp68I>TCGCGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 484,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCGCGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:484",
-}
-
-rest_dict["BspACI"] = {
-    "charac": (1, -1, None, None, "CCGC"),
-    "compsite": "(?=(?P<BspACI>CCGC))|(?=(?P<BspACI_as>GCGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 11884,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:11884",
-}
-
-rest_dict["BspANI"] = {
-    "charac": (2, -2, None, None, "GGCC"),
-    "compsite": "(?=(?P<BspANI>GGCC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 7453,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("X",),
-    "uri": "https://identifiers.org/rebase:7453",
-}
-
-rest_dict["BspCNI"] = {
-    "charac": (14, 7, None, None, "CTCAG"),
-    "compsite": "(?=(?P<BspCNI>CTCAG))|(?=(?P<BspCNI_as>CTGAG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 7,
-    "fst5": 14,
-    "id": 4663,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4663",
-}
-
-rest_dict["BspD6I"] = {
-    "charac": (9, 6, None, None, "GAGTC"),
-    "compsite": "(?=(?P<BspD6I>GAGTC))|(?=(?P<BspD6I_as>GACTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 6,
-    "fst5": 9,
-    "id": 14733,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:14733",
-}
-
-rest_dict["BspDI"] = {
-    "charac": (2, -2, None, None, "ATCGAT"),
-    "compsite": "(?=(?P<BspDI>ATCGAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 511,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATCGAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:511",
-}
-
-rest_dict["BspEI"] = {
-    "charac": (1, -1, None, None, "TCCGGA"),
-    "compsite": "(?=(?P<BspEI>TCCGGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 512,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:512",
-}
-
-rest_dict["BspFNI"] = {
-    "charac": (2, -2, None, None, "CGCG"),
-    "compsite": "(?=(?P<BspFNI>CGCG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 16207,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:16207",
-}
-
-rest_dict["BspGI"] = {
-    "charac": (None, None, None, None, "CTGGAC"),
-    "compsite": "(?=(?P<BspGI>CTGGAC))|(?=(?P<BspGI_as>GTCCAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 516,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTGGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:516",
-}
-
-rest_dict["BspHI"] = {
-    "charac": (1, -1, None, None, "TCATGA"),
-    "compsite": "(?=(?P<BspHI>TCATGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 517,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCATGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:517",
-}
-
-rest_dict["BspLI"] = {
-    "charac": (3, -3, None, None, "GGNNCC"),
-    "compsite": "(?=(?P<BspLI>GG..CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2831,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNNCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2831",
-}
-
-rest_dict["BspLU11I"] = {
-    "charac": (1, -1, None, None, "ACATGT"),
-    "compsite": "(?=(?P<BspLU11I>ACATGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2324,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACATGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2324",
-}
-
-rest_dict["BspMAI"] = {
-    "charac": (5, -5, None, None, "CTGCAG"),
-    "compsite": "(?=(?P<BspMAI>CTGCAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 5358,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTGCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("X",),
-    "uri": "https://identifiers.org/rebase:5358",
-}
-
-rest_dict["BspMI"] = {
-    "charac": (10, 8, None, None, "ACCTGC"),
-    "compsite": "(?=(?P<BspMI>ACCTGC))|(?=(?P<BspMI_as>GCAGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 8,
-    "fst5": 10,
-    "id": 527,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCTGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:527",
-}
-
-rest_dict["BspMII"] = {
-    "charac": (1, -1, None, None, "TCCGGA"),
-    "compsite": "(?=(?P<BspMII>TCCGGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 528,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:528",
-}
-
-rest_dict["BspNCI"] = {
-    "charac": (None, None, None, None, "CCAGA"),
-    "compsite": "(?=(?P<BspNCI>CCAGA))|(?=(?P<BspNCI_as>TCTGG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 4691,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCAGA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4691",
-}
-
-rest_dict["BspOI"] = {
-    "charac": (5, -5, None, None, "GCTAGC"),
-    "compsite": "(?=(?P<BspOI>GCTAGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 15356,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:15356",
-}
-
-rest_dict["BspPI"] = {
-    "charac": (9, 5, None, None, "GGATC"),
-    "compsite": "(?=(?P<BspPI>GGATC))|(?=(?P<BspPI_as>GATCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 9,
-    "id": 2448,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2448",
-}
-
-rest_dict["BspQI"] = {
-    "charac": (8, 4, None, None, "GCTCTTC"),
-    "compsite": "(?=(?P<BspQI>GCTCTTC))|(?=(?P<BspQI_as>GAAGAGC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": 4,
-    "fst5": 8,
-    "id": 4157,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTCTTC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4157",
-}
-
-rest_dict["BspT104I"] = {
-    "charac": (2, -2, None, None, "TTCGAA"),
-    "compsite": "(?=(?P<BspT104I>TTCGAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 4947,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTCGAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:4947",
-}
-
-rest_dict["BspT107I"] = {
-    "charac": (1, -1, None, None, "GGYRCC"),
-    "compsite": "(?=(?P<BspT107I>GG[CT][AG]CC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 4948,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GYRC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGYRCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:4948",
-}
-
-rest_dict["BspTI"] = {
-    "charac": (1, -1, None, None, "CTTAAG"),
-    "compsite": "(?=(?P<BspTI>CTTAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1989,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TTAA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1989",
-}
-
-rest_dict["BspTNI"] = {
-    "charac": (7, 5, None, None, "GGTCTC"),
-    "compsite": "(?=(?P<BspTNI>GGTCTC))|(?=(?P<BspTNI_as>GAGACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 5,
-    "fst5": 7,
-    "id": 5361,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("X",),
-    "uri": "https://identifiers.org/rebase:5361",
-}
-
-rest_dict["BsrBI"] = {
-    "charac": (3, -3, None, None, "CCGCTC"),
-    "compsite": "(?=(?P<BsrBI>CCGCTC))|(?=(?P<BsrBI_as>GAGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 535,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:535",
-}
-
-rest_dict["BsrDI"] = {
-    "charac": (8, 0, None, None, "GCAATG"),
-    "compsite": "(?=(?P<BsrDI>GCAATG))|(?=(?P<BsrDI_as>CATTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 0,
-    "fst5": 8,
-    "id": 2195,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAATG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2195",
-}
-
-rest_dict["BsrFI"] = {
-    "charac": (1, -1, None, None, "RCCGGY"),
-    "compsite": "(?=(?P<BsrFI>[AG]CCGG[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 538,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RCCGGY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:538",
-}
-
-rest_dict["BsrGI"] = {
-    "charac": (1, -1, None, None, "TGTACA"),
-    "compsite": "(?=(?P<BsrGI>TGTACA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2196,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGTACA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2196",
-}
-
-rest_dict["BsrI"] = {
-    "charac": (6, -1, None, None, "ACTGG"),
-    "compsite": "(?=(?P<BsrI>ACTGG))|(?=(?P<BsrI_as>CCAGT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 6,
-    "id": 540,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "GN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACTGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:540",
-}
-
-rest_dict["BssAI"] = {
-    "charac": (1, -1, None, None, "RCCGGY"),
-    "compsite": "(?=(?P<BssAI>[AG]CCGG[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 545,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RCCGGY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:545",
-}
-
-rest_dict["BssECI"] = {
-    "charac": (1, -1, None, None, "CCNNGG"),
-    "compsite": "(?=(?P<BssECI>CC..GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 3200,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CNNG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNNGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:3200",
-}
-
-rest_dict["BssHII"] = {
-    "charac": (1, -1, None, None, "GCGCGC"),
-    "compsite": "(?=(?P<BssHII>GCGCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 550,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGCGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "K", "M", "N", "Q", "X"),
-    "uri": "https://identifiers.org/rebase:550",
-}
-
-rest_dict["BssMI"] = {
-    "charac": (0, 0, None, None, "GATC"),
-    "compsite": "(?=(?P<BssMI>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 11124,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:11124",
-}
-
-rest_dict["BssNAI"] = {
-    "charac": (3, -3, None, None, "GTATAC"),
-    "compsite": "(?=(?P<BssNAI>GTATAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2959,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTATAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2959",
-}
-
-rest_dict["BssNI"] = {
-    "charac": (2, -2, None, None, "GRCGYC"),
-    "compsite": "(?=(?P<BssNI>G[AG]CG[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10487,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRCGYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:10487",
-}
-
-rest_dict["BssSI"] = {
-    "charac": (1, -1, None, None, "CACGAG"),
-    "compsite": "(?=(?P<BssSI>CACGAG))|(?=(?P<BssSI_as>CTCGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2566,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "ACGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2566",
-}
-
-rest_dict["BssT1I"] = {
-    "charac": (1, -1, None, None, "CCWWGG"),
-    "compsite": "(?=(?P<BssT1I>CC[AT][AT]GG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 554,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CWWG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWWGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:554",
-}
-
-rest_dict["Bst1107I"] = {
-    "charac": (3, -3, None, None, "GTATAC"),
-    "compsite": "(?=(?P<Bst1107I>GTATAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 556,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTATAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:556",
-}
-
-rest_dict["Bst2BI"] = {
-    "charac": (1, -1, None, None, "CACGAG"),
-    "compsite": "(?=(?P<Bst2BI>CACGAG))|(?=(?P<Bst2BI_as>CTCGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2810,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "ACGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2810",
-}
-
-rest_dict["Bst2UI"] = {
-    "charac": (2, -2, None, None, "CCWGG"),
-    "compsite": "(?=(?P<Bst2UI>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2745,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "W",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2745",
-}
-
-rest_dict["Bst4CI"] = {
-    "charac": (3, -3, None, None, "ACNGT"),
-    "compsite": "(?=(?P<Bst4CI>AC.GT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 3009,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACNGT",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:3009",
-}
-
-rest_dict["Bst6I"] = {
-    "charac": (7, 4, None, None, "CTCTTC"),
-    "compsite": "(?=(?P<Bst6I>CTCTTC))|(?=(?P<Bst6I_as>GAAGAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 4,
-    "fst5": 7,
-    "id": 5552,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCTTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:5552",
-}
-
-rest_dict["BstACI"] = {
-    "charac": (2, -2, None, None, "GRCGYC"),
-    "compsite": "(?=(?P<BstACI>G[AG]CG[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2948,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRCGYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2948",
-}
-
-rest_dict["BstAFI"] = {
-    "charac": (1, -1, None, None, "CTTAAG"),
-    "compsite": "(?=(?P<BstAFI>CTTAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 17119,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TTAA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:17119",
-}
-
-rest_dict["BstAPI"] = {
-    "charac": (7, -7, None, None, "GCANNNNNTGC"),
-    "compsite": "(?=(?P<BstAPI>GCA.....TGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 2958,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCANNNNNTGC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:2958",
-}
-
-rest_dict["BstAUI"] = {
-    "charac": (1, -1, None, None, "TGTACA"),
-    "compsite": "(?=(?P<BstAUI>TGTACA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 6960,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGTACA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:6960",
-}
-
-rest_dict["BstBAI"] = {
-    "charac": (3, -3, None, None, "YACGTR"),
-    "compsite": "(?=(?P<BstBAI>[CT]ACGT[AG]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2856,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YACGTR",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2856",
-}
-
-rest_dict["BstBI"] = {
-    "charac": (2, -2, None, None, "TTCGAA"),
-    "compsite": "(?=(?P<BstBI>TTCGAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 570,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTCGAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:570",
-}
-
-rest_dict["BstC8I"] = {
-    "charac": (3, -3, None, None, "GCNNGC"),
-    "compsite": "(?=(?P<BstC8I>GC..GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 5509,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNNGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:5509",
-}
-
-rest_dict["BstDEI"] = {
-    "charac": (1, -1, None, None, "CTNAG"),
-    "compsite": "(?=(?P<BstDEI>CT.AG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2767,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTNAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2767",
-}
-
-rest_dict["BstDSI"] = {
-    "charac": (1, -1, None, None, "CCRYGG"),
-    "compsite": "(?=(?P<BstDSI>CC[AG][CT]GG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2739,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CRYG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCRYGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2739",
-}
-
-rest_dict["BstEII"] = {
-    "charac": (1, -1, None, None, "GGTNACC"),
-    "compsite": "(?=(?P<BstEII>GGT.ACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 575,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GTNAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTNACC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("C", "J", "N"),
-    "uri": "https://identifiers.org/rebase:575",
-}
-
-rest_dict["BstENI"] = {
-    "charac": (5, -5, None, None, "CCTNNNNNAGG"),
-    "compsite": "(?=(?P<BstENI>CCT.....AGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 4841,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNNNNNAGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4841",
-}
-
-rest_dict["BstF5I"] = {
-    "charac": (7, 0, None, None, "GGATG"),
-    "compsite": "(?=(?P<BstF5I>GGATG))|(?=(?P<BstF5I_as>CATCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 0,
-    "fst5": 7,
-    "id": 2744,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2744",
-}
-
-rest_dict["BstFNI"] = {
-    "charac": (2, -2, None, None, "CGCG"),
-    "compsite": "(?=(?P<BstFNI>CGCG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 4070,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4070",
-}
-
-rest_dict["BstH2I"] = {
-    "charac": (5, -5, None, None, "RGCGCY"),
-    "compsite": "(?=(?P<BstH2I>[AG]GCGC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2743,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "GCGC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGCGCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2743",
-}
-
-rest_dict["BstHHI"] = {
-    "charac": (3, -3, None, None, "GCGC"),
-    "compsite": "(?=(?P<BstHHI>GCGC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 4914,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4914",
-}
-
-rest_dict["BstKTI"] = {
-    "charac": (3, -3, None, None, "GATC"),
-    "compsite": "(?=(?P<BstKTI>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 5533,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:5533",
-}
-
-rest_dict["BstMAI"] = {
-    "charac": (6, 5, None, None, "GTCTC"),
-    "compsite": "(?=(?P<BstMAI>GTCTC))|(?=(?P<BstMAI_as>GAGAC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 6,
-    "id": 10830,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTCTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:10830",
-}
-
-rest_dict["BstMBI"] = {
-    "charac": (0, 0, None, None, "GATC"),
-    "compsite": "(?=(?P<BstMBI>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 7530,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:7530",
-}
-
-rest_dict["BstMCI"] = {
-    "charac": (4, -4, None, None, "CGRYCG"),
-    "compsite": "(?=(?P<BstMCI>CG[AG][CT]CG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 2740,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "RY",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGRYCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2740",
-}
-
-rest_dict["BstMWI"] = {
-    "charac": (7, -7, None, None, "GCNNNNNNNGC"),
-    "compsite": "(?=(?P<BstMWI>GC.......GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 6223,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNNNNNNNGC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:6223",
-}
-
-rest_dict["BstNI"] = {
-    "charac": (2, -2, None, None, "CCWGG"),
-    "compsite": "(?=(?P<BstNI>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 586,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "W",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:586",
-}
-
-rest_dict["BstNSI"] = {
-    "charac": (5, -5, None, None, "RCATGY"),
-    "compsite": "(?=(?P<BstNSI>[AG]CATG[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2864,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RCATGY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2864",
-}
-
-rest_dict["BstPAI"] = {
-    "charac": (5, -5, None, None, "GACNNNNGTC"),
-    "compsite": "(?=(?P<BstPAI>GAC....GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 4619,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNGTC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4619",
-}
-
-rest_dict["BstPI"] = {
-    "charac": (1, -1, None, None, "GGTNACC"),
-    "compsite": "(?=(?P<BstPI>GGT.ACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 588,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GTNAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTNACC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:588",
-}
-
-rest_dict["BstSCI"] = {
-    "charac": (0, 0, None, None, "CCNGG"),
-    "compsite": "(?=(?P<BstSCI>CC.GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 5510,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCNGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:5510",
-}
-
-rest_dict["BstSFI"] = {
-    "charac": (1, -1, None, None, "CTRYAG"),
-    "compsite": "(?=(?P<BstSFI>CT[AG][CT]AG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2765,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TRYA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTRYAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2765",
-}
-
-rest_dict["BstSLI"] = {
-    "charac": (5, -5, None, None, "GKGCMC"),
-    "compsite": "(?=(?P<BstSLI>G[GT]GC[AC]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 16191,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "KGCM",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GKGCMC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:16191",
-}
-
-rest_dict["BstSNI"] = {
-    "charac": (3, -3, None, None, "TACGTA"),
-    "compsite": "(?=(?P<BstSNI>TACGTA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2734,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TACGTA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2734",
-}
-
-rest_dict["BstUI"] = {
-    "charac": (2, -2, None, None, "CGCG"),
-    "compsite": "(?=(?P<BstUI>CGCG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 593,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:593",
-}
-
-rest_dict["BstV1I"] = {
-    "charac": (13, 12, None, None, "GCAGC"),
-    "compsite": "(?=(?P<BstV1I>GCAGC))|(?=(?P<BstV1I_as>GCTGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 12,
-    "fst5": 13,
-    "id": 5508,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:5508",
-}
-
-rest_dict["BstV2I"] = {
-    "charac": (8, 6, None, None, "GAAGAC"),
-    "compsite": "(?=(?P<BstV2I>GAAGAC))|(?=(?P<BstV2I_as>GTCTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 6,
-    "fst5": 8,
-    "id": 4860,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4860",
-}
-
-rest_dict["BstX2I"] = {
-    "charac": (1, -1, None, None, "RGATCY"),
-    "compsite": "(?=(?P<BstX2I>[AG]GATC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2766,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGATCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2766",
-}
-
-rest_dict["BstXI"] = {
-    "charac": (8, -8, None, None, "CCANNNNNNTGG"),
-    "compsite": "(?=(?P<BstXI>CCA......TGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -8,
-    "fst5": 8,
-    "id": 596,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCANNNNNNTGG",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "J", "K", "M", "N", "Q", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:596",
-}
-
-rest_dict["BstYI"] = {
-    "charac": (1, -1, None, None, "RGATCY"),
-    "compsite": "(?=(?P<BstYI>[AG]GATC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 598,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGATCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:598",
-}
-
-rest_dict["BstZ17I"] = {
-    "charac": (3, -3, None, None, "GTATAC"),
-    "compsite": "(?=(?P<BstZ17I>GTATAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2662,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTATAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2662",
-}
-
-rest_dict["BstZI"] = {
-    "charac": (1, -1, None, None, "CGGCCG"),
-    "compsite": "(?=(?P<BstZI>CGGCCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 599,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGCCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("R",),
-    "uri": "https://identifiers.org/rebase:599",
-}
-
-rest_dict["Bsu15I"] = {
-    "charac": (2, -2, None, None, "ATCGAT"),
-    "compsite": "(?=(?P<Bsu15I>ATCGAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 608,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATCGAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:608",
-}
-
-rest_dict["Bsu36I"] = {
-    "charac": (2, -2, None, None, "CCTNAGG"),
-    "compsite": "(?=(?P<Bsu36I>CCT.AGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 611,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNAGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:611",
-}
-
-rest_dict["BsuI"] = {
-    "charac": (12, 5, None, None, "GTATCC"),
-    "compsite": "(?=(?P<BsuI>GTATCC))|(?=(?P<BsuI_as>GGATAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 5,
-    "fst5": 12,
-    "id": 26995,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTATCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:26995",
-}
-
-rest_dict["BsuRI"] = {
-    "charac": (2, -2, None, None, "GGCC"),
-    "compsite": "(?=(?P<BsuRI>GGCC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 620,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "I"),
-    "uri": "https://identifiers.org/rebase:620",
-}
-
-rest_dict["BsuTUI"] = {
-    "charac": (2, -2, None, None, "ATCGAT"),
-    "compsite": "(?=(?P<BsuTUI>ATCGAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 5360,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATCGAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("X",),
-    "uri": "https://identifiers.org/rebase:5360",
-}
-
-rest_dict["BtgI"] = {
-    "charac": (1, -1, None, None, "CCRYGG"),
-    "compsite": "(?=(?P<BtgI>CC[AG][CT]GG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 3790,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CRYG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCRYGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:3790",
-}
-
-rest_dict["BtgZI"] = {
-    "charac": (16, 14, None, None, "GCGATG"),
-    "compsite": "(?=(?P<BtgZI>GCGATG))|(?=(?P<BtgZI_as>CATCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 14,
-    "fst5": 16,
-    "id": 5640,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGATG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:5640",
-}
-
-rest_dict["BthCI"] = {
-    "charac": (4, -4, None, None, "GCNGC"),
-    "compsite": "(?=(?P<BthCI>GC.GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 5795,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "CNG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:5795",
-}
-
-rest_dict["BtrI"] = {
-    "charac": (3, -3, None, None, "CACGTC"),
-    "compsite": "(?=(?P<BtrI>CACGTC))|(?=(?P<BtrI_as>GACGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 3774,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:3774",
-}
-
-rest_dict["BtsCI"] = {
-    "charac": (7, 0, None, None, "GGATG"),
-    "compsite": "(?=(?P<BtsCI>GGATG))|(?=(?P<BtsCI_as>CATCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 0,
-    "fst5": 7,
-    "id": 10541,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:10541",
-}
-
-rest_dict["BtsI"] = {
-    "charac": (8, 0, None, None, "GCAGTG"),
-    "compsite": "(?=(?P<BtsI>GCAGTG))|(?=(?P<BtsI_as>CACTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 0,
-    "fst5": 8,
-    "id": 3096,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAGTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:3096",
-}
-
-rest_dict["BtsIMutI"] = {
-    "charac": (7, 0, None, None, "CAGTG"),
-    "compsite": "(?=(?P<BtsIMutI>CAGTG))|(?=(?P<BtsIMutI_as>CACTG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 0,
-    "fst5": 7,
-    "id": 28973,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAGTG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:28973",
-}
-
-rest_dict["BtuMI"] = {
-    "charac": (3, -3, None, None, "TCGCGA"),
-    "compsite": "(?=(?P<BtuMI>TCGCGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 11166,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCGCGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:11166",
-}
-
-rest_dict["Bve1B23I"] = {
-    "charac": (None, None, None, None, "GACNNNNNTGG"),
-    "compsite": "(?=(?P<Bve1B23I>GAC.....TGG))|(?=(?P<Bve1B23I_as>CCA.....GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 283053,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNNTGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:283053",
-}
-
-rest_dict["BveI"] = {
-    "charac": (10, 8, None, None, "ACCTGC"),
-    "compsite": "(?=(?P<BveI>ACCTGC))|(?=(?P<BveI_as>GCAGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 8,
-    "fst5": 10,
-    "id": 6224,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCTGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:6224",
-}
-
-rest_dict["Cac8I"] = {
-    "charac": (3, -3, None, None, "GCNNGC"),
-    "compsite": "(?=(?P<Cac8I>GC..GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 638,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNNGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:638",
-}
-
-rest_dict["CaiI"] = {
-    "charac": (6, -6, None, None, "CAGNNNCTG"),
-    "compsite": "(?=(?P<CaiI>CAG...CTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 3194,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAGNNNCTG",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3194",
-}
-
-rest_dict["Cal14237I"] = {
-    "charac": (None, None, None, None, "GGTTAG"),
-    "compsite": "(?=(?P<Cal14237I>GGTTAG))|(?=(?P<Cal14237I_as>CTAACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 31763,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTTAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:31763",
-}
-
-rest_dict["CalB3II"] = {
-    "charac": (None, None, None, None, "GRTTRAG"),
-    "compsite": "(?=(?P<CalB3II>G[AG]TT[AG]AG))|(?=(?P<CalB3II_as>CT[CT]AA[CT]C))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 67589,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRTTRAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:67589",
-}
-
-rest_dict["Cau10061II"] = {
-    "charac": (None, None, None, None, "GTTAAT"),
-    "compsite": "(?=(?P<Cau10061II>GTTAAT))|(?=(?P<Cau10061II_as>ATTAAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 70009,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTAAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:70009",
-}
-
-rest_dict["CauII"] = {
-    "charac": (2, -2, None, None, "CCSGG"),
-    "compsite": "(?=(?P<CauII>CC[CG]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 644,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "S",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCSGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:644",
-}
-
-rest_dict["Cba13II"] = {
-    "charac": (None, None, None, None, "AGGAAT"),
-    "compsite": "(?=(?P<Cba13II>AGGAAT))|(?=(?P<Cba13II_as>ATTCCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 102165,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGGAAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:102165",
-}
-
-rest_dict["Cba16038I"] = {
-    "charac": (None, None, None, None, "CCTNAYNC"),
-    "compsite": "(?=(?P<Cba16038I>CCT.A[CT].C))|(?=(?P<Cba16038I_as>G.[AG]T.AGG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 97723,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNAYNC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:97723",
-}
-
-rest_dict["Cbo67071IV"] = {
-    "charac": (None, None, None, None, "GCRGAAG"),
-    "compsite": "(?=(?P<Cbo67071IV>GC[AG]GAAG))|(?=(?P<Cbo67071IV_as>CTTC[CT]GC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 165809,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCRGAAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:165809",
-}
-
-rest_dict["CcaP7V"] = {
-    "charac": (None, None, None, None, "CRAAAAR"),
-    "compsite": "(?=(?P<CcaP7V>C[AG]AAAA[AG]))|(?=(?P<CcaP7V_as>[CT]TTTT[CT]G))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 116072,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRAAAAR",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:116072",
-}
-
-rest_dict["Cch467III"] = {
-    "charac": (None, None, None, None, "GNGAAAY"),
-    "compsite": "(?=(?P<Cch467III>G.GAAA[CT]))|(?=(?P<Cch467III_as>[AG]TTTC.C))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 216685,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GNGAAAY",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:216685",
-}
-
-rest_dict["CchII"] = {
-    "charac": (17, 9, None, None, "GGARGA"),
-    "compsite": "(?=(?P<CchII>GGA[AG]GA))|(?=(?P<CchII_as>TC[CT]TCC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": 9,
-    "fst5": 17,
-    "id": 24818,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGARGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:24818",
-}
-
-rest_dict["CchIII"] = {
-    "charac": (26, 18, None, None, "CCCAAG"),
-    "compsite": "(?=(?P<CchIII>CCCAAG))|(?=(?P<CchIII_as>CTTGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 24815,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:24815",
-}
-
-rest_dict["CciI"] = {
-    "charac": (1, -1, None, None, "TCATGA"),
-    "compsite": "(?=(?P<CciI>TCATGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 17117,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCATGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:17117",
-}
-
-rest_dict["CciNI"] = {
-    "charac": (2, -2, None, None, "GCGGCCGC"),
-    "compsite": "(?=(?P<CciNI>GCGGCCGC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2673,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGGCCGC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2673",
-}
-
-rest_dict["Cco11366VI"] = {
-    "charac": (None, None, None, None, "GAAGAA"),
-    "compsite": "(?=(?P<Cco11366VI>GAAGAA))|(?=(?P<Cco11366VI_as>TTCTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 421822,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:421822",
-}
-
-rest_dict["Cco11437V"] = {
-    "charac": (None, None, None, None, "CAYNNNNNRTAG"),
-    "compsite": "(?=(?P<Cco11437V>CA[CT].....[AG]TAG))|(?=(?P<Cco11437V_as>CTA[CT].....[AG]TG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 423414,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAYNNNNNRTAG",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:423414",
-}
-
-rest_dict["Cco14983V"] = {
-    "charac": (None, None, None, None, "GGGTDA"),
-    "compsite": "(?=(?P<Cco14983V>GGGT[AGT]A))|(?=(?P<Cco14983V_as>T[ACT]ACCC))",
-    "dna": None,
-    "freq": 1365.3333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 156213,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGTDA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:156213",
-}
-
-rest_dict["Cco14983VI"] = {
-    "charac": (None, None, None, None, "GCYGA"),
-    "compsite": "(?=(?P<Cco14983VI>GC[CT]GA))|(?=(?P<Cco14983VI_as>TC[AG]GC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 156209,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCYGA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:156209",
-}
-
-rest_dict["CcrNAIII"] = {
-    "charac": (None, None, None, None, "CGACCAG"),
-    "compsite": "(?=(?P<CcrNAIII>CGACCAG))|(?=(?P<CcrNAIII_as>CTGGTCG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 19984,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGACCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:19984",
-}
-
-rest_dict["Cdi11397I"] = {
-    "charac": (None, None, None, None, "GCGCAG"),
-    "compsite": "(?=(?P<Cdi11397I>GCGCAG))|(?=(?P<Cdi11397I_as>CTGCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 93952,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:93952",
-}
-
-rest_dict["Cdi13746V"] = {
-    "charac": (None, None, None, None, "RGAAAGR"),
-    "compsite": "(?=(?P<Cdi13746V>[AG]GAAAG[AG]))|(?=(?P<Cdi13746V_as>[CT]CTTTC[CT]))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 422788,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGAAAGR",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:422788",
-}
-
-rest_dict["Cdi13750III"] = {
-    "charac": (None, None, None, None, "CCGATCC"),
-    "compsite": "(?=(?P<Cdi13750III>CCGATCC))|(?=(?P<Cdi13750III_as>GGATCGG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 422822,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGATCC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:422822",
-}
-
-rest_dict["CdiI"] = {
-    "charac": (4, -1, None, None, "CATCG"),
-    "compsite": "(?=(?P<CdiI>CATCG))|(?=(?P<CdiI_as>CGATG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 4,
-    "id": 5297,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATCG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:5297",
-}
-
-rest_dict["CdpI"] = {
-    "charac": (26, 18, None, None, "GCGGAG"),
-    "compsite": "(?=(?P<CdpI>GCGGAG))|(?=(?P<CdpI_as>CTCCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 14868,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:14868",
-}
-
-rest_dict["Cdu23823II"] = {
-    "charac": (None, None, None, None, "GTGAAG"),
-    "compsite": "(?=(?P<Cdu23823II>GTGAAG))|(?=(?P<Cdu23823II_as>CTTCAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 125956,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTGAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:125956",
-}
-
-rest_dict["Cfa8380I"] = {
-    "charac": (None, None, None, None, "GRGGAY"),
-    "compsite": "(?=(?P<Cfa8380I>G[AG]GGA[CT]))|(?=(?P<Cfa8380I_as>[AG]TCC[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 421896,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRGGAY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:421896",
-}
-
-rest_dict["CfoI"] = {
-    "charac": (3, -3, None, None, "GCGC"),
-    "compsite": "(?=(?P<CfoI>GCGC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 654,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("M", "R", "S"),
-    "uri": "https://identifiers.org/rebase:654",
-}
-
-rest_dict["Cfr10I"] = {
-    "charac": (1, -1, None, None, "RCCGGY"),
-    "compsite": "(?=(?P<Cfr10I>[AG]CCGG[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 655,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RCCGGY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:655",
-}
-
-rest_dict["Cfr13I"] = {
-    "charac": (1, -1, None, None, "GGNCC"),
-    "compsite": "(?=(?P<Cfr13I>GG.CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 657,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:657",
-}
-
-rest_dict["Cfr42I"] = {
-    "charac": (4, -4, None, None, "CCGCGG"),
-    "compsite": "(?=(?P<Cfr42I>CCGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 678,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "GC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:678",
-}
-
-rest_dict["Cfr9I"] = {
-    "charac": (1, -1, None, None, "CCCGGG"),
-    "compsite": "(?=(?P<Cfr9I>CCCGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 699,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCGGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:699",
-}
-
-rest_dict["CfrI"] = {
-    "charac": (1, -1, None, None, "YGGCCR"),
-    "compsite": "(?=(?P<CfrI>[CT]GGCC[AG]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 702,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YGGCCR",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:702",
-}
-
-rest_dict["CfrMH13II"] = {
-    "charac": (None, None, None, None, "AGCANCC"),
-    "compsite": "(?=(?P<CfrMH13II>AGCA.CC))|(?=(?P<CfrMH13II_as>GG.TGCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 274395,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCANCC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:274395",
-}
-
-rest_dict["CfrMH16VI"] = {
-    "charac": (None, None, None, None, "CTAAAG"),
-    "compsite": "(?=(?P<CfrMH16VI>CTAAAG))|(?=(?P<CfrMH16VI_as>CTTTAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 274143,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTAAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:274143",
-}
-
-rest_dict["Cfupf3II"] = {
-    "charac": (None, None, None, None, "GARCAG"),
-    "compsite": "(?=(?P<Cfupf3II>GA[AG]CAG))|(?=(?P<Cfupf3II_as>CTG[CT]TC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 85269,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GARCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:85269",
-}
-
-rest_dict["Cgl13032I"] = {
-    "charac": (None, None, None, None, "GGCGCA"),
-    "compsite": "(?=(?P<Cgl13032I>GGCGCA))|(?=(?P<Cgl13032I_as>TGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 47793,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:47793",
-}
-
-rest_dict["Cgl13032II"] = {
-    "charac": (None, None, None, None, "ACGABGG"),
-    "compsite": "(?=(?P<Cgl13032II>ACGA[CGT]GG))|(?=(?P<Cgl13032II_as>CC[ACG]TCGT))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 47799,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGABGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:47799",
-}
-
-rest_dict["ChaI"] = {
-    "charac": (4, -4, None, None, "GATC"),
-    "compsite": "(?=(?P<ChaI>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 2688,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2688",
-}
-
-rest_dict["Cin11811I"] = {
-    "charac": (None, None, None, None, "TGKMCA"),
-    "compsite": "(?=(?P<Cin11811I>TG[GT][AC]CA))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 380986,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGKMCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:380986",
-}
-
-rest_dict["Cje265V"] = {
-    "charac": (None, None, None, None, "GKAAGC"),
-    "compsite": "(?=(?P<Cje265V>G[GT]AAGC))|(?=(?P<Cje265V_as>GCTT[AC]C))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 208512,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GKAAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:208512",
-}
-
-rest_dict["Cje54107III"] = {
-    "charac": (None, None, None, None, "GKAAYC"),
-    "compsite": "(?=(?P<Cje54107III>G[GT]AA[CT]C))|(?=(?P<Cje54107III_as>G[AG]TT[AC]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 244034,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GKAAYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:244034",
-}
-
-rest_dict["CjeFIII"] = {
-    "charac": (None, None, None, None, "GCAAGG"),
-    "compsite": "(?=(?P<CjeFIII>GCAAGG))|(?=(?P<CjeFIII_as>CCTTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 12350,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAAGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:12350",
-}
-
-rest_dict["CjeFV"] = {
-    "charac": (None, None, None, None, "GGRCA"),
-    "compsite": "(?=(?P<CjeFV>GG[AG]CA))|(?=(?P<CjeFV_as>TG[CT]CC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 12351,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGRCA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:12351",
-}
-
-rest_dict["CjeI"] = {
-    "charac": (-8, -25, 26, 9, "CCANNNNNNGT"),
-    "compsite": "(?=(?P<CjeI>CCA......GT))|(?=(?P<CjeI_as>AC......TGG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -25,
-    "fst5": -8,
-    "id": 2466,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 6,
-    "ovhgseq": "NNNNNN",
-    "results": None,
-    "scd3": 9,
-    "scd5": 26,
-    "site": "CCANNNNNNGT",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2466",
-}
-
-rest_dict["CjeNII"] = {
-    "charac": (None, None, None, None, "GAGNNNNNGT"),
-    "compsite": "(?=(?P<CjeNII>GAG.....GT))|(?=(?P<CjeNII_as>AC.....CTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 4509,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGNNNNNGT",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4509",
-}
-
-rest_dict["CjeNIII"] = {
-    "charac": (25, 17, None, None, "GKAAYG"),
-    "compsite": "(?=(?P<CjeNIII>G[GT]AA[CT]G))|(?=(?P<CjeNIII_as>C[AG]TT[AC]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 17,
-    "fst5": 25,
-    "id": 4511,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GKAAYG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4511",
-}
-
-rest_dict["CjeNV"] = {
-    "charac": (None, None, None, None, "CCYGA"),
-    "compsite": "(?=(?P<CjeNV>CC[CT]GA))|(?=(?P<CjeNV_as>TC[AG]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 151041,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCYGA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:151041",
-}
-
-rest_dict["CjeP659IV"] = {
-    "charac": (None, None, None, None, "CACNNNNNNNGAA"),
-    "compsite": "(?=(?P<CjeP659IV>CAC.......GAA))|(?=(?P<CjeP659IV_as>TTC.......GTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 28974,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACNNNNNNNGAA",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:28974",
-}
-
-rest_dict["CjePI"] = {
-    "charac": (-7, -25, 26, 8, "CCANNNNNNNTC"),
-    "compsite": "(?=(?P<CjePI>CCA.......TC))|(?=(?P<CjePI_as>GA.......TGG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -25,
-    "fst5": -7,
-    "id": 2467,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 6,
-    "ovhgseq": "NNNNNN",
-    "results": None,
-    "scd3": 8,
-    "scd5": 26,
-    "site": "CCANNNNNNNTC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2467",
-}
-
-rest_dict["CjuI"] = {
-    "charac": (None, None, None, None, "CAYNNNNNRTG"),
-    "compsite": "(?=(?P<CjuI>CA[CT].....[AG]TG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 10921,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAYNNNNNRTG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:10921",
-}
-
-rest_dict["CjuII"] = {
-    "charac": (None, None, None, None, "CAYNNNNNCTC"),
-    "compsite": "(?=(?P<CjuII>CA[CT].....CTC))|(?=(?P<CjuII_as>GAG.....[AG]TG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 11659,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAYNNNNNCTC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:11659",
-}
-
-rest_dict["Cko11077IV"] = {
-    "charac": (None, None, None, None, "TGACAG"),
-    "compsite": "(?=(?P<Cko11077IV>TGACAG))|(?=(?P<Cko11077IV_as>CTGTCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 422663,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGACAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:422663",
-}
-
-rest_dict["Cla11845III"] = {
-    "charac": (None, None, None, None, "GCGAA"),
-    "compsite": "(?=(?P<Cla11845III>GCGAA))|(?=(?P<Cla11845III_as>TTCGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 101409,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGAA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:101409",
-}
-
-rest_dict["ClaI"] = {
-    "charac": (2, -2, None, None, "ATCGAT"),
-    "compsite": "(?=(?P<ClaI>ATCGAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 716,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATCGAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K", "M", "N", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:716",
-}
-
-rest_dict["Cly7489II"] = {
-    "charac": (None, None, None, None, "AAAAGRG"),
-    "compsite": "(?=(?P<Cly7489II>AAAAG[AG]G))|(?=(?P<Cly7489II_as>C[CT]CTTTT))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 33132,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AAAAGRG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:33132",
-}
-
-rest_dict["Cpe10578V"] = {
-    "charac": (None, None, None, None, "GANGAGY"),
-    "compsite": "(?=(?P<Cpe10578V>GA.GAG[CT]))|(?=(?P<Cpe10578V_as>[AG]CTC.TC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 422833,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GANGAGY",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:422833",
-}
-
-rest_dict["Cpe13170II"] = {
-    "charac": (None, None, None, None, "GTTGNAG"),
-    "compsite": "(?=(?P<Cpe13170II>GTTG.AG))|(?=(?P<Cpe13170II_as>CT.CAAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 253771,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTGNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:253771",
-}
-
-rest_dict["Cpe2837III"] = {
-    "charac": (None, None, None, None, "GRNACAYT"),
-    "compsite": "(?=(?P<Cpe2837III>G[AG].ACA[CT]T))|(?=(?P<Cpe2837III_as>A[AG]TGT.[CT]C))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 253794,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRNACAYT",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:253794",
-}
-
-rest_dict["CpoI"] = {
-    "charac": (2, -2, None, None, "CGGWCCG"),
-    "compsite": "(?=(?P<CpoI>CGG[AT]CCG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 731,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGWCCG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:731",
-}
-
-rest_dict["Cre7908I"] = {
-    "charac": (None, None, None, None, "GCGGGA"),
-    "compsite": "(?=(?P<Cre7908I>GCGGGA))|(?=(?P<Cre7908I_as>TCCCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 253772,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:253772",
-}
-
-rest_dict["Csa9238II"] = {
-    "charac": (None, None, None, None, "CAAANTC"),
-    "compsite": "(?=(?P<Csa9238II>CAAA.TC))|(?=(?P<Csa9238II_as>GA.TTTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 429683,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAAANTC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:429683",
-}
-
-rest_dict["CseI"] = {
-    "charac": (10, 10, None, None, "GACGC"),
-    "compsite": "(?=(?P<CseI>GACGC))|(?=(?P<CseI_as>GCGTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 10,
-    "fst5": 10,
-    "id": 10691,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:10691",
-}
-
-rest_dict["CsiI"] = {
-    "charac": (1, -1, None, None, "ACCWGGT"),
-    "compsite": "(?=(?P<CsiI>ACC[AT]GGT))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 17997,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCWGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCWGGT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:17997",
-}
-
-rest_dict["Csp2014I"] = {
-    "charac": (None, None, None, None, "GGAGGC"),
-    "compsite": "(?=(?P<Csp2014I>GGAGGC))|(?=(?P<Csp2014I_as>GCCTCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 96077,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGAGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:96077",
-}
-
-rest_dict["Csp6I"] = {
-    "charac": (1, -1, None, None, "GTAC"),
-    "compsite": "(?=(?P<Csp6I>GTAC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 738,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTAC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:738",
-}
-
-rest_dict["CspAI"] = {
-    "charac": (1, -1, None, None, "ACCGGT"),
-    "compsite": "(?=(?P<CspAI>ACCGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2770,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCGGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:2770",
-}
-
-rest_dict["CspBP25III"] = {
-    "charac": (None, None, None, None, "CCANNNNNRTGA"),
-    "compsite": "(?=(?P<CspBP25III>CCA.....[AG]TGA))|(?=(?P<CspBP25III_as>TCA[CT].....TGG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 618871,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCANNNNNRTGA",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:618871",
-}
-
-rest_dict["CspCI"] = {
-    "charac": (-11, -25, 24, 10, "CAANNNNNGTGG"),
-    "compsite": "(?=(?P<CspCI>CAA.....GTGG))|(?=(?P<CspCI_as>CCAC.....TTG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": -25,
-    "fst5": -11,
-    "id": 5047,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": 10,
-    "scd5": 24,
-    "site": "CAANNNNNGTGG",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:5047",
-}
-
-rest_dict["CspI"] = {
-    "charac": (2, -2, None, None, "CGGWCCG"),
-    "compsite": "(?=(?P<CspI>CGG[AT]CCG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 739,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGWCCG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("R",),
-    "uri": "https://identifiers.org/rebase:739",
-}
-
-rest_dict["CspL61I"] = {
-    "charac": (None, None, None, None, "TYGAYCT"),
-    "compsite": "(?=(?P<CspL61I>T[CT]GA[CT]CT))|(?=(?P<CspL61I_as>AG[AG]TC[AG]A))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 501298,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TYGAYCT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:501298",
-}
-
-rest_dict["CspX1II"] = {
-    "charac": (None, None, None, None, "ACCCCA"),
-    "compsite": "(?=(?P<CspX1II>ACCCCA))|(?=(?P<CspX1II_as>TGGGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 618749,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:618749",
-}
-
-rest_dict["CstMI"] = {
-    "charac": (26, 18, None, None, "AAGGAG"),
-    "compsite": "(?=(?P<CstMI>AAGGAG))|(?=(?P<CstMI_as>CTCCTT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 7165,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AAGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:7165",
-}
-
-rest_dict["CviAII"] = {
-    "charac": (1, -1, None, None, "CATG"),
-    "compsite": "(?=(?P<CviAII>CATG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2211,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2211",
-}
-
-rest_dict["CviJI"] = {
-    "charac": (2, -2, None, None, "RGCY"),
-    "compsite": "(?=(?P<CviJI>[AG]GC[CT]))",
-    "dna": None,
-    "freq": 64.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 760,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGCY",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("Q", "X"),
-    "uri": "https://identifiers.org/rebase:760",
-}
-
-rest_dict["CviKI_1"] = {
-    "charac": (2, -2, None, None, "RGCY"),
-    "compsite": "(?=(?P<CviKI_1>[AG]GC[CT]))",
-    "dna": None,
-    "freq": 64.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": None,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGCY",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": None,
-}
-
-rest_dict["CviQI"] = {
-    "charac": (1, -1, None, None, "GTAC"),
-    "compsite": "(?=(?P<CviQI>GTAC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 766,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTAC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:766",
-}
-
-rest_dict["CviRI"] = {
-    "charac": (2, -2, None, None, "TGCA"),
-    "compsite": "(?=(?P<CviRI>TGCA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 767,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGCA",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:767",
-}
-
-rest_dict["Dde51507I"] = {
-    "charac": (None, None, None, None, "CCWGG"),
-    "compsite": "(?=(?P<Dde51507I>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 43352,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:43352",
-}
-
-rest_dict["DdeI"] = {
-    "charac": (1, -1, None, None, "CTNAG"),
-    "compsite": "(?=(?P<DdeI>CT.AG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 770,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTNAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("K", "M", "N", "O", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:770",
-}
-
-rest_dict["DinI"] = {
-    "charac": (3, -3, None, None, "GGCGCC"),
-    "compsite": "(?=(?P<DinI>GGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 11070,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:11070",
-}
-
-rest_dict["Dpi3069I"] = {
-    "charac": (None, None, None, None, "GACAG"),
-    "compsite": "(?=(?P<Dpi3069I>GACAG))|(?=(?P<Dpi3069I_as>CTGTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 317442,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:317442",
-}
-
-rest_dict["Dpi3084I"] = {
-    "charac": (None, None, None, None, "CGRAG"),
-    "compsite": "(?=(?P<Dpi3084I>CG[AG]AG))|(?=(?P<Dpi3084I_as>CT[CT]CG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 271821,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGRAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:271821",
-}
-
-rest_dict["Dpi3090II"] = {
-    "charac": (None, None, None, None, "AAGRAG"),
-    "compsite": "(?=(?P<Dpi3090II>AAG[AG]AG))|(?=(?P<Dpi3090II_as>CT[CT]CTT))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 271629,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AAGRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:271629",
-}
-
-rest_dict["DpnI"] = {
-    "charac": (2, -2, None, None, "GATC"),
-    "compsite": "(?=(?P<DpnI>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 776,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "E", "K", "M", "N", "O", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:776",
-}
-
-rest_dict["DpnII"] = {
-    "charac": (0, 0, None, None, "GATC"),
-    "compsite": "(?=(?P<DpnII>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 777,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:777",
-}
-
-rest_dict["DraI"] = {
-    "charac": (3, -3, None, None, "TTTAAA"),
-    "compsite": "(?=(?P<DraI>TTTAAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 778,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTTAAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "J", "K", "M", "N", "Q", "S", "V", "X"),
-    "uri": "https://identifiers.org/rebase:778",
-}
-
-rest_dict["DraII"] = {
-    "charac": (2, -2, None, None, "RGGNCCY"),
-    "compsite": "(?=(?P<DraII>[AG]GG.CC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 779,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGGNCCY",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:779",
-}
-
-rest_dict["DraIII"] = {
-    "charac": (6, -6, None, None, "CACNNNGTG"),
-    "compsite": "(?=(?P<DraIII>CAC...GTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 780,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACNNNGTG",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": ("I", "M", "N", "V"),
-    "uri": "https://identifiers.org/rebase:780",
-}
-
-rest_dict["DraRI"] = {
-    "charac": (27, 18, None, None, "CAAGNAC"),
-    "compsite": "(?=(?P<DraRI>CAAG.AC))|(?=(?P<DraRI_as>GT.CTTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 27,
-    "id": 13702,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAAGNAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:13702",
-}
-
-rest_dict["DrdI"] = {
-    "charac": (7, -7, None, None, "GACNNNNNNGTC"),
-    "compsite": "(?=(?P<DrdI>GAC......GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 787,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNNNGTC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:787",
-}
-
-rest_dict["DrdII"] = {
-    "charac": (None, None, None, None, "GAACCA"),
-    "compsite": "(?=(?P<DrdII>GAACCA))|(?=(?P<DrdII_as>TGGTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 788,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAACCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:788",
-}
-
-rest_dict["DrdIV"] = {
-    "charac": (26, 18, None, None, "TACGAC"),
-    "compsite": "(?=(?P<DrdIV>TACGAC))|(?=(?P<DrdIV_as>GTCGTA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 15492,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TACGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:15492",
-}
-
-rest_dict["DrdV"] = {
-    "charac": (17, 8, None, None, "CATGNAC"),
-    "compsite": "(?=(?P<DrdV>CATG.AC))|(?=(?P<DrdV_as>GT.CATG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 8,
-    "fst5": 17,
-    "id": 21570,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATGNAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:21570",
-}
-
-rest_dict["DrdVI"] = {
-    "charac": (None, None, None, None, "GCAGCC"),
-    "compsite": "(?=(?P<DrdVI>GCAGCC))|(?=(?P<DrdVI_as>GGCTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 33637,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:33637",
-}
-
-rest_dict["DrdVIII"] = {
-    "charac": (None, None, None, None, "ARGAGC"),
-    "compsite": "(?=(?P<DrdVIII>A[AG]GAGC))|(?=(?P<DrdVIII_as>GCTC[CT]T))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 60181,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ARGAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:60181",
-}
-
-rest_dict["DriI"] = {
-    "charac": (6, -6, None, None, "GACNNNNNGTC"),
-    "compsite": "(?=(?P<DriI>GAC.....GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 7493,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNNGTC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:7493",
-}
-
-rest_dict["DsaI"] = {
-    "charac": (1, -1, None, None, "CCRYGG"),
-    "compsite": "(?=(?P<DsaI>CC[AG][CT]GG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 790,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CRYG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCRYGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:790",
-}
-
-rest_dict["DseDI"] = {
-    "charac": (7, -7, None, None, "GACNNNNNNGTC"),
-    "compsite": "(?=(?P<DseDI>GAC......GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 2859,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNNNGTC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2859",
-}
-
-rest_dict["DspS02II"] = {
-    "charac": (None, None, None, None, "TGCCGAC"),
-    "compsite": "(?=(?P<DspS02II>TGCCGAC))|(?=(?P<DspS02II_as>GTCGGCA))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 451105,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGCCGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:451105",
-}
-
-rest_dict["DvuIII"] = {
-    "charac": (None, None, None, None, "CACNCAC"),
-    "compsite": "(?=(?P<DvuIII>CAC.CAC))|(?=(?P<DvuIII_as>GTG.GTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 7926,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACNCAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:7926",
-}
-
-rest_dict["EaeI"] = {
-    "charac": (1, -1, None, None, "YGGCCR"),
-    "compsite": "(?=(?P<EaeI>[CT]GGCC[AG]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 800,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YGGCCR",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K", "N"),
-    "uri": "https://identifiers.org/rebase:800",
-}
-
-rest_dict["EagI"] = {
-    "charac": (1, -1, None, None, "CGGCCG"),
-    "compsite": "(?=(?P<EagI>CGGCCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 802,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGCCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:802",
-}
-
-rest_dict["Eam1104I"] = {
-    "charac": (7, 4, None, None, "CTCTTC"),
-    "compsite": "(?=(?P<Eam1104I>CTCTTC))|(?=(?P<Eam1104I_as>GAAGAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 4,
-    "fst5": 7,
-    "id": 805,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCTTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:805",
-}
-
-rest_dict["Eam1105I"] = {
-    "charac": (6, -6, None, None, "GACNNNNNGTC"),
-    "compsite": "(?=(?P<Eam1105I>GAC.....GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 806,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNNGTC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:806",
-}
-
-rest_dict["EarI"] = {
-    "charac": (7, 4, None, None, "CTCTTC"),
-    "compsite": "(?=(?P<EarI>CTCTTC))|(?=(?P<EarI_as>GAAGAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 4,
-    "fst5": 7,
-    "id": 807,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCTTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:807",
-}
-
-rest_dict["EciI"] = {
-    "charac": (17, 9, None, None, "GGCGGA"),
-    "compsite": "(?=(?P<EciI>GGCGGA))|(?=(?P<EciI_as>TCCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 9,
-    "fst5": 17,
-    "id": 817,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:817",
-}
-
-rest_dict["Ecl136II"] = {
-    "charac": (3, -3, None, None, "GAGCTC"),
-    "compsite": "(?=(?P<Ecl136II>GAGCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 820,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:820",
-}
-
-rest_dict["Ecl234I"] = {
-    "charac": (None, None, None, None, "CGGNAAG"),
-    "compsite": "(?=(?P<Ecl234I>CGG.AAG))|(?=(?P<Ecl234I_as>CTT.CCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 251717,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGNAAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:251717",
-}
-
-rest_dict["Ecl35734I"] = {
-    "charac": (None, None, None, None, "GAAAYTC"),
-    "compsite": "(?=(?P<Ecl35734I>GAAA[CT]TC))|(?=(?P<Ecl35734I_as>GA[AG]TTTC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 102089,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAAYTC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:102089",
-}
-
-rest_dict["EclXI"] = {
-    "charac": (1, -1, None, None, "CGGCCG"),
-    "compsite": "(?=(?P<EclXI>CGGCCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 834,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGCCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("S",),
-    "uri": "https://identifiers.org/rebase:834",
-}
-
-rest_dict["Eco105I"] = {
-    "charac": (3, -3, None, None, "TACGTA"),
-    "compsite": "(?=(?P<Eco105I>TACGTA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 838,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TACGTA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:838",
-}
-
-rest_dict["Eco130I"] = {
-    "charac": (1, -1, None, None, "CCWWGG"),
-    "compsite": "(?=(?P<Eco130I>CC[AT][AT]GG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 849,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CWWG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWWGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:849",
-}
-
-rest_dict["Eco147I"] = {
-    "charac": (3, -3, None, None, "AGGCCT"),
-    "compsite": "(?=(?P<Eco147I>AGGCCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 853,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGGCCT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:853",
-}
-
-rest_dict["Eco1836I"] = {
-    "charac": (None, None, None, None, "CACANTT"),
-    "compsite": "(?=(?P<Eco1836I>CACA.TT))|(?=(?P<Eco1836I_as>AA.TGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 462575,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACANTT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:462575",
-}
-
-rest_dict["Eco24I"] = {
-    "charac": (5, -5, None, None, "GRGCYC"),
-    "compsite": "(?=(?P<Eco24I>G[AG]GC[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 910,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "RGCY",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRGCYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:910",
-}
-
-rest_dict["Eco31I"] = {
-    "charac": (7, 5, None, None, "GGTCTC"),
-    "compsite": "(?=(?P<Eco31I>GGTCTC))|(?=(?P<Eco31I_as>GAGACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 5,
-    "fst5": 7,
-    "id": 921,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:921",
-}
-
-rest_dict["Eco32I"] = {
-    "charac": (3, -3, None, None, "GATATC"),
-    "compsite": "(?=(?P<Eco32I>GATATC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 922,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATATC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:922",
-}
-
-rest_dict["Eco4174I"] = {
-    "charac": (None, None, None, None, "GCACAG"),
-    "compsite": "(?=(?P<Eco4174I>GCACAG))|(?=(?P<Eco4174I_as>CTGTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 433432,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCACAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:433432",
-}
-
-rest_dict["Eco43896II"] = {
-    "charac": (None, None, None, None, "CRARCAG"),
-    "compsite": "(?=(?P<Eco43896II>C[AG]A[AG]CAG))|(?=(?P<Eco43896II_as>CTG[CT]T[CT]G))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 219464,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRARCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:219464",
-}
-
-rest_dict["Eco4465II"] = {
-    "charac": (None, None, None, None, "GAAABCC"),
-    "compsite": "(?=(?P<Eco4465II>GAAA[CGT]CC))|(?=(?P<Eco4465II_as>GG[ACG]TTTC))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 148173,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAABCC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:148173",
-}
-
-rest_dict["Eco47I"] = {
-    "charac": (1, -1, None, None, "GGWCC"),
-    "compsite": "(?=(?P<Eco47I>GG[AT]CC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 930,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGWCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:930",
-}
-
-rest_dict["Eco47III"] = {
-    "charac": (3, -3, None, None, "AGCGCT"),
-    "compsite": "(?=(?P<Eco47III>AGCGCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 932,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCGCT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "M", "S"),
-    "uri": "https://identifiers.org/rebase:932",
-}
-
-rest_dict["Eco52I"] = {
-    "charac": (1, -1, None, None, "CGGCCG"),
-    "compsite": "(?=(?P<Eco52I>CGGCCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 938,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGCCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:938",
-}
-
-rest_dict["Eco53kI"] = {
-    "charac": (3, -3, None, None, "GAGCTC"),
-    "compsite": "(?=(?P<Eco53kI>GAGCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 3177,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:3177",
-}
-
-rest_dict["Eco57I"] = {
-    "charac": (22, 14, None, None, "CTGAAG"),
-    "compsite": "(?=(?P<Eco57I>CTGAAG))|(?=(?P<Eco57I_as>CTTCAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 14,
-    "fst5": 22,
-    "id": 941,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTGAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:941",
-}
-
-rest_dict["Eco57MI"] = {
-    "charac": (22, 14, None, None, "CTGRAG"),
-    "compsite": "(?=(?P<Eco57MI>CTG[AG]AG))|(?=(?P<Eco57MI_as>CT[CT]CAG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": 14,
-    "fst5": 22,
-    "id": 5034,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTGRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:5034",
-}
-
-rest_dict["Eco72I"] = {
-    "charac": (3, -3, None, None, "CACGTG"),
-    "compsite": "(?=(?P<Eco72I>CACGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 950,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:950",
-}
-
-rest_dict["Eco8164I"] = {
-    "charac": (None, None, None, None, "GCCKAG"),
-    "compsite": "(?=(?P<Eco8164I>GCC[GT]AG))|(?=(?P<Eco8164I_as>CT[AC]GGC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 433405,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCKAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:433405",
-}
-
-rest_dict["Eco81I"] = {
-    "charac": (2, -2, None, None, "CCTNAGG"),
-    "compsite": "(?=(?P<Eco81I>CCT.AGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 954,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNAGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:954",
-}
-
-rest_dict["Eco88I"] = {
-    "charac": (1, -1, None, None, "CYCGRG"),
-    "compsite": "(?=(?P<Eco88I>C[CT]CG[AG]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 958,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "YCGR",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYCGRG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:958",
-}
-
-rest_dict["Eco9009II"] = {
-    "charac": (None, None, None, None, "GAAANTC"),
-    "compsite": "(?=(?P<Eco9009II>GAAA.TC))|(?=(?P<Eco9009II_as>GA.TTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 434595,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAANTC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:434595",
-}
-
-rest_dict["Eco9020I"] = {
-    "charac": (None, None, None, None, "CGAABTT"),
-    "compsite": "(?=(?P<Eco9020I>CGAA[CGT]TT))|(?=(?P<Eco9020I_as>AA[ACG]TTCG))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 434674,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGAABTT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:434674",
-}
-
-rest_dict["Eco9035I"] = {
-    "charac": (None, None, None, None, "GGGANTT"),
-    "compsite": "(?=(?P<Eco9035I>GGGA.TT))|(?=(?P<Eco9035I_as>AA.TCCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 434664,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGANTT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:434664",
-}
-
-rest_dict["Eco91I"] = {
-    "charac": (1, -1, None, None, "GGTNACC"),
-    "compsite": "(?=(?P<Eco91I>GGT.ACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 960,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GTNAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTNACC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:960",
-}
-
-rest_dict["Eco9699II"] = {
-    "charac": (None, None, None, None, "TAGARC"),
-    "compsite": "(?=(?P<Eco9699II>TAGA[AG]C))|(?=(?P<Eco9699II_as>G[CT]TCTA))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 286445,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TAGARC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:286445",
-}
-
-rest_dict["EcoBLMcrX"] = {
-    "charac": (2, -2, None, None, "RCSRC"),
-    "compsite": "(?=(?P<EcoBLMcrX>[AG]C[CG][AG]C))|(?=(?P<EcoBLMcrX_as>G[CT][CG]G[CT]))",
-    "dna": None,
-    "freq": 128.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 134473,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "S",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RCSRC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:134473",
-}
-
-rest_dict["EcoE1140I"] = {
-    "charac": (None, None, None, None, "ACCYAC"),
-    "compsite": "(?=(?P<EcoE1140I>ACC[CT]AC))|(?=(?P<EcoE1140I_as>GT[AG]GGT))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 96234,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCYAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:96234",
-}
-
-rest_dict["EcoHI"] = {
-    "charac": (0, 0, None, None, "CCSGG"),
-    "compsite": "(?=(?P<EcoHI>CC[CG]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 978,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCSGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCSGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:978",
-}
-
-rest_dict["EcoHSI"] = {
-    "charac": (None, None, None, None, "GGTAAG"),
-    "compsite": "(?=(?P<EcoHSI>GGTAAG))|(?=(?P<EcoHSI_as>CTTACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 16127,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:16127",
-}
-
-rest_dict["EcoICRI"] = {
-    "charac": (3, -3, None, None, "GAGCTC"),
-    "compsite": "(?=(?P<EcoICRI>GAGCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 979,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:979",
-}
-
-rest_dict["EcoMVII"] = {
-    "charac": (None, None, None, None, "CANCATC"),
-    "compsite": "(?=(?P<EcoMVII>CA.CATC))|(?=(?P<EcoMVII_as>GATG.TG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 87918,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CANCATC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:87918",
-}
-
-rest_dict["EcoNI"] = {
-    "charac": (5, -5, None, None, "CCTNNNNNAGG"),
-    "compsite": "(?=(?P<EcoNI>CCT.....AGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 981,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNNNNNAGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:981",
-}
-
-rest_dict["EcoNIH6II"] = {
-    "charac": (None, None, None, None, "ATGAAG"),
-    "compsite": "(?=(?P<EcoNIH6II>ATGAAG))|(?=(?P<EcoNIH6II_as>CTTCAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 231661,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATGAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:231661",
-}
-
-rest_dict["EcoO109I"] = {
-    "charac": (2, -2, None, None, "RGGNCCY"),
-    "compsite": "(?=(?P<EcoO109I>[AG]GG.CC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 982,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGGNCCY",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "N"),
-    "uri": "https://identifiers.org/rebase:982",
-}
-
-rest_dict["EcoO157SI"] = {
-    "charac": (15, 12, None, None, "C"),
-    "compsite": "(?=(?P<EcoO157SI>C))|(?=(?P<EcoO157SI_as>G))",
-    "dna": None,
-    "freq": 4.0,
-    "fst3": 12,
-    "fst5": 15,
-    "id": 101311,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "C",
-    "size": 1,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:101311",
-}
-
-rest_dict["EcoO65I"] = {
-    "charac": (1, -1, None, None, "GGTNACC"),
-    "compsite": "(?=(?P<EcoO65I>GGT.ACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 986,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GTNAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTNACC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:986",
-}
-
-rest_dict["EcoRI"] = {
-    "charac": (1, -1, None, None, "GAATTC"),
-    "compsite": "(?=(?P<EcoRI>GAATTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 993,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAATTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:993",
-}
-
-rest_dict["EcoRII"] = {
-    "charac": (0, 0, None, None, "CCWGG"),
-    "compsite": "(?=(?P<EcoRII>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 994,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCWGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B", "J"),
-    "uri": "https://identifiers.org/rebase:994",
-}
-
-rest_dict["EcoRV"] = {
-    "charac": (3, -3, None, None, "GATATC"),
-    "compsite": "(?=(?P<EcoRV>GATATC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 995,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATATC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X"),
-    "uri": "https://identifiers.org/rebase:995",
-}
-
-rest_dict["EcoT14I"] = {
-    "charac": (1, -1, None, None, "CCWWGG"),
-    "compsite": "(?=(?P<EcoT14I>CC[AT][AT]GG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 997,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CWWG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWWGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:997",
-}
-
-rest_dict["EcoT22I"] = {
-    "charac": (5, -5, None, None, "ATGCAT"),
-    "compsite": "(?=(?P<EcoT22I>ATGCAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 998,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATGCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:998",
-}
-
-rest_dict["EcoT38I"] = {
-    "charac": (5, -5, None, None, "GRGCYC"),
-    "compsite": "(?=(?P<EcoT38I>G[AG]GC[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 999,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "RGCY",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRGCYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J",),
-    "uri": "https://identifiers.org/rebase:999",
-}
-
-rest_dict["EgeI"] = {
-    "charac": (3, -3, None, None, "GGCGCC"),
-    "compsite": "(?=(?P<EgeI>GGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2858,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2858",
-}
-
-rest_dict["EheI"] = {
-    "charac": (3, -3, None, None, "GGCGCC"),
-    "compsite": "(?=(?P<EheI>GGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1004,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1004",
-}
-
-rest_dict["Ehi46392I"] = {
-    "charac": (None, None, None, None, "CCCNNAG"),
-    "compsite": "(?=(?P<Ehi46392I>CCC..AG))|(?=(?P<Ehi46392I_as>CT..GGG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 430001,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCNNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:430001",
-}
-
-rest_dict["Eli8509II"] = {
-    "charac": (None, None, None, None, "CCGGAG"),
-    "compsite": "(?=(?P<Eli8509II>CCGGAG))|(?=(?P<Eli8509II_as>CTCCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 156312,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:156312",
-}
-
-rest_dict["ErhG4T10I"] = {
-    "charac": (None, None, None, None, "CGANNNNNNTC"),
-    "compsite": "(?=(?P<ErhG4T10I>CGA......TC))|(?=(?P<ErhG4T10I_as>GA......TCG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 314610,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGANNNNNNTC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:314610",
-}
-
-rest_dict["ErhI"] = {
-    "charac": (1, -1, None, None, "CCWWGG"),
-    "compsite": "(?=(?P<ErhI>CC[AT][AT]GG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2674,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CWWG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWWGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2674",
-}
-
-rest_dict["EsaBC3I"] = {
-    "charac": (2, -2, None, None, "TCGA"),
-    "compsite": "(?=(?P<EsaBC3I>TCGA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 4634,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCGA",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4634",
-}
-
-rest_dict["EsaSSI"] = {
-    "charac": (None, None, None, None, "GACCAC"),
-    "compsite": "(?=(?P<EsaSSI>GACCAC))|(?=(?P<EsaSSI_as>GTGGTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 14757,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACCAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:14757",
-}
-
-rest_dict["Esp3007I"] = {
-    "charac": (None, None, None, None, "CAGAAG"),
-    "compsite": "(?=(?P<Esp3007I>CAGAAG))|(?=(?P<Esp3007I_as>CTTCTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 77587,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAGAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:77587",
-}
-
-rest_dict["Esp3I"] = {
-    "charac": (7, 5, None, None, "CGTCTC"),
-    "compsite": "(?=(?P<Esp3I>CGTCTC))|(?=(?P<Esp3I_as>GAGACG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 5,
-    "fst5": 7,
-    "id": 1028,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGTCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "N"),
-    "uri": "https://identifiers.org/rebase:1028",
-}
-
-rest_dict["EspI"] = {
-    "charac": (2, -2, None, None, "GCTNAGC"),
-    "compsite": "(?=(?P<EspI>GCT.AGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1036,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTNAGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1036",
-}
-
-rest_dict["FaeI"] = {
-    "charac": (4, -4, None, None, "CATG"),
-    "compsite": "(?=(?P<FaeI>CATG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 11885,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:11885",
-}
-
-rest_dict["FaiI"] = {
-    "charac": (2, -2, None, None, "YATR"),
-    "compsite": "(?=(?P<FaiI>[CT]AT[AG]))",
-    "dna": None,
-    "freq": 64.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 18718,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YATR",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:18718",
-}
-
-rest_dict["FalI"] = {
-    "charac": (-8, -24, 24, 8, "AAGNNNNNCTT"),
-    "compsite": "(?=(?P<FalI>AAG.....CTT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -24,
-    "fst5": -8,
-    "id": 5531,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 8,
-    "scd5": 24,
-    "site": "AAGNNNNNCTT",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:5531",
-}
-
-rest_dict["FaqI"] = {
-    "charac": (15, 14, None, None, "GGGAC"),
-    "compsite": "(?=(?P<FaqI>GGGAC))|(?=(?P<FaqI_as>GTCCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 14,
-    "fst5": 15,
-    "id": 7454,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:7454",
-}
-
-rest_dict["FatI"] = {
-    "charac": (0, 0, None, None, "CATG"),
-    "compsite": "(?=(?P<FatI>CATG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 5536,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:5536",
-}
-
-rest_dict["FauI"] = {
-    "charac": (9, 6, None, None, "CCCGC"),
-    "compsite": "(?=(?P<FauI>CCCGC))|(?=(?P<FauI_as>GCGGG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 6,
-    "fst5": 9,
-    "id": 1038,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:1038",
-}
-
-rest_dict["FauNDI"] = {
-    "charac": (2, -2, None, None, "CATATG"),
-    "compsite": "(?=(?P<FauNDI>CATATG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2736,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATATG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2736",
-}
-
-rest_dict["Fba202Z8II"] = {
-    "charac": (None, None, None, None, "AGAAGG"),
-    "compsite": "(?=(?P<Fba202Z8II>AGAAGG))|(?=(?P<Fba202Z8II_as>CCTTCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 314863,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGAAGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:314863",
-}
-
-rest_dict["FbaI"] = {
-    "charac": (1, -1, None, None, "TGATCA"),
-    "compsite": "(?=(?P<FbaI>TGATCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1039,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGATCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:1039",
-}
-
-rest_dict["FblI"] = {
-    "charac": (2, -2, None, None, "GTMKAC"),
-    "compsite": "(?=(?P<FblI>GT[AC][GT]AC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1040,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "MK",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTMKAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:1040",
-}
-
-rest_dict["Fco1691IV"] = {
-    "charac": (None, None, None, None, "GCVGAG"),
-    "compsite": "(?=(?P<Fco1691IV>GC[ACG]GAG))|(?=(?P<Fco1691IV_as>CTC[CGT]GC))",
-    "dna": None,
-    "freq": 1365.3333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 177611,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCVGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:177611",
-}
-
-rest_dict["FinI"] = {
-    "charac": (None, None, None, None, "GGGAC"),
-    "compsite": "(?=(?P<FinI>GGGAC))|(?=(?P<FinI_as>GTCCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 1044,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1044",
-}
-
-rest_dict["FmuI"] = {
-    "charac": (4, -4, None, None, "GGNCC"),
-    "compsite": "(?=(?P<FmuI>GG.CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 2696,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2696",
-}
-
-rest_dict["Fna13121I"] = {
-    "charac": (None, None, None, None, "TTGAYC"),
-    "compsite": "(?=(?P<Fna13121I>TTGA[CT]C))|(?=(?P<Fna13121I_as>G[AG]TCAA))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 430829,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTGAYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:430829",
-}
-
-rest_dict["Fnu11326II"] = {
-    "charac": (None, None, None, None, "GAGNNNNRTAY"),
-    "compsite": "(?=(?P<Fnu11326II>GAG....[AG]TA[CT]))|(?=(?P<Fnu11326II_as>[AG]TA[CT]....CTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 429953,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGNNNNRTAY",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:429953",
-}
-
-rest_dict["Fnu11326IV"] = {
-    "charac": (None, None, None, None, "CTTAATT"),
-    "compsite": "(?=(?P<Fnu11326IV>CTTAATT))|(?=(?P<Fnu11326IV_as>AATTAAG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 430836,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTAATT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:430836",
-}
-
-rest_dict["Fnu4HI"] = {
-    "charac": (2, -2, None, None, "GCNGC"),
-    "compsite": "(?=(?P<Fnu4HI>GC.GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1048,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1048",
-}
-
-rest_dict["FnuDII"] = {
-    "charac": (2, -2, None, None, "CGCG"),
-    "compsite": "(?=(?P<FnuDII>CGCG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1053,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1053",
-}
-
-rest_dict["FokI"] = {
-    "charac": (14, 13, None, None, "GGATG"),
-    "compsite": "(?=(?P<FokI>GGATG))|(?=(?P<FokI_as>CATCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 13,
-    "fst5": 14,
-    "id": 1056,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "J", "K", "M", "N", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:1056",
-}
-
-rest_dict["FriOI"] = {
-    "charac": (5, -5, None, None, "GRGCYC"),
-    "compsite": "(?=(?P<FriOI>G[AG]GC[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2682,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "RGCY",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRGCYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2682",
-}
-
-rest_dict["FseI"] = {
-    "charac": (6, -6, None, None, "GGCCGGCC"),
-    "compsite": "(?=(?P<FseI>GGCCGGCC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 1059,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCCGGCC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1059",
-}
-
-rest_dict["Fsp4HI"] = {
-    "charac": (2, -2, None, None, "GCNGC"),
-    "compsite": "(?=(?P<Fsp4HI>GC.GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2738,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2738",
-}
-
-rest_dict["FspAI"] = {
-    "charac": (4, -4, None, None, "RTGCGCAY"),
-    "compsite": "(?=(?P<FspAI>[AG]TGCGCA[CT]))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 4756,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RTGCGCAY",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4756",
-}
-
-rest_dict["FspBI"] = {
-    "charac": (1, -1, None, None, "CTAG"),
-    "compsite": "(?=(?P<FspBI>CTAG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 6971,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTAG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:6971",
-}
-
-rest_dict["FspEI"] = {
-    "charac": (14, 16, None, None, "CC"),
-    "compsite": "(?=(?P<FspEI>CC))|(?=(?P<FspEI_as>GG))",
-    "dna": None,
-    "freq": 16.0,
-    "fst3": 16,
-    "fst5": 14,
-    "id": 23359,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CC",
-    "size": 2,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:23359",
-}
-
-rest_dict["FspI"] = {
-    "charac": (3, -3, None, None, "TGCGCA"),
-    "compsite": "(?=(?P<FspI>TGCGCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1063,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGCGCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "N"),
-    "uri": "https://identifiers.org/rebase:1063",
-}
-
-rest_dict["FspPK15I"] = {
-    "charac": (None, None, None, None, "GARGAAG"),
-    "compsite": "(?=(?P<FspPK15I>GA[AG]GAAG))|(?=(?P<FspPK15I_as>CTTC[CT]TC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 166439,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GARGAAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:166439",
-}
-
-rest_dict["FtnUV"] = {
-    "charac": (None, None, None, None, "GAAACA"),
-    "compsite": "(?=(?P<FtnUV>GAAACA))|(?=(?P<FtnUV_as>TGTTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 13984,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAACA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:13984",
-}
-
-rest_dict["GauT27I"] = {
-    "charac": (None, None, None, None, "CGCGCAGG"),
-    "compsite": "(?=(?P<GauT27I>CGCGCAGG))|(?=(?P<GauT27I_as>CCTGCGCG))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 21640,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCGCAGG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:21640",
-}
-
-rest_dict["Gba708II"] = {
-    "charac": (None, None, None, None, "ATGCAC"),
-    "compsite": "(?=(?P<Gba708II>ATGCAC))|(?=(?P<Gba708II_as>GTGCAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 78116,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATGCAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:78116",
-}
-
-rest_dict["GdiII"] = {
-    "charac": (1, -1, None, None, "CGGCCR"),
-    "compsite": "(?=(?P<GdiII>CGGCC[AG]))|(?=(?P<GdiII_as>[CT]GGCCG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1072,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGCCR",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1072",
-}
-
-rest_dict["GlaI"] = {
-    "charac": (2, -2, None, None, "GCGC"),
-    "compsite": "(?=(?P<GlaI>GCGC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 14597,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:14597",
-}
-
-rest_dict["GluI"] = {
-    "charac": (2, -2, None, None, "GCNGC"),
-    "compsite": "(?=(?P<GluI>GC.GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 15187,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:15187",
-}
-
-rest_dict["Gru56503II"] = {
-    "charac": (None, None, None, None, "CARABGC"),
-    "compsite": "(?=(?P<Gru56503II>CA[AG]A[CGT]GC))|(?=(?P<Gru56503II_as>GC[ACG]T[CT]TG))",
-    "dna": None,
-    "freq": 2730.6666666666665,
-    "fst3": None,
-    "fst5": None,
-    "id": 421745,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CARABGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:421745",
-}
-
-rest_dict["GsaI"] = {
-    "charac": (5, -5, None, None, "CCCAGC"),
-    "compsite": "(?=(?P<GsaI>CCCAGC))|(?=(?P<GsaI_as>GCTGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 17118,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CCAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:17118",
-}
-
-rest_dict["GsuI"] = {
-    "charac": (22, 14, None, None, "CTGGAG"),
-    "compsite": "(?=(?P<GsuI>CTGGAG))|(?=(?P<GsuI_as>CTCCAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 14,
-    "fst5": 22,
-    "id": 1085,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1085",
-}
-
-rest_dict["GsuPI"] = {
-    "charac": (None, None, None, None, "GTACAG"),
-    "compsite": "(?=(?P<GsuPI>GTACAG))|(?=(?P<GsuPI_as>CTGTAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 17641,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTACAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:17641",
-}
-
-rest_dict["HaeI"] = {
-    "charac": (3, -3, None, None, "WGGCCW"),
-    "compsite": "(?=(?P<HaeI>[AT]GGCC[AT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1087,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "WGGCCW",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1087",
-}
-
-rest_dict["HaeII"] = {
-    "charac": (5, -5, None, None, "RGCGCY"),
-    "compsite": "(?=(?P<HaeII>[AG]GCGC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1088,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "GCGC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGCGCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "K", "N"),
-    "uri": "https://identifiers.org/rebase:1088",
-}
-
-rest_dict["HaeIII"] = {
-    "charac": (2, -2, None, None, "GGCC"),
-    "compsite": "(?=(?P<HaeIII>GGCC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1089,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:1089",
-}
-
-rest_dict["HapII"] = {
-    "charac": (1, -1, None, None, "CCGG"),
-    "compsite": "(?=(?P<HapII>CCGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1094,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:1094",
-}
-
-rest_dict["HauII"] = {
-    "charac": (17, 9, None, None, "TGGCCA"),
-    "compsite": "(?=(?P<HauII>TGGCCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 9,
-    "fst5": 17,
-    "id": 20893,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGGCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:20893",
-}
-
-rest_dict["HbaII"] = {
-    "charac": (None, None, None, None, "GCCCAG"),
-    "compsite": "(?=(?P<HbaII>GCCCAG))|(?=(?P<HbaII_as>CTGGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 21444,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:21444",
-}
-
-rest_dict["Hca13221V"] = {
-    "charac": (None, None, None, None, "CACNNNNNRTAY"),
-    "compsite": "(?=(?P<Hca13221V>CAC.....[AG]TA[CT]))|(?=(?P<Hca13221V_as>[AG]TA[CT].....GTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 431204,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACNNNNNRTAY",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:431204",
-}
-
-rest_dict["HdeNY26I"] = {
-    "charac": (None, None, None, None, "CGANNNNNNTCC"),
-    "compsite": "(?=(?P<HdeNY26I>CGA......TCC))|(?=(?P<HdeNY26I_as>GGA......TCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 224970,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGANNNNNNTCC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:224970",
-}
-
-rest_dict["HdeZA17I"] = {
-    "charac": (None, None, None, None, "GCANNNNNNTCC"),
-    "compsite": "(?=(?P<HdeZA17I>GCA......TCC))|(?=(?P<HdeZA17I_as>GGA......TGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 224977,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCANNNNNNTCC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:224977",
-}
-
-rest_dict["HgaI"] = {
-    "charac": (10, 10, None, None, "GACGC"),
-    "compsite": "(?=(?P<HgaI>GACGC))|(?=(?P<HgaI_as>GCGTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 10,
-    "fst5": 10,
-    "id": 1096,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:1096",
-}
-
-rest_dict["HgiAI"] = {
-    "charac": (5, -5, None, None, "GWGCWC"),
-    "compsite": "(?=(?P<HgiAI>G[AT]GC[AT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1097,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "WGCW",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GWGCWC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1097",
-}
-
-rest_dict["HgiCI"] = {
-    "charac": (1, -1, None, None, "GGYRCC"),
-    "compsite": "(?=(?P<HgiCI>GG[CT][AG]CC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1099,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GYRC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGYRCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1099",
-}
-
-rest_dict["HgiEII"] = {
-    "charac": (None, None, None, None, "ACCNNNNNNGGT"),
-    "compsite": "(?=(?P<HgiEII>ACC......GGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 1105,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCNNNNNNGGT",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1105",
-}
-
-rest_dict["HgiJII"] = {
-    "charac": (5, -5, None, None, "GRGCYC"),
-    "compsite": "(?=(?P<HgiJII>G[AG]GC[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1113,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "RGCY",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRGCYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1113",
-}
-
-rest_dict["HhaI"] = {
-    "charac": (3, -3, None, None, "GCGC"),
-    "compsite": "(?=(?P<HhaI>GCGC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1117,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "N", "Q", "R", "X"),
-    "uri": "https://identifiers.org/rebase:1117",
-}
-
-rest_dict["Hin1I"] = {
-    "charac": (2, -2, None, None, "GRCGYC"),
-    "compsite": "(?=(?P<Hin1I>G[AG]CG[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1128,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRCGYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:1128",
-}
-
-rest_dict["Hin1II"] = {
-    "charac": (4, -4, None, None, "CATG"),
-    "compsite": "(?=(?P<Hin1II>CATG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1129,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1129",
-}
-
-rest_dict["Hin4I"] = {
-    "charac": (-8, -24, 24, 8, "GAYNNNNNVTC"),
-    "compsite": "(?=(?P<Hin4I>GA[CT].....[ACG]TC))|(?=(?P<Hin4I_as>GA[CGT].....[AG]TC))",
-    "dna": None,
-    "freq": 682.6666666666666,
-    "fst3": -24,
-    "fst5": -8,
-    "id": 2577,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 8,
-    "scd5": 24,
-    "site": "GAYNNNNNVTC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2577",
-}
-
-rest_dict["Hin4II"] = {
-    "charac": (11, 5, None, None, "CCTTC"),
-    "compsite": "(?=(?P<Hin4II>CCTTC))|(?=(?P<Hin4II_as>GAAGG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 11,
-    "id": 5045,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:5045",
-}
-
-rest_dict["Hin6I"] = {
-    "charac": (1, -1, None, None, "GCGC"),
-    "compsite": "(?=(?P<Hin6I>GCGC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1135,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1135",
-}
-
-rest_dict["HinP1I"] = {
-    "charac": (1, -1, None, None, "GCGC"),
-    "compsite": "(?=(?P<HinP1I>GCGC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1144,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1144",
-}
-
-rest_dict["HincII"] = {
-    "charac": (3, -3, None, None, "GTYRAC"),
-    "compsite": "(?=(?P<HincII>GT[CT][AG]AC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1148,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTYRAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "N", "O", "Q", "X"),
-    "uri": "https://identifiers.org/rebase:1148",
-}
-
-rest_dict["HindII"] = {
-    "charac": (3, -3, None, None, "GTYRAC"),
-    "compsite": "(?=(?P<HindII>GT[CT][AG]AC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1150,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTYRAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "M", "S", "V"),
-    "uri": "https://identifiers.org/rebase:1150",
-}
-
-rest_dict["HindIII"] = {
-    "charac": (1, -1, None, None, "AAGCTT"),
-    "compsite": "(?=(?P<HindIII>AAGCTT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1151,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AGCT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AAGCTT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:1151",
-}
-
-rest_dict["HinfI"] = {
-    "charac": (1, -1, None, None, "GANTC"),
-    "compsite": "(?=(?P<HinfI>GA.TC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1154,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "ANT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GANTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:1154",
-}
-
-rest_dict["HpaI"] = {
-    "charac": (3, -3, None, None, "GTTAAC"),
-    "compsite": "(?=(?P<HpaI>GTTAAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1158,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTAAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "Q", "S", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1158",
-}
-
-rest_dict["HpaII"] = {
-    "charac": (1, -1, None, None, "CCGG"),
-    "compsite": "(?=(?P<HpaII>CCGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1159,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "N", "Q", "R", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1159",
-}
-
-rest_dict["HphI"] = {
-    "charac": (13, 7, None, None, "GGTGA"),
-    "compsite": "(?=(?P<HphI>GGTGA))|(?=(?P<HphI_as>TCACC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 7,
-    "fst5": 13,
-    "id": 1160,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTGA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B", "N"),
-    "uri": "https://identifiers.org/rebase:1160",
-}
-
-rest_dict["Hpy166II"] = {
-    "charac": (3, -3, None, None, "GTNNAC"),
-    "compsite": "(?=(?P<Hpy166II>GT..AC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 4197,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTNNAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4197",
-}
-
-rest_dict["Hpy178III"] = {
-    "charac": (2, -2, None, None, "TCNNGA"),
-    "compsite": "(?=(?P<Hpy178III>TC..GA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 3249,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCNNGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:3249",
-}
-
-rest_dict["Hpy188I"] = {
-    "charac": (3, -3, None, None, "TCNGA"),
-    "compsite": "(?=(?P<Hpy188I>TC.GA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 3252,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCNGA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:3252",
-}
-
-rest_dict["Hpy188III"] = {
-    "charac": (2, -2, None, None, "TCNNGA"),
-    "compsite": "(?=(?P<Hpy188III>TC..GA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 4152,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCNNGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4152",
-}
-
-rest_dict["Hpy300XI"] = {
-    "charac": (None, None, None, None, "CCTYNA"),
-    "compsite": "(?=(?P<Hpy300XI>CCT[CT].A))|(?=(?P<Hpy300XI_as>T.[AG]AGG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 211704,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTYNA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:211704",
-}
-
-rest_dict["Hpy8I"] = {
-    "charac": (3, -3, None, None, "GTNNAC"),
-    "compsite": "(?=(?P<Hpy8I>GT..AC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 4002,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTNNAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4002",
-}
-
-rest_dict["Hpy99I"] = {
-    "charac": (5, -5, None, None, "CGWCG"),
-    "compsite": "(?=(?P<Hpy99I>CG[AT]CG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 4194,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "CGWCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGWCG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4194",
-}
-
-rest_dict["Hpy99XIII"] = {
-    "charac": (None, None, None, None, "GCCTA"),
-    "compsite": "(?=(?P<Hpy99XIII>GCCTA))|(?=(?P<Hpy99XIII_as>TAGGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 4062,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCTA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4062",
-}
-
-rest_dict["Hpy99XIV"] = {
-    "charac": (None, None, None, None, "GGWTAA"),
-    "compsite": "(?=(?P<Hpy99XIV>GG[AT]TAA))|(?=(?P<Hpy99XIV_as>TTA[AT]CC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 67181,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGWTAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:67181",
-}
-
-rest_dict["Hpy99XIV_mut1"] = {
-    "charac": (None, None, None, None, "GGWCNA"),
-    "compsite": "(?=(?P<Hpy99XIV_mut1>GG[AT]C.A))|(?=(?P<Hpy99XIV_mut1_as>T.G[AT]CC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": None,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGWCNA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": None,
-}
-
-rest_dict["Hpy99XXII"] = {
-    "charac": (None, None, None, None, "CYANNNNNNTGA"),
-    "compsite": "(?=(?P<Hpy99XXII>C[CT]A......TGA))|(?=(?P<Hpy99XXII_as>TCA......T[AG]G))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 4061,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYANNNNNNTGA",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4061",
-}
-
-rest_dict["HpyAS001VI"] = {
-    "charac": (None, None, None, None, "CYANNNNNNTTC"),
-    "compsite": "(?=(?P<HpyAS001VI>C[CT]A......TTC))|(?=(?P<HpyAS001VI_as>GAA......T[AG]G))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 468441,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYANNNNNNTTC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:468441",
-}
-
-rest_dict["HpyAV"] = {
-    "charac": (11, 5, None, None, "CCTTC"),
-    "compsite": "(?=(?P<HpyAV>CCTTC))|(?=(?P<HpyAV_as>GAAGG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 11,
-    "id": 4211,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4211",
-}
-
-rest_dict["HpyAXIV"] = {
-    "charac": (None, None, None, None, "GCGTA"),
-    "compsite": "(?=(?P<HpyAXIV>GCGTA))|(?=(?P<HpyAXIV_as>TACGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 3071,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGTA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:3071",
-}
-
-rest_dict["HpyAXVIII"] = {
-    "charac": (None, None, None, None, "GGANNAG"),
-    "compsite": "(?=(?P<HpyAXVIII>GGA..AG))|(?=(?P<HpyAXVIII_as>CT..TCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 6149,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGANNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:6149",
-}
-
-rest_dict["HpyAXVI_mut1"] = {
-    "charac": (None, None, None, None, "CRTTAA"),
-    "compsite": "(?=(?P<HpyAXVI_mut1>C[AG]TTAA))|(?=(?P<HpyAXVI_mut1_as>TTAA[CT]G))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": None,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRTTAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": None,
-}
-
-rest_dict["HpyAXVI_mut2"] = {
-    "charac": (None, None, None, None, "CRTCNA"),
-    "compsite": "(?=(?P<HpyAXVI_mut2>C[AG]TC.A))|(?=(?P<HpyAXVI_mut2_as>T.GA[CT]G))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": None,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRTCNA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": None,
-}
-
-rest_dict["HpyCH4III"] = {
-    "charac": (3, -3, None, None, "ACNGT"),
-    "compsite": "(?=(?P<HpyCH4III>AC.GT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 4148,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACNGT",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4148",
-}
-
-rest_dict["HpyCH4IV"] = {
-    "charac": (1, -1, None, None, "ACGT"),
-    "compsite": "(?=(?P<HpyCH4IV>ACGT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 4149,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4149",
-}
-
-rest_dict["HpyCH4V"] = {
-    "charac": (2, -2, None, None, "TGCA"),
-    "compsite": "(?=(?P<HpyCH4V>TGCA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 4150,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGCA",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4150",
-}
-
-rest_dict["HpyF10VI"] = {
-    "charac": (7, -7, None, None, "GCNNNNNNNGC"),
-    "compsite": "(?=(?P<HpyF10VI>GC.......GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 4304,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNNNNNNNGC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4304",
-}
-
-rest_dict["HpyF3I"] = {
-    "charac": (1, -1, None, None, "CTNAG"),
-    "compsite": "(?=(?P<HpyF3I>CT.AG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 4285,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTNAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4285",
-}
-
-rest_dict["HpyG272XV"] = {
-    "charac": (None, None, None, None, "GAAAAG"),
-    "compsite": "(?=(?P<HpyG272XV>GAAAAG))|(?=(?P<HpyG272XV_as>CTTTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 212292,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:212292",
-}
-
-rest_dict["HpyLIM6XII"] = {
-    "charac": (None, None, None, None, "CYANNNNNNTCC"),
-    "compsite": "(?=(?P<HpyLIM6XII>C[CT]A......TCC))|(?=(?P<HpyLIM6XII_as>GGA......T[AG]G))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 475965,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYANNNNNNTCC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:475965",
-}
-
-rest_dict["HpyLIM9XVI"] = {
-    "charac": (None, None, None, None, "GAAAAG"),
-    "compsite": "(?=(?P<HpyLIM9XVI>GAAAAG))|(?=(?P<HpyLIM9XVI_as>CTTTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 477626,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:477626",
-}
-
-rest_dict["HpyPU007XIX"] = {
-    "charac": (None, None, None, None, "CYANNNNNNTGY"),
-    "compsite": "(?=(?P<HpyPU007XIX>C[CT]A......TG[CT]))|(?=(?P<HpyPU007XIX_as>[AG]CA......T[AG]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 476105,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYANNNNNNTGY",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:476105",
-}
-
-rest_dict["HpySE526I"] = {
-    "charac": (1, -1, None, None, "ACGT"),
-    "compsite": "(?=(?P<HpySE526I>ACGT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 41799,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:41799",
-}
-
-rest_dict["HpyUM032XIII"] = {
-    "charac": (None, None, None, None, "CYANNNNNNNTRG"),
-    "compsite": "(?=(?P<HpyUM032XIII>C[CT]A.......T[AG]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 65004,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYANNNNNNNTRG",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:65004",
-}
-
-rest_dict["HpyUM032XIII_mut1"] = {
-    "charac": (None, None, None, None, "CYANNNNNNNTTC"),
-    "compsite": "(?=(?P<HpyUM032XIII_mut1>C[CT]A.......TTC))|(?=(?P<HpyUM032XIII_mut1_as>GAA.......T[AG]G))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": None,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYANNNNNNNTTC",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": None,
-}
-
-rest_dict["HpyUM032XIV"] = {
-    "charac": (None, None, None, None, "GAAAG"),
-    "compsite": "(?=(?P<HpyUM032XIV>GAAAG))|(?=(?P<HpyUM032XIV_as>CTTTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 65011,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:65011",
-}
-
-rest_dict["HpyUM037X"] = {
-    "charac": (None, None, None, None, "TNGGNAG|GTGGNAG"),
-    "compsite": "(?=(?P<HpyUM037X>T.GG.AG))|(?=(?P<HpyUM037X_as>CT.CC.A))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 65113,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TNGGNAG|GTGGNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:65113",
-}
-
-rest_dict["Hso63250IV"] = {
-    "charac": (None, None, None, None, "AACNNNNNGTT"),
-    "compsite": "(?=(?P<Hso63250IV>AAC.....GTT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 186849,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AACNNNNNGTT",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:186849",
-}
-
-rest_dict["Hso63373III"] = {
-    "charac": (None, None, None, None, "CGANNNNNRTAY"),
-    "compsite": "(?=(?P<Hso63373III>CGA.....[AG]TA[CT]))|(?=(?P<Hso63373III_as>[AG]TA[CT].....TCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 202592,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGANNNNNRTAY",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:202592",
-}
-
-rest_dict["Hsp92I"] = {
-    "charac": (2, -2, None, None, "GRCGYC"),
-    "compsite": "(?=(?P<Hsp92I>G[AG]CG[CT]C))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2580,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRCGYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("R",),
-    "uri": "https://identifiers.org/rebase:2580",
-}
-
-rest_dict["Hsp92II"] = {
-    "charac": (4, -4, None, None, "CATG"),
-    "compsite": "(?=(?P<Hsp92II>CATG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 2581,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("R",),
-    "uri": "https://identifiers.org/rebase:2581",
-}
-
-rest_dict["HspAI"] = {
-    "charac": (1, -1, None, None, "GCGC"),
-    "compsite": "(?=(?P<HspAI>GCGC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2675,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2675",
-}
-
-rest_dict["HspMHR1II"] = {
-    "charac": (None, None, None, None, "GAGCAGC"),
-    "compsite": "(?=(?P<HspMHR1II>GAGCAGC))|(?=(?P<HspMHR1II_as>GCTGCTC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 309943,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGCAGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:309943",
-}
-
-rest_dict["Jma19592I"] = {
-    "charac": (None, None, None, None, "GTATNAC"),
-    "compsite": "(?=(?P<Jma19592I>GTAT.AC))|(?=(?P<Jma19592I_as>GT.ATAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 61170,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTATNAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:61170",
-}
-
-rest_dict["Jma19592II"] = {
-    "charac": (None, None, None, None, "GRGCRAC"),
-    "compsite": "(?=(?P<Jma19592II>G[AG]GC[AG]AC))|(?=(?P<Jma19592II_as>GT[CT]GC[CT]C))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 61171,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRGCRAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:61171",
-}
-
-rest_dict["Jsp2502II"] = {
-    "charac": (None, None, None, None, "GRNGAAT"),
-    "compsite": "(?=(?P<Jsp2502II>G[AG].GAAT))|(?=(?P<Jsp2502II_as>ATTC.[CT]C))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 179014,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRNGAAT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:179014",
-}
-
-rest_dict["Kas9737III"] = {
-    "charac": (None, None, None, None, "CCCRAG"),
-    "compsite": "(?=(?P<Kas9737III>CCC[AG]AG))|(?=(?P<Kas9737III_as>CT[CT]GGG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 381943,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:381943",
-}
-
-rest_dict["KasI"] = {
-    "charac": (1, -1, None, None, "GGCGCC"),
-    "compsite": "(?=(?P<KasI>GGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1165,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GCGC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1165",
-}
-
-rest_dict["KflI"] = {
-    "charac": (2, -2, None, None, "GGGWCCC"),
-    "compsite": "(?=(?P<KflI>GGG[AT]CCC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 17985,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGWCCC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:17985",
-}
-
-rest_dict["Kor51II"] = {
-    "charac": (None, None, None, None, "RTCGAG"),
-    "compsite": "(?=(?P<Kor51II>[AG]TCGAG))|(?=(?P<Kor51II_as>CTCGA[CT]))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 152829,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RTCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:152829",
-}
-
-rest_dict["Kpn156V"] = {
-    "charac": (None, None, None, None, "CRTGATT"),
-    "compsite": "(?=(?P<Kpn156V>C[AG]TGATT))|(?=(?P<Kpn156V_as>AATCA[CT]G))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 235890,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRTGATT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:235890",
-}
-
-rest_dict["Kpn2I"] = {
-    "charac": (1, -1, None, None, "TCCGGA"),
-    "compsite": "(?=(?P<Kpn2I>TCCGGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1177,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1177",
-}
-
-rest_dict["Kpn327I"] = {
-    "charac": (None, None, None, None, "GACATC"),
-    "compsite": "(?=(?P<Kpn327I>GACATC))|(?=(?P<Kpn327I_as>GATGTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 271895,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACATC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:271895",
-}
-
-rest_dict["Kpn9178I"] = {
-    "charac": (None, None, None, None, "GNGCGAG"),
-    "compsite": "(?=(?P<Kpn9178I>G.GCGAG))|(?=(?P<Kpn9178I_as>CTCGC.C))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 312455,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GNGCGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:312455",
-}
-
-rest_dict["Kpn9644II"] = {
-    "charac": (None, None, None, None, "GRACRAC"),
-    "compsite": "(?=(?P<Kpn9644II>G[AG]AC[AG]AC))|(?=(?P<Kpn9644II_as>GT[CT]GT[CT]C))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 286855,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRACRAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:286855",
-}
-
-rest_dict["KpnI"] = {
-    "charac": (5, -5, None, None, "GGTACC"),
-    "compsite": "(?=(?P<KpnI>GGTACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1180,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTACC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:1180",
-}
-
-rest_dict["KpnNH25III"] = {
-    "charac": (None, None, None, None, "CTRGAG"),
-    "compsite": "(?=(?P<KpnNH25III>CT[AG]GAG))|(?=(?P<KpnNH25III_as>CTC[CT]AG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 243384,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTRGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:243384",
-}
-
-rest_dict["KpnNIH30III"] = {
-    "charac": (None, None, None, None, "GTTCNAC"),
-    "compsite": "(?=(?P<KpnNIH30III>GTTC.AC))|(?=(?P<KpnNIH30III_as>GT.GAAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 97462,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTCNAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:97462",
-}
-
-rest_dict["KpnNIH50I"] = {
-    "charac": (None, None, None, None, "GCYAAG"),
-    "compsite": "(?=(?P<KpnNIH50I>GC[CT]AAG))|(?=(?P<KpnNIH50I_as>CTT[AG]GC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 231662,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCYAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:231662",
-}
-
-rest_dict["Kro7512II"] = {
-    "charac": (None, None, None, None, "ARCAGKC"),
-    "compsite": "(?=(?P<Kro7512II>A[AG]CAG[GT]C))|(?=(?P<Kro7512II_as>G[AC]CTG[CT]T))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 289903,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ARCAGKC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:289903",
-}
-
-rest_dict["KroI"] = {
-    "charac": (1, -1, None, None, "GCCGGC"),
-    "compsite": "(?=(?P<KroI>GCCGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 38425,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:38425",
-}
-
-rest_dict["KroNI"] = {
-    "charac": (3, -3, None, None, "GCCGGC"),
-    "compsite": "(?=(?P<KroNI>GCCGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 491208,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:491208",
-}
-
-rest_dict["Ksp22I"] = {
-    "charac": (1, -1, None, None, "TGATCA"),
-    "compsite": "(?=(?P<Ksp22I>TGATCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1182,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGATCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:1182",
-}
-
-rest_dict["Ksp632I"] = {
-    "charac": (7, 4, None, None, "CTCTTC"),
-    "compsite": "(?=(?P<Ksp632I>CTCTTC))|(?=(?P<Ksp632I_as>GAAGAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 4,
-    "fst5": 7,
-    "id": 1183,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCTTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1183",
-}
-
-rest_dict["KspAI"] = {
-    "charac": (3, -3, None, None, "GTTAAC"),
-    "compsite": "(?=(?P<KspAI>GTTAAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2449,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTAAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2449",
-}
-
-rest_dict["KspI"] = {
-    "charac": (4, -4, None, None, "CCGCGG"),
-    "compsite": "(?=(?P<KspI>CCGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1184,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "GC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("M", "S"),
-    "uri": "https://identifiers.org/rebase:1184",
-}
-
-rest_dict["Kzo9I"] = {
-    "charac": (0, 0, None, None, "GATC"),
-    "compsite": "(?=(?P<Kzo9I>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 1186,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:1186",
-}
-
-rest_dict["Lba2029III"] = {
-    "charac": (None, None, None, None, "CYAAANG"),
-    "compsite": "(?=(?P<Lba2029III>C[CT]AAA.G))|(?=(?P<Lba2029III_as>C.TTT[AG]G))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 67764,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYAAANG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:67764",
-}
-
-rest_dict["Lbr124II"] = {
-    "charac": (None, None, None, None, "CATCNAC"),
-    "compsite": "(?=(?P<Lbr124II>CATC.AC))|(?=(?P<Lbr124II_as>GT.GATG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 251221,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATCNAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:251221",
-}
-
-rest_dict["Lcr047I"] = {
-    "charac": (None, None, None, None, "CTCCA"),
-    "compsite": "(?=(?P<Lcr047I>CTCCA))|(?=(?P<Lcr047I_as>TGGAG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 385800,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCCA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:385800",
-}
-
-rest_dict["Lcr047II"] = {
-    "charac": (None, None, None, None, "AGAAG"),
-    "compsite": "(?=(?P<Lcr047II>AGAAG))|(?=(?P<Lcr047II_as>CTTCT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 382621,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGAAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:382621",
-}
-
-rest_dict["LcrJM4II"] = {
-    "charac": (None, None, None, None, "GMAGG"),
-    "compsite": "(?=(?P<LcrJM4II>G[AC]AGG))|(?=(?P<LcrJM4II_as>CCT[GT]C))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 601088,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GMAGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:601088",
-}
-
-rest_dict["Lde4408II"] = {
-    "charac": (None, None, None, None, "ACAAAG"),
-    "compsite": "(?=(?P<Lde4408II>ACAAAG))|(?=(?P<Lde4408II_as>CTTTGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 202403,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACAAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:202403",
-}
-
-rest_dict["LguI"] = {
-    "charac": (8, 4, None, None, "GCTCTTC"),
-    "compsite": "(?=(?P<LguI>GCTCTTC))|(?=(?P<LguI_as>GAAGAGC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": 4,
-    "fst5": 8,
-    "id": 10920,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTCTTC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:10920",
-}
-
-rest_dict["LlaG50I"] = {
-    "charac": (None, None, None, None, "CCGTKA"),
-    "compsite": "(?=(?P<LlaG50I>CCGT[GT]A))|(?=(?P<LlaG50I_as>T[AC]ACGG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 230489,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGTKA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:230489",
-}
-
-rest_dict["Lme32I"] = {
-    "charac": (None, None, None, None, "CTYCAA"),
-    "compsite": "(?=(?P<Lme32I>CT[CT]CAA))|(?=(?P<Lme32I_as>TTG[AG]AG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 508470,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTYCAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:508470",
-}
-
-rest_dict["LmnI"] = {
-    "charac": (6, -1, None, None, "GCTCC"),
-    "compsite": "(?=(?P<LmnI>GCTCC))|(?=(?P<LmnI_as>GGAGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 6,
-    "id": 111909,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "CN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:111909",
-}
-
-rest_dict["Lmo370I"] = {
-    "charac": (None, None, None, None, "AGCGCCG"),
-    "compsite": "(?=(?P<Lmo370I>AGCGCCG))|(?=(?P<Lmo370I_as>CGGCGCT))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 120713,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCGCCG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:120713",
-}
-
-rest_dict["Lmo911II"] = {
-    "charac": (None, None, None, None, "TAGRAG"),
-    "compsite": "(?=(?P<Lmo911II>TAG[AG]AG))|(?=(?P<Lmo911II_as>CT[CT]CTA))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 70499,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TAGRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:70499",
-}
-
-rest_dict["Lpl1004II"] = {
-    "charac": (None, None, None, None, "AGGRAG"),
-    "compsite": "(?=(?P<Lpl1004II>AGG[AG]AG))|(?=(?P<Lpl1004II_as>CT[CT]CCT))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 230500,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGGRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:230500",
-}
-
-rest_dict["Lpn11417II"] = {
-    "charac": (None, None, None, None, "ACGAAT"),
-    "compsite": "(?=(?P<Lpn11417II>ACGAAT))|(?=(?P<Lpn11417II_as>ATTCGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 384822,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGAAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:384822",
-}
-
-rest_dict["Lpn12272I"] = {
-    "charac": (None, None, None, None, "GCNCAAC"),
-    "compsite": "(?=(?P<Lpn12272I>GC.CAAC))|(?=(?P<Lpn12272I_as>GTTG.GC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 255200,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNCAAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:255200",
-}
-
-rest_dict["LpnI"] = {
-    "charac": (3, -3, None, None, "RGCGCY"),
-    "compsite": "(?=(?P<LpnI>[AG]GCGC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1191,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGCGCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1191",
-}
-
-rest_dict["LpnPI"] = {
-    "charac": (14, 14, None, None, "CCDG"),
-    "compsite": "(?=(?P<LpnPI>CC[AGT]G))|(?=(?P<LpnPI_as>C[ACT]GG))",
-    "dna": None,
-    "freq": 85.33333333333333,
-    "fst3": 14,
-    "fst5": 14,
-    "id": 23358,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCDG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:23358",
-}
-
-rest_dict["Lra68I"] = {
-    "charac": (None, None, None, None, "GTTCNAG"),
-    "compsite": "(?=(?P<Lra68I>GTTC.AG))|(?=(?P<Lra68I_as>CT.GAAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 216189,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTCNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:216189",
-}
-
-rest_dict["LsaDS4I"] = {
-    "charac": (None, None, None, None, "TGGAAT"),
-    "compsite": "(?=(?P<LsaDS4I>TGGAAT))|(?=(?P<LsaDS4I_as>ATTCCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 231367,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGGAAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:231367",
-}
-
-rest_dict["Lsp1109I"] = {
-    "charac": (13, 12, None, None, "GCAGC"),
-    "compsite": "(?=(?P<Lsp1109I>GCAGC))|(?=(?P<Lsp1109I_as>GCTGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 12,
-    "fst5": 13,
-    "id": 1193,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1193",
-}
-
-rest_dict["Lsp48III"] = {
-    "charac": (None, None, None, None, "AGCACC"),
-    "compsite": "(?=(?P<Lsp48III>AGCACC))|(?=(?P<Lsp48III_as>GGTGCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 77633,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCACC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:77633",
-}
-
-rest_dict["Lsp6406VI"] = {
-    "charac": (None, None, None, None, "CRAGCAC"),
-    "compsite": "(?=(?P<Lsp6406VI>C[AG]AGCAC))|(?=(?P<Lsp6406VI_as>GTGCT[CT]G))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 53027,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRAGCAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:53027",
-}
-
-rest_dict["LweI"] = {
-    "charac": (10, 9, None, None, "GCATC"),
-    "compsite": "(?=(?P<LweI>GCATC))|(?=(?P<LweI_as>GATGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 9,
-    "fst5": 10,
-    "id": 4808,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCATC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4808",
-}
-
-rest_dict["MabI"] = {
-    "charac": (1, -1, None, None, "ACCWGGT"),
-    "compsite": "(?=(?P<MabI>ACC[AT]GGT))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 4915,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCWGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCWGGT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:4915",
-}
-
-rest_dict["MaeI"] = {
-    "charac": (1, -1, None, None, "CTAG"),
-    "compsite": "(?=(?P<MaeI>CTAG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1197,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTAG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("M",),
-    "uri": "https://identifiers.org/rebase:1197",
-}
-
-rest_dict["MaeII"] = {
-    "charac": (1, -1, None, None, "ACGT"),
-    "compsite": "(?=(?P<MaeII>ACGT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1198,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("M",),
-    "uri": "https://identifiers.org/rebase:1198",
-}
-
-rest_dict["MaeIII"] = {
-    "charac": (0, 0, None, None, "GTNAC"),
-    "compsite": "(?=(?P<MaeIII>GT.AC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 1199,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GTNAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTNAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("M", "S"),
-    "uri": "https://identifiers.org/rebase:1199",
-}
-
-rest_dict["MalI"] = {
-    "charac": (2, -2, None, None, "GATC"),
-    "compsite": "(?=(?P<MalI>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10872,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:10872",
-}
-
-rest_dict["MaqI"] = {
-    "charac": (28, 19, None, None, "CRTTGAC"),
-    "compsite": "(?=(?P<MaqI>C[AG]TTGAC))|(?=(?P<MaqI_as>GTCAA[CT]G))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": 19,
-    "fst5": 28,
-    "id": 16957,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRTTGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:16957",
-}
-
-rest_dict["MauBI"] = {
-    "charac": (2, -2, None, None, "CGCGCGCG"),
-    "compsite": "(?=(?P<MauBI>CGCGCGCG))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 14905,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCGCGCG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:14905",
-}
-
-rest_dict["Mba11I"] = {
-    "charac": (None, None, None, None, "AGGCGA"),
-    "compsite": "(?=(?P<Mba11I>AGGCGA))|(?=(?P<Mba11I_as>TCGCCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 52943,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGGCGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:52943",
-}
-
-rest_dict["MbiI"] = {
-    "charac": (3, -3, None, None, "CCGCTC"),
-    "compsite": "(?=(?P<MbiI>CCGCTC))|(?=(?P<MbiI_as>GAGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2983,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2983",
-}
-
-rest_dict["MboI"] = {
-    "charac": (0, 0, None, None, "GATC"),
-    "compsite": "(?=(?P<MboI>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 1204,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "K", "N", "Q", "R", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:1204",
-}
-
-rest_dict["MboII"] = {
-    "charac": (13, 7, None, None, "GAAGA"),
-    "compsite": "(?=(?P<MboII>GAAGA))|(?=(?P<MboII_as>TCTTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 7,
-    "fst5": 13,
-    "id": 1205,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "J", "K", "N", "Q", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1205",
-}
-
-rest_dict["McaTI"] = {
-    "charac": (4, -4, None, None, "GCGCGC"),
-    "compsite": "(?=(?P<McaTI>GCGCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 11763,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "GC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGCGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:11763",
-}
-
-rest_dict["Mch10819I"] = {
-    "charac": (None, None, None, None, "CYCAGCG"),
-    "compsite": "(?=(?P<Mch10819I>C[CT]CAGCG))|(?=(?P<Mch10819I_as>CGCTG[AG]G))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 405173,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYCAGCG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:405173",
-}
-
-rest_dict["Mch946II"] = {
-    "charac": (None, None, None, None, "WCGATCT"),
-    "compsite": "(?=(?P<Mch946II>[AT]CGATCT))|(?=(?P<Mch946II_as>AGATCG[AT]))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 287585,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "WCGATCT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:287585",
-}
-
-rest_dict["McrI"] = {
-    "charac": (4, -4, None, None, "CGRYCG"),
-    "compsite": "(?=(?P<McrI>CG[AG][CT]CG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1210,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "RY",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGRYCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1210",
-}
-
-rest_dict["MfeI"] = {
-    "charac": (1, -1, None, None, "CAATTG"),
-    "compsite": "(?=(?P<MfeI>CAATTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1213,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAATTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:1213",
-}
-
-rest_dict["MflI"] = {
-    "charac": (1, -1, None, None, "RGATCY"),
-    "compsite": "(?=(?P<MflI>[AG]GATC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1214,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGATCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:1214",
-}
-
-rest_dict["MhlI"] = {
-    "charac": (5, -5, None, None, "GDGCHC"),
-    "compsite": "(?=(?P<MhlI>G[AGT]GC[ACT]C))",
-    "dna": None,
-    "freq": 455.1111111111111,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 4839,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "DGCH",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GDGCHC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4839",
-}
-
-rest_dict["MjaIV"] = {
-    "charac": (None, None, None, None, "GTNNAC"),
-    "compsite": "(?=(?P<MjaIV>GT..AC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 3894,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTNNAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:3894",
-}
-
-rest_dict["MkaDII"] = {
-    "charac": (None, None, None, None, "GAGAYGT"),
-    "compsite": "(?=(?P<MkaDII>GAGA[CT]GT))|(?=(?P<MkaDII_as>AC[AG]TCTC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 71719,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGAYGT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:71719",
-}
-
-rest_dict["Mla10359I"] = {
-    "charac": (None, None, None, None, "CGANNNNNNTCA"),
-    "compsite": "(?=(?P<Mla10359I>CGA......TCA))|(?=(?P<Mla10359I_as>TGA......TCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 405174,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGANNNNNNTCA",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:405174",
-}
-
-rest_dict["MlsI"] = {
-    "charac": (3, -3, None, None, "TGGCCA"),
-    "compsite": "(?=(?P<MlsI>TGGCCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2985,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGGCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2985",
-}
-
-rest_dict["Mlu211III"] = {
-    "charac": (None, None, None, None, "AGCCCA"),
-    "compsite": "(?=(?P<Mlu211III>AGCCCA))|(?=(?P<Mlu211III_as>TGGGCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 275236,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:275236",
-}
-
-rest_dict["MluCI"] = {
-    "charac": (0, 0, None, None, "AATT"),
-    "compsite": "(?=(?P<MluCI>AATT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 4630,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AATT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:4630",
-}
-
-rest_dict["MluI"] = {
-    "charac": (1, -1, None, None, "ACGCGT"),
-    "compsite": "(?=(?P<MluI>ACGCGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1236,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGCGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V"),
-    "uri": "https://identifiers.org/rebase:1236",
-}
-
-rest_dict["MluNI"] = {
-    "charac": (3, -3, None, None, "TGGCCA"),
-    "compsite": "(?=(?P<MluNI>TGGCCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1266,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGGCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("M",),
-    "uri": "https://identifiers.org/rebase:1266",
-}
-
-rest_dict["Mly113I"] = {
-    "charac": (2, -2, None, None, "GGCGCC"),
-    "compsite": "(?=(?P<Mly113I>GGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1237,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:1237",
-}
-
-rest_dict["MlyI"] = {
-    "charac": (10, 5, None, None, "GAGTC"),
-    "compsite": "(?=(?P<MlyI>GAGTC))|(?=(?P<MlyI_as>GACTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 10,
-    "id": 1238,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1238",
-}
-
-rest_dict["MmeI"] = {
-    "charac": (26, 18, None, None, "TCCRAC"),
-    "compsite": "(?=(?P<MmeI>TCC[AG]AC))|(?=(?P<MmeI_as>GT[CT]GGA))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 1239,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCRAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N", "X"),
-    "uri": "https://identifiers.org/rebase:1239",
-}
-
-rest_dict["MnlI"] = {
-    "charac": (11, 6, None, None, "CCTC"),
-    "compsite": "(?=(?P<MnlI>CCTC))|(?=(?P<MnlI_as>GAGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 6,
-    "fst5": 11,
-    "id": 1243,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "N", "Q", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1243",
-}
-
-rest_dict["Mox20I"] = {
-    "charac": (3, -3, None, None, "TGGCCA"),
-    "compsite": "(?=(?P<Mox20I>TGGCCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 85920,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGGCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:85920",
-}
-
-rest_dict["Mph1103I"] = {
-    "charac": (5, -5, None, None, "ATGCAT"),
-    "compsite": "(?=(?P<Mph1103I>ATGCAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1252,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATGCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1252",
-}
-
-rest_dict["MreI"] = {
-    "charac": (2, -2, None, None, "CGCCGGCG"),
-    "compsite": "(?=(?P<MreI>CGCCGGCG))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10918,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCCGGCG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:10918",
-}
-
-rest_dict["MroI"] = {
-    "charac": (1, -1, None, None, "TCCGGA"),
-    "compsite": "(?=(?P<MroI>TCCGGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1258,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCGGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("M", "O"),
-    "uri": "https://identifiers.org/rebase:1258",
-}
-
-rest_dict["MroNI"] = {
-    "charac": (1, -1, None, None, "GCCGGC"),
-    "compsite": "(?=(?P<MroNI>GCCGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2676,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2676",
-}
-
-rest_dict["MroXI"] = {
-    "charac": (5, -5, None, None, "GAANNNNTTC"),
-    "compsite": "(?=(?P<MroXI>GAA....TTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2857,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAANNNNTTC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2857",
-}
-
-rest_dict["MscI"] = {
-    "charac": (3, -3, None, None, "TGGCCA"),
-    "compsite": "(?=(?P<MscI>TGGCCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1261,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGGCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N", "O"),
-    "uri": "https://identifiers.org/rebase:1261",
-}
-
-rest_dict["MseI"] = {
-    "charac": (1, -1, None, None, "TTAA"),
-    "compsite": "(?=(?P<MseI>TTAA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1262,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTAA",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1262",
-}
-
-rest_dict["MslI"] = {
-    "charac": (5, -5, None, None, "CAYNNNNRTG"),
-    "compsite": "(?=(?P<MslI>CA[CT]....[AG]TG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1265,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAYNNNNRTG",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1265",
-}
-
-rest_dict["Msp20I"] = {
-    "charac": (3, -3, None, None, "TGGCCA"),
-    "compsite": "(?=(?P<Msp20I>TGGCCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2597,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGGCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:2597",
-}
-
-rest_dict["MspA1I"] = {
-    "charac": (3, -3, None, None, "CMGCKG"),
-    "compsite": "(?=(?P<MspA1I>C[AC]GC[GT]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1272,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CMGCKG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:1272",
-}
-
-rest_dict["MspCI"] = {
-    "charac": (1, -1, None, None, "CTTAAG"),
-    "compsite": "(?=(?P<MspCI>CTTAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2161,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TTAA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:2161",
-}
-
-rest_dict["MspF392I"] = {
-    "charac": (None, None, None, None, "CCCAATV"),
-    "compsite": "(?=(?P<MspF392I>CCCAAT[ACG]))|(?=(?P<MspF392I_as>[CGT]ATTGGG))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 385375,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCAATV",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:385375",
-}
-
-rest_dict["MspGI"] = {
-    "charac": (5, -5, None, None, "GCCGGC"),
-    "compsite": "(?=(?P<MspGI>GCCGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 218866,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:218866",
-}
-
-rest_dict["MspI"] = {
-    "charac": (1, -1, None, None, "CCGG"),
-    "compsite": "(?=(?P<MspI>CCGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1277,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "J", "K", "N", "Q", "R", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1277",
-}
-
-rest_dict["MspI7II"] = {
-    "charac": (None, None, None, None, "ACGRAG"),
-    "compsite": "(?=(?P<MspI7II>ACG[AG]AG))|(?=(?P<MspI7II_as>CT[CT]CGT))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 77641,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:77641",
-}
-
-rest_dict["MspI7IV"] = {
-    "charac": (None, None, None, None, "GCMGAAG"),
-    "compsite": "(?=(?P<MspI7IV>GC[AC]GAAG))|(?=(?P<MspI7IV_as>CTTC[GT]GC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 77665,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCMGAAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:77665",
-}
-
-rest_dict["MspJI"] = {
-    "charac": (13, 13, None, None, "CNNR"),
-    "compsite": "(?=(?P<MspJI>C..[AG]))|(?=(?P<MspJI_as>[CT]..G))",
-    "dna": None,
-    "freq": 8.0,
-    "fst3": 13,
-    "fst5": 13,
-    "id": 18979,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CNNR",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:18979",
-}
-
-rest_dict["MspR9I"] = {
-    "charac": (2, -2, None, None, "CCNGG"),
-    "compsite": "(?=(?P<MspR9I>CC.GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2678,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2678",
-}
-
-rest_dict["MspSC27II"] = {
-    "charac": (None, None, None, None, "CCGCGAC"),
-    "compsite": "(?=(?P<MspSC27II>CCGCGAC))|(?=(?P<MspSC27II_as>GTCGCGG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 243902,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:243902",
-}
-
-rest_dict["MssI"] = {
-    "charac": (4, -4, None, None, "GTTTAAAC"),
-    "compsite": "(?=(?P<MssI>GTTTAAAC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 3091,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTTAAAC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3091",
-}
-
-rest_dict["MstI"] = {
-    "charac": (3, -3, None, None, "TGCGCA"),
-    "compsite": "(?=(?P<MstI>TGCGCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1279,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGCGCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1279",
-}
-
-rest_dict["MteI"] = {
-    "charac": (4, -4, None, None, "GCGCNGCGC"),
-    "compsite": "(?=(?P<MteI>GCGC.GCGC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 140117,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGCNGCGC",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:140117",
-}
-
-rest_dict["MtuHN878II"] = {
-    "charac": (None, None, None, None, "CACGCAG"),
-    "compsite": "(?=(?P<MtuHN878II>CACGCAG))|(?=(?P<MtuHN878II_as>CTGCGTG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 74924,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:74924",
-}
-
-rest_dict["MunI"] = {
-    "charac": (1, -1, None, None, "CAATTG"),
-    "compsite": "(?=(?P<MunI>CAATTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1285,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAATTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K", "M", "S"),
-    "uri": "https://identifiers.org/rebase:1285",
-}
-
-rest_dict["Mva1269I"] = {
-    "charac": (7, -1, None, None, "GAATGC"),
-    "compsite": "(?=(?P<Mva1269I>GAATGC))|(?=(?P<Mva1269I_as>GCATTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 7,
-    "id": 1992,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "CN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAATGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1992",
-}
-
-rest_dict["MvaI"] = {
-    "charac": (2, -2, None, None, "CCWGG"),
-    "compsite": "(?=(?P<MvaI>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1287,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "W",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B", "M"),
-    "uri": "https://identifiers.org/rebase:1287",
-}
-
-rest_dict["MvnI"] = {
-    "charac": (2, -2, None, None, "CGCG"),
-    "compsite": "(?=(?P<MvnI>CGCG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1290,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("M",),
-    "uri": "https://identifiers.org/rebase:1290",
-}
-
-rest_dict["MwoI"] = {
-    "charac": (7, -7, None, None, "GCNNNNNNNGC"),
-    "compsite": "(?=(?P<MwoI>GC.......GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 1291,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNNNNNNNGC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1291",
-}
-
-rest_dict["NaeI"] = {
-    "charac": (3, -3, None, None, "GCCGGC"),
-    "compsite": "(?=(?P<NaeI>GCCGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1294,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C", "K", "N"),
-    "uri": "https://identifiers.org/rebase:1294",
-}
-
-rest_dict["Nal45188II"] = {
-    "charac": (None, None, None, None, "ACCAGC"),
-    "compsite": "(?=(?P<Nal45188II>ACCAGC))|(?=(?P<Nal45188II_as>GCTGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 53140,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:53140",
-}
-
-rest_dict["Nan12227I"] = {
-    "charac": (None, None, None, None, "CCANNNNNNTCY"),
-    "compsite": "(?=(?P<Nan12227I>CCA......TC[CT]))|(?=(?P<Nan12227I_as>[AG]GA......TGG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 290013,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCANNNNNNTCY",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:290013",
-}
-
-rest_dict["NarI"] = {
-    "charac": (2, -2, None, None, "GGCGCC"),
-    "compsite": "(?=(?P<NarI>GGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1298,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "M", "N", "Q", "X"),
-    "uri": "https://identifiers.org/rebase:1298",
-}
-
-rest_dict["Nbr128II"] = {
-    "charac": (None, None, None, None, "ACCGAC"),
-    "compsite": "(?=(?P<Nbr128II>ACCGAC))|(?=(?P<Nbr128II_as>GTCGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 124782,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:124782",
-}
-
-rest_dict["NciI"] = {
-    "charac": (2, -2, None, None, "CCSGG"),
-    "compsite": "(?=(?P<NciI>CC[CG]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1307,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "S",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCSGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("J", "N"),
-    "uri": "https://identifiers.org/rebase:1307",
-}
-
-rest_dict["NcoI"] = {
-    "charac": (1, -1, None, None, "CCATGG"),
-    "compsite": "(?=(?P<NcoI>CCATGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1308,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCATGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "J", "K", "M", "N", "O", "Q", "R", "S", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:1308",
-}
-
-rest_dict["NdeI"] = {
-    "charac": (2, -2, None, None, "CATATG"),
-    "compsite": "(?=(?P<NdeI>CATATG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1312,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATATG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "M", "N", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:1312",
-}
-
-rest_dict["NdeII"] = {
-    "charac": (0, 0, None, None, "GATC"),
-    "compsite": "(?=(?P<NdeII>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 1313,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("J", "M"),
-    "uri": "https://identifiers.org/rebase:1313",
-}
-
-rest_dict["NgoAVII"] = {
-    "charac": (12, 7, None, None, "GCCGC"),
-    "compsite": "(?=(?P<NgoAVII>GCCGC))|(?=(?P<NgoAVII_as>GCGGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 7,
-    "fst5": 12,
-    "id": 5857,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:5857",
-}
-
-rest_dict["NgoAVIII"] = {
-    "charac": (-12, -25, 24, 11, "GACNNNNNTGA"),
-    "compsite": "(?=(?P<NgoAVIII>GAC.....TGA))|(?=(?P<NgoAVIII_as>TCA.....GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -25,
-    "fst5": -12,
-    "id": 12957,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": 11,
-    "scd5": 24,
-    "site": "GACNNNNNTGA",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:12957",
-}
-
-rest_dict["NgoMIV"] = {
-    "charac": (1, -1, None, None, "GCCGGC"),
-    "compsite": "(?=(?P<NgoMIV>GCCGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1330,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1330",
-}
-
-rest_dict["NhaXI"] = {
-    "charac": (None, None, None, None, "CAAGRAG"),
-    "compsite": "(?=(?P<NhaXI>CAAG[AG]AG))|(?=(?P<NhaXI_as>CT[CT]CTTG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 17300,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAAGRAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:17300",
-}
-
-rest_dict["NheI"] = {
-    "charac": (1, -1, None, None, "GCTAGC"),
-    "compsite": "(?=(?P<NheI>GCTAGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1335,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "J", "K", "M", "N", "O", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:1335",
-}
-
-rest_dict["NhoI"] = {
-    "charac": (None, None, None, None, "GCWGC"),
-    "compsite": "(?=(?P<NhoI>GC[AT]GC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 127135,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCWGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:127135",
-}
-
-rest_dict["NlaCI"] = {
-    "charac": (25, 17, None, None, "CATCAC"),
-    "compsite": "(?=(?P<NlaCI>CATCAC))|(?=(?P<NlaCI_as>GTGATG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 17,
-    "fst5": 25,
-    "id": 14145,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATCAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:14145",
-}
-
-rest_dict["NlaIII"] = {
-    "charac": (4, -4, None, None, "CATG"),
-    "compsite": "(?=(?P<NlaIII>CATG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1341,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1341",
-}
-
-rest_dict["NlaIV"] = {
-    "charac": (3, -3, None, None, "GGNNCC"),
-    "compsite": "(?=(?P<NlaIV>GG..CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1342,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNNCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1342",
-}
-
-rest_dict["Nli3877I"] = {
-    "charac": (5, -5, None, None, "CYCGRG"),
-    "compsite": "(?=(?P<Nli3877I>C[CT]CG[AG]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1345,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "YCGR",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CYCGRG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1345",
-}
-
-rest_dict["NmeA6CIII"] = {
-    "charac": (27, 19, None, None, "GCCGAC"),
-    "compsite": "(?=(?P<NmeA6CIII>GCCGAC))|(?=(?P<NmeA6CIII_as>GTCGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 19,
-    "fst5": 27,
-    "id": 17628,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:17628",
-}
-
-rest_dict["NmeAIII"] = {
-    "charac": (27, 19, None, None, "GCCGAG"),
-    "compsite": "(?=(?P<NmeAIII>GCCGAG))|(?=(?P<NmeAIII_as>CTCGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 19,
-    "fst5": 27,
-    "id": 13448,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:13448",
-}
-
-rest_dict["NmeDI"] = {
-    "charac": (-12, -13, 13, 12, "RCCGGY"),
-    "compsite": "(?=(?P<NmeDI>[AG]CCGG[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -13,
-    "fst5": -12,
-    "id": 4187,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 12,
-    "scd5": 13,
-    "site": "RCCGGY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4187",
-}
-
-rest_dict["NmuCI"] = {
-    "charac": (0, 0, None, None, "GTSAC"),
-    "compsite": "(?=(?P<NmuCI>GT[CG]AC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 4108,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GTSAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTSAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4108",
-}
-
-rest_dict["NotI"] = {
-    "charac": (2, -2, None, None, "GCGGCCGC"),
-    "compsite": "(?=(?P<NotI>GCGGCCGC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1367,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGGCCGC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "J", "K", "M", "N", "O", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:1367",
-}
-
-rest_dict["NpeUS61II"] = {
-    "charac": (None, None, None, None, "GATCGAC"),
-    "compsite": "(?=(?P<NpeUS61II>GATCGAC))|(?=(?P<NpeUS61II_as>GTCGATC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 42152,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATCGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:42152",
-}
-
-rest_dict["NruI"] = {
-    "charac": (3, -3, None, None, "TCGCGA"),
-    "compsite": "(?=(?P<NruI>TCGCGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1371,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCGCGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "Q", "S", "X"),
-    "uri": "https://identifiers.org/rebase:1371",
-}
-
-rest_dict["NsbI"] = {
-    "charac": (3, -3, None, None, "TGCGCA"),
-    "compsite": "(?=(?P<NsbI>TGCGCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2986,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGCGCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2986",
-}
-
-rest_dict["NsiI"] = {
-    "charac": (5, -5, None, None, "ATGCAT"),
-    "compsite": "(?=(?P<NsiI>ATGCAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1375,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATGCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J", "M", "N", "Q", "S", "X"),
-    "uri": "https://identifiers.org/rebase:1375",
-}
-
-rest_dict["NspBII"] = {
-    "charac": (3, -3, None, None, "CMGCKG"),
-    "compsite": "(?=(?P<NspBII>C[AC]GC[GT]G))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1381,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CMGCKG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1381",
-}
-
-rest_dict["NspES21II"] = {
-    "charac": (None, None, None, None, "CRTTCAG"),
-    "compsite": "(?=(?P<NspES21II>C[AG]TTCAG))|(?=(?P<NspES21II_as>CTGAA[CT]G))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 457016,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRTTCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:457016",
-}
-
-rest_dict["NspI"] = {
-    "charac": (5, -5, None, None, "RCATGY"),
-    "compsite": "(?=(?P<NspI>[AG]CATG[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1391,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RCATGY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1391",
-}
-
-rest_dict["NspV"] = {
-    "charac": (2, -2, None, None, "TTCGAA"),
-    "compsite": "(?=(?P<NspV>TTCGAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1407,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTCGAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("J",),
-    "uri": "https://identifiers.org/rebase:1407",
-}
-
-rest_dict["ObaBS10I"] = {
-    "charac": (None, None, None, None, "ACGAG"),
-    "compsite": "(?=(?P<ObaBS10I>ACGAG))|(?=(?P<ObaBS10I_as>CTCGT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 268727,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:268727",
-}
-
-rest_dict["OgrI"] = {
-    "charac": (None, None, None, None, "CAACNAC"),
-    "compsite": "(?=(?P<OgrI>CAAC.AC))|(?=(?P<OgrI_as>GT.GTTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 26679,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAACNAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:26679",
-}
-
-rest_dict["OliI"] = {
-    "charac": (5, -5, None, None, "CACNNNNGTG"),
-    "compsite": "(?=(?P<OliI>CAC....GTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 4547,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACNNNNGTG",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4547",
-}
-
-rest_dict["OspHL35III"] = {
-    "charac": (None, None, None, None, "YAGGAG"),
-    "compsite": "(?=(?P<OspHL35III>[CT]AGGAG))|(?=(?P<OspHL35III_as>CTCCT[AG]))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 67650,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YAGGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:67650",
-}
-
-rest_dict["PabI"] = {
-    "charac": (3, -3, None, None, "GTAC"),
-    "compsite": "(?=(?P<PabI>GTAC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 11107,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTAC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:11107",
-}
-
-rest_dict["Pac19842II"] = {
-    "charac": (None, None, None, None, "CCTTGA"),
-    "compsite": "(?=(?P<Pac19842II>CCTTGA))|(?=(?P<Pac19842II_as>TCAAGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 64405,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTTGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:64405",
-}
-
-rest_dict["PacI"] = {
-    "charac": (5, -5, None, None, "TTAATTAA"),
-    "compsite": "(?=(?P<PacI>TTAATTAA))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1424,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTAATTAA",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B", "N", "O"),
-    "uri": "https://identifiers.org/rebase:1424",
-}
-
-rest_dict["PacIII"] = {
-    "charac": (None, None, None, None, "GTAATC"),
-    "compsite": "(?=(?P<PacIII>GTAATC))|(?=(?P<PacIII_as>GATTAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 144691,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTAATC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:144691",
-}
-
-rest_dict["Pae10662III"] = {
-    "charac": (None, None, None, None, "TGACGAG"),
-    "compsite": "(?=(?P<Pae10662III>TGACGAG))|(?=(?P<Pae10662III_as>CTCGTCA))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 415783,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGACGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:415783",
-}
-
-rest_dict["Pae8506I"] = {
-    "charac": (None, None, None, None, "CATCGAR"),
-    "compsite": "(?=(?P<Pae8506I>CATCGA[AG]))|(?=(?P<Pae8506I_as>[CT]TCGATG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 414138,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATCGAR",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:414138",
-}
-
-rest_dict["PaeI"] = {
-    "charac": (5, -5, None, None, "GCATGC"),
-    "compsite": "(?=(?P<PaeI>GCATGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1448,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCATGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1448",
-}
-
-rest_dict["PaePA99III"] = {
-    "charac": (None, None, None, None, "AAGAYC"),
-    "compsite": "(?=(?P<PaePA99III>AAGA[CT]C))|(?=(?P<PaePA99III_as>G[AG]TCTT))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 334217,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AAGAYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:334217",
-}
-
-rest_dict["PaeR7I"] = {
-    "charac": (1, -1, None, None, "CTCGAG"),
-    "compsite": "(?=(?P<PaeR7I>CTCGAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1451,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TCGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1451",
-}
-
-rest_dict["PagI"] = {
-    "charac": (1, -1, None, None, "TCATGA"),
-    "compsite": "(?=(?P<PagI>TCATGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2989,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCATGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2989",
-}
-
-rest_dict["Pal408I"] = {
-    "charac": (None, None, None, None, "CCRTGAG"),
-    "compsite": "(?=(?P<Pal408I>CC[AG]TGAG))|(?=(?P<Pal408I_as>CTCA[CT]GG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 77800,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCRTGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:77800",
-}
-
-rest_dict["PalAI"] = {
-    "charac": (2, -2, None, None, "GGCGCGCC"),
-    "compsite": "(?=(?P<PalAI>GGCGCGCC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10829,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCGCC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:10829",
-}
-
-rest_dict["PaqCI"] = {
-    "charac": (11, 8, None, None, "CACCTGC"),
-    "compsite": "(?=(?P<PaqCI>CACCTGC))|(?=(?P<PaqCI_as>GCAGGTG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": 8,
-    "fst5": 11,
-    "id": 266039,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACCTGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:266039",
-}
-
-rest_dict["PasI"] = {
-    "charac": (2, -2, None, None, "CCCWGGG"),
-    "compsite": "(?=(?P<PasI>CCC[AT]GGG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 7401,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "CWG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCWGGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:7401",
-}
-
-rest_dict["PauI"] = {
-    "charac": (1, -1, None, None, "GCGCGC"),
-    "compsite": "(?=(?P<PauI>GCGCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2574,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGCGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2574",
-}
-
-rest_dict["Pba2294I"] = {
-    "charac": (None, None, None, None, "GTAAG"),
-    "compsite": "(?=(?P<Pba2294I>GTAAG))|(?=(?P<Pba2294I_as>CTTAC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 246929,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTAAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:246929",
-}
-
-rest_dict["Pbu13063II"] = {
-    "charac": (None, None, None, None, "GTATYC"),
-    "compsite": "(?=(?P<Pbu13063II>GTAT[CT]C))|(?=(?P<Pbu13063II_as>G[AG]ATAC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 409629,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTATYC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:409629",
-}
-
-rest_dict["PcaII"] = {
-    "charac": (None, None, None, None, "GACGAG"),
-    "compsite": "(?=(?P<PcaII>GACGAG))|(?=(?P<PcaII_as>CTCGTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 33508,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:33508",
-}
-
-rest_dict["PceI"] = {
-    "charac": (3, -3, None, None, "AGGCCT"),
-    "compsite": "(?=(?P<PceI>AGGCCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 5318,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGGCCT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:5318",
-}
-
-rest_dict["PciI"] = {
-    "charac": (1, -1, None, None, "ACATGT"),
-    "compsite": "(?=(?P<PciI>ACATGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 3773,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACATGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:3773",
-}
-
-rest_dict["PciSI"] = {
-    "charac": (8, 4, None, None, "GCTCTTC"),
-    "compsite": "(?=(?P<PciSI>GCTCTTC))|(?=(?P<PciSI_as>GAAGAGC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": 4,
-    "fst5": 8,
-    "id": 11886,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTCTTC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:11886",
-}
-
-rest_dict["Pcr308II"] = {
-    "charac": (None, None, None, None, "CCAAAG"),
-    "compsite": "(?=(?P<Pcr308II>CCAAAG))|(?=(?P<Pcr308II_as>CTTTGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 208811,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCAAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:208811",
-}
-
-rest_dict["PcsI"] = {
-    "charac": (7, -7, None, None, "WCGNNNNNNNCGW"),
-    "compsite": "(?=(?P<PcsI>[AT]CG.......CG[AT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 23597,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "WCGNNNNNNNCGW",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:23597",
-}
-
-rest_dict["PctI"] = {
-    "charac": (7, -1, None, None, "GAATGC"),
-    "compsite": "(?=(?P<PctI>GAATGC))|(?=(?P<PctI_as>GCATTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 7,
-    "id": 4840,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "CN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAATGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4840",
-}
-
-rest_dict["Pdi8503III"] = {
-    "charac": (None, None, None, None, "CCGGNAG"),
-    "compsite": "(?=(?P<Pdi8503III>CCGG.AG))|(?=(?P<Pdi8503III_as>CT.CCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 15666,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGGNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:15666",
-}
-
-rest_dict["PdiI"] = {
-    "charac": (3, -3, None, None, "GCCGGC"),
-    "compsite": "(?=(?P<PdiI>GCCGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 4109,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4109",
-}
-
-rest_dict["PdmI"] = {
-    "charac": (5, -5, None, None, "GAANNNNTTC"),
-    "compsite": "(?=(?P<PdmI>GAA....TTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 4110,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAANNNNTTC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4110",
-}
-
-rest_dict["Pdu1735I"] = {
-    "charac": (None, None, None, None, "CACCAC"),
-    "compsite": "(?=(?P<Pdu1735I>CACCAC))|(?=(?P<Pdu1735I_as>GTGGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 93532,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACCAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:93532",
-}
-
-rest_dict["PenI"] = {
-    "charac": (None, None, None, None, "GCAGT"),
-    "compsite": "(?=(?P<PenI>GCAGT))|(?=(?P<PenI_as>ACTGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 38313,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAGT",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:38313",
-}
-
-rest_dict["PfeI"] = {
-    "charac": (1, -1, None, None, "GAWTC"),
-    "compsite": "(?=(?P<PfeI>GA[AT]TC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 6972,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "AWT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAWTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:6972",
-}
-
-rest_dict["Pfl10783II"] = {
-    "charac": (None, None, None, None, "GCGTCAG"),
-    "compsite": "(?=(?P<Pfl10783II>GCGTCAG))|(?=(?P<Pfl10783II_as>CTGACGC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 287240,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGTCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:287240",
-}
-
-rest_dict["Pfl1108I"] = {
-    "charac": (None, None, None, None, "TCGTAG"),
-    "compsite": "(?=(?P<Pfl1108I>TCGTAG))|(?=(?P<Pfl1108I_as>CTACGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 1462,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCGTAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1462",
-}
-
-rest_dict["Pfl23II"] = {
-    "charac": (1, -1, None, None, "CGTACG"),
-    "compsite": "(?=(?P<Pfl23II>CGTACG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1468,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGTACG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1468",
-}
-
-rest_dict["Pfl3756II"] = {
-    "charac": (None, None, None, None, "CCCTNAG"),
-    "compsite": "(?=(?P<Pfl3756II>CCCT.AG))|(?=(?P<Pfl3756II_as>CT.AGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 414129,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCTNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:414129",
-}
-
-rest_dict["Pfl8569I"] = {
-    "charac": (3, -3, None, None, "GCNNGC"),
-    "compsite": "(?=(?P<Pfl8569I>GC..GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 161004,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNNGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:161004",
-}
-
-rest_dict["PflFI"] = {
-    "charac": (4, -4, None, None, "GACNNNGTC"),
-    "compsite": "(?=(?P<PflFI>GAC...GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 2886,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNGTC",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2886",
-}
-
-rest_dict["PflMI"] = {
-    "charac": (7, -7, None, None, "CCANNNNNTGG"),
-    "compsite": "(?=(?P<PflMI>CCA.....TGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 1475,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCANNNNNTGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1475",
-}
-
-rest_dict["PflPt14I"] = {
-    "charac": (None, None, None, None, "RGCCCAC"),
-    "compsite": "(?=(?P<PflPt14I>[AG]GCCCAC))|(?=(?P<PflPt14I_as>GTGGGC[CT]))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 161996,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGCCCAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:161996",
-}
-
-rest_dict["PfoI"] = {
-    "charac": (1, -1, None, None, "TCCNGGA"),
-    "compsite": "(?=(?P<PfoI>TCC.GGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 5507,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCNGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCCNGGA",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:5507",
-}
-
-rest_dict["PfrJS12IV"] = {
-    "charac": (None, None, None, None, "TANAAG"),
-    "compsite": "(?=(?P<PfrJS12IV>TA.AAG))|(?=(?P<PfrJS12IV_as>CTT.TA))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 178754,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TANAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:178754",
-}
-
-rest_dict["PfrJS12V"] = {
-    "charac": (None, None, None, None, "GGCGGAG"),
-    "compsite": "(?=(?P<PfrJS12V>GGCGGAG))|(?=(?P<PfrJS12V_as>CTCCGCC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 178755,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:178755",
-}
-
-rest_dict["PfrJS15III"] = {
-    "charac": (None, None, None, None, "CTTCNAC"),
-    "compsite": "(?=(?P<PfrJS15III>CTTC.AC))|(?=(?P<PfrJS15III_as>GT.GAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 160634,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTCNAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:160634",
-}
-
-rest_dict["PgaP73III"] = {
-    "charac": (None, None, None, None, "TTCGAG"),
-    "compsite": "(?=(?P<PgaP73III>TTCGAG))|(?=(?P<PgaP73III_as>CTCGAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 221241,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:221241",
-}
-
-rest_dict["Pin17FIII"] = {
-    "charac": (None, None, None, None, "GGYGAB"),
-    "compsite": "(?=(?P<Pin17FIII>GG[CT]GA[CGT]))|(?=(?P<Pin17FIII_as>[ACG]TC[AG]CC))",
-    "dna": None,
-    "freq": 682.6666666666666,
-    "fst3": None,
-    "fst5": None,
-    "id": 167970,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGYGAB",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:167970",
-}
-
-rest_dict["PinAI"] = {
-    "charac": (1, -1, None, None, "ACCGGT"),
-    "compsite": "(?=(?P<PinAI>ACCGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1485,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCGGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("Q", "X"),
-    "uri": "https://identifiers.org/rebase:1485",
-}
-
-rest_dict["PinP23II"] = {
-    "charac": (None, None, None, None, "CTRKCAG"),
-    "compsite": "(?=(?P<PinP23II>CT[AG][GT]CAG))|(?=(?P<PinP23II_as>CTG[AC][CT]AG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 229189,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTRKCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:229189",
-}
-
-rest_dict["PinP59III"] = {
-    "charac": (None, None, None, None, "GAAGNAG"),
-    "compsite": "(?=(?P<PinP59III>GAAG.AG))|(?=(?P<PinP59III_as>CT.CTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 229242,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:229242",
-}
-
-rest_dict["PkrI"] = {
-    "charac": (3, -3, None, None, "GCNGC"),
-    "compsite": "(?=(?P<PkrI>GC.GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 140102,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:140102",
-}
-
-rest_dict["PlaDI"] = {
-    "charac": (27, 19, None, None, "CATCAG"),
-    "compsite": "(?=(?P<PlaDI>CATCAG))|(?=(?P<PlaDI_as>CTGATG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 19,
-    "fst5": 27,
-    "id": 16956,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:16956",
-}
-
-rest_dict["Ple19I"] = {
-    "charac": (4, -4, None, None, "CGATCG"),
-    "compsite": "(?=(?P<Ple19I>CGATCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1489,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGATCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:1489",
-}
-
-rest_dict["PleI"] = {
-    "charac": (9, 5, None, None, "GAGTC"),
-    "compsite": "(?=(?P<PleI>GAGTC))|(?=(?P<PleI_as>GACTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 9,
-    "id": 1490,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1490",
-}
-
-rest_dict["PliMI"] = {
-    "charac": (None, None, None, None, "CGCCGAC"),
-    "compsite": "(?=(?P<PliMI>CGCCGAC))|(?=(?P<PliMI_as>GTCGGCG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 21604,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCCGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:21604",
-}
-
-rest_dict["PluTI"] = {
-    "charac": (5, -5, None, None, "GGCGCC"),
-    "compsite": "(?=(?P<PluTI>GGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 23545,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "GCGC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:23545",
-}
-
-rest_dict["PmaCI"] = {
-    "charac": (3, -3, None, None, "CACGTG"),
-    "compsite": "(?=(?P<PmaCI>CACGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1493,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:1493",
-}
-
-rest_dict["Pme10899I"] = {
-    "charac": (None, None, None, None, "GACAGG"),
-    "compsite": "(?=(?P<Pme10899I>GACAGG))|(?=(?P<Pme10899I_as>CCTGTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 415935,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACAGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:415935",
-}
-
-rest_dict["PmeI"] = {
-    "charac": (4, -4, None, None, "GTTTAAAC"),
-    "compsite": "(?=(?P<PmeI>GTTTAAAC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1497,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTTAAAC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1497",
-}
-
-rest_dict["PmlI"] = {
-    "charac": (3, -3, None, None, "CACGTG"),
-    "compsite": "(?=(?P<PmlI>CACGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1499,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1499",
-}
-
-rest_dict["PpiI"] = {
-    "charac": (-7, -24, 25, 8, "GAACNNNNNCTC"),
-    "compsite": "(?=(?P<PpiI>GAAC.....CTC))|(?=(?P<PpiI_as>GAG.....GTTC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": -24,
-    "fst5": -7,
-    "id": 3104,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 8,
-    "scd5": 25,
-    "site": "GAACNNNNNCTC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:3104",
-}
-
-rest_dict["PpiP13II"] = {
-    "charac": (None, None, None, None, "CGCRGAC"),
-    "compsite": "(?=(?P<PpiP13II>CGC[AG]GAC))|(?=(?P<PpiP13II_as>GTC[CT]GCG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 221251,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCRGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:221251",
-}
-
-rest_dict["PpsI"] = {
-    "charac": (9, 5, None, None, "GAGTC"),
-    "compsite": "(?=(?P<PpsI>GAGTC))|(?=(?P<PpsI_as>GACTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 9,
-    "id": 3199,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:3199",
-}
-
-rest_dict["Ppu10I"] = {
-    "charac": (1, -1, None, None, "ATGCAT"),
-    "compsite": "(?=(?P<Ppu10I>ATGCAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1504,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATGCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1504",
-}
-
-rest_dict["Ppu21I"] = {
-    "charac": (3, -3, None, None, "YACGTR"),
-    "compsite": "(?=(?P<Ppu21I>[CT]ACGT[AG]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1509,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "YACGTR",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1509",
-}
-
-rest_dict["PpuMI"] = {
-    "charac": (2, -2, None, None, "RGGWCCY"),
-    "compsite": "(?=(?P<PpuMI>[AG]GG[AT]CC[CT]))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1513,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGGWCCY",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1513",
-}
-
-rest_dict["Pru8113I"] = {
-    "charac": (None, None, None, None, "CAGANGC"),
-    "compsite": "(?=(?P<Pru8113I>CAGA.GC))|(?=(?P<Pru8113I_as>GC.TCTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 289328,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAGANGC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:289328",
-}
-
-rest_dict["PscI"] = {
-    "charac": (1, -1, None, None, "ACATGT"),
-    "compsite": "(?=(?P<PscI>ACATGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 10690,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACATGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:10690",
-}
-
-rest_dict["Pse18267I"] = {
-    "charac": (None, None, None, None, "RCCGAAG"),
-    "compsite": "(?=(?P<Pse18267I>[AG]CCGAAG))|(?=(?P<Pse18267I_as>CTTCGG[CT]))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 77783,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RCCGAAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:77783",
-}
-
-rest_dict["PshAI"] = {
-    "charac": (5, -5, None, None, "GACNNNNGTC"),
-    "compsite": "(?=(?P<PshAI>GAC....GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1515,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNNGTC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("K", "N"),
-    "uri": "https://identifiers.org/rebase:1515",
-}
-
-rest_dict["PshBI"] = {
-    "charac": (2, -2, None, None, "ATTAAT"),
-    "compsite": "(?=(?P<PshBI>ATTAAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2487,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATTAAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:2487",
-}
-
-rest_dict["PsiI"] = {
-    "charac": (3, -3, None, None, "TTATAA"),
-    "compsite": "(?=(?P<PsiI>TTATAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 3775,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTATAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:3775",
-}
-
-rest_dict["Psp0357II"] = {
-    "charac": (None, None, None, None, "GCGAAG"),
-    "compsite": "(?=(?P<Psp0357II>GCGAAG))|(?=(?P<Psp0357II_as>CTTCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 93738,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:93738",
-}
-
-rest_dict["Psp03I"] = {
-    "charac": (4, -4, None, None, "GGWCC"),
-    "compsite": "(?=(?P<Psp03I>GG[AT]CC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 5087,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGWCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:5087",
-}
-
-rest_dict["Psp124BI"] = {
-    "charac": (5, -5, None, None, "GAGCTC"),
-    "compsite": "(?=(?P<Psp124BI>GAGCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2679,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "AGCT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2679",
-}
-
-rest_dict["Psp1406I"] = {
-    "charac": (2, -2, None, None, "AACGTT"),
-    "compsite": "(?=(?P<Psp1406I>AACGTT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2176,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AACGTT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:2176",
-}
-
-rest_dict["Psp5II"] = {
-    "charac": (2, -2, None, None, "RGGWCCY"),
-    "compsite": "(?=(?P<Psp5II>[AG]GG[AT]CC[CT]))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1528,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGGWCCY",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1528",
-}
-
-rest_dict["Psp6I"] = {
-    "charac": (0, 0, None, None, "CCWGG"),
-    "compsite": "(?=(?P<Psp6I>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 6218,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCWGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:6218",
-}
-
-rest_dict["PspAT13III"] = {
-    "charac": (None, None, None, None, "CCGANAG"),
-    "compsite": "(?=(?P<PspAT13III>CCGA.AG))|(?=(?P<PspAT13III_as>CT.TCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 618734,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGANAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:618734",
-}
-
-rest_dict["PspCI"] = {
-    "charac": (3, -3, None, None, "CACGTG"),
-    "compsite": "(?=(?P<PspCI>CACGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 7495,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:7495",
-}
-
-rest_dict["PspD7DII"] = {
-    "charac": (None, None, None, None, "CCGCGAG"),
-    "compsite": "(?=(?P<PspD7DII>CCGCGAG))|(?=(?P<PspD7DII_as>CTCGCGG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 440972,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:440972",
-}
-
-rest_dict["PspEI"] = {
-    "charac": (1, -1, None, None, "GGTNACC"),
-    "compsite": "(?=(?P<PspEI>GGT.ACC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2681,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GTNAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTNACC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2681",
-}
-
-rest_dict["PspFI"] = {
-    "charac": (1, -1, None, None, "CCCAGC"),
-    "compsite": "(?=(?P<PspFI>CCCAGC))|(?=(?P<PspFI_as>GCTGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 17988,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCAGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:17988",
-}
-
-rest_dict["PspGI"] = {
-    "charac": (0, 0, None, None, "CCWGG"),
-    "compsite": "(?=(?P<PspGI>CC[AT]GG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 2568,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCWGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2568",
-}
-
-rest_dict["PspLI"] = {
-    "charac": (1, -1, None, None, "CGTACG"),
-    "compsite": "(?=(?P<PspLI>CGTACG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2748,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGTACG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2748",
-}
-
-rest_dict["PspMR102II"] = {
-    "charac": (None, None, None, None, "CAAGAAC"),
-    "compsite": "(?=(?P<PspMR102II>CAAGAAC))|(?=(?P<PspMR102II_as>GTTCTTG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 618721,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAAGAAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:618721",
-}
-
-rest_dict["PspN4I"] = {
-    "charac": (3, -3, None, None, "GGNNCC"),
-    "compsite": "(?=(?P<PspN4I>GG..CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2749,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNNCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2749",
-}
-
-rest_dict["PspOMI"] = {
-    "charac": (1, -1, None, None, "GGGCCC"),
-    "compsite": "(?=(?P<PspOMI>GGGCCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2683,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGCCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:2683",
-}
-
-rest_dict["PspOMII"] = {
-    "charac": (27, 18, None, None, "CGCCCAR"),
-    "compsite": "(?=(?P<PspOMII>CGCCCA[AG]))|(?=(?P<PspOMII_as>[CT]TGGGCG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": 18,
-    "fst5": 27,
-    "id": 13065,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCCCAR",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:13065",
-}
-
-rest_dict["PspPI"] = {
-    "charac": (1, -1, None, None, "GGNCC"),
-    "compsite": "(?=(?P<PspPI>GG.CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2771,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:2771",
-}
-
-rest_dict["PspPPI"] = {
-    "charac": (2, -2, None, None, "RGGWCCY"),
-    "compsite": "(?=(?P<PspPPI>[AG]GG[AT]CC[CT]))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2881,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGGWCCY",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:2881",
-}
-
-rest_dict["PspPRI"] = {
-    "charac": (21, 13, None, None, "CCYCAG"),
-    "compsite": "(?=(?P<PspPRI>CC[CT]CAG))|(?=(?P<PspPRI_as>CTG[AG]GG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": 13,
-    "fst5": 21,
-    "id": 14886,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCYCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:14886",
-}
-
-rest_dict["PspR84I"] = {
-    "charac": (None, None, None, None, "TACYCAC"),
-    "compsite": "(?=(?P<PspR84I>TAC[CT]CAC))|(?=(?P<PspR84I_as>GTG[AG]GTA))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 356267,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TACYCAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:356267",
-}
-
-rest_dict["PspXI"] = {
-    "charac": (2, -2, None, None, "VCTCGAGB"),
-    "compsite": "(?=(?P<PspXI>[ACG]CTCGAG[CGT]))",
-    "dna": None,
-    "freq": 7281.777777777777,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 7531,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TCGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "VCTCGAGB",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("I", "N"),
-    "uri": "https://identifiers.org/rebase:7531",
-}
-
-rest_dict["PsrI"] = {
-    "charac": (-7, -25, 25, 7, "GAACNNNNNNTAC"),
-    "compsite": "(?=(?P<PsrI>GAAC......TAC))|(?=(?P<PsrI_as>GTA......GTTC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": -25,
-    "fst5": -7,
-    "id": 4916,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 7,
-    "scd5": 25,
-    "site": "GAACNNNNNNTAC",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:4916",
-}
-
-rest_dict["PssI"] = {
-    "charac": (5, -5, None, None, "RGGNCCY"),
-    "compsite": "(?=(?P<PssI>[AG]GG.CC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1534,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGGNCCY",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1534",
-}
-
-rest_dict["Pst14472I"] = {
-    "charac": (None, None, None, None, "CNYACAC"),
-    "compsite": "(?=(?P<Pst14472I>C.[CT]ACAC))|(?=(?P<Pst14472I_as>GTGT[AG].G))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 93519,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CNYACAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:93519",
-}
-
-rest_dict["Pst145I"] = {
-    "charac": (None, None, None, None, "CTAMRAG"),
-    "compsite": "(?=(?P<Pst145I>CTA[AC][AG]AG))|(?=(?P<Pst145I_as>CT[CT][GT]TAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 138626,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTAMRAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:138626",
-}
-
-rest_dict["Pst273I"] = {
-    "charac": (None, None, None, None, "GATCGAG"),
-    "compsite": "(?=(?P<Pst273I>GATCGAG))|(?=(?P<Pst273I_as>CTCGATC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 153468,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATCGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:153468",
-}
-
-rest_dict["PstI"] = {
-    "charac": (5, -5, None, None, "CTGCAG"),
-    "compsite": "(?=(?P<PstI>CTGCAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1536,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTGCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1536",
-}
-
-rest_dict["PstNI"] = {
-    "charac": (6, -6, None, None, "CAGNNNCTG"),
-    "compsite": "(?=(?P<PstNI>CAG...CTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 26996,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAGNNNCTG",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:26996",
-}
-
-rest_dict["PsuGI"] = {
-    "charac": (None, None, None, None, "BBCGD"),
-    "compsite": "(?=(?P<PsuGI>[CGT][CGT]CG[AGT]))|(?=(?P<PsuGI_as>[ACT]CG[ACG][ACG]))",
-    "dna": None,
-    "freq": 37.925925925925924,
-    "fst3": None,
-    "fst5": None,
-    "id": 35017,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "BBCGD",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:35017",
-}
-
-rest_dict["PsuI"] = {
-    "charac": (1, -1, None, None, "RGATCY"),
-    "compsite": "(?=(?P<PsuI>[AG]GATC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 4111,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGATCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4111",
-}
-
-rest_dict["PsyI"] = {
-    "charac": (4, -4, None, None, "GACNNNGTC"),
-    "compsite": "(?=(?P<PsyI>GAC...GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 3093,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNGTC",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3093",
-}
-
-rest_dict["PteI"] = {
-    "charac": (1, -1, None, None, "GCGCGC"),
-    "compsite": "(?=(?P<PteI>GCGCGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 17982,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGCGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:17982",
-}
-
-rest_dict["PvuI"] = {
-    "charac": (4, -4, None, None, "CGATCG"),
-    "compsite": "(?=(?P<PvuI>CGATCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1541,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGATCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "K", "M", "N", "O", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:1541",
-}
-
-rest_dict["PvuII"] = {
-    "charac": (3, -3, None, None, "CAGCTG"),
-    "compsite": "(?=(?P<PvuII>CAGCTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1542,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAGCTG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "S", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1542",
-}
-
-rest_dict["Ran11014IV"] = {
-    "charac": (None, None, None, None, "GAAAGAG"),
-    "compsite": "(?=(?P<Ran11014IV>GAAAGAG))|(?=(?P<Ran11014IV_as>CTCTTTC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 216253,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAAGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:216253",
-}
-
-rest_dict["Rba2021I"] = {
-    "charac": (None, None, None, None, "CACGAGH"),
-    "compsite": "(?=(?P<Rba2021I>CACGAG[ACT]))|(?=(?P<Rba2021I_as>[AGT]CTCGTG))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 77917,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACGAGH",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:77917",
-}
-
-rest_dict["RceI"] = {
-    "charac": (27, 18, None, None, "CATCGAC"),
-    "compsite": "(?=(?P<RceI>CATCGAC))|(?=(?P<RceI_as>GTCGATG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": 18,
-    "fst5": 27,
-    "id": 20241,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATCGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:20241",
-}
-
-rest_dict["RdeGBI"] = {
-    "charac": (None, None, None, None, "CCGCAG"),
-    "compsite": "(?=(?P<RdeGBI>CCGCAG))|(?=(?P<RdeGBI_as>CTGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 28550,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:28550",
-}
-
-rest_dict["RdeGBII"] = {
-    "charac": (26, 18, None, None, "ACCCAG"),
-    "compsite": "(?=(?P<RdeGBII>ACCCAG))|(?=(?P<RdeGBII_as>CTGGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 28551,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:28551",
-}
-
-rest_dict["RdeGBIII"] = {
-    "charac": (-9, -17, 17, 9, "TGRYCA"),
-    "compsite": "(?=(?P<RdeGBIII>TG[AG][CT]CA))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -17,
-    "fst5": -9,
-    "id": 28544,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": 9,
-    "scd5": 17,
-    "site": "TGRYCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:28544",
-}
-
-rest_dict["Rer8036II"] = {
-    "charac": (None, None, None, None, "CCGAKGG"),
-    "compsite": "(?=(?P<Rer8036II>CCGA[GT]GG))|(?=(?P<Rer8036II_as>CC[AC]TCGG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 416878,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGAKGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:416878",
-}
-
-rest_dict["RflFIII"] = {
-    "charac": (None, None, None, None, "CGCCAG"),
-    "compsite": "(?=(?P<RflFIII>CGCCAG))|(?=(?P<RflFIII_as>CTGGCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 32269,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:32269",
-}
-
-rest_dict["RgaI"] = {
-    "charac": (5, -5, None, None, "GCGATCGC"),
-    "compsite": "(?=(?P<RgaI>GCGATCGC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 10873,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGATCGC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:10873",
-}
-
-rest_dict["Rgo13296IV"] = {
-    "charac": (None, None, None, None, "GRAAGCG"),
-    "compsite": "(?=(?P<Rgo13296IV>G[AG]AAGCG))|(?=(?P<Rgo13296IV_as>CGCTT[CT]C))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 416879,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRAAGCG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:416879",
-}
-
-rest_dict["Rho5650I"] = {
-    "charac": (None, None, None, None, "AACGAG"),
-    "compsite": "(?=(?P<Rho5650I>AACGAG))|(?=(?P<Rho5650I_as>CTCGTT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 414024,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AACGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:414024",
-}
-
-rest_dict["RigI"] = {
-    "charac": (6, -6, None, None, "GGCCGGCC"),
-    "compsite": "(?=(?P<RigI>GGCCGGCC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 14596,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCCGGCC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:14596",
-}
-
-rest_dict["Rkr11038I"] = {
-    "charac": (None, None, None, None, "GGANNNNNRTGA"),
-    "compsite": "(?=(?P<Rkr11038I>GGA.....[AG]TGA))|(?=(?P<Rkr11038I_as>TCA[CT].....TCC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 413999,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGANNNNNRTGA",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:413999",
-}
-
-rest_dict["RlaI"] = {
-    "charac": (None, None, None, None, "VCW"),
-    "compsite": "(?=(?P<RlaI>[ACG]C[AT]))|(?=(?P<RlaI_as>[AT]G[CGT]))",
-    "dna": None,
-    "freq": 10.666666666666666,
-    "fst3": None,
-    "fst5": None,
-    "id": 21323,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "VCW",
-    "size": 3,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:21323",
-}
-
-rest_dict["RlaII"] = {
-    "charac": (26, 18, None, None, "ACACAG"),
-    "compsite": "(?=(?P<RlaII>ACACAG))|(?=(?P<RlaII_as>CTGTGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 24516,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACACAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:24516",
-}
-
-rest_dict["RleAI"] = {
-    "charac": (18, 9, None, None, "CCCACA"),
-    "compsite": "(?=(?P<RleAI>CCCACA))|(?=(?P<RleAI_as>TGTGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 9,
-    "fst5": 18,
-    "id": 1552,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCACA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1552",
-}
-
-rest_dict["Rmu369III"] = {
-    "charac": (None, None, None, None, "GGCYAC"),
-    "compsite": "(?=(?P<Rmu369III>GGC[CT]AC))|(?=(?P<Rmu369III_as>GT[AG]GCC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 222072,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCYAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:222072",
-}
-
-rest_dict["RpaB5I"] = {
-    "charac": (27, 18, None, None, "CGRGGAC"),
-    "compsite": "(?=(?P<RpaB5I>CG[AG]GGAC))|(?=(?P<RpaB5I_as>GTCC[CT]CG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": 18,
-    "fst5": 27,
-    "id": 17116,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGRGGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:17116",
-}
-
-rest_dict["RpaBI"] = {
-    "charac": (27, 18, None, None, "CCCGCAG"),
-    "compsite": "(?=(?P<RpaBI>CCCGCAG))|(?=(?P<RpaBI_as>CTGCGGG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": 18,
-    "fst5": 27,
-    "id": 24819,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCGCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:24819",
-}
-
-rest_dict["RpaI"] = {
-    "charac": (18, 9, None, None, "GTYGGAG"),
-    "compsite": "(?=(?P<RpaI>GT[CT]GGAG))|(?=(?P<RpaI_as>CTCC[AG]AC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": 9,
-    "fst5": 18,
-    "id": 7538,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTYGGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:7538",
-}
-
-rest_dict["RpaTI"] = {
-    "charac": (None, None, None, None, "GRTGGAG"),
-    "compsite": "(?=(?P<RpaTI>G[AG]TGGAG))|(?=(?P<RpaTI_as>CTCCA[CT]C))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 26580,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRTGGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:26580",
-}
-
-rest_dict["RruI"] = {
-    "charac": (3, -3, None, None, "TCGCGA"),
-    "compsite": "(?=(?P<RruI>TCGCGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 17996,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCGCGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:17996",
-}
-
-rest_dict["RsaI"] = {
-    "charac": (2, -2, None, None, "GTAC"),
-    "compsite": "(?=(?P<RsaI>GTAC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1567,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTAC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "M", "N", "Q", "R", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:1567",
-}
-
-rest_dict["RsaNI"] = {
-    "charac": (1, -1, None, None, "GTAC"),
-    "compsite": "(?=(?P<RsaNI>GTAC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 16208,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTAC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:16208",
-}
-
-rest_dict["RseI"] = {
-    "charac": (5, -5, None, None, "CAYNNNNRTG"),
-    "compsite": "(?=(?P<RseI>CA[CT]....[AG]TG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 14762,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAYNNNNRTG",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:14762",
-}
-
-rest_dict["Rsp008IV"] = {
-    "charac": (None, None, None, None, "ACGCAG"),
-    "compsite": "(?=(?P<Rsp008IV>ACGCAG))|(?=(?P<Rsp008IV_as>CTGCGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 153107,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:153107",
-}
-
-rest_dict["Rsp008V"] = {
-    "charac": (None, None, None, None, "GCCCAT"),
-    "compsite": "(?=(?P<Rsp008V>GCCCAT))|(?=(?P<Rsp008V_as>ATGGGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 152603,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:152603",
-}
-
-rest_dict["Rsp531II"] = {
-    "charac": (None, None, None, None, "CACACG"),
-    "compsite": "(?=(?P<Rsp531II>CACACG))|(?=(?P<Rsp531II_as>CGTGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 274776,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACACG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:274776",
-}
-
-rest_dict["RspPBTS2III"] = {
-    "charac": (None, None, None, None, "CTTCGAG"),
-    "compsite": "(?=(?P<RspPBTS2III>CTTCGAG))|(?=(?P<RspPBTS2III_as>CTCGAAG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 152164,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTCGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:152164",
-}
-
-rest_dict["Rsr2I"] = {
-    "charac": (2, -2, None, None, "CGGWCCG"),
-    "compsite": "(?=(?P<Rsr2I>CGG[AT]CCG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 3886,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGWCCG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:3886",
-}
-
-rest_dict["RsrII"] = {
-    "charac": (2, -2, None, None, "CGGWCCG"),
-    "compsite": "(?=(?P<RsrII>CGG[AT]CCG))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1573,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGWCCG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("N", "Q", "X"),
-    "uri": "https://identifiers.org/rebase:1573",
-}
-
-rest_dict["Rtr1953I"] = {
-    "charac": (None, None, None, None, "TGANNNNNNTGA"),
-    "compsite": "(?=(?P<Rtr1953I>TGA......TGA))|(?=(?P<Rtr1953I_as>TCA......TCA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 145447,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGANNNNNNTGA",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:145447",
-}
-
-rest_dict["SacI"] = {
-    "charac": (5, -5, None, None, "GAGCTC"),
-    "compsite": "(?=(?P<SacI>GAGCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1578,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "AGCT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "M", "N", "O", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:1578",
-}
-
-rest_dict["SacII"] = {
-    "charac": (4, -4, None, None, "CCGCGG"),
-    "compsite": "(?=(?P<SacII>CCGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1579,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "GC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "N", "O", "Q", "R", "X"),
-    "uri": "https://identifiers.org/rebase:1579",
-}
-
-rest_dict["Saf8902III"] = {
-    "charac": (None, None, None, None, "CAATNAG"),
-    "compsite": "(?=(?P<Saf8902III>CAAT.AG))|(?=(?P<Saf8902III_as>CT.ATTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 46424,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAATNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:46424",
-}
-
-rest_dict["Sag901I"] = {
-    "charac": (None, None, None, None, "GCAAAT"),
-    "compsite": "(?=(?P<Sag901I>GCAAAT))|(?=(?P<Sag901I_as>ATTTGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 283227,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCAAAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:283227",
-}
-
-rest_dict["SalI"] = {
-    "charac": (1, -1, None, None, "GTCGAC"),
-    "compsite": "(?=(?P<SalI>GTCGAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1588,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TCGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTCGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1588",
-}
-
-rest_dict["SanDI"] = {
-    "charac": (2, -2, None, None, "GGGWCCC"),
-    "compsite": "(?=(?P<SanDI>GGG[AT]CCC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2610,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGWCCC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2610",
-}
-
-rest_dict["SapI"] = {
-    "charac": (8, 4, None, None, "GCTCTTC"),
-    "compsite": "(?=(?P<SapI>GCTCTTC))|(?=(?P<SapI_as>GAAGAGC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": 4,
-    "fst5": 8,
-    "id": 1593,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTCTTC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1593",
-}
-
-rest_dict["SaqAI"] = {
-    "charac": (1, -1, None, None, "TTAA"),
-    "compsite": "(?=(?P<SaqAI>TTAA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 17984,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTAA",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:17984",
-}
-
-rest_dict["SatI"] = {
-    "charac": (2, -2, None, None, "GCNGC"),
-    "compsite": "(?=(?P<SatI>GC.GC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 4809,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCNGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4809",
-}
-
-rest_dict["Sau1803III"] = {
-    "charac": (None, None, None, None, "CGANNNNNNTAC"),
-    "compsite": "(?=(?P<Sau1803III>CGA......TAC))|(?=(?P<Sau1803III_as>GTA......TCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 288557,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGANNNNNNTAC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:288557",
-}
-
-rest_dict["Sau3AI"] = {
-    "charac": (0, 0, None, None, "GATC"),
-    "compsite": "(?=(?P<Sau3AI>GATC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 1604,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("C", "J", "K", "M", "N", "X"),
-    "uri": "https://identifiers.org/rebase:1604",
-}
-
-rest_dict["Sau5656II"] = {
-    "charac": (None, None, None, None, "GTTGCA"),
-    "compsite": "(?=(?P<Sau5656II>GTTGCA))|(?=(?P<Sau5656II_as>TGCAAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 415194,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTGCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:415194",
-}
-
-rest_dict["Sau64037IV"] = {
-    "charac": (None, None, None, None, "GTANNNNNNTGG"),
-    "compsite": "(?=(?P<Sau64037IV>GTA......TGG))|(?=(?P<Sau64037IV_as>CCA......TAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 248173,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTANNNNNNTGG",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:248173",
-}
-
-rest_dict["Sau96I"] = {
-    "charac": (1, -1, None, None, "GGNCC"),
-    "compsite": "(?=(?P<Sau96I>GG.CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1607,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GNC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("J", "N"),
-    "uri": "https://identifiers.org/rebase:1607",
-}
-
-rest_dict["SauI"] = {
-    "charac": (2, -2, None, None, "CCTNAGG"),
-    "compsite": "(?=(?P<SauI>CCT.AGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1617,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "TNA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNAGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1617",
-}
-
-rest_dict["SauMJ015III"] = {
-    "charac": (None, None, None, None, "GARCNAG"),
-    "compsite": "(?=(?P<SauMJ015III>GA[AG]C.AG))|(?=(?P<SauMJ015III_as>CT.G[CT]TC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 386673,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GARCNAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:386673",
-}
-
-rest_dict["Sba460II"] = {
-    "charac": (None, None, None, None, "GGNGAYG"),
-    "compsite": "(?=(?P<Sba460II>GG.GA[CT]G))|(?=(?P<Sba460II_as>C[AG]TC.CC))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 202647,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNGAYG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:202647",
-}
-
-rest_dict["SbfI"] = {
-    "charac": (6, -6, None, None, "CCTGCAGG"),
-    "compsite": "(?=(?P<SbfI>CCTGCAGG))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 2742,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTGCAGG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:2742",
-}
-
-rest_dict["Sbo46I"] = {
-    "charac": (None, None, None, None, "TGAAC"),
-    "compsite": "(?=(?P<Sbo46I>TGAAC))|(?=(?P<Sbo46I_as>GTTCA))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 70558,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TGAAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:70558",
-}
-
-rest_dict["ScaI"] = {
-    "charac": (3, -3, None, None, "AGTACT"),
-    "compsite": "(?=(?P<ScaI>AGTACT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1628,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGTACT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "J", "K", "M", "N", "O", "Q", "R", "X"),
-    "uri": "https://identifiers.org/rebase:1628",
-}
-
-rest_dict["SchI"] = {
-    "charac": (10, 5, None, None, "GAGTC"),
-    "compsite": "(?=(?P<SchI>GAGTC))|(?=(?P<SchI_as>GACTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 5,
-    "fst5": 10,
-    "id": 3090,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3090",
-}
-
-rest_dict["SciI"] = {
-    "charac": (3, -3, None, None, "CTCGAG"),
-    "compsite": "(?=(?P<SciI>CTCGAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1635,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1635",
-}
-
-rest_dict["ScoDS2II"] = {
-    "charac": (None, None, None, None, "GCTAAT"),
-    "compsite": "(?=(?P<ScoDS2II>GCTAAT))|(?=(?P<ScoDS2II_as>ATTAGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 187777,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCTAAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:187777",
-}
-
-rest_dict["ScrFI"] = {
-    "charac": (2, -2, None, None, "CCNGG"),
-    "compsite": "(?=(?P<ScrFI>CC.GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1639,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("J", "N"),
-    "uri": "https://identifiers.org/rebase:1639",
-}
-
-rest_dict["SdaI"] = {
-    "charac": (6, -6, None, None, "CCTGCAGG"),
-    "compsite": "(?=(?P<SdaI>CCTGCAGG))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 2946,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTGCAGG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2946",
-}
-
-rest_dict["SdeAI"] = {
-    "charac": (27, 19, None, None, "CAGRAG"),
-    "compsite": "(?=(?P<SdeAI>CAG[AG]AG))|(?=(?P<SdeAI_as>CT[CT]CTG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": 19,
-    "fst5": 27,
-    "id": 13902,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAGRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:13902",
-}
-
-rest_dict["SdeOSI"] = {
-    "charac": (-11, -24, 23, 10, "GACNNNNRTGA"),
-    "compsite": "(?=(?P<SdeOSI>GAC....[AG]TGA))|(?=(?P<SdeOSI_as>TCA[CT]....GTC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -24,
-    "fst5": -11,
-    "id": 16253,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": 10,
-    "scd5": 23,
-    "site": "GACNNNNRTGA",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:16253",
-}
-
-rest_dict["SduI"] = {
-    "charac": (5, -5, None, None, "GDGCHC"),
-    "compsite": "(?=(?P<SduI>G[AGT]GC[ACT]C))",
-    "dna": None,
-    "freq": 455.1111111111111,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1641,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "DGCH",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GDGCHC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:1641",
-}
-
-rest_dict["Sdy5370I"] = {
-    "charac": (None, None, None, None, "CACNNNNNTCY"),
-    "compsite": "(?=(?P<Sdy5370I>CAC.....TC[CT]))|(?=(?P<Sdy5370I_as>[AG]GA.....GTG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 256274,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACNNNNNTCY",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:256274",
-}
-
-rest_dict["Sdy7136I"] = {
-    "charac": (None, None, None, None, "GAGNNNNNTAA"),
-    "compsite": "(?=(?P<Sdy7136I>GAG.....TAA))|(?=(?P<Sdy7136I_as>TTA.....CTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 255658,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGNNNNNTAA",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:255658",
-}
-
-rest_dict["Sdy9603I"] = {
-    "charac": (None, None, None, None, "GCANNNNNNNTGA"),
-    "compsite": "(?=(?P<Sdy9603I>GCA.......TGA))|(?=(?P<Sdy9603I_as>TCA.......TGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 417791,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCANNNNNNNTGA",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:417791",
-}
-
-rest_dict["SecI"] = {
-    "charac": (1, -1, None, None, "CCNNGG"),
-    "compsite": "(?=(?P<SecI>CC..GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1643,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CNNG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNNGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1643",
-}
-
-rest_dict["SelI"] = {
-    "charac": (0, 0, None, None, "CGCG"),
-    "compsite": "(?=(?P<SelI>CGCG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 1646,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1646",
-}
-
-rest_dict["Sen17963III"] = {
-    "charac": (None, None, None, None, "CCAAAC"),
-    "compsite": "(?=(?P<Sen17963III>CCAAAC))|(?=(?P<Sen17963III_as>GTTTGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 204955,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCAAAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:204955",
-}
-
-rest_dict["Sen5794III"] = {
-    "charac": (None, None, None, None, "ACGAACB"),
-    "compsite": "(?=(?P<Sen5794III>ACGAAC[CGT]))|(?=(?P<Sen5794III_as>[ACG]GTTCGT))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 413892,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGAACB",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:413892",
-}
-
-rest_dict["Sen6480IV"] = {
-    "charac": (None, None, None, None, "GTTCAT"),
-    "compsite": "(?=(?P<Sen6480IV>GTTCAT))|(?=(?P<Sen6480IV_as>ATGAAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 255831,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTTCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:255831",
-}
-
-rest_dict["SenA1673III"] = {
-    "charac": (None, None, None, None, "GNGGCAG"),
-    "compsite": "(?=(?P<SenA1673III>G.GGCAG))|(?=(?P<SenA1673III_as>CTGCC.C))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 227671,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GNGGCAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:227671",
-}
-
-rest_dict["SenSARA26III"] = {
-    "charac": (None, None, None, None, "ACRCAG"),
-    "compsite": "(?=(?P<SenSARA26III>AC[AG]CAG))|(?=(?P<SenSARA26III_as>CTG[CT]GT))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 161925,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACRCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:161925",
-}
-
-rest_dict["SenTFIV"] = {
-    "charac": (None, None, None, None, "GATCAG"),
-    "compsite": "(?=(?P<SenTFIV>GATCAG))|(?=(?P<SenTFIV_as>CTGATC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 66999,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GATCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:66999",
-}
-
-rest_dict["Sep11964I"] = {
-    "charac": (None, None, None, None, "CGYCAT"),
-    "compsite": "(?=(?P<Sep11964I>CG[CT]CAT))|(?=(?P<Sep11964I_as>ATG[AG]CG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 415268,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGYCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:415268",
-}
-
-rest_dict["Seq11824I"] = {
-    "charac": (None, None, None, None, "CTANNNNNCTC"),
-    "compsite": "(?=(?P<Seq11824I>CTA.....CTC))|(?=(?P<Seq11824I_as>GAG.....TAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 255596,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTANNNNNCTC",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:255596",
-}
-
-rest_dict["SetI"] = {
-    "charac": (4, -4, None, None, "ASST"),
-    "compsite": "(?=(?P<SetI>A[CG][CG]T))",
-    "dna": None,
-    "freq": 64.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 14595,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "ASST",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ASST",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:14595",
-}
-
-rest_dict["SexAI"] = {
-    "charac": (1, -1, None, None, "ACCWGGT"),
-    "compsite": "(?=(?P<SexAI>ACC[AT]GGT))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2314,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCWGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCWGGT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": ("M", "N"),
-    "uri": "https://identifiers.org/rebase:2314",
-}
-
-rest_dict["SfaAI"] = {
-    "charac": (5, -5, None, None, "GCGATCGC"),
-    "compsite": "(?=(?P<SfaAI>GCGATCGC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 10922,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGATCGC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:10922",
-}
-
-rest_dict["SfaNI"] = {
-    "charac": (10, 9, None, None, "GCATC"),
-    "compsite": "(?=(?P<SfaNI>GCATC))|(?=(?P<SfaNI_as>GATGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 9,
-    "fst5": 10,
-    "id": 1652,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCATC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:1652",
-}
-
-rest_dict["SfcI"] = {
-    "charac": (1, -1, None, None, "CTRYAG"),
-    "compsite": "(?=(?P<SfcI>CT[AG][CT]AG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1653,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TRYA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTRYAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1653",
-}
-
-rest_dict["SfeI"] = {
-    "charac": (1, -1, None, None, "CTRYAG"),
-    "compsite": "(?=(?P<SfeI>CT[AG][CT]AG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1654,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TRYA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTRYAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1654",
-}
-
-rest_dict["SfiI"] = {
-    "charac": (8, -8, None, None, "GGCCNNNNNGGCC"),
-    "compsite": "(?=(?P<SfiI>GGCC.....GGCC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -8,
-    "fst5": 8,
-    "id": 1655,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCCNNNNNGGCC",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1655",
-}
-
-rest_dict["Sfl13829III"] = {
-    "charac": (None, None, None, None, "GNYCAG"),
-    "compsite": "(?=(?P<Sfl13829III>G.[CT]CAG))|(?=(?P<Sfl13829III_as>CTG[AG].C))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 416071,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GNYCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:416071",
-}
-
-rest_dict["SfoI"] = {
-    "charac": (3, -3, None, None, "GGCGCC"),
-    "compsite": "(?=(?P<SfoI>GGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1660,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1660",
-}
-
-rest_dict["Sfr274I"] = {
-    "charac": (1, -1, None, None, "CTCGAG"),
-    "compsite": "(?=(?P<Sfr274I>CTCGAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1661,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TCGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:1661",
-}
-
-rest_dict["Sfr303I"] = {
-    "charac": (4, -4, None, None, "CCGCGG"),
-    "compsite": "(?=(?P<Sfr303I>CCGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1662,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "GC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:1662",
-}
-
-rest_dict["SfuI"] = {
-    "charac": (2, -2, None, None, "TTCGAA"),
-    "compsite": "(?=(?P<SfuI>TTCGAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1666,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTCGAA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("M", "S"),
-    "uri": "https://identifiers.org/rebase:1666",
-}
-
-rest_dict["SgeI"] = {
-    "charac": (13, 13, None, None, "CNNG"),
-    "compsite": "(?=(?P<SgeI>C..G))",
-    "dna": None,
-    "freq": 16.0,
-    "fst3": 13,
-    "fst5": 13,
-    "id": 21264,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CNNG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:21264",
-}
-
-rest_dict["SgfI"] = {
-    "charac": (5, -5, None, None, "GCGATCGC"),
-    "compsite": "(?=(?P<SgfI>GCGATCGC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2426,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "AT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGATCGC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("R",),
-    "uri": "https://identifiers.org/rebase:2426",
-}
-
-rest_dict["Sgr7807I"] = {
-    "charac": (None, None, None, None, "GCCGAGG"),
-    "compsite": "(?=(?P<Sgr7807I>GCCGAGG))|(?=(?P<Sgr7807I_as>CCTCGGC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 419639,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCGAGG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:419639",
-}
-
-rest_dict["SgrAI"] = {
-    "charac": (2, -2, None, None, "CRCCGGYG"),
-    "compsite": "(?=(?P<SgrAI>C[AG]CCGG[CT]G))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 1673,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRCCGGYG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1673",
-}
-
-rest_dict["SgrAII"] = {
-    "charac": (None, None, None, None, "CGAGATC"),
-    "compsite": "(?=(?P<SgrAII>CGAGATC))|(?=(?P<SgrAII_as>GATCTCG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 334113,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGAGATC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:334113",
-}
-
-rest_dict["SgrBI"] = {
-    "charac": (4, -4, None, None, "CCGCGG"),
-    "compsite": "(?=(?P<SgrBI>CCGCGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1674,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "GC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGCGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:1674",
-}
-
-rest_dict["SgrDI"] = {
-    "charac": (2, -2, None, None, "CGTCGACG"),
-    "compsite": "(?=(?P<SgrDI>CGTCGACG))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10539,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TCGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGTCGACG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:10539",
-}
-
-rest_dict["SgrTI"] = {
-    "charac": (14, 14, None, None, "CCDS"),
-    "compsite": "(?=(?P<SgrTI>CC[AGT][CG]))|(?=(?P<SgrTI_as>[CG][ACT]GG))",
-    "dna": None,
-    "freq": 42.666666666666664,
-    "fst3": 14,
-    "fst5": 14,
-    "id": 29707,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCDS",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:29707",
-}
-
-rest_dict["SgsI"] = {
-    "charac": (2, -2, None, None, "GGCGCGCC"),
-    "compsite": "(?=(?P<SgsI>GGCGCGCC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10689,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CGCG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCGCC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:10689",
-}
-
-rest_dict["SimI"] = {
-    "charac": (2, 0, None, None, "GGGTC"),
-    "compsite": "(?=(?P<SimI>GGGTC))|(?=(?P<SimI_as>GACCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 0,
-    "fst5": 2,
-    "id": 2782,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GTC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2782",
-}
-
-rest_dict["SinI"] = {
-    "charac": (1, -1, None, None, "GGWCC"),
-    "compsite": "(?=(?P<SinI>GG[AT]CC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1687,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGWCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("X",),
-    "uri": "https://identifiers.org/rebase:1687",
-}
-
-rest_dict["SlaI"] = {
-    "charac": (1, -1, None, None, "CTCGAG"),
-    "compsite": "(?=(?P<SlaI>CTCGAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1694,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TCGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C", "Y"),
-    "uri": "https://identifiers.org/rebase:1694",
-}
-
-rest_dict["Sma10259II"] = {
-    "charac": (None, None, None, None, "CAAAGA"),
-    "compsite": "(?=(?P<Sma10259II>CAAAGA))|(?=(?P<Sma10259II_as>TCTTTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 288314,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAAAGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:288314",
-}
-
-rest_dict["Sma325I"] = {
-    "charac": (None, None, None, None, "ARCCCT"),
-    "compsite": "(?=(?P<Sma325I>A[AG]CCCT))|(?=(?P<Sma325I_as>AGGG[CT]T))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 208853,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ARCCCT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:208853",
-}
-
-rest_dict["SmaI"] = {
-    "charac": (3, -3, None, None, "CCCGGG"),
-    "compsite": "(?=(?P<SmaI>CCCGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1704,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCGGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"),
-    "uri": "https://identifiers.org/rebase:1704",
-}
-
-rest_dict["SmaUMH5I"] = {
-    "charac": (None, None, None, None, "CTTGAC"),
-    "compsite": "(?=(?P<SmaUMH5I>CTTGAC))|(?=(?P<SmaUMH5I_as>GTCAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 212811,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTGAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:212811",
-}
-
-rest_dict["SmaUMH8I"] = {
-    "charac": (None, None, None, None, "GCGAACB"),
-    "compsite": "(?=(?P<SmaUMH8I>GCGAAC[CGT]))|(?=(?P<SmaUMH8I_as>[ACG]GTTCGC))",
-    "dna": None,
-    "freq": 5461.333333333333,
-    "fst3": None,
-    "fst5": None,
-    "id": 212281,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGAACB",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:212281",
-}
-
-rest_dict["SmiI"] = {
-    "charac": (4, -4, None, None, "ATTTAAAT"),
-    "compsite": "(?=(?P<SmiI>ATTTAAAT))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 2750,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATTTAAAT",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "K", "V"),
-    "uri": "https://identifiers.org/rebase:2750",
-}
-
-rest_dict["SmiMI"] = {
-    "charac": (5, -5, None, None, "CAYNNNNRTG"),
-    "compsite": "(?=(?P<SmiMI>CA[CT]....[AG]TG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 4190,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAYNNNNRTG",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:4190",
-}
-
-rest_dict["SmlI"] = {
-    "charac": (1, -1, None, None, "CTYRAG"),
-    "compsite": "(?=(?P<SmlI>CT[CT][AG]AG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2884,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TYRA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTYRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2884",
-}
-
-rest_dict["SmoI"] = {
-    "charac": (1, -1, None, None, "CTYRAG"),
-    "compsite": "(?=(?P<SmoI>CT[CT][AG]AG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 10923,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TYRA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTYRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:10923",
-}
-
-rest_dict["Sna507VIII"] = {
-    "charac": (None, None, None, None, "CRTTGAG"),
-    "compsite": "(?=(?P<Sna507VIII>C[AG]TTGAG))|(?=(?P<Sna507VIII_as>CTCAA[CT]G))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 297923,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CRTTGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:297923",
-}
-
-rest_dict["SnaBI"] = {
-    "charac": (3, -3, None, None, "TACGTA"),
-    "compsite": "(?=(?P<SnaBI>TACGTA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1707,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TACGTA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C", "K", "M", "N"),
-    "uri": "https://identifiers.org/rebase:1707",
-}
-
-rest_dict["SnaI"] = {
-    "charac": (None, None, None, None, "GTATAC"),
-    "compsite": "(?=(?P<SnaI>GTATAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 1708,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTATAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1708",
-}
-
-rest_dict["Sno506I"] = {
-    "charac": (None, None, None, None, "GGCCGAG"),
-    "compsite": "(?=(?P<Sno506I>GGCCGAG))|(?=(?P<Sno506I_as>CTCGGCC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 26389,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCCGAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:26389",
-}
-
-rest_dict["Spe19205IV"] = {
-    "charac": (None, None, None, None, "GGACY"),
-    "compsite": "(?=(?P<Spe19205IV>GGAC[CT]))|(?=(?P<Spe19205IV_as>[AG]GTCC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 297945,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGACY",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:297945",
-}
-
-rest_dict["SpeI"] = {
-    "charac": (1, -1, None, None, "ACTAGT"),
-    "compsite": "(?=(?P<SpeI>ACTAGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1717,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACTAGT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "M", "N", "O", "Q", "R", "S", "X"),
-    "uri": "https://identifiers.org/rebase:1717",
-}
-
-rest_dict["SphI"] = {
-    "charac": (5, -5, None, None, "GCATGC"),
-    "compsite": "(?=(?P<SphI>GCATGC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1719,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCATGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1719",
-}
-
-rest_dict["SplI"] = {
-    "charac": (1, -1, None, None, "CGTACG"),
-    "compsite": "(?=(?P<SplI>CGTACG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1724,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGTACG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1724",
-}
-
-rest_dict["SpnRII"] = {
-    "charac": (None, None, None, None, "TCGAG"),
-    "compsite": "(?=(?P<SpnRII>TCGAG))|(?=(?P<SpnRII_as>CTCGA))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 5624,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCGAG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:5624",
-}
-
-rest_dict["SpoDI"] = {
-    "charac": (None, None, None, None, "GCGGRAG"),
-    "compsite": "(?=(?P<SpoDI>GCGG[AG]AG))|(?=(?P<SpoDI_as>CT[CT]CCGC))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 13737,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGGRAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:13737",
-}
-
-rest_dict["SrfI"] = {
-    "charac": (4, -4, None, None, "GCCCGGGC"),
-    "compsite": "(?=(?P<SrfI>GCCCGGGC))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1728,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCCCGGGC",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1728",
-}
-
-rest_dict["Sse232I"] = {
-    "charac": (2, -2, None, None, "CGCCGGCG"),
-    "compsite": "(?=(?P<Sse232I>CGCCGGCG))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 3831,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCCGGCG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:3831",
-}
-
-rest_dict["Sse8387I"] = {
-    "charac": (6, -6, None, None, "CCTGCAGG"),
-    "compsite": "(?=(?P<Sse8387I>CCTGCAGG))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -6,
-    "fst5": 6,
-    "id": 1732,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTGCAGG",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:1732",
-}
-
-rest_dict["Sse8647I"] = {
-    "charac": (2, -2, None, None, "AGGWCCT"),
-    "compsite": "(?=(?P<Sse8647I>AGG[AT]CCT))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2637,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGGWCCT",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2637",
-}
-
-rest_dict["Sse9I"] = {
-    "charac": (0, 0, None, None, "AATT"),
-    "compsite": "(?=(?P<Sse9I>AATT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 2639,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AATT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2639",
-}
-
-rest_dict["SseBI"] = {
-    "charac": (3, -3, None, None, "AGGCCT"),
-    "compsite": "(?=(?P<SseBI>AGGCCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2159,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGGCCT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:2159",
-}
-
-rest_dict["SsiI"] = {
-    "charac": (1, -1, None, None, "CCGC"),
-    "compsite": "(?=(?P<SsiI>CCGC))|(?=(?P<SsiI_as>GCGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 7452,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGC",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:7452",
-}
-
-rest_dict["Ssp6803IV"] = {
-    "charac": (None, None, None, None, "GAAGGC"),
-    "compsite": "(?=(?P<Ssp6803IV>GAAGGC))|(?=(?P<Ssp6803IV_as>GCCTTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 7489,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGGC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:7489",
-}
-
-rest_dict["Ssp714II"] = {
-    "charac": (None, None, None, None, "CGCAGCG"),
-    "compsite": "(?=(?P<Ssp714II>CGCAGCG))|(?=(?P<Ssp714II_as>CGCTGCG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 70572,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGCAGCG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:70572",
-}
-
-rest_dict["SspD5I"] = {
-    "charac": (13, 8, None, None, "GGTGA"),
-    "compsite": "(?=(?P<SspD5I>GGTGA))|(?=(?P<SspD5I_as>TCACC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 8,
-    "fst5": 13,
-    "id": 4114,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGTGA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4114",
-}
-
-rest_dict["SspDI"] = {
-    "charac": (1, -1, None, None, "GGCGCC"),
-    "compsite": "(?=(?P<SspDI>GGCGCC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 20303,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GCGC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGCGCC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:20303",
-}
-
-rest_dict["SspI"] = {
-    "charac": (3, -3, None, None, "AATATT"),
-    "compsite": "(?=(?P<SspI>AATATT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1746,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AATATT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "N", "Q", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1746",
-}
-
-rest_dict["SspJOR1II"] = {
-    "charac": (None, None, None, None, "AGCGANC"),
-    "compsite": "(?=(?P<SspJOR1II>AGCGA.C))|(?=(?P<SspJOR1II_as>G.TCGCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 317476,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGCGANC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:317476",
-}
-
-rest_dict["SspMI"] = {
-    "charac": (1, -1, None, None, "CTAG"),
-    "compsite": "(?=(?P<SspMI>CTAG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 102129,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTAG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:102129",
-}
-
-rest_dict["SstE37I"] = {
-    "charac": (27, 18, None, None, "CGAAGAC"),
-    "compsite": "(?=(?P<SstE37I>CGAAGAC))|(?=(?P<SstE37I_as>GTCTTCG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": 18,
-    "fst5": 27,
-    "id": 26747,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGAAGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:26747",
-}
-
-rest_dict["SstI"] = {
-    "charac": (5, -5, None, None, "GAGCTC"),
-    "compsite": "(?=(?P<SstI>GAGCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 1759,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "AGCT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C",),
-    "uri": "https://identifiers.org/rebase:1759",
-}
-
-rest_dict["Sth132I"] = {
-    "charac": (8, 8, None, None, "CCCG"),
-    "compsite": "(?=(?P<Sth132I>CCCG))|(?=(?P<Sth132I_as>CGGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 8,
-    "fst5": 8,
-    "id": 2567,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2567",
-}
-
-rest_dict["Sth20745III"] = {
-    "charac": (None, None, None, None, "GGACGAC"),
-    "compsite": "(?=(?P<Sth20745III>GGACGAC))|(?=(?P<Sth20745III_as>GTCGTCC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 22988,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGACGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:22988",
-}
-
-rest_dict["Sth302II"] = {
-    "charac": (2, -2, None, None, "CCGG"),
-    "compsite": "(?=(?P<Sth302II>CCGG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 10809,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCGG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:10809",
-}
-
-rest_dict["SthSt3II"] = {
-    "charac": (None, None, None, None, "GAAGT"),
-    "compsite": "(?=(?P<SthSt3II>GAAGT))|(?=(?P<SthSt3II_as>ACTTC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 214127,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAAGT",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:214127",
-}
-
-rest_dict["StsI"] = {
-    "charac": (15, 14, None, None, "GGATG"),
-    "compsite": "(?=(?P<StsI>GGATG))|(?=(?P<StsI_as>CATCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 14,
-    "fst5": 15,
-    "id": 1784,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "NNNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGATG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1784",
-}
-
-rest_dict["StuI"] = {
-    "charac": (3, -3, None, None, "AGGCCT"),
-    "compsite": "(?=(?P<StuI>AGGCCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 1785,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGGCCT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "M", "N", "Q", "X"),
-    "uri": "https://identifiers.org/rebase:1785",
-}
-
-rest_dict["StyD4I"] = {
-    "charac": (0, 0, None, None, "CCNGG"),
-    "compsite": "(?=(?P<StyD4I>CC.GG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 1786,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "CCNGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCNGG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1786",
-}
-
-rest_dict["StyI"] = {
-    "charac": (1, -1, None, None, "CCWWGG"),
-    "compsite": "(?=(?P<StyI>CC[AT][AT]GG))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1787,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CWWG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCWWGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("C", "J", "N"),
-    "uri": "https://identifiers.org/rebase:1787",
-}
-
-rest_dict["SurP32aII"] = {
-    "charac": (None, None, None, None, "ACRGAG"),
-    "compsite": "(?=(?P<SurP32aII>AC[AG]GAG))|(?=(?P<SurP32aII_as>CTC[CT]GT))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 198625,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACRGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:198625",
-}
-
-rest_dict["SwaI"] = {
-    "charac": (4, -4, None, None, "ATTTAAAT"),
-    "compsite": "(?=(?P<SwaI>ATTTAAAT))",
-    "dna": None,
-    "freq": 65536.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1798,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATTTAAAT",
-    "size": 8,
-    "substrat": "DNA",
-    "suppl": ("J", "M", "N", "S"),
-    "uri": "https://identifiers.org/rebase:1798",
-}
-
-rest_dict["Sxy1780I"] = {
-    "charac": (None, None, None, None, "GGGTNA"),
-    "compsite": "(?=(?P<Sxy1780I>GGGT.A))|(?=(?P<Sxy1780I_as>T.ACCC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 702772,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGGTNA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:702772",
-}
-
-rest_dict["TaaI"] = {
-    "charac": (3, -3, None, None, "ACNGT"),
-    "compsite": "(?=(?P<TaaI>AC.GT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 3088,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACNGT",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3088",
-}
-
-rest_dict["TagI"] = {
-    "charac": (2, -2, None, None, "ACGT"),
-    "compsite": "(?=(?P<TagI>ACGT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 220784,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:220784",
-}
-
-rest_dict["TaiI"] = {
-    "charac": (4, -4, None, None, "ACGT"),
-    "compsite": "(?=(?P<TaiI>ACGT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 2823,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "ACGT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2823",
-}
-
-rest_dict["TaqI"] = {
-    "charac": (1, -1, None, None, "TCGA"),
-    "compsite": "(?=(?P<TaqI>TCGA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1801,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "CG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCGA",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "Q", "R", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1801",
-}
-
-rest_dict["TaqII"] = {
-    "charac": (17, 9, None, None, "GACCGA"),
-    "compsite": "(?=(?P<TaqII>GACCGA))|(?=(?P<TaqII_as>TCGGTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 9,
-    "fst5": 17,
-    "id": 1802,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACCGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("Q", "X"),
-    "uri": "https://identifiers.org/rebase:1802",
-}
-
-rest_dict["TaqIII"] = {
-    "charac": (17, 9, None, None, "CACCCA"),
-    "compsite": "(?=(?P<TaqIII>CACCCA))|(?=(?P<TaqIII_as>TGGGTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 9,
-    "fst5": 17,
-    "id": 126474,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:126474",
-}
-
-rest_dict["TasI"] = {
-    "charac": (0, 0, None, None, "AATT"),
-    "compsite": "(?=(?P<TasI>AATT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 3089,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AATT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3089",
-}
-
-rest_dict["TatI"] = {
-    "charac": (1, -1, None, None, "WGTACW"),
-    "compsite": "(?=(?P<TatI>[AT]GTAC[AT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2746,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GTAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "WGTACW",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2746",
-}
-
-rest_dict["TauI"] = {
-    "charac": (4, -4, None, None, "GCSGC"),
-    "compsite": "(?=(?P<TauI>GC[CG]GC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 2579,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "CSG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCSGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2579",
-}
-
-rest_dict["TfiI"] = {
-    "charac": (1, -1, None, None, "GAWTC"),
-    "compsite": "(?=(?P<TfiI>GA[AT]TC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1807,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "AWT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAWTC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1807",
-}
-
-rest_dict["TkoI"] = {
-    "charac": (26, 18, None, None, "GTGAAG"),
-    "compsite": "(?=(?P<TkoI>GTGAAG))|(?=(?P<TkoI_as>CTTCAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 18,
-    "fst5": 26,
-    "id": 10788,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTGAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:10788",
-}
-
-rest_dict["TkoII"] = {
-    "charac": (16, 8, None, None, "TTCAAG"),
-    "compsite": "(?=(?P<TkoII>TTCAAG))|(?=(?P<TkoII_as>CTTGAA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": 8,
-    "fst5": 16,
-    "id": 10787,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTCAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:10787",
-}
-
-rest_dict["TpyTP2I"] = {
-    "charac": (None, None, None, None, "ACCAAG"),
-    "compsite": "(?=(?P<TpyTP2I>ACCAAG))|(?=(?P<TpyTP2I_as>CTTGGT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 290573,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACCAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:290573",
-}
-
-rest_dict["Tru1I"] = {
-    "charac": (1, -1, None, None, "TTAA"),
-    "compsite": "(?=(?P<Tru1I>TTAA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2218,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTAA",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2218",
-}
-
-rest_dict["Tru9I"] = {
-    "charac": (1, -1, None, None, "TTAA"),
-    "compsite": "(?=(?P<Tru9I>TTAA))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 1817,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TTAA",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("I", "M", "V"),
-    "uri": "https://identifiers.org/rebase:1817",
-}
-
-rest_dict["TscAI"] = {
-    "charac": (7, -7, None, None, "CASTG"),
-    "compsite": "(?=(?P<TscAI>CA[CG]TG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 15359,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 10,
-    "ovhgseq": "NNCASTGNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CASTG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:15359",
-}
-
-rest_dict["TseFI"] = {
-    "charac": (0, 0, None, None, "GTSAC"),
-    "compsite": "(?=(?P<TseFI>GT[CG]AC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 55431,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GTSAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTSAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:55431",
-}
-
-rest_dict["TseI"] = {
-    "charac": (1, -1, None, None, "GCWGC"),
-    "compsite": "(?=(?P<TseI>GC[AT]GC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2537,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "CWG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCWGC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2537",
-}
-
-rest_dict["TsoI"] = {
-    "charac": (17, 9, None, None, "TARCCA"),
-    "compsite": "(?=(?P<TsoI>TA[AG]CCA))|(?=(?P<TsoI_as>TGG[CT]TA))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": 9,
-    "fst5": 17,
-    "id": 7540,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TARCCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:7540",
-}
-
-rest_dict["Tsp45I"] = {
-    "charac": (0, 0, None, None, "GTSAC"),
-    "compsite": "(?=(?P<Tsp45I>GT[CG]AC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 1822,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GTSAC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTSAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:1822",
-}
-
-rest_dict["Tsp4CI"] = {
-    "charac": (3, -3, None, None, "ACNGT"),
-    "compsite": "(?=(?P<Tsp4CI>AC.GT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 2795,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACNGT",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2795",
-}
-
-rest_dict["TspARh3I"] = {
-    "charac": (None, None, None, None, "GRACGAC"),
-    "compsite": "(?=(?P<TspARh3I>G[AG]ACGAC))|(?=(?P<TspARh3I_as>GTCGT[CT]C))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 58600,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GRACGAC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:58600",
-}
-
-rest_dict["TspDTI"] = {
-    "charac": (16, 9, None, None, "ATGAA"),
-    "compsite": "(?=(?P<TspDTI>ATGAA))|(?=(?P<TspDTI_as>TTCAT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 9,
-    "fst5": 16,
-    "id": 5798,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATGAA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("Q", "X"),
-    "uri": "https://identifiers.org/rebase:5798",
-}
-
-rest_dict["TspEI"] = {
-    "charac": (0, 0, None, None, "AATT"),
-    "compsite": "(?=(?P<TspEI>AATT))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 1824,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AATT",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1824",
-}
-
-rest_dict["TspGWI"] = {
-    "charac": (16, 9, None, None, "ACGGA"),
-    "compsite": "(?=(?P<TspGWI>ACGGA))|(?=(?P<TspGWI_as>TCCGT))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": 9,
-    "fst5": 16,
-    "id": 5332,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ACGGA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("Q", "X"),
-    "uri": "https://identifiers.org/rebase:5332",
-}
-
-rest_dict["TspMI"] = {
-    "charac": (1, -1, None, None, "CCCGGG"),
-    "compsite": "(?=(?P<TspMI>CCCGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 7191,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCGGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:7191",
-}
-
-rest_dict["TspRI"] = {
-    "charac": (7, -7, None, None, "CASTG"),
-    "compsite": "(?=(?P<TspRI>CA[CG]TG))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 2463,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 10,
-    "ovhgseq": "NNCASTGNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CASTG",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2463",
-}
-
-rest_dict["TssI"] = {
-    "charac": (None, None, None, None, "GAGNNNCTC"),
-    "compsite": "(?=(?P<TssI>GAG...CTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 10540,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGNNNCTC",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:10540",
-}
-
-rest_dict["TstI"] = {
-    "charac": (-8, -25, 24, 7, "CACNNNNNNTCC"),
-    "compsite": "(?=(?P<TstI>CAC......TCC))|(?=(?P<TstI_as>GGA......GTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -25,
-    "fst5": -8,
-    "id": 7739,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 5,
-    "ovhgseq": "NNNNN",
-    "results": None,
-    "scd3": 7,
-    "scd5": 24,
-    "site": "CACNNNNNNTCC",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:7739",
-}
-
-rest_dict["TsuI"] = {
-    "charac": (None, None, None, None, "GCGAC"),
-    "compsite": "(?=(?P<TsuI>GCGAC))|(?=(?P<TsuI_as>GTCGC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 8158,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GCGAC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:8158",
-}
-
-rest_dict["Tth111I"] = {
-    "charac": (4, -4, None, None, "GACNNNGTC"),
-    "compsite": "(?=(?P<Tth111I>GAC...GTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -4,
-    "fst5": 4,
-    "id": 1829,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACNNNGTC",
-    "size": 9,
-    "substrat": "DNA",
-    "suppl": ("I", "K", "N", "Q", "V", "X"),
-    "uri": "https://identifiers.org/rebase:1829",
-}
-
-rest_dict["Tth111II"] = {
-    "charac": (17, 9, None, None, "CAARCA"),
-    "compsite": "(?=(?P<Tth111II>CAA[AG]CA))|(?=(?P<Tth111II_as>TG[CT]TTG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": 9,
-    "fst5": 17,
-    "id": 1830,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CAARCA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:1830",
-}
-
-rest_dict["UbaF11I"] = {
-    "charac": (None, None, None, None, "TCGTA"),
-    "compsite": "(?=(?P<UbaF11I>TCGTA))|(?=(?P<UbaF11I_as>TACGA))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 11658,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCGTA",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:11658",
-}
-
-rest_dict["UbaF12I"] = {
-    "charac": (None, None, None, None, "CTACNNNGTC"),
-    "compsite": "(?=(?P<UbaF12I>CTAC...GTC))|(?=(?P<UbaF12I_as>GAC...GTAG))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 13011,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTACNNNGTC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:13011",
-}
-
-rest_dict["UbaF13I"] = {
-    "charac": (None, None, None, None, "GAGNNNNNNCTGG"),
-    "compsite": "(?=(?P<UbaF13I>GAG......CTGG))|(?=(?P<UbaF13I_as>CCAG......CTC))",
-    "dna": None,
-    "freq": 16384.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 13892,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAGNNNNNNCTGG",
-    "size": 13,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:13892",
-}
-
-rest_dict["UbaF14I"] = {
-    "charac": (None, None, None, None, "CCANNNNNTCG"),
-    "compsite": "(?=(?P<UbaF14I>CCA.....TCG))|(?=(?P<UbaF14I_as>CGA.....TGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 13967,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCANNNNNTCG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:13967",
-}
-
-rest_dict["UbaF9I"] = {
-    "charac": (None, None, None, None, "TACNNNNNRTGT"),
-    "compsite": "(?=(?P<UbaF9I>TAC.....[AG]TGT))|(?=(?P<UbaF9I_as>ACA[CT].....GTA))",
-    "dna": None,
-    "freq": 8192.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 10733,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TACNNNNNRTGT",
-    "size": 12,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:10733",
-}
-
-rest_dict["UbaPI"] = {
-    "charac": (None, None, None, None, "CGAACG"),
-    "compsite": "(?=(?P<UbaPI>CGAACG))|(?=(?P<UbaPI_as>CGTTCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 4118,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGAACG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:4118",
-}
-
-rest_dict["UcoMSI"] = {
-    "charac": (-7, -11, 11, 7, "GAGCTC"),
-    "compsite": "(?=(?P<UcoMSI>GAGCTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -11,
-    "fst5": -7,
-    "id": 38634,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": 7,
-    "scd5": 11,
-    "site": "GAGCTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:38634",
-}
-
-rest_dict["UnbI"] = {
-    "charac": (0, 0, None, None, "GGNCC"),
-    "compsite": "(?=(?P<UnbI>GG.CC))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 3815,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GGNCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGNCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:3815",
-}
-
-rest_dict["UpaP162I"] = {
-    "charac": (2, -2, None, None, "CATG"),
-    "compsite": "(?=(?P<UpaP162I>CATG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 277875,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CATG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:277875",
-}
-
-rest_dict["Van9116I"] = {
-    "charac": (None, None, None, None, "CCKAAG"),
-    "compsite": "(?=(?P<Van9116I>CC[GT]AAG))|(?=(?P<Van9116I_as>CTT[AC]GG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 208144,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCKAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:208144",
-}
-
-rest_dict["Van91I"] = {
-    "charac": (7, -7, None, None, "CCANNNNNTGG"),
-    "compsite": "(?=(?P<Van91I>CCA.....TGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -7,
-    "fst5": 7,
-    "id": 2108,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 3,
-    "ovhgseq": "NNN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCANNNNNTGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("B", "K"),
-    "uri": "https://identifiers.org/rebase:2108",
-}
-
-rest_dict["VchE4II"] = {
-    "charac": (None, None, None, None, "RTAAAYG"),
-    "compsite": "(?=(?P<VchE4II>[AG]TAAA[CT]G))|(?=(?P<VchE4II_as>C[AG]TTTA[CT]))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 278400,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RTAAAYG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:278400",
-}
-
-rest_dict["Vdi96II"] = {
-    "charac": (None, None, None, None, "GNCYTAG"),
-    "compsite": "(?=(?P<Vdi96II>G.C[CT]TAG))|(?=(?P<Vdi96II_as>CTA[AG]G.C))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 235889,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GNCYTAG",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:235889",
-}
-
-rest_dict["Vha464I"] = {
-    "charac": (1, -1, None, None, "CTTAAG"),
-    "compsite": "(?=(?P<Vha464I>CTTAAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2113,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TTAA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTTAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("V",),
-    "uri": "https://identifiers.org/rebase:2113",
-}
-
-rest_dict["VneI"] = {
-    "charac": (1, -1, None, None, "GTGCAC"),
-    "compsite": "(?=(?P<VneI>GTGCAC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2116,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTGCAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2116",
-}
-
-rest_dict["VpaK11AI"] = {
-    "charac": (0, 0, None, None, "GGWCC"),
-    "compsite": "(?=(?P<VpaK11AI>GG[AT]CC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": 0,
-    "fst5": 0,
-    "id": 2659,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -5,
-    "ovhgseq": "GGWCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGWCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2659",
-}
-
-rest_dict["VpaK11BI"] = {
-    "charac": (1, -1, None, None, "GGWCC"),
-    "compsite": "(?=(?P<VpaK11BI>GG[AT]CC))",
-    "dna": None,
-    "freq": 512.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2660,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -3,
-    "ovhgseq": "GWC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GGWCC",
-    "size": 5,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:2660",
-}
-
-rest_dict["VpaSKIII"] = {
-    "charac": (None, None, None, None, "CGTCAG"),
-    "compsite": "(?=(?P<VpaSKIII>CGTCAG))|(?=(?P<VpaSKIII_as>CTGACG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 618776,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGTCAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:618776",
-}
-
-rest_dict["VspI"] = {
-    "charac": (2, -2, None, None, "ATTAAT"),
-    "compsite": "(?=(?P<VspI>ATTAAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 2124,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATTAAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "I", "V"),
-    "uri": "https://identifiers.org/rebase:2124",
-}
-
-rest_dict["Vtu19109I"] = {
-    "charac": (None, None, None, None, "CACRAYC"),
-    "compsite": "(?=(?P<Vtu19109I>CAC[AG]A[CT]C))|(?=(?P<Vtu19109I_as>G[AG]T[CT]GTG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 97533,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACRAYC",
-    "size": 7,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:97533",
-}
-
-rest_dict["WviI"] = {
-    "charac": (27, 19, None, None, "CACRAG"),
-    "compsite": "(?=(?P<WviI>CAC[AG]AG))|(?=(?P<WviI_as>CT[CT]GTG))",
-    "dna": None,
-    "freq": 2048.0,
-    "fst3": 19,
-    "fst5": 27,
-    "id": 33033,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 2,
-    "ovhgseq": "NN",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CACRAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:33033",
-}
-
-rest_dict["XagI"] = {
-    "charac": (5, -5, None, None, "CCTNNNNNAGG"),
-    "compsite": "(?=(?P<XagI>CCT.....AGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2987,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTNNNNNAGG",
-    "size": 11,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:2987",
-}
-
-rest_dict["XapI"] = {
-    "charac": (1, -1, None, None, "RAATTY"),
-    "compsite": "(?=(?P<XapI>[AG]AATT[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 3195,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "AATT",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RAATTY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3195",
-}
-
-rest_dict["XbaI"] = {
-    "charac": (1, -1, None, None, "TCTAGA"),
-    "compsite": "(?=(?P<XbaI>TCTAGA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2126,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TCTAGA",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "C", "I", "J", "K", "M", "N", "Q", "R", "S", "V", "X"),
-    "uri": "https://identifiers.org/rebase:2126",
-}
-
-rest_dict["Xca85IV"] = {
-    "charac": (None, None, None, None, "TACGAG"),
-    "compsite": "(?=(?P<Xca85IV>TACGAG))|(?=(?P<Xca85IV_as>CTCGTA))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 162608,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "TACGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:162608",
-}
-
-rest_dict["XceI"] = {
-    "charac": (5, -5, None, None, "RCATGY"),
-    "compsite": "(?=(?P<XceI>[AG]CATG[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 3092,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "CATG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RCATGY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3092",
-}
-
-rest_dict["XcmI"] = {
-    "charac": (8, -8, None, None, "CCANNNNNNNNNTGG"),
-    "compsite": "(?=(?P<XcmI>CCA.........TGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -8,
-    "fst5": 8,
-    "id": 2129,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCANNNNNNNNNTGG",
-    "size": 15,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2129",
-}
-
-rest_dict["XhoI"] = {
-    "charac": (1, -1, None, None, "CTCGAG"),
-    "compsite": "(?=(?P<XhoI>CTCGAG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2136,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "TCGA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTCGAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B", "J", "K", "M", "N", "O", "Q", "R", "X"),
-    "uri": "https://identifiers.org/rebase:2136",
-}
-
-rest_dict["XhoII"] = {
-    "charac": (1, -1, None, None, "RGATCY"),
-    "compsite": "(?=(?P<XhoII>[AG]GATC[CT]))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2137,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GATC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "RGATCY",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2137",
-}
-
-rest_dict["XmaI"] = {
-    "charac": (1, -1, None, None, "CCCGGG"),
-    "compsite": "(?=(?P<XmaI>CCCGGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2138,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CCGG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCCGGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:2138",
-}
-
-rest_dict["XmaIII"] = {
-    "charac": (1, -1, None, None, "CGGCCG"),
-    "compsite": "(?=(?P<XmaIII>CGGCCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 2140,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "GGCC",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGCCG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:2140",
-}
-
-rest_dict["XmaJI"] = {
-    "charac": (1, -1, None, None, "CCTAGG"),
-    "compsite": "(?=(?P<XmaJI>CCTAGG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 4112,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -4,
-    "ovhgseq": "CTAG",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CCTAGG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:4112",
-}
-
-rest_dict["XmiI"] = {
-    "charac": (2, -2, None, None, "GTMKAC"),
-    "compsite": "(?=(?P<XmiI>GT[AC][GT]AC))",
-    "dna": None,
-    "freq": 1024.0,
-    "fst3": -2,
-    "fst5": 2,
-    "id": 3828,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "MK",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GTMKAC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("B",),
-    "uri": "https://identifiers.org/rebase:3828",
-}
-
-rest_dict["XmnI"] = {
-    "charac": (5, -5, None, None, "GAANNNNTTC"),
-    "compsite": "(?=(?P<XmnI>GAA....TTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2143,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GAANNNNTTC",
-    "size": 10,
-    "substrat": "DNA",
-    "suppl": ("N",),
-    "uri": "https://identifiers.org/rebase:2143",
-}
-
-rest_dict["XspI"] = {
-    "charac": (1, -1, None, None, "CTAG"),
-    "compsite": "(?=(?P<XspI>CTAG))",
-    "dna": None,
-    "freq": 256.0,
-    "fst3": -1,
-    "fst5": 1,
-    "id": 3825,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": -2,
-    "ovhgseq": "TA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CTAG",
-    "size": 4,
-    "substrat": "DNA",
-    "suppl": ("K",),
-    "uri": "https://identifiers.org/rebase:3825",
-}
-
-rest_dict["YkrI"] = {
-    "charac": (11, 9, None, None, "C"),
-    "compsite": "(?=(?P<YkrI>C))|(?=(?P<YkrI_as>G))",
-    "dna": None,
-    "freq": 4.0,
-    "fst3": 9,
-    "fst5": 11,
-    "id": 23238,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 1,
-    "ovhgseq": "N",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "C",
-    "size": 1,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:23238",
-}
-
-rest_dict["Yps3606I"] = {
-    "charac": (None, None, None, None, "CGGAAG"),
-    "compsite": "(?=(?P<Yps3606I>CGGAAG))|(?=(?P<Yps3606I_as>CTTCCG))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 102781,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "CGGAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:102781",
-}
-
-rest_dict["Yru12986I"] = {
-    "charac": (None, None, None, None, "AGGAAG"),
-    "compsite": "(?=(?P<Yru12986I>AGGAAG))|(?=(?P<Yru12986I_as>CTTCCT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": None,
-    "fst5": None,
-    "id": 420275,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": None,
-    "ovhgseq": None,
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGGAAG",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": (),
-    "uri": "https://identifiers.org/rebase:420275",
-}
-
-rest_dict["ZraI"] = {
-    "charac": (3, -3, None, None, "GACGTC"),
-    "compsite": "(?=(?P<ZraI>GACGTC))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 5363,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "GACGTC",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "N", "V"),
-    "uri": "https://identifiers.org/rebase:5363",
-}
-
-rest_dict["ZrmI"] = {
-    "charac": (3, -3, None, None, "AGTACT"),
-    "compsite": "(?=(?P<ZrmI>AGTACT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -3,
-    "fst5": 3,
-    "id": 7494,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 0,
-    "ovhgseq": "",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "AGTACT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I",),
-    "uri": "https://identifiers.org/rebase:7494",
-}
-
-rest_dict["Zsp2I"] = {
-    "charac": (5, -5, None, None, "ATGCAT"),
-    "compsite": "(?=(?P<Zsp2I>ATGCAT))",
-    "dna": None,
-    "freq": 4096.0,
-    "fst3": -5,
-    "fst5": 5,
-    "id": 2156,
-    "inact_temp": 65,
-    "opt_temp": 37,
-    "ovhg": 4,
-    "ovhgseq": "TGCA",
-    "results": None,
-    "scd3": None,
-    "scd5": None,
-    "site": "ATGCAT",
-    "size": 6,
-    "substrat": "DNA",
-    "suppl": ("I", "V"),
-    "uri": "https://identifiers.org/rebase:2156",
-}
-
-
 # Turn black code style off
 # fmt: off
 
+# The enzymes are stored in _enzymes as tuples of the name of the enzyme
+# followed by the values of the fields in _fields. rest_dict maps the name
+# of each enzyme to a dictionary of these fields.
+_fields = ("charac", "compsite", "dna", "freq", "fst3", "fst5", "id", "inact_temp", "opt_temp", "ovhg", "ovhgseq", "results", "scd3", "scd5", "site", "size", "substrat", "suppl", "uri")
+
+_enzymes = (
+    ("AanI", (3, -3, None, None, "TTATAA"), "(?=(?P<AanI>TTATAA))", None, 4096.0, -3, 3, 15358, 65, 37, 0, "", None, None, None, "TTATAA", 6, "DNA", ("B",), "https://identifiers.org/rebase:15358"),
+    ("AarI", (11, 8, None, None, "CACCTGC"), "(?=(?P<AarI>CACCTGC))|(?=(?P<AarI_as>GCAGGTG))", None, 16384.0, 8, 11, 2892, 65, 37, -4, "NNNN", None, None, None, "CACCTGC", 7, "DNA", ("B",), "https://identifiers.org/rebase:2892"),
+    ("AasI", (7, -7, None, None, "GACNNNNNNGTC"), "(?=(?P<AasI>GAC......GTC))", None, 4096.0, -7, 7, 5465, 65, 37, 2, "NN", None, None, None, "GACNNNNNNGTC", 12, "DNA", ("B",), "https://identifiers.org/rebase:5465"),
+    ("AatII", (5, -5, None, None, "GACGTC"), "(?=(?P<AatII>GACGTC))", None, 4096.0, -5, 5, 7, 65, 37, 4, "ACGT", None, None, None, "GACGTC", 6, "DNA", ("B", "I", "K", "M", "N", "V"), "https://identifiers.org/rebase:7"),
+    ("Aba13301I", (None, None, None, None, "GCAAAC"), "(?=(?P<Aba13301I>GCAAAC))|(?=(?P<Aba13301I_as>GTTTGC))", None, 4096.0, None, None, 375383, 65, 37, None, None, None, None, None, "GCAAAC", 6, "DNA", (), "https://identifiers.org/rebase:375383"),
+    ("Aba6411II", (None, None, None, None, "CRRTAAG"), "(?=(?P<Aba6411II>C[AG][AG]TAAG))|(?=(?P<Aba6411II_as>CTTA[CT][CT]G))", None, 4096.0, None, None, 101759, 65, 37, None, None, None, None, None, "CRRTAAG", 7, "DNA", (), "https://identifiers.org/rebase:101759"),
+    ("AbaB8342IV", (None, None, None, None, "CATTAG"), "(?=(?P<AbaB8342IV>CATTAG))|(?=(?P<AbaB8342IV_as>CTAATG))", None, 4096.0, None, None, 126502, 65, 37, None, None, None, None, None, "CATTAG", 6, "DNA", (), "https://identifiers.org/rebase:126502"),
+    ("AbaCIII", (None, None, None, None, "CTATCAV"), "(?=(?P<AbaCIII>CTATCA[ACG]))|(?=(?P<AbaCIII_as>[CGT]TGATAG))", None, 5461.333333333333, None, None, 23309, 65, 37, None, None, None, None, None, "CTATCAV", 7, "DNA", (), "https://identifiers.org/rebase:23309"),
+    ("AbaPBA3II", (None, None, None, None, "CAYGAC"), "(?=(?P<AbaPBA3II>CA[CT]GAC))|(?=(?P<AbaPBA3II_as>GTC[AG]TG))", None, 2048.0, None, None, 443064, 65, 37, None, None, None, None, None, "CAYGAC", 6, "DNA", (), "https://identifiers.org/rebase:443064"),
+    ("AbaSI", (12, 9, None, None, "C"), "(?=(?P<AbaSI>C))|(?=(?P<AbaSI_as>G))", None, 4.0, 9, 12, 23265, 65, 37, 2, "NN", None, None, None, "C", 1, "DNA", ("N",), "https://identifiers.org/rebase:23265"),
+    ("AbaUMB2I", (None, None, None, None, "YCCGSS"), "(?=(?P<AbaUMB2I>[CT]CCG[CG][CG]))|(?=(?P<AbaUMB2I_as>[CG][CG]CGG[AG]))", None, 512.0, None, None, 30399, 65, 37, None, None, None, None, None, "YCCGSS", 6, "DNA", (), "https://identifiers.org/rebase:30399"),
+    ("Abr4036II", (None, None, None, None, "GRTYGACC"), "(?=(?P<Abr4036II>G[AG]T[CT]GACC))|(?=(?P<Abr4036II_as>GGTC[AG]A[CT]C))", None, 16384.0, None, None, 312254, 65, 37, None, None, None, None, None, "GRTYGACC", 8, "DNA", (), "https://identifiers.org/rebase:312254"),
+    ("AbsI", (2, -2, None, None, "CCTCGAGG"), "(?=(?P<AbsI>CCTCGAGG))", None, 65536.0, -2, 2, 14594, 65, 37, -4, "TCGA", None, None, None, "CCTCGAGG", 8, "DNA", ("I",), "https://identifiers.org/rebase:14594"),
+    ("Acc16I", (3, -3, None, None, "TGCGCA"), "(?=(?P<Acc16I>TGCGCA))", None, 4096.0, -3, 3, 2638, 65, 37, 0, "", None, None, None, "TGCGCA", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2638"),
+    ("Acc36I", (10, 8, None, None, "ACCTGC"), "(?=(?P<Acc36I>ACCTGC))|(?=(?P<Acc36I_as>GCAGGT))", None, 4096.0, 8, 10, 4162, 65, 37, -4, "NNNN", None, None, None, "ACCTGC", 6, "DNA", ("I",), "https://identifiers.org/rebase:4162"),
+    ("Acc65I", (1, -1, None, None, "GGTACC"), "(?=(?P<Acc65I>GGTACC))", None, 4096.0, -1, 1, 14, 65, 37, -4, "GTAC", None, None, None, "GGTACC", 6, "DNA", ("B", "I", "N", "V"), "https://identifiers.org/rebase:14"),
+    ("Acc65V", (None, None, None, None, "GACGCA"), "(?=(?P<Acc65V>GACGCA))|(?=(?P<Acc65V_as>TGCGTC))", None, 4096.0, None, None, 152525, 65, 37, None, None, None, None, None, "GACGCA", 6, "DNA", (), "https://identifiers.org/rebase:152525"),
+    ("AccB1I", (1, -1, None, None, "GGYRCC"), "(?=(?P<AccB1I>GG[CT][AG]CC))", None, 1024.0, -1, 1, 15, 65, 37, -4, "GYRC", None, None, None, "GGYRCC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:15"),
+    ("AccB7I", (7, -7, None, None, "CCANNNNNTGG"), "(?=(?P<AccB7I>CCA.....TGG))", None, 4096.0, -7, 7, 16, 65, 37, 3, "NNN", None, None, None, "CCANNNNNTGG", 11, "DNA", ("I", "V"), "https://identifiers.org/rebase:16"),
+    ("AccBSI", (3, -3, None, None, "CCGCTC"), "(?=(?P<AccBSI>CCGCTC))|(?=(?P<AccBSI_as>GAGCGG))", None, 4096.0, -3, 3, 2733, 65, 37, 0, "", None, None, None, "CCGCTC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2733"),
+    ("AccI", (2, -2, None, None, "GTMKAC"), "(?=(?P<AccI>GT[AC][GT]AC))", None, 1024.0, -2, 2, 18, 65, 37, -2, "MK", None, None, None, "GTMKAC", 6, "DNA", ("B", "J", "K", "M", "N", "Q", "X"), "https://identifiers.org/rebase:18"),
+    ("AccII", (2, -2, None, None, "CGCG"), "(?=(?P<AccII>CGCG))", None, 256.0, -2, 2, 19, 65, 37, 0, "", None, None, None, "CGCG", 4, "DNA", ("J", "K"), "https://identifiers.org/rebase:19"),
+    ("AccIII", (1, -1, None, None, "TCCGGA"), "(?=(?P<AccIII>TCCGGA))", None, 4096.0, -1, 1, 20, 65, 37, -4, "CCGG", None, None, None, "TCCGGA", 6, "DNA", ("J", "K"), "https://identifiers.org/rebase:20"),
+    ("AccIX", (None, None, None, None, "GACRAC"), "(?=(?P<AccIX>GAC[AG]AC))|(?=(?P<AccIX_as>GT[CT]GTC))", None, 2048.0, None, None, 278986, 65, 37, None, None, None, None, None, "GACRAC", 6, "DNA", (), "https://identifiers.org/rebase:278986"),
+    ("AccX", (None, None, None, None, "GGARCA"), "(?=(?P<AccX>GGA[AG]CA))|(?=(?P<AccX_as>TG[CT]TCC))", None, 2048.0, None, None, 278990, 65, 37, None, None, None, None, None, "GGARCA", 6, "DNA", (), "https://identifiers.org/rebase:278990"),
+    ("AceIII", (13, 11, None, None, "CAGCTC"), "(?=(?P<AceIII>CAGCTC))|(?=(?P<AceIII_as>GAGCTG))", None, 4096.0, 11, 13, 2569, 65, 37, -4, "NNNN", None, None, None, "CAGCTC", 6, "DNA", (), "https://identifiers.org/rebase:2569"),
+    ("AchA6III", (None, None, None, None, "AGCCAG"), "(?=(?P<AchA6III>AGCCAG))|(?=(?P<AchA6III_as>CTGGCT))", None, 4096.0, None, None, 19867, 65, 37, None, None, None, None, None, "AGCCAG", 6, "DNA", (), "https://identifiers.org/rebase:19867"),
+    ("AciI", (1, -1, None, None, "CCGC"), "(?=(?P<AciI>CCGC))|(?=(?P<AciI_as>GCGG))", None, 256.0, -1, 1, 21, 65, 37, -2, "CG", None, None, None, "CCGC", 4, "DNA", ("N",), "https://identifiers.org/rebase:21"),
+    ("AclI", (2, -2, None, None, "AACGTT"), "(?=(?P<AclI>AACGTT))", None, 4096.0, -2, 2, 2181, 65, 37, -2, "CG", None, None, None, "AACGTT", 6, "DNA", ("I", "N", "V"), "https://identifiers.org/rebase:2181"),
+    ("AclWI", (9, 5, None, None, "GGATC"), "(?=(?P<AclWI>GGATC))|(?=(?P<AclWI_as>GATCC))", None, 1024.0, 5, 9, 2668, 65, 37, -1, "N", None, None, None, "GGATC", 5, "DNA", ("I",), "https://identifiers.org/rebase:2668"),
+    ("Aco12261II", (None, None, None, None, "CCRGAG"), "(?=(?P<Aco12261II>CC[AG]GAG))|(?=(?P<Aco12261II_as>CTC[CT]GG))", None, 2048.0, None, None, 25209, 65, 37, None, None, None, None, None, "CCRGAG", 6, "DNA", (), "https://identifiers.org/rebase:25209"),
+    ("AcoI", (1, -1, None, None, "YGGCCR"), "(?=(?P<AcoI>[CT]GGCC[AG]))", None, 1024.0, -1, 1, 11822, 65, 37, -4, "GGCC", None, None, None, "YGGCCR", 6, "DNA", ("I",), "https://identifiers.org/rebase:11822"),
+    ("AcoY31II", (None, None, None, None, "TAGCRAB"), "(?=(?P<AcoY31II>TAGC[AG]A[CGT]))|(?=(?P<AcoY31II_as>[ACG]T[CT]GCTA))", None, 2730.6666666666665, None, None, 250928, 65, 37, None, None, None, None, None, "TAGCRAB", 7, "DNA", (), "https://identifiers.org/rebase:250928"),
+    ("AcsI", (1, -1, None, None, "RAATTY"), "(?=(?P<AcsI>[AG]AATT[CT]))", None, 1024.0, -1, 1, 2184, 65, 37, -4, "AATT", None, None, None, "RAATTY", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2184"),
+    ("AcuI", (22, 14, None, None, "CTGAAG"), "(?=(?P<AcuI>CTGAAG))|(?=(?P<AcuI_as>CTTCAG))", None, 4096.0, 14, 22, 5534, 65, 37, 2, "NN", None, None, None, "CTGAAG", 6, "DNA", ("I", "N"), "https://identifiers.org/rebase:5534"),
+    ("AcvI", (3, -3, None, None, "CACGTG"), "(?=(?P<AcvI>CACGTG))", None, 4096.0, -3, 3, 5359, 65, 37, 0, "", None, None, None, "CACGTG", 6, "DNA", ("Q", "X"), "https://identifiers.org/rebase:5359"),
+    ("AcyI", (2, -2, None, None, "GRCGYC"), "(?=(?P<AcyI>G[AG]CG[CT]C))", None, 1024.0, -2, 2, 31, 65, 37, -2, "CG", None, None, None, "GRCGYC", 6, "DNA", ("J",), "https://identifiers.org/rebase:31"),
+    ("AdeI", (6, -6, None, None, "CACNNNGTG"), "(?=(?P<AdeI>CAC...GTG))", None, 4096.0, -6, 6, 2991, 65, 37, 3, "NNN", None, None, None, "CACNNNGTG", 9, "DNA", ("B",), "https://identifiers.org/rebase:2991"),
+    ("Adh6U21I", (None, None, None, None, "GAANCAG"), "(?=(?P<Adh6U21I>GAA.CAG))|(?=(?P<Adh6U21I_as>CTG.TTC))", None, 4096.0, None, None, 214041, 65, 37, None, None, None, None, None, "GAANCAG", 7, "DNA", (), "https://identifiers.org/rebase:214041"),
+    ("AfaI", (2, -2, None, None, "GTAC"), "(?=(?P<AfaI>GTAC))", None, 256.0, -2, 2, 37, 65, 37, 0, "", None, None, None, "GTAC", 4, "DNA", ("B", "K"), "https://identifiers.org/rebase:37"),
+    ("AfeI", (3, -3, None, None, "AGCGCT"), "(?=(?P<AfeI>AGCGCT))", None, 4096.0, -3, 3, 2669, 65, 37, 0, "", None, None, None, "AGCGCT", 6, "DNA", ("I", "N"), "https://identifiers.org/rebase:2669"),
+    ("AfiI", (7, -7, None, None, "CCNNNNNNNGG"), "(?=(?P<AfiI>CC.......GG))", None, 256.0, -7, 7, 10489, 65, 37, 3, "NNN", None, None, None, "CCNNNNNNNGG", 11, "DNA", ("V",), "https://identifiers.org/rebase:10489"),
+    ("AflII", (1, -1, None, None, "CTTAAG"), "(?=(?P<AflII>CTTAAG))", None, 4096.0, -1, 1, 39, 65, 37, -4, "TTAA", None, None, None, "CTTAAG", 6, "DNA", ("J", "K", "N"), "https://identifiers.org/rebase:39"),
+    ("AflIII", (1, -1, None, None, "ACRYGT"), "(?=(?P<AflIII>AC[AG][CT]GT))", None, 1024.0, -1, 1, 40, 65, 37, -4, "CRYG", None, None, None, "ACRYGT", 6, "DNA", ("M", "N", "S"), "https://identifiers.org/rebase:40"),
+    ("AgeI", (1, -1, None, None, "ACCGGT"), "(?=(?P<AgeI>ACCGGT))", None, 4096.0, -1, 1, 42, 65, 37, -4, "CCGG", None, None, None, "ACCGGT", 6, "DNA", ("J", "N", "R"), "https://identifiers.org/rebase:42"),
+    ("AgsI", (3, -3, None, None, "TTSAA"), "(?=(?P<AgsI>TT[CG]AA))", None, 512.0, -3, 3, 19404, 65, 37, 1, "S", None, None, None, "TTSAA", 5, "DNA", ("I",), "https://identifiers.org/rebase:19404"),
+    ("AhaIII", (3, -3, None, None, "TTTAAA"), "(?=(?P<AhaIII>TTTAAA))", None, 4096.0, -3, 3, 47, 65, 37, 0, "", None, None, None, "TTTAAA", 6, "DNA", (), "https://identifiers.org/rebase:47"),
+    ("AhdI", (6, -6, None, None, "GACNNNNNGTC"), "(?=(?P<AhdI>GAC.....GTC))", None, 4096.0, -6, 6, 48, 65, 37, 1, "N", None, None, None, "GACNNNNNGTC", 11, "DNA", ("N",), "https://identifiers.org/rebase:48"),
+    ("AhlI", (1, -1, None, None, "ACTAGT"), "(?=(?P<AhlI>ACTAGT))", None, 4096.0, -1, 1, 4838, 65, 37, -4, "CTAG", None, None, None, "ACTAGT", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:4838"),
+    ("AhyRBAHI", (None, None, None, None, "GCYYGAC"), "(?=(?P<AhyRBAHI>GC[CT][CT]GAC))|(?=(?P<AhyRBAHI_as>GTC[AG][AG]GC))", None, 4096.0, None, None, 89839, 65, 37, None, None, None, None, None, "GCYYGAC", 7, "DNA", (), "https://identifiers.org/rebase:89839"),
+    ("AhyYL17I", (None, None, None, None, "YAAMGAG"), "(?=(?P<AhyYL17I>[CT]AA[AC]GAG))|(?=(?P<AhyYL17I_as>CTC[GT]TT[AG]))", None, 4096.0, None, None, 82738, 65, 37, None, None, None, None, None, "YAAMGAG", 7, "DNA", (), "https://identifiers.org/rebase:82738"),
+    ("AjiI", (3, -3, None, None, "CACGTC"), "(?=(?P<AjiI>CACGTC))|(?=(?P<AjiI_as>GACGTG))", None, 4096.0, -3, 3, 10919, 65, 37, 0, "", None, None, None, "CACGTC", 6, "DNA", ("B",), "https://identifiers.org/rebase:10919"),
+    ("AjnI", (0, 0, None, None, "CCWGG"), "(?=(?P<AjnI>CC[AT]GG))", None, 512.0, 0, 0, 7185, 65, 37, -5, "CCWGG", None, None, None, "CCWGG", 5, "DNA", ("I",), "https://identifiers.org/rebase:7185"),
+    ("AjuI", (-7, -26, 25, 6, "GAANNNNNNNTTGG"), "(?=(?P<AjuI>GAA.......TTGG))|(?=(?P<AjuI_as>CCAA.......TTC))", None, 16384.0, -26, -7, 7740, 65, 37, 5, "NNNNN", None, 6, 25, "GAANNNNNNNTTGG", 14, "DNA", ("B",), "https://identifiers.org/rebase:7740"),
+    ("AleI", (5, -5, None, None, "CACNNNNGTG"), "(?=(?P<AleI>CAC....GTG))", None, 4096.0, -5, 5, 5791, 65, 37, 0, "", None, None, None, "CACNNNNGTG", 10, "DNA", ("N",), "https://identifiers.org/rebase:5791"),
+    ("AlfI", (-10, -24, 24, 10, "GCANNNNNNTGC"), "(?=(?P<AlfI>GCA......TGC))", None, 4096.0, -24, -10, 6110, 65, 37, 2, "NN", None, 10, 24, "GCANNNNNNTGC", 12, "DNA", (), "https://identifiers.org/rebase:6110"),
+    ("AloI", (-7, -25, 25, 7, "GAACNNNNNNTCC"), "(?=(?P<AloI>GAAC......TCC))|(?=(?P<AloI_as>GGA......GTTC))", None, 16384.0, -25, -7, 2812, 65, 37, 5, "NNNNN", None, 7, 25, "GAACNNNNNNTCC", 13, "DNA", ("B",), "https://identifiers.org/rebase:2812"),
+    ("AluBI", (2, -2, None, None, "AGCT"), "(?=(?P<AluBI>AGCT))", None, 256.0, -2, 2, 16189, 65, 37, 0, "", None, None, None, "AGCT", 4, "DNA", ("I",), "https://identifiers.org/rebase:16189"),
+    ("AluI", (2, -2, None, None, "AGCT"), "(?=(?P<AluI>AGCT))", None, 256.0, -2, 2, 61, 65, 37, 0, "", None, None, None, "AGCT", 4, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"), "https://identifiers.org/rebase:61"),
+    ("Alw21I", (5, -5, None, None, "GWGCWC"), "(?=(?P<Alw21I>G[AT]GC[AT]C))", None, 1024.0, -5, 5, 62, 65, 37, 4, "WGCW", None, None, None, "GWGCWC", 6, "DNA", ("B",), "https://identifiers.org/rebase:62"),
+    ("Alw26I", (6, 5, None, None, "GTCTC"), "(?=(?P<Alw26I>GTCTC))|(?=(?P<Alw26I_as>GAGAC))", None, 1024.0, 5, 6, 63, 65, 37, -4, "NNNN", None, None, None, "GTCTC", 5, "DNA", ("B",), "https://identifiers.org/rebase:63"),
+    ("Alw44I", (1, -1, None, None, "GTGCAC"), "(?=(?P<Alw44I>GTGCAC))", None, 4096.0, -1, 1, 64, 65, 37, -4, "TGCA", None, None, None, "GTGCAC", 6, "DNA", ("B", "J"), "https://identifiers.org/rebase:64"),
+    ("AlwFI", (None, None, None, None, "GAAAYNNNNNRTG"), "(?=(?P<AlwFI>GAAA[CT].....[AG]TG))|(?=(?P<AlwFI_as>CA[CT].....[AG]TTTC))", None, 16384.0, None, None, 7655, 65, 37, None, None, None, None, None, "GAAAYNNNNNRTG", 13, "DNA", (), "https://identifiers.org/rebase:7655"),
+    ("AlwI", (9, 5, None, None, "GGATC"), "(?=(?P<AlwI>GGATC))|(?=(?P<AlwI_as>GATCC))", None, 1024.0, 5, 9, 65, 65, 37, -1, "N", None, None, None, "GGATC", 5, "DNA", ("N",), "https://identifiers.org/rebase:65"),
+    ("AlwNI", (6, -6, None, None, "CAGNNNCTG"), "(?=(?P<AlwNI>CAG...CTG))", None, 4096.0, -6, 6, 66, 65, 37, 3, "NNN", None, None, None, "CAGNNNCTG", 9, "DNA", ("N",), "https://identifiers.org/rebase:66"),
+    ("Ama87I", (1, -1, None, None, "CYCGRG"), "(?=(?P<Ama87I>C[CT]CG[AG]G))", None, 1024.0, -1, 1, 68, 65, 37, -4, "YCGR", None, None, None, "CYCGRG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:68"),
+    ("AmaCSI", (17, 9, None, None, "GCTCCA"), "(?=(?P<AmaCSI>GCTCCA))|(?=(?P<AmaCSI_as>TGGAGC))", None, 4096.0, 9, 17, 26714, 65, 37, 2, "NN", None, None, None, "GCTCCA", 6, "DNA", (), "https://identifiers.org/rebase:26714"),
+    ("Aod1I", (None, None, None, None, "GATCNAC"), "(?=(?P<Aod1I>GATC.AC))|(?=(?P<Aod1I_as>GT.GATC))", None, 4096.0, None, None, 270415, 65, 37, None, None, None, None, None, "GATCNAC", 7, "DNA", (), "https://identifiers.org/rebase:270415"),
+    ("Aor13HI", (1, -1, None, None, "TCCGGA"), "(?=(?P<Aor13HI>TCCGGA))", None, 4096.0, -1, 1, 2453, 65, 37, -4, "CCGG", None, None, None, "TCCGGA", 6, "DNA", ("K",), "https://identifiers.org/rebase:2453"),
+    ("Aor51HI", (3, -3, None, None, "AGCGCT"), "(?=(?P<Aor51HI>AGCGCT))", None, 4096.0, -3, 3, 76, 65, 37, 0, "", None, None, None, "AGCGCT", 6, "DNA", ("K",), "https://identifiers.org/rebase:76"),
+    ("AoxI", (0, 0, None, None, "GGCC"), "(?=(?P<AoxI>GGCC))", None, 256.0, 0, 0, 29052, 65, 37, -4, "GGCC", None, None, None, "GGCC", 4, "DNA", ("I",), "https://identifiers.org/rebase:29052"),
+    ("ApaBI", (8, -8, None, None, "GCANNNNNTGC"), "(?=(?P<ApaBI>GCA.....TGC))", None, 4096.0, -8, 8, 81, 65, 37, 5, "NNNNN", None, None, None, "GCANNNNNTGC", 11, "DNA", (), "https://identifiers.org/rebase:81"),
+    ("ApaI", (5, -5, None, None, "GGGCCC"), "(?=(?P<ApaI>GGGCCC))", None, 4096.0, -5, 5, 84, 65, 37, 4, "GGCC", None, None, None, "GGGCCC", 6, "DNA", ("B", "I", "J", "K", "M", "N", "Q", "R", "V", "X"), "https://identifiers.org/rebase:84"),
+    ("ApaLI", (1, -1, None, None, "GTGCAC"), "(?=(?P<ApaLI>GTGCAC))", None, 4096.0, -1, 1, 85, 65, 37, -4, "TGCA", None, None, None, "GTGCAC", 6, "DNA", ("C", "K", "N"), "https://identifiers.org/rebase:85"),
+    ("ApeKI", (1, -1, None, None, "GCWGC"), "(?=(?P<ApeKI>GC[AT]GC))", None, 512.0, -1, 1, 6397, 65, 37, -3, "CWG", None, None, None, "GCWGC", 5, "DNA", ("N",), "https://identifiers.org/rebase:6397"),
+    ("ApoI", (1, -1, None, None, "RAATTY"), "(?=(?P<ApoI>[AG]AATT[CT]))", None, 1024.0, -1, 1, 89, 65, 37, -4, "AATT", None, None, None, "RAATTY", 6, "DNA", ("N",), "https://identifiers.org/rebase:89"),
+    ("ApyPI", (26, 18, None, None, "ATCGAC"), "(?=(?P<ApyPI>ATCGAC))|(?=(?P<ApyPI_as>GTCGAT))", None, 4096.0, 18, 26, 14756, 65, 37, 2, "NN", None, None, None, "ATCGAC", 6, "DNA", (), "https://identifiers.org/rebase:14756"),
+    ("AquII", (27, 18, None, None, "GCCGNAC"), "(?=(?P<AquII>GCCG.AC))|(?=(?P<AquII_as>GT.CGGC))", None, 4096.0, 18, 27, 20238, 65, 37, 2, "NN", None, None, None, "GCCGNAC", 7, "DNA", (), "https://identifiers.org/rebase:20238"),
+    ("AquIII", (26, 18, None, None, "GAGGAG"), "(?=(?P<AquIII>GAGGAG))|(?=(?P<AquIII_as>CTCCTC))", None, 4096.0, 18, 26, 20239, 65, 37, 2, "NN", None, None, None, "GAGGAG", 6, "DNA", (), "https://identifiers.org/rebase:20239"),
+    ("AquIV", (26, 17, None, None, "GRGGAAG"), "(?=(?P<AquIV>G[AG]GGAAG))|(?=(?P<AquIV_as>CTTCC[CT]C))", None, 8192.0, 17, 26, 20240, 65, 37, 2, "NN", None, None, None, "GRGGAAG", 7, "DNA", (), "https://identifiers.org/rebase:20240"),
+    ("ArsI", (-8, -26, 24, 6, "GACNNNNNNTTYG"), "(?=(?P<ArsI>GAC......TT[CT]G))|(?=(?P<ArsI_as>C[AG]AA......GTC))", None, 8192.0, -26, -8, 19405, 65, 37, 5, "NNNNN", None, 6, 24, "GACNNNNNNTTYG", 13, "DNA", ("I",), "https://identifiers.org/rebase:19405"),
+    ("AscI", (2, -2, None, None, "GGCGCGCC"), "(?=(?P<AscI>GGCGCGCC))", None, 65536.0, -2, 2, 95, 65, 37, -4, "CGCG", None, None, None, "GGCGCGCC", 8, "DNA", ("N",), "https://identifiers.org/rebase:95"),
+    ("AseI", (2, -2, None, None, "ATTAAT"), "(?=(?P<AseI>ATTAAT))", None, 4096.0, -2, 2, 96, 65, 37, -2, "TA", None, None, None, "ATTAAT", 6, "DNA", ("J", "N"), "https://identifiers.org/rebase:96"),
+    ("Asi256I", (1, -1, None, None, "GATC"), "(?=(?P<Asi256I>GATC))", None, 256.0, -1, 1, 18472, 65, 37, -2, "AT", None, None, None, "GATC", 4, "DNA", (), "https://identifiers.org/rebase:18472"),
+    ("AsiGI", (1, -1, None, None, "ACCGGT"), "(?=(?P<AsiGI>ACCGGT))", None, 4096.0, -1, 1, 10828, 65, 37, -4, "CCGG", None, None, None, "ACCGGT", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:10828"),
+    ("AsiSI", (5, -5, None, None, "GCGATCGC"), "(?=(?P<AsiSI>GCGATCGC))", None, 65536.0, -5, 5, 4628, 65, 37, 2, "AT", None, None, None, "GCGATCGC", 8, "DNA", ("I", "N"), "https://identifiers.org/rebase:4628"),
+    ("Asl11923II", (None, None, None, None, "GGGABCC"), "(?=(?P<Asl11923II>GGGA[CGT]CC))|(?=(?P<Asl11923II_as>GG[ACG]TCCC))", None, 5461.333333333333, None, None, 288754, 65, 37, None, None, None, None, None, "GGGABCC", 7, "DNA", (), "https://identifiers.org/rebase:288754"),
+    ("Asp103I", (None, None, None, None, "CGRAGGC"), "(?=(?P<Asp103I>CG[AG]AGGC))|(?=(?P<Asp103I_as>GCCT[CT]CG))", None, 8192.0, None, None, 226699, 65, 37, None, None, None, None, None, "CGRAGGC", 7, "DNA", (), "https://identifiers.org/rebase:226699"),
+    ("Asp114pII", (None, None, None, None, "AGCABCC"), "(?=(?P<Asp114pII>AGCA[CGT]CC))|(?=(?P<Asp114pII_as>GG[ACG]TGCT))", None, 5461.333333333333, None, None, 183955, 65, 37, None, None, None, None, None, "AGCABCC", 7, "DNA", (), "https://identifiers.org/rebase:183955"),
+    ("Asp337I", (None, None, None, None, "CARABGG"), "(?=(?P<Asp337I>CA[AG]A[CGT]GG))|(?=(?P<Asp337I_as>CC[ACG]T[CT]TG))", None, 2730.6666666666665, None, None, 313892, 65, 37, None, None, None, None, None, "CARABGG", 7, "DNA", (), "https://identifiers.org/rebase:313892"),
+    ("Asp700I", (5, -5, None, None, "GAANNNNTTC"), "(?=(?P<Asp700I>GAA....TTC))", None, 4096.0, -5, 5, 127, 65, 37, 0, "", None, None, None, "GAANNNNTTC", 10, "DNA", ("M",), "https://identifiers.org/rebase:127"),
+    ("Asp718I", (1, -1, None, None, "GGTACC"), "(?=(?P<Asp718I>GGTACC))", None, 4096.0, -1, 1, 132, 65, 37, -4, "GTAC", None, None, None, "GGTACC", 6, "DNA", ("M", "S"), "https://identifiers.org/rebase:132"),
+    ("AspA2I", (1, -1, None, None, "CCTAGG"), "(?=(?P<AspA2I>CCTAGG))", None, 4096.0, -1, 1, 6959, 65, 37, -4, "CTAG", None, None, None, "CCTAGG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:6959"),
+    ("AspAMDIV", (None, None, None, None, "ACCCAC"), "(?=(?P<AspAMDIV>ACCCAC))|(?=(?P<AspAMDIV_as>GTGGGT))", None, 4096.0, None, None, 333117, 65, 37, None, None, None, None, None, "ACCCAC", 6, "DNA", (), "https://identifiers.org/rebase:333117"),
+    ("AspBHI", (13, 12, None, None, "YSCNS"), "(?=(?P<AspBHI>[CT][CG]C.[CG]))|(?=(?P<AspBHI_as>[CG].G[CG][AG]))", None, 32.0, 12, 13, 21321, 65, 37, -4, "NNNN", None, None, None, "YSCNS", 5, "DNA", (), "https://identifiers.org/rebase:21321"),
+    ("AspDUT2V", (None, None, None, None, "GNGCAAC"), "(?=(?P<AspDUT2V>G.GCAAC))|(?=(?P<AspDUT2V_as>GTTGC.C))", None, 4096.0, None, None, 142406, 65, 37, None, None, None, None, None, "GNGCAAC", 7, "DNA", (), "https://identifiers.org/rebase:142406"),
+    ("AspJHL3II", (None, None, None, None, "CGCCCAG"), "(?=(?P<AspJHL3II>CGCCCAG))|(?=(?P<AspJHL3II_as>CTGGGCG))", None, 16384.0, None, None, 67384, 65, 37, None, None, None, None, None, "CGCCCAG", 7, "DNA", (), "https://identifiers.org/rebase:67384"),
+    ("AspLEI", (3, -3, None, None, "GCGC"), "(?=(?P<AspLEI>GCGC))", None, 256.0, -3, 3, 2670, 65, 37, 2, "CG", None, None, None, "GCGC", 4, "DNA", ("I", "V"), "https://identifiers.org/rebase:2670"),
+    ("AspNIH4III", (None, None, None, None, "AAGAACB"), "(?=(?P<AspNIH4III>AAGAAC[CGT]))|(?=(?P<AspNIH4III_as>[ACG]GTTCTT))", None, 5461.333333333333, None, None, 231703, 65, 37, None, None, None, None, None, "AAGAACB", 7, "DNA", (), "https://identifiers.org/rebase:231703"),
+    ("AspS9I", (1, -1, None, None, "GGNCC"), "(?=(?P<AspS9I>GG.CC))", None, 256.0, -1, 1, 2737, 65, 37, -3, "GNC", None, None, None, "GGNCC", 5, "DNA", ("I", "V"), "https://identifiers.org/rebase:2737"),
+    ("AspSLV7III", (None, None, None, None, "GTCTCA"), "(?=(?P<AspSLV7III>GTCTCA))|(?=(?P<AspSLV7III_as>TGAGAC))", None, 4096.0, None, None, 144656, 65, 37, None, None, None, None, None, "GTCTCA", 6, "DNA", (), "https://identifiers.org/rebase:144656"),
+    ("Asu14238IV", (None, None, None, None, "CGTRAC"), "(?=(?P<Asu14238IV>CGT[AG]AC))|(?=(?P<Asu14238IV_as>GT[CT]ACG))", None, 2048.0, None, None, 48969, 65, 37, None, None, None, None, None, "CGTRAC", 6, "DNA", (), "https://identifiers.org/rebase:48969"),
+    ("AsuC2I", (2, -2, None, None, "CCSGG"), "(?=(?P<AsuC2I>CC[CG]GG))", None, 512.0, -2, 2, 2901, 65, 37, -1, "S", None, None, None, "CCSGG", 5, "DNA", ("I",), "https://identifiers.org/rebase:2901"),
+    ("AsuHPI", (13, 7, None, None, "GGTGA"), "(?=(?P<AsuHPI>GGTGA))|(?=(?P<AsuHPI_as>TCACC))", None, 1024.0, 7, 13, 2811, 65, 37, 1, "N", None, None, None, "GGTGA", 5, "DNA", ("I", "V"), "https://identifiers.org/rebase:2811"),
+    ("AsuI", (1, -1, None, None, "GGNCC"), "(?=(?P<AsuI>GG.CC))", None, 256.0, -1, 1, 153, 65, 37, -3, "GNC", None, None, None, "GGNCC", 5, "DNA", (), "https://identifiers.org/rebase:153"),
+    ("AsuII", (2, -2, None, None, "TTCGAA"), "(?=(?P<AsuII>TTCGAA))", None, 4096.0, -2, 2, 154, 65, 37, -2, "CG", None, None, None, "TTCGAA", 6, "DNA", ("C",), "https://identifiers.org/rebase:154"),
+    ("AsuNHI", (1, -1, None, None, "GCTAGC"), "(?=(?P<AsuNHI>GCTAGC))", None, 4096.0, -1, 1, 2854, 65, 37, -4, "CTAG", None, None, None, "GCTAGC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2854"),
+    ("AteTI", (None, None, None, None, "GGGRAG"), "(?=(?P<AteTI>GGG[AG]AG))|(?=(?P<AteTI_as>CT[CT]CCC))", None, 2048.0, None, None, 21623, 65, 37, None, None, None, None, None, "GGGRAG", 6, "DNA", (), "https://identifiers.org/rebase:21623"),
+    ("AvaI", (1, -1, None, None, "CYCGRG"), "(?=(?P<AvaI>C[CT]CG[AG]G))", None, 1024.0, -1, 1, 165, 65, 37, -4, "YCGR", None, None, None, "CYCGRG", 6, "DNA", ("J", "N", "Q", "X"), "https://identifiers.org/rebase:165"),
+    ("AvaII", (1, -1, None, None, "GGWCC"), "(?=(?P<AvaII>GG[AT]CC))", None, 512.0, -1, 1, 166, 65, 37, -3, "GWC", None, None, None, "GGWCC", 5, "DNA", ("J", "N", "X"), "https://identifiers.org/rebase:166"),
+    ("AvaIII", (None, None, None, None, "ATGCAT"), "(?=(?P<AvaIII>ATGCAT))", None, 4096.0, None, None, 167, 65, 37, None, None, None, None, None, "ATGCAT", 6, "DNA", (), "https://identifiers.org/rebase:167"),
+    ("Avi249I", (None, None, None, None, "CTGCA"), "(?=(?P<Avi249I>CTGCA))|(?=(?P<Avi249I_as>TGCAG))", None, 1024.0, None, None, 625880, 65, 37, None, None, None, None, None, "CTGCA", 5, "DNA", (), "https://identifiers.org/rebase:625880"),
+    ("AvrII", (1, -1, None, None, "CCTAGG"), "(?=(?P<AvrII>CCTAGG))", None, 4096.0, -1, 1, 173, 65, 37, -4, "CTAG", None, None, None, "CCTAGG", 6, "DNA", ("N",), "https://identifiers.org/rebase:173"),
+    ("Awo1030IV", (None, None, None, None, "GCCRAG"), "(?=(?P<Awo1030IV>GCC[AG]AG))|(?=(?P<Awo1030IV_as>CT[CT]GGC))", None, 2048.0, None, None, 45794, 65, 37, None, None, None, None, None, "GCCRAG", 6, "DNA", (), "https://identifiers.org/rebase:45794"),
+    ("AxyI", (2, -2, None, None, "CCTNAGG"), "(?=(?P<AxyI>CCT.AGG))", None, 4096.0, -2, 2, 174, 65, 37, -3, "TNA", None, None, None, "CCTNAGG", 7, "DNA", ("J",), "https://identifiers.org/rebase:174"),
+    ("BaeGI", (5, -5, None, None, "GKGCMC"), "(?=(?P<BaeGI>G[GT]GC[AC]C))", None, 1024.0, -5, 5, 16983, 65, 37, 4, "KGCM", None, None, None, "GKGCMC", 6, "DNA", ("N",), "https://identifiers.org/rebase:16983"),
+    ("BaeI", (-10, -26, 23, 7, "ACNNNNGTAYC"), "(?=(?P<BaeI>AC....GTA[CT]C))|(?=(?P<BaeI_as>G[AG]TAC....GT))", None, 8192.0, -26, -10, 179, 65, 37, 5, "NNNNN", None, 7, 23, "ACNNNNGTAYC", 11, "DNA", ("N",), "https://identifiers.org/rebase:179"),
+    ("Bag18758I", (None, None, None, None, "CCCGAG"), "(?=(?P<Bag18758I>CCCGAG))|(?=(?P<Bag18758I_as>CTCGGG))", None, 4096.0, None, None, 77520, 65, 37, None, None, None, None, None, "CCCGAG", 6, "DNA", (), "https://identifiers.org/rebase:77520"),
+    ("BalI", (3, -3, None, None, "TGGCCA"), "(?=(?P<BalI>TGGCCA))", None, 4096.0, -3, 3, 183, 65, 37, 0, "", None, None, None, "TGGCCA", 6, "DNA", ("B", "J", "K", "Q", "X"), "https://identifiers.org/rebase:183"),
+    ("BamHI", (1, -1, None, None, "GGATCC"), "(?=(?P<BamHI>GGATCC))", None, 4096.0, -1, 1, 185, 65, 37, -4, "GATC", None, None, None, "GGATCC", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"), "https://identifiers.org/rebase:185"),
+    ("BanI", (1, -1, None, None, "GGYRCC"), "(?=(?P<BanI>GG[CT][AG]CC))", None, 1024.0, -1, 1, 190, 65, 37, -4, "GYRC", None, None, None, "GGYRCC", 6, "DNA", ("N",), "https://identifiers.org/rebase:190"),
+    ("BanII", (5, -5, None, None, "GRGCYC"), "(?=(?P<BanII>G[AG]GC[CT]C))", None, 1024.0, -5, 5, 191, 65, 37, 4, "RGCY", None, None, None, "GRGCYC", 6, "DNA", ("K", "N", "X"), "https://identifiers.org/rebase:191"),
+    ("BanLI", (None, None, None, None, "RTCAGG"), "(?=(?P<BanLI>[AG]TCAGG))|(?=(?P<BanLI_as>CCTGA[CT]))", None, 2048.0, None, None, 73422, 65, 37, None, None, None, None, None, "RTCAGG", 6, "DNA", (), "https://identifiers.org/rebase:73422"),
+    ("BarI", (-7, -25, 25, 7, "GAAGNNNNNNTAC"), "(?=(?P<BarI>GAAG......TAC))|(?=(?P<BarI_as>GTA......CTTC))", None, 16384.0, -25, -7, 16190, 65, 37, 5, "NNNNN", None, 7, 25, "GAAGNNNNNNTAC", 13, "DNA", ("I",), "https://identifiers.org/rebase:16190"),
+    ("Bau1417V", (None, None, None, None, "GTTCAG"), "(?=(?P<Bau1417V>GTTCAG))|(?=(?P<Bau1417V_as>CTGAAC))", None, 4096.0, None, None, 292899, 65, 37, None, None, None, None, None, "GTTCAG", 6, "DNA", (), "https://identifiers.org/rebase:292899"),
+    ("BauI", (1, -1, None, None, "CACGAG"), "(?=(?P<BauI>CACGAG))|(?=(?P<BauI_as>CTCGTG))", None, 4096.0, -1, 1, 7455, 65, 37, -4, "ACGA", None, None, None, "CACGAG", 6, "DNA", ("B",), "https://identifiers.org/rebase:7455"),
+    ("Bbr52II", (None, None, None, None, "GGCGAG"), "(?=(?P<Bbr52II>GGCGAG))|(?=(?P<Bbr52II_as>CTCGCC))", None, 4096.0, None, None, 163590, 65, 37, None, None, None, None, None, "GGCGAG", 6, "DNA", (), "https://identifiers.org/rebase:163590"),
+    ("Bbr57III", (None, None, None, None, "GTRAAYG"), "(?=(?P<Bbr57III>GT[AG]AA[CT]G))|(?=(?P<Bbr57III_as>C[AG]TT[CT]AC))", None, 4096.0, None, None, 184356, 65, 37, None, None, None, None, None, "GTRAAYG", 7, "DNA", (), "https://identifiers.org/rebase:184356"),
+    ("Bbr7017II", (None, None, None, None, "CGGGAG"), "(?=(?P<Bbr7017II>CGGGAG))|(?=(?P<Bbr7017II_as>CTCCCG))", None, 4096.0, None, None, 63078, 65, 37, None, None, None, None, None, "CGGGAG", 6, "DNA", (), "https://identifiers.org/rebase:63078"),
+    ("Bbr7017III", (None, None, None, None, "GGRCAG"), "(?=(?P<Bbr7017III>GG[AG]CAG))|(?=(?P<Bbr7017III_as>CTG[CT]CC))", None, 2048.0, None, None, 62650, 65, 37, None, None, None, None, None, "GGRCAG", 6, "DNA", (), "https://identifiers.org/rebase:62650"),
+    ("BbrPI", (3, -3, None, None, "CACGTG"), "(?=(?P<BbrPI>CACGTG))", None, 4096.0, -3, 3, 211, 65, 37, 0, "", None, None, None, "CACGTG", 6, "DNA", ("M",), "https://identifiers.org/rebase:211"),
+    ("BbsI", (8, 6, None, None, "GAAGAC"), "(?=(?P<BbsI>GAAGAC))|(?=(?P<BbsI_as>GTCTTC))", None, 4096.0, 6, 8, 212, 65, 37, -4, "NNNN", None, None, None, "GAAGAC", 6, "DNA", ("N",), "https://identifiers.org/rebase:212"),
+    ("BbuB31I", (None, None, None, None, "GNAAYG"), "(?=(?P<BbuB31I>G.AA[CT]G))|(?=(?P<BbuB31I_as>C[AG]TT.C))", None, 512.0, None, None, 4697, 65, 37, None, None, None, None, None, "GNAAYG", 6, "DNA", (), "https://identifiers.org/rebase:4697"),
+    ("BbuB31II", (None, None, None, None, "CGRKA"), "(?=(?P<BbuB31II>CG[AG][GT]A))|(?=(?P<BbuB31II_as>T[AC][CT]CG))", None, 256.0, None, None, 4248, 65, 37, None, None, None, None, None, "CGRKA", 5, "DNA", (), "https://identifiers.org/rebase:4248"),
+    ("Bbv12I", (5, -5, None, None, "GWGCWC"), "(?=(?P<Bbv12I>G[AT]GC[AT]C))", None, 1024.0, -5, 5, 214, 65, 37, 4, "WGCW", None, None, None, "GWGCWC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:214"),
+    ("BbvCI", (2, -2, None, None, "CCTCAGC"), "(?=(?P<BbvCI>CCTCAGC))|(?=(?P<BbvCI_as>GCTGAGG))", None, 16384.0, -2, 2, 3098, 65, 37, -3, "TCA", None, None, None, "CCTCAGC", 7, "DNA", ("N",), "https://identifiers.org/rebase:3098"),
+    ("BbvI", (13, 12, None, None, "GCAGC"), "(?=(?P<BbvI>GCAGC))|(?=(?P<BbvI_as>GCTGC))", None, 1024.0, 12, 13, 220, 65, 37, -4, "NNNN", None, None, None, "GCAGC", 5, "DNA", ("N",), "https://identifiers.org/rebase:220"),
+    ("BbvII", (8, 6, None, None, "GAAGAC"), "(?=(?P<BbvII>GAAGAC))|(?=(?P<BbvII_as>GTCTTC))", None, 4096.0, 6, 8, 221, 65, 37, -4, "NNNN", None, None, None, "GAAGAC", 6, "DNA", (), "https://identifiers.org/rebase:221"),
+    ("BccI", (9, 5, None, None, "CCATC"), "(?=(?P<BccI>CCATC))|(?=(?P<BccI_as>GATGG))", None, 1024.0, 5, 9, 226, 65, 37, -1, "N", None, None, None, "CCATC", 5, "DNA", ("N",), "https://identifiers.org/rebase:226"),
+    ("Bce10661III", (None, None, None, None, "TATCNAG"), "(?=(?P<Bce10661III>TATC.AG))|(?=(?P<Bce10661III_as>CT.GATA))", None, 4096.0, None, None, 420286, 65, 37, None, None, None, None, None, "TATCNAG", 7, "DNA", (), "https://identifiers.org/rebase:420286"),
+    ("Bce3081I", (None, None, None, None, "TAGGAG"), "(?=(?P<Bce3081I>TAGGAG))|(?=(?P<Bce3081I_as>CTCCTA))", None, 4096.0, None, None, 34295, 65, 37, None, None, None, None, None, "TAGGAG", 6, "DNA", (), "https://identifiers.org/rebase:34295"),
+    ("Bce83I", (22, 14, None, None, "CTTGAG"), "(?=(?P<Bce83I>CTTGAG))|(?=(?P<Bce83I_as>CTCAAG))", None, 4096.0, 14, 22, 2162, 65, 37, 2, "NN", None, None, None, "CTTGAG", 6, "DNA", (), "https://identifiers.org/rebase:2162"),
+    ("BceAI", (17, 14, None, None, "ACGGC"), "(?=(?P<BceAI>ACGGC))|(?=(?P<BceAI_as>GCCGT))", None, 1024.0, 14, 17, 4686, 65, 37, -2, "NN", None, None, None, "ACGGC", 5, "DNA", ("N",), "https://identifiers.org/rebase:4686"),
+    ("BceSIV", (-7, -10, 14, 11, "GCAGC"), "(?=(?P<BceSIV>GCAGC))|(?=(?P<BceSIV_as>GCTGC))", None, 1024.0, -10, -7, 24953, 65, 37, -2, "NN", None, 11, 14, "GCAGC", 5, "DNA", (), "https://identifiers.org/rebase:24953"),
+    ("BcefI", (17, 13, None, None, "ACGGC"), "(?=(?P<BcefI>ACGGC))|(?=(?P<BcefI_as>GCCGT))", None, 1024.0, 13, 17, 237, 65, 37, -1, "N", None, None, None, "ACGGC", 5, "DNA", (), "https://identifiers.org/rebase:237"),
+    ("BcgI", (-10, -24, 24, 10, "CGANNNNNNTGC"), "(?=(?P<BcgI>CGA......TGC))|(?=(?P<BcgI_as>GCA......TCG))", None, 4096.0, -24, -10, 238, 65, 37, 2, "NN", None, 10, 24, "CGANNNNNNTGC", 12, "DNA", ("N",), "https://identifiers.org/rebase:238"),
+    ("BciT130I", (2, -2, None, None, "CCWGG"), "(?=(?P<BciT130I>CC[AT]GG))", None, 512.0, -2, 2, 37575, 65, 37, -1, "W", None, None, None, "CCWGG", 5, "DNA", ("K",), "https://identifiers.org/rebase:37575"),
+    ("BciVI", (12, 5, None, None, "GTATCC"), "(?=(?P<BciVI>GTATCC))|(?=(?P<BciVI_as>GGATAC))", None, 4096.0, 5, 12, 2885, 65, 37, 1, "N", None, None, None, "GTATCC", 6, "DNA", ("N",), "https://identifiers.org/rebase:2885"),
+    ("BclI", (1, -1, None, None, "TGATCA"), "(?=(?P<BclI>TGATCA))", None, 4096.0, -1, 1, 242, 65, 37, -4, "GATC", None, None, None, "TGATCA", 6, "DNA", ("B", "C", "J", "M", "N", "O", "R", "S"), "https://identifiers.org/rebase:242"),
+    ("BcnI", (2, -2, None, None, "CCSGG"), "(?=(?P<BcnI>CC[CG]GG))", None, 512.0, -2, 2, 244, 65, 37, -1, "S", None, None, None, "CCSGG", 5, "DNA", ("B", "K"), "https://identifiers.org/rebase:244"),
+    ("Bco11035III", (None, None, None, None, "GAAGCY"), "(?=(?P<Bco11035III>GAAGC[CT]))|(?=(?P<Bco11035III_as>[AG]GCTTC))", None, 2048.0, None, None, 380172, 65, 37, None, None, None, None, None, "GAAGCY", 6, "DNA", (), "https://identifiers.org/rebase:380172"),
+    ("BcoDI", (6, 5, None, None, "GTCTC"), "(?=(?P<BcoDI>GTCTC))|(?=(?P<BcoDI_as>GAGAC))", None, 1024.0, 5, 6, 20174, 65, 37, -4, "NNNN", None, None, None, "GTCTC", 5, "DNA", ("N",), "https://identifiers.org/rebase:20174"),
+    ("BcuI", (1, -1, None, None, "ACTAGT"), "(?=(?P<BcuI>ACTAGT))", None, 4096.0, -1, 1, 2990, 65, 37, -4, "CTAG", None, None, None, "ACTAGT", 6, "DNA", ("B",), "https://identifiers.org/rebase:2990"),
+    ("BdaI", (-10, -24, 24, 10, "TGANNNNNNTCA"), "(?=(?P<BdaI>TGA......TCA))", None, 4096.0, -24, -10, 7508, 65, 37, 2, "NN", None, 10, 24, "TGANNNNNNTCA", 12, "DNA", (), "https://identifiers.org/rebase:7508"),
+    ("BetI", (1, -1, None, None, "WCCGGW"), "(?=(?P<BetI>[AT]CCGG[AT]))", None, 1024.0, -1, 1, 255, 65, 37, -4, "CCGG", None, None, None, "WCCGGW", 6, "DNA", (), "https://identifiers.org/rebase:255"),
+    ("BfaI", (1, -1, None, None, "CTAG"), "(?=(?P<BfaI>CTAG))", None, 256.0, -1, 1, 256, 65, 37, -2, "TA", None, None, None, "CTAG", 4, "DNA", ("N",), "https://identifiers.org/rebase:256"),
+    ("BfaSII", (None, None, None, None, "GANGGAG"), "(?=(?P<BfaSII>GA.GGAG))|(?=(?P<BfaSII_as>CTCC.TC))", None, 4096.0, None, None, 11042, 65, 37, None, None, None, None, None, "GANGGAG", 7, "DNA", (), "https://identifiers.org/rebase:11042"),
+    ("BfiI", (11, 4, None, None, "ACTGGG"), "(?=(?P<BfiI>ACTGGG))|(?=(?P<BfiI_as>CCCAGT))", None, 4096.0, 4, 11, 2697, 65, 37, 1, "N", None, None, None, "ACTGGG", 6, "DNA", (), "https://identifiers.org/rebase:2697"),
+    ("BfmI", (1, -1, None, None, "CTRYAG"), "(?=(?P<BfmI>CT[AG][CT]AG))", None, 1024.0, -1, 1, 2747, 65, 37, -4, "TRYA", None, None, None, "CTRYAG", 6, "DNA", ("B",), "https://identifiers.org/rebase:2747"),
+    ("BfoI", (5, -5, None, None, "RGCGCY"), "(?=(?P<BfoI>[AG]GCGC[CT]))", None, 1024.0, -5, 5, 17995, 65, 37, 4, "GCGC", None, None, None, "RGCGCY", 6, "DNA", ("B",), "https://identifiers.org/rebase:17995"),
+    ("BfrI", (1, -1, None, None, "CTTAAG"), "(?=(?P<BfrI>CTTAAG))", None, 4096.0, -1, 1, 259, 65, 37, -4, "TTAA", None, None, None, "CTTAAG", 6, "DNA", ("M", "S"), "https://identifiers.org/rebase:259"),
+    ("BfuAI", (10, 8, None, None, "ACCTGC"), "(?=(?P<BfuAI>ACCTGC))|(?=(?P<BfuAI_as>GCAGGT))", None, 4096.0, 8, 10, 4687, 65, 37, -4, "NNNN", None, None, None, "ACCTGC", 6, "DNA", ("N",), "https://identifiers.org/rebase:4687"),
+    ("BfuI", (12, 5, None, None, "GTATCC"), "(?=(?P<BfuI>GTATCC))|(?=(?P<BfuI_as>GGATAC))", None, 4096.0, 5, 12, 4107, 65, 37, 1, "N", None, None, None, "GTATCC", 6, "DNA", ("B",), "https://identifiers.org/rebase:4107"),
+    ("Bga514I", (None, None, None, None, "GTRAAG"), "(?=(?P<Bga514I>GT[AG]AAG))|(?=(?P<Bga514I_as>CTT[CT]AC))", None, 2048.0, None, None, 297545, 65, 37, None, None, None, None, None, "GTRAAG", 6, "DNA", (), "https://identifiers.org/rebase:297545"),
+    ("BglI", (7, -7, None, None, "GCCNNNNNGGC"), "(?=(?P<BglI>GCC.....GGC))", None, 4096.0, -7, 7, 260, 65, 37, 3, "NNN", None, None, None, "GCCNNNNNGGC", 11, "DNA", ("B", "C", "I", "J", "K", "N", "O", "Q", "R", "V", "X"), "https://identifiers.org/rebase:260"),
+    ("BglII", (1, -1, None, None, "AGATCT"), "(?=(?P<BglII>AGATCT))", None, 4096.0, -1, 1, 261, 65, 37, -4, "GATC", None, None, None, "AGATCT", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X"), "https://identifiers.org/rebase:261"),
+    ("Bhe175II", (None, None, None, None, "GCCCNA"), "(?=(?P<Bhe175II>GCCC.A))|(?=(?P<Bhe175II_as>T.GGGC))", None, 1024.0, None, None, 628980, 65, 37, None, None, None, None, None, "GCCCNA", 6, "DNA", (), "https://identifiers.org/rebase:628980"),
+    ("BinI", (9, 5, None, None, "GGATC"), "(?=(?P<BinI>GGATC))|(?=(?P<BinI_as>GATCC))", None, 1024.0, 5, 9, 265, 65, 37, -1, "N", None, None, None, "GGATC", 5, "DNA", (), "https://identifiers.org/rebase:265"),
+    ("BisI", (2, -2, None, None, "GCNGC"), "(?=(?P<BisI>GC.GC))", None, 256.0, -2, 2, 10871, 65, 37, -1, "N", None, None, None, "GCNGC", 5, "DNA", ("I",), "https://identifiers.org/rebase:10871"),
+    ("BkrAM31DI", (None, None, None, None, "RTTAAATM"), "(?=(?P<BkrAM31DI>[AG]TTAAAT[AC]))|(?=(?P<BkrAM31DI_as>[GT]ATTTAA[CT]))", None, 16384.0, None, None, 198858, 65, 37, None, None, None, None, None, "RTTAAATM", 8, "DNA", (), "https://identifiers.org/rebase:198858"),
+    ("Ble402II", (None, None, None, None, "GRAGCAG"), "(?=(?P<Ble402II>G[AG]AGCAG))|(?=(?P<Ble402II_as>CTGCT[CT]C))", None, 8192.0, None, None, 69395, 65, 37, None, None, None, None, None, "GRAGCAG", 7, "DNA", (), "https://identifiers.org/rebase:69395"),
+    ("BlnI", (1, -1, None, None, "CCTAGG"), "(?=(?P<BlnI>CCTAGG))", None, 4096.0, -1, 1, 275, 65, 37, -4, "CTAG", None, None, None, "CCTAGG", 6, "DNA", ("K", "M", "S"), "https://identifiers.org/rebase:275"),
+    ("BloAII", (None, None, None, None, "GAGGAC"), "(?=(?P<BloAII>GAGGAC))|(?=(?P<BloAII_as>GTCCTC))", None, 4096.0, None, None, 57734, 65, 37, None, None, None, None, None, "GAGGAC", 6, "DNA", (), "https://identifiers.org/rebase:57734"),
+    ("BlpI", (2, -2, None, None, "GCTNAGC"), "(?=(?P<BlpI>GCT.AGC))", None, 4096.0, -2, 2, 2535, 65, 37, -3, "TNA", None, None, None, "GCTNAGC", 7, "DNA", ("N",), "https://identifiers.org/rebase:2535"),
+    ("BlsI", (3, -3, None, None, "GCNGC"), "(?=(?P<BlsI>GC.GC))", None, 256.0, -3, 3, 15186, 65, 37, 1, "N", None, None, None, "GCNGC", 5, "DNA", ("I",), "https://identifiers.org/rebase:15186"),
+    ("BmcAI", (3, -3, None, None, "AGTACT"), "(?=(?P<BmcAI>AGTACT))", None, 4096.0, -3, 3, 10484, 65, 37, 0, "", None, None, None, "AGTACT", 6, "DNA", ("V",), "https://identifiers.org/rebase:10484"),
+    ("Bme1390I", (2, -2, None, None, "CCNGG"), "(?=(?P<Bme1390I>CC.GG))", None, 256.0, -2, 2, 2216, 65, 37, -1, "N", None, None, None, "CCNGG", 5, "DNA", ("B",), "https://identifiers.org/rebase:2216"),
+    ("Bme18I", (1, -1, None, None, "GGWCC"), "(?=(?P<Bme18I>GG[AT]CC))", None, 512.0, -1, 1, 286, 65, 37, -3, "GWC", None, None, None, "GGWCC", 5, "DNA", ("I", "V"), "https://identifiers.org/rebase:286"),
+    ("BmeDI", (3, 0, None, None, "C"), "(?=(?P<BmeDI>C))|(?=(?P<BmeDI_as>G))", None, 4.0, 0, 3, 25281, 65, 37, 2, "NN", None, None, None, "C", 1, "DNA", (), "https://identifiers.org/rebase:25281"),
+    ("BmeRI", (6, -6, None, None, "GACNNNNNGTC"), "(?=(?P<BmeRI>GAC.....GTC))", None, 4096.0, -6, 6, 10486, 65, 37, 1, "N", None, None, None, "GACNNNNNGTC", 11, "DNA", ("V",), "https://identifiers.org/rebase:10486"),
+    ("BmeT110I", (1, -1, None, None, "CYCGRG"), "(?=(?P<BmeT110I>C[CT]CG[AG]G))", None, 1024.0, -1, 1, 11105, 65, 37, -4, "YCGR", None, None, None, "CYCGRG", 6, "DNA", ("B", "K"), "https://identifiers.org/rebase:11105"),
+    ("BmgBI", (3, -3, None, None, "CACGTC"), "(?=(?P<BmgBI>CACGTC))|(?=(?P<BmgBI_as>GACGTG))", None, 4096.0, -3, 3, 5041, 65, 37, 0, "", None, None, None, "CACGTC", 6, "DNA", ("N",), "https://identifiers.org/rebase:5041"),
+    ("BmgI", (None, None, None, None, "GKGCCC"), "(?=(?P<BmgI>G[GT]GCCC))|(?=(?P<BmgI_as>GGGC[AC]C))", None, 2048.0, None, None, 2578, 65, 37, None, None, None, None, None, "GKGCCC", 6, "DNA", (), "https://identifiers.org/rebase:2578"),
+    ("BmgT120I", (1, -1, None, None, "GGNCC"), "(?=(?P<BmgT120I>GG.CC))", None, 256.0, -1, 1, 11106, 65, 37, -3, "GNC", None, None, None, "GGNCC", 5, "DNA", ("K",), "https://identifiers.org/rebase:11106"),
+    ("BmiI", (3, -3, None, None, "GGNNCC"), "(?=(?P<BmiI>GG..CC))", None, 256.0, -3, 3, 10481, 65, 37, 0, "", None, None, None, "GGNNCC", 6, "DNA", ("V",), "https://identifiers.org/rebase:10481"),
+    ("BmrFI", (2, -2, None, None, "CCNGG"), "(?=(?P<BmrFI>CC.GG))", None, 256.0, -2, 2, 10485, 65, 37, -1, "N", None, None, None, "CCNGG", 5, "DNA", ("V",), "https://identifiers.org/rebase:10485"),
+    ("BmrI", (11, 4, None, None, "ACTGGG"), "(?=(?P<BmrI>ACTGGG))|(?=(?P<BmrI_as>CCCAGT))", None, 4096.0, 4, 11, 2993, 65, 37, 1, "N", None, None, None, "ACTGGG", 6, "DNA", ("N",), "https://identifiers.org/rebase:2993"),
+    ("BmsI", (10, 9, None, None, "GCATC"), "(?=(?P<BmsI>GCATC))|(?=(?P<BmsI_as>GATGC))", None, 1024.0, 9, 10, 17981, 65, 37, -4, "NNNN", None, None, None, "GCATC", 5, "DNA", ("B",), "https://identifiers.org/rebase:17981"),
+    ("BmtI", (5, -5, None, None, "GCTAGC"), "(?=(?P<BmtI>GCTAGC))", None, 4096.0, -5, 5, 6222, 65, 37, 4, "CTAG", None, None, None, "GCTAGC", 6, "DNA", ("I", "N", "V"), "https://identifiers.org/rebase:6222"),
+    ("BmuI", (11, 4, None, None, "ACTGGG"), "(?=(?P<BmuI>ACTGGG))|(?=(?P<BmuI_as>CCCAGT))", None, 4096.0, 4, 11, 10875, 65, 37, 1, "N", None, None, None, "ACTGGG", 6, "DNA", ("I",), "https://identifiers.org/rebase:10875"),
+    ("BoxI", (5, -5, None, None, "GACNNNNGTC"), "(?=(?P<BoxI>GAC....GTC))", None, 4096.0, -5, 5, 3094, 65, 37, 0, "", None, None, None, "GACNNNNGTC", 10, "DNA", ("B",), "https://identifiers.org/rebase:3094"),
+    ("BpiI", (8, 6, None, None, "GAAGAC"), "(?=(?P<BpiI>GAAGAC))|(?=(?P<BpiI_as>GTCTTC))", None, 4096.0, 6, 8, 2447, 65, 37, -4, "NNNN", None, None, None, "GAAGAC", 6, "DNA", ("B",), "https://identifiers.org/rebase:2447"),
+    ("BplI", (-8, -24, 24, 8, "GAGNNNNNCTC"), "(?=(?P<BplI>GAG.....CTC))", None, 4096.0, -24, -8, 2732, 65, 37, 5, "NNNNN", None, 8, 24, "GAGNNNNNCTC", 11, "DNA", ("B",), "https://identifiers.org/rebase:2732"),
+    ("BpmI", (22, 14, None, None, "CTGGAG"), "(?=(?P<BpmI>CTGGAG))|(?=(?P<BpmI_as>CTCCAG))", None, 4096.0, 14, 22, 295, 65, 37, 2, "NN", None, None, None, "CTGGAG", 6, "DNA", ("I", "N"), "https://identifiers.org/rebase:295"),
+    ("Bps6700III", (None, None, None, None, "TACCNAG"), "(?=(?P<Bps6700III>TACC.AG))|(?=(?P<Bps6700III_as>CT.GGTA))", None, 4096.0, None, None, 421501, 65, 37, None, None, None, None, None, "TACCNAG", 7, "DNA", (), "https://identifiers.org/rebase:421501"),
+    ("Bpu10I", (2, -2, None, None, "CCTNAGC"), "(?=(?P<Bpu10I>CCT.AGC))|(?=(?P<Bpu10I_as>GCT.AGG))", None, 4096.0, -2, 2, 298, 65, 37, -3, "TNA", None, None, None, "CCTNAGC", 7, "DNA", ("B", "I", "N", "V"), "https://identifiers.org/rebase:298"),
+    ("Bpu1102I", (2, -2, None, None, "GCTNAGC"), "(?=(?P<Bpu1102I>GCT.AGC))", None, 4096.0, -2, 2, 299, 65, 37, -3, "TNA", None, None, None, "GCTNAGC", 7, "DNA", ("B", "K"), "https://identifiers.org/rebase:299"),
+    ("Bpu14I", (2, -2, None, None, "TTCGAA"), "(?=(?P<Bpu14I>TTCGAA))", None, 4096.0, -2, 2, 301, 65, 37, -2, "CG", None, None, None, "TTCGAA", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:301"),
+    ("BpuEI", (22, 14, None, None, "CTTGAG"), "(?=(?P<BpuEI>CTTGAG))|(?=(?P<BpuEI_as>CTCAAG))", None, 4096.0, 14, 22, 5222, 65, 37, 2, "NN", None, None, None, "CTTGAG", 6, "DNA", ("N",), "https://identifiers.org/rebase:5222"),
+    ("BpuMI", (2, -2, None, None, "CCSGG"), "(?=(?P<BpuMI>CC[CG]GG))", None, 512.0, -2, 2, 10493, 65, 37, -1, "S", None, None, None, "CCSGG", 5, "DNA", ("V",), "https://identifiers.org/rebase:10493"),
+    ("Bsa29I", (2, -2, None, None, "ATCGAT"), "(?=(?P<Bsa29I>ATCGAT))", None, 4096.0, -2, 2, 2671, 65, 37, -2, "CG", None, None, None, "ATCGAT", 6, "DNA", ("I",), "https://identifiers.org/rebase:2671"),
+    ("BsaAI", (3, -3, None, None, "YACGTR"), "(?=(?P<BsaAI>[CT]ACGT[AG]))", None, 1024.0, -3, 3, 305, 65, 37, 0, "", None, None, None, "YACGTR", 6, "DNA", ("N",), "https://identifiers.org/rebase:305"),
+    ("BsaBI", (5, -5, None, None, "GATNNNNATC"), "(?=(?P<BsaBI>GAT....ATC))", None, 4096.0, -5, 5, 306, 65, 37, 0, "", None, None, None, "GATNNNNATC", 10, "DNA", ("N",), "https://identifiers.org/rebase:306"),
+    ("BsaHI", (2, -2, None, None, "GRCGYC"), "(?=(?P<BsaHI>G[AG]CG[CT]C))", None, 1024.0, -2, 2, 312, 65, 37, -2, "CG", None, None, None, "GRCGYC", 6, "DNA", ("N",), "https://identifiers.org/rebase:312"),
+    ("BsaI", (7, 5, None, None, "GGTCTC"), "(?=(?P<BsaI>GGTCTC))|(?=(?P<BsaI_as>GAGACC))", None, 4096.0, 5, 7, 313, 65, 37, -4, "NNNN", None, None, None, "GGTCTC", 6, "DNA", ("N",), "https://identifiers.org/rebase:313"),
+    ("BsaJI", (1, -1, None, None, "CCNNGG"), "(?=(?P<BsaJI>CC..GG))", None, 256.0, -1, 1, 314, 65, 37, -4, "CNNG", None, None, None, "CCNNGG", 6, "DNA", ("N",), "https://identifiers.org/rebase:314"),
+    ("BsaWI", (1, -1, None, None, "WCCGGW"), "(?=(?P<BsaWI>[AT]CCGG[AT]))", None, 1024.0, -1, 1, 328, 65, 37, -4, "CCGG", None, None, None, "WCCGGW", 6, "DNA", ("N",), "https://identifiers.org/rebase:328"),
+    ("BsaXI", (-9, -23, 21, 7, "ACNNNNNCTCC"), "(?=(?P<BsaXI>AC.....CTCC))|(?=(?P<BsaXI_as>GGAG.....GT))", None, 4096.0, -23, -9, 2194, 65, 37, 3, "NNN", None, 7, 21, "ACNNNNNCTCC", 11, "DNA", ("N",), "https://identifiers.org/rebase:2194"),
+    ("BsbI", (27, 19, None, None, "CAACAC"), "(?=(?P<BsbI>CAACAC))|(?=(?P<BsbI_as>GTGTTG))", None, 4096.0, 19, 27, 329, 65, 37, 2, "NN", None, None, None, "CAACAC", 6, "DNA", (), "https://identifiers.org/rebase:329"),
+    ("Bsc4I", (7, -7, None, None, "CCNNNNNNNGG"), "(?=(?P<Bsc4I>CC.......GG))", None, 256.0, -7, 7, 2357, 65, 37, 3, "NNN", None, None, None, "CCNNNNNNNGG", 11, "DNA", ("I",), "https://identifiers.org/rebase:2357"),
+    ("BscAI", (9, 6, None, None, "GCATC"), "(?=(?P<BscAI>GCATC))|(?=(?P<BscAI_as>GATGC))", None, 1024.0, 6, 9, 330, 65, 37, -2, "NN", None, None, None, "GCATC", 5, "DNA", (), "https://identifiers.org/rebase:330"),
+    ("BscGI", (None, None, None, None, "CCCGT"), "(?=(?P<BscGI>CCCGT))|(?=(?P<BscGI_as>ACGGG))", None, 1024.0, None, None, 2163, 65, 37, None, None, None, None, None, "CCCGT", 5, "DNA", (), "https://identifiers.org/rebase:2163"),
+    ("BscXI", (5, -5, None, None, "GCAGGC"), "(?=(?P<BscXI>GCAGGC))|(?=(?P<BscXI_as>GCCTGC))", None, 4096.0, -5, 5, 11108, 65, 37, 4, "CAGG", None, None, None, "GCAGGC", 6, "DNA", (), "https://identifiers.org/rebase:11108"),
+    ("Bse118I", (1, -1, None, None, "RCCGGY"), "(?=(?P<Bse118I>[AG]CCGG[CT]))", None, 1024.0, -1, 1, 337, 65, 37, -4, "CCGG", None, None, None, "RCCGGY", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:337"),
+    ("Bse1I", (6, -1, None, None, "ACTGG"), "(?=(?P<Bse1I>ACTGG))|(?=(?P<Bse1I_as>CCAGT))", None, 1024.0, -1, 6, 2672, 65, 37, 2, "GN", None, None, None, "ACTGG", 5, "DNA", ("I", "V"), "https://identifiers.org/rebase:2672"),
+    ("Bse21I", (2, -2, None, None, "CCTNAGG"), "(?=(?P<Bse21I>CCT.AGG))", None, 4096.0, -2, 2, 338, 65, 37, -3, "TNA", None, None, None, "CCTNAGG", 7, "DNA", ("I", "V"), "https://identifiers.org/rebase:338"),
+    ("Bse3DI", (8, 0, None, None, "GCAATG"), "(?=(?P<Bse3DI>GCAATG))|(?=(?P<Bse3DI_as>CATTGC))", None, 4096.0, 0, 8, 2879, 65, 37, 2, "NN", None, None, None, "GCAATG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2879"),
+    ("Bse8I", (5, -5, None, None, "GATNNNNATC"), "(?=(?P<Bse8I>GAT....ATC))", None, 4096.0, -5, 5, 2366, 65, 37, 0, "", None, None, None, "GATNNNNATC", 10, "DNA", ("I", "V"), "https://identifiers.org/rebase:2366"),
+    ("BseAI", (1, -1, None, None, "TCCGGA"), "(?=(?P<BseAI>TCCGGA))", None, 4096.0, -1, 1, 339, 65, 37, -4, "CCGG", None, None, None, "TCCGGA", 6, "DNA", ("C",), "https://identifiers.org/rebase:339"),
+    ("BseBI", (2, -2, None, None, "CCWGG"), "(?=(?P<BseBI>CC[AT]GG))", None, 512.0, -2, 2, 340, 65, 37, -1, "W", None, None, None, "CCWGG", 5, "DNA", ("C",), "https://identifiers.org/rebase:340"),
+    ("BseCI", (2, -2, None, None, "ATCGAT"), "(?=(?P<BseCI>ATCGAT))", None, 4096.0, -2, 2, 2160, 65, 37, -2, "CG", None, None, None, "ATCGAT", 6, "DNA", ("C",), "https://identifiers.org/rebase:2160"),
+    ("BseDI", (1, -1, None, None, "CCNNGG"), "(?=(?P<BseDI>CC..GG))", None, 256.0, -1, 1, 2289, 65, 37, -4, "CNNG", None, None, None, "CCNNGG", 6, "DNA", ("B",), "https://identifiers.org/rebase:2289"),
+    ("BseGI", (7, 0, None, None, "GGATG"), "(?=(?P<BseGI>GGATG))|(?=(?P<BseGI_as>CATCC))", None, 1024.0, 0, 7, 2988, 65, 37, 2, "NN", None, None, None, "GGATG", 5, "DNA", ("B",), "https://identifiers.org/rebase:2988"),
+    ("BseJI", (5, -5, None, None, "GATNNNNATC"), "(?=(?P<BseJI>GAT....ATC))", None, 4096.0, -5, 5, 5464, 65, 37, 0, "", None, None, None, "GATNNNNATC", 10, "DNA", ("B",), "https://identifiers.org/rebase:5464"),
+    ("BseLI", (7, -7, None, None, "CCNNNNNNNGG"), "(?=(?P<BseLI>CC.......GG))", None, 256.0, -7, 7, 2982, 65, 37, 3, "NNN", None, None, None, "CCNNNNNNNGG", 11, "DNA", ("B",), "https://identifiers.org/rebase:2982"),
+    ("BseMI", (8, 0, None, None, "GCAATG"), "(?=(?P<BseMI>GCAATG))|(?=(?P<BseMI_as>CATTGC))", None, 4096.0, 0, 8, 2984, 65, 37, 2, "NN", None, None, None, "GCAATG", 6, "DNA", ("B",), "https://identifiers.org/rebase:2984"),
+    ("BseMII", (15, 8, None, None, "CTCAG"), "(?=(?P<BseMII>CTCAG))|(?=(?P<BseMII_as>CTGAG))", None, 1024.0, 8, 15, 3025, 65, 37, 2, "NN", None, None, None, "CTCAG", 5, "DNA", ("B",), "https://identifiers.org/rebase:3025"),
+    ("BseNI", (6, -1, None, None, "ACTGG"), "(?=(?P<BseNI>ACTGG))|(?=(?P<BseNI_as>CCAGT))", None, 1024.0, -1, 6, 2179, 65, 37, 2, "GN", None, None, None, "ACTGG", 5, "DNA", ("B",), "https://identifiers.org/rebase:2179"),
+    ("BsePI", (1, -1, None, None, "GCGCGC"), "(?=(?P<BsePI>GCGCGC))", None, 4096.0, -1, 1, 344, 65, 37, -4, "CGCG", None, None, None, "GCGCGC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:344"),
+    ("BseRI", (16, 8, None, None, "GAGGAG"), "(?=(?P<BseRI>GAGGAG))|(?=(?P<BseRI_as>CTCCTC))", None, 4096.0, 8, 16, 2316, 65, 37, 2, "NN", None, None, None, "GAGGAG", 6, "DNA", ("N",), "https://identifiers.org/rebase:2316"),
+    ("BseSI", (5, -5, None, None, "GKGCMC"), "(?=(?P<BseSI>G[GT]GC[AC]C))", None, 1024.0, -5, 5, 3105, 65, 37, 4, "KGCM", None, None, None, "GKGCMC", 6, "DNA", ("B",), "https://identifiers.org/rebase:3105"),
+    ("BseX3I", (1, -1, None, None, "CGGCCG"), "(?=(?P<BseX3I>CGGCCG))", None, 4096.0, -1, 1, 2960, 65, 37, -4, "GGCC", None, None, None, "CGGCCG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2960"),
+    ("BseXI", (13, 12, None, None, "GCAGC"), "(?=(?P<BseXI>GCAGC))|(?=(?P<BseXI_as>GCTGC))", None, 1024.0, 12, 13, 3830, 65, 37, -4, "NNNN", None, None, None, "GCAGC", 5, "DNA", ("B",), "https://identifiers.org/rebase:3830"),
+    ("BseYI", (1, -1, None, None, "CCCAGC"), "(?=(?P<BseYI>CCCAGC))|(?=(?P<BseYI_as>GCTGGG))", None, 4096.0, -1, 1, 5309, 65, 37, -4, "CCAG", None, None, None, "CCCAGC", 6, "DNA", ("N",), "https://identifiers.org/rebase:5309"),
+    ("BsgI", (22, 14, None, None, "GTGCAG"), "(?=(?P<BsgI>GTGCAG))|(?=(?P<BsgI_as>CTGCAC))", None, 4096.0, 14, 22, 345, 65, 37, 2, "NN", None, None, None, "GTGCAG", 6, "DNA", ("N",), "https://identifiers.org/rebase:345"),
+    ("Bsh1236I", (2, -2, None, None, "CGCG"), "(?=(?P<Bsh1236I>CGCG))", None, 256.0, -2, 2, 2177, 65, 37, 0, "", None, None, None, "CGCG", 4, "DNA", ("B",), "https://identifiers.org/rebase:2177"),
+    ("Bsh1285I", (4, -4, None, None, "CGRYCG"), "(?=(?P<Bsh1285I>CG[AG][CT]CG))", None, 1024.0, -4, 4, 2178, 65, 37, 2, "RY", None, None, None, "CGRYCG", 6, "DNA", ("B",), "https://identifiers.org/rebase:2178"),
+    ("BshFI", (2, -2, None, None, "GGCC"), "(?=(?P<BshFI>GGCC))", None, 256.0, -2, 2, 352, 65, 37, 0, "", None, None, None, "GGCC", 4, "DNA", ("C",), "https://identifiers.org/rebase:352"),
+    ("BshNI", (1, -1, None, None, "GGYRCC"), "(?=(?P<BshNI>GG[CT][AG]CC))", None, 1024.0, -1, 1, 2428, 65, 37, -4, "GYRC", None, None, None, "GGYRCC", 6, "DNA", ("B",), "https://identifiers.org/rebase:2428"),
+    ("BshTI", (1, -1, None, None, "ACCGGT"), "(?=(?P<BshTI>ACCGGT))", None, 4096.0, -1, 1, 3829, 65, 37, -4, "CCGG", None, None, None, "ACCGGT", 6, "DNA", ("B",), "https://identifiers.org/rebase:3829"),
+    ("BshVI", (2, -2, None, None, "ATCGAT"), "(?=(?P<BshVI>ATCGAT))", None, 4096.0, -2, 2, 8568, 65, 37, -2, "CG", None, None, None, "ATCGAT", 6, "DNA", ("V",), "https://identifiers.org/rebase:8568"),
+    ("BsiEI", (4, -4, None, None, "CGRYCG"), "(?=(?P<BsiEI>CG[AG][CT]CG))", None, 1024.0, -4, 4, 363, 65, 37, 2, "RY", None, None, None, "CGRYCG", 6, "DNA", ("N",), "https://identifiers.org/rebase:363"),
+    ("BsiHKAI", (5, -5, None, None, "GWGCWC"), "(?=(?P<BsiHKAI>G[AT]GC[AT]C))", None, 1024.0, -5, 5, 367, 65, 37, 4, "WGCW", None, None, None, "GWGCWC", 6, "DNA", ("N",), "https://identifiers.org/rebase:367"),
+    ("BsiHKCI", (1, -1, None, None, "CYCGRG"), "(?=(?P<BsiHKCI>C[CT]CG[AG]G))", None, 1024.0, -1, 1, 5362, 65, 37, -4, "YCGR", None, None, None, "CYCGRG", 6, "DNA", ("Q", "X"), "https://identifiers.org/rebase:5362"),
+    ("BsiI", (1, -1, None, None, "CACGAG"), "(?=(?P<BsiI>CACGAG))|(?=(?P<BsiI_as>CTCGTG))", None, 4096.0, -1, 1, 368, 65, 37, -4, "ACGA", None, None, None, "CACGAG", 6, "DNA", (), "https://identifiers.org/rebase:368"),
+    ("BsiSI", (1, -1, None, None, "CCGG"), "(?=(?P<BsiSI>CCGG))", None, 256.0, -1, 1, 378, 65, 37, -2, "CG", None, None, None, "CCGG", 4, "DNA", ("C", "Y"), "https://identifiers.org/rebase:378"),
+    ("BsiWI", (1, -1, None, None, "CGTACG"), "(?=(?P<BsiWI>CGTACG))", None, 4096.0, -1, 1, 382, 65, 37, -4, "GTAC", None, None, None, "CGTACG", 6, "DNA", ("N",), "https://identifiers.org/rebase:382"),
+    ("BsiYI", (7, -7, None, None, "CCNNNNNNNGG"), "(?=(?P<BsiYI>CC.......GG))", None, 256.0, -7, 7, 384, 65, 37, 3, "NNN", None, None, None, "CCNNNNNNNGG", 11, "DNA", (), "https://identifiers.org/rebase:384"),
+    ("BslFI", (15, 14, None, None, "GGGAC"), "(?=(?P<BslFI>GGGAC))|(?=(?P<BslFI_as>GTCCC))", None, 1024.0, 14, 15, 7532, 65, 37, -4, "NNNN", None, None, None, "GGGAC", 5, "DNA", ("I",), "https://identifiers.org/rebase:7532"),
+    ("BslI", (7, -7, None, None, "CCNNNNNNNGG"), "(?=(?P<BslI>CC.......GG))", None, 256.0, -7, 7, 386, 65, 37, 3, "NNN", None, None, None, "CCNNNNNNNGG", 11, "DNA", ("N",), "https://identifiers.org/rebase:386"),
+    ("BsmAI", (6, 5, None, None, "GTCTC"), "(?=(?P<BsmAI>GTCTC))|(?=(?P<BsmAI_as>GAGAC))", None, 1024.0, 5, 6, 387, 65, 37, -4, "NNNN", None, None, None, "GTCTC", 5, "DNA", ("N",), "https://identifiers.org/rebase:387"),
+    ("BsmBI", (7, 5, None, None, "CGTCTC"), "(?=(?P<BsmBI>CGTCTC))|(?=(?P<BsmBI_as>GAGACG))", None, 4096.0, 5, 7, 2415, 65, 37, -4, "NNNN", None, None, None, "CGTCTC", 6, "DNA", ("N",), "https://identifiers.org/rebase:2415"),
+    ("BsmFI", (15, 14, None, None, "GGGAC"), "(?=(?P<BsmFI>GGGAC))|(?=(?P<BsmFI_as>GTCCC))", None, 1024.0, 14, 15, 2212, 65, 37, -4, "NNNN", None, None, None, "GGGAC", 5, "DNA", ("N",), "https://identifiers.org/rebase:2212"),
+    ("BsmI", (7, -1, None, None, "GAATGC"), "(?=(?P<BsmI>GAATGC))|(?=(?P<BsmI_as>GCATTC))", None, 4096.0, -1, 7, 389, 65, 37, 2, "CN", None, None, None, "GAATGC", 6, "DNA", ("J", "M", "N", "S"), "https://identifiers.org/rebase:389"),
+    ("BsnI", (2, -2, None, None, "GGCC"), "(?=(?P<BsnI>GGCC))", None, 256.0, -2, 2, 10491, 65, 37, 0, "", None, None, None, "GGCC", 4, "DNA", ("V",), "https://identifiers.org/rebase:10491"),
+    ("Bso31I", (7, 5, None, None, "GGTCTC"), "(?=(?P<Bso31I>GGTCTC))|(?=(?P<Bso31I_as>GAGACC))", None, 4096.0, 5, 7, 4069, 65, 37, -4, "NNNN", None, None, None, "GGTCTC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:4069"),
+    ("BsoBI", (1, -1, None, None, "CYCGRG"), "(?=(?P<BsoBI>C[CT]CG[AG]G))", None, 1024.0, -1, 1, 392, 65, 37, -4, "YCGR", None, None, None, "CYCGRG", 6, "DNA", ("N",), "https://identifiers.org/rebase:392"),
+    ("Bsp119I", (2, -2, None, None, "TTCGAA"), "(?=(?P<Bsp119I>TTCGAA))", None, 4096.0, -2, 2, 406, 65, 37, -2, "CG", None, None, None, "TTCGAA", 6, "DNA", ("B",), "https://identifiers.org/rebase:406"),
+    ("Bsp120I", (1, -1, None, None, "GGGCCC"), "(?=(?P<Bsp120I>GGGCCC))", None, 4096.0, -1, 1, 407, 65, 37, -4, "GGCC", None, None, None, "GGGCCC", 6, "DNA", ("B",), "https://identifiers.org/rebase:407"),
+    ("Bsp1286I", (5, -5, None, None, "GDGCHC"), "(?=(?P<Bsp1286I>G[AGT]GC[ACT]C))", None, 455.1111111111111, -5, 5, 416, 65, 37, 4, "DGCH", None, None, None, "GDGCHC", 6, "DNA", ("J", "K", "N"), "https://identifiers.org/rebase:416"),
+    ("Bsp13I", (1, -1, None, None, "TCCGGA"), "(?=(?P<Bsp13I>TCCGGA))", None, 4096.0, -1, 1, 430, 65, 37, -4, "CCGG", None, None, None, "TCCGGA", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:430"),
+    ("Bsp1407I", (1, -1, None, None, "TGTACA"), "(?=(?P<Bsp1407I>TGTACA))", None, 4096.0, -1, 1, 2175, 65, 37, -4, "GTAC", None, None, None, "TGTACA", 6, "DNA", ("B", "K"), "https://identifiers.org/rebase:2175"),
+    ("Bsp143I", (0, 0, None, None, "GATC"), "(?=(?P<Bsp143I>GATC))", None, 256.0, 0, 0, 434, 65, 37, -4, "GATC", None, None, None, "GATC", 4, "DNA", ("B",), "https://identifiers.org/rebase:434"),
+    ("Bsp1720I", (2, -2, None, None, "GCTNAGC"), "(?=(?P<Bsp1720I>GCT.AGC))", None, 4096.0, -2, 2, 442, 65, 37, -3, "TNA", None, None, None, "GCTNAGC", 7, "DNA", ("I", "V"), "https://identifiers.org/rebase:442"),
+    ("Bsp19I", (1, -1, None, None, "CCATGG"), "(?=(?P<Bsp19I>CCATGG))", None, 4096.0, -1, 1, 446, 65, 37, -4, "CATG", None, None, None, "CCATGG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:446"),
+    ("Bsp24I", (-8, -25, 24, 7, "GACNNNNNNTGG"), "(?=(?P<Bsp24I>GAC......TGG))|(?=(?P<Bsp24I_as>CCA......GTC))", None, 4096.0, -25, -8, 2437, 65, 37, 5, "NNNNN", None, 7, 24, "GACNNNNNNTGG", 12, "DNA", (), "https://identifiers.org/rebase:2437"),
+    ("Bsp3004IV", (None, None, None, None, "CCGCAT"), "(?=(?P<Bsp3004IV>CCGCAT))|(?=(?P<Bsp3004IV_as>ATGCGG))", None, 4096.0, None, None, 67611, 65, 37, None, None, None, None, None, "CCGCAT", 6, "DNA", (), "https://identifiers.org/rebase:67611"),
+    ("Bsp460III", (None, None, None, None, "CGCGCAG"), "(?=(?P<Bsp460III>CGCGCAG))|(?=(?P<Bsp460III_as>CTGCGCG))", None, 16384.0, None, None, 145234, 65, 37, None, None, None, None, None, "CGCGCAG", 7, "DNA", (), "https://identifiers.org/rebase:145234"),
+    ("Bsp68I", (3, -3, None, None, "TCGCGA"), "(?=(?P<Bsp68I>TCGCGA))", None, 4096.0, -3, 3, 484, 65, 37, 0, "", None, None, None, "TCGCGA", 6, "DNA", ("B",), "https://identifiers.org/rebase:484"),
+    ("BspACI", (1, -1, None, None, "CCGC"), "(?=(?P<BspACI>CCGC))|(?=(?P<BspACI_as>GCGG))", None, 256.0, -1, 1, 11884, 65, 37, -2, "CG", None, None, None, "CCGC", 4, "DNA", ("I",), "https://identifiers.org/rebase:11884"),
+    ("BspANI", (2, -2, None, None, "GGCC"), "(?=(?P<BspANI>GGCC))", None, 256.0, -2, 2, 7453, 65, 37, 0, "", None, None, None, "GGCC", 4, "DNA", ("X",), "https://identifiers.org/rebase:7453"),
+    ("BspCNI", (14, 7, None, None, "CTCAG"), "(?=(?P<BspCNI>CTCAG))|(?=(?P<BspCNI_as>CTGAG))", None, 1024.0, 7, 14, 4663, 65, 37, 2, "NN", None, None, None, "CTCAG", 5, "DNA", ("N",), "https://identifiers.org/rebase:4663"),
+    ("BspD6I", (9, 6, None, None, "GAGTC"), "(?=(?P<BspD6I>GAGTC))|(?=(?P<BspD6I_as>GACTC))", None, 1024.0, 6, 9, 14733, 65, 37, -2, "NN", None, None, None, "GAGTC", 5, "DNA", (), "https://identifiers.org/rebase:14733"),
+    ("BspDI", (2, -2, None, None, "ATCGAT"), "(?=(?P<BspDI>ATCGAT))", None, 4096.0, -2, 2, 511, 65, 37, -2, "CG", None, None, None, "ATCGAT", 6, "DNA", ("N",), "https://identifiers.org/rebase:511"),
+    ("BspEI", (1, -1, None, None, "TCCGGA"), "(?=(?P<BspEI>TCCGGA))", None, 4096.0, -1, 1, 512, 65, 37, -4, "CCGG", None, None, None, "TCCGGA", 6, "DNA", ("N",), "https://identifiers.org/rebase:512"),
+    ("BspFNI", (2, -2, None, None, "CGCG"), "(?=(?P<BspFNI>CGCG))", None, 256.0, -2, 2, 16207, 65, 37, 0, "", None, None, None, "CGCG", 4, "DNA", ("I",), "https://identifiers.org/rebase:16207"),
+    ("BspGI", (None, None, None, None, "CTGGAC"), "(?=(?P<BspGI>CTGGAC))|(?=(?P<BspGI_as>GTCCAG))", None, 4096.0, None, None, 516, 65, 37, None, None, None, None, None, "CTGGAC", 6, "DNA", (), "https://identifiers.org/rebase:516"),
+    ("BspHI", (1, -1, None, None, "TCATGA"), "(?=(?P<BspHI>TCATGA))", None, 4096.0, -1, 1, 517, 65, 37, -4, "CATG", None, None, None, "TCATGA", 6, "DNA", ("N",), "https://identifiers.org/rebase:517"),
+    ("BspLI", (3, -3, None, None, "GGNNCC"), "(?=(?P<BspLI>GG..CC))", None, 256.0, -3, 3, 2831, 65, 37, 0, "", None, None, None, "GGNNCC", 6, "DNA", ("B",), "https://identifiers.org/rebase:2831"),
+    ("BspLU11I", (1, -1, None, None, "ACATGT"), "(?=(?P<BspLU11I>ACATGT))", None, 4096.0, -1, 1, 2324, 65, 37, -4, "CATG", None, None, None, "ACATGT", 6, "DNA", (), "https://identifiers.org/rebase:2324"),
+    ("BspMAI", (5, -5, None, None, "CTGCAG"), "(?=(?P<BspMAI>CTGCAG))", None, 4096.0, -5, 5, 5358, 65, 37, 4, "TGCA", None, None, None, "CTGCAG", 6, "DNA", ("X",), "https://identifiers.org/rebase:5358"),
+    ("BspMI", (10, 8, None, None, "ACCTGC"), "(?=(?P<BspMI>ACCTGC))|(?=(?P<BspMI_as>GCAGGT))", None, 4096.0, 8, 10, 527, 65, 37, -4, "NNNN", None, None, None, "ACCTGC", 6, "DNA", ("N",), "https://identifiers.org/rebase:527"),
+    ("BspMII", (1, -1, None, None, "TCCGGA"), "(?=(?P<BspMII>TCCGGA))", None, 4096.0, -1, 1, 528, 65, 37, -4, "CCGG", None, None, None, "TCCGGA", 6, "DNA", (), "https://identifiers.org/rebase:528"),
+    ("BspNCI", (None, None, None, None, "CCAGA"), "(?=(?P<BspNCI>CCAGA))|(?=(?P<BspNCI_as>TCTGG))", None, 1024.0, None, None, 4691, 65, 37, None, None, None, None, None, "CCAGA", 5, "DNA", (), "https://identifiers.org/rebase:4691"),
+    ("BspOI", (5, -5, None, None, "GCTAGC"), "(?=(?P<BspOI>GCTAGC))", None, 4096.0, -5, 5, 15356, 65, 37, 4, "CTAG", None, None, None, "GCTAGC", 6, "DNA", ("B",), "https://identifiers.org/rebase:15356"),
+    ("BspPI", (9, 5, None, None, "GGATC"), "(?=(?P<BspPI>GGATC))|(?=(?P<BspPI_as>GATCC))", None, 1024.0, 5, 9, 2448, 65, 37, -1, "N", None, None, None, "GGATC", 5, "DNA", ("B",), "https://identifiers.org/rebase:2448"),
+    ("BspQI", (8, 4, None, None, "GCTCTTC"), "(?=(?P<BspQI>GCTCTTC))|(?=(?P<BspQI_as>GAAGAGC))", None, 16384.0, 4, 8, 4157, 65, 37, -3, "NNN", None, None, None, "GCTCTTC", 7, "DNA", ("N",), "https://identifiers.org/rebase:4157"),
+    ("BspT104I", (2, -2, None, None, "TTCGAA"), "(?=(?P<BspT104I>TTCGAA))", None, 4096.0, -2, 2, 4947, 65, 37, -2, "CG", None, None, None, "TTCGAA", 6, "DNA", ("K",), "https://identifiers.org/rebase:4947"),
+    ("BspT107I", (1, -1, None, None, "GGYRCC"), "(?=(?P<BspT107I>GG[CT][AG]CC))", None, 1024.0, -1, 1, 4948, 65, 37, -4, "GYRC", None, None, None, "GGYRCC", 6, "DNA", ("K",), "https://identifiers.org/rebase:4948"),
+    ("BspTI", (1, -1, None, None, "CTTAAG"), "(?=(?P<BspTI>CTTAAG))", None, 4096.0, -1, 1, 1989, 65, 37, -4, "TTAA", None, None, None, "CTTAAG", 6, "DNA", ("B",), "https://identifiers.org/rebase:1989"),
+    ("BspTNI", (7, 5, None, None, "GGTCTC"), "(?=(?P<BspTNI>GGTCTC))|(?=(?P<BspTNI_as>GAGACC))", None, 4096.0, 5, 7, 5361, 65, 37, -4, "NNNN", None, None, None, "GGTCTC", 6, "DNA", ("X",), "https://identifiers.org/rebase:5361"),
+    ("BsrBI", (3, -3, None, None, "CCGCTC"), "(?=(?P<BsrBI>CCGCTC))|(?=(?P<BsrBI_as>GAGCGG))", None, 4096.0, -3, 3, 535, 65, 37, 0, "", None, None, None, "CCGCTC", 6, "DNA", ("N",), "https://identifiers.org/rebase:535"),
+    ("BsrDI", (8, 0, None, None, "GCAATG"), "(?=(?P<BsrDI>GCAATG))|(?=(?P<BsrDI_as>CATTGC))", None, 4096.0, 0, 8, 2195, 65, 37, 2, "NN", None, None, None, "GCAATG", 6, "DNA", ("N",), "https://identifiers.org/rebase:2195"),
+    ("BsrFI", (1, -1, None, None, "RCCGGY"), "(?=(?P<BsrFI>[AG]CCGG[CT]))", None, 1024.0, -1, 1, 538, 65, 37, -4, "CCGG", None, None, None, "RCCGGY", 6, "DNA", ("N",), "https://identifiers.org/rebase:538"),
+    ("BsrGI", (1, -1, None, None, "TGTACA"), "(?=(?P<BsrGI>TGTACA))", None, 4096.0, -1, 1, 2196, 65, 37, -4, "GTAC", None, None, None, "TGTACA", 6, "DNA", ("N",), "https://identifiers.org/rebase:2196"),
+    ("BsrI", (6, -1, None, None, "ACTGG"), "(?=(?P<BsrI>ACTGG))|(?=(?P<BsrI_as>CCAGT))", None, 1024.0, -1, 6, 540, 65, 37, 2, "GN", None, None, None, "ACTGG", 5, "DNA", ("N",), "https://identifiers.org/rebase:540"),
+    ("BssAI", (1, -1, None, None, "RCCGGY"), "(?=(?P<BssAI>[AG]CCGG[CT]))", None, 1024.0, -1, 1, 545, 65, 37, -4, "CCGG", None, None, None, "RCCGGY", 6, "DNA", ("C",), "https://identifiers.org/rebase:545"),
+    ("BssECI", (1, -1, None, None, "CCNNGG"), "(?=(?P<BssECI>CC..GG))", None, 256.0, -1, 1, 3200, 65, 37, -4, "CNNG", None, None, None, "CCNNGG", 6, "DNA", ("I",), "https://identifiers.org/rebase:3200"),
+    ("BssHII", (1, -1, None, None, "GCGCGC"), "(?=(?P<BssHII>GCGCGC))", None, 4096.0, -1, 1, 550, 65, 37, -4, "CGCG", None, None, None, "GCGCGC", 6, "DNA", ("J", "K", "M", "N", "Q", "X"), "https://identifiers.org/rebase:550"),
+    ("BssMI", (0, 0, None, None, "GATC"), "(?=(?P<BssMI>GATC))", None, 256.0, 0, 0, 11124, 65, 37, -4, "GATC", None, None, None, "GATC", 4, "DNA", ("V",), "https://identifiers.org/rebase:11124"),
+    ("BssNAI", (3, -3, None, None, "GTATAC"), "(?=(?P<BssNAI>GTATAC))", None, 4096.0, -3, 3, 2959, 65, 37, 0, "", None, None, None, "GTATAC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2959"),
+    ("BssNI", (2, -2, None, None, "GRCGYC"), "(?=(?P<BssNI>G[AG]CG[CT]C))", None, 1024.0, -2, 2, 10487, 65, 37, -2, "CG", None, None, None, "GRCGYC", 6, "DNA", ("V",), "https://identifiers.org/rebase:10487"),
+    ("BssSI", (1, -1, None, None, "CACGAG"), "(?=(?P<BssSI>CACGAG))|(?=(?P<BssSI_as>CTCGTG))", None, 4096.0, -1, 1, 2566, 65, 37, -4, "ACGA", None, None, None, "CACGAG", 6, "DNA", ("N",), "https://identifiers.org/rebase:2566"),
+    ("BssT1I", (1, -1, None, None, "CCWWGG"), "(?=(?P<BssT1I>CC[AT][AT]GG))", None, 1024.0, -1, 1, 554, 65, 37, -4, "CWWG", None, None, None, "CCWWGG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:554"),
+    ("Bst1107I", (3, -3, None, None, "GTATAC"), "(?=(?P<Bst1107I>GTATAC))", None, 4096.0, -3, 3, 556, 65, 37, 0, "", None, None, None, "GTATAC", 6, "DNA", ("B", "K"), "https://identifiers.org/rebase:556"),
+    ("Bst2BI", (1, -1, None, None, "CACGAG"), "(?=(?P<Bst2BI>CACGAG))|(?=(?P<Bst2BI_as>CTCGTG))", None, 4096.0, -1, 1, 2810, 65, 37, -4, "ACGA", None, None, None, "CACGAG", 6, "DNA", ("I",), "https://identifiers.org/rebase:2810"),
+    ("Bst2UI", (2, -2, None, None, "CCWGG"), "(?=(?P<Bst2UI>CC[AT]GG))", None, 512.0, -2, 2, 2745, 65, 37, -1, "W", None, None, None, "CCWGG", 5, "DNA", ("I", "V"), "https://identifiers.org/rebase:2745"),
+    ("Bst4CI", (3, -3, None, None, "ACNGT"), "(?=(?P<Bst4CI>AC.GT))", None, 256.0, -3, 3, 3009, 65, 37, 1, "N", None, None, None, "ACNGT", 5, "DNA", ("I", "V"), "https://identifiers.org/rebase:3009"),
+    ("Bst6I", (7, 4, None, None, "CTCTTC"), "(?=(?P<Bst6I>CTCTTC))|(?=(?P<Bst6I_as>GAAGAG))", None, 4096.0, 4, 7, 5552, 65, 37, -3, "NNN", None, None, None, "CTCTTC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:5552"),
+    ("BstACI", (2, -2, None, None, "GRCGYC"), "(?=(?P<BstACI>G[AG]CG[CT]C))", None, 1024.0, -2, 2, 2948, 65, 37, -2, "CG", None, None, None, "GRCGYC", 6, "DNA", ("I",), "https://identifiers.org/rebase:2948"),
+    ("BstAFI", (1, -1, None, None, "CTTAAG"), "(?=(?P<BstAFI>CTTAAG))", None, 4096.0, -1, 1, 17119, 65, 37, -4, "TTAA", None, None, None, "CTTAAG", 6, "DNA", ("I",), "https://identifiers.org/rebase:17119"),
+    ("BstAPI", (7, -7, None, None, "GCANNNNNTGC"), "(?=(?P<BstAPI>GCA.....TGC))", None, 4096.0, -7, 7, 2958, 65, 37, 3, "NNN", None, None, None, "GCANNNNNTGC", 11, "DNA", ("I", "N"), "https://identifiers.org/rebase:2958"),
+    ("BstAUI", (1, -1, None, None, "TGTACA"), "(?=(?P<BstAUI>TGTACA))", None, 4096.0, -1, 1, 6960, 65, 37, -4, "GTAC", None, None, None, "TGTACA", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:6960"),
+    ("BstBAI", (3, -3, None, None, "YACGTR"), "(?=(?P<BstBAI>[CT]ACGT[AG]))", None, 1024.0, -3, 3, 2856, 65, 37, 0, "", None, None, None, "YACGTR", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2856"),
+    ("BstBI", (2, -2, None, None, "TTCGAA"), "(?=(?P<BstBI>TTCGAA))", None, 4096.0, -2, 2, 570, 65, 37, -2, "CG", None, None, None, "TTCGAA", 6, "DNA", ("N",), "https://identifiers.org/rebase:570"),
+    ("BstC8I", (3, -3, None, None, "GCNNGC"), "(?=(?P<BstC8I>GC..GC))", None, 256.0, -3, 3, 5509, 65, 37, 0, "", None, None, None, "GCNNGC", 6, "DNA", ("I",), "https://identifiers.org/rebase:5509"),
+    ("BstDEI", (1, -1, None, None, "CTNAG"), "(?=(?P<BstDEI>CT.AG))", None, 256.0, -1, 1, 2767, 65, 37, -3, "TNA", None, None, None, "CTNAG", 5, "DNA", ("I", "V"), "https://identifiers.org/rebase:2767"),
+    ("BstDSI", (1, -1, None, None, "CCRYGG"), "(?=(?P<BstDSI>CC[AG][CT]GG))", None, 1024.0, -1, 1, 2739, 65, 37, -4, "CRYG", None, None, None, "CCRYGG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2739"),
+    ("BstEII", (1, -1, None, None, "GGTNACC"), "(?=(?P<BstEII>GGT.ACC))", None, 4096.0, -1, 1, 575, 65, 37, -5, "GTNAC", None, None, None, "GGTNACC", 7, "DNA", ("C", "J", "N"), "https://identifiers.org/rebase:575"),
+    ("BstENI", (5, -5, None, None, "CCTNNNNNAGG"), "(?=(?P<BstENI>CCT.....AGG))", None, 4096.0, -5, 5, 4841, 65, 37, -1, "N", None, None, None, "CCTNNNNNAGG", 11, "DNA", ("I", "V"), "https://identifiers.org/rebase:4841"),
+    ("BstF5I", (7, 0, None, None, "GGATG"), "(?=(?P<BstF5I>GGATG))|(?=(?P<BstF5I_as>CATCC))", None, 1024.0, 0, 7, 2744, 65, 37, 2, "NN", None, None, None, "GGATG", 5, "DNA", ("I", "V"), "https://identifiers.org/rebase:2744"),
+    ("BstFNI", (2, -2, None, None, "CGCG"), "(?=(?P<BstFNI>CGCG))", None, 256.0, -2, 2, 4070, 65, 37, 0, "", None, None, None, "CGCG", 4, "DNA", ("I", "V"), "https://identifiers.org/rebase:4070"),
+    ("BstH2I", (5, -5, None, None, "RGCGCY"), "(?=(?P<BstH2I>[AG]GCGC[CT]))", None, 1024.0, -5, 5, 2743, 65, 37, 4, "GCGC", None, None, None, "RGCGCY", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2743"),
+    ("BstHHI", (3, -3, None, None, "GCGC"), "(?=(?P<BstHHI>GCGC))", None, 256.0, -3, 3, 4914, 65, 37, 2, "CG", None, None, None, "GCGC", 4, "DNA", ("I", "V"), "https://identifiers.org/rebase:4914"),
+    ("BstKTI", (3, -3, None, None, "GATC"), "(?=(?P<BstKTI>GATC))", None, 256.0, -3, 3, 5533, 65, 37, 2, "AT", None, None, None, "GATC", 4, "DNA", ("I",), "https://identifiers.org/rebase:5533"),
+    ("BstMAI", (6, 5, None, None, "GTCTC"), "(?=(?P<BstMAI>GTCTC))|(?=(?P<BstMAI_as>GAGAC))", None, 1024.0, 5, 6, 10830, 65, 37, -4, "NNNN", None, None, None, "GTCTC", 5, "DNA", ("I", "V"), "https://identifiers.org/rebase:10830"),
+    ("BstMBI", (0, 0, None, None, "GATC"), "(?=(?P<BstMBI>GATC))", None, 256.0, 0, 0, 7530, 65, 37, -4, "GATC", None, None, None, "GATC", 4, "DNA", ("I", "V"), "https://identifiers.org/rebase:7530"),
+    ("BstMCI", (4, -4, None, None, "CGRYCG"), "(?=(?P<BstMCI>CG[AG][CT]CG))", None, 1024.0, -4, 4, 2740, 65, 37, 2, "RY", None, None, None, "CGRYCG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2740"),
+    ("BstMWI", (7, -7, None, None, "GCNNNNNNNGC"), "(?=(?P<BstMWI>GC.......GC))", None, 256.0, -7, 7, 6223, 65, 37, 3, "NNN", None, None, None, "GCNNNNNNNGC", 11, "DNA", ("I",), "https://identifiers.org/rebase:6223"),
+    ("BstNI", (2, -2, None, None, "CCWGG"), "(?=(?P<BstNI>CC[AT]GG))", None, 512.0, -2, 2, 586, 65, 37, -1, "W", None, None, None, "CCWGG", 5, "DNA", ("N",), "https://identifiers.org/rebase:586"),
+    ("BstNSI", (5, -5, None, None, "RCATGY"), "(?=(?P<BstNSI>[AG]CATG[CT]))", None, 1024.0, -5, 5, 2864, 65, 37, 4, "CATG", None, None, None, "RCATGY", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2864"),
+    ("BstPAI", (5, -5, None, None, "GACNNNNGTC"), "(?=(?P<BstPAI>GAC....GTC))", None, 4096.0, -5, 5, 4619, 65, 37, 0, "", None, None, None, "GACNNNNGTC", 10, "DNA", ("I", "V"), "https://identifiers.org/rebase:4619"),
+    ("BstPI", (1, -1, None, None, "GGTNACC"), "(?=(?P<BstPI>GGT.ACC))", None, 4096.0, -1, 1, 588, 65, 37, -5, "GTNAC", None, None, None, "GGTNACC", 7, "DNA", ("K",), "https://identifiers.org/rebase:588"),
+    ("BstSCI", (0, 0, None, None, "CCNGG"), "(?=(?P<BstSCI>CC.GG))", None, 256.0, 0, 0, 5510, 65, 37, -5, "CCNGG", None, None, None, "CCNGG", 5, "DNA", ("I",), "https://identifiers.org/rebase:5510"),
+    ("BstSFI", (1, -1, None, None, "CTRYAG"), "(?=(?P<BstSFI>CT[AG][CT]AG))", None, 1024.0, -1, 1, 2765, 65, 37, -4, "TRYA", None, None, None, "CTRYAG", 6, "DNA", ("I",), "https://identifiers.org/rebase:2765"),
+    ("BstSLI", (5, -5, None, None, "GKGCMC"), "(?=(?P<BstSLI>G[GT]GC[AC]C))", None, 1024.0, -5, 5, 16191, 65, 37, 4, "KGCM", None, None, None, "GKGCMC", 6, "DNA", ("I",), "https://identifiers.org/rebase:16191"),
+    ("BstSNI", (3, -3, None, None, "TACGTA"), "(?=(?P<BstSNI>TACGTA))", None, 4096.0, -3, 3, 2734, 65, 37, 0, "", None, None, None, "TACGTA", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2734"),
+    ("BstUI", (2, -2, None, None, "CGCG"), "(?=(?P<BstUI>CGCG))", None, 256.0, -2, 2, 593, 65, 37, 0, "", None, None, None, "CGCG", 4, "DNA", ("N",), "https://identifiers.org/rebase:593"),
+    ("BstV1I", (13, 12, None, None, "GCAGC"), "(?=(?P<BstV1I>GCAGC))|(?=(?P<BstV1I_as>GCTGC))", None, 1024.0, 12, 13, 5508, 65, 37, -4, "NNNN", None, None, None, "GCAGC", 5, "DNA", ("I",), "https://identifiers.org/rebase:5508"),
+    ("BstV2I", (8, 6, None, None, "GAAGAC"), "(?=(?P<BstV2I>GAAGAC))|(?=(?P<BstV2I_as>GTCTTC))", None, 4096.0, 6, 8, 4860, 65, 37, -4, "NNNN", None, None, None, "GAAGAC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:4860"),
+    ("BstX2I", (1, -1, None, None, "RGATCY"), "(?=(?P<BstX2I>[AG]GATC[CT]))", None, 1024.0, -1, 1, 2766, 65, 37, -4, "GATC", None, None, None, "RGATCY", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2766"),
+    ("BstXI", (8, -8, None, None, "CCANNNNNNTGG"), "(?=(?P<BstXI>CCA......TGG))", None, 4096.0, -8, 8, 596, 65, 37, 4, "NNNN", None, None, None, "CCANNNNNNTGG", 12, "DNA", ("B", "I", "J", "K", "M", "N", "Q", "V", "X", "Y"), "https://identifiers.org/rebase:596"),
+    ("BstYI", (1, -1, None, None, "RGATCY"), "(?=(?P<BstYI>[AG]GATC[CT]))", None, 1024.0, -1, 1, 598, 65, 37, -4, "GATC", None, None, None, "RGATCY", 6, "DNA", ("N",), "https://identifiers.org/rebase:598"),
+    ("BstZ17I", (3, -3, None, None, "GTATAC"), "(?=(?P<BstZ17I>GTATAC))", None, 4096.0, -3, 3, 2662, 65, 37, 0, "", None, None, None, "GTATAC", 6, "DNA", ("N",), "https://identifiers.org/rebase:2662"),
+    ("BstZI", (1, -1, None, None, "CGGCCG"), "(?=(?P<BstZI>CGGCCG))", None, 4096.0, -1, 1, 599, 65, 37, -4, "GGCC", None, None, None, "CGGCCG", 6, "DNA", ("R",), "https://identifiers.org/rebase:599"),
+    ("Bsu15I", (2, -2, None, None, "ATCGAT"), "(?=(?P<Bsu15I>ATCGAT))", None, 4096.0, -2, 2, 608, 65, 37, -2, "CG", None, None, None, "ATCGAT", 6, "DNA", ("B",), "https://identifiers.org/rebase:608"),
+    ("Bsu36I", (2, -2, None, None, "CCTNAGG"), "(?=(?P<Bsu36I>CCT.AGG))", None, 4096.0, -2, 2, 611, 65, 37, -3, "TNA", None, None, None, "CCTNAGG", 7, "DNA", ("N",), "https://identifiers.org/rebase:611"),
+    ("BsuI", (12, 5, None, None, "GTATCC"), "(?=(?P<BsuI>GTATCC))|(?=(?P<BsuI_as>GGATAC))", None, 4096.0, 5, 12, 26995, 65, 37, 1, "N", None, None, None, "GTATCC", 6, "DNA", ("I",), "https://identifiers.org/rebase:26995"),
+    ("BsuRI", (2, -2, None, None, "GGCC"), "(?=(?P<BsuRI>GGCC))", None, 256.0, -2, 2, 620, 65, 37, 0, "", None, None, None, "GGCC", 4, "DNA", ("B", "I"), "https://identifiers.org/rebase:620"),
+    ("BsuTUI", (2, -2, None, None, "ATCGAT"), "(?=(?P<BsuTUI>ATCGAT))", None, 4096.0, -2, 2, 5360, 65, 37, -2, "CG", None, None, None, "ATCGAT", 6, "DNA", ("X",), "https://identifiers.org/rebase:5360"),
+    ("BtgI", (1, -1, None, None, "CCRYGG"), "(?=(?P<BtgI>CC[AG][CT]GG))", None, 1024.0, -1, 1, 3790, 65, 37, -4, "CRYG", None, None, None, "CCRYGG", 6, "DNA", ("N",), "https://identifiers.org/rebase:3790"),
+    ("BtgZI", (16, 14, None, None, "GCGATG"), "(?=(?P<BtgZI>GCGATG))|(?=(?P<BtgZI_as>CATCGC))", None, 4096.0, 14, 16, 5640, 65, 37, -4, "NNNN", None, None, None, "GCGATG", 6, "DNA", ("N",), "https://identifiers.org/rebase:5640"),
+    ("BthCI", (4, -4, None, None, "GCNGC"), "(?=(?P<BthCI>GC.GC))", None, 256.0, -4, 4, 5795, 65, 37, 3, "CNG", None, None, None, "GCNGC", 5, "DNA", (), "https://identifiers.org/rebase:5795"),
+    ("BtrI", (3, -3, None, None, "CACGTC"), "(?=(?P<BtrI>CACGTC))|(?=(?P<BtrI_as>GACGTG))", None, 4096.0, -3, 3, 3774, 65, 37, 0, "", None, None, None, "CACGTC", 6, "DNA", ("I",), "https://identifiers.org/rebase:3774"),
+    ("BtsCI", (7, 0, None, None, "GGATG"), "(?=(?P<BtsCI>GGATG))|(?=(?P<BtsCI_as>CATCC))", None, 1024.0, 0, 7, 10541, 65, 37, 2, "NN", None, None, None, "GGATG", 5, "DNA", ("N",), "https://identifiers.org/rebase:10541"),
+    ("BtsI", (8, 0, None, None, "GCAGTG"), "(?=(?P<BtsI>GCAGTG))|(?=(?P<BtsI_as>CACTGC))", None, 4096.0, 0, 8, 3096, 65, 37, 2, "NN", None, None, None, "GCAGTG", 6, "DNA", ("N",), "https://identifiers.org/rebase:3096"),
+    ("BtsIMutI", (7, 0, None, None, "CAGTG"), "(?=(?P<BtsIMutI>CAGTG))|(?=(?P<BtsIMutI_as>CACTG))", None, 1024.0, 0, 7, 28973, 65, 37, 2, "NN", None, None, None, "CAGTG", 5, "DNA", ("N",), "https://identifiers.org/rebase:28973"),
+    ("BtuMI", (3, -3, None, None, "TCGCGA"), "(?=(?P<BtuMI>TCGCGA))", None, 4096.0, -3, 3, 11166, 65, 37, 0, "", None, None, None, "TCGCGA", 6, "DNA", ("V",), "https://identifiers.org/rebase:11166"),
+    ("Bve1B23I", (None, None, None, None, "GACNNNNNTGG"), "(?=(?P<Bve1B23I>GAC.....TGG))|(?=(?P<Bve1B23I_as>CCA.....GTC))", None, 4096.0, None, None, 283053, 65, 37, None, None, None, None, None, "GACNNNNNTGG", 11, "DNA", (), "https://identifiers.org/rebase:283053"),
+    ("BveI", (10, 8, None, None, "ACCTGC"), "(?=(?P<BveI>ACCTGC))|(?=(?P<BveI_as>GCAGGT))", None, 4096.0, 8, 10, 6224, 65, 37, -4, "NNNN", None, None, None, "ACCTGC", 6, "DNA", ("B",), "https://identifiers.org/rebase:6224"),
+    ("Cac8I", (3, -3, None, None, "GCNNGC"), "(?=(?P<Cac8I>GC..GC))", None, 256.0, -3, 3, 638, 65, 37, 0, "", None, None, None, "GCNNGC", 6, "DNA", ("N",), "https://identifiers.org/rebase:638"),
+    ("CaiI", (6, -6, None, None, "CAGNNNCTG"), "(?=(?P<CaiI>CAG...CTG))", None, 4096.0, -6, 6, 3194, 65, 37, 3, "NNN", None, None, None, "CAGNNNCTG", 9, "DNA", ("B",), "https://identifiers.org/rebase:3194"),
+    ("Cal14237I", (None, None, None, None, "GGTTAG"), "(?=(?P<Cal14237I>GGTTAG))|(?=(?P<Cal14237I_as>CTAACC))", None, 4096.0, None, None, 31763, 65, 37, None, None, None, None, None, "GGTTAG", 6, "DNA", (), "https://identifiers.org/rebase:31763"),
+    ("CalB3II", (None, None, None, None, "GRTTRAG"), "(?=(?P<CalB3II>G[AG]TT[AG]AG))|(?=(?P<CalB3II_as>CT[CT]AA[CT]C))", None, 4096.0, None, None, 67589, 65, 37, None, None, None, None, None, "GRTTRAG", 7, "DNA", (), "https://identifiers.org/rebase:67589"),
+    ("Cau10061II", (None, None, None, None, "GTTAAT"), "(?=(?P<Cau10061II>GTTAAT))|(?=(?P<Cau10061II_as>ATTAAC))", None, 4096.0, None, None, 70009, 65, 37, None, None, None, None, None, "GTTAAT", 6, "DNA", (), "https://identifiers.org/rebase:70009"),
+    ("CauII", (2, -2, None, None, "CCSGG"), "(?=(?P<CauII>CC[CG]GG))", None, 512.0, -2, 2, 644, 65, 37, -1, "S", None, None, None, "CCSGG", 5, "DNA", (), "https://identifiers.org/rebase:644"),
+    ("Cba13II", (None, None, None, None, "AGGAAT"), "(?=(?P<Cba13II>AGGAAT))|(?=(?P<Cba13II_as>ATTCCT))", None, 4096.0, None, None, 102165, 65, 37, None, None, None, None, None, "AGGAAT", 6, "DNA", (), "https://identifiers.org/rebase:102165"),
+    ("Cba16038I", (None, None, None, None, "CCTNAYNC"), "(?=(?P<Cba16038I>CCT.A[CT].C))|(?=(?P<Cba16038I_as>G.[AG]T.AGG))", None, 2048.0, None, None, 97723, 65, 37, None, None, None, None, None, "CCTNAYNC", 8, "DNA", (), "https://identifiers.org/rebase:97723"),
+    ("Cbo67071IV", (None, None, None, None, "GCRGAAG"), "(?=(?P<Cbo67071IV>GC[AG]GAAG))|(?=(?P<Cbo67071IV_as>CTTC[CT]GC))", None, 8192.0, None, None, 165809, 65, 37, None, None, None, None, None, "GCRGAAG", 7, "DNA", (), "https://identifiers.org/rebase:165809"),
+    ("CcaP7V", (None, None, None, None, "CRAAAAR"), "(?=(?P<CcaP7V>C[AG]AAAA[AG]))|(?=(?P<CcaP7V_as>[CT]TTTT[CT]G))", None, 4096.0, None, None, 116072, 65, 37, None, None, None, None, None, "CRAAAAR", 7, "DNA", (), "https://identifiers.org/rebase:116072"),
+    ("Cch467III", (None, None, None, None, "GNGAAAY"), "(?=(?P<Cch467III>G.GAAA[CT]))|(?=(?P<Cch467III_as>[AG]TTTC.C))", None, 2048.0, None, None, 216685, 65, 37, None, None, None, None, None, "GNGAAAY", 7, "DNA", (), "https://identifiers.org/rebase:216685"),
+    ("CchII", (17, 9, None, None, "GGARGA"), "(?=(?P<CchII>GGA[AG]GA))|(?=(?P<CchII_as>TC[CT]TCC))", None, 2048.0, 9, 17, 24818, 65, 37, 2, "NN", None, None, None, "GGARGA", 6, "DNA", (), "https://identifiers.org/rebase:24818"),
+    ("CchIII", (26, 18, None, None, "CCCAAG"), "(?=(?P<CchIII>CCCAAG))|(?=(?P<CchIII_as>CTTGGG))", None, 4096.0, 18, 26, 24815, 65, 37, 2, "NN", None, None, None, "CCCAAG", 6, "DNA", (), "https://identifiers.org/rebase:24815"),
+    ("CciI", (1, -1, None, None, "TCATGA"), "(?=(?P<CciI>TCATGA))", None, 4096.0, -1, 1, 17117, 65, 37, -4, "CATG", None, None, None, "TCATGA", 6, "DNA", ("I",), "https://identifiers.org/rebase:17117"),
+    ("CciNI", (2, -2, None, None, "GCGGCCGC"), "(?=(?P<CciNI>GCGGCCGC))", None, 65536.0, -2, 2, 2673, 65, 37, -4, "GGCC", None, None, None, "GCGGCCGC", 8, "DNA", ("I", "V"), "https://identifiers.org/rebase:2673"),
+    ("Cco11366VI", (None, None, None, None, "GAAGAA"), "(?=(?P<Cco11366VI>GAAGAA))|(?=(?P<Cco11366VI_as>TTCTTC))", None, 4096.0, None, None, 421822, 65, 37, None, None, None, None, None, "GAAGAA", 6, "DNA", (), "https://identifiers.org/rebase:421822"),
+    ("Cco11437V", (None, None, None, None, "CAYNNNNNRTAG"), "(?=(?P<Cco11437V>CA[CT].....[AG]TAG))|(?=(?P<Cco11437V_as>CTA[CT].....[AG]TG))", None, 4096.0, None, None, 423414, 65, 37, None, None, None, None, None, "CAYNNNNNRTAG", 12, "DNA", (), "https://identifiers.org/rebase:423414"),
+    ("Cco14983V", (None, None, None, None, "GGGTDA"), "(?=(?P<Cco14983V>GGGT[AGT]A))|(?=(?P<Cco14983V_as>T[ACT]ACCC))", None, 1365.3333333333333, None, None, 156213, 65, 37, None, None, None, None, None, "GGGTDA", 6, "DNA", (), "https://identifiers.org/rebase:156213"),
+    ("Cco14983VI", (None, None, None, None, "GCYGA"), "(?=(?P<Cco14983VI>GC[CT]GA))|(?=(?P<Cco14983VI_as>TC[AG]GC))", None, 512.0, None, None, 156209, 65, 37, None, None, None, None, None, "GCYGA", 5, "DNA", (), "https://identifiers.org/rebase:156209"),
+    ("CcrNAIII", (None, None, None, None, "CGACCAG"), "(?=(?P<CcrNAIII>CGACCAG))|(?=(?P<CcrNAIII_as>CTGGTCG))", None, 16384.0, None, None, 19984, 65, 37, None, None, None, None, None, "CGACCAG", 7, "DNA", (), "https://identifiers.org/rebase:19984"),
+    ("Cdi11397I", (None, None, None, None, "GCGCAG"), "(?=(?P<Cdi11397I>GCGCAG))|(?=(?P<Cdi11397I_as>CTGCGC))", None, 4096.0, None, None, 93952, 65, 37, None, None, None, None, None, "GCGCAG", 6, "DNA", (), "https://identifiers.org/rebase:93952"),
+    ("Cdi13746V", (None, None, None, None, "RGAAAGR"), "(?=(?P<Cdi13746V>[AG]GAAAG[AG]))|(?=(?P<Cdi13746V_as>[CT]CTTTC[CT]))", None, 4096.0, None, None, 422788, 65, 37, None, None, None, None, None, "RGAAAGR", 7, "DNA", (), "https://identifiers.org/rebase:422788"),
+    ("Cdi13750III", (None, None, None, None, "CCGATCC"), "(?=(?P<Cdi13750III>CCGATCC))|(?=(?P<Cdi13750III_as>GGATCGG))", None, 16384.0, None, None, 422822, 65, 37, None, None, None, None, None, "CCGATCC", 7, "DNA", (), "https://identifiers.org/rebase:422822"),
+    ("CdiI", (4, -1, None, None, "CATCG"), "(?=(?P<CdiI>CATCG))|(?=(?P<CdiI_as>CGATG))", None, 1024.0, -1, 4, 5297, 65, 37, 0, "", None, None, None, "CATCG", 5, "DNA", (), "https://identifiers.org/rebase:5297"),
+    ("CdpI", (26, 18, None, None, "GCGGAG"), "(?=(?P<CdpI>GCGGAG))|(?=(?P<CdpI_as>CTCCGC))", None, 4096.0, 18, 26, 14868, 65, 37, 2, "NN", None, None, None, "GCGGAG", 6, "DNA", (), "https://identifiers.org/rebase:14868"),
+    ("Cdu23823II", (None, None, None, None, "GTGAAG"), "(?=(?P<Cdu23823II>GTGAAG))|(?=(?P<Cdu23823II_as>CTTCAC))", None, 4096.0, None, None, 125956, 65, 37, None, None, None, None, None, "GTGAAG", 6, "DNA", (), "https://identifiers.org/rebase:125956"),
+    ("Cfa8380I", (None, None, None, None, "GRGGAY"), "(?=(?P<Cfa8380I>G[AG]GGA[CT]))|(?=(?P<Cfa8380I_as>[AG]TCC[CT]C))", None, 1024.0, None, None, 421896, 65, 37, None, None, None, None, None, "GRGGAY", 6, "DNA", (), "https://identifiers.org/rebase:421896"),
+    ("CfoI", (3, -3, None, None, "GCGC"), "(?=(?P<CfoI>GCGC))", None, 256.0, -3, 3, 654, 65, 37, 2, "CG", None, None, None, "GCGC", 4, "DNA", ("M", "R", "S"), "https://identifiers.org/rebase:654"),
+    ("Cfr10I", (1, -1, None, None, "RCCGGY"), "(?=(?P<Cfr10I>[AG]CCGG[CT]))", None, 1024.0, -1, 1, 655, 65, 37, -4, "CCGG", None, None, None, "RCCGGY", 6, "DNA", ("B", "K"), "https://identifiers.org/rebase:655"),
+    ("Cfr13I", (1, -1, None, None, "GGNCC"), "(?=(?P<Cfr13I>GG.CC))", None, 256.0, -1, 1, 657, 65, 37, -3, "GNC", None, None, None, "GGNCC", 5, "DNA", ("B",), "https://identifiers.org/rebase:657"),
+    ("Cfr42I", (4, -4, None, None, "CCGCGG"), "(?=(?P<Cfr42I>CCGCGG))", None, 4096.0, -4, 4, 678, 65, 37, 2, "GC", None, None, None, "CCGCGG", 6, "DNA", ("B",), "https://identifiers.org/rebase:678"),
+    ("Cfr9I", (1, -1, None, None, "CCCGGG"), "(?=(?P<Cfr9I>CCCGGG))", None, 4096.0, -1, 1, 699, 65, 37, -4, "CCGG", None, None, None, "CCCGGG", 6, "DNA", ("B",), "https://identifiers.org/rebase:699"),
+    ("CfrI", (1, -1, None, None, "YGGCCR"), "(?=(?P<CfrI>[CT]GGCC[AG]))", None, 1024.0, -1, 1, 702, 65, 37, -4, "GGCC", None, None, None, "YGGCCR", 6, "DNA", (), "https://identifiers.org/rebase:702"),
+    ("CfrMH13II", (None, None, None, None, "AGCANCC"), "(?=(?P<CfrMH13II>AGCA.CC))|(?=(?P<CfrMH13II_as>GG.TGCT))", None, 4096.0, None, None, 274395, 65, 37, None, None, None, None, None, "AGCANCC", 7, "DNA", (), "https://identifiers.org/rebase:274395"),
+    ("CfrMH16VI", (None, None, None, None, "CTAAAG"), "(?=(?P<CfrMH16VI>CTAAAG))|(?=(?P<CfrMH16VI_as>CTTTAG))", None, 4096.0, None, None, 274143, 65, 37, None, None, None, None, None, "CTAAAG", 6, "DNA", (), "https://identifiers.org/rebase:274143"),
+    ("Cfupf3II", (None, None, None, None, "GARCAG"), "(?=(?P<Cfupf3II>GA[AG]CAG))|(?=(?P<Cfupf3II_as>CTG[CT]TC))", None, 2048.0, None, None, 85269, 65, 37, None, None, None, None, None, "GARCAG", 6, "DNA", (), "https://identifiers.org/rebase:85269"),
+    ("Cgl13032I", (None, None, None, None, "GGCGCA"), "(?=(?P<Cgl13032I>GGCGCA))|(?=(?P<Cgl13032I_as>TGCGCC))", None, 4096.0, None, None, 47793, 65, 37, None, None, None, None, None, "GGCGCA", 6, "DNA", (), "https://identifiers.org/rebase:47793"),
+    ("Cgl13032II", (None, None, None, None, "ACGABGG"), "(?=(?P<Cgl13032II>ACGA[CGT]GG))|(?=(?P<Cgl13032II_as>CC[ACG]TCGT))", None, 5461.333333333333, None, None, 47799, 65, 37, None, None, None, None, None, "ACGABGG", 7, "DNA", (), "https://identifiers.org/rebase:47799"),
+    ("ChaI", (4, -4, None, None, "GATC"), "(?=(?P<ChaI>GATC))", None, 256.0, -4, 4, 2688, 65, 37, 4, "GATC", None, None, None, "GATC", 4, "DNA", (), "https://identifiers.org/rebase:2688"),
+    ("Cin11811I", (None, None, None, None, "TGKMCA"), "(?=(?P<Cin11811I>TG[GT][AC]CA))", None, 1024.0, None, None, 380986, 65, 37, None, None, None, None, None, "TGKMCA", 6, "DNA", (), "https://identifiers.org/rebase:380986"),
+    ("Cje265V", (None, None, None, None, "GKAAGC"), "(?=(?P<Cje265V>G[GT]AAGC))|(?=(?P<Cje265V_as>GCTT[AC]C))", None, 2048.0, None, None, 208512, 65, 37, None, None, None, None, None, "GKAAGC", 6, "DNA", (), "https://identifiers.org/rebase:208512"),
+    ("Cje54107III", (None, None, None, None, "GKAAYC"), "(?=(?P<Cje54107III>G[GT]AA[CT]C))|(?=(?P<Cje54107III_as>G[AG]TT[AC]C))", None, 1024.0, None, None, 244034, 65, 37, None, None, None, None, None, "GKAAYC", 6, "DNA", (), "https://identifiers.org/rebase:244034"),
+    ("CjeFIII", (None, None, None, None, "GCAAGG"), "(?=(?P<CjeFIII>GCAAGG))|(?=(?P<CjeFIII_as>CCTTGC))", None, 4096.0, None, None, 12350, 65, 37, None, None, None, None, None, "GCAAGG", 6, "DNA", (), "https://identifiers.org/rebase:12350"),
+    ("CjeFV", (None, None, None, None, "GGRCA"), "(?=(?P<CjeFV>GG[AG]CA))|(?=(?P<CjeFV_as>TG[CT]CC))", None, 512.0, None, None, 12351, 65, 37, None, None, None, None, None, "GGRCA", 5, "DNA", (), "https://identifiers.org/rebase:12351"),
+    ("CjeI", (-8, -25, 26, 9, "CCANNNNNNGT"), "(?=(?P<CjeI>CCA......GT))|(?=(?P<CjeI_as>AC......TGG))", None, 1024.0, -25, -8, 2466, 65, 37, 6, "NNNNNN", None, 9, 26, "CCANNNNNNGT", 11, "DNA", (), "https://identifiers.org/rebase:2466"),
+    ("CjeNII", (None, None, None, None, "GAGNNNNNGT"), "(?=(?P<CjeNII>GAG.....GT))|(?=(?P<CjeNII_as>AC.....CTC))", None, 1024.0, None, None, 4509, 65, 37, None, None, None, None, None, "GAGNNNNNGT", 10, "DNA", (), "https://identifiers.org/rebase:4509"),
+    ("CjeNIII", (25, 17, None, None, "GKAAYG"), "(?=(?P<CjeNIII>G[GT]AA[CT]G))|(?=(?P<CjeNIII_as>C[AG]TT[AC]C))", None, 1024.0, 17, 25, 4511, 65, 37, 2, "NN", None, None, None, "GKAAYG", 6, "DNA", (), "https://identifiers.org/rebase:4511"),
+    ("CjeNV", (None, None, None, None, "CCYGA"), "(?=(?P<CjeNV>CC[CT]GA))|(?=(?P<CjeNV_as>TC[AG]GG))", None, 512.0, None, None, 151041, 65, 37, None, None, None, None, None, "CCYGA", 5, "DNA", (), "https://identifiers.org/rebase:151041"),
+    ("CjeP659IV", (None, None, None, None, "CACNNNNNNNGAA"), "(?=(?P<CjeP659IV>CAC.......GAA))|(?=(?P<CjeP659IV_as>TTC.......GTG))", None, 4096.0, None, None, 28974, 65, 37, None, None, None, None, None, "CACNNNNNNNGAA", 13, "DNA", (), "https://identifiers.org/rebase:28974"),
+    ("CjePI", (-7, -25, 26, 8, "CCANNNNNNNTC"), "(?=(?P<CjePI>CCA.......TC))|(?=(?P<CjePI_as>GA.......TGG))", None, 1024.0, -25, -7, 2467, 65, 37, 6, "NNNNNN", None, 8, 26, "CCANNNNNNNTC", 12, "DNA", (), "https://identifiers.org/rebase:2467"),
+    ("CjuI", (None, None, None, None, "CAYNNNNNRTG"), "(?=(?P<CjuI>CA[CT].....[AG]TG))", None, 1024.0, None, None, 10921, 65, 37, None, None, None, None, None, "CAYNNNNNRTG", 11, "DNA", (), "https://identifiers.org/rebase:10921"),
+    ("CjuII", (None, None, None, None, "CAYNNNNNCTC"), "(?=(?P<CjuII>CA[CT].....CTC))|(?=(?P<CjuII_as>GAG.....[AG]TG))", None, 2048.0, None, None, 11659, 65, 37, None, None, None, None, None, "CAYNNNNNCTC", 11, "DNA", (), "https://identifiers.org/rebase:11659"),
+    ("Cko11077IV", (None, None, None, None, "TGACAG"), "(?=(?P<Cko11077IV>TGACAG))|(?=(?P<Cko11077IV_as>CTGTCA))", None, 4096.0, None, None, 422663, 65, 37, None, None, None, None, None, "TGACAG", 6, "DNA", (), "https://identifiers.org/rebase:422663"),
+    ("Cla11845III", (None, None, None, None, "GCGAA"), "(?=(?P<Cla11845III>GCGAA))|(?=(?P<Cla11845III_as>TTCGC))", None, 1024.0, None, None, 101409, 65, 37, None, None, None, None, None, "GCGAA", 5, "DNA", (), "https://identifiers.org/rebase:101409"),
+    ("ClaI", (2, -2, None, None, "ATCGAT"), "(?=(?P<ClaI>ATCGAT))", None, 4096.0, -2, 2, 716, 65, 37, -2, "CG", None, None, None, "ATCGAT", 6, "DNA", ("B", "K", "M", "N", "Q", "R", "S", "X"), "https://identifiers.org/rebase:716"),
+    ("Cly7489II", (None, None, None, None, "AAAAGRG"), "(?=(?P<Cly7489II>AAAAG[AG]G))|(?=(?P<Cly7489II_as>C[CT]CTTTT))", None, 8192.0, None, None, 33132, 65, 37, None, None, None, None, None, "AAAAGRG", 7, "DNA", (), "https://identifiers.org/rebase:33132"),
+    ("Cpe10578V", (None, None, None, None, "GANGAGY"), "(?=(?P<Cpe10578V>GA.GAG[CT]))|(?=(?P<Cpe10578V_as>[AG]CTC.TC))", None, 2048.0, None, None, 422833, 65, 37, None, None, None, None, None, "GANGAGY", 7, "DNA", (), "https://identifiers.org/rebase:422833"),
+    ("Cpe13170II", (None, None, None, None, "GTTGNAG"), "(?=(?P<Cpe13170II>GTTG.AG))|(?=(?P<Cpe13170II_as>CT.CAAC))", None, 4096.0, None, None, 253771, 65, 37, None, None, None, None, None, "GTTGNAG", 7, "DNA", (), "https://identifiers.org/rebase:253771"),
+    ("Cpe2837III", (None, None, None, None, "GRNACAYT"), "(?=(?P<Cpe2837III>G[AG].ACA[CT]T))|(?=(?P<Cpe2837III_as>A[AG]TGT.[CT]C))", None, 4096.0, None, None, 253794, 65, 37, None, None, None, None, None, "GRNACAYT", 8, "DNA", (), "https://identifiers.org/rebase:253794"),
+    ("CpoI", (2, -2, None, None, "CGGWCCG"), "(?=(?P<CpoI>CGG[AT]CCG))", None, 8192.0, -2, 2, 731, 65, 37, -3, "GWC", None, None, None, "CGGWCCG", 7, "DNA", ("B", "K"), "https://identifiers.org/rebase:731"),
+    ("Cre7908I", (None, None, None, None, "GCGGGA"), "(?=(?P<Cre7908I>GCGGGA))|(?=(?P<Cre7908I_as>TCCCGC))", None, 4096.0, None, None, 253772, 65, 37, None, None, None, None, None, "GCGGGA", 6, "DNA", (), "https://identifiers.org/rebase:253772"),
+    ("Csa9238II", (None, None, None, None, "CAAANTC"), "(?=(?P<Csa9238II>CAAA.TC))|(?=(?P<Csa9238II_as>GA.TTTG))", None, 4096.0, None, None, 429683, 65, 37, None, None, None, None, None, "CAAANTC", 7, "DNA", (), "https://identifiers.org/rebase:429683"),
+    ("CseI", (10, 10, None, None, "GACGC"), "(?=(?P<CseI>GACGC))|(?=(?P<CseI_as>GCGTC))", None, 1024.0, 10, 10, 10691, 65, 37, -5, "NNNNN", None, None, None, "GACGC", 5, "DNA", ("B",), "https://identifiers.org/rebase:10691"),
+    ("CsiI", (1, -1, None, None, "ACCWGGT"), "(?=(?P<CsiI>ACC[AT]GGT))", None, 8192.0, -1, 1, 17997, 65, 37, -5, "CCWGG", None, None, None, "ACCWGGT", 7, "DNA", ("B",), "https://identifiers.org/rebase:17997"),
+    ("Csp2014I", (None, None, None, None, "GGAGGC"), "(?=(?P<Csp2014I>GGAGGC))|(?=(?P<Csp2014I_as>GCCTCC))", None, 4096.0, None, None, 96077, 65, 37, None, None, None, None, None, "GGAGGC", 6, "DNA", (), "https://identifiers.org/rebase:96077"),
+    ("Csp6I", (1, -1, None, None, "GTAC"), "(?=(?P<Csp6I>GTAC))", None, 256.0, -1, 1, 738, 65, 37, -2, "TA", None, None, None, "GTAC", 4, "DNA", ("B",), "https://identifiers.org/rebase:738"),
+    ("CspAI", (1, -1, None, None, "ACCGGT"), "(?=(?P<CspAI>ACCGGT))", None, 4096.0, -1, 1, 2770, 65, 37, -4, "CCGG", None, None, None, "ACCGGT", 6, "DNA", ("C",), "https://identifiers.org/rebase:2770"),
+    ("CspBP25III", (None, None, None, None, "CCANNNNNRTGA"), "(?=(?P<CspBP25III>CCA.....[AG]TGA))|(?=(?P<CspBP25III_as>TCA[CT].....TGG))", None, 8192.0, None, None, 618871, 65, 37, None, None, None, None, None, "CCANNNNNRTGA", 12, "DNA", (), "https://identifiers.org/rebase:618871"),
+    ("CspCI", (-11, -25, 24, 10, "CAANNNNNGTGG"), "(?=(?P<CspCI>CAA.....GTGG))|(?=(?P<CspCI_as>CCAC.....TTG))", None, 16384.0, -25, -11, 5047, 65, 37, 2, "NN", None, 10, 24, "CAANNNNNGTGG", 12, "DNA", ("N",), "https://identifiers.org/rebase:5047"),
+    ("CspI", (2, -2, None, None, "CGGWCCG"), "(?=(?P<CspI>CGG[AT]CCG))", None, 8192.0, -2, 2, 739, 65, 37, -3, "GWC", None, None, None, "CGGWCCG", 7, "DNA", ("R",), "https://identifiers.org/rebase:739"),
+    ("CspL61I", (None, None, None, None, "TYGAYCT"), "(?=(?P<CspL61I>T[CT]GA[CT]CT))|(?=(?P<CspL61I_as>AG[AG]TC[AG]A))", None, 4096.0, None, None, 501298, 65, 37, None, None, None, None, None, "TYGAYCT", 7, "DNA", (), "https://identifiers.org/rebase:501298"),
+    ("CspX1II", (None, None, None, None, "ACCCCA"), "(?=(?P<CspX1II>ACCCCA))|(?=(?P<CspX1II_as>TGGGGT))", None, 4096.0, None, None, 618749, 65, 37, None, None, None, None, None, "ACCCCA", 6, "DNA", (), "https://identifiers.org/rebase:618749"),
+    ("CstMI", (26, 18, None, None, "AAGGAG"), "(?=(?P<CstMI>AAGGAG))|(?=(?P<CstMI_as>CTCCTT))", None, 4096.0, 18, 26, 7165, 65, 37, 2, "NN", None, None, None, "AAGGAG", 6, "DNA", (), "https://identifiers.org/rebase:7165"),
+    ("CviAII", (1, -1, None, None, "CATG"), "(?=(?P<CviAII>CATG))", None, 256.0, -1, 1, 2211, 65, 37, -2, "AT", None, None, None, "CATG", 4, "DNA", ("N",), "https://identifiers.org/rebase:2211"),
+    ("CviJI", (2, -2, None, None, "RGCY"), "(?=(?P<CviJI>[AG]GC[CT]))", None, 64.0, -2, 2, 760, 65, 37, 0, "", None, None, None, "RGCY", 4, "DNA", ("Q", "X"), "https://identifiers.org/rebase:760"),
+    ("CviKI_1", (2, -2, None, None, "RGCY"), "(?=(?P<CviKI_1>[AG]GC[CT]))", None, 64.0, -2, 2, None, 65, 37, 0, "", None, None, None, "RGCY", 4, "DNA", ("N",), None),
+    ("CviQI", (1, -1, None, None, "GTAC"), "(?=(?P<CviQI>GTAC))", None, 256.0, -1, 1, 766, 65, 37, -2, "TA", None, None, None, "GTAC", 4, "DNA", ("N",), "https://identifiers.org/rebase:766"),
+    ("CviRI", (2, -2, None, None, "TGCA"), "(?=(?P<CviRI>TGCA))", None, 256.0, -2, 2, 767, 65, 37, 0, "", None, None, None, "TGCA", 4, "DNA", (), "https://identifiers.org/rebase:767"),
+    ("Dde51507I", (None, None, None, None, "CCWGG"), "(?=(?P<Dde51507I>CC[AT]GG))", None, 512.0, None, None, 43352, 65, 37, None, None, None, None, None, "CCWGG", 5, "DNA", (), "https://identifiers.org/rebase:43352"),
+    ("DdeI", (1, -1, None, None, "CTNAG"), "(?=(?P<DdeI>CT.AG))", None, 256.0, -1, 1, 770, 65, 37, -3, "TNA", None, None, None, "CTNAG", 5, "DNA", ("K", "M", "N", "O", "Q", "R", "S", "X"), "https://identifiers.org/rebase:770"),
+    ("DinI", (3, -3, None, None, "GGCGCC"), "(?=(?P<DinI>GGCGCC))", None, 4096.0, -3, 3, 11070, 65, 37, 0, "", None, None, None, "GGCGCC", 6, "DNA", ("V",), "https://identifiers.org/rebase:11070"),
+    ("Dpi3069I", (None, None, None, None, "GACAG"), "(?=(?P<Dpi3069I>GACAG))|(?=(?P<Dpi3069I_as>CTGTC))", None, 1024.0, None, None, 317442, 65, 37, None, None, None, None, None, "GACAG", 5, "DNA", (), "https://identifiers.org/rebase:317442"),
+    ("Dpi3084I", (None, None, None, None, "CGRAG"), "(?=(?P<Dpi3084I>CG[AG]AG))|(?=(?P<Dpi3084I_as>CT[CT]CG))", None, 512.0, None, None, 271821, 65, 37, None, None, None, None, None, "CGRAG", 5, "DNA", (), "https://identifiers.org/rebase:271821"),
+    ("Dpi3090II", (None, None, None, None, "AAGRAG"), "(?=(?P<Dpi3090II>AAG[AG]AG))|(?=(?P<Dpi3090II_as>CT[CT]CTT))", None, 2048.0, None, None, 271629, 65, 37, None, None, None, None, None, "AAGRAG", 6, "DNA", (), "https://identifiers.org/rebase:271629"),
+    ("DpnI", (2, -2, None, None, "GATC"), "(?=(?P<DpnI>GATC))", None, 256.0, -2, 2, 776, 65, 37, 0, "", None, None, None, "GATC", 4, "DNA", ("B", "E", "K", "M", "N", "O", "Q", "R", "S", "X"), "https://identifiers.org/rebase:776"),
+    ("DpnII", (0, 0, None, None, "GATC"), "(?=(?P<DpnII>GATC))", None, 256.0, 0, 0, 777, 65, 37, -4, "GATC", None, None, None, "GATC", 4, "DNA", ("N",), "https://identifiers.org/rebase:777"),
+    ("DraI", (3, -3, None, None, "TTTAAA"), "(?=(?P<DraI>TTTAAA))", None, 4096.0, -3, 3, 778, 65, 37, 0, "", None, None, None, "TTTAAA", 6, "DNA", ("B", "I", "J", "K", "M", "N", "Q", "S", "V", "X"), "https://identifiers.org/rebase:778"),
+    ("DraII", (2, -2, None, None, "RGGNCCY"), "(?=(?P<DraII>[AG]GG.CC[CT]))", None, 1024.0, -2, 2, 779, 65, 37, -3, "GNC", None, None, None, "RGGNCCY", 7, "DNA", (), "https://identifiers.org/rebase:779"),
+    ("DraIII", (6, -6, None, None, "CACNNNGTG"), "(?=(?P<DraIII>CAC...GTG))", None, 4096.0, -6, 6, 780, 65, 37, 3, "NNN", None, None, None, "CACNNNGTG", 9, "DNA", ("I", "M", "N", "V"), "https://identifiers.org/rebase:780"),
+    ("DraRI", (27, 18, None, None, "CAAGNAC"), "(?=(?P<DraRI>CAAG.AC))|(?=(?P<DraRI_as>GT.CTTG))", None, 4096.0, 18, 27, 13702, 65, 37, 2, "NN", None, None, None, "CAAGNAC", 7, "DNA", (), "https://identifiers.org/rebase:13702"),
+    ("DrdI", (7, -7, None, None, "GACNNNNNNGTC"), "(?=(?P<DrdI>GAC......GTC))", None, 4096.0, -7, 7, 787, 65, 37, 2, "NN", None, None, None, "GACNNNNNNGTC", 12, "DNA", ("N",), "https://identifiers.org/rebase:787"),
+    ("DrdII", (None, None, None, None, "GAACCA"), "(?=(?P<DrdII>GAACCA))|(?=(?P<DrdII_as>TGGTTC))", None, 4096.0, None, None, 788, 65, 37, None, None, None, None, None, "GAACCA", 6, "DNA", (), "https://identifiers.org/rebase:788"),
+    ("DrdIV", (26, 18, None, None, "TACGAC"), "(?=(?P<DrdIV>TACGAC))|(?=(?P<DrdIV_as>GTCGTA))", None, 4096.0, 18, 26, 15492, 65, 37, 2, "NN", None, None, None, "TACGAC", 6, "DNA", (), "https://identifiers.org/rebase:15492"),
+    ("DrdV", (17, 8, None, None, "CATGNAC"), "(?=(?P<DrdV>CATG.AC))|(?=(?P<DrdV_as>GT.CATG))", None, 4096.0, 8, 17, 21570, 65, 37, 2, "NN", None, None, None, "CATGNAC", 7, "DNA", (), "https://identifiers.org/rebase:21570"),
+    ("DrdVI", (None, None, None, None, "GCAGCC"), "(?=(?P<DrdVI>GCAGCC))|(?=(?P<DrdVI_as>GGCTGC))", None, 4096.0, None, None, 33637, 65, 37, None, None, None, None, None, "GCAGCC", 6, "DNA", (), "https://identifiers.org/rebase:33637"),
+    ("DrdVIII", (None, None, None, None, "ARGAGC"), "(?=(?P<DrdVIII>A[AG]GAGC))|(?=(?P<DrdVIII_as>GCTC[CT]T))", None, 2048.0, None, None, 60181, 65, 37, None, None, None, None, None, "ARGAGC", 6, "DNA", (), "https://identifiers.org/rebase:60181"),
+    ("DriI", (6, -6, None, None, "GACNNNNNGTC"), "(?=(?P<DriI>GAC.....GTC))", None, 4096.0, -6, 6, 7493, 65, 37, 1, "N", None, None, None, "GACNNNNNGTC", 11, "DNA", ("I",), "https://identifiers.org/rebase:7493"),
+    ("DsaI", (1, -1, None, None, "CCRYGG"), "(?=(?P<DsaI>CC[AG][CT]GG))", None, 1024.0, -1, 1, 790, 65, 37, -4, "CRYG", None, None, None, "CCRYGG", 6, "DNA", (), "https://identifiers.org/rebase:790"),
+    ("DseDI", (7, -7, None, None, "GACNNNNNNGTC"), "(?=(?P<DseDI>GAC......GTC))", None, 4096.0, -7, 7, 2859, 65, 37, 2, "NN", None, None, None, "GACNNNNNNGTC", 12, "DNA", ("I", "V"), "https://identifiers.org/rebase:2859"),
+    ("DspS02II", (None, None, None, None, "TGCCGAC"), "(?=(?P<DspS02II>TGCCGAC))|(?=(?P<DspS02II_as>GTCGGCA))", None, 16384.0, None, None, 451105, 65, 37, None, None, None, None, None, "TGCCGAC", 7, "DNA", (), "https://identifiers.org/rebase:451105"),
+    ("DvuIII", (None, None, None, None, "CACNCAC"), "(?=(?P<DvuIII>CAC.CAC))|(?=(?P<DvuIII_as>GTG.GTG))", None, 4096.0, None, None, 7926, 65, 37, None, None, None, None, None, "CACNCAC", 7, "DNA", (), "https://identifiers.org/rebase:7926"),
+    ("EaeI", (1, -1, None, None, "YGGCCR"), "(?=(?P<EaeI>[CT]GGCC[AG]))", None, 1024.0, -1, 1, 800, 65, 37, -4, "GGCC", None, None, None, "YGGCCR", 6, "DNA", ("K", "N"), "https://identifiers.org/rebase:800"),
+    ("EagI", (1, -1, None, None, "CGGCCG"), "(?=(?P<EagI>CGGCCG))", None, 4096.0, -1, 1, 802, 65, 37, -4, "GGCC", None, None, None, "CGGCCG", 6, "DNA", ("N",), "https://identifiers.org/rebase:802"),
+    ("Eam1104I", (7, 4, None, None, "CTCTTC"), "(?=(?P<Eam1104I>CTCTTC))|(?=(?P<Eam1104I_as>GAAGAG))", None, 4096.0, 4, 7, 805, 65, 37, -3, "NNN", None, None, None, "CTCTTC", 6, "DNA", ("B",), "https://identifiers.org/rebase:805"),
+    ("Eam1105I", (6, -6, None, None, "GACNNNNNGTC"), "(?=(?P<Eam1105I>GAC.....GTC))", None, 4096.0, -6, 6, 806, 65, 37, 1, "N", None, None, None, "GACNNNNNGTC", 11, "DNA", ("B",), "https://identifiers.org/rebase:806"),
+    ("EarI", (7, 4, None, None, "CTCTTC"), "(?=(?P<EarI>CTCTTC))|(?=(?P<EarI_as>GAAGAG))", None, 4096.0, 4, 7, 807, 65, 37, -3, "NNN", None, None, None, "CTCTTC", 6, "DNA", ("N",), "https://identifiers.org/rebase:807"),
+    ("EciI", (17, 9, None, None, "GGCGGA"), "(?=(?P<EciI>GGCGGA))|(?=(?P<EciI_as>TCCGCC))", None, 4096.0, 9, 17, 817, 65, 37, 2, "NN", None, None, None, "GGCGGA", 6, "DNA", ("N",), "https://identifiers.org/rebase:817"),
+    ("Ecl136II", (3, -3, None, None, "GAGCTC"), "(?=(?P<Ecl136II>GAGCTC))", None, 4096.0, -3, 3, 820, 65, 37, 0, "", None, None, None, "GAGCTC", 6, "DNA", ("B",), "https://identifiers.org/rebase:820"),
+    ("Ecl234I", (None, None, None, None, "CGGNAAG"), "(?=(?P<Ecl234I>CGG.AAG))|(?=(?P<Ecl234I_as>CTT.CCG))", None, 4096.0, None, None, 251717, 65, 37, None, None, None, None, None, "CGGNAAG", 7, "DNA", (), "https://identifiers.org/rebase:251717"),
+    ("Ecl35734I", (None, None, None, None, "GAAAYTC"), "(?=(?P<Ecl35734I>GAAA[CT]TC))|(?=(?P<Ecl35734I_as>GA[AG]TTTC))", None, 8192.0, None, None, 102089, 65, 37, None, None, None, None, None, "GAAAYTC", 7, "DNA", (), "https://identifiers.org/rebase:102089"),
+    ("EclXI", (1, -1, None, None, "CGGCCG"), "(?=(?P<EclXI>CGGCCG))", None, 4096.0, -1, 1, 834, 65, 37, -4, "GGCC", None, None, None, "CGGCCG", 6, "DNA", ("S",), "https://identifiers.org/rebase:834"),
+    ("Eco105I", (3, -3, None, None, "TACGTA"), "(?=(?P<Eco105I>TACGTA))", None, 4096.0, -3, 3, 838, 65, 37, 0, "", None, None, None, "TACGTA", 6, "DNA", ("B",), "https://identifiers.org/rebase:838"),
+    ("Eco130I", (1, -1, None, None, "CCWWGG"), "(?=(?P<Eco130I>CC[AT][AT]GG))", None, 1024.0, -1, 1, 849, 65, 37, -4, "CWWG", None, None, None, "CCWWGG", 6, "DNA", ("B",), "https://identifiers.org/rebase:849"),
+    ("Eco147I", (3, -3, None, None, "AGGCCT"), "(?=(?P<Eco147I>AGGCCT))", None, 4096.0, -3, 3, 853, 65, 37, 0, "", None, None, None, "AGGCCT", 6, "DNA", ("B",), "https://identifiers.org/rebase:853"),
+    ("Eco1836I", (None, None, None, None, "CACANTT"), "(?=(?P<Eco1836I>CACA.TT))|(?=(?P<Eco1836I_as>AA.TGTG))", None, 4096.0, None, None, 462575, 65, 37, None, None, None, None, None, "CACANTT", 7, "DNA", (), "https://identifiers.org/rebase:462575"),
+    ("Eco24I", (5, -5, None, None, "GRGCYC"), "(?=(?P<Eco24I>G[AG]GC[CT]C))", None, 1024.0, -5, 5, 910, 65, 37, 4, "RGCY", None, None, None, "GRGCYC", 6, "DNA", ("B",), "https://identifiers.org/rebase:910"),
+    ("Eco31I", (7, 5, None, None, "GGTCTC"), "(?=(?P<Eco31I>GGTCTC))|(?=(?P<Eco31I_as>GAGACC))", None, 4096.0, 5, 7, 921, 65, 37, -4, "NNNN", None, None, None, "GGTCTC", 6, "DNA", ("B",), "https://identifiers.org/rebase:921"),
+    ("Eco32I", (3, -3, None, None, "GATATC"), "(?=(?P<Eco32I>GATATC))", None, 4096.0, -3, 3, 922, 65, 37, 0, "", None, None, None, "GATATC", 6, "DNA", ("B",), "https://identifiers.org/rebase:922"),
+    ("Eco4174I", (None, None, None, None, "GCACAG"), "(?=(?P<Eco4174I>GCACAG))|(?=(?P<Eco4174I_as>CTGTGC))", None, 4096.0, None, None, 433432, 65, 37, None, None, None, None, None, "GCACAG", 6, "DNA", (), "https://identifiers.org/rebase:433432"),
+    ("Eco43896II", (None, None, None, None, "CRARCAG"), "(?=(?P<Eco43896II>C[AG]A[AG]CAG))|(?=(?P<Eco43896II_as>CTG[CT]T[CT]G))", None, 4096.0, None, None, 219464, 65, 37, None, None, None, None, None, "CRARCAG", 7, "DNA", (), "https://identifiers.org/rebase:219464"),
+    ("Eco4465II", (None, None, None, None, "GAAABCC"), "(?=(?P<Eco4465II>GAAA[CGT]CC))|(?=(?P<Eco4465II_as>GG[ACG]TTTC))", None, 5461.333333333333, None, None, 148173, 65, 37, None, None, None, None, None, "GAAABCC", 7, "DNA", (), "https://identifiers.org/rebase:148173"),
+    ("Eco47I", (1, -1, None, None, "GGWCC"), "(?=(?P<Eco47I>GG[AT]CC))", None, 512.0, -1, 1, 930, 65, 37, -3, "GWC", None, None, None, "GGWCC", 5, "DNA", ("B",), "https://identifiers.org/rebase:930"),
+    ("Eco47III", (3, -3, None, None, "AGCGCT"), "(?=(?P<Eco47III>AGCGCT))", None, 4096.0, -3, 3, 932, 65, 37, 0, "", None, None, None, "AGCGCT", 6, "DNA", ("B", "M", "S"), "https://identifiers.org/rebase:932"),
+    ("Eco52I", (1, -1, None, None, "CGGCCG"), "(?=(?P<Eco52I>CGGCCG))", None, 4096.0, -1, 1, 938, 65, 37, -4, "GGCC", None, None, None, "CGGCCG", 6, "DNA", ("B", "K"), "https://identifiers.org/rebase:938"),
+    ("Eco53kI", (3, -3, None, None, "GAGCTC"), "(?=(?P<Eco53kI>GAGCTC))", None, 4096.0, -3, 3, 3177, 65, 37, 0, "", None, None, None, "GAGCTC", 6, "DNA", ("N",), "https://identifiers.org/rebase:3177"),
+    ("Eco57I", (22, 14, None, None, "CTGAAG"), "(?=(?P<Eco57I>CTGAAG))|(?=(?P<Eco57I_as>CTTCAG))", None, 4096.0, 14, 22, 941, 65, 37, 2, "NN", None, None, None, "CTGAAG", 6, "DNA", ("B",), "https://identifiers.org/rebase:941"),
+    ("Eco57MI", (22, 14, None, None, "CTGRAG"), "(?=(?P<Eco57MI>CTG[AG]AG))|(?=(?P<Eco57MI_as>CT[CT]CAG))", None, 2048.0, 14, 22, 5034, 65, 37, 2, "NN", None, None, None, "CTGRAG", 6, "DNA", (), "https://identifiers.org/rebase:5034"),
+    ("Eco72I", (3, -3, None, None, "CACGTG"), "(?=(?P<Eco72I>CACGTG))", None, 4096.0, -3, 3, 950, 65, 37, 0, "", None, None, None, "CACGTG", 6, "DNA", ("B",), "https://identifiers.org/rebase:950"),
+    ("Eco8164I", (None, None, None, None, "GCCKAG"), "(?=(?P<Eco8164I>GCC[GT]AG))|(?=(?P<Eco8164I_as>CT[AC]GGC))", None, 2048.0, None, None, 433405, 65, 37, None, None, None, None, None, "GCCKAG", 6, "DNA", (), "https://identifiers.org/rebase:433405"),
+    ("Eco81I", (2, -2, None, None, "CCTNAGG"), "(?=(?P<Eco81I>CCT.AGG))", None, 4096.0, -2, 2, 954, 65, 37, -3, "TNA", None, None, None, "CCTNAGG", 7, "DNA", ("B", "K"), "https://identifiers.org/rebase:954"),
+    ("Eco88I", (1, -1, None, None, "CYCGRG"), "(?=(?P<Eco88I>C[CT]CG[AG]G))", None, 1024.0, -1, 1, 958, 65, 37, -4, "YCGR", None, None, None, "CYCGRG", 6, "DNA", ("B",), "https://identifiers.org/rebase:958"),
+    ("Eco9009II", (None, None, None, None, "GAAANTC"), "(?=(?P<Eco9009II>GAAA.TC))|(?=(?P<Eco9009II_as>GA.TTTC))", None, 4096.0, None, None, 434595, 65, 37, None, None, None, None, None, "GAAANTC", 7, "DNA", (), "https://identifiers.org/rebase:434595"),
+    ("Eco9020I", (None, None, None, None, "CGAABTT"), "(?=(?P<Eco9020I>CGAA[CGT]TT))|(?=(?P<Eco9020I_as>AA[ACG]TTCG))", None, 5461.333333333333, None, None, 434674, 65, 37, None, None, None, None, None, "CGAABTT", 7, "DNA", (), "https://identifiers.org/rebase:434674"),
+    ("Eco9035I", (None, None, None, None, "GGGANTT"), "(?=(?P<Eco9035I>GGGA.TT))|(?=(?P<Eco9035I_as>AA.TCCC))", None, 4096.0, None, None, 434664, 65, 37, None, None, None, None, None, "GGGANTT", 7, "DNA", (), "https://identifiers.org/rebase:434664"),
+    ("Eco91I", (1, -1, None, None, "GGTNACC"), "(?=(?P<Eco91I>GGT.ACC))", None, 4096.0, -1, 1, 960, 65, 37, -5, "GTNAC", None, None, None, "GGTNACC", 7, "DNA", ("B",), "https://identifiers.org/rebase:960"),
+    ("Eco9699II", (None, None, None, None, "TAGARC"), "(?=(?P<Eco9699II>TAGA[AG]C))|(?=(?P<Eco9699II_as>G[CT]TCTA))", None, 2048.0, None, None, 286445, 65, 37, None, None, None, None, None, "TAGARC", 6, "DNA", (), "https://identifiers.org/rebase:286445"),
+    ("EcoBLMcrX", (2, -2, None, None, "RCSRC"), "(?=(?P<EcoBLMcrX>[AG]C[CG][AG]C))|(?=(?P<EcoBLMcrX_as>G[CT][CG]G[CT]))", None, 128.0, -2, 2, 134473, 65, 37, -1, "S", None, None, None, "RCSRC", 5, "DNA", (), "https://identifiers.org/rebase:134473"),
+    ("EcoE1140I", (None, None, None, None, "ACCYAC"), "(?=(?P<EcoE1140I>ACC[CT]AC))|(?=(?P<EcoE1140I_as>GT[AG]GGT))", None, 2048.0, None, None, 96234, 65, 37, None, None, None, None, None, "ACCYAC", 6, "DNA", (), "https://identifiers.org/rebase:96234"),
+    ("EcoHI", (0, 0, None, None, "CCSGG"), "(?=(?P<EcoHI>CC[CG]GG))", None, 512.0, 0, 0, 978, 65, 37, -5, "CCSGG", None, None, None, "CCSGG", 5, "DNA", (), "https://identifiers.org/rebase:978"),
+    ("EcoHSI", (None, None, None, None, "GGTAAG"), "(?=(?P<EcoHSI>GGTAAG))|(?=(?P<EcoHSI_as>CTTACC))", None, 4096.0, None, None, 16127, 65, 37, None, None, None, None, None, "GGTAAG", 6, "DNA", (), "https://identifiers.org/rebase:16127"),
+    ("EcoICRI", (3, -3, None, None, "GAGCTC"), "(?=(?P<EcoICRI>GAGCTC))", None, 4096.0, -3, 3, 979, 65, 37, 0, "", None, None, None, "GAGCTC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:979"),
+    ("EcoMVII", (None, None, None, None, "CANCATC"), "(?=(?P<EcoMVII>CA.CATC))|(?=(?P<EcoMVII_as>GATG.TG))", None, 4096.0, None, None, 87918, 65, 37, None, None, None, None, None, "CANCATC", 7, "DNA", (), "https://identifiers.org/rebase:87918"),
+    ("EcoNI", (5, -5, None, None, "CCTNNNNNAGG"), "(?=(?P<EcoNI>CCT.....AGG))", None, 4096.0, -5, 5, 981, 65, 37, -1, "N", None, None, None, "CCTNNNNNAGG", 11, "DNA", ("N",), "https://identifiers.org/rebase:981"),
+    ("EcoNIH6II", (None, None, None, None, "ATGAAG"), "(?=(?P<EcoNIH6II>ATGAAG))|(?=(?P<EcoNIH6II_as>CTTCAT))", None, 4096.0, None, None, 231661, 65, 37, None, None, None, None, None, "ATGAAG", 6, "DNA", (), "https://identifiers.org/rebase:231661"),
+    ("EcoO109I", (2, -2, None, None, "RGGNCCY"), "(?=(?P<EcoO109I>[AG]GG.CC[CT]))", None, 1024.0, -2, 2, 982, 65, 37, -3, "GNC", None, None, None, "RGGNCCY", 7, "DNA", ("B", "J", "K", "N"), "https://identifiers.org/rebase:982"),
+    ("EcoO157SI", (15, 12, None, None, "C"), "(?=(?P<EcoO157SI>C))|(?=(?P<EcoO157SI_as>G))", None, 4.0, 12, 15, 101311, 65, 37, 2, "NN", None, None, None, "C", 1, "DNA", (), "https://identifiers.org/rebase:101311"),
+    ("EcoO65I", (1, -1, None, None, "GGTNACC"), "(?=(?P<EcoO65I>GGT.ACC))", None, 4096.0, -1, 1, 986, 65, 37, -5, "GTNAC", None, None, None, "GGTNACC", 7, "DNA", ("K",), "https://identifiers.org/rebase:986"),
+    ("EcoRI", (1, -1, None, None, "GAATTC"), "(?=(?P<EcoRI>GAATTC))", None, 4096.0, -1, 1, 993, 65, 37, -4, "AATT", None, None, None, "GAATTC", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"), "https://identifiers.org/rebase:993"),
+    ("EcoRII", (0, 0, None, None, "CCWGG"), "(?=(?P<EcoRII>CC[AT]GG))", None, 512.0, 0, 0, 994, 65, 37, -5, "CCWGG", None, None, None, "CCWGG", 5, "DNA", ("B", "J"), "https://identifiers.org/rebase:994"),
+    ("EcoRV", (3, -3, None, None, "GATATC"), "(?=(?P<EcoRV>GATATC))", None, 4096.0, -3, 3, 995, 65, 37, 0, "", None, None, None, "GATATC", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X"), "https://identifiers.org/rebase:995"),
+    ("EcoT14I", (1, -1, None, None, "CCWWGG"), "(?=(?P<EcoT14I>CC[AT][AT]GG))", None, 1024.0, -1, 1, 997, 65, 37, -4, "CWWG", None, None, None, "CCWWGG", 6, "DNA", ("K",), "https://identifiers.org/rebase:997"),
+    ("EcoT22I", (5, -5, None, None, "ATGCAT"), "(?=(?P<EcoT22I>ATGCAT))", None, 4096.0, -5, 5, 998, 65, 37, 4, "TGCA", None, None, None, "ATGCAT", 6, "DNA", ("B", "K"), "https://identifiers.org/rebase:998"),
+    ("EcoT38I", (5, -5, None, None, "GRGCYC"), "(?=(?P<EcoT38I>G[AG]GC[CT]C))", None, 1024.0, -5, 5, 999, 65, 37, 4, "RGCY", None, None, None, "GRGCYC", 6, "DNA", ("J",), "https://identifiers.org/rebase:999"),
+    ("EgeI", (3, -3, None, None, "GGCGCC"), "(?=(?P<EgeI>GGCGCC))", None, 4096.0, -3, 3, 2858, 65, 37, 0, "", None, None, None, "GGCGCC", 6, "DNA", ("I",), "https://identifiers.org/rebase:2858"),
+    ("EheI", (3, -3, None, None, "GGCGCC"), "(?=(?P<EheI>GGCGCC))", None, 4096.0, -3, 3, 1004, 65, 37, 0, "", None, None, None, "GGCGCC", 6, "DNA", ("B",), "https://identifiers.org/rebase:1004"),
+    ("Ehi46392I", (None, None, None, None, "CCCNNAG"), "(?=(?P<Ehi46392I>CCC..AG))|(?=(?P<Ehi46392I_as>CT..GGG))", None, 1024.0, None, None, 430001, 65, 37, None, None, None, None, None, "CCCNNAG", 7, "DNA", (), "https://identifiers.org/rebase:430001"),
+    ("Eli8509II", (None, None, None, None, "CCGGAG"), "(?=(?P<Eli8509II>CCGGAG))|(?=(?P<Eli8509II_as>CTCCGG))", None, 4096.0, None, None, 156312, 65, 37, None, None, None, None, None, "CCGGAG", 6, "DNA", (), "https://identifiers.org/rebase:156312"),
+    ("ErhG4T10I", (None, None, None, None, "CGANNNNNNTC"), "(?=(?P<ErhG4T10I>CGA......TC))|(?=(?P<ErhG4T10I_as>GA......TCG))", None, 1024.0, None, None, 314610, 65, 37, None, None, None, None, None, "CGANNNNNNTC", 11, "DNA", (), "https://identifiers.org/rebase:314610"),
+    ("ErhI", (1, -1, None, None, "CCWWGG"), "(?=(?P<ErhI>CC[AT][AT]GG))", None, 1024.0, -1, 1, 2674, 65, 37, -4, "CWWG", None, None, None, "CCWWGG", 6, "DNA", ("I",), "https://identifiers.org/rebase:2674"),
+    ("EsaBC3I", (2, -2, None, None, "TCGA"), "(?=(?P<EsaBC3I>TCGA))", None, 256.0, -2, 2, 4634, 65, 37, 0, "", None, None, None, "TCGA", 4, "DNA", (), "https://identifiers.org/rebase:4634"),
+    ("EsaSSI", (None, None, None, None, "GACCAC"), "(?=(?P<EsaSSI>GACCAC))|(?=(?P<EsaSSI_as>GTGGTC))", None, 4096.0, None, None, 14757, 65, 37, None, None, None, None, None, "GACCAC", 6, "DNA", (), "https://identifiers.org/rebase:14757"),
+    ("Esp3007I", (None, None, None, None, "CAGAAG"), "(?=(?P<Esp3007I>CAGAAG))|(?=(?P<Esp3007I_as>CTTCTG))", None, 4096.0, None, None, 77587, 65, 37, None, None, None, None, None, "CAGAAG", 6, "DNA", (), "https://identifiers.org/rebase:77587"),
+    ("Esp3I", (7, 5, None, None, "CGTCTC"), "(?=(?P<Esp3I>CGTCTC))|(?=(?P<Esp3I_as>GAGACG))", None, 4096.0, 5, 7, 1028, 65, 37, -4, "NNNN", None, None, None, "CGTCTC", 6, "DNA", ("B", "N"), "https://identifiers.org/rebase:1028"),
+    ("EspI", (2, -2, None, None, "GCTNAGC"), "(?=(?P<EspI>GCT.AGC))", None, 4096.0, -2, 2, 1036, 65, 37, -3, "TNA", None, None, None, "GCTNAGC", 7, "DNA", (), "https://identifiers.org/rebase:1036"),
+    ("FaeI", (4, -4, None, None, "CATG"), "(?=(?P<FaeI>CATG))", None, 256.0, -4, 4, 11885, 65, 37, 4, "CATG", None, None, None, "CATG", 4, "DNA", ("I",), "https://identifiers.org/rebase:11885"),
+    ("FaiI", (2, -2, None, None, "YATR"), "(?=(?P<FaiI>[CT]AT[AG]))", None, 64.0, -2, 2, 18718, 65, 37, 0, "", None, None, None, "YATR", 4, "DNA", ("I",), "https://identifiers.org/rebase:18718"),
+    ("FalI", (-8, -24, 24, 8, "AAGNNNNNCTT"), "(?=(?P<FalI>AAG.....CTT))", None, 4096.0, -24, -8, 5531, 65, 37, 5, "NNNNN", None, 8, 24, "AAGNNNNNCTT", 11, "DNA", ("I",), "https://identifiers.org/rebase:5531"),
+    ("FaqI", (15, 14, None, None, "GGGAC"), "(?=(?P<FaqI>GGGAC))|(?=(?P<FaqI_as>GTCCC))", None, 1024.0, 14, 15, 7454, 65, 37, -4, "NNNN", None, None, None, "GGGAC", 5, "DNA", ("B",), "https://identifiers.org/rebase:7454"),
+    ("FatI", (0, 0, None, None, "CATG"), "(?=(?P<FatI>CATG))", None, 256.0, 0, 0, 5536, 65, 37, -4, "CATG", None, None, None, "CATG", 4, "DNA", ("I", "N"), "https://identifiers.org/rebase:5536"),
+    ("FauI", (9, 6, None, None, "CCCGC"), "(?=(?P<FauI>CCCGC))|(?=(?P<FauI_as>GCGGG))", None, 1024.0, 6, 9, 1038, 65, 37, -2, "NN", None, None, None, "CCCGC", 5, "DNA", ("I", "N"), "https://identifiers.org/rebase:1038"),
+    ("FauNDI", (2, -2, None, None, "CATATG"), "(?=(?P<FauNDI>CATATG))", None, 4096.0, -2, 2, 2736, 65, 37, -2, "TA", None, None, None, "CATATG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2736"),
+    ("Fba202Z8II", (None, None, None, None, "AGAAGG"), "(?=(?P<Fba202Z8II>AGAAGG))|(?=(?P<Fba202Z8II_as>CCTTCT))", None, 4096.0, None, None, 314863, 65, 37, None, None, None, None, None, "AGAAGG", 6, "DNA", (), "https://identifiers.org/rebase:314863"),
+    ("FbaI", (1, -1, None, None, "TGATCA"), "(?=(?P<FbaI>TGATCA))", None, 4096.0, -1, 1, 1039, 65, 37, -4, "GATC", None, None, None, "TGATCA", 6, "DNA", ("K",), "https://identifiers.org/rebase:1039"),
+    ("FblI", (2, -2, None, None, "GTMKAC"), "(?=(?P<FblI>GT[AC][GT]AC))", None, 1024.0, -2, 2, 1040, 65, 37, -2, "MK", None, None, None, "GTMKAC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:1040"),
+    ("Fco1691IV", (None, None, None, None, "GCVGAG"), "(?=(?P<Fco1691IV>GC[ACG]GAG))|(?=(?P<Fco1691IV_as>CTC[CGT]GC))", None, 1365.3333333333333, None, None, 177611, 65, 37, None, None, None, None, None, "GCVGAG", 6, "DNA", (), "https://identifiers.org/rebase:177611"),
+    ("FinI", (None, None, None, None, "GGGAC"), "(?=(?P<FinI>GGGAC))|(?=(?P<FinI_as>GTCCC))", None, 1024.0, None, None, 1044, 65, 37, None, None, None, None, None, "GGGAC", 5, "DNA", (), "https://identifiers.org/rebase:1044"),
+    ("FmuI", (4, -4, None, None, "GGNCC"), "(?=(?P<FmuI>GG.CC))", None, 256.0, -4, 4, 2696, 65, 37, 3, "GNC", None, None, None, "GGNCC", 5, "DNA", (), "https://identifiers.org/rebase:2696"),
+    ("Fna13121I", (None, None, None, None, "TTGAYC"), "(?=(?P<Fna13121I>TTGA[CT]C))|(?=(?P<Fna13121I_as>G[AG]TCAA))", None, 2048.0, None, None, 430829, 65, 37, None, None, None, None, None, "TTGAYC", 6, "DNA", (), "https://identifiers.org/rebase:430829"),
+    ("Fnu11326II", (None, None, None, None, "GAGNNNNRTAY"), "(?=(?P<Fnu11326II>GAG....[AG]TA[CT]))|(?=(?P<Fnu11326II_as>[AG]TA[CT]....CTC))", None, 4096.0, None, None, 429953, 65, 37, None, None, None, None, None, "GAGNNNNRTAY", 11, "DNA", (), "https://identifiers.org/rebase:429953"),
+    ("Fnu11326IV", (None, None, None, None, "CTTAATT"), "(?=(?P<Fnu11326IV>CTTAATT))|(?=(?P<Fnu11326IV_as>AATTAAG))", None, 16384.0, None, None, 430836, 65, 37, None, None, None, None, None, "CTTAATT", 7, "DNA", (), "https://identifiers.org/rebase:430836"),
+    ("Fnu4HI", (2, -2, None, None, "GCNGC"), "(?=(?P<Fnu4HI>GC.GC))", None, 256.0, -2, 2, 1048, 65, 37, -1, "N", None, None, None, "GCNGC", 5, "DNA", ("N",), "https://identifiers.org/rebase:1048"),
+    ("FnuDII", (2, -2, None, None, "CGCG"), "(?=(?P<FnuDII>CGCG))", None, 256.0, -2, 2, 1053, 65, 37, 0, "", None, None, None, "CGCG", 4, "DNA", (), "https://identifiers.org/rebase:1053"),
+    ("FokI", (14, 13, None, None, "GGATG"), "(?=(?P<FokI>GGATG))|(?=(?P<FokI_as>CATCC))", None, 1024.0, 13, 14, 1056, 65, 37, -4, "NNNN", None, None, None, "GGATG", 5, "DNA", ("B", "I", "J", "K", "M", "N", "V", "X", "Y"), "https://identifiers.org/rebase:1056"),
+    ("FriOI", (5, -5, None, None, "GRGCYC"), "(?=(?P<FriOI>G[AG]GC[CT]C))", None, 1024.0, -5, 5, 2682, 65, 37, 4, "RGCY", None, None, None, "GRGCYC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2682"),
+    ("FseI", (6, -6, None, None, "GGCCGGCC"), "(?=(?P<FseI>GGCCGGCC))", None, 65536.0, -6, 6, 1059, 65, 37, 4, "CCGG", None, None, None, "GGCCGGCC", 8, "DNA", ("N",), "https://identifiers.org/rebase:1059"),
+    ("Fsp4HI", (2, -2, None, None, "GCNGC"), "(?=(?P<Fsp4HI>GC.GC))", None, 256.0, -2, 2, 2738, 65, 37, -1, "N", None, None, None, "GCNGC", 5, "DNA", ("I",), "https://identifiers.org/rebase:2738"),
+    ("FspAI", (4, -4, None, None, "RTGCGCAY"), "(?=(?P<FspAI>[AG]TGCGCA[CT]))", None, 16384.0, -4, 4, 4756, 65, 37, 0, "", None, None, None, "RTGCGCAY", 8, "DNA", ("B",), "https://identifiers.org/rebase:4756"),
+    ("FspBI", (1, -1, None, None, "CTAG"), "(?=(?P<FspBI>CTAG))", None, 256.0, -1, 1, 6971, 65, 37, -2, "TA", None, None, None, "CTAG", 4, "DNA", ("B",), "https://identifiers.org/rebase:6971"),
+    ("FspEI", (14, 16, None, None, "CC"), "(?=(?P<FspEI>CC))|(?=(?P<FspEI_as>GG))", None, 16.0, 16, 14, 23359, 65, 37, -4, "NNNN", None, None, None, "CC", 2, "DNA", ("N",), "https://identifiers.org/rebase:23359"),
+    ("FspI", (3, -3, None, None, "TGCGCA"), "(?=(?P<FspI>TGCGCA))", None, 4096.0, -3, 3, 1063, 65, 37, 0, "", None, None, None, "TGCGCA", 6, "DNA", ("J", "N"), "https://identifiers.org/rebase:1063"),
+    ("FspPK15I", (None, None, None, None, "GARGAAG"), "(?=(?P<FspPK15I>GA[AG]GAAG))|(?=(?P<FspPK15I_as>CTTC[CT]TC))", None, 8192.0, None, None, 166439, 65, 37, None, None, None, None, None, "GARGAAG", 7, "DNA", (), "https://identifiers.org/rebase:166439"),
+    ("FtnUV", (None, None, None, None, "GAAACA"), "(?=(?P<FtnUV>GAAACA))|(?=(?P<FtnUV_as>TGTTTC))", None, 4096.0, None, None, 13984, 65, 37, None, None, None, None, None, "GAAACA", 6, "DNA", (), "https://identifiers.org/rebase:13984"),
+    ("GauT27I", (None, None, None, None, "CGCGCAGG"), "(?=(?P<GauT27I>CGCGCAGG))|(?=(?P<GauT27I_as>CCTGCGCG))", None, 65536.0, None, None, 21640, 65, 37, None, None, None, None, None, "CGCGCAGG", 8, "DNA", (), "https://identifiers.org/rebase:21640"),
+    ("Gba708II", (None, None, None, None, "ATGCAC"), "(?=(?P<Gba708II>ATGCAC))|(?=(?P<Gba708II_as>GTGCAT))", None, 4096.0, None, None, 78116, 65, 37, None, None, None, None, None, "ATGCAC", 6, "DNA", (), "https://identifiers.org/rebase:78116"),
+    ("GdiII", (1, -1, None, None, "CGGCCR"), "(?=(?P<GdiII>CGGCC[AG]))|(?=(?P<GdiII_as>[CT]GGCCG))", None, 2048.0, -1, 1, 1072, 65, 37, -4, "GGCC", None, None, None, "CGGCCR", 6, "DNA", (), "https://identifiers.org/rebase:1072"),
+    ("GlaI", (2, -2, None, None, "GCGC"), "(?=(?P<GlaI>GCGC))", None, 256.0, -2, 2, 14597, 65, 37, 0, "", None, None, None, "GCGC", 4, "DNA", ("I",), "https://identifiers.org/rebase:14597"),
+    ("GluI", (2, -2, None, None, "GCNGC"), "(?=(?P<GluI>GC.GC))", None, 256.0, -2, 2, 15187, 65, 37, -1, "N", None, None, None, "GCNGC", 5, "DNA", ("I",), "https://identifiers.org/rebase:15187"),
+    ("Gru56503II", (None, None, None, None, "CARABGC"), "(?=(?P<Gru56503II>CA[AG]A[CGT]GC))|(?=(?P<Gru56503II_as>GC[ACG]T[CT]TG))", None, 2730.6666666666665, None, None, 421745, 65, 37, None, None, None, None, None, "CARABGC", 7, "DNA", (), "https://identifiers.org/rebase:421745"),
+    ("GsaI", (5, -5, None, None, "CCCAGC"), "(?=(?P<GsaI>CCCAGC))|(?=(?P<GsaI_as>GCTGGG))", None, 4096.0, -5, 5, 17118, 65, 37, 4, "CCAG", None, None, None, "CCCAGC", 6, "DNA", ("I",), "https://identifiers.org/rebase:17118"),
+    ("GsuI", (22, 14, None, None, "CTGGAG"), "(?=(?P<GsuI>CTGGAG))|(?=(?P<GsuI_as>CTCCAG))", None, 4096.0, 14, 22, 1085, 65, 37, 2, "NN", None, None, None, "CTGGAG", 6, "DNA", ("B",), "https://identifiers.org/rebase:1085"),
+    ("GsuPI", (None, None, None, None, "GTACAG"), "(?=(?P<GsuPI>GTACAG))|(?=(?P<GsuPI_as>CTGTAC))", None, 4096.0, None, None, 17641, 65, 37, None, None, None, None, None, "GTACAG", 6, "DNA", (), "https://identifiers.org/rebase:17641"),
+    ("HaeI", (3, -3, None, None, "WGGCCW"), "(?=(?P<HaeI>[AT]GGCC[AT]))", None, 1024.0, -3, 3, 1087, 65, 37, 0, "", None, None, None, "WGGCCW", 6, "DNA", (), "https://identifiers.org/rebase:1087"),
+    ("HaeII", (5, -5, None, None, "RGCGCY"), "(?=(?P<HaeII>[AG]GCGC[CT]))", None, 1024.0, -5, 5, 1088, 65, 37, 4, "GCGC", None, None, None, "RGCGCY", 6, "DNA", ("J", "K", "N"), "https://identifiers.org/rebase:1088"),
+    ("HaeIII", (2, -2, None, None, "GGCC"), "(?=(?P<HaeIII>GGCC))", None, 256.0, -2, 2, 1089, 65, 37, 0, "", None, None, None, "GGCC", 4, "DNA", ("B", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "X"), "https://identifiers.org/rebase:1089"),
+    ("HapII", (1, -1, None, None, "CCGG"), "(?=(?P<HapII>CCGG))", None, 256.0, -1, 1, 1094, 65, 37, -2, "CG", None, None, None, "CCGG", 4, "DNA", ("B", "K"), "https://identifiers.org/rebase:1094"),
+    ("HauII", (17, 9, None, None, "TGGCCA"), "(?=(?P<HauII>TGGCCA))", None, 4096.0, 9, 17, 20893, 65, 37, 2, "NN", None, None, None, "TGGCCA", 6, "DNA", (), "https://identifiers.org/rebase:20893"),
+    ("HbaII", (None, None, None, None, "GCCCAG"), "(?=(?P<HbaII>GCCCAG))|(?=(?P<HbaII_as>CTGGGC))", None, 4096.0, None, None, 21444, 65, 37, None, None, None, None, None, "GCCCAG", 6, "DNA", (), "https://identifiers.org/rebase:21444"),
+    ("Hca13221V", (None, None, None, None, "CACNNNNNRTAY"), "(?=(?P<Hca13221V>CAC.....[AG]TA[CT]))|(?=(?P<Hca13221V_as>[AG]TA[CT].....GTG))", None, 4096.0, None, None, 431204, 65, 37, None, None, None, None, None, "CACNNNNNRTAY", 12, "DNA", (), "https://identifiers.org/rebase:431204"),
+    ("HdeNY26I", (None, None, None, None, "CGANNNNNNTCC"), "(?=(?P<HdeNY26I>CGA......TCC))|(?=(?P<HdeNY26I_as>GGA......TCG))", None, 4096.0, None, None, 224970, 65, 37, None, None, None, None, None, "CGANNNNNNTCC", 12, "DNA", (), "https://identifiers.org/rebase:224970"),
+    ("HdeZA17I", (None, None, None, None, "GCANNNNNNTCC"), "(?=(?P<HdeZA17I>GCA......TCC))|(?=(?P<HdeZA17I_as>GGA......TGC))", None, 4096.0, None, None, 224977, 65, 37, None, None, None, None, None, "GCANNNNNNTCC", 12, "DNA", (), "https://identifiers.org/rebase:224977"),
+    ("HgaI", (10, 10, None, None, "GACGC"), "(?=(?P<HgaI>GACGC))|(?=(?P<HgaI_as>GCGTC))", None, 1024.0, 10, 10, 1096, 65, 37, -5, "NNNNN", None, None, None, "GACGC", 5, "DNA", ("I", "N"), "https://identifiers.org/rebase:1096"),
+    ("HgiAI", (5, -5, None, None, "GWGCWC"), "(?=(?P<HgiAI>G[AT]GC[AT]C))", None, 1024.0, -5, 5, 1097, 65, 37, 4, "WGCW", None, None, None, "GWGCWC", 6, "DNA", (), "https://identifiers.org/rebase:1097"),
+    ("HgiCI", (1, -1, None, None, "GGYRCC"), "(?=(?P<HgiCI>GG[CT][AG]CC))", None, 1024.0, -1, 1, 1099, 65, 37, -4, "GYRC", None, None, None, "GGYRCC", 6, "DNA", (), "https://identifiers.org/rebase:1099"),
+    ("HgiEII", (None, None, None, None, "ACCNNNNNNGGT"), "(?=(?P<HgiEII>ACC......GGT))", None, 4096.0, None, None, 1105, 65, 37, None, None, None, None, None, "ACCNNNNNNGGT", 12, "DNA", (), "https://identifiers.org/rebase:1105"),
+    ("HgiJII", (5, -5, None, None, "GRGCYC"), "(?=(?P<HgiJII>G[AG]GC[CT]C))", None, 1024.0, -5, 5, 1113, 65, 37, 4, "RGCY", None, None, None, "GRGCYC", 6, "DNA", (), "https://identifiers.org/rebase:1113"),
+    ("HhaI", (3, -3, None, None, "GCGC"), "(?=(?P<HhaI>GCGC))", None, 256.0, -3, 3, 1117, 65, 37, 2, "CG", None, None, None, "GCGC", 4, "DNA", ("B", "J", "K", "N", "Q", "R", "X"), "https://identifiers.org/rebase:1117"),
+    ("Hin1I", (2, -2, None, None, "GRCGYC"), "(?=(?P<Hin1I>G[AG]CG[CT]C))", None, 1024.0, -2, 2, 1128, 65, 37, -2, "CG", None, None, None, "GRCGYC", 6, "DNA", ("B", "K"), "https://identifiers.org/rebase:1128"),
+    ("Hin1II", (4, -4, None, None, "CATG"), "(?=(?P<Hin1II>CATG))", None, 256.0, -4, 4, 1129, 65, 37, 4, "CATG", None, None, None, "CATG", 4, "DNA", ("B",), "https://identifiers.org/rebase:1129"),
+    ("Hin4I", (-8, -24, 24, 8, "GAYNNNNNVTC"), "(?=(?P<Hin4I>GA[CT].....[ACG]TC))|(?=(?P<Hin4I_as>GA[CGT].....[AG]TC))", None, 682.6666666666666, -24, -8, 2577, 65, 37, 5, "NNNNN", None, 8, 24, "GAYNNNNNVTC", 11, "DNA", (), "https://identifiers.org/rebase:2577"),
+    ("Hin4II", (11, 5, None, None, "CCTTC"), "(?=(?P<Hin4II>CCTTC))|(?=(?P<Hin4II_as>GAAGG))", None, 1024.0, 5, 11, 5045, 65, 37, 1, "N", None, None, None, "CCTTC", 5, "DNA", (), "https://identifiers.org/rebase:5045"),
+    ("Hin6I", (1, -1, None, None, "GCGC"), "(?=(?P<Hin6I>GCGC))", None, 256.0, -1, 1, 1135, 65, 37, -2, "CG", None, None, None, "GCGC", 4, "DNA", ("B",), "https://identifiers.org/rebase:1135"),
+    ("HinP1I", (1, -1, None, None, "GCGC"), "(?=(?P<HinP1I>GCGC))", None, 256.0, -1, 1, 1144, 65, 37, -2, "CG", None, None, None, "GCGC", 4, "DNA", ("N",), "https://identifiers.org/rebase:1144"),
+    ("HincII", (3, -3, None, None, "GTYRAC"), "(?=(?P<HincII>GT[CT][AG]AC))", None, 1024.0, -3, 3, 1148, 65, 37, 0, "", None, None, None, "GTYRAC", 6, "DNA", ("B", "J", "K", "N", "O", "Q", "X"), "https://identifiers.org/rebase:1148"),
+    ("HindII", (3, -3, None, None, "GTYRAC"), "(?=(?P<HindII>GT[CT][AG]AC))", None, 1024.0, -3, 3, 1150, 65, 37, 0, "", None, None, None, "GTYRAC", 6, "DNA", ("I", "M", "S", "V"), "https://identifiers.org/rebase:1150"),
+    ("HindIII", (1, -1, None, None, "AAGCTT"), "(?=(?P<HindIII>AAGCTT))", None, 4096.0, -1, 1, 1151, 65, 37, -4, "AGCT", None, None, None, "AAGCTT", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"), "https://identifiers.org/rebase:1151"),
+    ("HinfI", (1, -1, None, None, "GANTC"), "(?=(?P<HinfI>GA.TC))", None, 256.0, -1, 1, 1154, 65, 37, -3, "ANT", None, None, None, "GANTC", 5, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "V", "X", "Y"), "https://identifiers.org/rebase:1154"),
+    ("HpaI", (3, -3, None, None, "GTTAAC"), "(?=(?P<HpaI>GTTAAC))", None, 4096.0, -3, 3, 1158, 65, 37, 0, "", None, None, None, "GTTAAC", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "Q", "S", "V", "X"), "https://identifiers.org/rebase:1158"),
+    ("HpaII", (1, -1, None, None, "CCGG"), "(?=(?P<HpaII>CCGG))", None, 256.0, -1, 1, 1159, 65, 37, -2, "CG", None, None, None, "CCGG", 4, "DNA", ("B", "I", "N", "Q", "R", "V", "X"), "https://identifiers.org/rebase:1159"),
+    ("HphI", (13, 7, None, None, "GGTGA"), "(?=(?P<HphI>GGTGA))|(?=(?P<HphI_as>TCACC))", None, 1024.0, 7, 13, 1160, 65, 37, 1, "N", None, None, None, "GGTGA", 5, "DNA", ("B", "N"), "https://identifiers.org/rebase:1160"),
+    ("Hpy166II", (3, -3, None, None, "GTNNAC"), "(?=(?P<Hpy166II>GT..AC))", None, 256.0, -3, 3, 4197, 65, 37, 0, "", None, None, None, "GTNNAC", 6, "DNA", ("N",), "https://identifiers.org/rebase:4197"),
+    ("Hpy178III", (2, -2, None, None, "TCNNGA"), "(?=(?P<Hpy178III>TC..GA))", None, 256.0, -2, 2, 3249, 65, 37, -2, "NN", None, None, None, "TCNNGA", 6, "DNA", (), "https://identifiers.org/rebase:3249"),
+    ("Hpy188I", (3, -3, None, None, "TCNGA"), "(?=(?P<Hpy188I>TC.GA))", None, 256.0, -3, 3, 3252, 65, 37, 1, "N", None, None, None, "TCNGA", 5, "DNA", ("N",), "https://identifiers.org/rebase:3252"),
+    ("Hpy188III", (2, -2, None, None, "TCNNGA"), "(?=(?P<Hpy188III>TC..GA))", None, 256.0, -2, 2, 4152, 65, 37, -2, "NN", None, None, None, "TCNNGA", 6, "DNA", ("N",), "https://identifiers.org/rebase:4152"),
+    ("Hpy300XI", (None, None, None, None, "CCTYNA"), "(?=(?P<Hpy300XI>CCT[CT].A))|(?=(?P<Hpy300XI_as>T.[AG]AGG))", None, 512.0, None, None, 211704, 65, 37, None, None, None, None, None, "CCTYNA", 6, "DNA", (), "https://identifiers.org/rebase:211704"),
+    ("Hpy8I", (3, -3, None, None, "GTNNAC"), "(?=(?P<Hpy8I>GT..AC))", None, 256.0, -3, 3, 4002, 65, 37, 0, "", None, None, None, "GTNNAC", 6, "DNA", ("B",), "https://identifiers.org/rebase:4002"),
+    ("Hpy99I", (5, -5, None, None, "CGWCG"), "(?=(?P<Hpy99I>CG[AT]CG))", None, 512.0, -5, 5, 4194, 65, 37, 5, "CGWCG", None, None, None, "CGWCG", 5, "DNA", ("N",), "https://identifiers.org/rebase:4194"),
+    ("Hpy99XIII", (None, None, None, None, "GCCTA"), "(?=(?P<Hpy99XIII>GCCTA))|(?=(?P<Hpy99XIII_as>TAGGC))", None, 1024.0, None, None, 4062, 65, 37, None, None, None, None, None, "GCCTA", 5, "DNA", (), "https://identifiers.org/rebase:4062"),
+    ("Hpy99XIV", (None, None, None, None, "GGWTAA"), "(?=(?P<Hpy99XIV>GG[AT]TAA))|(?=(?P<Hpy99XIV_as>TTA[AT]CC))", None, 2048.0, None, None, 67181, 65, 37, None, None, None, None, None, "GGWTAA", 6, "DNA", (), "https://identifiers.org/rebase:67181"),
+    ("Hpy99XIV_mut1", (None, None, None, None, "GGWCNA"), "(?=(?P<Hpy99XIV_mut1>GG[AT]C.A))|(?=(?P<Hpy99XIV_mut1_as>T.G[AT]CC))", None, 512.0, None, None, None, 65, 37, None, None, None, None, None, "GGWCNA", 6, "DNA", (), None),
+    ("Hpy99XXII", (None, None, None, None, "CYANNNNNNTGA"), "(?=(?P<Hpy99XXII>C[CT]A......TGA))|(?=(?P<Hpy99XXII_as>TCA......T[AG]G))", None, 2048.0, None, None, 4061, 65, 37, None, None, None, None, None, "CYANNNNNNTGA", 12, "DNA", (), "https://identifiers.org/rebase:4061"),
+    ("HpyAS001VI", (None, None, None, None, "CYANNNNNNTTC"), "(?=(?P<HpyAS001VI>C[CT]A......TTC))|(?=(?P<HpyAS001VI_as>GAA......T[AG]G))", None, 2048.0, None, None, 468441, 65, 37, None, None, None, None, None, "CYANNNNNNTTC", 12, "DNA", (), "https://identifiers.org/rebase:468441"),
+    ("HpyAV", (11, 5, None, None, "CCTTC"), "(?=(?P<HpyAV>CCTTC))|(?=(?P<HpyAV_as>GAAGG))", None, 1024.0, 5, 11, 4211, 65, 37, 1, "N", None, None, None, "CCTTC", 5, "DNA", ("N",), "https://identifiers.org/rebase:4211"),
+    ("HpyAXIV", (None, None, None, None, "GCGTA"), "(?=(?P<HpyAXIV>GCGTA))|(?=(?P<HpyAXIV_as>TACGC))", None, 1024.0, None, None, 3071, 65, 37, None, None, None, None, None, "GCGTA", 5, "DNA", (), "https://identifiers.org/rebase:3071"),
+    ("HpyAXVIII", (None, None, None, None, "GGANNAG"), "(?=(?P<HpyAXVIII>GGA..AG))|(?=(?P<HpyAXVIII_as>CT..TCC))", None, 1024.0, None, None, 6149, 65, 37, None, None, None, None, None, "GGANNAG", 7, "DNA", (), "https://identifiers.org/rebase:6149"),
+    ("HpyAXVI_mut1", (None, None, None, None, "CRTTAA"), "(?=(?P<HpyAXVI_mut1>C[AG]TTAA))|(?=(?P<HpyAXVI_mut1_as>TTAA[CT]G))", None, 2048.0, None, None, None, 65, 37, None, None, None, None, None, "CRTTAA", 6, "DNA", (), None),
+    ("HpyAXVI_mut2", (None, None, None, None, "CRTCNA"), "(?=(?P<HpyAXVI_mut2>C[AG]TC.A))|(?=(?P<HpyAXVI_mut2_as>T.GA[CT]G))", None, 512.0, None, None, None, 65, 37, None, None, None, None, None, "CRTCNA", 6, "DNA", (), None),
+    ("HpyCH4III", (3, -3, None, None, "ACNGT"), "(?=(?P<HpyCH4III>AC.GT))", None, 256.0, -3, 3, 4148, 65, 37, 1, "N", None, None, None, "ACNGT", 5, "DNA", ("N",), "https://identifiers.org/rebase:4148"),
+    ("HpyCH4IV", (1, -1, None, None, "ACGT"), "(?=(?P<HpyCH4IV>ACGT))", None, 256.0, -1, 1, 4149, 65, 37, -2, "CG", None, None, None, "ACGT", 4, "DNA", ("N",), "https://identifiers.org/rebase:4149"),
+    ("HpyCH4V", (2, -2, None, None, "TGCA"), "(?=(?P<HpyCH4V>TGCA))", None, 256.0, -2, 2, 4150, 65, 37, 0, "", None, None, None, "TGCA", 4, "DNA", ("N",), "https://identifiers.org/rebase:4150"),
+    ("HpyF10VI", (7, -7, None, None, "GCNNNNNNNGC"), "(?=(?P<HpyF10VI>GC.......GC))", None, 256.0, -7, 7, 4304, 65, 37, 3, "NNN", None, None, None, "GCNNNNNNNGC", 11, "DNA", ("B",), "https://identifiers.org/rebase:4304"),
+    ("HpyF3I", (1, -1, None, None, "CTNAG"), "(?=(?P<HpyF3I>CT.AG))", None, 256.0, -1, 1, 4285, 65, 37, -3, "TNA", None, None, None, "CTNAG", 5, "DNA", ("B",), "https://identifiers.org/rebase:4285"),
+    ("HpyG272XV", (None, None, None, None, "GAAAAG"), "(?=(?P<HpyG272XV>GAAAAG))|(?=(?P<HpyG272XV_as>CTTTTC))", None, 4096.0, None, None, 212292, 65, 37, None, None, None, None, None, "GAAAAG", 6, "DNA", (), "https://identifiers.org/rebase:212292"),
+    ("HpyLIM6XII", (None, None, None, None, "CYANNNNNNTCC"), "(?=(?P<HpyLIM6XII>C[CT]A......TCC))|(?=(?P<HpyLIM6XII_as>GGA......T[AG]G))", None, 2048.0, None, None, 475965, 65, 37, None, None, None, None, None, "CYANNNNNNTCC", 12, "DNA", (), "https://identifiers.org/rebase:475965"),
+    ("HpyLIM9XVI", (None, None, None, None, "GAAAAG"), "(?=(?P<HpyLIM9XVI>GAAAAG))|(?=(?P<HpyLIM9XVI_as>CTTTTC))", None, 4096.0, None, None, 477626, 65, 37, None, None, None, None, None, "GAAAAG", 6, "DNA", (), "https://identifiers.org/rebase:477626"),
+    ("HpyPU007XIX", (None, None, None, None, "CYANNNNNNTGY"), "(?=(?P<HpyPU007XIX>C[CT]A......TG[CT]))|(?=(?P<HpyPU007XIX_as>[AG]CA......T[AG]G))", None, 1024.0, None, None, 476105, 65, 37, None, None, None, None, None, "CYANNNNNNTGY", 12, "DNA", (), "https://identifiers.org/rebase:476105"),
+    ("HpySE526I", (1, -1, None, None, "ACGT"), "(?=(?P<HpySE526I>ACGT))", None, 256.0, -1, 1, 41799, 65, 37, -2, "CG", None, None, None, "ACGT", 4, "DNA", ("I",), "https://identifiers.org/rebase:41799"),
+    ("HpyUM032XIII", (None, None, None, None, "CYANNNNNNNTRG"), "(?=(?P<HpyUM032XIII>C[CT]A.......T[AG]G))", None, 1024.0, None, None, 65004, 65, 37, None, None, None, None, None, "CYANNNNNNNTRG", 13, "DNA", (), "https://identifiers.org/rebase:65004"),
+    ("HpyUM032XIII_mut1", (None, None, None, None, "CYANNNNNNNTTC"), "(?=(?P<HpyUM032XIII_mut1>C[CT]A.......TTC))|(?=(?P<HpyUM032XIII_mut1_as>GAA.......T[AG]G))", None, 2048.0, None, None, None, 65, 37, None, None, None, None, None, "CYANNNNNNNTTC", 13, "DNA", (), None),
+    ("HpyUM032XIV", (None, None, None, None, "GAAAG"), "(?=(?P<HpyUM032XIV>GAAAG))|(?=(?P<HpyUM032XIV_as>CTTTC))", None, 1024.0, None, None, 65011, 65, 37, None, None, None, None, None, "GAAAG", 5, "DNA", (), "https://identifiers.org/rebase:65011"),
+    ("HpyUM037X", (None, None, None, None, "TNGGNAG|GTGGNAG"), "(?=(?P<HpyUM037X>T.GG.AG))|(?=(?P<HpyUM037X_as>CT.CC.A))", None, 1024.0, None, None, 65113, 65, 37, None, None, None, None, None, "TNGGNAG|GTGGNAG", 7, "DNA", (), "https://identifiers.org/rebase:65113"),
+    ("Hso63250IV", (None, None, None, None, "AACNNNNNGTT"), "(?=(?P<Hso63250IV>AAC.....GTT))", None, 4096.0, None, None, 186849, 65, 37, None, None, None, None, None, "AACNNNNNGTT", 11, "DNA", (), "https://identifiers.org/rebase:186849"),
+    ("Hso63373III", (None, None, None, None, "CGANNNNNRTAY"), "(?=(?P<Hso63373III>CGA.....[AG]TA[CT]))|(?=(?P<Hso63373III_as>[AG]TA[CT].....TCG))", None, 4096.0, None, None, 202592, 65, 37, None, None, None, None, None, "CGANNNNNRTAY", 12, "DNA", (), "https://identifiers.org/rebase:202592"),
+    ("Hsp92I", (2, -2, None, None, "GRCGYC"), "(?=(?P<Hsp92I>G[AG]CG[CT]C))", None, 1024.0, -2, 2, 2580, 65, 37, -2, "CG", None, None, None, "GRCGYC", 6, "DNA", ("R",), "https://identifiers.org/rebase:2580"),
+    ("Hsp92II", (4, -4, None, None, "CATG"), "(?=(?P<Hsp92II>CATG))", None, 256.0, -4, 4, 2581, 65, 37, 4, "CATG", None, None, None, "CATG", 4, "DNA", ("R",), "https://identifiers.org/rebase:2581"),
+    ("HspAI", (1, -1, None, None, "GCGC"), "(?=(?P<HspAI>GCGC))", None, 256.0, -1, 1, 2675, 65, 37, -2, "CG", None, None, None, "GCGC", 4, "DNA", ("I", "V"), "https://identifiers.org/rebase:2675"),
+    ("HspMHR1II", (None, None, None, None, "GAGCAGC"), "(?=(?P<HspMHR1II>GAGCAGC))|(?=(?P<HspMHR1II_as>GCTGCTC))", None, 16384.0, None, None, 309943, 65, 37, None, None, None, None, None, "GAGCAGC", 7, "DNA", (), "https://identifiers.org/rebase:309943"),
+    ("Jma19592I", (None, None, None, None, "GTATNAC"), "(?=(?P<Jma19592I>GTAT.AC))|(?=(?P<Jma19592I_as>GT.ATAC))", None, 4096.0, None, None, 61170, 65, 37, None, None, None, None, None, "GTATNAC", 7, "DNA", (), "https://identifiers.org/rebase:61170"),
+    ("Jma19592II", (None, None, None, None, "GRGCRAC"), "(?=(?P<Jma19592II>G[AG]GC[AG]AC))|(?=(?P<Jma19592II_as>GT[CT]GC[CT]C))", None, 4096.0, None, None, 61171, 65, 37, None, None, None, None, None, "GRGCRAC", 7, "DNA", (), "https://identifiers.org/rebase:61171"),
+    ("Jsp2502II", (None, None, None, None, "GRNGAAT"), "(?=(?P<Jsp2502II>G[AG].GAAT))|(?=(?P<Jsp2502II_as>ATTC.[CT]C))", None, 2048.0, None, None, 179014, 65, 37, None, None, None, None, None, "GRNGAAT", 7, "DNA", (), "https://identifiers.org/rebase:179014"),
+    ("Kas9737III", (None, None, None, None, "CCCRAG"), "(?=(?P<Kas9737III>CCC[AG]AG))|(?=(?P<Kas9737III_as>CT[CT]GGG))", None, 2048.0, None, None, 381943, 65, 37, None, None, None, None, None, "CCCRAG", 6, "DNA", (), "https://identifiers.org/rebase:381943"),
+    ("KasI", (1, -1, None, None, "GGCGCC"), "(?=(?P<KasI>GGCGCC))", None, 4096.0, -1, 1, 1165, 65, 37, -4, "GCGC", None, None, None, "GGCGCC", 6, "DNA", ("N",), "https://identifiers.org/rebase:1165"),
+    ("KflI", (2, -2, None, None, "GGGWCCC"), "(?=(?P<KflI>GGG[AT]CCC))", None, 8192.0, -2, 2, 17985, 65, 37, -3, "GWC", None, None, None, "GGGWCCC", 7, "DNA", ("B",), "https://identifiers.org/rebase:17985"),
+    ("Kor51II", (None, None, None, None, "RTCGAG"), "(?=(?P<Kor51II>[AG]TCGAG))|(?=(?P<Kor51II_as>CTCGA[CT]))", None, 2048.0, None, None, 152829, 65, 37, None, None, None, None, None, "RTCGAG", 6, "DNA", (), "https://identifiers.org/rebase:152829"),
+    ("Kpn156V", (None, None, None, None, "CRTGATT"), "(?=(?P<Kpn156V>C[AG]TGATT))|(?=(?P<Kpn156V_as>AATCA[CT]G))", None, 8192.0, None, None, 235890, 65, 37, None, None, None, None, None, "CRTGATT", 7, "DNA", (), "https://identifiers.org/rebase:235890"),
+    ("Kpn2I", (1, -1, None, None, "TCCGGA"), "(?=(?P<Kpn2I>TCCGGA))", None, 4096.0, -1, 1, 1177, 65, 37, -4, "CCGG", None, None, None, "TCCGGA", 6, "DNA", ("B",), "https://identifiers.org/rebase:1177"),
+    ("Kpn327I", (None, None, None, None, "GACATC"), "(?=(?P<Kpn327I>GACATC))|(?=(?P<Kpn327I_as>GATGTC))", None, 4096.0, None, None, 271895, 65, 37, None, None, None, None, None, "GACATC", 6, "DNA", (), "https://identifiers.org/rebase:271895"),
+    ("Kpn9178I", (None, None, None, None, "GNGCGAG"), "(?=(?P<Kpn9178I>G.GCGAG))|(?=(?P<Kpn9178I_as>CTCGC.C))", None, 4096.0, None, None, 312455, 65, 37, None, None, None, None, None, "GNGCGAG", 7, "DNA", (), "https://identifiers.org/rebase:312455"),
+    ("Kpn9644II", (None, None, None, None, "GRACRAC"), "(?=(?P<Kpn9644II>G[AG]AC[AG]AC))|(?=(?P<Kpn9644II_as>GT[CT]GT[CT]C))", None, 4096.0, None, None, 286855, 65, 37, None, None, None, None, None, "GRACRAC", 7, "DNA", (), "https://identifiers.org/rebase:286855"),
+    ("KpnI", (5, -5, None, None, "GGTACC"), "(?=(?P<KpnI>GGTACC))", None, 4096.0, -5, 5, 1180, 65, 37, 4, "GTAC", None, None, None, "GGTACC", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"), "https://identifiers.org/rebase:1180"),
+    ("KpnNH25III", (None, None, None, None, "CTRGAG"), "(?=(?P<KpnNH25III>CT[AG]GAG))|(?=(?P<KpnNH25III_as>CTC[CT]AG))", None, 2048.0, None, None, 243384, 65, 37, None, None, None, None, None, "CTRGAG", 6, "DNA", (), "https://identifiers.org/rebase:243384"),
+    ("KpnNIH30III", (None, None, None, None, "GTTCNAC"), "(?=(?P<KpnNIH30III>GTTC.AC))|(?=(?P<KpnNIH30III_as>GT.GAAC))", None, 4096.0, None, None, 97462, 65, 37, None, None, None, None, None, "GTTCNAC", 7, "DNA", (), "https://identifiers.org/rebase:97462"),
+    ("KpnNIH50I", (None, None, None, None, "GCYAAG"), "(?=(?P<KpnNIH50I>GC[CT]AAG))|(?=(?P<KpnNIH50I_as>CTT[AG]GC))", None, 2048.0, None, None, 231662, 65, 37, None, None, None, None, None, "GCYAAG", 6, "DNA", (), "https://identifiers.org/rebase:231662"),
+    ("Kro7512II", (None, None, None, None, "ARCAGKC"), "(?=(?P<Kro7512II>A[AG]CAG[GT]C))|(?=(?P<Kro7512II_as>G[AC]CTG[CT]T))", None, 4096.0, None, None, 289903, 65, 37, None, None, None, None, None, "ARCAGKC", 7, "DNA", (), "https://identifiers.org/rebase:289903"),
+    ("KroI", (1, -1, None, None, "GCCGGC"), "(?=(?P<KroI>GCCGGC))", None, 4096.0, -1, 1, 38425, 65, 37, -4, "CCGG", None, None, None, "GCCGGC", 6, "DNA", ("I",), "https://identifiers.org/rebase:38425"),
+    ("KroNI", (3, -3, None, None, "GCCGGC"), "(?=(?P<KroNI>GCCGGC))", None, 4096.0, -3, 3, 491208, 65, 37, 0, "", None, None, None, "GCCGGC", 6, "DNA", ("I",), "https://identifiers.org/rebase:491208"),
+    ("Ksp22I", (1, -1, None, None, "TGATCA"), "(?=(?P<Ksp22I>TGATCA))", None, 4096.0, -1, 1, 1182, 65, 37, -4, "GATC", None, None, None, "TGATCA", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:1182"),
+    ("Ksp632I", (7, 4, None, None, "CTCTTC"), "(?=(?P<Ksp632I>CTCTTC))|(?=(?P<Ksp632I_as>GAAGAG))", None, 4096.0, 4, 7, 1183, 65, 37, -3, "NNN", None, None, None, "CTCTTC", 6, "DNA", (), "https://identifiers.org/rebase:1183"),
+    ("KspAI", (3, -3, None, None, "GTTAAC"), "(?=(?P<KspAI>GTTAAC))", None, 4096.0, -3, 3, 2449, 65, 37, 0, "", None, None, None, "GTTAAC", 6, "DNA", ("B",), "https://identifiers.org/rebase:2449"),
+    ("KspI", (4, -4, None, None, "CCGCGG"), "(?=(?P<KspI>CCGCGG))", None, 4096.0, -4, 4, 1184, 65, 37, 2, "GC", None, None, None, "CCGCGG", 6, "DNA", ("M", "S"), "https://identifiers.org/rebase:1184"),
+    ("Kzo9I", (0, 0, None, None, "GATC"), "(?=(?P<Kzo9I>GATC))", None, 256.0, 0, 0, 1186, 65, 37, -4, "GATC", None, None, None, "GATC", 4, "DNA", ("I",), "https://identifiers.org/rebase:1186"),
+    ("Lba2029III", (None, None, None, None, "CYAAANG"), "(?=(?P<Lba2029III>C[CT]AAA.G))|(?=(?P<Lba2029III_as>C.TTT[AG]G))", None, 2048.0, None, None, 67764, 65, 37, None, None, None, None, None, "CYAAANG", 7, "DNA", (), "https://identifiers.org/rebase:67764"),
+    ("Lbr124II", (None, None, None, None, "CATCNAC"), "(?=(?P<Lbr124II>CATC.AC))|(?=(?P<Lbr124II_as>GT.GATG))", None, 4096.0, None, None, 251221, 65, 37, None, None, None, None, None, "CATCNAC", 7, "DNA", (), "https://identifiers.org/rebase:251221"),
+    ("Lcr047I", (None, None, None, None, "CTCCA"), "(?=(?P<Lcr047I>CTCCA))|(?=(?P<Lcr047I_as>TGGAG))", None, 1024.0, None, None, 385800, 65, 37, None, None, None, None, None, "CTCCA", 5, "DNA", (), "https://identifiers.org/rebase:385800"),
+    ("Lcr047II", (None, None, None, None, "AGAAG"), "(?=(?P<Lcr047II>AGAAG))|(?=(?P<Lcr047II_as>CTTCT))", None, 1024.0, None, None, 382621, 65, 37, None, None, None, None, None, "AGAAG", 5, "DNA", (), "https://identifiers.org/rebase:382621"),
+    ("LcrJM4II", (None, None, None, None, "GMAGG"), "(?=(?P<LcrJM4II>G[AC]AGG))|(?=(?P<LcrJM4II_as>CCT[GT]C))", None, 512.0, None, None, 601088, 65, 37, None, None, None, None, None, "GMAGG", 5, "DNA", (), "https://identifiers.org/rebase:601088"),
+    ("Lde4408II", (None, None, None, None, "ACAAAG"), "(?=(?P<Lde4408II>ACAAAG))|(?=(?P<Lde4408II_as>CTTTGT))", None, 4096.0, None, None, 202403, 65, 37, None, None, None, None, None, "ACAAAG", 6, "DNA", (), "https://identifiers.org/rebase:202403"),
+    ("LguI", (8, 4, None, None, "GCTCTTC"), "(?=(?P<LguI>GCTCTTC))|(?=(?P<LguI_as>GAAGAGC))", None, 16384.0, 4, 8, 10920, 65, 37, -3, "NNN", None, None, None, "GCTCTTC", 7, "DNA", ("B",), "https://identifiers.org/rebase:10920"),
+    ("LlaG50I", (None, None, None, None, "CCGTKA"), "(?=(?P<LlaG50I>CCGT[GT]A))|(?=(?P<LlaG50I_as>T[AC]ACGG))", None, 2048.0, None, None, 230489, 65, 37, None, None, None, None, None, "CCGTKA", 6, "DNA", (), "https://identifiers.org/rebase:230489"),
+    ("Lme32I", (None, None, None, None, "CTYCAA"), "(?=(?P<Lme32I>CT[CT]CAA))|(?=(?P<Lme32I_as>TTG[AG]AG))", None, 2048.0, None, None, 508470, 65, 37, None, None, None, None, None, "CTYCAA", 6, "DNA", (), "https://identifiers.org/rebase:508470"),
+    ("LmnI", (6, -1, None, None, "GCTCC"), "(?=(?P<LmnI>GCTCC))|(?=(?P<LmnI_as>GGAGC))", None, 1024.0, -1, 6, 111909, 65, 37, 2, "CN", None, None, None, "GCTCC", 5, "DNA", ("I",), "https://identifiers.org/rebase:111909"),
+    ("Lmo370I", (None, None, None, None, "AGCGCCG"), "(?=(?P<Lmo370I>AGCGCCG))|(?=(?P<Lmo370I_as>CGGCGCT))", None, 16384.0, None, None, 120713, 65, 37, None, None, None, None, None, "AGCGCCG", 7, "DNA", (), "https://identifiers.org/rebase:120713"),
+    ("Lmo911II", (None, None, None, None, "TAGRAG"), "(?=(?P<Lmo911II>TAG[AG]AG))|(?=(?P<Lmo911II_as>CT[CT]CTA))", None, 2048.0, None, None, 70499, 65, 37, None, None, None, None, None, "TAGRAG", 6, "DNA", (), "https://identifiers.org/rebase:70499"),
+    ("Lpl1004II", (None, None, None, None, "AGGRAG"), "(?=(?P<Lpl1004II>AGG[AG]AG))|(?=(?P<Lpl1004II_as>CT[CT]CCT))", None, 2048.0, None, None, 230500, 65, 37, None, None, None, None, None, "AGGRAG", 6, "DNA", (), "https://identifiers.org/rebase:230500"),
+    ("Lpn11417II", (None, None, None, None, "ACGAAT"), "(?=(?P<Lpn11417II>ACGAAT))|(?=(?P<Lpn11417II_as>ATTCGT))", None, 4096.0, None, None, 384822, 65, 37, None, None, None, None, None, "ACGAAT", 6, "DNA", (), "https://identifiers.org/rebase:384822"),
+    ("Lpn12272I", (None, None, None, None, "GCNCAAC"), "(?=(?P<Lpn12272I>GC.CAAC))|(?=(?P<Lpn12272I_as>GTTG.GC))", None, 4096.0, None, None, 255200, 65, 37, None, None, None, None, None, "GCNCAAC", 7, "DNA", (), "https://identifiers.org/rebase:255200"),
+    ("LpnI", (3, -3, None, None, "RGCGCY"), "(?=(?P<LpnI>[AG]GCGC[CT]))", None, 1024.0, -3, 3, 1191, 65, 37, 0, "", None, None, None, "RGCGCY", 6, "DNA", (), "https://identifiers.org/rebase:1191"),
+    ("LpnPI", (14, 14, None, None, "CCDG"), "(?=(?P<LpnPI>CC[AGT]G))|(?=(?P<LpnPI_as>C[ACT]GG))", None, 85.33333333333333, 14, 14, 23358, 65, 37, -4, "NNNN", None, None, None, "CCDG", 4, "DNA", ("N",), "https://identifiers.org/rebase:23358"),
+    ("Lra68I", (None, None, None, None, "GTTCNAG"), "(?=(?P<Lra68I>GTTC.AG))|(?=(?P<Lra68I_as>CT.GAAC))", None, 4096.0, None, None, 216189, 65, 37, None, None, None, None, None, "GTTCNAG", 7, "DNA", (), "https://identifiers.org/rebase:216189"),
+    ("LsaDS4I", (None, None, None, None, "TGGAAT"), "(?=(?P<LsaDS4I>TGGAAT))|(?=(?P<LsaDS4I_as>ATTCCA))", None, 4096.0, None, None, 231367, 65, 37, None, None, None, None, None, "TGGAAT", 6, "DNA", (), "https://identifiers.org/rebase:231367"),
+    ("Lsp1109I", (13, 12, None, None, "GCAGC"), "(?=(?P<Lsp1109I>GCAGC))|(?=(?P<Lsp1109I_as>GCTGC))", None, 1024.0, 12, 13, 1193, 65, 37, -4, "NNNN", None, None, None, "GCAGC", 5, "DNA", ("B",), "https://identifiers.org/rebase:1193"),
+    ("Lsp48III", (None, None, None, None, "AGCACC"), "(?=(?P<Lsp48III>AGCACC))|(?=(?P<Lsp48III_as>GGTGCT))", None, 4096.0, None, None, 77633, 65, 37, None, None, None, None, None, "AGCACC", 6, "DNA", (), "https://identifiers.org/rebase:77633"),
+    ("Lsp6406VI", (None, None, None, None, "CRAGCAC"), "(?=(?P<Lsp6406VI>C[AG]AGCAC))|(?=(?P<Lsp6406VI_as>GTGCT[CT]G))", None, 8192.0, None, None, 53027, 65, 37, None, None, None, None, None, "CRAGCAC", 7, "DNA", (), "https://identifiers.org/rebase:53027"),
+    ("LweI", (10, 9, None, None, "GCATC"), "(?=(?P<LweI>GCATC))|(?=(?P<LweI_as>GATGC))", None, 1024.0, 9, 10, 4808, 65, 37, -4, "NNNN", None, None, None, "GCATC", 5, "DNA", ("B",), "https://identifiers.org/rebase:4808"),
+    ("MabI", (1, -1, None, None, "ACCWGGT"), "(?=(?P<MabI>ACC[AT]GGT))", None, 8192.0, -1, 1, 4915, 65, 37, -5, "CCWGG", None, None, None, "ACCWGGT", 7, "DNA", ("I",), "https://identifiers.org/rebase:4915"),
+    ("MaeI", (1, -1, None, None, "CTAG"), "(?=(?P<MaeI>CTAG))", None, 256.0, -1, 1, 1197, 65, 37, -2, "TA", None, None, None, "CTAG", 4, "DNA", ("M",), "https://identifiers.org/rebase:1197"),
+    ("MaeII", (1, -1, None, None, "ACGT"), "(?=(?P<MaeII>ACGT))", None, 256.0, -1, 1, 1198, 65, 37, -2, "CG", None, None, None, "ACGT", 4, "DNA", ("M",), "https://identifiers.org/rebase:1198"),
+    ("MaeIII", (0, 0, None, None, "GTNAC"), "(?=(?P<MaeIII>GT.AC))", None, 256.0, 0, 0, 1199, 65, 37, -5, "GTNAC", None, None, None, "GTNAC", 5, "DNA", ("M", "S"), "https://identifiers.org/rebase:1199"),
+    ("MalI", (2, -2, None, None, "GATC"), "(?=(?P<MalI>GATC))", None, 256.0, -2, 2, 10872, 65, 37, 0, "", None, None, None, "GATC", 4, "DNA", ("I",), "https://identifiers.org/rebase:10872"),
+    ("MaqI", (28, 19, None, None, "CRTTGAC"), "(?=(?P<MaqI>C[AG]TTGAC))|(?=(?P<MaqI_as>GTCAA[CT]G))", None, 8192.0, 19, 28, 16957, 65, 37, 2, "NN", None, None, None, "CRTTGAC", 7, "DNA", (), "https://identifiers.org/rebase:16957"),
+    ("MauBI", (2, -2, None, None, "CGCGCGCG"), "(?=(?P<MauBI>CGCGCGCG))", None, 65536.0, -2, 2, 14905, 65, 37, -4, "CGCG", None, None, None, "CGCGCGCG", 8, "DNA", ("B",), "https://identifiers.org/rebase:14905"),
+    ("Mba11I", (None, None, None, None, "AGGCGA"), "(?=(?P<Mba11I>AGGCGA))|(?=(?P<Mba11I_as>TCGCCT))", None, 4096.0, None, None, 52943, 65, 37, None, None, None, None, None, "AGGCGA", 6, "DNA", (), "https://identifiers.org/rebase:52943"),
+    ("MbiI", (3, -3, None, None, "CCGCTC"), "(?=(?P<MbiI>CCGCTC))|(?=(?P<MbiI_as>GAGCGG))", None, 4096.0, -3, 3, 2983, 65, 37, 0, "", None, None, None, "CCGCTC", 6, "DNA", ("B",), "https://identifiers.org/rebase:2983"),
+    ("MboI", (0, 0, None, None, "GATC"), "(?=(?P<MboI>GATC))", None, 256.0, 0, 0, 1204, 65, 37, -4, "GATC", None, None, None, "GATC", 4, "DNA", ("B", "C", "K", "N", "Q", "R", "X", "Y"), "https://identifiers.org/rebase:1204"),
+    ("MboII", (13, 7, None, None, "GAAGA"), "(?=(?P<MboII>GAAGA))|(?=(?P<MboII_as>TCTTC))", None, 1024.0, 7, 13, 1205, 65, 37, 1, "N", None, None, None, "GAAGA", 5, "DNA", ("B", "I", "J", "K", "N", "Q", "V", "X"), "https://identifiers.org/rebase:1205"),
+    ("McaTI", (4, -4, None, None, "GCGCGC"), "(?=(?P<McaTI>GCGCGC))", None, 4096.0, -4, 4, 11763, 65, 37, 2, "GC", None, None, None, "GCGCGC", 6, "DNA", (), "https://identifiers.org/rebase:11763"),
+    ("Mch10819I", (None, None, None, None, "CYCAGCG"), "(?=(?P<Mch10819I>C[CT]CAGCG))|(?=(?P<Mch10819I_as>CGCTG[AG]G))", None, 8192.0, None, None, 405173, 65, 37, None, None, None, None, None, "CYCAGCG", 7, "DNA", (), "https://identifiers.org/rebase:405173"),
+    ("Mch946II", (None, None, None, None, "WCGATCT"), "(?=(?P<Mch946II>[AT]CGATCT))|(?=(?P<Mch946II_as>AGATCG[AT]))", None, 8192.0, None, None, 287585, 65, 37, None, None, None, None, None, "WCGATCT", 7, "DNA", (), "https://identifiers.org/rebase:287585"),
+    ("McrI", (4, -4, None, None, "CGRYCG"), "(?=(?P<McrI>CG[AG][CT]CG))", None, 1024.0, -4, 4, 1210, 65, 37, 2, "RY", None, None, None, "CGRYCG", 6, "DNA", (), "https://identifiers.org/rebase:1210"),
+    ("MfeI", (1, -1, None, None, "CAATTG"), "(?=(?P<MfeI>CAATTG))", None, 4096.0, -1, 1, 1213, 65, 37, -4, "AATT", None, None, None, "CAATTG", 6, "DNA", ("I", "N"), "https://identifiers.org/rebase:1213"),
+    ("MflI", (1, -1, None, None, "RGATCY"), "(?=(?P<MflI>[AG]GATC[CT]))", None, 1024.0, -1, 1, 1214, 65, 37, -4, "GATC", None, None, None, "RGATCY", 6, "DNA", ("K",), "https://identifiers.org/rebase:1214"),
+    ("MhlI", (5, -5, None, None, "GDGCHC"), "(?=(?P<MhlI>G[AGT]GC[ACT]C))", None, 455.1111111111111, -5, 5, 4839, 65, 37, 4, "DGCH", None, None, None, "GDGCHC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:4839"),
+    ("MjaIV", (None, None, None, None, "GTNNAC"), "(?=(?P<MjaIV>GT..AC))", None, 256.0, None, None, 3894, 65, 37, None, None, None, None, None, "GTNNAC", 6, "DNA", (), "https://identifiers.org/rebase:3894"),
+    ("MkaDII", (None, None, None, None, "GAGAYGT"), "(?=(?P<MkaDII>GAGA[CT]GT))|(?=(?P<MkaDII_as>AC[AG]TCTC))", None, 8192.0, None, None, 71719, 65, 37, None, None, None, None, None, "GAGAYGT", 7, "DNA", (), "https://identifiers.org/rebase:71719"),
+    ("Mla10359I", (None, None, None, None, "CGANNNNNNTCA"), "(?=(?P<Mla10359I>CGA......TCA))|(?=(?P<Mla10359I_as>TGA......TCG))", None, 4096.0, None, None, 405174, 65, 37, None, None, None, None, None, "CGANNNNNNTCA", 12, "DNA", (), "https://identifiers.org/rebase:405174"),
+    ("MlsI", (3, -3, None, None, "TGGCCA"), "(?=(?P<MlsI>TGGCCA))", None, 4096.0, -3, 3, 2985, 65, 37, 0, "", None, None, None, "TGGCCA", 6, "DNA", ("B",), "https://identifiers.org/rebase:2985"),
+    ("Mlu211III", (None, None, None, None, "AGCCCA"), "(?=(?P<Mlu211III>AGCCCA))|(?=(?P<Mlu211III_as>TGGGCT))", None, 4096.0, None, None, 275236, 65, 37, None, None, None, None, None, "AGCCCA", 6, "DNA", (), "https://identifiers.org/rebase:275236"),
+    ("MluCI", (0, 0, None, None, "AATT"), "(?=(?P<MluCI>AATT))", None, 256.0, 0, 0, 4630, 65, 37, -4, "AATT", None, None, None, "AATT", 4, "DNA", ("N",), "https://identifiers.org/rebase:4630"),
+    ("MluI", (1, -1, None, None, "ACGCGT"), "(?=(?P<MluI>ACGCGT))", None, 4096.0, -1, 1, 1236, 65, 37, -4, "CGCG", None, None, None, "ACGCGT", 6, "DNA", ("B", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V"), "https://identifiers.org/rebase:1236"),
+    ("MluNI", (3, -3, None, None, "TGGCCA"), "(?=(?P<MluNI>TGGCCA))", None, 4096.0, -3, 3, 1266, 65, 37, 0, "", None, None, None, "TGGCCA", 6, "DNA", ("M",), "https://identifiers.org/rebase:1266"),
+    ("Mly113I", (2, -2, None, None, "GGCGCC"), "(?=(?P<Mly113I>GGCGCC))", None, 4096.0, -2, 2, 1237, 65, 37, -2, "CG", None, None, None, "GGCGCC", 6, "DNA", ("I",), "https://identifiers.org/rebase:1237"),
+    ("MlyI", (10, 5, None, None, "GAGTC"), "(?=(?P<MlyI>GAGTC))|(?=(?P<MlyI_as>GACTC))", None, 1024.0, 5, 10, 1238, 65, 37, 0, "", None, None, None, "GAGTC", 5, "DNA", ("N",), "https://identifiers.org/rebase:1238"),
+    ("MmeI", (26, 18, None, None, "TCCRAC"), "(?=(?P<MmeI>TCC[AG]AC))|(?=(?P<MmeI_as>GT[CT]GGA))", None, 2048.0, 18, 26, 1239, 65, 37, 2, "NN", None, None, None, "TCCRAC", 6, "DNA", ("N", "X"), "https://identifiers.org/rebase:1239"),
+    ("MnlI", (11, 6, None, None, "CCTC"), "(?=(?P<MnlI>CCTC))|(?=(?P<MnlI_as>GAGG))", None, 256.0, 6, 11, 1243, 65, 37, 1, "N", None, None, None, "CCTC", 4, "DNA", ("B", "I", "N", "Q", "V", "X"), "https://identifiers.org/rebase:1243"),
+    ("Mox20I", (3, -3, None, None, "TGGCCA"), "(?=(?P<Mox20I>TGGCCA))", None, 4096.0, -3, 3, 85920, 65, 37, 0, "", None, None, None, "TGGCCA", 6, "DNA", ("I",), "https://identifiers.org/rebase:85920"),
+    ("Mph1103I", (5, -5, None, None, "ATGCAT"), "(?=(?P<Mph1103I>ATGCAT))", None, 4096.0, -5, 5, 1252, 65, 37, 4, "TGCA", None, None, None, "ATGCAT", 6, "DNA", ("B",), "https://identifiers.org/rebase:1252"),
+    ("MreI", (2, -2, None, None, "CGCCGGCG"), "(?=(?P<MreI>CGCCGGCG))", None, 65536.0, -2, 2, 10918, 65, 37, -4, "CCGG", None, None, None, "CGCCGGCG", 8, "DNA", ("B",), "https://identifiers.org/rebase:10918"),
+    ("MroI", (1, -1, None, None, "TCCGGA"), "(?=(?P<MroI>TCCGGA))", None, 4096.0, -1, 1, 1258, 65, 37, -4, "CCGG", None, None, None, "TCCGGA", 6, "DNA", ("M", "O"), "https://identifiers.org/rebase:1258"),
+    ("MroNI", (1, -1, None, None, "GCCGGC"), "(?=(?P<MroNI>GCCGGC))", None, 4096.0, -1, 1, 2676, 65, 37, -4, "CCGG", None, None, None, "GCCGGC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2676"),
+    ("MroXI", (5, -5, None, None, "GAANNNNTTC"), "(?=(?P<MroXI>GAA....TTC))", None, 4096.0, -5, 5, 2857, 65, 37, 0, "", None, None, None, "GAANNNNTTC", 10, "DNA", ("I", "V"), "https://identifiers.org/rebase:2857"),
+    ("MscI", (3, -3, None, None, "TGGCCA"), "(?=(?P<MscI>TGGCCA))", None, 4096.0, -3, 3, 1261, 65, 37, 0, "", None, None, None, "TGGCCA", 6, "DNA", ("N", "O"), "https://identifiers.org/rebase:1261"),
+    ("MseI", (1, -1, None, None, "TTAA"), "(?=(?P<MseI>TTAA))", None, 256.0, -1, 1, 1262, 65, 37, -2, "TA", None, None, None, "TTAA", 4, "DNA", ("N",), "https://identifiers.org/rebase:1262"),
+    ("MslI", (5, -5, None, None, "CAYNNNNRTG"), "(?=(?P<MslI>CA[CT]....[AG]TG))", None, 1024.0, -5, 5, 1265, 65, 37, 0, "", None, None, None, "CAYNNNNRTG", 10, "DNA", ("N",), "https://identifiers.org/rebase:1265"),
+    ("Msp20I", (3, -3, None, None, "TGGCCA"), "(?=(?P<Msp20I>TGGCCA))", None, 4096.0, -3, 3, 2597, 65, 37, 0, "", None, None, None, "TGGCCA", 6, "DNA", ("V",), "https://identifiers.org/rebase:2597"),
+    ("MspA1I", (3, -3, None, None, "CMGCKG"), "(?=(?P<MspA1I>C[AC]GC[GT]G))", None, 1024.0, -3, 3, 1272, 65, 37, 0, "", None, None, None, "CMGCKG", 6, "DNA", ("I", "N", "V"), "https://identifiers.org/rebase:1272"),
+    ("MspCI", (1, -1, None, None, "CTTAAG"), "(?=(?P<MspCI>CTTAAG))", None, 4096.0, -1, 1, 2161, 65, 37, -4, "TTAA", None, None, None, "CTTAAG", 6, "DNA", ("C",), "https://identifiers.org/rebase:2161"),
+    ("MspF392I", (None, None, None, None, "CCCAATV"), "(?=(?P<MspF392I>CCCAAT[ACG]))|(?=(?P<MspF392I_as>[CGT]ATTGGG))", None, 5461.333333333333, None, None, 385375, 65, 37, None, None, None, None, None, "CCCAATV", 7, "DNA", (), "https://identifiers.org/rebase:385375"),
+    ("MspGI", (5, -5, None, None, "GCCGGC"), "(?=(?P<MspGI>GCCGGC))", None, 4096.0, -5, 5, 218866, 65, 37, 4, "CCGG", None, None, None, "GCCGGC", 6, "DNA", (), "https://identifiers.org/rebase:218866"),
+    ("MspI", (1, -1, None, None, "CCGG"), "(?=(?P<MspI>CCGG))", None, 256.0, -1, 1, 1277, 65, 37, -2, "CG", None, None, None, "CCGG", 4, "DNA", ("B", "I", "J", "K", "N", "Q", "R", "V", "X"), "https://identifiers.org/rebase:1277"),
+    ("MspI7II", (None, None, None, None, "ACGRAG"), "(?=(?P<MspI7II>ACG[AG]AG))|(?=(?P<MspI7II_as>CT[CT]CGT))", None, 2048.0, None, None, 77641, 65, 37, None, None, None, None, None, "ACGRAG", 6, "DNA", (), "https://identifiers.org/rebase:77641"),
+    ("MspI7IV", (None, None, None, None, "GCMGAAG"), "(?=(?P<MspI7IV>GC[AC]GAAG))|(?=(?P<MspI7IV_as>CTTC[GT]GC))", None, 8192.0, None, None, 77665, 65, 37, None, None, None, None, None, "GCMGAAG", 7, "DNA", (), "https://identifiers.org/rebase:77665"),
+    ("MspJI", (13, 13, None, None, "CNNR"), "(?=(?P<MspJI>C..[AG]))|(?=(?P<MspJI_as>[CT]..G))", None, 8.0, 13, 13, 18979, 65, 37, -4, "NNNN", None, None, None, "CNNR", 4, "DNA", ("N",), "https://identifiers.org/rebase:18979"),
+    ("MspR9I", (2, -2, None, None, "CCNGG"), "(?=(?P<MspR9I>CC.GG))", None, 256.0, -2, 2, 2678, 65, 37, -1, "N", None, None, None, "CCNGG", 5, "DNA", ("I",), "https://identifiers.org/rebase:2678"),
+    ("MspSC27II", (None, None, None, None, "CCGCGAC"), "(?=(?P<MspSC27II>CCGCGAC))|(?=(?P<MspSC27II_as>GTCGCGG))", None, 16384.0, None, None, 243902, 65, 37, None, None, None, None, None, "CCGCGAC", 7, "DNA", (), "https://identifiers.org/rebase:243902"),
+    ("MssI", (4, -4, None, None, "GTTTAAAC"), "(?=(?P<MssI>GTTTAAAC))", None, 65536.0, -4, 4, 3091, 65, 37, 0, "", None, None, None, "GTTTAAAC", 8, "DNA", ("B",), "https://identifiers.org/rebase:3091"),
+    ("MstI", (3, -3, None, None, "TGCGCA"), "(?=(?P<MstI>TGCGCA))", None, 4096.0, -3, 3, 1279, 65, 37, 0, "", None, None, None, "TGCGCA", 6, "DNA", (), "https://identifiers.org/rebase:1279"),
+    ("MteI", (4, -4, None, None, "GCGCNGCGC"), "(?=(?P<MteI>GCGC.GCGC))", None, 65536.0, -4, 4, 140117, 65, 37, -1, "N", None, None, None, "GCGCNGCGC", 9, "DNA", ("I",), "https://identifiers.org/rebase:140117"),
+    ("MtuHN878II", (None, None, None, None, "CACGCAG"), "(?=(?P<MtuHN878II>CACGCAG))|(?=(?P<MtuHN878II_as>CTGCGTG))", None, 16384.0, None, None, 74924, 65, 37, None, None, None, None, None, "CACGCAG", 7, "DNA", (), "https://identifiers.org/rebase:74924"),
+    ("MunI", (1, -1, None, None, "CAATTG"), "(?=(?P<MunI>CAATTG))", None, 4096.0, -1, 1, 1285, 65, 37, -4, "AATT", None, None, None, "CAATTG", 6, "DNA", ("B", "K", "M", "S"), "https://identifiers.org/rebase:1285"),
+    ("Mva1269I", (7, -1, None, None, "GAATGC"), "(?=(?P<Mva1269I>GAATGC))|(?=(?P<Mva1269I_as>GCATTC))", None, 4096.0, -1, 7, 1992, 65, 37, 2, "CN", None, None, None, "GAATGC", 6, "DNA", ("B",), "https://identifiers.org/rebase:1992"),
+    ("MvaI", (2, -2, None, None, "CCWGG"), "(?=(?P<MvaI>CC[AT]GG))", None, 512.0, -2, 2, 1287, 65, 37, -1, "W", None, None, None, "CCWGG", 5, "DNA", ("B", "M"), "https://identifiers.org/rebase:1287"),
+    ("MvnI", (2, -2, None, None, "CGCG"), "(?=(?P<MvnI>CGCG))", None, 256.0, -2, 2, 1290, 65, 37, 0, "", None, None, None, "CGCG", 4, "DNA", ("M",), "https://identifiers.org/rebase:1290"),
+    ("MwoI", (7, -7, None, None, "GCNNNNNNNGC"), "(?=(?P<MwoI>GC.......GC))", None, 256.0, -7, 7, 1291, 65, 37, 3, "NNN", None, None, None, "GCNNNNNNNGC", 11, "DNA", ("N",), "https://identifiers.org/rebase:1291"),
+    ("NaeI", (3, -3, None, None, "GCCGGC"), "(?=(?P<NaeI>GCCGGC))", None, 4096.0, -3, 3, 1294, 65, 37, 0, "", None, None, None, "GCCGGC", 6, "DNA", ("C", "K", "N"), "https://identifiers.org/rebase:1294"),
+    ("Nal45188II", (None, None, None, None, "ACCAGC"), "(?=(?P<Nal45188II>ACCAGC))|(?=(?P<Nal45188II_as>GCTGGT))", None, 4096.0, None, None, 53140, 65, 37, None, None, None, None, None, "ACCAGC", 6, "DNA", (), "https://identifiers.org/rebase:53140"),
+    ("Nan12227I", (None, None, None, None, "CCANNNNNNTCY"), "(?=(?P<Nan12227I>CCA......TC[CT]))|(?=(?P<Nan12227I_as>[AG]GA......TGG))", None, 2048.0, None, None, 290013, 65, 37, None, None, None, None, None, "CCANNNNNNTCY", 12, "DNA", (), "https://identifiers.org/rebase:290013"),
+    ("NarI", (2, -2, None, None, "GGCGCC"), "(?=(?P<NarI>GGCGCC))", None, 4096.0, -2, 2, 1298, 65, 37, -2, "CG", None, None, None, "GGCGCC", 6, "DNA", ("J", "M", "N", "Q", "X"), "https://identifiers.org/rebase:1298"),
+    ("Nbr128II", (None, None, None, None, "ACCGAC"), "(?=(?P<Nbr128II>ACCGAC))|(?=(?P<Nbr128II_as>GTCGGT))", None, 4096.0, None, None, 124782, 65, 37, None, None, None, None, None, "ACCGAC", 6, "DNA", (), "https://identifiers.org/rebase:124782"),
+    ("NciI", (2, -2, None, None, "CCSGG"), "(?=(?P<NciI>CC[CG]GG))", None, 512.0, -2, 2, 1307, 65, 37, -1, "S", None, None, None, "CCSGG", 5, "DNA", ("J", "N"), "https://identifiers.org/rebase:1307"),
+    ("NcoI", (1, -1, None, None, "CCATGG"), "(?=(?P<NcoI>CCATGG))", None, 4096.0, -1, 1, 1308, 65, 37, -4, "CATG", None, None, None, "CCATGG", 6, "DNA", ("B", "C", "J", "K", "M", "N", "O", "Q", "R", "S", "X", "Y"), "https://identifiers.org/rebase:1308"),
+    ("NdeI", (2, -2, None, None, "CATATG"), "(?=(?P<NdeI>CATATG))", None, 4096.0, -2, 2, 1312, 65, 37, -2, "TA", None, None, None, "CATATG", 6, "DNA", ("B", "J", "K", "M", "N", "Q", "R", "S", "X"), "https://identifiers.org/rebase:1312"),
+    ("NdeII", (0, 0, None, None, "GATC"), "(?=(?P<NdeII>GATC))", None, 256.0, 0, 0, 1313, 65, 37, -4, "GATC", None, None, None, "GATC", 4, "DNA", ("J", "M"), "https://identifiers.org/rebase:1313"),
+    ("NgoAVII", (12, 7, None, None, "GCCGC"), "(?=(?P<NgoAVII>GCCGC))|(?=(?P<NgoAVII_as>GCGGC))", None, 1024.0, 7, 12, 5857, 65, 37, 0, "", None, None, None, "GCCGC", 5, "DNA", (), "https://identifiers.org/rebase:5857"),
+    ("NgoAVIII", (-12, -25, 24, 11, "GACNNNNNTGA"), "(?=(?P<NgoAVIII>GAC.....TGA))|(?=(?P<NgoAVIII_as>TCA.....GTC))", None, 4096.0, -25, -12, 12957, 65, 37, 2, "NN", None, 11, 24, "GACNNNNNTGA", 11, "DNA", (), "https://identifiers.org/rebase:12957"),
+    ("NgoMIV", (1, -1, None, None, "GCCGGC"), "(?=(?P<NgoMIV>GCCGGC))", None, 4096.0, -1, 1, 1330, 65, 37, -4, "CCGG", None, None, None, "GCCGGC", 6, "DNA", ("N",), "https://identifiers.org/rebase:1330"),
+    ("NhaXI", (None, None, None, None, "CAAGRAG"), "(?=(?P<NhaXI>CAAG[AG]AG))|(?=(?P<NhaXI_as>CT[CT]CTTG))", None, 8192.0, None, None, 17300, 65, 37, None, None, None, None, None, "CAAGRAG", 7, "DNA", (), "https://identifiers.org/rebase:17300"),
+    ("NheI", (1, -1, None, None, "GCTAGC"), "(?=(?P<NheI>GCTAGC))", None, 4096.0, -1, 1, 1335, 65, 37, -4, "CTAG", None, None, None, "GCTAGC", 6, "DNA", ("B", "C", "J", "K", "M", "N", "O", "Q", "R", "S", "X"), "https://identifiers.org/rebase:1335"),
+    ("NhoI", (None, None, None, None, "GCWGC"), "(?=(?P<NhoI>GC[AT]GC))", None, 512.0, None, None, 127135, 65, 37, None, None, None, None, None, "GCWGC", 5, "DNA", (), "https://identifiers.org/rebase:127135"),
+    ("NlaCI", (25, 17, None, None, "CATCAC"), "(?=(?P<NlaCI>CATCAC))|(?=(?P<NlaCI_as>GTGATG))", None, 4096.0, 17, 25, 14145, 65, 37, 2, "NN", None, None, None, "CATCAC", 6, "DNA", (), "https://identifiers.org/rebase:14145"),
+    ("NlaIII", (4, -4, None, None, "CATG"), "(?=(?P<NlaIII>CATG))", None, 256.0, -4, 4, 1341, 65, 37, 4, "CATG", None, None, None, "CATG", 4, "DNA", ("N",), "https://identifiers.org/rebase:1341"),
+    ("NlaIV", (3, -3, None, None, "GGNNCC"), "(?=(?P<NlaIV>GG..CC))", None, 256.0, -3, 3, 1342, 65, 37, 0, "", None, None, None, "GGNNCC", 6, "DNA", ("N",), "https://identifiers.org/rebase:1342"),
+    ("Nli3877I", (5, -5, None, None, "CYCGRG"), "(?=(?P<Nli3877I>C[CT]CG[AG]G))", None, 1024.0, -5, 5, 1345, 65, 37, 4, "YCGR", None, None, None, "CYCGRG", 6, "DNA", (), "https://identifiers.org/rebase:1345"),
+    ("NmeA6CIII", (27, 19, None, None, "GCCGAC"), "(?=(?P<NmeA6CIII>GCCGAC))|(?=(?P<NmeA6CIII_as>GTCGGC))", None, 4096.0, 19, 27, 17628, 65, 37, 2, "NN", None, None, None, "GCCGAC", 6, "DNA", (), "https://identifiers.org/rebase:17628"),
+    ("NmeAIII", (27, 19, None, None, "GCCGAG"), "(?=(?P<NmeAIII>GCCGAG))|(?=(?P<NmeAIII_as>CTCGGC))", None, 4096.0, 19, 27, 13448, 65, 37, 2, "NN", None, None, None, "GCCGAG", 6, "DNA", ("N",), "https://identifiers.org/rebase:13448"),
+    ("NmeDI", (-12, -13, 13, 12, "RCCGGY"), "(?=(?P<NmeDI>[AG]CCGG[CT]))", None, 1024.0, -13, -12, 4187, 65, 37, -5, "NNNNN", None, 12, 13, "RCCGGY", 6, "DNA", (), "https://identifiers.org/rebase:4187"),
+    ("NmuCI", (0, 0, None, None, "GTSAC"), "(?=(?P<NmuCI>GT[CG]AC))", None, 512.0, 0, 0, 4108, 65, 37, -5, "GTSAC", None, None, None, "GTSAC", 5, "DNA", ("B",), "https://identifiers.org/rebase:4108"),
+    ("NotI", (2, -2, None, None, "GCGGCCGC"), "(?=(?P<NotI>GCGGCCGC))", None, 65536.0, -2, 2, 1367, 65, 37, -4, "GGCC", None, None, None, "GCGGCCGC", 8, "DNA", ("B", "C", "J", "K", "M", "N", "O", "Q", "R", "S", "X"), "https://identifiers.org/rebase:1367"),
+    ("NpeUS61II", (None, None, None, None, "GATCGAC"), "(?=(?P<NpeUS61II>GATCGAC))|(?=(?P<NpeUS61II_as>GTCGATC))", None, 16384.0, None, None, 42152, 65, 37, None, None, None, None, None, "GATCGAC", 7, "DNA", (), "https://identifiers.org/rebase:42152"),
+    ("NruI", (3, -3, None, None, "TCGCGA"), "(?=(?P<NruI>TCGCGA))", None, 4096.0, -3, 3, 1371, 65, 37, 0, "", None, None, None, "TCGCGA", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "Q", "S", "X"), "https://identifiers.org/rebase:1371"),
+    ("NsbI", (3, -3, None, None, "TGCGCA"), "(?=(?P<NsbI>TGCGCA))", None, 4096.0, -3, 3, 2986, 65, 37, 0, "", None, None, None, "TGCGCA", 6, "DNA", ("B",), "https://identifiers.org/rebase:2986"),
+    ("NsiI", (5, -5, None, None, "ATGCAT"), "(?=(?P<NsiI>ATGCAT))", None, 4096.0, -5, 5, 1375, 65, 37, 4, "TGCA", None, None, None, "ATGCAT", 6, "DNA", ("J", "M", "N", "Q", "S", "X"), "https://identifiers.org/rebase:1375"),
+    ("NspBII", (3, -3, None, None, "CMGCKG"), "(?=(?P<NspBII>C[AC]GC[GT]G))", None, 1024.0, -3, 3, 1381, 65, 37, 0, "", None, None, None, "CMGCKG", 6, "DNA", (), "https://identifiers.org/rebase:1381"),
+    ("NspES21II", (None, None, None, None, "CRTTCAG"), "(?=(?P<NspES21II>C[AG]TTCAG))|(?=(?P<NspES21II_as>CTGAA[CT]G))", None, 8192.0, None, None, 457016, 65, 37, None, None, None, None, None, "CRTTCAG", 7, "DNA", (), "https://identifiers.org/rebase:457016"),
+    ("NspI", (5, -5, None, None, "RCATGY"), "(?=(?P<NspI>[AG]CATG[CT]))", None, 1024.0, -5, 5, 1391, 65, 37, 4, "CATG", None, None, None, "RCATGY", 6, "DNA", ("N",), "https://identifiers.org/rebase:1391"),
+    ("NspV", (2, -2, None, None, "TTCGAA"), "(?=(?P<NspV>TTCGAA))", None, 4096.0, -2, 2, 1407, 65, 37, -2, "CG", None, None, None, "TTCGAA", 6, "DNA", ("J",), "https://identifiers.org/rebase:1407"),
+    ("ObaBS10I", (None, None, None, None, "ACGAG"), "(?=(?P<ObaBS10I>ACGAG))|(?=(?P<ObaBS10I_as>CTCGT))", None, 1024.0, None, None, 268727, 65, 37, None, None, None, None, None, "ACGAG", 5, "DNA", (), "https://identifiers.org/rebase:268727"),
+    ("OgrI", (None, None, None, None, "CAACNAC"), "(?=(?P<OgrI>CAAC.AC))|(?=(?P<OgrI_as>GT.GTTG))", None, 4096.0, None, None, 26679, 65, 37, None, None, None, None, None, "CAACNAC", 7, "DNA", (), "https://identifiers.org/rebase:26679"),
+    ("OliI", (5, -5, None, None, "CACNNNNGTG"), "(?=(?P<OliI>CAC....GTG))", None, 4096.0, -5, 5, 4547, 65, 37, 0, "", None, None, None, "CACNNNNGTG", 10, "DNA", ("B",), "https://identifiers.org/rebase:4547"),
+    ("OspHL35III", (None, None, None, None, "YAGGAG"), "(?=(?P<OspHL35III>[CT]AGGAG))|(?=(?P<OspHL35III_as>CTCCT[AG]))", None, 2048.0, None, None, 67650, 65, 37, None, None, None, None, None, "YAGGAG", 6, "DNA", (), "https://identifiers.org/rebase:67650"),
+    ("PabI", (3, -3, None, None, "GTAC"), "(?=(?P<PabI>GTAC))", None, 256.0, -3, 3, 11107, 65, 37, 2, "TA", None, None, None, "GTAC", 4, "DNA", (), "https://identifiers.org/rebase:11107"),
+    ("Pac19842II", (None, None, None, None, "CCTTGA"), "(?=(?P<Pac19842II>CCTTGA))|(?=(?P<Pac19842II_as>TCAAGG))", None, 4096.0, None, None, 64405, 65, 37, None, None, None, None, None, "CCTTGA", 6, "DNA", (), "https://identifiers.org/rebase:64405"),
+    ("PacI", (5, -5, None, None, "TTAATTAA"), "(?=(?P<PacI>TTAATTAA))", None, 65536.0, -5, 5, 1424, 65, 37, 2, "AT", None, None, None, "TTAATTAA", 8, "DNA", ("B", "N", "O"), "https://identifiers.org/rebase:1424"),
+    ("PacIII", (None, None, None, None, "GTAATC"), "(?=(?P<PacIII>GTAATC))|(?=(?P<PacIII_as>GATTAC))", None, 4096.0, None, None, 144691, 65, 37, None, None, None, None, None, "GTAATC", 6, "DNA", (), "https://identifiers.org/rebase:144691"),
+    ("Pae10662III", (None, None, None, None, "TGACGAG"), "(?=(?P<Pae10662III>TGACGAG))|(?=(?P<Pae10662III_as>CTCGTCA))", None, 16384.0, None, None, 415783, 65, 37, None, None, None, None, None, "TGACGAG", 7, "DNA", (), "https://identifiers.org/rebase:415783"),
+    ("Pae8506I", (None, None, None, None, "CATCGAR"), "(?=(?P<Pae8506I>CATCGA[AG]))|(?=(?P<Pae8506I_as>[CT]TCGATG))", None, 8192.0, None, None, 414138, 65, 37, None, None, None, None, None, "CATCGAR", 7, "DNA", (), "https://identifiers.org/rebase:414138"),
+    ("PaeI", (5, -5, None, None, "GCATGC"), "(?=(?P<PaeI>GCATGC))", None, 4096.0, -5, 5, 1448, 65, 37, 4, "CATG", None, None, None, "GCATGC", 6, "DNA", ("B",), "https://identifiers.org/rebase:1448"),
+    ("PaePA99III", (None, None, None, None, "AAGAYC"), "(?=(?P<PaePA99III>AAGA[CT]C))|(?=(?P<PaePA99III_as>G[AG]TCTT))", None, 2048.0, None, None, 334217, 65, 37, None, None, None, None, None, "AAGAYC", 6, "DNA", (), "https://identifiers.org/rebase:334217"),
+    ("PaeR7I", (1, -1, None, None, "CTCGAG"), "(?=(?P<PaeR7I>CTCGAG))", None, 4096.0, -1, 1, 1451, 65, 37, -4, "TCGA", None, None, None, "CTCGAG", 6, "DNA", ("N",), "https://identifiers.org/rebase:1451"),
+    ("PagI", (1, -1, None, None, "TCATGA"), "(?=(?P<PagI>TCATGA))", None, 4096.0, -1, 1, 2989, 65, 37, -4, "CATG", None, None, None, "TCATGA", 6, "DNA", ("B",), "https://identifiers.org/rebase:2989"),
+    ("Pal408I", (None, None, None, None, "CCRTGAG"), "(?=(?P<Pal408I>CC[AG]TGAG))|(?=(?P<Pal408I_as>CTCA[CT]GG))", None, 8192.0, None, None, 77800, 65, 37, None, None, None, None, None, "CCRTGAG", 7, "DNA", (), "https://identifiers.org/rebase:77800"),
+    ("PalAI", (2, -2, None, None, "GGCGCGCC"), "(?=(?P<PalAI>GGCGCGCC))", None, 65536.0, -2, 2, 10829, 65, 37, -4, "CGCG", None, None, None, "GGCGCGCC", 8, "DNA", ("I",), "https://identifiers.org/rebase:10829"),
+    ("PaqCI", (11, 8, None, None, "CACCTGC"), "(?=(?P<PaqCI>CACCTGC))|(?=(?P<PaqCI_as>GCAGGTG))", None, 16384.0, 8, 11, 266039, 65, 37, -4, "NNNN", None, None, None, "CACCTGC", 7, "DNA", ("N",), "https://identifiers.org/rebase:266039"),
+    ("PasI", (2, -2, None, None, "CCCWGGG"), "(?=(?P<PasI>CCC[AT]GGG))", None, 8192.0, -2, 2, 7401, 65, 37, -3, "CWG", None, None, None, "CCCWGGG", 7, "DNA", ("B",), "https://identifiers.org/rebase:7401"),
+    ("PauI", (1, -1, None, None, "GCGCGC"), "(?=(?P<PauI>GCGCGC))", None, 4096.0, -1, 1, 2574, 65, 37, -4, "CGCG", None, None, None, "GCGCGC", 6, "DNA", ("B",), "https://identifiers.org/rebase:2574"),
+    ("Pba2294I", (None, None, None, None, "GTAAG"), "(?=(?P<Pba2294I>GTAAG))|(?=(?P<Pba2294I_as>CTTAC))", None, 1024.0, None, None, 246929, 65, 37, None, None, None, None, None, "GTAAG", 5, "DNA", (), "https://identifiers.org/rebase:246929"),
+    ("Pbu13063II", (None, None, None, None, "GTATYC"), "(?=(?P<Pbu13063II>GTAT[CT]C))|(?=(?P<Pbu13063II_as>G[AG]ATAC))", None, 2048.0, None, None, 409629, 65, 37, None, None, None, None, None, "GTATYC", 6, "DNA", (), "https://identifiers.org/rebase:409629"),
+    ("PcaII", (None, None, None, None, "GACGAG"), "(?=(?P<PcaII>GACGAG))|(?=(?P<PcaII_as>CTCGTC))", None, 4096.0, None, None, 33508, 65, 37, None, None, None, None, None, "GACGAG", 6, "DNA", (), "https://identifiers.org/rebase:33508"),
+    ("PceI", (3, -3, None, None, "AGGCCT"), "(?=(?P<PceI>AGGCCT))", None, 4096.0, -3, 3, 5318, 65, 37, 0, "", None, None, None, "AGGCCT", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:5318"),
+    ("PciI", (1, -1, None, None, "ACATGT"), "(?=(?P<PciI>ACATGT))", None, 4096.0, -1, 1, 3773, 65, 37, -4, "CATG", None, None, None, "ACATGT", 6, "DNA", ("I", "N"), "https://identifiers.org/rebase:3773"),
+    ("PciSI", (8, 4, None, None, "GCTCTTC"), "(?=(?P<PciSI>GCTCTTC))|(?=(?P<PciSI_as>GAAGAGC))", None, 16384.0, 4, 8, 11886, 65, 37, -3, "NNN", None, None, None, "GCTCTTC", 7, "DNA", ("I",), "https://identifiers.org/rebase:11886"),
+    ("Pcr308II", (None, None, None, None, "CCAAAG"), "(?=(?P<Pcr308II>CCAAAG))|(?=(?P<Pcr308II_as>CTTTGG))", None, 4096.0, None, None, 208811, 65, 37, None, None, None, None, None, "CCAAAG", 6, "DNA", (), "https://identifiers.org/rebase:208811"),
+    ("PcsI", (7, -7, None, None, "WCGNNNNNNNCGW"), "(?=(?P<PcsI>[AT]CG.......CG[AT]))", None, 1024.0, -7, 7, 23597, 65, 37, 1, "N", None, None, None, "WCGNNNNNNNCGW", 13, "DNA", ("I",), "https://identifiers.org/rebase:23597"),
+    ("PctI", (7, -1, None, None, "GAATGC"), "(?=(?P<PctI>GAATGC))|(?=(?P<PctI_as>GCATTC))", None, 4096.0, -1, 7, 4840, 65, 37, 2, "CN", None, None, None, "GAATGC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:4840"),
+    ("Pdi8503III", (None, None, None, None, "CCGGNAG"), "(?=(?P<Pdi8503III>CCGG.AG))|(?=(?P<Pdi8503III_as>CT.CCGG))", None, 4096.0, None, None, 15666, 65, 37, None, None, None, None, None, "CCGGNAG", 7, "DNA", (), "https://identifiers.org/rebase:15666"),
+    ("PdiI", (3, -3, None, None, "GCCGGC"), "(?=(?P<PdiI>GCCGGC))", None, 4096.0, -3, 3, 4109, 65, 37, 0, "", None, None, None, "GCCGGC", 6, "DNA", ("B",), "https://identifiers.org/rebase:4109"),
+    ("PdmI", (5, -5, None, None, "GAANNNNTTC"), "(?=(?P<PdmI>GAA....TTC))", None, 4096.0, -5, 5, 4110, 65, 37, 0, "", None, None, None, "GAANNNNTTC", 10, "DNA", ("B",), "https://identifiers.org/rebase:4110"),
+    ("Pdu1735I", (None, None, None, None, "CACCAC"), "(?=(?P<Pdu1735I>CACCAC))|(?=(?P<Pdu1735I_as>GTGGTG))", None, 4096.0, None, None, 93532, 65, 37, None, None, None, None, None, "CACCAC", 6, "DNA", (), "https://identifiers.org/rebase:93532"),
+    ("PenI", (None, None, None, None, "GCAGT"), "(?=(?P<PenI>GCAGT))|(?=(?P<PenI_as>ACTGC))", None, 1024.0, None, None, 38313, 65, 37, None, None, None, None, None, "GCAGT", 5, "DNA", (), "https://identifiers.org/rebase:38313"),
+    ("PfeI", (1, -1, None, None, "GAWTC"), "(?=(?P<PfeI>GA[AT]TC))", None, 512.0, -1, 1, 6972, 65, 37, -3, "AWT", None, None, None, "GAWTC", 5, "DNA", ("B",), "https://identifiers.org/rebase:6972"),
+    ("Pfl10783II", (None, None, None, None, "GCGTCAG"), "(?=(?P<Pfl10783II>GCGTCAG))|(?=(?P<Pfl10783II_as>CTGACGC))", None, 16384.0, None, None, 287240, 65, 37, None, None, None, None, None, "GCGTCAG", 7, "DNA", (), "https://identifiers.org/rebase:287240"),
+    ("Pfl1108I", (None, None, None, None, "TCGTAG"), "(?=(?P<Pfl1108I>TCGTAG))|(?=(?P<Pfl1108I_as>CTACGA))", None, 4096.0, None, None, 1462, 65, 37, None, None, None, None, None, "TCGTAG", 6, "DNA", (), "https://identifiers.org/rebase:1462"),
+    ("Pfl23II", (1, -1, None, None, "CGTACG"), "(?=(?P<Pfl23II>CGTACG))", None, 4096.0, -1, 1, 1468, 65, 37, -4, "GTAC", None, None, None, "CGTACG", 6, "DNA", ("B",), "https://identifiers.org/rebase:1468"),
+    ("Pfl3756II", (None, None, None, None, "CCCTNAG"), "(?=(?P<Pfl3756II>CCCT.AG))|(?=(?P<Pfl3756II_as>CT.AGGG))", None, 4096.0, None, None, 414129, 65, 37, None, None, None, None, None, "CCCTNAG", 7, "DNA", (), "https://identifiers.org/rebase:414129"),
+    ("Pfl8569I", (3, -3, None, None, "GCNNGC"), "(?=(?P<Pfl8569I>GC..GC))", None, 256.0, -3, 3, 161004, 65, 37, 0, "", None, None, None, "GCNNGC", 6, "DNA", (), "https://identifiers.org/rebase:161004"),
+    ("PflFI", (4, -4, None, None, "GACNNNGTC"), "(?=(?P<PflFI>GAC...GTC))", None, 4096.0, -4, 4, 2886, 65, 37, -1, "N", None, None, None, "GACNNNGTC", 9, "DNA", ("N",), "https://identifiers.org/rebase:2886"),
+    ("PflMI", (7, -7, None, None, "CCANNNNNTGG"), "(?=(?P<PflMI>CCA.....TGG))", None, 4096.0, -7, 7, 1475, 65, 37, 3, "NNN", None, None, None, "CCANNNNNTGG", 11, "DNA", ("N",), "https://identifiers.org/rebase:1475"),
+    ("PflPt14I", (None, None, None, None, "RGCCCAC"), "(?=(?P<PflPt14I>[AG]GCCCAC))|(?=(?P<PflPt14I_as>GTGGGC[CT]))", None, 8192.0, None, None, 161996, 65, 37, None, None, None, None, None, "RGCCCAC", 7, "DNA", (), "https://identifiers.org/rebase:161996"),
+    ("PfoI", (1, -1, None, None, "TCCNGGA"), "(?=(?P<PfoI>TCC.GGA))", None, 4096.0, -1, 1, 5507, 65, 37, -5, "CCNGG", None, None, None, "TCCNGGA", 7, "DNA", ("B",), "https://identifiers.org/rebase:5507"),
+    ("PfrJS12IV", (None, None, None, None, "TANAAG"), "(?=(?P<PfrJS12IV>TA.AAG))|(?=(?P<PfrJS12IV_as>CTT.TA))", None, 1024.0, None, None, 178754, 65, 37, None, None, None, None, None, "TANAAG", 6, "DNA", (), "https://identifiers.org/rebase:178754"),
+    ("PfrJS12V", (None, None, None, None, "GGCGGAG"), "(?=(?P<PfrJS12V>GGCGGAG))|(?=(?P<PfrJS12V_as>CTCCGCC))", None, 16384.0, None, None, 178755, 65, 37, None, None, None, None, None, "GGCGGAG", 7, "DNA", (), "https://identifiers.org/rebase:178755"),
+    ("PfrJS15III", (None, None, None, None, "CTTCNAC"), "(?=(?P<PfrJS15III>CTTC.AC))|(?=(?P<PfrJS15III_as>GT.GAAG))", None, 4096.0, None, None, 160634, 65, 37, None, None, None, None, None, "CTTCNAC", 7, "DNA", (), "https://identifiers.org/rebase:160634"),
+    ("PgaP73III", (None, None, None, None, "TTCGAG"), "(?=(?P<PgaP73III>TTCGAG))|(?=(?P<PgaP73III_as>CTCGAA))", None, 4096.0, None, None, 221241, 65, 37, None, None, None, None, None, "TTCGAG", 6, "DNA", (), "https://identifiers.org/rebase:221241"),
+    ("Pin17FIII", (None, None, None, None, "GGYGAB"), "(?=(?P<Pin17FIII>GG[CT]GA[CGT]))|(?=(?P<Pin17FIII_as>[ACG]TC[AG]CC))", None, 682.6666666666666, None, None, 167970, 65, 37, None, None, None, None, None, "GGYGAB", 6, "DNA", (), "https://identifiers.org/rebase:167970"),
+    ("PinAI", (1, -1, None, None, "ACCGGT"), "(?=(?P<PinAI>ACCGGT))", None, 4096.0, -1, 1, 1485, 65, 37, -4, "CCGG", None, None, None, "ACCGGT", 6, "DNA", ("Q", "X"), "https://identifiers.org/rebase:1485"),
+    ("PinP23II", (None, None, None, None, "CTRKCAG"), "(?=(?P<PinP23II>CT[AG][GT]CAG))|(?=(?P<PinP23II_as>CTG[AC][CT]AG))", None, 4096.0, None, None, 229189, 65, 37, None, None, None, None, None, "CTRKCAG", 7, "DNA", (), "https://identifiers.org/rebase:229189"),
+    ("PinP59III", (None, None, None, None, "GAAGNAG"), "(?=(?P<PinP59III>GAAG.AG))|(?=(?P<PinP59III_as>CT.CTTC))", None, 4096.0, None, None, 229242, 65, 37, None, None, None, None, None, "GAAGNAG", 7, "DNA", (), "https://identifiers.org/rebase:229242"),
+    ("PkrI", (3, -3, None, None, "GCNGC"), "(?=(?P<PkrI>GC.GC))", None, 256.0, -3, 3, 140102, 65, 37, 1, "N", None, None, None, "GCNGC", 5, "DNA", ("I",), "https://identifiers.org/rebase:140102"),
+    ("PlaDI", (27, 19, None, None, "CATCAG"), "(?=(?P<PlaDI>CATCAG))|(?=(?P<PlaDI_as>CTGATG))", None, 4096.0, 19, 27, 16956, 65, 37, 2, "NN", None, None, None, "CATCAG", 6, "DNA", (), "https://identifiers.org/rebase:16956"),
+    ("Ple19I", (4, -4, None, None, "CGATCG"), "(?=(?P<Ple19I>CGATCG))", None, 4096.0, -4, 4, 1489, 65, 37, 2, "AT", None, None, None, "CGATCG", 6, "DNA", ("I",), "https://identifiers.org/rebase:1489"),
+    ("PleI", (9, 5, None, None, "GAGTC"), "(?=(?P<PleI>GAGTC))|(?=(?P<PleI_as>GACTC))", None, 1024.0, 5, 9, 1490, 65, 37, -1, "N", None, None, None, "GAGTC", 5, "DNA", ("N",), "https://identifiers.org/rebase:1490"),
+    ("PliMI", (None, None, None, None, "CGCCGAC"), "(?=(?P<PliMI>CGCCGAC))|(?=(?P<PliMI_as>GTCGGCG))", None, 16384.0, None, None, 21604, 65, 37, None, None, None, None, None, "CGCCGAC", 7, "DNA", (), "https://identifiers.org/rebase:21604"),
+    ("PluTI", (5, -5, None, None, "GGCGCC"), "(?=(?P<PluTI>GGCGCC))", None, 4096.0, -5, 5, 23545, 65, 37, 4, "GCGC", None, None, None, "GGCGCC", 6, "DNA", ("N",), "https://identifiers.org/rebase:23545"),
+    ("PmaCI", (3, -3, None, None, "CACGTG"), "(?=(?P<PmaCI>CACGTG))", None, 4096.0, -3, 3, 1493, 65, 37, 0, "", None, None, None, "CACGTG", 6, "DNA", ("K",), "https://identifiers.org/rebase:1493"),
+    ("Pme10899I", (None, None, None, None, "GACAGG"), "(?=(?P<Pme10899I>GACAGG))|(?=(?P<Pme10899I_as>CCTGTC))", None, 4096.0, None, None, 415935, 65, 37, None, None, None, None, None, "GACAGG", 6, "DNA", (), "https://identifiers.org/rebase:415935"),
+    ("PmeI", (4, -4, None, None, "GTTTAAAC"), "(?=(?P<PmeI>GTTTAAAC))", None, 65536.0, -4, 4, 1497, 65, 37, 0, "", None, None, None, "GTTTAAAC", 8, "DNA", ("N",), "https://identifiers.org/rebase:1497"),
+    ("PmlI", (3, -3, None, None, "CACGTG"), "(?=(?P<PmlI>CACGTG))", None, 4096.0, -3, 3, 1499, 65, 37, 0, "", None, None, None, "CACGTG", 6, "DNA", ("N",), "https://identifiers.org/rebase:1499"),
+    ("PpiI", (-7, -24, 25, 8, "GAACNNNNNCTC"), "(?=(?P<PpiI>GAAC.....CTC))|(?=(?P<PpiI_as>GAG.....GTTC))", None, 16384.0, -24, -7, 3104, 65, 37, 5, "NNNNN", None, 8, 25, "GAACNNNNNCTC", 12, "DNA", (), "https://identifiers.org/rebase:3104"),
+    ("PpiP13II", (None, None, None, None, "CGCRGAC"), "(?=(?P<PpiP13II>CGC[AG]GAC))|(?=(?P<PpiP13II_as>GTC[CT]GCG))", None, 8192.0, None, None, 221251, 65, 37, None, None, None, None, None, "CGCRGAC", 7, "DNA", (), "https://identifiers.org/rebase:221251"),
+    ("PpsI", (9, 5, None, None, "GAGTC"), "(?=(?P<PpsI>GAGTC))|(?=(?P<PpsI_as>GACTC))", None, 1024.0, 5, 9, 3199, 65, 37, -1, "N", None, None, None, "GAGTC", 5, "DNA", ("I",), "https://identifiers.org/rebase:3199"),
+    ("Ppu10I", (1, -1, None, None, "ATGCAT"), "(?=(?P<Ppu10I>ATGCAT))", None, 4096.0, -1, 1, 1504, 65, 37, -4, "TGCA", None, None, None, "ATGCAT", 6, "DNA", (), "https://identifiers.org/rebase:1504"),
+    ("Ppu21I", (3, -3, None, None, "YACGTR"), "(?=(?P<Ppu21I>[CT]ACGT[AG]))", None, 1024.0, -3, 3, 1509, 65, 37, 0, "", None, None, None, "YACGTR", 6, "DNA", ("B",), "https://identifiers.org/rebase:1509"),
+    ("PpuMI", (2, -2, None, None, "RGGWCCY"), "(?=(?P<PpuMI>[AG]GG[AT]CC[CT]))", None, 2048.0, -2, 2, 1513, 65, 37, -3, "GWC", None, None, None, "RGGWCCY", 7, "DNA", ("N",), "https://identifiers.org/rebase:1513"),
+    ("Pru8113I", (None, None, None, None, "CAGANGC"), "(?=(?P<Pru8113I>CAGA.GC))|(?=(?P<Pru8113I_as>GC.TCTG))", None, 4096.0, None, None, 289328, 65, 37, None, None, None, None, None, "CAGANGC", 7, "DNA", (), "https://identifiers.org/rebase:289328"),
+    ("PscI", (1, -1, None, None, "ACATGT"), "(?=(?P<PscI>ACATGT))", None, 4096.0, -1, 1, 10690, 65, 37, -4, "CATG", None, None, None, "ACATGT", 6, "DNA", ("B",), "https://identifiers.org/rebase:10690"),
+    ("Pse18267I", (None, None, None, None, "RCCGAAG"), "(?=(?P<Pse18267I>[AG]CCGAAG))|(?=(?P<Pse18267I_as>CTTCGG[CT]))", None, 8192.0, None, None, 77783, 65, 37, None, None, None, None, None, "RCCGAAG", 7, "DNA", (), "https://identifiers.org/rebase:77783"),
+    ("PshAI", (5, -5, None, None, "GACNNNNGTC"), "(?=(?P<PshAI>GAC....GTC))", None, 4096.0, -5, 5, 1515, 65, 37, 0, "", None, None, None, "GACNNNNGTC", 10, "DNA", ("K", "N"), "https://identifiers.org/rebase:1515"),
+    ("PshBI", (2, -2, None, None, "ATTAAT"), "(?=(?P<PshBI>ATTAAT))", None, 4096.0, -2, 2, 2487, 65, 37, -2, "TA", None, None, None, "ATTAAT", 6, "DNA", ("K",), "https://identifiers.org/rebase:2487"),
+    ("PsiI", (3, -3, None, None, "TTATAA"), "(?=(?P<PsiI>TTATAA))", None, 4096.0, -3, 3, 3775, 65, 37, 0, "", None, None, None, "TTATAA", 6, "DNA", ("I", "N"), "https://identifiers.org/rebase:3775"),
+    ("Psp0357II", (None, None, None, None, "GCGAAG"), "(?=(?P<Psp0357II>GCGAAG))|(?=(?P<Psp0357II_as>CTTCGC))", None, 4096.0, None, None, 93738, 65, 37, None, None, None, None, None, "GCGAAG", 6, "DNA", (), "https://identifiers.org/rebase:93738"),
+    ("Psp03I", (4, -4, None, None, "GGWCC"), "(?=(?P<Psp03I>GG[AT]CC))", None, 512.0, -4, 4, 5087, 65, 37, 3, "GWC", None, None, None, "GGWCC", 5, "DNA", (), "https://identifiers.org/rebase:5087"),
+    ("Psp124BI", (5, -5, None, None, "GAGCTC"), "(?=(?P<Psp124BI>GAGCTC))", None, 4096.0, -5, 5, 2679, 65, 37, 4, "AGCT", None, None, None, "GAGCTC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2679"),
+    ("Psp1406I", (2, -2, None, None, "AACGTT"), "(?=(?P<Psp1406I>AACGTT))", None, 4096.0, -2, 2, 2176, 65, 37, -2, "CG", None, None, None, "AACGTT", 6, "DNA", ("B", "K"), "https://identifiers.org/rebase:2176"),
+    ("Psp5II", (2, -2, None, None, "RGGWCCY"), "(?=(?P<Psp5II>[AG]GG[AT]CC[CT]))", None, 2048.0, -2, 2, 1528, 65, 37, -3, "GWC", None, None, None, "RGGWCCY", 7, "DNA", ("B",), "https://identifiers.org/rebase:1528"),
+    ("Psp6I", (0, 0, None, None, "CCWGG"), "(?=(?P<Psp6I>CC[AT]GG))", None, 512.0, 0, 0, 6218, 65, 37, -5, "CCWGG", None, None, None, "CCWGG", 5, "DNA", ("I",), "https://identifiers.org/rebase:6218"),
+    ("PspAT13III", (None, None, None, None, "CCGANAG"), "(?=(?P<PspAT13III>CCGA.AG))|(?=(?P<PspAT13III_as>CT.TCGG))", None, 4096.0, None, None, 618734, 65, 37, None, None, None, None, None, "CCGANAG", 7, "DNA", (), "https://identifiers.org/rebase:618734"),
+    ("PspCI", (3, -3, None, None, "CACGTG"), "(?=(?P<PspCI>CACGTG))", None, 4096.0, -3, 3, 7495, 65, 37, 0, "", None, None, None, "CACGTG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:7495"),
+    ("PspD7DII", (None, None, None, None, "CCGCGAG"), "(?=(?P<PspD7DII>CCGCGAG))|(?=(?P<PspD7DII_as>CTCGCGG))", None, 16384.0, None, None, 440972, 65, 37, None, None, None, None, None, "CCGCGAG", 7, "DNA", (), "https://identifiers.org/rebase:440972"),
+    ("PspEI", (1, -1, None, None, "GGTNACC"), "(?=(?P<PspEI>GGT.ACC))", None, 4096.0, -1, 1, 2681, 65, 37, -5, "GTNAC", None, None, None, "GGTNACC", 7, "DNA", ("I", "V"), "https://identifiers.org/rebase:2681"),
+    ("PspFI", (1, -1, None, None, "CCCAGC"), "(?=(?P<PspFI>CCCAGC))|(?=(?P<PspFI_as>GCTGGG))", None, 4096.0, -1, 1, 17988, 65, 37, -4, "CCAG", None, None, None, "CCCAGC", 6, "DNA", ("B",), "https://identifiers.org/rebase:17988"),
+    ("PspGI", (0, 0, None, None, "CCWGG"), "(?=(?P<PspGI>CC[AT]GG))", None, 512.0, 0, 0, 2568, 65, 37, -5, "CCWGG", None, None, None, "CCWGG", 5, "DNA", ("N",), "https://identifiers.org/rebase:2568"),
+    ("PspLI", (1, -1, None, None, "CGTACG"), "(?=(?P<PspLI>CGTACG))", None, 4096.0, -1, 1, 2748, 65, 37, -4, "GTAC", None, None, None, "CGTACG", 6, "DNA", ("I",), "https://identifiers.org/rebase:2748"),
+    ("PspMR102II", (None, None, None, None, "CAAGAAC"), "(?=(?P<PspMR102II>CAAGAAC))|(?=(?P<PspMR102II_as>GTTCTTG))", None, 16384.0, None, None, 618721, 65, 37, None, None, None, None, None, "CAAGAAC", 7, "DNA", (), "https://identifiers.org/rebase:618721"),
+    ("PspN4I", (3, -3, None, None, "GGNNCC"), "(?=(?P<PspN4I>GG..CC))", None, 256.0, -3, 3, 2749, 65, 37, 0, "", None, None, None, "GGNNCC", 6, "DNA", ("I",), "https://identifiers.org/rebase:2749"),
+    ("PspOMI", (1, -1, None, None, "GGGCCC"), "(?=(?P<PspOMI>GGGCCC))", None, 4096.0, -1, 1, 2683, 65, 37, -4, "GGCC", None, None, None, "GGGCCC", 6, "DNA", ("I", "N", "V"), "https://identifiers.org/rebase:2683"),
+    ("PspOMII", (27, 18, None, None, "CGCCCAR"), "(?=(?P<PspOMII>CGCCCA[AG]))|(?=(?P<PspOMII_as>[CT]TGGGCG))", None, 8192.0, 18, 27, 13065, 65, 37, 2, "NN", None, None, None, "CGCCCAR", 7, "DNA", (), "https://identifiers.org/rebase:13065"),
+    ("PspPI", (1, -1, None, None, "GGNCC"), "(?=(?P<PspPI>GG.CC))", None, 256.0, -1, 1, 2771, 65, 37, -3, "GNC", None, None, None, "GGNCC", 5, "DNA", ("C",), "https://identifiers.org/rebase:2771"),
+    ("PspPPI", (2, -2, None, None, "RGGWCCY"), "(?=(?P<PspPPI>[AG]GG[AT]CC[CT]))", None, 2048.0, -2, 2, 2881, 65, 37, -3, "GWC", None, None, None, "RGGWCCY", 7, "DNA", ("I",), "https://identifiers.org/rebase:2881"),
+    ("PspPRI", (21, 13, None, None, "CCYCAG"), "(?=(?P<PspPRI>CC[CT]CAG))|(?=(?P<PspPRI_as>CTG[AG]GG))", None, 2048.0, 13, 21, 14886, 65, 37, 2, "NN", None, None, None, "CCYCAG", 6, "DNA", (), "https://identifiers.org/rebase:14886"),
+    ("PspR84I", (None, None, None, None, "TACYCAC"), "(?=(?P<PspR84I>TAC[CT]CAC))|(?=(?P<PspR84I_as>GTG[AG]GTA))", None, 8192.0, None, None, 356267, 65, 37, None, None, None, None, None, "TACYCAC", 7, "DNA", (), "https://identifiers.org/rebase:356267"),
+    ("PspXI", (2, -2, None, None, "VCTCGAGB"), "(?=(?P<PspXI>[ACG]CTCGAG[CGT]))", None, 7281.777777777777, -2, 2, 7531, 65, 37, -4, "TCGA", None, None, None, "VCTCGAGB", 8, "DNA", ("I", "N"), "https://identifiers.org/rebase:7531"),
+    ("PsrI", (-7, -25, 25, 7, "GAACNNNNNNTAC"), "(?=(?P<PsrI>GAAC......TAC))|(?=(?P<PsrI_as>GTA......GTTC))", None, 16384.0, -25, -7, 4916, 65, 37, 5, "NNNNN", None, 7, 25, "GAACNNNNNNTAC", 13, "DNA", ("I",), "https://identifiers.org/rebase:4916"),
+    ("PssI", (5, -5, None, None, "RGGNCCY"), "(?=(?P<PssI>[AG]GG.CC[CT]))", None, 1024.0, -5, 5, 1534, 65, 37, 3, "GNC", None, None, None, "RGGNCCY", 7, "DNA", (), "https://identifiers.org/rebase:1534"),
+    ("Pst14472I", (None, None, None, None, "CNYACAC"), "(?=(?P<Pst14472I>C.[CT]ACAC))|(?=(?P<Pst14472I_as>GTGT[AG].G))", None, 2048.0, None, None, 93519, 65, 37, None, None, None, None, None, "CNYACAC", 7, "DNA", (), "https://identifiers.org/rebase:93519"),
+    ("Pst145I", (None, None, None, None, "CTAMRAG"), "(?=(?P<Pst145I>CTA[AC][AG]AG))|(?=(?P<Pst145I_as>CT[CT][GT]TAG))", None, 4096.0, None, None, 138626, 65, 37, None, None, None, None, None, "CTAMRAG", 7, "DNA", (), "https://identifiers.org/rebase:138626"),
+    ("Pst273I", (None, None, None, None, "GATCGAG"), "(?=(?P<Pst273I>GATCGAG))|(?=(?P<Pst273I_as>CTCGATC))", None, 16384.0, None, None, 153468, 65, 37, None, None, None, None, None, "GATCGAG", 7, "DNA", (), "https://identifiers.org/rebase:153468"),
+    ("PstI", (5, -5, None, None, "CTGCAG"), "(?=(?P<PstI>CTGCAG))", None, 4096.0, -5, 5, 1536, 65, 37, 4, "TGCA", None, None, None, "CTGCAG", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X"), "https://identifiers.org/rebase:1536"),
+    ("PstNI", (6, -6, None, None, "CAGNNNCTG"), "(?=(?P<PstNI>CAG...CTG))", None, 4096.0, -6, 6, 26996, 65, 37, 3, "NNN", None, None, None, "CAGNNNCTG", 9, "DNA", ("I",), "https://identifiers.org/rebase:26996"),
+    ("PsuGI", (None, None, None, None, "BBCGD"), "(?=(?P<PsuGI>[CGT][CGT]CG[AGT]))|(?=(?P<PsuGI_as>[ACT]CG[ACG][ACG]))", None, 37.925925925925924, None, None, 35017, 65, 37, None, None, None, None, None, "BBCGD", 5, "DNA", (), "https://identifiers.org/rebase:35017"),
+    ("PsuI", (1, -1, None, None, "RGATCY"), "(?=(?P<PsuI>[AG]GATC[CT]))", None, 1024.0, -1, 1, 4111, 65, 37, -4, "GATC", None, None, None, "RGATCY", 6, "DNA", ("B",), "https://identifiers.org/rebase:4111"),
+    ("PsyI", (4, -4, None, None, "GACNNNGTC"), "(?=(?P<PsyI>GAC...GTC))", None, 4096.0, -4, 4, 3093, 65, 37, -1, "N", None, None, None, "GACNNNGTC", 9, "DNA", ("B",), "https://identifiers.org/rebase:3093"),
+    ("PteI", (1, -1, None, None, "GCGCGC"), "(?=(?P<PteI>GCGCGC))", None, 4096.0, -1, 1, 17982, 65, 37, -4, "CGCG", None, None, None, "GCGCGC", 6, "DNA", ("B",), "https://identifiers.org/rebase:17982"),
+    ("PvuI", (4, -4, None, None, "CGATCG"), "(?=(?P<PvuI>CGATCG))", None, 4096.0, -4, 4, 1541, 65, 37, 2, "AT", None, None, None, "CGATCG", 6, "DNA", ("B", "K", "M", "N", "O", "Q", "R", "S", "X"), "https://identifiers.org/rebase:1541"),
+    ("PvuII", (3, -3, None, None, "CAGCTG"), "(?=(?P<PvuII>CAGCTG))", None, 4096.0, -3, 3, 1542, 65, 37, 0, "", None, None, None, "CAGCTG", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "S", "V", "X"), "https://identifiers.org/rebase:1542"),
+    ("Ran11014IV", (None, None, None, None, "GAAAGAG"), "(?=(?P<Ran11014IV>GAAAGAG))|(?=(?P<Ran11014IV_as>CTCTTTC))", None, 16384.0, None, None, 216253, 65, 37, None, None, None, None, None, "GAAAGAG", 7, "DNA", (), "https://identifiers.org/rebase:216253"),
+    ("Rba2021I", (None, None, None, None, "CACGAGH"), "(?=(?P<Rba2021I>CACGAG[ACT]))|(?=(?P<Rba2021I_as>[AGT]CTCGTG))", None, 5461.333333333333, None, None, 77917, 65, 37, None, None, None, None, None, "CACGAGH", 7, "DNA", (), "https://identifiers.org/rebase:77917"),
+    ("RceI", (27, 18, None, None, "CATCGAC"), "(?=(?P<RceI>CATCGAC))|(?=(?P<RceI_as>GTCGATG))", None, 16384.0, 18, 27, 20241, 65, 37, 2, "NN", None, None, None, "CATCGAC", 7, "DNA", (), "https://identifiers.org/rebase:20241"),
+    ("RdeGBI", (None, None, None, None, "CCGCAG"), "(?=(?P<RdeGBI>CCGCAG))|(?=(?P<RdeGBI_as>CTGCGG))", None, 4096.0, None, None, 28550, 65, 37, None, None, None, None, None, "CCGCAG", 6, "DNA", (), "https://identifiers.org/rebase:28550"),
+    ("RdeGBII", (26, 18, None, None, "ACCCAG"), "(?=(?P<RdeGBII>ACCCAG))|(?=(?P<RdeGBII_as>CTGGGT))", None, 4096.0, 18, 26, 28551, 65, 37, 2, "NN", None, None, None, "ACCCAG", 6, "DNA", (), "https://identifiers.org/rebase:28551"),
+    ("RdeGBIII", (-9, -17, 17, 9, "TGRYCA"), "(?=(?P<RdeGBIII>TG[AG][CT]CA))", None, 1024.0, -17, -9, 28544, 65, 37, 2, "NN", None, 9, 17, "TGRYCA", 6, "DNA", (), "https://identifiers.org/rebase:28544"),
+    ("Rer8036II", (None, None, None, None, "CCGAKGG"), "(?=(?P<Rer8036II>CCGA[GT]GG))|(?=(?P<Rer8036II_as>CC[AC]TCGG))", None, 8192.0, None, None, 416878, 65, 37, None, None, None, None, None, "CCGAKGG", 7, "DNA", (), "https://identifiers.org/rebase:416878"),
+    ("RflFIII", (None, None, None, None, "CGCCAG"), "(?=(?P<RflFIII>CGCCAG))|(?=(?P<RflFIII_as>CTGGCG))", None, 4096.0, None, None, 32269, 65, 37, None, None, None, None, None, "CGCCAG", 6, "DNA", (), "https://identifiers.org/rebase:32269"),
+    ("RgaI", (5, -5, None, None, "GCGATCGC"), "(?=(?P<RgaI>GCGATCGC))", None, 65536.0, -5, 5, 10873, 65, 37, 2, "AT", None, None, None, "GCGATCGC", 8, "DNA", ("I",), "https://identifiers.org/rebase:10873"),
+    ("Rgo13296IV", (None, None, None, None, "GRAAGCG"), "(?=(?P<Rgo13296IV>G[AG]AAGCG))|(?=(?P<Rgo13296IV_as>CGCTT[CT]C))", None, 8192.0, None, None, 416879, 65, 37, None, None, None, None, None, "GRAAGCG", 7, "DNA", (), "https://identifiers.org/rebase:416879"),
+    ("Rho5650I", (None, None, None, None, "AACGAG"), "(?=(?P<Rho5650I>AACGAG))|(?=(?P<Rho5650I_as>CTCGTT))", None, 4096.0, None, None, 414024, 65, 37, None, None, None, None, None, "AACGAG", 6, "DNA", (), "https://identifiers.org/rebase:414024"),
+    ("RigI", (6, -6, None, None, "GGCCGGCC"), "(?=(?P<RigI>GGCCGGCC))", None, 65536.0, -6, 6, 14596, 65, 37, 4, "CCGG", None, None, None, "GGCCGGCC", 8, "DNA", ("I",), "https://identifiers.org/rebase:14596"),
+    ("Rkr11038I", (None, None, None, None, "GGANNNNNRTGA"), "(?=(?P<Rkr11038I>GGA.....[AG]TGA))|(?=(?P<Rkr11038I_as>TCA[CT].....TCC))", None, 8192.0, None, None, 413999, 65, 37, None, None, None, None, None, "GGANNNNNRTGA", 12, "DNA", (), "https://identifiers.org/rebase:413999"),
+    ("RlaI", (None, None, None, None, "VCW"), "(?=(?P<RlaI>[ACG]C[AT]))|(?=(?P<RlaI_as>[AT]G[CGT]))", None, 10.666666666666666, None, None, 21323, 65, 37, None, None, None, None, None, "VCW", 3, "DNA", (), "https://identifiers.org/rebase:21323"),
+    ("RlaII", (26, 18, None, None, "ACACAG"), "(?=(?P<RlaII>ACACAG))|(?=(?P<RlaII_as>CTGTGT))", None, 4096.0, 18, 26, 24516, 65, 37, 2, "NN", None, None, None, "ACACAG", 6, "DNA", (), "https://identifiers.org/rebase:24516"),
+    ("RleAI", (18, 9, None, None, "CCCACA"), "(?=(?P<RleAI>CCCACA))|(?=(?P<RleAI_as>TGTGGG))", None, 4096.0, 9, 18, 1552, 65, 37, 3, "NNN", None, None, None, "CCCACA", 6, "DNA", (), "https://identifiers.org/rebase:1552"),
+    ("Rmu369III", (None, None, None, None, "GGCYAC"), "(?=(?P<Rmu369III>GGC[CT]AC))|(?=(?P<Rmu369III_as>GT[AG]GCC))", None, 2048.0, None, None, 222072, 65, 37, None, None, None, None, None, "GGCYAC", 6, "DNA", (), "https://identifiers.org/rebase:222072"),
+    ("RpaB5I", (27, 18, None, None, "CGRGGAC"), "(?=(?P<RpaB5I>CG[AG]GGAC))|(?=(?P<RpaB5I_as>GTCC[CT]CG))", None, 8192.0, 18, 27, 17116, 65, 37, 2, "NN", None, None, None, "CGRGGAC", 7, "DNA", (), "https://identifiers.org/rebase:17116"),
+    ("RpaBI", (27, 18, None, None, "CCCGCAG"), "(?=(?P<RpaBI>CCCGCAG))|(?=(?P<RpaBI_as>CTGCGGG))", None, 16384.0, 18, 27, 24819, 65, 37, 2, "NN", None, None, None, "CCCGCAG", 7, "DNA", (), "https://identifiers.org/rebase:24819"),
+    ("RpaI", (18, 9, None, None, "GTYGGAG"), "(?=(?P<RpaI>GT[CT]GGAG))|(?=(?P<RpaI_as>CTCC[AG]AC))", None, 8192.0, 9, 18, 7538, 65, 37, 2, "NN", None, None, None, "GTYGGAG", 7, "DNA", (), "https://identifiers.org/rebase:7538"),
+    ("RpaTI", (None, None, None, None, "GRTGGAG"), "(?=(?P<RpaTI>G[AG]TGGAG))|(?=(?P<RpaTI_as>CTCCA[CT]C))", None, 8192.0, None, None, 26580, 65, 37, None, None, None, None, None, "GRTGGAG", 7, "DNA", (), "https://identifiers.org/rebase:26580"),
+    ("RruI", (3, -3, None, None, "TCGCGA"), "(?=(?P<RruI>TCGCGA))", None, 4096.0, -3, 3, 17996, 65, 37, 0, "", None, None, None, "TCGCGA", 6, "DNA", ("B",), "https://identifiers.org/rebase:17996"),
+    ("RsaI", (2, -2, None, None, "GTAC"), "(?=(?P<RsaI>GTAC))", None, 256.0, -2, 2, 1567, 65, 37, 0, "", None, None, None, "GTAC", 4, "DNA", ("B", "C", "I", "J", "M", "N", "Q", "R", "V", "X", "Y"), "https://identifiers.org/rebase:1567"),
+    ("RsaNI", (1, -1, None, None, "GTAC"), "(?=(?P<RsaNI>GTAC))", None, 256.0, -1, 1, 16208, 65, 37, -2, "TA", None, None, None, "GTAC", 4, "DNA", ("I",), "https://identifiers.org/rebase:16208"),
+    ("RseI", (5, -5, None, None, "CAYNNNNRTG"), "(?=(?P<RseI>CA[CT]....[AG]TG))", None, 1024.0, -5, 5, 14762, 65, 37, 0, "", None, None, None, "CAYNNNNRTG", 10, "DNA", ("B",), "https://identifiers.org/rebase:14762"),
+    ("Rsp008IV", (None, None, None, None, "ACGCAG"), "(?=(?P<Rsp008IV>ACGCAG))|(?=(?P<Rsp008IV_as>CTGCGT))", None, 4096.0, None, None, 153107, 65, 37, None, None, None, None, None, "ACGCAG", 6, "DNA", (), "https://identifiers.org/rebase:153107"),
+    ("Rsp008V", (None, None, None, None, "GCCCAT"), "(?=(?P<Rsp008V>GCCCAT))|(?=(?P<Rsp008V_as>ATGGGC))", None, 4096.0, None, None, 152603, 65, 37, None, None, None, None, None, "GCCCAT", 6, "DNA", (), "https://identifiers.org/rebase:152603"),
+    ("Rsp531II", (None, None, None, None, "CACACG"), "(?=(?P<Rsp531II>CACACG))|(?=(?P<Rsp531II_as>CGTGTG))", None, 4096.0, None, None, 274776, 65, 37, None, None, None, None, None, "CACACG", 6, "DNA", (), "https://identifiers.org/rebase:274776"),
+    ("RspPBTS2III", (None, None, None, None, "CTTCGAG"), "(?=(?P<RspPBTS2III>CTTCGAG))|(?=(?P<RspPBTS2III_as>CTCGAAG))", None, 16384.0, None, None, 152164, 65, 37, None, None, None, None, None, "CTTCGAG", 7, "DNA", (), "https://identifiers.org/rebase:152164"),
+    ("Rsr2I", (2, -2, None, None, "CGGWCCG"), "(?=(?P<Rsr2I>CGG[AT]CCG))", None, 8192.0, -2, 2, 3886, 65, 37, -3, "GWC", None, None, None, "CGGWCCG", 7, "DNA", ("I", "V"), "https://identifiers.org/rebase:3886"),
+    ("RsrII", (2, -2, None, None, "CGGWCCG"), "(?=(?P<RsrII>CGG[AT]CCG))", None, 8192.0, -2, 2, 1573, 65, 37, -3, "GWC", None, None, None, "CGGWCCG", 7, "DNA", ("N", "Q", "X"), "https://identifiers.org/rebase:1573"),
+    ("Rtr1953I", (None, None, None, None, "TGANNNNNNTGA"), "(?=(?P<Rtr1953I>TGA......TGA))|(?=(?P<Rtr1953I_as>TCA......TCA))", None, 4096.0, None, None, 145447, 65, 37, None, None, None, None, None, "TGANNNNNNTGA", 12, "DNA", (), "https://identifiers.org/rebase:145447"),
+    ("SacI", (5, -5, None, None, "GAGCTC"), "(?=(?P<SacI>GAGCTC))", None, 4096.0, -5, 5, 1578, 65, 37, 4, "AGCT", None, None, None, "GAGCTC", 6, "DNA", ("B", "J", "K", "M", "N", "O", "Q", "R", "S", "X"), "https://identifiers.org/rebase:1578"),
+    ("SacII", (4, -4, None, None, "CCGCGG"), "(?=(?P<SacII>CCGCGG))", None, 4096.0, -4, 4, 1579, 65, 37, 2, "GC", None, None, None, "CCGCGG", 6, "DNA", ("B", "J", "K", "N", "O", "Q", "R", "X"), "https://identifiers.org/rebase:1579"),
+    ("Saf8902III", (None, None, None, None, "CAATNAG"), "(?=(?P<Saf8902III>CAAT.AG))|(?=(?P<Saf8902III_as>CT.ATTG))", None, 4096.0, None, None, 46424, 65, 37, None, None, None, None, None, "CAATNAG", 7, "DNA", (), "https://identifiers.org/rebase:46424"),
+    ("Sag901I", (None, None, None, None, "GCAAAT"), "(?=(?P<Sag901I>GCAAAT))|(?=(?P<Sag901I_as>ATTTGC))", None, 4096.0, None, None, 283227, 65, 37, None, None, None, None, None, "GCAAAT", 6, "DNA", (), "https://identifiers.org/rebase:283227"),
+    ("SalI", (1, -1, None, None, "GTCGAC"), "(?=(?P<SalI>GTCGAC))", None, 4096.0, -1, 1, 1588, 65, 37, -4, "TCGA", None, None, None, "GTCGAC", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "V", "X"), "https://identifiers.org/rebase:1588"),
+    ("SanDI", (2, -2, None, None, "GGGWCCC"), "(?=(?P<SanDI>GGG[AT]CCC))", None, 8192.0, -2, 2, 2610, 65, 37, -3, "GWC", None, None, None, "GGGWCCC", 7, "DNA", (), "https://identifiers.org/rebase:2610"),
+    ("SapI", (8, 4, None, None, "GCTCTTC"), "(?=(?P<SapI>GCTCTTC))|(?=(?P<SapI_as>GAAGAGC))", None, 16384.0, 4, 8, 1593, 65, 37, -3, "NNN", None, None, None, "GCTCTTC", 7, "DNA", ("N",), "https://identifiers.org/rebase:1593"),
+    ("SaqAI", (1, -1, None, None, "TTAA"), "(?=(?P<SaqAI>TTAA))", None, 256.0, -1, 1, 17984, 65, 37, -2, "TA", None, None, None, "TTAA", 4, "DNA", ("B",), "https://identifiers.org/rebase:17984"),
+    ("SatI", (2, -2, None, None, "GCNGC"), "(?=(?P<SatI>GC.GC))", None, 256.0, -2, 2, 4809, 65, 37, -1, "N", None, None, None, "GCNGC", 5, "DNA", ("B",), "https://identifiers.org/rebase:4809"),
+    ("Sau1803III", (None, None, None, None, "CGANNNNNNTAC"), "(?=(?P<Sau1803III>CGA......TAC))|(?=(?P<Sau1803III_as>GTA......TCG))", None, 4096.0, None, None, 288557, 65, 37, None, None, None, None, None, "CGANNNNNNTAC", 12, "DNA", (), "https://identifiers.org/rebase:288557"),
+    ("Sau3AI", (0, 0, None, None, "GATC"), "(?=(?P<Sau3AI>GATC))", None, 256.0, 0, 0, 1604, 65, 37, -4, "GATC", None, None, None, "GATC", 4, "DNA", ("C", "J", "K", "M", "N", "X"), "https://identifiers.org/rebase:1604"),
+    ("Sau5656II", (None, None, None, None, "GTTGCA"), "(?=(?P<Sau5656II>GTTGCA))|(?=(?P<Sau5656II_as>TGCAAC))", None, 4096.0, None, None, 415194, 65, 37, None, None, None, None, None, "GTTGCA", 6, "DNA", (), "https://identifiers.org/rebase:415194"),
+    ("Sau64037IV", (None, None, None, None, "GTANNNNNNTGG"), "(?=(?P<Sau64037IV>GTA......TGG))|(?=(?P<Sau64037IV_as>CCA......TAC))", None, 4096.0, None, None, 248173, 65, 37, None, None, None, None, None, "GTANNNNNNTGG", 12, "DNA", (), "https://identifiers.org/rebase:248173"),
+    ("Sau96I", (1, -1, None, None, "GGNCC"), "(?=(?P<Sau96I>GG.CC))", None, 256.0, -1, 1, 1607, 65, 37, -3, "GNC", None, None, None, "GGNCC", 5, "DNA", ("J", "N"), "https://identifiers.org/rebase:1607"),
+    ("SauI", (2, -2, None, None, "CCTNAGG"), "(?=(?P<SauI>CCT.AGG))", None, 4096.0, -2, 2, 1617, 65, 37, -3, "TNA", None, None, None, "CCTNAGG", 7, "DNA", (), "https://identifiers.org/rebase:1617"),
+    ("SauMJ015III", (None, None, None, None, "GARCNAG"), "(?=(?P<SauMJ015III>GA[AG]C.AG))|(?=(?P<SauMJ015III_as>CT.G[CT]TC))", None, 2048.0, None, None, 386673, 65, 37, None, None, None, None, None, "GARCNAG", 7, "DNA", (), "https://identifiers.org/rebase:386673"),
+    ("Sba460II", (None, None, None, None, "GGNGAYG"), "(?=(?P<Sba460II>GG.GA[CT]G))|(?=(?P<Sba460II_as>C[AG]TC.CC))", None, 2048.0, None, None, 202647, 65, 37, None, None, None, None, None, "GGNGAYG", 7, "DNA", (), "https://identifiers.org/rebase:202647"),
+    ("SbfI", (6, -6, None, None, "CCTGCAGG"), "(?=(?P<SbfI>CCTGCAGG))", None, 65536.0, -6, 6, 2742, 65, 37, 4, "TGCA", None, None, None, "CCTGCAGG", 8, "DNA", ("I", "N", "V"), "https://identifiers.org/rebase:2742"),
+    ("Sbo46I", (None, None, None, None, "TGAAC"), "(?=(?P<Sbo46I>TGAAC))|(?=(?P<Sbo46I_as>GTTCA))", None, 1024.0, None, None, 70558, 65, 37, None, None, None, None, None, "TGAAC", 5, "DNA", (), "https://identifiers.org/rebase:70558"),
+    ("ScaI", (3, -3, None, None, "AGTACT"), "(?=(?P<ScaI>AGTACT))", None, 4096.0, -3, 3, 1628, 65, 37, 0, "", None, None, None, "AGTACT", 6, "DNA", ("B", "C", "J", "K", "M", "N", "O", "Q", "R", "X"), "https://identifiers.org/rebase:1628"),
+    ("SchI", (10, 5, None, None, "GAGTC"), "(?=(?P<SchI>GAGTC))|(?=(?P<SchI_as>GACTC))", None, 1024.0, 5, 10, 3090, 65, 37, 0, "", None, None, None, "GAGTC", 5, "DNA", ("B",), "https://identifiers.org/rebase:3090"),
+    ("SciI", (3, -3, None, None, "CTCGAG"), "(?=(?P<SciI>CTCGAG))", None, 4096.0, -3, 3, 1635, 65, 37, 0, "", None, None, None, "CTCGAG", 6, "DNA", (), "https://identifiers.org/rebase:1635"),
+    ("ScoDS2II", (None, None, None, None, "GCTAAT"), "(?=(?P<ScoDS2II>GCTAAT))|(?=(?P<ScoDS2II_as>ATTAGC))", None, 4096.0, None, None, 187777, 65, 37, None, None, None, None, None, "GCTAAT", 6, "DNA", (), "https://identifiers.org/rebase:187777"),
+    ("ScrFI", (2, -2, None, None, "CCNGG"), "(?=(?P<ScrFI>CC.GG))", None, 256.0, -2, 2, 1639, 65, 37, -1, "N", None, None, None, "CCNGG", 5, "DNA", ("J", "N"), "https://identifiers.org/rebase:1639"),
+    ("SdaI", (6, -6, None, None, "CCTGCAGG"), "(?=(?P<SdaI>CCTGCAGG))", None, 65536.0, -6, 6, 2946, 65, 37, 4, "TGCA", None, None, None, "CCTGCAGG", 8, "DNA", ("B",), "https://identifiers.org/rebase:2946"),
+    ("SdeAI", (27, 19, None, None, "CAGRAG"), "(?=(?P<SdeAI>CAG[AG]AG))|(?=(?P<SdeAI_as>CT[CT]CTG))", None, 2048.0, 19, 27, 13902, 65, 37, 2, "NN", None, None, None, "CAGRAG", 6, "DNA", (), "https://identifiers.org/rebase:13902"),
+    ("SdeOSI", (-11, -24, 23, 10, "GACNNNNRTGA"), "(?=(?P<SdeOSI>GAC....[AG]TGA))|(?=(?P<SdeOSI_as>TCA[CT]....GTC))", None, 8192.0, -24, -11, 16253, 65, 37, 2, "NN", None, 10, 23, "GACNNNNRTGA", 11, "DNA", (), "https://identifiers.org/rebase:16253"),
+    ("SduI", (5, -5, None, None, "GDGCHC"), "(?=(?P<SduI>G[AGT]GC[ACT]C))", None, 455.1111111111111, -5, 5, 1641, 65, 37, 4, "DGCH", None, None, None, "GDGCHC", 6, "DNA", ("B",), "https://identifiers.org/rebase:1641"),
+    ("Sdy5370I", (None, None, None, None, "CACNNNNNTCY"), "(?=(?P<Sdy5370I>CAC.....TC[CT]))|(?=(?P<Sdy5370I_as>[AG]GA.....GTG))", None, 2048.0, None, None, 256274, 65, 37, None, None, None, None, None, "CACNNNNNTCY", 11, "DNA", (), "https://identifiers.org/rebase:256274"),
+    ("Sdy7136I", (None, None, None, None, "GAGNNNNNTAA"), "(?=(?P<Sdy7136I>GAG.....TAA))|(?=(?P<Sdy7136I_as>TTA.....CTC))", None, 4096.0, None, None, 255658, 65, 37, None, None, None, None, None, "GAGNNNNNTAA", 11, "DNA", (), "https://identifiers.org/rebase:255658"),
+    ("Sdy9603I", (None, None, None, None, "GCANNNNNNNTGA"), "(?=(?P<Sdy9603I>GCA.......TGA))|(?=(?P<Sdy9603I_as>TCA.......TGC))", None, 4096.0, None, None, 417791, 65, 37, None, None, None, None, None, "GCANNNNNNNTGA", 13, "DNA", (), "https://identifiers.org/rebase:417791"),
+    ("SecI", (1, -1, None, None, "CCNNGG"), "(?=(?P<SecI>CC..GG))", None, 256.0, -1, 1, 1643, 65, 37, -4, "CNNG", None, None, None, "CCNNGG", 6, "DNA", (), "https://identifiers.org/rebase:1643"),
+    ("SelI", (0, 0, None, None, "CGCG"), "(?=(?P<SelI>CGCG))", None, 256.0, 0, 0, 1646, 65, 37, -4, "CGCG", None, None, None, "CGCG", 4, "DNA", (), "https://identifiers.org/rebase:1646"),
+    ("Sen17963III", (None, None, None, None, "CCAAAC"), "(?=(?P<Sen17963III>CCAAAC))|(?=(?P<Sen17963III_as>GTTTGG))", None, 4096.0, None, None, 204955, 65, 37, None, None, None, None, None, "CCAAAC", 6, "DNA", (), "https://identifiers.org/rebase:204955"),
+    ("Sen5794III", (None, None, None, None, "ACGAACB"), "(?=(?P<Sen5794III>ACGAAC[CGT]))|(?=(?P<Sen5794III_as>[ACG]GTTCGT))", None, 5461.333333333333, None, None, 413892, 65, 37, None, None, None, None, None, "ACGAACB", 7, "DNA", (), "https://identifiers.org/rebase:413892"),
+    ("Sen6480IV", (None, None, None, None, "GTTCAT"), "(?=(?P<Sen6480IV>GTTCAT))|(?=(?P<Sen6480IV_as>ATGAAC))", None, 4096.0, None, None, 255831, 65, 37, None, None, None, None, None, "GTTCAT", 6, "DNA", (), "https://identifiers.org/rebase:255831"),
+    ("SenA1673III", (None, None, None, None, "GNGGCAG"), "(?=(?P<SenA1673III>G.GGCAG))|(?=(?P<SenA1673III_as>CTGCC.C))", None, 4096.0, None, None, 227671, 65, 37, None, None, None, None, None, "GNGGCAG", 7, "DNA", (), "https://identifiers.org/rebase:227671"),
+    ("SenSARA26III", (None, None, None, None, "ACRCAG"), "(?=(?P<SenSARA26III>AC[AG]CAG))|(?=(?P<SenSARA26III_as>CTG[CT]GT))", None, 2048.0, None, None, 161925, 65, 37, None, None, None, None, None, "ACRCAG", 6, "DNA", (), "https://identifiers.org/rebase:161925"),
+    ("SenTFIV", (None, None, None, None, "GATCAG"), "(?=(?P<SenTFIV>GATCAG))|(?=(?P<SenTFIV_as>CTGATC))", None, 4096.0, None, None, 66999, 65, 37, None, None, None, None, None, "GATCAG", 6, "DNA", (), "https://identifiers.org/rebase:66999"),
+    ("Sep11964I", (None, None, None, None, "CGYCAT"), "(?=(?P<Sep11964I>CG[CT]CAT))|(?=(?P<Sep11964I_as>ATG[AG]CG))", None, 2048.0, None, None, 415268, 65, 37, None, None, None, None, None, "CGYCAT", 6, "DNA", (), "https://identifiers.org/rebase:415268"),
+    ("Seq11824I", (None, None, None, None, "CTANNNNNCTC"), "(?=(?P<Seq11824I>CTA.....CTC))|(?=(?P<Seq11824I_as>GAG.....TAG))", None, 4096.0, None, None, 255596, 65, 37, None, None, None, None, None, "CTANNNNNCTC", 11, "DNA", (), "https://identifiers.org/rebase:255596"),
+    ("SetI", (4, -4, None, None, "ASST"), "(?=(?P<SetI>A[CG][CG]T))", None, 64.0, -4, 4, 14595, 65, 37, 4, "ASST", None, None, None, "ASST", 4, "DNA", ("I",), "https://identifiers.org/rebase:14595"),
+    ("SexAI", (1, -1, None, None, "ACCWGGT"), "(?=(?P<SexAI>ACC[AT]GGT))", None, 8192.0, -1, 1, 2314, 65, 37, -5, "CCWGG", None, None, None, "ACCWGGT", 7, "DNA", ("M", "N"), "https://identifiers.org/rebase:2314"),
+    ("SfaAI", (5, -5, None, None, "GCGATCGC"), "(?=(?P<SfaAI>GCGATCGC))", None, 65536.0, -5, 5, 10922, 65, 37, 2, "AT", None, None, None, "GCGATCGC", 8, "DNA", ("B",), "https://identifiers.org/rebase:10922"),
+    ("SfaNI", (10, 9, None, None, "GCATC"), "(?=(?P<SfaNI>GCATC))|(?=(?P<SfaNI_as>GATGC))", None, 1024.0, 9, 10, 1652, 65, 37, -4, "NNNN", None, None, None, "GCATC", 5, "DNA", ("I", "N", "V"), "https://identifiers.org/rebase:1652"),
+    ("SfcI", (1, -1, None, None, "CTRYAG"), "(?=(?P<SfcI>CT[AG][CT]AG))", None, 1024.0, -1, 1, 1653, 65, 37, -4, "TRYA", None, None, None, "CTRYAG", 6, "DNA", ("N",), "https://identifiers.org/rebase:1653"),
+    ("SfeI", (1, -1, None, None, "CTRYAG"), "(?=(?P<SfeI>CT[AG][CT]AG))", None, 1024.0, -1, 1, 1654, 65, 37, -4, "TRYA", None, None, None, "CTRYAG", 6, "DNA", (), "https://identifiers.org/rebase:1654"),
+    ("SfiI", (8, -8, None, None, "GGCCNNNNNGGCC"), "(?=(?P<SfiI>GGCC.....GGCC))", None, 65536.0, -8, 8, 1655, 65, 37, 3, "NNN", None, None, None, "GGCCNNNNNGGCC", 13, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "V", "X"), "https://identifiers.org/rebase:1655"),
+    ("Sfl13829III", (None, None, None, None, "GNYCAG"), "(?=(?P<Sfl13829III>G.[CT]CAG))|(?=(?P<Sfl13829III_as>CTG[AG].C))", None, 512.0, None, None, 416071, 65, 37, None, None, None, None, None, "GNYCAG", 6, "DNA", (), "https://identifiers.org/rebase:416071"),
+    ("SfoI", (3, -3, None, None, "GGCGCC"), "(?=(?P<SfoI>GGCGCC))", None, 4096.0, -3, 3, 1660, 65, 37, 0, "", None, None, None, "GGCGCC", 6, "DNA", ("N",), "https://identifiers.org/rebase:1660"),
+    ("Sfr274I", (1, -1, None, None, "CTCGAG"), "(?=(?P<Sfr274I>CTCGAG))", None, 4096.0, -1, 1, 1661, 65, 37, -4, "TCGA", None, None, None, "CTCGAG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:1661"),
+    ("Sfr303I", (4, -4, None, None, "CCGCGG"), "(?=(?P<Sfr303I>CCGCGG))", None, 4096.0, -4, 4, 1662, 65, 37, 2, "GC", None, None, None, "CCGCGG", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:1662"),
+    ("SfuI", (2, -2, None, None, "TTCGAA"), "(?=(?P<SfuI>TTCGAA))", None, 4096.0, -2, 2, 1666, 65, 37, -2, "CG", None, None, None, "TTCGAA", 6, "DNA", ("M", "S"), "https://identifiers.org/rebase:1666"),
+    ("SgeI", (13, 13, None, None, "CNNG"), "(?=(?P<SgeI>C..G))", None, 16.0, 13, 13, 21264, 65, 37, -4, "NNNN", None, None, None, "CNNG", 4, "DNA", ("B",), "https://identifiers.org/rebase:21264"),
+    ("SgfI", (5, -5, None, None, "GCGATCGC"), "(?=(?P<SgfI>GCGATCGC))", None, 65536.0, -5, 5, 2426, 65, 37, 2, "AT", None, None, None, "GCGATCGC", 8, "DNA", ("R",), "https://identifiers.org/rebase:2426"),
+    ("Sgr7807I", (None, None, None, None, "GCCGAGG"), "(?=(?P<Sgr7807I>GCCGAGG))|(?=(?P<Sgr7807I_as>CCTCGGC))", None, 16384.0, None, None, 419639, 65, 37, None, None, None, None, None, "GCCGAGG", 7, "DNA", (), "https://identifiers.org/rebase:419639"),
+    ("SgrAI", (2, -2, None, None, "CRCCGGYG"), "(?=(?P<SgrAI>C[AG]CCGG[CT]G))", None, 16384.0, -2, 2, 1673, 65, 37, -4, "CCGG", None, None, None, "CRCCGGYG", 8, "DNA", ("N",), "https://identifiers.org/rebase:1673"),
+    ("SgrAII", (None, None, None, None, "CGAGATC"), "(?=(?P<SgrAII>CGAGATC))|(?=(?P<SgrAII_as>GATCTCG))", None, 16384.0, None, None, 334113, 65, 37, None, None, None, None, None, "CGAGATC", 7, "DNA", (), "https://identifiers.org/rebase:334113"),
+    ("SgrBI", (4, -4, None, None, "CCGCGG"), "(?=(?P<SgrBI>CCGCGG))", None, 4096.0, -4, 4, 1674, 65, 37, 2, "GC", None, None, None, "CCGCGG", 6, "DNA", ("C",), "https://identifiers.org/rebase:1674"),
+    ("SgrDI", (2, -2, None, None, "CGTCGACG"), "(?=(?P<SgrDI>CGTCGACG))", None, 65536.0, -2, 2, 10539, 65, 37, -4, "TCGA", None, None, None, "CGTCGACG", 8, "DNA", ("B",), "https://identifiers.org/rebase:10539"),
+    ("SgrTI", (14, 14, None, None, "CCDS"), "(?=(?P<SgrTI>CC[AGT][CG]))|(?=(?P<SgrTI_as>[CG][ACT]GG))", None, 42.666666666666664, 14, 14, 29707, 65, 37, -4, "NNNN", None, None, None, "CCDS", 4, "DNA", (), "https://identifiers.org/rebase:29707"),
+    ("SgsI", (2, -2, None, None, "GGCGCGCC"), "(?=(?P<SgsI>GGCGCGCC))", None, 65536.0, -2, 2, 10689, 65, 37, -4, "CGCG", None, None, None, "GGCGCGCC", 8, "DNA", ("B",), "https://identifiers.org/rebase:10689"),
+    ("SimI", (2, 0, None, None, "GGGTC"), "(?=(?P<SimI>GGGTC))|(?=(?P<SimI_as>GACCC))", None, 1024.0, 0, 2, 2782, 65, 37, -3, "GTC", None, None, None, "GGGTC", 5, "DNA", (), "https://identifiers.org/rebase:2782"),
+    ("SinI", (1, -1, None, None, "GGWCC"), "(?=(?P<SinI>GG[AT]CC))", None, 512.0, -1, 1, 1687, 65, 37, -3, "GWC", None, None, None, "GGWCC", 5, "DNA", ("X",), "https://identifiers.org/rebase:1687"),
+    ("SlaI", (1, -1, None, None, "CTCGAG"), "(?=(?P<SlaI>CTCGAG))", None, 4096.0, -1, 1, 1694, 65, 37, -4, "TCGA", None, None, None, "CTCGAG", 6, "DNA", ("C", "Y"), "https://identifiers.org/rebase:1694"),
+    ("Sma10259II", (None, None, None, None, "CAAAGA"), "(?=(?P<Sma10259II>CAAAGA))|(?=(?P<Sma10259II_as>TCTTTG))", None, 4096.0, None, None, 288314, 65, 37, None, None, None, None, None, "CAAAGA", 6, "DNA", (), "https://identifiers.org/rebase:288314"),
+    ("Sma325I", (None, None, None, None, "ARCCCT"), "(?=(?P<Sma325I>A[AG]CCCT))|(?=(?P<Sma325I_as>AGGG[CT]T))", None, 2048.0, None, None, 208853, 65, 37, None, None, None, None, None, "ARCCCT", 6, "DNA", (), "https://identifiers.org/rebase:208853"),
+    ("SmaI", (3, -3, None, None, "CCCGGG"), "(?=(?P<SmaI>CCCGGG))", None, 4096.0, -3, 3, 1704, 65, 37, 0, "", None, None, None, "CCCGGG", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "S", "V", "X", "Y"), "https://identifiers.org/rebase:1704"),
+    ("SmaUMH5I", (None, None, None, None, "CTTGAC"), "(?=(?P<SmaUMH5I>CTTGAC))|(?=(?P<SmaUMH5I_as>GTCAAG))", None, 4096.0, None, None, 212811, 65, 37, None, None, None, None, None, "CTTGAC", 6, "DNA", (), "https://identifiers.org/rebase:212811"),
+    ("SmaUMH8I", (None, None, None, None, "GCGAACB"), "(?=(?P<SmaUMH8I>GCGAAC[CGT]))|(?=(?P<SmaUMH8I_as>[ACG]GTTCGC))", None, 5461.333333333333, None, None, 212281, 65, 37, None, None, None, None, None, "GCGAACB", 7, "DNA", (), "https://identifiers.org/rebase:212281"),
+    ("SmiI", (4, -4, None, None, "ATTTAAAT"), "(?=(?P<SmiI>ATTTAAAT))", None, 65536.0, -4, 4, 2750, 65, 37, 0, "", None, None, None, "ATTTAAAT", 8, "DNA", ("B", "I", "K", "V"), "https://identifiers.org/rebase:2750"),
+    ("SmiMI", (5, -5, None, None, "CAYNNNNRTG"), "(?=(?P<SmiMI>CA[CT]....[AG]TG))", None, 1024.0, -5, 5, 4190, 65, 37, 0, "", None, None, None, "CAYNNNNRTG", 10, "DNA", ("I", "V"), "https://identifiers.org/rebase:4190"),
+    ("SmlI", (1, -1, None, None, "CTYRAG"), "(?=(?P<SmlI>CT[CT][AG]AG))", None, 1024.0, -1, 1, 2884, 65, 37, -4, "TYRA", None, None, None, "CTYRAG", 6, "DNA", ("N",), "https://identifiers.org/rebase:2884"),
+    ("SmoI", (1, -1, None, None, "CTYRAG"), "(?=(?P<SmoI>CT[CT][AG]AG))", None, 1024.0, -1, 1, 10923, 65, 37, -4, "TYRA", None, None, None, "CTYRAG", 6, "DNA", ("B",), "https://identifiers.org/rebase:10923"),
+    ("Sna507VIII", (None, None, None, None, "CRTTGAG"), "(?=(?P<Sna507VIII>C[AG]TTGAG))|(?=(?P<Sna507VIII_as>CTCAA[CT]G))", None, 8192.0, None, None, 297923, 65, 37, None, None, None, None, None, "CRTTGAG", 7, "DNA", (), "https://identifiers.org/rebase:297923"),
+    ("SnaBI", (3, -3, None, None, "TACGTA"), "(?=(?P<SnaBI>TACGTA))", None, 4096.0, -3, 3, 1707, 65, 37, 0, "", None, None, None, "TACGTA", 6, "DNA", ("C", "K", "M", "N"), "https://identifiers.org/rebase:1707"),
+    ("SnaI", (None, None, None, None, "GTATAC"), "(?=(?P<SnaI>GTATAC))", None, 4096.0, None, None, 1708, 65, 37, None, None, None, None, None, "GTATAC", 6, "DNA", (), "https://identifiers.org/rebase:1708"),
+    ("Sno506I", (None, None, None, None, "GGCCGAG"), "(?=(?P<Sno506I>GGCCGAG))|(?=(?P<Sno506I_as>CTCGGCC))", None, 16384.0, None, None, 26389, 65, 37, None, None, None, None, None, "GGCCGAG", 7, "DNA", (), "https://identifiers.org/rebase:26389"),
+    ("Spe19205IV", (None, None, None, None, "GGACY"), "(?=(?P<Spe19205IV>GGAC[CT]))|(?=(?P<Spe19205IV_as>[AG]GTCC))", None, 512.0, None, None, 297945, 65, 37, None, None, None, None, None, "GGACY", 5, "DNA", (), "https://identifiers.org/rebase:297945"),
+    ("SpeI", (1, -1, None, None, "ACTAGT"), "(?=(?P<SpeI>ACTAGT))", None, 4096.0, -1, 1, 1717, 65, 37, -4, "CTAG", None, None, None, "ACTAGT", 6, "DNA", ("B", "J", "K", "M", "N", "O", "Q", "R", "S", "X"), "https://identifiers.org/rebase:1717"),
+    ("SphI", (5, -5, None, None, "GCATGC"), "(?=(?P<SphI>GCATGC))", None, 4096.0, -5, 5, 1719, 65, 37, 4, "CATG", None, None, None, "GCATGC", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "O", "Q", "R", "V", "X"), "https://identifiers.org/rebase:1719"),
+    ("SplI", (1, -1, None, None, "CGTACG"), "(?=(?P<SplI>CGTACG))", None, 4096.0, -1, 1, 1724, 65, 37, -4, "GTAC", None, None, None, "CGTACG", 6, "DNA", (), "https://identifiers.org/rebase:1724"),
+    ("SpnRII", (None, None, None, None, "TCGAG"), "(?=(?P<SpnRII>TCGAG))|(?=(?P<SpnRII_as>CTCGA))", None, 1024.0, None, None, 5624, 65, 37, None, None, None, None, None, "TCGAG", 5, "DNA", (), "https://identifiers.org/rebase:5624"),
+    ("SpoDI", (None, None, None, None, "GCGGRAG"), "(?=(?P<SpoDI>GCGG[AG]AG))|(?=(?P<SpoDI_as>CT[CT]CCGC))", None, 8192.0, None, None, 13737, 65, 37, None, None, None, None, None, "GCGGRAG", 7, "DNA", (), "https://identifiers.org/rebase:13737"),
+    ("SrfI", (4, -4, None, None, "GCCCGGGC"), "(?=(?P<SrfI>GCCCGGGC))", None, 65536.0, -4, 4, 1728, 65, 37, 0, "", None, None, None, "GCCCGGGC", 8, "DNA", ("N",), "https://identifiers.org/rebase:1728"),
+    ("Sse232I", (2, -2, None, None, "CGCCGGCG"), "(?=(?P<Sse232I>CGCCGGCG))", None, 65536.0, -2, 2, 3831, 65, 37, -4, "CCGG", None, None, None, "CGCCGGCG", 8, "DNA", (), "https://identifiers.org/rebase:3831"),
+    ("Sse8387I", (6, -6, None, None, "CCTGCAGG"), "(?=(?P<Sse8387I>CCTGCAGG))", None, 65536.0, -6, 6, 1732, 65, 37, 4, "TGCA", None, None, None, "CCTGCAGG", 8, "DNA", ("K",), "https://identifiers.org/rebase:1732"),
+    ("Sse8647I", (2, -2, None, None, "AGGWCCT"), "(?=(?P<Sse8647I>AGG[AT]CCT))", None, 8192.0, -2, 2, 2637, 65, 37, -3, "GWC", None, None, None, "AGGWCCT", 7, "DNA", (), "https://identifiers.org/rebase:2637"),
+    ("Sse9I", (0, 0, None, None, "AATT"), "(?=(?P<Sse9I>AATT))", None, 256.0, 0, 0, 2639, 65, 37, -4, "AATT", None, None, None, "AATT", 4, "DNA", ("I", "V"), "https://identifiers.org/rebase:2639"),
+    ("SseBI", (3, -3, None, None, "AGGCCT"), "(?=(?P<SseBI>AGGCCT))", None, 4096.0, -3, 3, 2159, 65, 37, 0, "", None, None, None, "AGGCCT", 6, "DNA", ("C",), "https://identifiers.org/rebase:2159"),
+    ("SsiI", (1, -1, None, None, "CCGC"), "(?=(?P<SsiI>CCGC))|(?=(?P<SsiI_as>GCGG))", None, 256.0, -1, 1, 7452, 65, 37, -2, "CG", None, None, None, "CCGC", 4, "DNA", ("B",), "https://identifiers.org/rebase:7452"),
+    ("Ssp6803IV", (None, None, None, None, "GAAGGC"), "(?=(?P<Ssp6803IV>GAAGGC))|(?=(?P<Ssp6803IV_as>GCCTTC))", None, 4096.0, None, None, 7489, 65, 37, None, None, None, None, None, "GAAGGC", 6, "DNA", (), "https://identifiers.org/rebase:7489"),
+    ("Ssp714II", (None, None, None, None, "CGCAGCG"), "(?=(?P<Ssp714II>CGCAGCG))|(?=(?P<Ssp714II_as>CGCTGCG))", None, 16384.0, None, None, 70572, 65, 37, None, None, None, None, None, "CGCAGCG", 7, "DNA", (), "https://identifiers.org/rebase:70572"),
+    ("SspD5I", (13, 8, None, None, "GGTGA"), "(?=(?P<SspD5I>GGTGA))|(?=(?P<SspD5I_as>TCACC))", None, 1024.0, 8, 13, 4114, 65, 37, 0, "", None, None, None, "GGTGA", 5, "DNA", (), "https://identifiers.org/rebase:4114"),
+    ("SspDI", (1, -1, None, None, "GGCGCC"), "(?=(?P<SspDI>GGCGCC))", None, 4096.0, -1, 1, 20303, 65, 37, -4, "GCGC", None, None, None, "GGCGCC", 6, "DNA", ("B",), "https://identifiers.org/rebase:20303"),
+    ("SspI", (3, -3, None, None, "AATATT"), "(?=(?P<SspI>AATATT))", None, 4096.0, -3, 3, 1746, 65, 37, 0, "", None, None, None, "AATATT", 6, "DNA", ("B", "C", "I", "J", "K", "N", "Q", "V", "X"), "https://identifiers.org/rebase:1746"),
+    ("SspJOR1II", (None, None, None, None, "AGCGANC"), "(?=(?P<SspJOR1II>AGCGA.C))|(?=(?P<SspJOR1II_as>G.TCGCT))", None, 4096.0, None, None, 317476, 65, 37, None, None, None, None, None, "AGCGANC", 7, "DNA", (), "https://identifiers.org/rebase:317476"),
+    ("SspMI", (1, -1, None, None, "CTAG"), "(?=(?P<SspMI>CTAG))", None, 256.0, -1, 1, 102129, 65, 37, -2, "TA", None, None, None, "CTAG", 4, "DNA", ("I",), "https://identifiers.org/rebase:102129"),
+    ("SstE37I", (27, 18, None, None, "CGAAGAC"), "(?=(?P<SstE37I>CGAAGAC))|(?=(?P<SstE37I_as>GTCTTCG))", None, 16384.0, 18, 27, 26747, 65, 37, 2, "NN", None, None, None, "CGAAGAC", 7, "DNA", (), "https://identifiers.org/rebase:26747"),
+    ("SstI", (5, -5, None, None, "GAGCTC"), "(?=(?P<SstI>GAGCTC))", None, 4096.0, -5, 5, 1759, 65, 37, 4, "AGCT", None, None, None, "GAGCTC", 6, "DNA", ("C",), "https://identifiers.org/rebase:1759"),
+    ("Sth132I", (8, 8, None, None, "CCCG"), "(?=(?P<Sth132I>CCCG))|(?=(?P<Sth132I_as>CGGG))", None, 256.0, 8, 8, 2567, 65, 37, -4, "NNNN", None, None, None, "CCCG", 4, "DNA", (), "https://identifiers.org/rebase:2567"),
+    ("Sth20745III", (None, None, None, None, "GGACGAC"), "(?=(?P<Sth20745III>GGACGAC))|(?=(?P<Sth20745III_as>GTCGTCC))", None, 16384.0, None, None, 22988, 65, 37, None, None, None, None, None, "GGACGAC", 7, "DNA", (), "https://identifiers.org/rebase:22988"),
+    ("Sth302II", (2, -2, None, None, "CCGG"), "(?=(?P<Sth302II>CCGG))", None, 256.0, -2, 2, 10809, 65, 37, 0, "", None, None, None, "CCGG", 4, "DNA", (), "https://identifiers.org/rebase:10809"),
+    ("SthSt3II", (None, None, None, None, "GAAGT"), "(?=(?P<SthSt3II>GAAGT))|(?=(?P<SthSt3II_as>ACTTC))", None, 1024.0, None, None, 214127, 65, 37, None, None, None, None, None, "GAAGT", 5, "DNA", (), "https://identifiers.org/rebase:214127"),
+    ("StsI", (15, 14, None, None, "GGATG"), "(?=(?P<StsI>GGATG))|(?=(?P<StsI_as>CATCC))", None, 1024.0, 14, 15, 1784, 65, 37, -4, "NNNN", None, None, None, "GGATG", 5, "DNA", (), "https://identifiers.org/rebase:1784"),
+    ("StuI", (3, -3, None, None, "AGGCCT"), "(?=(?P<StuI>AGGCCT))", None, 4096.0, -3, 3, 1785, 65, 37, 0, "", None, None, None, "AGGCCT", 6, "DNA", ("B", "J", "K", "M", "N", "Q", "X"), "https://identifiers.org/rebase:1785"),
+    ("StyD4I", (0, 0, None, None, "CCNGG"), "(?=(?P<StyD4I>CC.GG))", None, 256.0, 0, 0, 1786, 65, 37, -5, "CCNGG", None, None, None, "CCNGG", 5, "DNA", ("N",), "https://identifiers.org/rebase:1786"),
+    ("StyI", (1, -1, None, None, "CCWWGG"), "(?=(?P<StyI>CC[AT][AT]GG))", None, 1024.0, -1, 1, 1787, 65, 37, -4, "CWWG", None, None, None, "CCWWGG", 6, "DNA", ("C", "J", "N"), "https://identifiers.org/rebase:1787"),
+    ("SurP32aII", (None, None, None, None, "ACRGAG"), "(?=(?P<SurP32aII>AC[AG]GAG))|(?=(?P<SurP32aII_as>CTC[CT]GT))", None, 2048.0, None, None, 198625, 65, 37, None, None, None, None, None, "ACRGAG", 6, "DNA", (), "https://identifiers.org/rebase:198625"),
+    ("SwaI", (4, -4, None, None, "ATTTAAAT"), "(?=(?P<SwaI>ATTTAAAT))", None, 65536.0, -4, 4, 1798, 65, 37, 0, "", None, None, None, "ATTTAAAT", 8, "DNA", ("J", "M", "N", "S"), "https://identifiers.org/rebase:1798"),
+    ("Sxy1780I", (None, None, None, None, "GGGTNA"), "(?=(?P<Sxy1780I>GGGT.A))|(?=(?P<Sxy1780I_as>T.ACCC))", None, 1024.0, None, None, 702772, 65, 37, None, None, None, None, None, "GGGTNA", 6, "DNA", (), "https://identifiers.org/rebase:702772"),
+    ("TaaI", (3, -3, None, None, "ACNGT"), "(?=(?P<TaaI>AC.GT))", None, 256.0, -3, 3, 3088, 65, 37, 1, "N", None, None, None, "ACNGT", 5, "DNA", ("B",), "https://identifiers.org/rebase:3088"),
+    ("TagI", (2, -2, None, None, "ACGT"), "(?=(?P<TagI>ACGT))", None, 256.0, -2, 2, 220784, 65, 37, 0, "", None, None, None, "ACGT", 4, "DNA", (), "https://identifiers.org/rebase:220784"),
+    ("TaiI", (4, -4, None, None, "ACGT"), "(?=(?P<TaiI>ACGT))", None, 256.0, -4, 4, 2823, 65, 37, 4, "ACGT", None, None, None, "ACGT", 4, "DNA", ("B",), "https://identifiers.org/rebase:2823"),
+    ("TaqI", (1, -1, None, None, "TCGA"), "(?=(?P<TaqI>TCGA))", None, 256.0, -1, 1, 1801, 65, 37, -2, "CG", None, None, None, "TCGA", 4, "DNA", ("B", "C", "I", "J", "K", "M", "N", "Q", "R", "V", "X"), "https://identifiers.org/rebase:1801"),
+    ("TaqII", (17, 9, None, None, "GACCGA"), "(?=(?P<TaqII>GACCGA))|(?=(?P<TaqII_as>TCGGTC))", None, 4096.0, 9, 17, 1802, 65, 37, 2, "NN", None, None, None, "GACCGA", 6, "DNA", ("Q", "X"), "https://identifiers.org/rebase:1802"),
+    ("TaqIII", (17, 9, None, None, "CACCCA"), "(?=(?P<TaqIII>CACCCA))|(?=(?P<TaqIII_as>TGGGTG))", None, 4096.0, 9, 17, 126474, 65, 37, 2, "NN", None, None, None, "CACCCA", 6, "DNA", (), "https://identifiers.org/rebase:126474"),
+    ("TasI", (0, 0, None, None, "AATT"), "(?=(?P<TasI>AATT))", None, 256.0, 0, 0, 3089, 65, 37, -4, "AATT", None, None, None, "AATT", 4, "DNA", ("B",), "https://identifiers.org/rebase:3089"),
+    ("TatI", (1, -1, None, None, "WGTACW"), "(?=(?P<TatI>[AT]GTAC[AT]))", None, 1024.0, -1, 1, 2746, 65, 37, -4, "GTAC", None, None, None, "WGTACW", 6, "DNA", ("B",), "https://identifiers.org/rebase:2746"),
+    ("TauI", (4, -4, None, None, "GCSGC"), "(?=(?P<TauI>GC[CG]GC))", None, 512.0, -4, 4, 2579, 65, 37, 3, "CSG", None, None, None, "GCSGC", 5, "DNA", ("B",), "https://identifiers.org/rebase:2579"),
+    ("TfiI", (1, -1, None, None, "GAWTC"), "(?=(?P<TfiI>GA[AT]TC))", None, 512.0, -1, 1, 1807, 65, 37, -3, "AWT", None, None, None, "GAWTC", 5, "DNA", ("N",), "https://identifiers.org/rebase:1807"),
+    ("TkoI", (26, 18, None, None, "GTGAAG"), "(?=(?P<TkoI>GTGAAG))|(?=(?P<TkoI_as>CTTCAC))", None, 4096.0, 18, 26, 10788, 65, 37, 2, "NN", None, None, None, "GTGAAG", 6, "DNA", (), "https://identifiers.org/rebase:10788"),
+    ("TkoII", (16, 8, None, None, "TTCAAG"), "(?=(?P<TkoII>TTCAAG))|(?=(?P<TkoII_as>CTTGAA))", None, 4096.0, 8, 16, 10787, 65, 37, 2, "NN", None, None, None, "TTCAAG", 6, "DNA", (), "https://identifiers.org/rebase:10787"),
+    ("TpyTP2I", (None, None, None, None, "ACCAAG"), "(?=(?P<TpyTP2I>ACCAAG))|(?=(?P<TpyTP2I_as>CTTGGT))", None, 4096.0, None, None, 290573, 65, 37, None, None, None, None, None, "ACCAAG", 6, "DNA", (), "https://identifiers.org/rebase:290573"),
+    ("Tru1I", (1, -1, None, None, "TTAA"), "(?=(?P<Tru1I>TTAA))", None, 256.0, -1, 1, 2218, 65, 37, -2, "TA", None, None, None, "TTAA", 4, "DNA", ("B",), "https://identifiers.org/rebase:2218"),
+    ("Tru9I", (1, -1, None, None, "TTAA"), "(?=(?P<Tru9I>TTAA))", None, 256.0, -1, 1, 1817, 65, 37, -2, "TA", None, None, None, "TTAA", 4, "DNA", ("I", "M", "V"), "https://identifiers.org/rebase:1817"),
+    ("TscAI", (7, -7, None, None, "CASTG"), "(?=(?P<TscAI>CA[CG]TG))", None, 512.0, -7, 7, 15359, 65, 37, 10, "NNCASTGNN", None, None, None, "CASTG", 5, "DNA", ("B",), "https://identifiers.org/rebase:15359"),
+    ("TseFI", (0, 0, None, None, "GTSAC"), "(?=(?P<TseFI>GT[CG]AC))", None, 512.0, 0, 0, 55431, 65, 37, -5, "GTSAC", None, None, None, "GTSAC", 5, "DNA", ("I",), "https://identifiers.org/rebase:55431"),
+    ("TseI", (1, -1, None, None, "GCWGC"), "(?=(?P<TseI>GC[AT]GC))", None, 512.0, -1, 1, 2537, 65, 37, -3, "CWG", None, None, None, "GCWGC", 5, "DNA", ("N",), "https://identifiers.org/rebase:2537"),
+    ("TsoI", (17, 9, None, None, "TARCCA"), "(?=(?P<TsoI>TA[AG]CCA))|(?=(?P<TsoI_as>TGG[CT]TA))", None, 2048.0, 9, 17, 7540, 65, 37, 2, "NN", None, None, None, "TARCCA", 6, "DNA", (), "https://identifiers.org/rebase:7540"),
+    ("Tsp45I", (0, 0, None, None, "GTSAC"), "(?=(?P<Tsp45I>GT[CG]AC))", None, 512.0, 0, 0, 1822, 65, 37, -5, "GTSAC", None, None, None, "GTSAC", 5, "DNA", ("N",), "https://identifiers.org/rebase:1822"),
+    ("Tsp4CI", (3, -3, None, None, "ACNGT"), "(?=(?P<Tsp4CI>AC.GT))", None, 256.0, -3, 3, 2795, 65, 37, 1, "N", None, None, None, "ACNGT", 5, "DNA", (), "https://identifiers.org/rebase:2795"),
+    ("TspARh3I", (None, None, None, None, "GRACGAC"), "(?=(?P<TspARh3I>G[AG]ACGAC))|(?=(?P<TspARh3I_as>GTCGT[CT]C))", None, 8192.0, None, None, 58600, 65, 37, None, None, None, None, None, "GRACGAC", 7, "DNA", (), "https://identifiers.org/rebase:58600"),
+    ("TspDTI", (16, 9, None, None, "ATGAA"), "(?=(?P<TspDTI>ATGAA))|(?=(?P<TspDTI_as>TTCAT))", None, 1024.0, 9, 16, 5798, 65, 37, 2, "NN", None, None, None, "ATGAA", 5, "DNA", ("Q", "X"), "https://identifiers.org/rebase:5798"),
+    ("TspEI", (0, 0, None, None, "AATT"), "(?=(?P<TspEI>AATT))", None, 256.0, 0, 0, 1824, 65, 37, -4, "AATT", None, None, None, "AATT", 4, "DNA", (), "https://identifiers.org/rebase:1824"),
+    ("TspGWI", (16, 9, None, None, "ACGGA"), "(?=(?P<TspGWI>ACGGA))|(?=(?P<TspGWI_as>TCCGT))", None, 1024.0, 9, 16, 5332, 65, 37, 2, "NN", None, None, None, "ACGGA", 5, "DNA", ("Q", "X"), "https://identifiers.org/rebase:5332"),
+    ("TspMI", (1, -1, None, None, "CCCGGG"), "(?=(?P<TspMI>CCCGGG))", None, 4096.0, -1, 1, 7191, 65, 37, -4, "CCGG", None, None, None, "CCCGGG", 6, "DNA", ("N",), "https://identifiers.org/rebase:7191"),
+    ("TspRI", (7, -7, None, None, "CASTG"), "(?=(?P<TspRI>CA[CG]TG))", None, 512.0, -7, 7, 2463, 65, 37, 10, "NNCASTGNN", None, None, None, "CASTG", 5, "DNA", ("N",), "https://identifiers.org/rebase:2463"),
+    ("TssI", (None, None, None, None, "GAGNNNCTC"), "(?=(?P<TssI>GAG...CTC))", None, 4096.0, None, None, 10540, 65, 37, None, None, None, None, None, "GAGNNNCTC", 9, "DNA", (), "https://identifiers.org/rebase:10540"),
+    ("TstI", (-8, -25, 24, 7, "CACNNNNNNTCC"), "(?=(?P<TstI>CAC......TCC))|(?=(?P<TstI_as>GGA......GTG))", None, 4096.0, -25, -8, 7739, 65, 37, 5, "NNNNN", None, 7, 24, "CACNNNNNNTCC", 12, "DNA", (), "https://identifiers.org/rebase:7739"),
+    ("TsuI", (None, None, None, None, "GCGAC"), "(?=(?P<TsuI>GCGAC))|(?=(?P<TsuI_as>GTCGC))", None, 1024.0, None, None, 8158, 65, 37, None, None, None, None, None, "GCGAC", 5, "DNA", (), "https://identifiers.org/rebase:8158"),
+    ("Tth111I", (4, -4, None, None, "GACNNNGTC"), "(?=(?P<Tth111I>GAC...GTC))", None, 4096.0, -4, 4, 1829, 65, 37, -1, "N", None, None, None, "GACNNNGTC", 9, "DNA", ("I", "K", "N", "Q", "V", "X"), "https://identifiers.org/rebase:1829"),
+    ("Tth111II", (17, 9, None, None, "CAARCA"), "(?=(?P<Tth111II>CAA[AG]CA))|(?=(?P<Tth111II_as>TG[CT]TTG))", None, 2048.0, 9, 17, 1830, 65, 37, 2, "NN", None, None, None, "CAARCA", 6, "DNA", (), "https://identifiers.org/rebase:1830"),
+    ("UbaF11I", (None, None, None, None, "TCGTA"), "(?=(?P<UbaF11I>TCGTA))|(?=(?P<UbaF11I_as>TACGA))", None, 1024.0, None, None, 11658, 65, 37, None, None, None, None, None, "TCGTA", 5, "DNA", (), "https://identifiers.org/rebase:11658"),
+    ("UbaF12I", (None, None, None, None, "CTACNNNGTC"), "(?=(?P<UbaF12I>CTAC...GTC))|(?=(?P<UbaF12I_as>GAC...GTAG))", None, 16384.0, None, None, 13011, 65, 37, None, None, None, None, None, "CTACNNNGTC", 10, "DNA", (), "https://identifiers.org/rebase:13011"),
+    ("UbaF13I", (None, None, None, None, "GAGNNNNNNCTGG"), "(?=(?P<UbaF13I>GAG......CTGG))|(?=(?P<UbaF13I_as>CCAG......CTC))", None, 16384.0, None, None, 13892, 65, 37, None, None, None, None, None, "GAGNNNNNNCTGG", 13, "DNA", (), "https://identifiers.org/rebase:13892"),
+    ("UbaF14I", (None, None, None, None, "CCANNNNNTCG"), "(?=(?P<UbaF14I>CCA.....TCG))|(?=(?P<UbaF14I_as>CGA.....TGG))", None, 4096.0, None, None, 13967, 65, 37, None, None, None, None, None, "CCANNNNNTCG", 11, "DNA", (), "https://identifiers.org/rebase:13967"),
+    ("UbaF9I", (None, None, None, None, "TACNNNNNRTGT"), "(?=(?P<UbaF9I>TAC.....[AG]TGT))|(?=(?P<UbaF9I_as>ACA[CT].....GTA))", None, 8192.0, None, None, 10733, 65, 37, None, None, None, None, None, "TACNNNNNRTGT", 12, "DNA", (), "https://identifiers.org/rebase:10733"),
+    ("UbaPI", (None, None, None, None, "CGAACG"), "(?=(?P<UbaPI>CGAACG))|(?=(?P<UbaPI_as>CGTTCG))", None, 4096.0, None, None, 4118, 65, 37, None, None, None, None, None, "CGAACG", 6, "DNA", (), "https://identifiers.org/rebase:4118"),
+    ("UcoMSI", (-7, -11, 11, 7, "GAGCTC"), "(?=(?P<UcoMSI>GAGCTC))", None, 4096.0, -11, -7, 38634, 65, 37, -2, "NN", None, 7, 11, "GAGCTC", 6, "DNA", (), "https://identifiers.org/rebase:38634"),
+    ("UnbI", (0, 0, None, None, "GGNCC"), "(?=(?P<UnbI>GG.CC))", None, 256.0, 0, 0, 3815, 65, 37, -5, "GGNCC", None, None, None, "GGNCC", 5, "DNA", (), "https://identifiers.org/rebase:3815"),
+    ("UpaP162I", (2, -2, None, None, "CATG"), "(?=(?P<UpaP162I>CATG))", None, 256.0, -2, 2, 277875, 65, 37, 0, "", None, None, None, "CATG", 4, "DNA", (), "https://identifiers.org/rebase:277875"),
+    ("Van9116I", (None, None, None, None, "CCKAAG"), "(?=(?P<Van9116I>CC[GT]AAG))|(?=(?P<Van9116I_as>CTT[AC]GG))", None, 2048.0, None, None, 208144, 65, 37, None, None, None, None, None, "CCKAAG", 6, "DNA", (), "https://identifiers.org/rebase:208144"),
+    ("Van91I", (7, -7, None, None, "CCANNNNNTGG"), "(?=(?P<Van91I>CCA.....TGG))", None, 4096.0, -7, 7, 2108, 65, 37, 3, "NNN", None, None, None, "CCANNNNNTGG", 11, "DNA", ("B", "K"), "https://identifiers.org/rebase:2108"),
+    ("VchE4II", (None, None, None, None, "RTAAAYG"), "(?=(?P<VchE4II>[AG]TAAA[CT]G))|(?=(?P<VchE4II_as>C[AG]TTTA[CT]))", None, 4096.0, None, None, 278400, 65, 37, None, None, None, None, None, "RTAAAYG", 7, "DNA", (), "https://identifiers.org/rebase:278400"),
+    ("Vdi96II", (None, None, None, None, "GNCYTAG"), "(?=(?P<Vdi96II>G.C[CT]TAG))|(?=(?P<Vdi96II_as>CTA[AG]G.C))", None, 2048.0, None, None, 235889, 65, 37, None, None, None, None, None, "GNCYTAG", 7, "DNA", (), "https://identifiers.org/rebase:235889"),
+    ("Vha464I", (1, -1, None, None, "CTTAAG"), "(?=(?P<Vha464I>CTTAAG))", None, 4096.0, -1, 1, 2113, 65, 37, -4, "TTAA", None, None, None, "CTTAAG", 6, "DNA", ("V",), "https://identifiers.org/rebase:2113"),
+    ("VneI", (1, -1, None, None, "GTGCAC"), "(?=(?P<VneI>GTGCAC))", None, 4096.0, -1, 1, 2116, 65, 37, -4, "TGCA", None, None, None, "GTGCAC", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2116"),
+    ("VpaK11AI", (0, 0, None, None, "GGWCC"), "(?=(?P<VpaK11AI>GG[AT]CC))", None, 512.0, 0, 0, 2659, 65, 37, -5, "GGWCC", None, None, None, "GGWCC", 5, "DNA", (), "https://identifiers.org/rebase:2659"),
+    ("VpaK11BI", (1, -1, None, None, "GGWCC"), "(?=(?P<VpaK11BI>GG[AT]CC))", None, 512.0, -1, 1, 2660, 65, 37, -3, "GWC", None, None, None, "GGWCC", 5, "DNA", ("K",), "https://identifiers.org/rebase:2660"),
+    ("VpaSKIII", (None, None, None, None, "CGTCAG"), "(?=(?P<VpaSKIII>CGTCAG))|(?=(?P<VpaSKIII_as>CTGACG))", None, 4096.0, None, None, 618776, 65, 37, None, None, None, None, None, "CGTCAG", 6, "DNA", (), "https://identifiers.org/rebase:618776"),
+    ("VspI", (2, -2, None, None, "ATTAAT"), "(?=(?P<VspI>ATTAAT))", None, 4096.0, -2, 2, 2124, 65, 37, -2, "TA", None, None, None, "ATTAAT", 6, "DNA", ("B", "I", "V"), "https://identifiers.org/rebase:2124"),
+    ("Vtu19109I", (None, None, None, None, "CACRAYC"), "(?=(?P<Vtu19109I>CAC[AG]A[CT]C))|(?=(?P<Vtu19109I_as>G[AG]T[CT]GTG))", None, 4096.0, None, None, 97533, 65, 37, None, None, None, None, None, "CACRAYC", 7, "DNA", (), "https://identifiers.org/rebase:97533"),
+    ("WviI", (27, 19, None, None, "CACRAG"), "(?=(?P<WviI>CAC[AG]AG))|(?=(?P<WviI_as>CT[CT]GTG))", None, 2048.0, 19, 27, 33033, 65, 37, 2, "NN", None, None, None, "CACRAG", 6, "DNA", (), "https://identifiers.org/rebase:33033"),
+    ("XagI", (5, -5, None, None, "CCTNNNNNAGG"), "(?=(?P<XagI>CCT.....AGG))", None, 4096.0, -5, 5, 2987, 65, 37, -1, "N", None, None, None, "CCTNNNNNAGG", 11, "DNA", ("B",), "https://identifiers.org/rebase:2987"),
+    ("XapI", (1, -1, None, None, "RAATTY"), "(?=(?P<XapI>[AG]AATT[CT]))", None, 1024.0, -1, 1, 3195, 65, 37, -4, "AATT", None, None, None, "RAATTY", 6, "DNA", ("B",), "https://identifiers.org/rebase:3195"),
+    ("XbaI", (1, -1, None, None, "TCTAGA"), "(?=(?P<XbaI>TCTAGA))", None, 4096.0, -1, 1, 2126, 65, 37, -4, "CTAG", None, None, None, "TCTAGA", 6, "DNA", ("B", "C", "I", "J", "K", "M", "N", "Q", "R", "S", "V", "X"), "https://identifiers.org/rebase:2126"),
+    ("Xca85IV", (None, None, None, None, "TACGAG"), "(?=(?P<Xca85IV>TACGAG))|(?=(?P<Xca85IV_as>CTCGTA))", None, 4096.0, None, None, 162608, 65, 37, None, None, None, None, None, "TACGAG", 6, "DNA", (), "https://identifiers.org/rebase:162608"),
+    ("XceI", (5, -5, None, None, "RCATGY"), "(?=(?P<XceI>[AG]CATG[CT]))", None, 1024.0, -5, 5, 3092, 65, 37, 4, "CATG", None, None, None, "RCATGY", 6, "DNA", ("B",), "https://identifiers.org/rebase:3092"),
+    ("XcmI", (8, -8, None, None, "CCANNNNNNNNNTGG"), "(?=(?P<XcmI>CCA.........TGG))", None, 4096.0, -8, 8, 2129, 65, 37, 1, "N", None, None, None, "CCANNNNNNNNNTGG", 15, "DNA", ("N",), "https://identifiers.org/rebase:2129"),
+    ("XhoI", (1, -1, None, None, "CTCGAG"), "(?=(?P<XhoI>CTCGAG))", None, 4096.0, -1, 1, 2136, 65, 37, -4, "TCGA", None, None, None, "CTCGAG", 6, "DNA", ("B", "J", "K", "M", "N", "O", "Q", "R", "X"), "https://identifiers.org/rebase:2136"),
+    ("XhoII", (1, -1, None, None, "RGATCY"), "(?=(?P<XhoII>[AG]GATC[CT]))", None, 1024.0, -1, 1, 2137, 65, 37, -4, "GATC", None, None, None, "RGATCY", 6, "DNA", (), "https://identifiers.org/rebase:2137"),
+    ("XmaI", (1, -1, None, None, "CCCGGG"), "(?=(?P<XmaI>CCCGGG))", None, 4096.0, -1, 1, 2138, 65, 37, -4, "CCGG", None, None, None, "CCCGGG", 6, "DNA", ("I", "N", "V"), "https://identifiers.org/rebase:2138"),
+    ("XmaIII", (1, -1, None, None, "CGGCCG"), "(?=(?P<XmaIII>CGGCCG))", None, 4096.0, -1, 1, 2140, 65, 37, -4, "GGCC", None, None, None, "CGGCCG", 6, "DNA", (), "https://identifiers.org/rebase:2140"),
+    ("XmaJI", (1, -1, None, None, "CCTAGG"), "(?=(?P<XmaJI>CCTAGG))", None, 4096.0, -1, 1, 4112, 65, 37, -4, "CTAG", None, None, None, "CCTAGG", 6, "DNA", ("B",), "https://identifiers.org/rebase:4112"),
+    ("XmiI", (2, -2, None, None, "GTMKAC"), "(?=(?P<XmiI>GT[AC][GT]AC))", None, 1024.0, -2, 2, 3828, 65, 37, -2, "MK", None, None, None, "GTMKAC", 6, "DNA", ("B",), "https://identifiers.org/rebase:3828"),
+    ("XmnI", (5, -5, None, None, "GAANNNNTTC"), "(?=(?P<XmnI>GAA....TTC))", None, 4096.0, -5, 5, 2143, 65, 37, 0, "", None, None, None, "GAANNNNTTC", 10, "DNA", ("N",), "https://identifiers.org/rebase:2143"),
+    ("XspI", (1, -1, None, None, "CTAG"), "(?=(?P<XspI>CTAG))", None, 256.0, -1, 1, 3825, 65, 37, -2, "TA", None, None, None, "CTAG", 4, "DNA", ("K",), "https://identifiers.org/rebase:3825"),
+    ("YkrI", (11, 9, None, None, "C"), "(?=(?P<YkrI>C))|(?=(?P<YkrI_as>G))", None, 4.0, 9, 11, 23238, 65, 37, 1, "N", None, None, None, "C", 1, "DNA", (), "https://identifiers.org/rebase:23238"),
+    ("Yps3606I", (None, None, None, None, "CGGAAG"), "(?=(?P<Yps3606I>CGGAAG))|(?=(?P<Yps3606I_as>CTTCCG))", None, 4096.0, None, None, 102781, 65, 37, None, None, None, None, None, "CGGAAG", 6, "DNA", (), "https://identifiers.org/rebase:102781"),
+    ("Yru12986I", (None, None, None, None, "AGGAAG"), "(?=(?P<Yru12986I>AGGAAG))|(?=(?P<Yru12986I_as>CTTCCT))", None, 4096.0, None, None, 420275, 65, 37, None, None, None, None, None, "AGGAAG", 6, "DNA", (), "https://identifiers.org/rebase:420275"),
+    ("ZraI", (3, -3, None, None, "GACGTC"), "(?=(?P<ZraI>GACGTC))", None, 4096.0, -3, 3, 5363, 65, 37, 0, "", None, None, None, "GACGTC", 6, "DNA", ("I", "N", "V"), "https://identifiers.org/rebase:5363"),
+    ("ZrmI", (3, -3, None, None, "AGTACT"), "(?=(?P<ZrmI>AGTACT))", None, 4096.0, -3, 3, 7494, 65, 37, 0, "", None, None, None, "AGTACT", 6, "DNA", ("I",), "https://identifiers.org/rebase:7494"),
+    ("Zsp2I", (5, -5, None, None, "ATGCAT"), "(?=(?P<Zsp2I>ATGCAT))", None, 4096.0, -5, 5, 2156, 65, 37, 4, "TGCA", None, None, None, "ATGCAT", 6, "DNA", ("I", "V"), "https://identifiers.org/rebase:2156"),
+)
+
+rest_dict = {enzyme[0]: dict(zip(_fields, enzyme[1:])) for enzyme in _enzymes}
+
+
 suppliers = {}
 
 suppliers["B"] = (
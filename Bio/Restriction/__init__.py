@@ -53,7 +53,29 @@ Examples
 
 """  # noqa: W291, W293
 
-from Bio.Restriction.Restriction import *  # noqa (legacy module arrangement)
+from Bio.Restriction import Restriction as _Restriction
+from Bio.Restriction.Restriction import Analysis  # noqa: F401
+from Bio.Restriction.Restriction import FormattedSeq  # noqa: F401
+from Bio.Restriction.Restriction import RestrictionBatch  # noqa: F401
+from Bio.Restriction.Restriction import SiteMatcher  # noqa: F401
+
+# The restriction enzymes and the batches AllEnzymes, CommOnly and NonComm
+# are only created when first used (see Restriction.py).
+__all__ = _Restriction.__all__
+
+
+def __getattr__(name):
+    """Return the restriction enzymes and pre-made batches on first use."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_Restriction, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names in the module, including all restriction enzymes."""
+    return sorted(set(globals()).union(__all__))
 
 
 #
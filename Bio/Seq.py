@@ -21,8 +21,10 @@ See also the Seq_ wiki and the chapter in our tutorial:
 """
 
 import collections
+import itertools
 import numbers
 import warnings
+import weakref
 from abc import ABC
 from abc import abstractmethod
 from typing import Optional
@@ -2733,6 +2735,204 @@ def back_transcribe(rna):
         return rna.replace("U", "T").replace("u", "t")
 
 
+def _get_codon_table(table):
+    """Return the CodonTable object for a table name, NCBI identifier, or table (PRIVATE).
+
+    For a name or an identifier, the ambiguous generic table is returned,
+    as the same table can be used for DNA and RNA.
+    """
+    try:
+        table_id = int(table)
+    except ValueError:
+        # Assume it's a table name
+        # The same table can be used for RNA or DNA
+        try:
+            codon_table = CodonTable.ambiguous_generic_by_name[table]
+        except KeyError:
+            if isinstance(table, str):
+                raise ValueError(
+                    "The Bio.Seq translate methods and function DO NOT "
+                    "take a character string mapping table like the python "
+                    "string object's translate method. "
+                    "Use str(my_seq).translate(...) instead."
+                ) from None
+            else:
+                raise TypeError("table argument must be integer or string") from None
+    except (AttributeError, TypeError):
+        # Assume it's a CodonTable object
+        if isinstance(table, CodonTable.CodonTable):
+            codon_table = table
+        else:
+            raise ValueError("Bad table argument") from None
+    else:
+        # Assume it's a table ID
+        # The same table can be used for RNA or DNA
+        codon_table = CodonTable.ambiguous_generic_by_id[table_id]
+    return codon_table
+
+
+def _get_valid_letters(codon_table):
+    """Return the set of valid (upper case) nucleotide letters of a table (PRIVATE)."""
+    if codon_table.nucleotide_alphabet is not None:
+        return set(codon_table.nucleotide_alphabet.upper())
+    # Assume the worst case, ambiguous DNA or RNA:
+    return set(
+        IUPACData.ambiguous_dna_letters.upper()
+        + IUPACData.ambiguous_rna_letters.upper()
+    )
+
+
+# Codons which can be both STOP and an amino acid, for each CodonTable used
+_dual_coding_codons = weakref.WeakKeyDictionary()
+
+
+def _check_dual_coding(codon_table, to_stop):
+    """Warn about, or reject for to_stop, codons coding for STOP and an amino acid (PRIVATE)."""
+    forward_table = codon_table.forward_table
+    # Check for tables with 'ambiguous' (dual-coding) stop codons:
+    try:
+        dual_coding = _dual_coding_codons[codon_table]
+    except KeyError:
+        dual_coding = [c for c in codon_table.stop_codons if c in forward_table]
+        _dual_coding_codons[codon_table] = dual_coding
+    if dual_coding:
+        c = dual_coding[0]
+        if to_stop:
+            raise ValueError(
+                "You cannot use 'to_stop=True' with this table as it contains"
+                f" {len(dual_coding)} codon(s) which can be both STOP and an"
+                f" amino acid (e.g. '{c}' -> '{forward_table[c]}' or STOP)."
+            )
+        warnings.warn(
+            f"This table contains {len(dual_coding)} codon(s) which code(s) for"
+            f" both STOP and an amino acid (e.g. '{c}' -> '{forward_table[c]}'"
+            " or STOP). Such codons will be translated as amino acid.",
+            BiopythonWarning,
+        )
+
+
+# Values used in the codon lookup tables for codons which do not translate
+# to an amino acid; amino acids are stored as their ASCII value.
+_INVALID_CODON = 0
+_STOP_CODON = 1
+_POSSIBLE_STOP_CODON = 2
+
+# Codon lookup tables, created when a CodonTable is first used
+_codon_lookups = weakref.WeakKeyDictionary()
+
+
+def _get_codon_lookup(codon_table):
+    """Return the codon lookup table for a CodonTable object (PRIVATE).
+
+    The lookup table is a tuple (first, second, third, translations) of
+    NumPy arrays. The first three map each byte value (upper or lower case
+    nucleotide letter) at the first, second, and third codon position to
+    an offset, such that the sum of the three offsets is the index of the
+    codon in translations. All invalid letters map to the same offset. The
+    translations array stores the ASCII value of the amino acid of each
+    codon, or one of the values _STOP_CODON, _POSSIBLE_STOP_CODON, or
+    _INVALID_CODON.
+
+    All combinations of the letters in the table are included, so that
+    ambiguous codons are translated exactly as the forward table would.
+    Returns None if the table cannot be represented in this way (for
+    example, if it uses letters outside of ASCII).
+    """
+    try:
+        return _codon_lookups[codon_table]
+    except KeyError:
+        pass
+    import numpy as np  # Lazy import
+
+    forward_table = codon_table.forward_table
+    stop_codons = codon_table.stop_codons
+    valid_letters = _get_valid_letters(codon_table)
+    letters = set(valid_letters)
+    # The forward table of an ambiguous codon table wraps an unambiguous one,
+    # and also accepts the letters of its ambiguous nucleotide values
+    codons = getattr(forward_table, "forward_table", forward_table)
+    for codon in itertools.chain(codons, stop_codons):
+        letters.update(codon)
+    letters.update(getattr(forward_table, "ambiguous_nucleotide", ""))
+    letters = "".join(sorted(letters))
+    lookup = None
+    if letters.isascii() and letters == letters.upper() and len(letters) < 40:
+        size = len(letters) + 1
+        letter_indices = np.zeros(256, np.uint16)
+        for index, letter in enumerate(letters, 1):
+            letter_indices[ord(letter)] = index
+            letter_indices[ord(letter.lower())] = index
+        translations = np.zeros(size**3, np.uint8)
+        for (i, c1), (j, c2), (k, c3) in itertools.product(
+            enumerate(letters, 1), repeat=3
+        ):
+            codon = c1 + c2 + c3
+            # Same logic as in _translate_str
+            try:
+                amino_acid = forward_table[codon]
+            except (KeyError, CodonTable.TranslationError):
+                if codon in stop_codons:
+                    value = _STOP_CODON
+                elif valid_letters.issuperset(codon):
+                    value = _POSSIBLE_STOP_CODON
+                else:
+                    value = _INVALID_CODON
+            else:
+                if len(amino_acid) != 1 or not amino_acid.isascii():
+                    break
+                value = ord(amino_acid)
+                if value <= _POSSIBLE_STOP_CODON:
+                    break
+            translations[(i * size + j) * size + k] = value
+        else:
+            first = letter_indices * size * size
+            second = letter_indices * size
+            third = letter_indices
+            lookup = (first, second, third, translations)
+    _codon_lookups[codon_table] = lookup
+    return lookup
+
+
+def _translate_codons(data, lookup, gap, until_stop=False):
+    """Translate the codons in a bytes object using a codon lookup table (PRIVATE).
+
+    Arguments:
+     - data - bytes object; its length must be a multiple of three.
+     - lookup - codon lookup table, as returned by _get_codon_lookup.
+     - gap - gap character, or None.
+     - until_stop - if True, translation stops after the first stop codon.
+
+    Returns a bytes object with the amino acid of each codon, _STOP_CODON
+    for stop codons, and _POSSIBLE_STOP_CODON for ambiguous codons that may
+    be a stop codon. Gap codons are translated as the gap character. Raises
+    a TranslationError for invalid codons.
+    """
+    import numpy as np  # Lazy import
+
+    first, second, third, translations = lookup
+    nucleotides = np.frombuffer(data, np.uint8)
+    indices = first[nucleotides[0::3]]
+    indices += second[nucleotides[1::3]]
+    indices += third[nucleotides[2::3]]
+    protein = translations[indices].tobytes()
+    if until_stop:
+        i = protein.find(_STOP_CODON)
+        if i >= 0:
+            protein = protein[: i + 1]
+    i = protein.find(_INVALID_CODON)
+    if i >= 0:
+        protein = bytearray(protein)
+        while i >= 0:
+            codon = data[3 * i : 3 * i + 3]
+            if not gap or codon != gap.encode() * 3:
+                codon = codon.decode("ASCII")
+                raise CodonTable.TranslationError(f"Codon '{codon}' is invalid")
+            protein[i] = ord(gap)
+            i = protein.find(_INVALID_CODON, i + 1)
+        protein = bytes(protein)
+    return protein
+
+
 def _translate_str(
     sequence, table, stop_symbol="*", to_stop=False, cds=False, pos_stop="X", gap=None
 ):
@@ -2798,63 +2998,15 @@ def _translate_str(
        ...
     Bio.Data.CodonTable.TranslationError: Extra in frame stop codon 'TAG' found.
     """
-    try:
-        table_id = int(table)
-    except ValueError:
-        # Assume it's a table name
-        # The same table can be used for RNA or DNA
-        try:
-            codon_table = CodonTable.ambiguous_generic_by_name[table]
-        except KeyError:
-            if isinstance(table, str):
-                raise ValueError(
-                    "The Bio.Seq translate methods and function DO NOT "
-                    "take a character string mapping table like the python "
-                    "string object's translate method. "
-                    "Use str(my_seq).translate(...) instead."
-                ) from None
-            else:
-                raise TypeError("table argument must be integer or string") from None
-    except (AttributeError, TypeError):
-        # Assume it's a CodonTable object
-        if isinstance(table, CodonTable.CodonTable):
-            codon_table = table
-        else:
-            raise ValueError("Bad table argument") from None
-    else:
-        # Assume it's a table ID
-        # The same table can be used for RNA or DNA
-        codon_table = CodonTable.ambiguous_generic_by_id[table_id]
+    codon_table = _get_codon_table(table)
     sequence = sequence.upper()
     amino_acids = []
     forward_table = codon_table.forward_table
     stop_codons = codon_table.stop_codons
-    if codon_table.nucleotide_alphabet is not None:
-        valid_letters = set(codon_table.nucleotide_alphabet.upper())
-    else:
-        # Assume the worst case, ambiguous DNA or RNA:
-        valid_letters = set(
-            IUPACData.ambiguous_dna_letters.upper()
-            + IUPACData.ambiguous_rna_letters.upper()
-        )
+    valid_letters = _get_valid_letters(codon_table)
     n = len(sequence)
 
-    # Check for tables with 'ambiguous' (dual-coding) stop codons:
-    dual_coding = [c for c in stop_codons if c in forward_table]
-    if dual_coding:
-        c = dual_coding[0]
-        if to_stop:
-            raise ValueError(
-                "You cannot use 'to_stop=True' with this table as it contains"
-                f" {len(dual_coding)} codon(s) which can be both STOP and an"
-                f" amino acid (e.g. '{c}' -> '{forward_table[c]}' or STOP)."
-            )
-        warnings.warn(
-            f"This table contains {len(dual_coding)} codon(s) which code(s) for"
-            f" both STOP and an amino acid (e.g. '{c}' -> '{forward_table[c]}'"
-            " or STOP). Such codons will be translated as amino acid.",
-            BiopythonWarning,
-        )
+    _check_dual_coding(codon_table, to_stop)
 
     if cds:
         if str(sequence[:3]).upper() not in codon_table.start_codons:
@@ -2886,6 +3038,33 @@ def _translate_str(
         elif len(gap) > 1:
             raise ValueError("Gap character should be a single character string.")
 
+    lookup = _get_codon_lookup(codon_table)
+    if (
+        lookup is not None
+        and sequence.isascii()
+        and len(stop_symbol) == 1
+        and stop_symbol.isascii()
+        and len(pos_stop) == 1
+        and pos_stop.isascii()
+        and (not gap or gap.isascii())
+    ):
+        # Translate all codons at once using the lookup table
+        data = sequence[: n - n % 3].encode("ASCII")
+        protein = _translate_codons(data, lookup, gap, cds or to_stop)
+        if (cds or to_stop) and protein.endswith(bytes([_STOP_CODON])):
+            if cds:
+                i = 3 * (len(protein) - 1)
+                codon = sequence[i : i + 3]
+                raise CodonTable.TranslationError(
+                    f"Extra in frame stop codon '{codon}' found."
+                )
+            protein = protein[:-1]
+        markers = bytes([_STOP_CODON, _POSSIBLE_STOP_CODON])
+        symbols = (stop_symbol + pos_stop).encode("ASCII")
+        protein = protein.translate(bytes.maketrans(markers, symbols))
+        amino_acids.append(protein.decode("ASCII"))
+        return "".join(amino_acids)
+
     for i in range(0, n - n % 3, 3):
         codon = sequence[i : i + 3]
         try:
@@ -3016,6 +3195,94 @@ def translate(
         return _translate_str(sequence, table, stop_symbol, to_stop, cds, gap=gap)
 
 
+def translate_six_frames(sequences, table="Standard", stop_symbol="*", gap=None):
+    """Translate nucleotide sequences in all six reading frames.
+
+    Arguments:
+     - sequences - an iterable of nucleotide sequences, as strings, Seq,
+       or MutableSeq objects.
+     - table - Which codon table to use?  This can be either a name
+       (string), an NCBI identifier (integer), or a CodonTable object
+       (useful for non-standard genetic codes).  Defaults to the "Standard"
+       table.
+     - stop_symbol - Single character string, what to use for any
+       terminators, defaults to the asterisk, "*".
+     - gap - Single character string to denote symbol used for gaps.
+       Defaults to None.
+
+    Returns a list with a tuple of six translations for each sequence, for
+    the frames +1, +2, +3 (starting at the first, second, and third letter
+    of the sequence) followed by the frames -1, -2, -3 (starting at the
+    first, second, and third letter of the reverse complement). Each frame
+    is translated up to its last complete codon. The translations are
+    strings for string sequences, and Seq objects otherwise.
+
+    All codons of all sequences are translated together, which is much
+    faster than translating each frame of each sequence separately:
+
+    >>> for frames in translate_six_frames(["ATGGCCATTGTAATGGGCCGCTGA", "TTAG"]):
+    ...     print(frames)
+    ...
+    ('MAIVMGR*', 'WPL*WAA', 'GHCNGPL', 'SAAHYNGH', 'QRPITMA', 'SGPLQWP')
+    ('L', '*', '', 'L', '*', '')
+
+    Ambiguous codons that may be a stop codon are translated as "X", as in
+    the translate function.
+    """
+    if isinstance(sequences, (str, bytes, _SeqAbstractBaseClass)):
+        raise TypeError("Expected an iterable of sequences")
+    codon_table = _get_codon_table(table)
+    _check_dual_coding(codon_table, False)
+    if gap is not None:
+        if not isinstance(gap, str):
+            raise TypeError("Gap character should be a single character string.")
+        elif len(gap) > 1:
+            raise ValueError("Gap character should be a single character string.")
+    lookup = _get_codon_lookup(codon_table)
+    frames = []
+    types = []
+    for sequence in sequences:
+        if isinstance(sequence, str):
+            data = sequence.encode("ASCII", "replace")
+            types.append(str)
+        else:
+            data = bytes(sequence)
+            types.append(Seq)
+        n = len(data)
+        for strand in (data, data.translate(_dna_complement_table)[::-1]):
+            for start in range(3):
+                end = start + max(n - start, 0) // 3 * 3
+                frames.append(strand[start:end])
+    if (
+        lookup is None
+        or len(stop_symbol) != 1
+        or not stop_symbol.isascii()
+        or (gap and not gap.isascii())
+    ):
+        translations = [
+            _translate_str(
+                frame.decode("ASCII", "replace"), codon_table, stop_symbol, gap=gap
+            )
+            for frame in frames
+        ]
+    else:
+        protein = _translate_codons(b"".join(frames), lookup, gap)
+        markers = bytes([_STOP_CODON, _POSSIBLE_STOP_CODON])
+        symbols = (stop_symbol + "X").encode("ASCII")
+        protein = protein.translate(bytes.maketrans(markers, symbols))
+        protein = protein.decode("ASCII")
+        translations = []
+        start = 0
+        for frame in frames:
+            end = start + len(frame) // 3
+            translations.append(protein[start:end])
+            start = end
+    return [
+        tuple(cls(translation) for translation in translations[6 * i : 6 * i + 6])
+        for i, cls in enumerate(types)
+    ]
+
+
 def reverse_complement(sequence, inplace=False):
     """Return the reverse complement as a DNA sequence.
 
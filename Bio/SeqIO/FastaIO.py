@@ -13,7 +13,15 @@
 You are expected to use this module via the Bio.SeqIO functions.
 """
 
+import bisect
+import os
+import struct
+
+from Bio import bgzf
+from Bio.File import _map_file
+from Bio.File import _MappedFile
 from Bio.Seq import Seq
+from Bio.Seq import SequenceDataAbstractBaseClass
 from Bio.SeqRecord import SeqRecord
 from Bio import BiopythonDeprecationWarning
 
@@ -651,6 +659,390 @@ class FastaTwoLineWriter(FastaWriter):
         return f">{title}\n{data}\n"
 
 
+class _BgzfStream:
+    """Random access to a BGZF file by uncompressed offset (PRIVATE).
+
+    The offsets in a .fai index refer to the uncompressed data. Objects of
+    this class translate these into BGZF virtual offsets using the start of
+    each BGZF block, taken from the samtools .gzi index file if it exists,
+    or otherwise by scanning the block headers of the compressed file.
+    """
+
+    def __init__(self, filename):
+        """Open the BGZF file and load the block offsets."""
+        self.handle = bgzf.BgzfReader(filename, "rb")
+        try:
+            with open(filename + ".gzi", "rb") as stream:
+                data = stream.read()
+        except FileNotFoundError:
+            with open(filename, "rb") as stream:
+                blocks = [
+                    (raw_start, data_start)
+                    for raw_start, raw_length, data_start, data_length in bgzf.BgzfBlocks(
+                        stream
+                    )
+                    if data_length > 0
+                ]
+        else:
+            (count,) = struct.unpack_from("<Q", data)
+            if len(data) != 8 + 16 * count:
+                raise ValueError(f"Corrupt BGZF index file {filename}.gzi")
+            values = struct.unpack_from("<%dQ" % (2 * count), data, 8)
+            blocks = [(0, 0)] + list(zip(values[::2], values[1::2]))
+        self.raw_starts = [raw_start for raw_start, data_start in blocks]
+        self.data_starts = [data_start for raw_start, data_start in blocks]
+
+    def seek(self, offset):
+        """Move to the given offset in the uncompressed data."""
+        handle = self.handle
+        if handle is None:
+            raise ValueError("seek of closed file")
+        i = bisect.bisect_right(self.data_starts, offset) - 1
+        handle.seek((self.raw_starts[i] << 16) | (offset - self.data_starts[i]))
+
+    def read(self, size):
+        """Read size bytes of uncompressed data."""
+        return self.handle.read(size)
+
+    def close(self):
+        """Close the BGZF file."""
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+
+class _FastaSequenceData(SequenceDataAbstractBaseClass):
+    """Stores information needed to retrieve sequence data from a FASTA file (PRIVATE).
+
+    Objects of this class store the file position at which the sequence data
+    start, the number of bases and bytes per line as given in the .fai index,
+    and the start and length of the region of the sequence they represent.
+
+    Only two methods are provided: __len__ and __getitem__. The former will
+    return the length of the region, while the latter calculates the file
+    positions of the requested part of the region from the line lengths, and
+    returns the sequence (as a bytes object) read from the file.
+
+    If the file is memory-mapped, slicing with a step of 1 returns a new
+    object for the requested part of the region instead, without reading any
+    data, and the sequence is copied from the mapping when requested.
+    """
+
+    __slots__ = ("stream", "offset", "linebases", "linewidth", "start", "length")
+
+    def __init__(self, stream, offset, linebases, linewidth, start, length):
+        """Initialize the file stream and file position of the sequence data."""
+        self.stream = stream
+        self.offset = offset
+        self.linebases = linebases
+        self.linewidth = linewidth
+        self.start = start
+        self.length = length
+        super().__init__()
+
+    def __getitem__(self, key):
+        """Return the sequence contents (as a bytes object) for the requested region."""
+        length = self.length
+        if isinstance(key, slice):
+            start, end, step = key.indices(length)
+            size = len(range(start, end, step))
+            if size == 0:
+                return b""
+            if step < 0:
+                start, end = start + (size - 1) * step, start + 1
+            stream = self.stream
+            if step == 1 and size < length and isinstance(stream, _MappedFile):
+                return _FastaSequenceData(
+                    stream,
+                    self.offset,
+                    self.linebases,
+                    self.linewidth,
+                    self.start + start,
+                    size,
+                )
+        else:
+            if key < 0:
+                key += length
+            if key < 0 or key >= length:
+                raise IndexError("index out of range")
+            start = key
+            end = key + 1
+            step = 1
+        start += self.start
+        end += self.start
+        linebases = self.linebases
+        linewidth = self.linewidth
+        # file positions of the first letter, and just after the last letter
+        first = self.offset + (start // linebases) * linewidth + start % linebases
+        last = (
+            self.offset + ((end - 1) // linebases) * linewidth + (end - 1) % linebases
+        )
+        stream = self.stream
+        if isinstance(stream, _MappedFile):
+            try:
+                data = stream[first : last + 1]
+            except ValueError:  # mmap closed or invalid
+                raise ValueError("cannot retrieve sequence: file is closed") from None
+        else:
+            try:
+                stream.seek(first)
+            except ValueError as exception:
+                if str(exception) == "seek of closed file":
+                    raise ValueError(
+                        "cannot retrieve sequence: file is closed"
+                    ) from None
+                raise
+            data = stream.read(last + 1 - first)
+        if linewidth > linebases:
+            data = data.translate(None, b"\r\n")
+        if len(data) != end - start:
+            raise ValueError("sequence data do not match the .fai index")
+        if isinstance(key, slice):
+            if step < 0:
+                return data[::-1][::-step]
+            return data[::step]
+        else:  # single letter
+            return data[0]
+
+    def __len__(self):
+        """Get the length of the region."""
+        return self.length
+
+
+def _is_bgzf(filename):
+    """Check if the file starts with a BGZF block header (PRIVATE)."""
+    with open(filename, "rb") as stream:
+        header = stream.read(4)
+    return header == bgzf._bgzf_magic
+
+
+def write_faidx(filename):
+    """Create the samtools-compatible .fai index of a FASTA file.
+
+    Arguments:
+     - filename - name of the FASTA file, optionally BGZF compressed.
+
+    The index is written to a file with ".fai" appended to the name of the
+    FASTA file, with one line per sequence giving its name (the first word
+    of the title line), its length, the file offset of its first letter, and
+    the number of letters and bytes in each line. For a BGZF compressed file,
+    the offsets refer to the uncompressed data, and the BGZF block offsets
+    are also written to a samtools-compatible ".gzi" file. As for samtools,
+    all lines of a sequence except the last must have the same length; a
+    ValueError is raised otherwise.
+
+    Returns the number of sequences in the index.
+    """
+    compressed = _is_bgzf(filename)
+    if compressed:
+        stream = bgzf.BgzfReader(filename, "rb")
+    else:
+        stream = open(filename, "rb")
+    entries = []
+    names = set()
+    name = None
+    length = offset = linebases = linewidth = 0
+    position = 0
+    with stream:
+        for line in stream:
+            position += len(line)
+            if line.startswith(b">"):
+                if name is not None:
+                    entries.append((name, length, offset, linebases, linewidth))
+                words = line[1:].split(None, 1)
+                if not words:
+                    raise ValueError("FASTA title line without a sequence name")
+                name = words[0].decode()
+                if name in names:
+                    raise ValueError(f"Duplicate key '{name}'")
+                names.add(name)
+                offset = position
+                length = 0
+                linebases = 0
+                linewidth = 0
+                short = False
+                continue
+            if name is None:
+                if line.strip():
+                    raise ValueError("Expected FASTA title line starting with '>'")
+                continue
+            bases = len(line.rstrip(b"\r\n"))
+            if bases == 0:
+                short = True
+                continue
+            if short:
+                raise ValueError(
+                    f"Different line length in sequence '{name}'; "
+                    "all lines but the last must have the same length"
+                )
+            ending = len(line) - bases
+            if linebases == 0:
+                linebases = bases
+                linewidth = len(line)
+            elif bases != linebases or len(line) != linewidth:
+                # allowed only for the last line, which may also lack a newline
+                if bases > linebases or (ending and ending != linewidth - linebases):
+                    raise ValueError(
+                        f"Different line length in sequence '{name}'; "
+                        "all lines but the last must have the same length"
+                    )
+                short = True
+            length += bases
+    if name is not None:
+        entries.append((name, length, offset, linebases, linewidth))
+    with open(filename + ".fai", "w") as stream:
+        for entry in entries:
+            stream.write("%s\t%d\t%d\t%d\t%d\n" % entry)
+    if compressed:
+        with open(filename, "rb") as stream:
+            blocks = [
+                (raw_start, data_start)
+                for raw_start, raw_length, data_start, data_length in bgzf.BgzfBlocks(
+                    stream
+                )
+                if data_length > 0 and raw_start > 0
+            ]
+        with open(filename + ".gzi", "wb") as stream:
+            stream.write(struct.pack("<Q", len(blocks)))
+            for block in blocks:
+                stream.write(struct.pack("<QQ", *block))
+    return len(entries)
+
+
+class FaidxReader:
+    """Random access to the sequences in a FASTA file using a .fai index.
+
+    The index file (the name of the FASTA file with ".fai" appended) is in
+    the format used by ``samtools faidx``; if it does not exist, it is
+    created by calling ``write_faidx``. The FASTA file may be compressed
+    with BGZF (for example by ``bgzip``), but not with plain gzip.
+
+    The reader acts as a read-only dictionary of the sequence names to
+    SeqRecord objects. The sequence of each record is loaded lazily: only
+    the parts of the sequence that are requested are read from the file,
+    using the line lengths stored in the index to calculate their position
+    in the file. Use the ``fetch`` method to get the sequence of a region
+    directly.
+
+    With ``mmap=True``, the (uncompressed) FASTA file is memory-mapped
+    instead. Slicing a sequence then only records the region, and the
+    sequence contents are copied from the mapping when they are requested,
+    without any file reads. The mapping is shared by all readers of the same
+    file in a process, and sequences are pickled by their position in the
+    file, so that worker processes share the same pages of the file in
+    memory.
+
+    >>> from Bio.SeqIO.FastaIO import FaidxReader
+    >>> with FaidxReader("Fasta/f002") as fasta:
+    ...     print(len(fasta))
+    ...     record = fasta["gi|1348917|gb|G26685|G26685"]
+    ...     print(record.id, len(record))
+    ...     print(record.seq[:10])
+    ...     print(fasta.fetch("gi|1348917|gb|G26685|G26685", 95, 105))
+    ...
+    3
+    gi|1348917|gb|G26685|G26685 413
+    CGGAGCCAGC
+    AATAGTTGTA
+
+    """
+
+    def __init__(self, filename, mmap=False):
+        """Open the FASTA file and load its .fai index.
+
+        Arguments:
+         - filename - name of the FASTA file, optionally BGZF compressed.
+         - mmap - if True, memory-map the FASTA file instead of reading from
+           it; this is not possible for BGZF compressed files. Default False.
+
+        """
+        if not os.path.exists(filename + ".fai"):
+            write_faidx(filename)
+        index = {}
+        with open(filename + ".fai") as stream:
+            for line in stream:
+                words = line.rstrip("\r\n").split("\t")
+                if len(words) < 5:
+                    raise ValueError(f"Corrupt .fai index line: {line!r}")
+                name = words[0]
+                length, offset, linebases, linewidth = map(int, words[1:5])
+                index[name] = (length, offset, linebases, linewidth)
+        self._index = index
+        if _is_bgzf(filename):
+            if mmap:
+                raise ValueError("BGZF compressed files cannot be memory-mapped")
+            self._stream = _BgzfStream(filename)
+        elif mmap:
+            self._stream = _map_file(filename)
+        else:
+            self._stream = open(filename, "rb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def close(self):
+        """Close the FASTA file.
+
+        Sequences loaded from the file can no longer be retrieved after the
+        file is closed, unless they were already read. A memory-mapped file
+        is shared with other readers and with the sequences, and is unmapped
+        only when it is no longer in use.
+        """
+        if not isinstance(self._stream, _MappedFile):
+            self._stream.close()
+
+    def __len__(self):
+        """Return the number of sequences in the index."""
+        return len(self._index)
+
+    def __contains__(self, name):
+        """Check if a sequence with this name is in the index."""
+        return name in self._index
+
+    def __iter__(self):
+        """Iterate over the sequence names."""
+        return iter(self._index)
+
+    def keys(self):
+        """Return a view of the sequence names, in the order of the index file."""
+        return self._index.keys()
+
+    def lengths(self):
+        """Return a dictionary of the sequence names to their lengths."""
+        return {name: values[0] for name, values in self._index.items()}
+
+    def __getitem__(self, name):
+        """Return the sequence with the given name as a SeqRecord."""
+        seq = self.fetch(name)
+        return SeqRecord(seq, id=name, name=name, description="")
+
+    def fetch(self, name, start=None, end=None):
+        """Return the sequence of a region as a lazily loaded Seq object.
+
+        Arguments:
+         - name - name of the sequence, as in the index.
+         - start, end - start and end of the region, with zero-based
+           coordinates as in Python slices (not the one-based inclusive
+           coordinates used by ``samtools faidx``). By default, the full
+           sequence is returned.
+
+        """
+        try:
+            length, offset, linebases, linewidth = self._index[name]
+        except KeyError:
+            raise KeyError(f"sequence '{name}' not found in index") from None
+        start, end, step = slice(start, end).indices(length)
+        if end < start:
+            end = start
+        data = _FastaSequenceData(
+            self._stream, offset, linebases, linewidth, start, end - start
+        )
+        return Seq(data)
+
+
 def as_fasta(record):
     """Turn a SeqRecord into a FASTA formatted string."""
     warnings.warn(
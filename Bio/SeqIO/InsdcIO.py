@@ -64,13 +64,20 @@ class GenBankIterator(SequenceIterator):
 
     modes = "t"
 
-    def __init__(self, source):
+    def __init__(self, source, lazy_features=False, feature_types=None):
         """Break up a Genbank file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
+        Optional arguments:
+         - lazy_features - if True, the features are parsed only when they
+           are first accessed, which is faster if you only need the sequence
+           or a few of the features.
+         - feature_types - optional collection of feature types (e.g. "CDS");
+           features of any other type are skipped while reading the file.
+
         Note that for genomes or chromosomes, there is typically only
         one record.
 
@@ -100,9 +107,21 @@ class GenBankIterator(SequenceIterator):
         L31939.1
         AF297471.1
 
+        To only look at the CDS features of a record, you can skip the other
+        features, and parse each CDS feature only when you get to it:
+
+        >>> record = SeqIO.read("GenBank/NC_005816.gb", "genbank",
+        ...                     lazy_features=True, feature_types={"CDS"})
+        >>> len(record.features)
+        10
+        >>> print(record.features[0].qualifiers["locus_tag"][0])
+        YP_pPCP01
+
         """
         super().__init__(source, fmt="GenBank")
-        self.records = GenBankScanner(debug=0).parse_records(self.stream)
+        self.records = GenBankScanner(debug=0).parse_records(
+            self.stream, feature_types=feature_types, lazy=lazy_features
+        )
 
     def __next__(self):
         """Return the next SeqRecord."""
@@ -114,13 +133,16 @@ class EmblIterator(SequenceIterator):
 
     modes = "t"
 
-    def __init__(self, source):
+    def __init__(self, source, lazy_features=False, feature_types=None):
         """Break up an EMBL file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
+        The optional arguments lazy_features and feature_types are as for
+        the GenBankIterator.
+
         Note that for genomes or chromosomes, there is typically only
         one record.
 
@@ -158,7 +180,9 @@ class EmblIterator(SequenceIterator):
 
         """
         super().__init__(source, fmt="EMBL")
-        self.records = EmblScanner(debug=0).parse_records(self.stream)
+        self.records = EmblScanner(debug=0).parse_records(
+            self.stream, feature_types=feature_types, lazy=lazy_features
+        )
 
     def __next__(self):
         """Return the next SeqRecord."""
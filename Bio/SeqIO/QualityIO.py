@@ -374,6 +374,8 @@ from collections.abc import Iterable
 import array
 from dataclasses import dataclass
 
+import numpy as np
+
 from Bio import BiopythonParserWarning
 from Bio import BiopythonWarning
 from Bio import BiopythonDeprecationWarning
@@ -382,6 +384,7 @@ from Bio.File import as_handle
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 
+from .Interfaces import _BytesIOSource
 from .Interfaces import _clean
 from .Interfaces import _get_seq_string
 from .Interfaces import _TextIOSource
@@ -571,6 +574,19 @@ _solexa_to_sanger_quality_str = {
 }
 
 
+def _get_quality_str_from_array(qualities, offset: int, maximum: int, message: str):
+    """Encode an array of PHRED qualities stored as unsigned bytes (PRIVATE).
+
+    >>> qualities = np.array([50, 40, 30, 20, 10, 0], np.uint8)
+    >>> _get_quality_str_from_array(qualities, 33, 93, "Data loss")
+    'SI?5+!'
+    """
+    if len(qualities) and qualities.max() > maximum:
+        warnings.warn(message, BiopythonWarning)
+        qualities = np.minimum(qualities, maximum)
+    return (qualities + offset).tobytes().decode("ascii")
+
+
 def _get_sanger_quality_str(record: SeqRecord) -> str:
     """Return a Sanger FASTQ encoded quality string (PRIVATE).
 
@@ -640,6 +656,14 @@ def _get_sanger_quality_str(record: SeqRecord) -> str:
         # Fall back on solexa scores...
         pass
     else:
+        if isinstance(qualities, np.ndarray) and qualities.dtype == np.uint8:
+            # e.g. from FastqPhredArrayIterator
+            return _get_quality_str_from_array(
+                qualities,
+                SANGER_SCORE_OFFSET,
+                93,
+                "Data loss - max PHRED quality 93 in Sanger FASTQ",
+            )
         # Try and use the precomputed mapping:
         try:
             return "".join(_phred_to_sanger_quality_str[qp] for qp in qualities)
@@ -715,6 +739,14 @@ def _get_illumina_quality_str(record: SeqRecord) -> str:
         # Fall back on solexa scores...
         pass
     else:
+        if isinstance(qualities, np.ndarray) and qualities.dtype == np.uint8:
+            # e.g. from FastqIlluminaArrayIterator
+            return _get_quality_str_from_array(
+                qualities,
+                SOLEXA_SCORE_OFFSET,
+                62,
+                "Data loss - max PHRED quality 62 in Illumina FASTQ",
+            )
         # Try and use the precomputed mapping:
         try:
             return "".join(_phred_to_illumina_quality_str[qp] for qp in qualities)
@@ -1456,6 +1488,243 @@ class FastqIlluminaIterator(FastqIteratorAbstractBaseClass):
         super().__init__(source)
 
 
+class FastqPhredArrayIterator(SequenceIterator[bytes]):
+    """Parser for FASTQ files storing the qualities as NumPy arrays.
+
+    This parser reads the file in large binary chunks, and stores the PHRED
+    qualities of each record as a NumPy array of unsigned bytes (np.uint8)
+    instead of as a list of integers.
+    """
+
+    modes = "b"
+
+    q_mapping = FastqPhredIterator.q_mapping
+
+    q_key = "phred_quality"
+
+    # bytes allowed in the sequence (printable ASCII, excluding the space)
+    _seq_letters = bytes(range(33, 127))
+
+    def __init__(self, source: _BytesIOSource, chunk_size: int = 1048576):
+        """Iterate over FASTQ records as SeqRecord objects.
+
+        Arguments:
+         - source - input stream opened in binary mode, or a path to a file
+         - chunk_size - number of bytes to read from the file at a time
+
+        This parser accepts the same files as FastqPhredIterator, and returns
+        the same records, except that the PHRED qualities are stored as a
+        NumPy array of unsigned bytes. The file is read in large chunks, and
+        the quality letters in each chunk are converted to quality values in
+        one go; the array of each record is a view on the values of the chunk.
+        This is considerably faster and uses much less memory than storing a
+        list of integers for each record. The FASTQ writers use the array
+        directly.
+
+        >>> with open("Quality/example.fastq", "rb") as handle:
+        ...     for record in FastqPhredArrayIterator(handle):
+        ...         print("%s %s" % (record.id, record.seq))
+        EAS54_6_R1_2_1_413_324 CCCTTCTTGTCTTCAGCGTTTCTCC
+        EAS54_6_R1_2_1_540_792 TTGGCAGGCCAAGGCCGATGGATCA
+        EAS54_6_R1_2_1_443_348 GTTGCTTCTGGCGTGGGTGGGGGGG
+        >>> qualities = record.letter_annotations["phred_quality"]
+        >>> qualities.dtype
+        dtype('uint8')
+        >>> print(qualities.tolist())
+        [26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 24, 26, 22, 26, 26, 13, 22, 26, 18, 24, 18, 18, 18, 18]
+        >>> print(record.format("fastq"))
+        @EAS54_6_R1_2_1_443_348
+        GTTGCTTCTGGCGTGGGTGGGGGGG
+        +
+        ;;;;;;;;;;;9;7;;.7;393333
+        <BLANKLINE>
+
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        super().__init__(source, fmt="Fastq")
+        self.chunk_size = chunk_size
+        self._data = b""
+        self._pos = 0
+        self._eof = False
+        # quality values of the data in the buffer, as bytes and as an array
+        self._scores = None
+        self._qualities = None
+        # start of the line last returned by _readline
+        self._line_start = 0
+
+    def _fill(self):
+        """Append the next chunk of the file to the buffer (PRIVATE).
+
+        Returns False if the end of the file was reached.
+        """
+        if self._eof:
+            return False
+        data = self._data[self._pos :]
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            if not data or data.endswith(b"\n"):
+                return False
+            # add the missing line ending of the last line
+            chunk = b"\n"
+        self._data = data + chunk
+        self._pos = 0
+        self._scores = None
+        self._qualities = None
+        return True
+
+    def _readline(self):
+        """Return the next line without its line ending, or None at EOF (PRIVATE)."""
+        end = self._data.find(b"\n", self._pos)
+        while end < 0:
+            if not self._fill():
+                return None
+            end = self._data.find(b"\n", self._pos)
+        self._line_start = self._pos
+        line = self._data[self._pos : end].rstrip()
+        self._pos = end + 1
+        return line
+
+    def _find_record(self):
+        """Find the line endings of the next four lines in the buffer (PRIVATE).
+
+        The buffer is extended until it also contains the first letter of the
+        line after these four lines, if any. Returns None if the file ends
+        before the fourth line.
+        """
+        while True:
+            data = self._data
+            i = data.find(b"\n", self._pos)
+            j = data.find(b"\n", i + 1) if i >= 0 else -1
+            k = data.find(b"\n", j + 1) if j >= 0 else -1
+            m = data.find(b"\n", k + 1) if k >= 0 else -1
+            if m >= 0 and (m + 1 < len(data) or self._eof):
+                return i, j, k, m
+            if not self._fill() and m < 0:
+                return None
+
+    def __next__(self) -> SeqRecord:
+        """Parse the file and generate SeqRecord objects."""
+        ends = self._find_record()
+        if ends is not None:
+            # Most FASTQ files use four lines per record, with the
+            # sequence and the quality each on a single line. Records
+            # that don't fit this layout are parsed line by line below.
+            data = self._data
+            pos = self._pos
+            i, j, k, m = ends
+            if (
+                data[pos] == 64  # "@"
+                and data[i + 1] != 43  # "+"
+                and data[j + 1] == 43
+                and data[m + 1 : m + 2] in (b"@", b"")
+            ):
+                title_line = data[pos + 1 : i].rstrip()
+                seq_bytes = data[i + 1 : j].rstrip()
+                second_title = data[j + 2 : k].rstrip()
+                quality = data[k + 1 : m].rstrip()
+                seq_len = len(seq_bytes)
+                if (
+                    len(quality) == seq_len
+                    and (not second_title or second_title == title_line)
+                    and not seq_bytes.translate(None, self._seq_letters)
+                    and quality.isascii()
+                ):
+                    if self._scores is None:
+                        self._scores = bytearray(data).translate(self.q_mapping)
+                        self._qualities = np.frombuffer(self._scores, np.uint8)
+                    start = k + 1
+                    end = start + seq_len
+                    if self._scores.find(INVALID_CHAR_CODE, start, end) < 0:
+                        self._pos = m + 1
+                        return self._create_record(
+                            title_line, seq_bytes, self._qualities[start:end]
+                        )
+        line = self._readline()
+        if line is None:
+            raise StopIteration
+        if not line.startswith(b"@"):
+            raise ValueError("Records in Fastq files should start with '@' character")
+        title_line = line[1:]
+        # There will now be one or more sequence lines; keep going until we
+        # find the "+" marking the quality line:
+        seq_bytes = b""
+        while True:
+            line = self._readline()
+            if line is None:
+                if seq_bytes:
+                    raise ValueError("End of file without quality information.")
+                else:
+                    raise ValueError("Unexpected end of file")
+            if line.startswith(b"+"):
+                break
+            seq_bytes += line
+        seq_len = len(seq_bytes)
+        # The title here is optional, but if present must match!
+        second_title = line[1:]
+        if second_title and second_title != title_line:
+            raise ValueError("Sequence and quality captions differ.")
+        if seq_bytes.translate(None, self._seq_letters):
+            raise ValueError("Whitespace is not allowed in the sequence.")
+        # There will now be at least one line of quality data, followed by
+        # another sequence, or EOF
+        line = self._readline()
+        if line is None:
+            raise ValueError("Unexpected end of file")
+        quality = b""
+        while line is not None:
+            if line.startswith(b"@") and len(quality) >= seq_len:
+                # Start of the next record, not a line of quality data
+                # starting with "@". Go back to the start of this line, so
+                # that the next record can be parsed in one go again.
+                self._pos = self._line_start
+                break
+            quality += line
+            line = self._readline()
+        if not quality.isascii():
+            quality_string = quality.decode("latin-1")
+            index = _find_index_where(quality_string, lambda c: not c.isascii())
+            raise InvalidCharError(quality_string, index, "is not an ASCII character")
+        if len(quality) != seq_len:
+            raise ValueError(
+                "Lengths of sequence and quality values differs for %s (%i and %i)."
+                % (title_line.decode(), seq_len, len(quality))
+            )
+        scores = bytearray(quality).translate(self.q_mapping)
+        if INVALID_CHAR in scores:
+            details = "not in correct range (are you sure you're using the right QualityIO parser?)"
+            raise InvalidCharError(
+                quality.decode(), scores.find(INVALID_CHAR_CODE), details
+            )
+        return self._create_record(
+            title_line, seq_bytes, np.frombuffer(scores, np.uint8)
+        )
+
+    def _create_record(self, title_line, seq_bytes, qualities):
+        """Return a SeqRecord for the parsed data (PRIVATE)."""
+        descr = title_line.decode()
+        id = descr.split(None, 1)[0] if descr else ""
+        # SeqRecord._from_validated avoids length/type checking
+        return SeqRecord._from_validated(
+            Seq(seq_bytes),
+            id=id,
+            name=id,
+            description=descr,
+            letter_annotations={self.q_key: qualities},
+        )
+
+
+class FastqIlluminaArrayIterator(FastqPhredArrayIterator):
+    """Parser for Illumina 1.3 to 1.7 FASTQ files storing the qualities as arrays.
+
+    This is the counterpart of FastqIlluminaIterator; the PHRED qualities are
+    stored as a NumPy array of unsigned bytes.
+    """
+
+    q_mapping = FastqIlluminaIterator.q_mapping
+
+
 class QualPhredIterator(SequenceIterator):
     """Parser for QUAL files with PHRED quality scores but no sequence."""
 
@@ -19,6 +19,26 @@ specifically requested, making the parser memory-efficient.
 
 The TwoBitIterator object implements the __getitem__, keys, and __len__
 methods that allow it to be used as a dictionary.
+
+Alternatively, the packed sequence data can be loaded into memory as they are
+stored in the file, as PackedSequenceData objects. These keep two bits per
+nucleotide, together with the blocks of N's and of masked (lowercase)
+nucleotides, and provide slicing, complement, reverse complement, and counting
+of nucleotides without unpacking the sequence. The file can also be
+memory-mapped, in which case the PackedSequenceData objects are views of the
+packed data in the mapped file, and their sequence contents are unpacked only
+when requested. PackedSequenceData objects can also be created directly from
+a nucleotide sequence:
+
+>>> from Bio.Seq import Seq
+>>> from Bio.SeqIO.TwoBitIO import PackedSequenceData
+>>> seq = Seq(PackedSequenceData("ACGTNNacgtAAAA"))
+>>> seq[2:12]
+Seq('GTNNacgtAA')
+>>> seq.reverse_complement()
+Seq('TTTTacgtNNACGT')
+>>> seq.count("A"), seq.count("a"), seq.count("N")
+(5, 1, 2)
 """
 
 # The .2bit file format is defined by UCSC as follows
@@ -82,6 +102,9 @@ except ImportError:
         "See http://www.numpy.org/"
     ) from None
 
+from Bio.File import _map_file
+from Bio.File import _MappedFile
+from Bio.Seq import _dna_complement_table
 from Bio.Seq import Seq
 from Bio.Seq import SequenceDataAbstractBaseClass
 from Bio.SeqRecord import SeqRecord
@@ -167,15 +190,400 @@ class _TwoBitSequenceData(SequenceDataAbstractBaseClass):
         return data
 
 
+# The 2-bit code of each letter that can be stored in packed form; the
+# nucleotides in a block of N's are stored as T, as in twoBit files.
+_letter_codes = np.full(256, 255, np.uint8)
+for _code, _letters in enumerate((b"Tt", b"Cc", b"Aa", b"Gg")):
+    _letter_codes[list(_letters)] = _code
+_letter_codes[list(b"Nn")] = 0
+del _code, _letters
+
+# The four 2-bit codes in each byte value, starting with the most significant
+_byte_codes = (np.arange(256)[:, None] >> np.array([6, 4, 2, 0])) & 3
+# The byte value with the same codes in reverse order
+_reversed_bytes = (_byte_codes[:, ::-1] << np.array([6, 4, 2, 0])).sum(1)
+_reversed_bytes = _reversed_bytes.astype(np.uint8)
+# Number of occurrences of each code in the first 0, 1, 2, 3, 4 nucleotides
+# of each byte value, indexed as [code, byte, number of nucleotides]
+_code_counts = np.zeros((4, 256, 5), np.int64)
+for _code in range(4):
+    np.cumsum(_byte_codes == _code, axis=1, out=_code_counts[_code, :, 1:])
+del _code
+
+
+def _find_blocks(mask):
+    """Return the start and end of each run of True values in mask (PRIVATE)."""
+    edges = np.diff(mask.view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return np.column_stack((starts, ends)).astype(np.uint32)
+
+
+def _find_overlapping_blocks(blocks, start, end):
+    """Return the blocks overlapping the region from start to end (PRIVATE).
+
+    As the blocks are sorted, a view of the blocks array is returned.
+    """
+    i = np.searchsorted(blocks[:, 1], start, "right")
+    j = np.searchsorted(blocks[:, 0], end, "left")
+    return blocks[i:j]
+
+
+def _clip_blocks(blocks, start, end):
+    """Return the blocks overlapping start to end, clipped to that region (PRIVATE)."""
+    blocks = _find_overlapping_blocks(blocks, start, end).astype(np.int64)
+    np.clip(blocks, start, end, out=blocks)
+    return blocks
+
+
+def _intersect_blocks(blocks1, blocks2):
+    """Return the regions covered by both blocks1 and blocks2 (PRIVATE)."""
+    starts1, ends1 = blocks1.T
+    starts2, ends2 = blocks2.T
+    # blocks2[i[k]:j[k]] overlap with blocks1[k]
+    i = np.searchsorted(ends2, starts1, "right")
+    j = np.searchsorted(starts2, ends1, "left")
+    counts = np.maximum(j - i, 0)
+    indices1 = np.repeat(np.arange(len(blocks1)), counts)
+    indices2 = np.arange(counts.sum()) + np.repeat(
+        i - np.cumsum(counts) + counts, counts
+    )
+    starts = np.maximum(starts1[indices1], starts2[indices2])
+    ends = np.minimum(ends1[indices1], ends2[indices2])
+    return np.column_stack((starts, ends))
+
+
+def _find_mapping(array):
+    """Return the memory-mapped file the array is a view of, or None (PRIVATE)."""
+    base = array.base
+    while isinstance(base, np.ndarray):
+        base = base.base
+    if isinstance(base, memoryview):
+        base = base.obj
+    if isinstance(base, _MappedFile):
+        return base
+    return None
+
+
+def _restore_packed_sequence_data(packed, start, length, nBlocks, maskBlocks):
+    """Recreate a pickled PackedSequenceData object (PRIVATE).
+
+    Memory-mapped packed data are given as a tuple of the mapping, and the
+    offset and size of the packed data in the mapped file.
+    """
+    if isinstance(packed, tuple):
+        mapping, offset, size = packed
+        packed = np.frombuffer(mapping, np.uint8, size, offset)
+    return PackedSequenceData._from_packed(packed, start, length, nBlocks, maskBlocks)
+
+
+class PackedSequenceData(SequenceDataAbstractBaseClass):
+    """Stores a nucleotide sequence packed to two bits per nucleotide.
+
+    The nucleotides are packed as in the twoBit file format, with T, C, A, G
+    represented as 00, 01, 10, 11, and four nucleotides per byte. Blocks of
+    unknown nucleotides (N) and of masked (lowercase) nucleotides are stored
+    separately as arrays with the start and end position of each block. Only
+    the letters A, C, G, T, and N, in upper or lower case, can be stored.
+
+    The packed data are stored as a NumPy uint8 array in the ``packed``
+    attribute, and ``start`` is the position of the first nucleotide of the
+    sequence in the packed array. The ``nBlocks`` and ``maskBlocks`` attributes
+    are uint32 arrays with two columns, giving the start and end of the blocks
+    of N's and of masked nucleotides, sorted by position, in the same
+    coordinates as ``start``; blocks may extend beyond the sequence.
+
+    Slicing with a step of 1 or -1 returns a new PackedSequenceData object
+    sharing or reversing the packed data, while other slices, and the full
+    sequence, are returned as a bytes object. The complement (as calculated by
+    the complement and reverse_complement methods of a Seq object), and counts
+    of a single letter, are calculated directly from the packed data.
+    """
+
+    __slots__ = ("packed", "start", "length", "nBlocks", "maskBlocks")
+
+    def __init__(self, data):
+        """Pack the nucleotide sequence data, stored as a bytes or str object."""
+        if isinstance(data, str):
+            data = data.encode("ASCII", "replace")
+        letters = np.frombuffer(data, np.uint8)
+        codes = _letter_codes[letters]
+        invalid = codes == 255
+        if invalid.any():
+            letter = chr(letters[invalid][0])
+            raise ValueError(f"letter '{letter}' cannot be stored in packed form")
+        length = len(codes)
+        if length >= 2**32:
+            raise ValueError("sequence is too long to be stored in packed form")
+        padded = np.zeros((length + 3) // 4 * 4, np.uint8)
+        padded[:length] = codes
+        padded = padded.reshape(-1, 4)
+        packed = padded[:, 0] << 6
+        packed |= padded[:, 1] << 4
+        packed |= padded[:, 2] << 2
+        packed |= padded[:, 3]
+        self.packed = packed
+        self.start = 0
+        self.length = length
+        self.nBlocks = _find_blocks((letters | 0x20) == ord("n"))
+        self.maskBlocks = _find_blocks(letters >= ord("a"))
+        super().__init__()
+
+    @classmethod
+    def _from_packed(cls, packed, start, length, nBlocks, maskBlocks):
+        """Create a new object from the packed data and blocks (PRIVATE)."""
+        data = cls.__new__(cls)
+        data.packed = packed
+        data.start = start
+        data.length = length
+        data.nBlocks = nBlocks
+        data.maskBlocks = maskBlocks
+        return data
+
+    def __reduce__(self):
+        # Packed data in a memory-mapped file are pickled by their position in
+        # the file, so that they are mapped again instead of being copied.
+        packed = self.packed
+        mapping = _find_mapping(packed)
+        if mapping is not None:
+            offset = packed.ctypes.data - np.frombuffer(mapping, np.uint8).ctypes.data
+            packed = (mapping, offset, len(packed))
+        return (
+            _restore_packed_sequence_data,
+            (packed, self.start, self.length, self.nBlocks, self.maskBlocks),
+        )
+
+    def __len__(self):
+        """Return the sequence length."""
+        return self.length
+
+    def __getitem__(self, key):
+        """Return the sequence contents for the requested region.
+
+        A slice with a step of 1 or -1 returns a new PackedSequenceData object,
+        unless the full sequence is requested; any other slice returns a bytes
+        object.
+        """
+        length = self.length
+        if not isinstance(key, slice):
+            if key < 0:
+                key += length
+            if not 0 <= key < length:
+                raise IndexError("sequence index out of range")
+            return self._unpack(key, key + 1)[0]
+        start, end, step = key.indices(length)
+        if len(range(start, end, step)) == 0:
+            return b""
+        if step == 1:
+            if start == 0 and end == length:
+                return self._unpack(0, length)
+            return self._slice(start, end)
+        if step > 0:
+            return self._unpack(start, end)[::step]
+        # the region from end + 1 to start + 1, in reverse order
+        if step == -1:
+            return self._slice(end + 1, start + 1)._reverse()
+        return self._unpack(end + 1, start + 1)[::step]
+
+    def _unpack(self, start, end):
+        """Return the sequence from start to end as a bytes object (PRIVATE)."""
+        start += self.start
+        end += self.start
+        return _twoBitIO.convert(
+            self.packed[start // 4 : (end + 3) // 4],
+            start,
+            end,
+            1,
+            _find_overlapping_blocks(self.nBlocks, start, end),
+            _find_overlapping_blocks(self.maskBlocks, start, end),
+        )
+
+    def _slice(self, start, end):
+        """Return the sequence from start to end as a new object (PRIVATE).
+
+        The returned object shares the packed data and the blocks with this
+        object, keeping only the blocks overlapping with the region.
+        """
+        if start == 0 and end == self.length:
+            return self
+        start += self.start
+        end += self.start
+        return self._from_packed(
+            self.packed,
+            start,
+            end - start,
+            _find_overlapping_blocks(self.nBlocks, start, end),
+            _find_overlapping_blocks(self.maskBlocks, start, end),
+        )
+
+    def _reverse(self):
+        """Return the reversed sequence as a new object (PRIVATE)."""
+        start = self.start
+        end = start + self.length
+        offset = start // 4 * 4
+        packed = _reversed_bytes[self.packed[start // 4 : (end + 3) // 4][::-1]]
+        size = 4 * len(packed)
+        # position i (counting from offset) is moved to position size - 1 - i
+        nBlocks = size + offset - _clip_blocks(self.nBlocks, start, end)[::-1, ::-1]
+        maskBlocks = size + offset - _clip_blocks(self.maskBlocks, start, end)
+        maskBlocks = maskBlocks[::-1, ::-1]
+        return self._from_packed(
+            packed,
+            size + offset - end,
+            self.length,
+            nBlocks.astype(np.uint32),
+            maskBlocks.astype(np.uint32),
+        )
+
+    def _complement(self):
+        """Return the complementary sequence as a new object (PRIVATE)."""
+        start = self.start
+        end = start + self.length
+        offset = start // 4 * 4
+        # XOR with 10 maps T (00) to A (10), and C (01) to G (11)
+        packed = self.packed[start // 4 : (end + 3) // 4] ^ 0b10101010
+        nBlocks = _clip_blocks(self.nBlocks, start, end) - offset
+        maskBlocks = _clip_blocks(self.maskBlocks, start, end) - offset
+        return self._from_packed(
+            packed,
+            start - offset,
+            self.length,
+            nBlocks.astype(np.uint32),
+            maskBlocks.astype(np.uint32),
+        )
+
+    def _count_code(self, code, blocks):
+        """Count the occurrences of a 2-bit code in the blocks (PRIVATE).
+
+        The packed data are processed in chunks, and the number of occurrences
+        in each block is found from the cumulative number of occurrences in
+        the chunk.
+        """
+        if len(blocks) == 0:
+            return 0
+        counts = _code_counts[code]
+        starts, ends = blocks.T
+        chunk_size = 4 * 1048576  # number of nucleotides in a chunk
+        total = 0
+        for chunk_start in range(
+            starts[0] // chunk_size * chunk_size, ends[-1], chunk_size
+        ):
+            chunk_end = chunk_start + chunk_size
+            i = np.searchsorted(ends, chunk_start, "right")
+            j = np.searchsorted(starts, chunk_end, "left")
+            if i == j:
+                continue
+            data = self.packed[chunk_start // 4 : chunk_end // 4]
+            cumulative = np.zeros(len(data) + 1, np.int64)
+            np.cumsum(counts[data, 4], out=cumulative[1:])
+            last = len(data) - 1
+            for positions, sign in ((ends[i:j], 1), (starts[i:j], -1)):
+                positions = np.clip(positions, chunk_start, chunk_end) - chunk_start
+                quotients, remainders = np.divmod(positions, 4)
+                partial = counts[data[np.minimum(quotients, last)], remainders]
+                total += sign * (cumulative[quotients].sum() + partial.sum())
+        return int(total)
+
+    def count(self, sub, start=None, end=None):
+        """Return the number of non-overlapping occurrences of sub in data[start:end].
+
+        Optional arguments start and end are interpreted as in slice notation.
+        This method behaves as the count method of Python strings. Occurrences
+        of a single letter are counted directly from the packed data.
+        """
+        if len(sub) != 1:
+            if len(sub) == 0:
+                return super().count(sub, start, end)
+            start, end, step = slice(start, end).indices(self.length)
+            if start >= end:
+                return 0
+            return self._unpack(start, end).count(sub)
+        start, end, step = slice(start, end).indices(self.length)
+        letter = sub[0]
+        if isinstance(letter, str):
+            letter = ord(letter)
+        code = _letter_codes[letter]
+        if code == 255 or start >= end:
+            return 0
+        start += self.start
+        end += self.start
+        nBlocks = _clip_blocks(self.nBlocks, start, end)
+        maskBlocks = _clip_blocks(self.maskBlocks, start, end)
+        # N's in a masked block are shown as n
+        maskedNBlocks = _intersect_blocks(nBlocks, maskBlocks)
+        if letter in b"Nn":
+            masked = int(np.diff(maskedNBlocks).sum())
+            if letter == ord("n"):
+                return masked
+            return int(np.diff(nBlocks).sum()) - masked
+        masked = self._count_code(code, maskBlocks)
+        masked -= self._count_code(code, maskedNBlocks)
+        if letter >= ord("a"):
+            return masked
+        region = np.array([[start, end]])
+        return self._count_code(code, region) - self._count_code(code, nBlocks) - masked
+
+    def translate(self, table, delete=b""):
+        """Return a copy with each character mapped by the given translation table.
+
+          table
+            Translation table, which must be a bytes object of length 256.
+
+        All characters occurring in the optional argument delete are removed.
+        The remaining characters are mapped through the given translation table.
+        The DNA complement table, as used by the complement and
+        reverse_complement methods of Seq objects, is applied to the packed
+        data directly, returning a new PackedSequenceData object.
+        """
+        if not delete and table == _dna_complement_table:
+            return self._complement()
+        return super().translate(table, delete)
+
+    def upper(self):
+        """Return an upper case copy of the sequence."""
+        maskBlocks = np.empty((0, 2), dtype="uint32")
+        return self._from_packed(
+            self.packed, self.start, self.length, self.nBlocks, maskBlocks
+        )
+
+    def lower(self):
+        """Return a lower case copy of the sequence."""
+        maskBlocks = np.array([[self.start, self.start + self.length]], "uint32")
+        return self._from_packed(
+            self.packed, self.start, self.length, self.nBlocks, maskBlocks
+        )
+
+
 class TwoBitIterator(SequenceIterator):
     """Parser for UCSC twoBit (.2bit) files."""
 
     modes = "b"
 
-    def __init__(self, source):
-        """Read the file index."""
+    def __init__(self, source, packed=False, mmap=False):
+        """Read the file index.
+
+        Arguments:
+         - source - input file stream, or path to input file
+         - packed - if False (default), the sequence data are read from the
+           file when requested, so the file must remain open while the
+           sequences are being accessed. If True, the packed sequence data
+           are loaded into memory as PackedSequenceData objects, without
+           unpacking them.
+         - mmap - if True, the file is memory-mapped, and the sequences are
+           PackedSequenceData objects viewing the packed data in the mapped
+           file; nothing is copied until the sequence contents are requested.
+           Slices share the mapping, and are pickled by their position in
+           the file, so that worker processes share the same pages of the
+           file in memory. The file need not remain open. Default False.
+
+        """
         super().__init__(source, fmt="twoBit")
         stream = self.stream
+        if mmap:
+            try:
+                mapping = _map_file(stream.name)
+            except (AttributeError, TypeError):
+                raise ValueError("memory mapping requires a file on disk") from None
         data = stream.read(4)
         if not data:
             raise ValueError("Empty file.")
@@ -216,26 +624,42 @@ class TwoBitIterator(SequenceIterator):
             stream.seek(offset)
             data = stream.read(4)
             dnaSize = int.from_bytes(data, byteorder, signed=False)
-            sequence = _TwoBitSequenceData(stream, offset, dnaSize)
             data = stream.read(4)
             nBlockCount = int.from_bytes(data, byteorder, signed=False)
             nBlockStarts = np.fromfile(stream, dtype=dtype, count=nBlockCount)
             nBlockSizes = np.fromfile(stream, dtype=dtype, count=nBlockCount)
-            sequence.nBlocks = np.empty((nBlockCount, 2), dtype="uint32")
-            sequence.nBlocks[:, 0] = nBlockStarts
-            sequence.nBlocks[:, 1] = nBlockStarts + nBlockSizes
+            nBlocks = np.empty((nBlockCount, 2), dtype="uint32")
+            nBlocks[:, 0] = nBlockStarts
+            nBlocks[:, 1] = nBlockStarts + nBlockSizes
             data = stream.read(4)
             maskBlockCount = int.from_bytes(data, byteorder, signed=False)
             maskBlockStarts = np.fromfile(stream, dtype=dtype, count=maskBlockCount)
             maskBlockSizes = np.fromfile(stream, dtype=dtype, count=maskBlockCount)
-            sequence.maskBlocks = np.empty((maskBlockCount, 2), dtype="uint32")
-            sequence.maskBlocks[:, 0] = maskBlockStarts
-            sequence.maskBlocks[:, 1] = maskBlockStarts + maskBlockSizes
+            maskBlocks = np.empty((maskBlockCount, 2), dtype="uint32")
+            maskBlocks[:, 0] = maskBlockStarts
+            maskBlocks[:, 1] = maskBlockStarts + maskBlockSizes
             data = stream.read(4)
             reserved = int.from_bytes(data, byteorder, signed=False)
             if reserved != 0:
                 raise ValueError("Found non-zero reserved field %u" % reserved)
-            sequence.offset = stream.tell()
+            if packed or mmap:
+                byteSize = (dnaSize + 3) // 4
+                if mmap:
+                    offset = stream.tell()
+                    if offset + byteSize > len(mapping):
+                        raise ValueError("Unexpected end of file")
+                    data = np.frombuffer(mapping, np.uint8, byteSize, offset)
+                else:
+                    data = np.fromfile(stream, dtype="uint8", count=byteSize)
+                    if len(data) < byteSize:
+                        raise ValueError("Unexpected end of file")
+                sequence = PackedSequenceData._from_packed(
+                    data, 0, dnaSize, nBlocks, maskBlocks
+                )
+            else:
+                sequence = _TwoBitSequenceData(stream, stream.tell(), dnaSize)
+                sequence.nBlocks = nBlocks
+                sequence.maskBlocks = maskBlocks
             sequence = Seq(sequence)
             sequences[name] = sequence
         self._names = iter(self.sequences)
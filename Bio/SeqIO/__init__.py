@@ -334,6 +334,7 @@ You can also use any file format supported by Bio.AlignIO, such as "nexus",
 "phylip" and "stockholm", which gives you access to the individual sequences
 making up each alignment as SeqRecords.
 """
+
 # TODO
 # - define policy on reading aligned sequences with more than
 #   one gap character (see also AlignIO)
@@ -376,6 +377,7 @@ making up each alignment as SeqRecords.
 #
 # --Peter
 
+import os
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from collections.abc import Iterable
@@ -619,7 +621,7 @@ def write(
     raise ValueError(f"Unknown format '{format}'")
 
 
-def parse(handle, format, alphabet=None):
+def parse(handle, format, alphabet=None, **kwargs):
     r"""Turn a sequence file into an iterator returning SeqRecords.
 
     Arguments:
@@ -627,6 +629,11 @@ def parse(handle, format, alphabet=None):
      - format   - lower case string describing the file format.
      - alphabet - no longer used, should be None.
 
+    Any additional keyword arguments are passed on to the parser for the
+    file format. For example, the "genbank" and "embl" parsers accept
+    lazy_features=True to parse each feature only when it is first accessed,
+    and feature_types to read only the features of the given types.
+
     Typical usage, opening a file to read in, and looping over the record(s):
 
     >>> from Bio import SeqIO
@@ -671,12 +678,12 @@ def parse(handle, format, alphabet=None):
 
     iterator_generator = _FormatToIterator.get(format)
     if iterator_generator:
-        return iterator_generator(handle)
+        return iterator_generator(handle, **kwargs)
 
     raise ValueError(f"Unknown format '{format}'")
 
 
-def read(handle, format, alphabet=None):
+def read(handle, format, alphabet=None, **kwargs):
     """Turn a sequence file into a single SeqRecord.
 
     Arguments:
@@ -685,6 +692,9 @@ def read(handle, format, alphabet=None):
      - format   - string describing the file format.
      - alphabet - no longer used, should be None.
 
+    Any additional keyword arguments are passed on to the parser for the
+    file format, as for Bio.SeqIO.parse(...).
+
     This function is for use parsing sequence files containing
     exactly one record.  For example, reading a GenBank file:
 
@@ -716,7 +726,7 @@ def read(handle, format, alphabet=None):
     Use the Bio.SeqIO.parse(handle, format) function if you want
     to read multiple records from the handle.
     """
-    with parse(handle, format, alphabet) as records:
+    with parse(handle, format, alphabet, **kwargs) as records:
         try:
             record = next(records)
         except StopIteration:
@@ -729,6 +739,77 @@ def read(handle, format, alphabet=None):
     return record
 
 
+def parse_parallel(
+    filename, format, func=None, workers=None, ordered=True, chunk_size=16777216
+):
+    """Parse a sequence file in parallel, using a pool of worker processes.
+
+    Arguments:
+     - filename   - name of the file (not a handle)
+     - format     - lower case string describing the file format.
+     - func       - optional function to apply to each SeqRecord.
+     - workers    - number of worker processes; by default, the number of
+       CPUs.
+     - ordered    - if True (default), return the results in the order of the
+       records in the file.
+     - chunk_size - approximate size in bytes of the chunks of the file
+       parsed by each worker process.
+
+    The file is split into chunks at record boundaries, using the same record
+    markers as Bio.SeqIO.index(). Each chunk is parsed in a worker process,
+    and if given, the function is applied to each record there. This returns
+    an iterator over the records, or over the values returned by the function.
+    For example, to calculate the GC content of each sequence in a FASTA file:
+
+    >>> from Bio import SeqIO
+    >>> from Bio.SeqUtils import gc_fraction
+    >>> filename = "Fasta/f002"
+    >>> for value in SeqIO.parse_parallel(filename, "fasta", gc_fraction, workers=2):
+    ...     print("%0.2f" % value)
+    0.46
+    0.39
+    0.43
+
+    As the function and its return values are sent between processes, they
+    must be picklable; in particular, the function cannot be a lambda
+    function. Applying the function in the worker processes allows per-record
+    work such as translation to use multiple cores; if ``func`` is None, the
+    SeqRecord objects themselves are returned.
+
+    With ``ordered=False``, the results of each chunk are returned as soon as
+    the chunk has been parsed, which may differ from the order in the file;
+    the results within a chunk are still in order.
+
+    This is supported for the plain text formats that Bio.SeqIO.index() can
+    split at a record marker, such as FASTA, GenBank, and EMBL, and for FASTQ
+    files with four lines per record (no line wrapping). Compressed files are
+    not supported.
+    """
+    # Try and give helpful error messages:
+    if not isinstance(format, str):
+        raise TypeError("Need a string for the file format (lower case)")
+    if not format:
+        raise ValueError("Format required (lower case string)")
+    if not format.islower():
+        raise ValueError(f"Format string '{format}' should be lower case")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    from ._parallel import _fastq_formats  # Lazy import
+    from ._parallel import _parse_parallel
+    from ._parallel import _record_markers
+
+    if format == "uniprot-xml" or (
+        format not in _record_markers and format not in _fastq_formats
+    ):
+        raise ValueError(f"Unsupported format {format!r}")
+    if not isinstance(filename, (str, bytes, os.PathLike)):
+        raise TypeError(
+            "Need a string or path-like object for the filename (not a handle)"
+        )
+    return _parse_parallel(filename, format, func, workers, ordered, chunk_size)
+
+
 def to_dict(sequences, key_function=None):
     """Turn a sequence iterator or list into a dictionary.
 
@@ -803,7 +884,7 @@ def to_dict(sequences, key_function=None):
     return d
 
 
-def index(filename, format, alphabet=None, key_function=None):
+def index(filename, format, alphabet=None, key_function=None, index_filename=None):
     """Indexes a sequence file and returns a dictionary like object.
 
     Arguments:
@@ -813,6 +894,8 @@ def index(filename, format, alphabet=None, key_function=None):
      - key_function - Optional callback function which when given a
        SeqRecord identifier string should return a unique key for the
        dictionary.
+     - index_filename - Optional name of a file to store the index in
+       (see below).
 
     This indexing function will return a dictionary like object, giving the
     SeqRecord objects as values.
@@ -907,6 +990,37 @@ def index(filename, format, alphabet=None, key_function=None):
     to be completely parsed while building the index. Right now this is
     usually avoided.
 
+    For very large files, holding all keys and offsets in memory may be
+    too expensive, and rescanning the file every time slow. If you give an
+    index_filename, the keys and offsets are instead stored in a compact
+    binary file, which is memory-mapped and searched on lookup. The index
+    file is created the first time, and reused afterwards as long as the
+    indexed file has not been modified:
+
+    >>> import os
+    >>> import tempfile
+    >>> index_filename = os.path.join(tempfile.mkdtemp(), "example.idx")
+    >>> records = SeqIO.index("Quality/example.fastq", "fastq",
+    ...                       index_filename=index_filename)
+    >>> len(records)
+    3
+    >>> print(records["EAS54_6_R1_2_1_540_792"].seq)
+    TTGGCAGGCCAAGGCCGATGGATCA
+    >>> records.close()
+    >>> records = SeqIO.index("Quality/example.fastq", "fastq",
+    ...                       index_filename=index_filename)
+    >>> list(records)
+    ['EAS54_6_R1_2_1_413_324', 'EAS54_6_R1_2_1_540_792', 'EAS54_6_R1_2_1_443_348']
+    >>> records.close()
+    >>> os.remove(index_filename)
+
+    The keys must then be strings. The index file is also rebuilt if it was
+    created with a different key_function, as identified by its qualified
+    name (so all lambda functions defined in the same scope count as the
+    same). Such a dictionary can be pickled cheaply, e.g. to pass it to
+    worker processes, as only the file names (and the key_function, which
+    must then be picklable too) are stored.
+
     See Also: Bio.SeqIO.index_db() and Bio.SeqIO.to_dict()
 
     """
@@ -922,6 +1036,7 @@ def index(filename, format, alphabet=None, key_function=None):
 
     # Map the file format to a sequence iterator:
     from Bio.File import _IndexedSeqFileDict
+    from Bio.File import _MappedSeqFileDict
 
     from ._index import _FormatToRandomAccess  # Lazy import
 
@@ -943,6 +1058,16 @@ def index(filename, format, alphabet=None, key_function=None):
             "Need a string or path-like object for the filename (not a handle)"
         ) from None
 
+    if index_filename is not None:
+        return _MappedSeqFileDict(
+            random_access_proxy,
+            key_function,
+            repr,
+            "SeqRecord",
+            os.fspath(index_filename),
+            os.fspath(filename),
+            format,
+        )
     return _IndexedSeqFileDict(random_access_proxy, key_function, repr, "SeqRecord")
 
 
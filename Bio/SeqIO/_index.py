@@ -178,25 +178,29 @@ class SffTrimedRandomAccess(SffRandomAccess):
 ###################
 
 
+# Each record starts with a line beginning with this marker
+_record_markers = {
+    "ace": b"CO ",
+    "embl": b"ID ",
+    "fasta": b">",
+    "genbank": b"LOCUS ",
+    "gb": b"LOCUS ",
+    "imgt": b"ID ",
+    "phd": b"BEGIN_SEQUENCE",
+    "pir": b">..;",
+    "qual": b">",
+    "swiss": b"ID ",
+    "uniprot-xml": b"<entry ",
+}
+
+
 class SequentialSeqFileRandomAccess(SeqFileRandomAccess):
     """Random access to a simple sequential sequence file."""
 
     def __init__(self, filename, format):
         """Initialize the class."""
         SeqFileRandomAccess.__init__(self, filename, format)
-        marker = {
-            "ace": b"CO ",
-            "embl": b"ID ",
-            "fasta": b">",
-            "genbank": b"LOCUS ",
-            "gb": b"LOCUS ",
-            "imgt": b"ID ",
-            "phd": b"BEGIN_SEQUENCE",
-            "pir": b">..;",
-            "qual": b">",
-            "swiss": b"ID ",
-            "uniprot-xml": b"<entry ",
-        }[format]
+        marker = _record_markers[format]
         self._marker = marker
         self._marker_re = re.compile(b"^" + marker)
 
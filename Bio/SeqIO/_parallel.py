@@ -0,0 +1,158 @@
+# Copyright 2026 by the Biopython contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Parsing sequence files in parallel (PRIVATE).
+
+You are not expected to access this module, or any of its code, directly. This
+is all handled internally by the Bio.SeqIO.parse_parallel(...) function which
+is the public interface for this functionality.
+
+The file is split into chunks of roughly equal size at record boundaries,
+found using the same record markers as Bio.SeqIO.index(...). Each chunk is
+then parsed, and the optional function applied to each record, in a worker
+process.
+"""
+
+import collections
+import io
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+
+from Bio import SeqIO
+
+from ._index import _record_markers
+
+_fastq_formats = ("fastq", "fastq-sanger", "fastq-solexa", "fastq-illumina")
+
+
+def _find_record_start(handle, format, offset):
+    """Return the file offset of the first record starting at or after offset (PRIVATE).
+
+    Returns the offset of the end of the file if there are no more records.
+    """
+    if offset > 0:
+        # skip the rest of the line containing the byte before offset,
+        # so that we are at the start of a line
+        handle.seek(offset - 1)
+        handle.readline()
+    else:
+        handle.seek(0)
+    if format in _fastq_formats:
+        return _find_fastq_record_start(handle)
+    # the markers are regular expressions, as in Bio.SeqIO.index
+    marker_re = re.compile(b"^" + _record_markers[format])
+    while True:
+        position = handle.tell()
+        line = handle.readline()
+        if marker_re.match(line) or not line:
+            return position
+
+
+def _find_fastq_record_start(handle):
+    """Return the file offset of the next FASTQ record (PRIVATE).
+
+    As quality lines can also start with "@", a line starting with "@" is
+    accepted as the start of a record only if it is followed by a sequence
+    line, a "+" line, a quality line of the same length as the sequence, and
+    the start of the next record (or the end of the file). This assumes that
+    the records are not line-wrapped.
+    """
+    lines = collections.deque()
+    while True:
+        while len(lines) < 5:
+            lines.append((handle.tell(), handle.readline()))
+        position, line = lines[0]
+        if not line:
+            return position
+        if (
+            line.startswith(b"@")
+            and lines[2][1].startswith(b"+")
+            and len(lines[1][1].rstrip()) == len(lines[3][1].rstrip())
+            and (lines[4][1].startswith(b"@") or not lines[4][1])
+        ):
+            return position
+        lines.popleft()
+
+
+def _split_file(filename, format, chunk_size):
+    """Return the (start, end) file offsets of the chunks of the file (PRIVATE)."""
+    size = os.path.getsize(filename)
+    with open(filename, "rb") as handle:
+        start = 0
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                end = _find_record_start(handle, format, end)
+            else:
+                end = size
+            yield start, end
+            start = end
+
+
+def _parse_chunk(filename, format, start, end, func):
+    """Parse a chunk of the file, and apply func to each record (PRIVATE)."""
+    with open(filename, "rb") as handle:
+        handle.seek(start)
+        data = handle.read(end - start)
+    # same decoding and newline handling as when SeqIO.parse opens the file
+    stream = io.TextIOWrapper(io.BytesIO(data))
+    records = SeqIO.parse(stream, format)
+    if func is None:
+        return list(records)
+    return [func(record) for record in records]
+
+
+def _parse_parallel(filename, format, func, workers, ordered, chunk_size):
+    """Parse the chunks of the file in a pool of processes (PRIVATE)."""
+    with ProcessPoolExecutor(workers) as executor:
+        yield from _parse_chunks(
+            executor, filename, format, func, workers, ordered, chunk_size
+        )
+
+
+def _parse_chunks(executor, filename, format, func, workers, ordered, chunk_size):
+    """Parse the chunks of the file using the executor (PRIVATE)."""
+    # Limit the number of chunks submitted at a time, so that the results
+    # don't pile up in memory if they are consumed slowly.
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    chunks = _split_file(filename, format, chunk_size)
+    if ordered:
+        pending = collections.deque()
+        try:
+            for start, end in chunks:
+                future = executor.submit(
+                    _parse_chunk, filename, format, start, end, func
+                )
+                pending.append(future)
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+    else:
+        pending = set()
+        try:
+            for start, end in chunks:
+                future = executor.submit(
+                    _parse_chunk, filename, format, start, end, func
+                )
+                pending.add(future)
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -23,6 +23,8 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING
 from typing import Union
 
+import numpy as np
+
 from Bio import StreamModeError
 from Bio.Seq import MutableSeq
 from Bio.Seq import Seq
@@ -1029,8 +1031,15 @@ class SeqRecord:
             # To make this type safe, we would need to make sure the types are compatible, eg: no adding tuples and str
             for k, v in self.letter_annotations.items():  # type: ignore
                 if k in other.letter_annotations:
-                    # avoid length checks, but otherwise equivalent to answer.letter_annotations[k] = v + other.letter_annotations[k]
-                    dict.__setitem__(answer.letter_annotations, k, v + other.letter_annotations[k])  # type: ignore
+                    w = other.letter_annotations[k]
+                    if isinstance(v, np.ndarray) or isinstance(w, np.ndarray):
+                        # Concatenate NumPy arrays (e.g. FASTQ qualities), also
+                        # if the other value is a list
+                        v = np.concatenate((np.asarray(v), np.asarray(w)))
+                    else:
+                        v = v + w
+                    # avoid length checks, but otherwise equivalent to answer.letter_annotations[k] = v
+                    dict.__setitem__(answer.letter_annotations, k, v)  # type: ignore
         except TypeError:
             print("Failed while try to concatenate letter annotations")
             raise
@@ -0,0 +1,319 @@
+# Copyright 2026 by the Biopython contributors.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Find open reading frames (ORFs) in nucleotide sequences.
+
+An ORF is taken to run from a start codon to the first stop codon in the
+same frame (inclusive), using the start and stop codons of the codon table.
+For each stop codon, only the longest ORF is reported, starting at the first
+start codon following the previous stop codon in that frame. Codons with
+ambiguous nucleotides are regarded as neither start nor stop codons.
+
+The start and stop codons are found in all six frames of the sequence at
+once, in a single pass over the sequence using NumPy:
+
+>>> from Bio.SeqUtils.orf import find_orfs
+>>> orfs = find_orfs("CCATGAAATTTGGGTAACCTTACCCAAATTTCATGG", min_length=12)
+>>> orfs.tolist()
+[[2, 17, 1], [19, 34, -1]]
+
+Each row gives the start and end (in Python coordinates, on the forward
+strand, and including the stop codon), and the strand of an ORF.
+"""
+
+import collections
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from Bio.Seq import _get_codon_table
+from Bio.SeqFeature import CompoundLocation
+from Bio.SeqFeature import SeqFeature
+from Bio.SeqFeature import SimpleLocation
+
+# Map nucleotides to 0-3 for A, C, G, T (or U), and 4 for anything else
+_nucleotide_indices = np.full(256, 4, np.uint8)
+for _index, _letters in enumerate(("Aa", "Cc", "Gg", "TtUu")):
+    for _letter in _letters:
+        _nucleotide_indices[ord(_letter)] = _index
+del _index, _letters, _letter
+
+
+def _get_codon_masks(table):
+    """Return boolean arrays marking the start and stop codons (PRIVATE).
+
+    The arrays are indexed by 25 * i + 5 * j + k for a codon with nucleotide
+    indices i, j, and k, where an index of 4 denotes any other letter.
+    """
+    codon_table = _get_codon_table(table)
+    starts = np.zeros(125, bool)
+    stops = np.zeros(125, bool)
+    for i, c1 in enumerate("ACGT"):
+        for j, c2 in enumerate("ACGT"):
+            for k, c3 in enumerate("ACGT"):
+                codon = c1 + c2 + c3
+                codons = (codon, codon.replace("T", "U"))
+                index = 25 * i + 5 * j + k
+                for codon in codons:
+                    if codon in codon_table.start_codons:
+                        starts[index] = True
+                    if codon in codon_table.stop_codons:
+                        stops[index] = True
+    return starts, stops
+
+
+def _find_strand_orfs(indices, starts, stops, min_length, max_length=None):
+    """Find the ORFs on one strand, given the nucleotide indices (PRIVATE).
+
+    If max_length is not None, ORFs start at the first start codon after
+    the previous stop codon, or max_length nucleotides before their end,
+    whichever is later. Returns two arrays with the start and end of each
+    ORF.
+    """
+    codons = indices[:-2] * 25
+    codons += indices[1:-1] * 5
+    codons += indices[2:]
+    start_positions = np.flatnonzero(starts[codons])
+    stop_positions = np.flatnonzero(stops[codons])
+    orf_starts = []
+    orf_ends = []
+    for frame in range(3):
+        frame_starts = start_positions[start_positions % 3 == frame]
+        frame_stops = stop_positions[stop_positions % 3 == frame]
+        # The ORF ending at each stop codon begins at the first start codon
+        # after the previous stop codon in the same frame, if any
+        previous = np.concatenate(([frame - 3], frame_stops))[: len(frame_stops)]
+        first = previous + 3
+        if max_length is not None:
+            np.maximum(first, frame_stops + 3 - max_length, out=first)
+        k = np.searchsorted(frame_starts, first)
+        found = k < len(frame_starts)
+        begin = frame_starts[k[found]]
+        end = frame_stops[found] + 3
+        found = begin < end
+        orf_starts.append(begin[found])
+        orf_ends.append(end[found])
+    orf_starts = np.concatenate(orf_starts)
+    orf_ends = np.concatenate(orf_ends)
+    found = orf_ends - orf_starts >= min_length
+    return orf_starts[found], orf_ends[found]
+
+
+def _find_orfs(data, starts, stops, min_length, circular):
+    """Find the ORFs in a sequence given as bytes (PRIVATE).
+
+    This function does the work for find_orfs, and is also run in the
+    worker processes of find_orfs_in_records.
+    """
+    n = len(data)
+    indices = _nucleotide_indices[np.frombuffer(data, np.uint8)]
+    # the complement of nucleotide index i is 3 - i, except for 4
+    reverse = indices[::-1].copy()
+    reverse[reverse < 4] ^= 3
+    results = []
+    for strand, strand_indices in ((1, indices), (-1, reverse)):
+        if circular:
+            # Use three copies of the sequence, and keep the ORFs starting
+            # in the middle copy, so that ORFs spanning the origin are found.
+            # ORFs are at most as long as the sequence.
+            strand_indices = np.tile(strand_indices, 3)
+            begin, end = _find_strand_orfs(strand_indices, starts, stops, min_length, n)
+            found = (n <= begin) & (begin < 2 * n)
+            begin = begin[found] - n
+            end = end[found] - n
+        else:
+            begin, end = _find_strand_orfs(strand_indices, starts, stops, min_length)
+        if strand == -1:
+            begin, end = n - end, n - begin
+            if circular:
+                # ORFs spanning the origin end after the end of the sequence
+                wrapped = begin < 0
+                begin[wrapped] += n
+                end[wrapped] += n
+        results.append(np.column_stack((begin, end, np.full(len(begin), strand))))
+    orfs = np.concatenate(results).astype(np.int64)
+    return orfs[np.lexsort((orfs[:, 1], orfs[:, 0]))]
+
+
+def _get_bytes(sequence):
+    """Return the sequence contents as a bytes object (PRIVATE)."""
+    if isinstance(sequence, str):
+        return sequence.encode("ASCII", "replace")
+    return bytes(sequence)
+
+
+def find_orfs(sequence, table="Standard", min_length=75, circular=False):
+    """Find the open reading frames in all six frames of a nucleotide sequence.
+
+    Arguments:
+     - sequence - nucleotide sequence as a string, Seq, or MutableSeq object.
+     - table - Which codon table to use?  This can be either a name
+       (string), an NCBI identifier (integer), or a CodonTable object.
+       Its start and stop codons are used. Defaults to the "Standard"
+       table.
+     - min_length - minimum length of an ORF in nucleotides, including the
+       stop codon. Defaults to 75.
+     - circular - if True, the sequence is circular, and ORFs spanning the
+       origin are reported as well. ORFs are then at most as long as the
+       sequence; if there is no stop codon in the same frame within that
+       distance upstream, the ORF starts at the most upstream start codon
+       within it.
+
+    Returns a NumPy array with three columns, giving the start, end, and
+    strand (1 or -1) of each ORF, sorted by start and end. The start and
+    end are Python coordinates on the forward strand, and the ORF includes
+    the stop codon. For a circular sequence, the end of an ORF spanning the
+    origin is larger than the length of the sequence.
+
+    >>> orfs = find_orfs("TGAAATTTGGGTAACCATG", min_length=6)
+    >>> orfs.tolist()
+    []
+    >>> orfs = find_orfs("TGAAATTTGGGTAACCATG", min_length=6, circular=True)
+    >>> orfs.tolist()
+    [[16, 22, 1]]
+
+    Using the bacterial genetic code, GTG and TTG are start codons as well:
+
+    >>> orfs = find_orfs("GTGAAATAA", min_length=6, table=11)
+    >>> orfs.tolist()
+    [[0, 9, 1]]
+    """
+    starts, stops = _get_codon_masks(table)
+    data = _get_bytes(sequence)
+    return _find_orfs(data, starts, stops, min_length, circular)
+
+
+def _orf_features(orfs, length):
+    """Return the ORFs from find_orfs as a list of SeqFeature objects (PRIVATE)."""
+    features = []
+    for start, end, strand in orfs.tolist():
+        if end <= length:
+            location = SimpleLocation(start, end, strand)
+        elif strand == 1:
+            location = CompoundLocation(
+                [SimpleLocation(start, length, 1), SimpleLocation(0, end - length, 1)]
+            )
+        else:
+            location = CompoundLocation(
+                [
+                    SimpleLocation(0, end - length, -1),
+                    SimpleLocation(start, length, -1),
+                ]
+            )
+        features.append(SeqFeature(location, type="CDS"))
+    return features
+
+
+def orf_features(sequence, table="Standard", min_length=75, circular=False):
+    """Find the open reading frames, and return them as SeqFeature objects.
+
+    The arguments are the same as for find_orfs. Returns a list of
+    SeqFeature objects of type "CDS", in the same order as find_orfs.
+    For a circular sequence, ORFs spanning the origin have a compound
+    location.
+
+    >>> from Bio.Seq import Seq
+    >>> sequence = Seq("TGAAATTTGGGTAACCATG")
+    >>> features = orf_features(sequence, min_length=6, circular=True)
+    >>> print(features[0].location)
+    join{[16:19](+), [0:3](+)}
+    >>> features[0].extract(sequence).translate()
+    Seq('M*')
+    """
+    starts, stops = _get_codon_masks(table)
+    data = _get_bytes(sequence)
+    orfs = _find_orfs(data, starts, stops, min_length, circular)
+    return _orf_features(orfs, len(data))
+
+
+def _find_orfs_batch(batch, starts, stops, min_length):
+    """Find the ORFs in a list of (bytes, circular) tuples (PRIVATE)."""
+    return [
+        _find_orfs(data, starts, stops, min_length, circular)
+        for data, circular in batch
+    ]
+
+
+def _add_orf_features(records, future):
+    """Add the ORFs found by a worker process to the records, and yield them (PRIVATE)."""
+    for record, orfs in zip(records, future.result()):
+        record.features.extend(_orf_features(orfs, len(record.seq)))
+        yield record
+
+
+def find_orfs_in_records(
+    records,
+    table="Standard",
+    min_length=75,
+    circular=None,
+    workers=None,
+    batch_size=1048576,
+):
+    """Find the open reading frames in SeqRecord objects using worker processes.
+
+    Arguments:
+     - records - an iterable of SeqRecord objects, e.g. from Bio.SeqIO.parse.
+     - table - codon table, as for find_orfs.
+     - min_length - minimum length of an ORF in nucleotides, as for find_orfs.
+     - circular - if None (default), a record is regarded as circular if
+       its "topology" annotation is "circular"; use True or False to
+       override this for all records.
+     - workers - maximum number of worker processes; by default, the number
+       of processors.
+     - batch_size - approximate total length of the sequences sent to a
+       worker process at a time (default 1 MiB).
+
+    This is a generator function, yielding the records in their original
+    order with the ORFs appended to their features (as in orf_features).
+    Only the sequences are sent to the worker processes, and at most a few
+    batches per worker are pending at any time, so that large files can be
+    processed as a stream:
+
+    >>> from Bio import SeqIO
+    >>> records = SeqIO.parse("GenBank/NC_005816.gb", "genbank")
+    >>> for record in find_orfs_in_records(records, table=11, min_length=300,
+    ...                                    workers=2):
+    ...     orfs = [f for f in record.features if f.type == "CDS"]
+    ...     print(record.id, record.annotations["topology"], len(orfs))
+    ...
+    NC_005816.1 circular 24
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    starts, stops = _get_codon_masks(table)
+    # Limit the number of batches submitted at a time, so that the records
+    # don't pile up in memory if they are consumed slowly.
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(workers) as executor:
+        pending = collections.deque()
+        batch_records = []
+        batch = []
+        size = 0
+        for record in records:
+            if circular is None:
+                is_circular = record.annotations.get("topology") == "circular"
+            else:
+                is_circular = circular
+            data = _get_bytes(record.seq)
+            batch_records.append(record)
+            batch.append((data, is_circular))
+            size += len(data)
+            if size >= batch_size:
+                future = executor.submit(
+                    _find_orfs_batch, batch, starts, stops, min_length
+                )
+                pending.append((batch_records, future))
+                batch_records = []
+                batch = []
+                size = 0
+                if len(pending) >= max_pending:
+                    yield from _add_orf_features(*pending.popleft())
+        if batch:
+            future = executor.submit(_find_orfs_batch, batch, starts, stops, min_length)
+            pending.append((batch_records, future))
+        while pending:
+            yield from _add_orf_features(*pending.popleft())
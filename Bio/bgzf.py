@@ -247,11 +247,13 @@ If your data is in UTF-8 or any other incompatible encoding, you must use
 binary mode, and decode the appropriate fragments yourself.
 """
 
+import collections
 import io
 import struct
 import sys
 import zlib
 from builtins import open as _open
+from concurrent.futures import ThreadPoolExecutor
 
 _bgzf_magic = b"\x1f\x8b\x08\x04"
 _bgzf_header = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00\x42\x43\x02\x00"
@@ -259,7 +261,7 @@ _bgzf_eof = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00\x1b\x00
 _bytes_BC = b"BC"
 
 
-def open(filename, mode="rb"):
+def open(filename, mode="rb", threads=1):
     r"""Open a BGZF file for reading, writing or appending.
 
     If text mode is requested, in order to avoid multi-byte characters, this is
@@ -268,11 +270,14 @@ def open(filename, mode="rb"):
 
     If your data is in UTF-8 or any other incompatible encoding, you must use
     binary mode, and decode the appropriate fragments yourself.
+
+    Argument ``threads`` sets the number of threads used to decompress (when
+    reading) or compress (when writing) the BGZF blocks.
     """
     if "r" in mode.lower():
-        return BgzfReader(filename, mode)
+        return BgzfReader(filename, mode, threads=threads)
     elif "w" in mode.lower() or "a" in mode.lower():
-        return BgzfWriter(filename, mode)
+        return BgzfWriter(filename, mode, threads=threads)
     else:
         raise ValueError(f"Bad mode {mode!r}")
 
@@ -435,6 +440,17 @@ def _load_bgzf_block(handle, text_mode=False):
     Returns a tuple (block size and data), or at end of file
     will raise StopIteration.
     """
+    block_size, deflated, expected_crc, expected_size = _read_bgzf_block(handle)
+    data = _inflate_bgzf_block(deflated, expected_crc, expected_size, text_mode)
+    return block_size, data
+
+
+def _read_bgzf_block(handle):
+    """Read the next BGZF block without decompressing it (PRIVATE).
+
+    Returns a tuple (block size, compressed data, CRC, and length of the
+    uncompressed data), or at end of file will raise StopIteration.
+    """
     magic = handle.read(4)
     if not magic:
         # End of file - should we signal this differently now?
@@ -468,10 +484,20 @@ def _load_bgzf_block(handle, text_mode=False):
         raise ValueError("Missing BC, this isn't a BGZF file!")
     # Now comes the compressed data, CRC, and length of uncompressed data.
     deflate_size = block_size - 1 - extra_len - 19
-    d = zlib.decompressobj(-15)  # Negative window size means no headers
-    data = d.decompress(handle.read(deflate_size)) + d.flush()
+    deflated = handle.read(deflate_size)
     expected_crc = handle.read(4)
     expected_size = struct.unpack("<I", handle.read(4))[0]
+    return block_size, deflated, expected_crc, expected_size
+
+
+def _inflate_bgzf_block(deflated, expected_crc, expected_size, text_mode=False):
+    """Decompress the data of a BGZF block and check it (PRIVATE).
+
+    zlib releases the global interpreter lock while decompressing, so this
+    function can be run in a pool of threads.
+    """
+    d = zlib.decompressobj(-15)  # Negative window size means no headers
+    data = d.decompress(deflated) + d.flush()
     if expected_size != len(data):
         raise RuntimeError("Decompressed to %i, not %i" % (len(data), expected_size))
     # Should cope with a mix of Python platforms...
@@ -485,9 +511,9 @@ def _load_bgzf_block(handle, text_mode=False):
     if text_mode:
         # Note ISO-8859-1 aka Latin-1 preserves first 256 chars
         # (i.e. ASCII), but critically is a single byte encoding
-        return block_size, data.decode("latin-1")
+        return data.decode("latin-1")
     else:
-        return block_size, data
+        return data
 
 
 class BgzfReader:
@@ -555,7 +581,7 @@ class BgzfReader:
     pass, but is important for improving performance of random access.
     """
 
-    def __init__(self, filename=None, mode="r", fileobj=None, max_cache=100):
+    def __init__(self, filename=None, mode="r", fileobj=None, max_cache=100, threads=1):
         r"""Initialize the class for reading a BGZF file.
 
         You would typically use the top level ``bgzf.open(...)`` function
@@ -581,11 +607,21 @@ class BgzfReader:
         cache in memory. Each can be up to 64kb thus the default of 100 blocks
         could take up to 6MB of RAM. This is important for efficient random
         access, a small value is fine for reading the file in one pass.
+
+        Argument ``threads`` controls the number of threads used to decompress
+        the BGZF blocks. With the default of one thread, each block is
+        decompressed when it is needed. With more threads, the compressed
+        data of the next few blocks is read ahead, and decompressed in a pool
+        of threads while the current block is being processed. As zlib
+        releases the global interpreter lock, this can use multiple cores.
+        The virtual offsets returned by ``tell`` are not affected.
         """
         # TODO - Assuming we can seek, check for 28 bytes EOF empty block
         # and if missing warn about possible truncation (as in samtools)?
         if max_cache < 1:
             raise ValueError("Use max_cache with a minimum of 1")
+        if threads < 1:
+            raise ValueError("Use threads with a minimum of 1")
         # Must open the BGZF file in binary mode, but we may want to
         # treat the contents as either text or binary (unicode or
         # bytes under Python 3)
@@ -613,6 +649,13 @@ class BgzfReader:
         self._buffers = {}
         self._block_start_offset = None
         self._block_raw_length = None
+        if threads > 1:
+            self._executor = ThreadPoolExecutor(threads)
+            # blocks being decompressed, as (start offset, block size, future)
+            self._prefetched = collections.deque()
+            self._prefetch_size = 2 * threads
+        else:
+            self._executor = None
         self._load_block(handle.tell())
 
     def _load_block(self, start_offset=None):
@@ -635,6 +678,9 @@ class BgzfReader:
             # TODO - Implement LRU cache removal?
             self._buffers.popitem()
         # Now load the block
+        if self._executor is not None:
+            self._load_prefetched_block(start_offset)
+            return
         handle = self._handle
         if start_offset is not None:
             handle.seek(start_offset)
@@ -653,6 +699,46 @@ class BgzfReader:
         # Finally save the block in our cache,
         self._buffers[self._block_start_offset] = self._buffer, block_size
 
+    def _load_prefetched_block(self, start_offset):
+        """Load a block decompressed in the thread pool (PRIVATE)."""
+        prefetched = self._prefetched
+        while prefetched and prefetched[0][0] < start_offset:
+            # skipped over these blocks
+            prefetched.popleft()
+        if prefetched and prefetched[0][0] == start_offset:
+            offset = prefetched[-1][0] + prefetched[-1][1]
+        else:
+            # random access; discard any blocks read ahead
+            prefetched.clear()
+            offset = start_offset
+        # Reading the compressed data is fast; submit each block for
+        # decompression as soon as it has been read.
+        handle = self._handle
+        handle.seek(offset)
+        while len(prefetched) < self._prefetch_size:
+            try:
+                block_size, *args = _read_bgzf_block(handle)
+            except StopIteration:
+                break
+            future = self._executor.submit(_inflate_bgzf_block, *args, self._text)
+            prefetched.append((offset, block_size, future))
+            offset += block_size
+        if prefetched:
+            offset, block_size, future = prefetched.popleft()
+            self._buffer = future.result()
+        else:
+            # EOF
+            block_size = 0
+            if self._text:
+                self._buffer = ""
+            else:
+                self._buffer = b""
+        self._block_start_offset = start_offset
+        self._within_block_offset = 0
+        self._block_raw_length = block_size
+        # Finally save the block in our cache,
+        self._buffers[start_offset] = self._buffer, block_size
+
     def tell(self):
         """Return a 64-bit unsigned BGZF virtual offset."""
         if 0 < self._within_block_offset and self._within_block_offset == len(
@@ -765,6 +851,9 @@ class BgzfReader:
 
     def close(self):
         """Close BGZF file."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
         self._handle.close()
         self._buffer = None
         self._block_start_offset = None
@@ -794,8 +883,22 @@ class BgzfReader:
 class BgzfWriter:
     """Define a BGZFWriter object."""
 
-    def __init__(self, filename=None, mode="w", fileobj=None, compresslevel=6):
-        """Initialize the class."""
+    def __init__(
+        self, filename=None, mode="w", fileobj=None, compresslevel=6, threads=1
+    ):
+        """Initialize the class.
+
+        Argument ``threads`` controls the number of threads used to compress
+        the BGZF blocks. With more than one thread, full blocks are compressed
+        in a pool of threads, and written to the file in their original order
+        once they are ready. As zlib releases the global interpreter lock,
+        this can use multiple cores. The output is identical to the output
+        written with a single thread, and ``tell`` still returns the exact
+        virtual offset, though it has to wait for the pending blocks to be
+        written first.
+        """
+        if threads < 1:
+            raise ValueError("Use threads with a minimum of 1")
         if filename and fileobj:
             raise ValueError("Supply either filename or fileobj, not both")
         if fileobj:
@@ -818,9 +921,34 @@ class BgzfWriter:
         self._handle = handle
         self._buffer = b""
         self.compresslevel = compresslevel
+        if threads > 1:
+            self._executor = ThreadPoolExecutor(threads)
+            # compressed blocks not yet written, in file order
+            self._pending = collections.deque()
+            self._max_pending = 2 * threads
+        else:
+            self._executor = None
 
     def _write_block(self, block):
         """Write provided data to file as a single BGZF compressed block (PRIVATE)."""
+        if self._executor is None:
+            self._handle.write(self._compress_block(block))
+            return
+        pending = self._pending
+        pending.append(self._executor.submit(self._compress_block, block))
+        while len(pending) > self._max_pending:
+            self._handle.write(pending.popleft().result())
+
+    def _write_pending(self):
+        """Write the blocks that are still being compressed to file (PRIVATE)."""
+        if self._executor is None:
+            return
+        pending = self._pending
+        while pending:
+            self._handle.write(pending.popleft().result())
+
+    def _compress_block(self, block):
+        """Compress data as a single BGZF block (PRIVATE)."""
         # print("Saving %i bytes" % len(block))
         if len(block) > 65536:
             raise ValueError(f"{len(block)} Block length > 65536")
@@ -852,8 +980,7 @@ class BgzfWriter:
         # 2 bytes: block length as BC sub field (2)
         # X bytes: the data
         # 8 bytes: crc (4), uncompressed data length (4)
-        data = _bgzf_header + bsize + compressed + crc + uncompressed_length
-        self._handle.write(data)
+        return _bgzf_header + bsize + compressed + crc + uncompressed_length
 
     def write(self, data):
         """Write method for the class."""
@@ -884,6 +1011,7 @@ class BgzfWriter:
             self._buffer = self._buffer[65535:]
         self._write_block(self._buffer)
         self._buffer = b""
+        self._write_pending()
         self._handle.flush()
 
     def close(self):
@@ -896,12 +1024,19 @@ class BgzfWriter:
         """
         if self._buffer:
             self.flush()
+        self._write_pending()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
         self._handle.write(_bgzf_eof)
         self._handle.flush()
         self._handle.close()
 
     def tell(self):
         """Return a BGZF 64-bit virtual offset."""
+        # The offset of the current block depends on the size of the
+        # compressed blocks before it.
+        self._write_pending()
         return make_virtual_offset(self._handle.tell(), len(self._buffer))
 
     def seekable(self):
@@ -9,6 +9,7 @@
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
 #include <math.h>
+#include <string.h>
 
 
 static void
@@ -60,6 +61,72 @@ calculate(const char sequence[], Py_ssize_t m, double* matrix, Py_ssize_t n,
     }
 }
 
+static void
+encode(const char sequence[], Py_ssize_t n, unsigned char codes[])
+{
+    Py_ssize_t i;
+    unsigned char table[256];
+
+    memset(table, 4, sizeof(table));
+    table['A'] = 0; table['a'] = 0;
+    table['C'] = 1; table['c'] = 1;
+    table['G'] = 2; table['g'] = 2;
+    table['T'] = 3; table['t'] = 3;
+    for (i = 0; i < n; i++) codes[i] = table[(unsigned char)sequence[i]];
+}
+
+static void
+scan(const unsigned char codes[], const double* matrix, Py_ssize_t m,
+     Py_ssize_t n, float* forward, float* reverse, double* table)
+{
+    /* Scores both strands in a single pass over the encoded sequence, using
+     * each letter code for both the forward and the reverse complement table.
+     * The table stores five scores per motif position: the scores for A, C,
+     * G, and T, and NaN for any other letter, so that the inner loop does
+     * not need to branch. The first 5*m values are used for the forward
+     * strand, the next 5*m values for the reverse complement. */
+    Py_ssize_t i, j;
+    unsigned char c;
+    double score, rcscore;
+    double* rctable = table + 5 * m;
+#ifndef NAN
+    double NAN = 0.0;
+    NAN /= NAN;
+#endif
+
+    for (j = 0; j < m; j++) {
+        table[5*j+0] = matrix[4*j+0];
+        table[5*j+1] = matrix[4*j+1];
+        table[5*j+2] = matrix[4*j+2];
+        table[5*j+3] = matrix[4*j+3];
+        table[5*j+4] = NAN;
+        rctable[5*j+0] = matrix[4*(m-1-j)+3];
+        rctable[5*j+1] = matrix[4*(m-1-j)+2];
+        rctable[5*j+2] = matrix[4*(m-1-j)+1];
+        rctable[5*j+3] = matrix[4*(m-1-j)+0];
+        rctable[5*j+4] = NAN;
+    }
+    if (reverse == NULL) {
+        for (i = 0; i < n; i++) {
+            score = 0.0;
+            for (j = 0; j < m; j++) score += table[5*j+codes[i+j]];
+            forward[i] = (float)score;
+        }
+        return;
+    }
+    for (i = 0; i < n; i++) {
+        score = 0.0;
+        rcscore = 0.0;
+        for (j = 0; j < m; j++) {
+            c = codes[i+j];
+            score += table[5*j+c];
+            rcscore += rctable[5*j+c];
+        }
+        forward[i] = (float)score;
+        reverse[i] = (float)rcscore;
+    }
+}
+
 static int
 matrix_converter(PyObject* object, void* address)
 {
@@ -144,6 +211,86 @@ exit:
     return 0;
 }
 
+static int
+codes_converter(PyObject* object, void* address)
+{
+    const int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+    char datatype;
+    Py_buffer* view = address;
+
+    if (object == NULL) goto exit;
+    if (PyObject_GetBuffer(object, view, flags) == -1) return 0;
+    datatype = view->format[0];
+    switch (datatype) {
+        case '@':
+        case '=':
+        case '<':
+        case '>':
+        case '!': datatype = view->format[1]; break;
+        default: break;
+    }
+    if (datatype != 'B') {
+        PyErr_Format(PyExc_RuntimeError,
+            "codes array has incorrect data format ('%c', expected 'B')",
+            datatype);
+        goto exit;
+    }
+    if (view->ndim != 1) {
+        PyErr_Format(PyExc_ValueError,
+            "codes array has incorrect rank (%d expected 1)",
+            view->ndim);
+        goto exit;
+    }
+    return Py_CLEANUP_SUPPORTED;
+
+exit:
+    PyBuffer_Release(view);
+    return 0;
+}
+
+static int
+strand_scores_converter(PyObject* object, void* address)
+{
+    const int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+    char datatype;
+    Py_buffer* view = address;
+
+    if (object == NULL) goto exit;
+    if (PyObject_GetBuffer(object, view, flags) == -1) return 0;
+    datatype = view->format[0];
+    switch (datatype) {
+        case '@':
+        case '=':
+        case '<':
+        case '>':
+        case '!': datatype = view->format[1]; break;
+        default: break;
+    }
+    if (datatype != 'f') {
+        PyErr_Format(PyExc_RuntimeError,
+            "scores array has incorrect data format ('%c', expected 'f')",
+            datatype);
+        goto exit;
+    }
+    if (view->ndim != 2) {
+        PyErr_Format(PyExc_ValueError,
+            "scores array has incorrect rank (%d expected 2)",
+            view->ndim);
+        goto exit;
+    }
+    if (view->shape[0] != 1 && view->shape[0] != 2) {
+        PyErr_Format(PyExc_ValueError,
+            "scores array should have one or two rows (%zd rows found)",
+            view->shape[0]);
+        goto exit;
+    }
+    return Py_CLEANUP_SUPPORTED;
+
+exit:
+    PyBuffer_Release(view);
+    return 0;
+}
+
 static char calculate__doc__[] =
 "    calculate(sequence, pwm, scores)\n"
 "\n"
@@ -188,12 +335,128 @@ py_calculate(PyObject* self, PyObject* args, PyObject* keywords)
     return result;
 }
 
+static char encode__doc__[] =
+"    encode(sequence, codes)\n"
+"\n"
+"This function encodes the nucleotides A, C, G, and T in the sequence\n"
+"(in upper or lower case) as 0, 1, 2, and 3, and any other letter as 4,\n"
+"and stores them in the provided numpy uint8 array codes. The encoded\n"
+"sequence can be scanned with any number of position-weight matrices\n"
+"using the scan function.\n";
+
+static PyObject*
+py_encode(PyObject* self, PyObject* args, PyObject* keywords)
+{
+    static char* kwlist[] = {"sequence", "codes", NULL};
+    PyObject* result = NULL;
+    Py_buffer sequence;
+    Py_buffer codes;
+
+    codes.obj = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, keywords, "y*O&", kwlist,
+                                     &sequence,
+                                     codes_converter, &codes)) return NULL;
+    if (codes.shape[0] == sequence.len) {
+        Py_BEGIN_ALLOW_THREADS
+        encode(sequence.buf, sequence.len, codes.buf);
+        Py_END_ALLOW_THREADS
+        Py_INCREF(Py_None);
+        result = Py_None;
+    }
+    else {
+        PyErr_Format(PyExc_RuntimeError,
+                    "size of codes array is inconsistent "
+                    "(sequence length is %zd, codes length is %zd)",
+                    sequence.len, codes.shape[0]);
+    }
+
+    PyBuffer_Release(&sequence);
+    codes_converter(NULL, &codes);
+    return result;
+}
+
+static char scan__doc__[] =
+"    scan(codes, matrix, scores)\n"
+"\n"
+"This function calculates the position-weight matrix scores for all\n"
+"positions along the sequence encoded in codes (see encode) for the\n"
+"position-weight matrix, and stores them in the first row of the\n"
+"provided two-dimensional numpy array scores. If scores has two rows,\n"
+"the scores for the reverse complement of the position-weight matrix are\n"
+"stored in the second row. Positions with letters other than A, C, G, T\n"
+"get a score of NaN. The global interpreter lock is released during the\n"
+"calculation.\n";
+
+static PyObject*
+py_scan(PyObject* self, PyObject* args, PyObject* keywords)
+{
+    static char* kwlist[] = {"codes", "matrix", "scores", NULL};
+    Py_ssize_t m;
+    Py_ssize_t n;
+    Py_ssize_t s;
+    float* forward;
+    float* reverse = NULL;
+    double* table;
+    PyObject* result = NULL;
+    Py_buffer codes;
+    Py_buffer scores;
+    Py_buffer matrix;
+
+    codes.obj = NULL;
+    matrix.obj = NULL;
+    scores.obj = NULL;
+    if (!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
+                                     codes_converter, &codes,
+                                     matrix_converter, &matrix,
+                                     strand_scores_converter, &scores))
+        goto exit;
+    s = codes.shape[0];
+    m = matrix.shape[0];
+    n = scores.shape[1];
+    if (n != s - m + 1) {
+        PyErr_Format(PyExc_RuntimeError,
+                    "size of scores array is inconsistent "
+                    "(sequence length is %zd, "
+                    "motif length is %zd, scores length is %zd)", s, m, n);
+        goto exit;
+    }
+    table = PyMem_Malloc(10 * m * sizeof(double));
+    if (!table) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+    forward = scores.buf;
+    if (scores.shape[0] == 2) reverse = forward + n;
+    Py_BEGIN_ALLOW_THREADS
+    scan(codes.buf, matrix.buf, m, n, forward, reverse, table);
+    Py_END_ALLOW_THREADS
+    PyMem_Free(table);
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+exit:
+    codes_converter(NULL, &codes);
+    matrix_converter(NULL, &matrix);
+    strand_scores_converter(NULL, &scores);
+    return result;
+}
+
 static struct PyMethodDef methods[] = {
    {"calculate",
     (PyCFunction)py_calculate,
     METH_VARARGS | METH_KEYWORDS,
     PyDoc_STR(calculate__doc__),
    },
+   {"encode",
+    (PyCFunction)py_encode,
+    METH_VARARGS | METH_KEYWORDS,
+    PyDoc_STR(encode__doc__),
+   },
+   {"scan",
+    (PyCFunction)py_scan,
+    METH_VARARGS | METH_KEYWORDS,
+    PyDoc_STR(scan__doc__),
+   },
    {NULL, NULL, 0, NULL} /* sentinel */
 };
 
@@ -11,6 +11,7 @@ Implementation of frequency (count) matrices, position-weight matrices,
 and position-specific scoring matrices.
 """
 
+import functools
 import math
 import numbers
 
@@ -399,6 +400,18 @@ class PositionWeightMatrix(GenericPositionMatrix):
 class PositionSpecificScoringMatrix(GenericPositionMatrix):
     """Class for the support of Position Specific Scoring Matrix calculations."""
 
+    def _logodds(self):
+        """Return the log-odds scores as a (length, 4) numpy array (PRIVATE).
+
+        The columns correspond to A, C, G, and T, as expected by the C code.
+        """
+        # TODO - Code itself tolerates ambiguous bases (as NaN).
+        if sorted(self.alphabet) != ["A", "C", "G", "T"]:
+            raise ValueError(
+                "PSSM has wrong alphabet: %s - Use only with DNA motifs" % self.alphabet
+            )
+        return np.array([self[letter] for letter in "ACGT"], float).T.copy()
+
     def calculate(self, sequence):
         """Return the PWM score for a given sequence for all positions.
 
@@ -410,41 +423,17 @@ class PositionSpecificScoringMatrix(GenericPositionMatrix):
          - otherwise, the result is a one-dimensional numpy array
 
         """
-        # TODO - Code itself tolerates ambiguous bases (as NaN).
-        if sorted(self.alphabet) != ["A", "C", "G", "T"]:
-            raise ValueError(
-                "PSSM has wrong alphabet: %s - Use only with DNA motifs" % self.alphabet
-            )
-
+        logodds = self._logodds()
         # NOTE: The C code handles mixed case input as this could be large
         # (e.g. contig or chromosome), so requiring it be all upper or lower
         # case would impose an overhead to allocate the extra memory.
-        try:
-            sequence = bytes(sequence)
-        except TypeError:  # str
-            try:
-                sequence = bytes(sequence, "ASCII")
-            except TypeError:
-                raise ValueError(
-                    "sequence should be a Seq, MutableSeq, string, or bytes-like object"
-                ) from None
-            except UnicodeEncodeError:
-                raise ValueError(
-                    "sequence should contain ASCII characters only"
-                ) from None
-        except Exception:
-            raise ValueError(
-                "sequence should be a Seq, MutableSeq, string, or bytes-like object"
-            ) from None
+        sequence = _as_bytes(sequence)
 
         n = len(sequence)
         m = self.length
         # Create the numpy arrays here; the C module then does not rely on numpy
         # Use a float32 for the scores array to save space
         scores = np.empty(n - m + 1, np.float32)
-        logodds = np.array(
-            [[self[letter][i] for letter in "ACGT"] for i in range(m)], float
-        )
         _pwm.calculate(sequence, logodds, scores)
 
         if len(scores) == 1:
@@ -457,33 +446,16 @@ class PositionSpecificScoringMatrix(GenericPositionMatrix):
 
         A generator function, returning found hits in the given sequence
         with the pwm score higher than the threshold.
+
+        To search many sequences for many motifs, use the search function
+        in this module instead.
         """
-        sequence = sequence.upper()
-        seq_len = len(sequence)
-        motif_l = self.length
-        chunk_starts = np.arange(0, seq_len, chunksize)
-        if both:
-            rc = self.reverse_complement()
-        for chunk_start in chunk_starts:
-            subseq = sequence[chunk_start : chunk_start + chunksize + motif_l - 1]
-            pos_scores = self.calculate(subseq)
-            pos_ind = pos_scores >= threshold
-            pos_positions = np.where(pos_ind)[0] + chunk_start
-            pos_scores = pos_scores[pos_ind]
-            if both:
-                neg_scores = rc.calculate(subseq)
-                neg_ind = neg_scores >= threshold
-                neg_positions = np.where(neg_ind)[0] + chunk_start
-                neg_scores = neg_scores[neg_ind]
-            else:
-                neg_positions = np.empty((0), dtype=int)
-                neg_scores = np.empty((0), dtype=int)
-            chunk_positions = np.append(pos_positions, neg_positions - seq_len)
-            chunk_scores = np.append(pos_scores, neg_scores)
-            order = np.argsort(np.append(pos_positions, neg_positions))
-            chunk_positions = chunk_positions[order]
-            chunk_scores = chunk_scores[order]
-            yield from zip(chunk_positions, chunk_scores)
+        logodds = self._logodds()
+        codes = _encode(sequence)
+        buffer = _scores_buffer(len(codes), both, chunksize)
+        for start in range(0, len(codes), chunksize):
+            positions, scores = _scan_chunk(codes, start, logodds, threshold, buffer)
+            yield from zip(positions, scores)
 
     @property
     def max(self):
@@ -621,3 +593,151 @@ class PositionSpecificScoringMatrix(GenericPositionMatrix):
         for letter in self.alphabet:
             background[letter] /= total
         return ScoreDistribution(precision=precision, pssm=self, background=background)
+
+
+def search(pssms, sequences, threshold=0.0, both=True, chunksize=10**6, executor=None):
+    """Find hits of several PSSMs in several sequences.
+
+    This is equivalent to calling the search method of each PSSM on each
+    sequence, but much faster if there are many motifs: each sequence is
+    encoded only once, the log-odds scores of each motif are calculated only
+    once, and both strands are scored in a single pass in C code.
+
+    Arguments:
+     - pssms - a list of PositionSpecificScoringMatrix objects.
+     - sequences - an iterable of DNA sequences (Seq, MutableSeq, string,
+       bytes-like object, or SeqRecord).
+     - threshold - the minimum score of a hit; either a single number, or a
+       sequence with one threshold for each PSSM.
+     - both - if True (default), search both strands.
+     - chunksize - the number of positions scored at a time; this limits the
+       memory used for storing scores.
+     - executor - optional concurrent.futures executor used to search the
+       sequences in parallel. The C code releases the global interpreter
+       lock, so a ThreadPoolExecutor can use multiple cores.
+
+    For each sequence, a list with one (positions, scores) tuple for each
+    PSSM is returned, where positions and scores are numpy arrays. As for
+    the search method, hits on the reverse strand have a negative position
+    following the Python convention on negative indices, and the hits are
+    sorted by their location on the sequence.
+
+    >>> from Bio import motifs
+    >>> from Bio.motifs.matrix import search
+    >>> m1 = motifs.create(["TACAA", "TACGC", "TACAC", "TACCC"])
+    >>> m2 = motifs.create(["GATTA", "GATCA", "GATTA"])
+    >>> pssms = [m1.pssm, m2.pssm]
+    >>> sequences = ["TACACTGCATTACAACCCAAGCATTA", "GGTGATTAGGTACAC"]
+    >>> for hits in search(pssms, sequences, threshold=4.0):
+    ...     for positions, scores in hits:
+    ...         print(positions.tolist(), ["%.3f" % score for score in scores])
+    ...
+    [0, 10] ['8.585', '7.000']
+    [] []
+    [10] ['8.585']
+    [3] ['9.415']
+
+    """
+    logodds = [pssm._logodds() for pssm in pssms]
+    if isinstance(threshold, numbers.Real):
+        thresholds = [float(threshold)] * len(logodds)
+    else:
+        thresholds = [float(value) for value in threshold]
+        if len(thresholds) != len(logodds):
+            raise ValueError(
+                "expected %d thresholds (found %d)" % (len(logodds), len(thresholds))
+            )
+    function = functools.partial(
+        _search_sequence,
+        logodds=logodds,
+        thresholds=thresholds,
+        both=both,
+        chunksize=chunksize,
+    )
+    if executor is None:
+        return map(function, sequences)
+    return executor.map(function, sequences)
+
+
+def _as_bytes(sequence):
+    """Return the sequence as a bytes-like object (PRIVATE)."""
+    try:
+        return bytes(sequence)
+    except TypeError:  # str
+        try:
+            return bytes(sequence, "ASCII")
+        except TypeError:
+            raise ValueError(
+                "sequence should be a Seq, MutableSeq, string, or bytes-like object"
+            ) from None
+        except UnicodeEncodeError:
+            raise ValueError("sequence should contain ASCII characters only") from None
+    except Exception:
+        raise ValueError(
+            "sequence should be a Seq, MutableSeq, string, or bytes-like object"
+        ) from None
+
+
+def _encode(sequence):
+    """Encode the nucleotides in a sequence as 0, 1, 2, 3 (PRIVATE).
+
+    Letters other than A, C, G, T (in upper or lower case) are encoded as 4.
+    """
+    sequence = _as_bytes(sequence)
+    codes = np.empty(len(sequence), np.uint8)
+    _pwm.encode(sequence, codes)
+    return codes
+
+
+def _scores_buffer(length, both, chunksize):
+    """Allocate a scores array for scanning a sequence in chunks (PRIVATE)."""
+    rows = 2 if both else 1
+    return np.empty((rows, min(length, chunksize)), np.float32)
+
+
+def _scan_chunk(codes, start, logodds, threshold, buffer):
+    """Find hits in the chunk of positions starting at start (PRIVATE).
+
+    Returns the positions and scores of the hits, as numpy arrays. The
+    buffer is used to store the scores of all positions in the chunk; if it
+    has two rows, the reverse strand is searched as well.
+    """
+    n = len(codes)
+    m = len(logodds)
+    rows, chunksize = buffer.shape
+    stop = min(start + chunksize, n - m + 1)
+    if stop <= start:
+        return np.empty(0, np.intp), np.empty(0, np.float32)
+    size = stop - start
+    # The scores must be stored in a contiguous array.
+    scores = buffer.reshape(-1)[: rows * size].reshape(rows, size)
+    _pwm.scan(codes[start : stop + m - 1], logodds, scores)
+    strands, indices = np.nonzero(scores >= threshold)
+    order = np.argsort(indices, kind="stable")
+    strands = strands[order]
+    indices = indices[order]
+    positions = indices + start - n * strands
+    return positions, scores[strands, indices]
+
+
+def _search_sequence(sequence, logodds, thresholds, both, chunksize):
+    """Find the hits of each motif in one sequence (PRIVATE)."""
+    codes = _encode(sequence)
+    buffer = _scores_buffer(len(codes), both, chunksize)
+    hits = [([], []) for matrix in logodds]
+    # Scan all motifs on a chunk before moving on to the next chunk, so that
+    # the encoded sequence of the chunk stays in the CPU cache.
+    for start in range(0, len(codes), chunksize):
+        for matrix, threshold, (positions, scores) in zip(logodds, thresholds, hits):
+            chunk_positions, chunk_scores = _scan_chunk(
+                codes, start, matrix, threshold, buffer
+            )
+            positions.append(chunk_positions)
+            scores.append(chunk_scores)
+    return [
+        (
+            np.concatenate(positions) if positions else np.empty(0, np.intp),
+            np.concatenate(scores) if scores else np.empty(0, np.float32),
+        )
+        for positions, scores in hits
+    ]
@@ -421,6 +421,12 @@ Used REBASE emboss files version {release_number} ({time.gmtime().tm_year}).
 
 '''
 
+_fields_comment = """\
+# The enzymes are stored in _enzymes as tuples of the name of the enzyme
+# followed by the values of the fields in _fields. rest_dict maps the name
+# of each enzyme to a dictionary of these fields.
+"""
+
 
 class DictionaryBuilder:
     """Builds ``Restriction_Dictionary.py`` from Rebase files.
@@ -529,21 +535,30 @@ class DictionaryBuilder:
         with open(os.path.join(update, "Restriction_Dictionary.py"), "w") as results:
             print("Writing the dictionary containing the new Restriction classes...")
             results.write(start)
-            results.write("rest_dict = {}\n")
+            results.write("# Turn black code style off\n# fmt: off\n")
+            results.write("\n")
+            #
+            #   Each enzyme is written as a tuple of constants, so that the
+            #   whole table is stored as a single constant in the .pyc file.
+            #
+            fields = sorted(next(iter(classdict.values())))
+            results.write(_fields_comment)
+            results.write("_fields = %s\n" % double_quote_repr(tuple(fields)))
             results.write("\n")
+            results.write("_enzymes = (\n")
             for name in sorted(classdict):
-                results.write("rest_dict[%s] = {\n" % double_quote_repr(name))
-                for key, value in sorted(classdict[name].items()):
-                    results.write(
-                        "    %s: %s,\n"
-                        % (double_quote_repr(key), double_quote_repr(value))
-                    )
-                results.write("}\n\n")
+                values = [name] + [classdict[name][key] for key in fields]
+                results.write("    %s,\n" % double_quote_repr(tuple(values)))
+            results.write(")\n")
+            results.write("\n")
+            results.write(
+                "rest_dict = {enzyme[0]: dict(zip(_fields, enzyme[1:])) "
+                "for enzyme in _enzymes}\n"
+            )
+            results.write("\n")
             print("OK.\n")
             print("Writing the dictionary containing the suppliers data...")
             results.write("\n")
-            results.write("# Turn black code style off\n# fmt: off\n")
-            results.write("\n")
             results.write("suppliers = {}\n")
             results.write("\n")
             for name in sorted(suppliersdict):
@@ -71,6 +71,7 @@ if np is None:
             "Bio.MarkovModel",
             "Bio.MaxEntropy",
             "Bio.NaiveBayes",
+            "Bio.PDB.AtomColumns",
             "Bio.PDB.Chain",
             "Bio.PDB.Dice",
             "Bio.PDB.HSExposure",
@@ -0,0 +1,262 @@
+# Copyright 2026 by the Biopython contributors.  All rights reserved.
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for Align.bam module."""
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+from io import StringIO
+
+from Bio import Align
+from Bio.Align import bam
+
+try:
+    import numpy as np
+except ImportError:
+    from Bio import MissingPythonDependencyError
+
+    raise MissingPythonDependencyError(
+        "Install numpy if you want to use Bio.Align.bam."
+    ) from None
+
+
+class TestAlign_reading(unittest.TestCase):
+    def check_ex1(self, alignments):
+        n = 0
+        for alignment in alignments:
+            n += 1
+        self.assertEqual(n, 3270)
+        self.assertEqual(alignment.sequences[0].id, "chr2")
+        self.assertEqual(len(alignment.sequences[0].seq), 1584)
+        self.assertEqual(alignment.sequences[1].id, "EAS114_26:7:37:79:581")
+        self.assertEqual(
+            alignment.sequences[1].seq, "TTTTCTGGCATGAAAAAAAAAAAAAAAAAAAAAAA"
+        )
+        self.assertEqual(alignment.flag, 83)
+        self.assertEqual(alignment.mapq, 68)
+        self.assertTrue(
+            np.array_equal(alignment.coordinates, np.array([[1532, 1567], [35, 0]]))
+        )
+        self.assertEqual(alignment.rnext, "chr2")
+        self.assertEqual(alignment.pnext, 1348)
+        self.assertEqual(alignment.tlen, -219)
+        self.assertEqual(
+            alignment.sequences[1].letter_annotations["phred_quality"][:8],
+            [18, 11, 11, 11, 28, 28, 28, 21],
+        )
+        self.assertEqual(
+            alignment.annotations,
+            {"MF": 18, "Aq": 27, "NM": 2, "UQ": 23, "H0": 0, "H1": 1},
+        )
+
+    def test_ex1(self):
+        alignments = Align.parse("SamBam/ex1.bam", "bam")
+        self.assertEqual(alignments.metadata, {})
+        self.assertEqual([target.id for target in alignments.targets], ["chr1", "chr2"])
+        self.check_ex1(alignments)
+
+    def test_ex1_header(self):
+        with open("SamBam/ex1_header.bam", "rb") as stream:
+            alignments = Align.parse(stream, "bam")
+            self.assertEqual(
+                alignments.metadata["HD"], {"VN": "1.3", "SO": "coordinate"}
+            )
+            self.assertEqual(len(alignments.targets), 2)
+            self.assertEqual(alignments.targets[0].id, "chr1")
+            self.assertEqual(len(alignments.targets[0].seq), 1575)
+            self.assertEqual(alignments.targets[1].id, "chr2")
+            self.assertEqual(len(alignments.targets[1].seq), 1584)
+            self.check_ex1(alignments)
+            self.assertEqual(len(alignments[:]), 3270)
+
+    def test_compare_sam(self):
+        """Compare the alignments in the BAM and SAM files."""
+        alignments1 = Align.parse("SamBam/ex1_refresh.bam", "bam")
+        alignments2 = Align.parse("SamBam/ex1_header.sam", "sam")
+        n = 0
+        for alignment1, alignment2 in zip(alignments1, alignments2):
+            n += 1
+            self.assertEqual(alignment1.query.id, alignment2.query.id)
+            self.assertEqual(alignment1.query.seq, alignment2.query.seq)
+            self.assertEqual(
+                alignment1.query.letter_annotations,
+                alignment2.query.letter_annotations,
+            )
+            self.assertEqual(alignment1.flag, alignment2.flag)
+            if alignment2.coordinates is None:
+                self.assertIsNone(alignment1.coordinates)
+            else:
+                self.assertEqual(alignment1.target.id, alignment2.target.id)
+                self.assertTrue(
+                    np.array_equal(alignment1.coordinates, alignment2.coordinates)
+                )
+            for key in ("mapq", "rnext", "pnext", "tlen", "annotations"):
+                self.assertEqual(
+                    getattr(alignment1, key, None), getattr(alignment2, key, None)
+                )
+        self.assertEqual(n, 3270)
+
+
+class TestAlign_writing(unittest.TestCase):
+    def test_ex1(self):
+        alignments = Align.parse("SamBam/ex1_header.bam", "bam")
+        mapped = Align.Alignments(
+            alignment for alignment in alignments if alignment.coordinates is not None
+        )
+        mapped.metadata = alignments.metadata
+        mapped.targets = alignments.targets
+        self.assertEqual(len(mapped), 3235)
+        stream = BytesIO()
+        n = Align.write(mapped, stream, "bam")
+        self.assertEqual(n, 3235)
+        data = stream.getvalue()
+        # BGZF end-of-file marker
+        self.assertEqual(
+            data[-28:],
+            bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000"),
+        )
+        stream.seek(0)
+        alignments = Align.parse(stream, "bam")
+        self.assertEqual(alignments.metadata, mapped.metadata)
+        self.assertEqual(
+            [(target.id, len(target)) for target in alignments.targets],
+            [("chr1", 1575), ("chr2", 1584)],
+        )
+        # the SAM output should be identical
+        output1 = StringIO()
+        Align.write(mapped, output1, "sam")
+        output2 = StringIO()
+        Align.write(alignments, output2, "sam")
+        self.assertEqual(output1.getvalue(), output2.getvalue())
+
+    def test_targets(self):
+        alignments = list(Align.parse("SamBam/bam1_sorted.bam", "bam"))
+        alignments = [alignment for alignment in alignments if alignment.target]
+        stream = BytesIO()
+        self.assertRaises(ValueError, Align.write, alignments, stream, "bam")
+        targets = [alignments[0].target]
+        stream = BytesIO()
+        writer = bam.AlignmentWriter(stream, targets=targets)
+        self.assertEqual(writer.write(alignments), 3)
+        stream.seek(0)
+        alignments = Align.parse(stream, "bam")
+        self.assertEqual(alignments.targets[0].id, "1")
+        self.assertEqual(len(alignments.targets[0]), 239940)
+        self.assertEqual(len(alignments), 3)
+
+
+class TestAlign_search(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "ex1.bam")
+        shutil.copyfile("SamBam/ex1_header.bam", self.filename)
+        # find the reference position of each alignment in the SAM file
+        self.positions = []
+        with open("SamBam/ex1_header.sam") as stream:
+            for line in stream:
+                if line.startswith("@"):
+                    continue
+                words = line.split("\t")
+                name = words[0]
+                rname = words[2]
+                start = int(words[3]) - 1
+                length = sum(
+                    int(number)
+                    for number, letter in re.findall(r"(\d+)([MIDNSHP=X])", words[5])
+                    if letter in "MDN=X"
+                )
+                end = start + max(length, 1)
+                self.positions.append((name, rname, start, end))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check_search(self, alignments):
+        for chromosome, start, end in (
+            ("chr1", 0, 1),
+            ("chr1", 100, 101),
+            ("chr1", 990, 1030),
+            ("chr1", 1500, 3000),
+            ("chr2", 0, 1584),
+            ("chr2", 1200, 1201),
+            ("chr2", 1300, 1400),
+        ):
+            expected = [
+                name
+                for name, rname, alignment_start, alignment_end in self.positions
+                if rname == chromosome
+                and alignment_start < end
+                and start < alignment_end
+            ]
+            names = [
+                alignment.query.id
+                for alignment in alignments.search(chromosome, start, end)
+            ]
+            self.assertEqual(names, expected)
+        self.assertEqual(len(list(alignments.search("chr2"))), 1806)
+        self.assertEqual(len(list(alignments.search())), 3270)
+        self.assertRaises(ValueError, next, alignments.search("chr3", 0, 10))
+
+    def test_bai(self):
+        bam.write_index(self.filename)
+        # identical to the index created by samtools
+        with open(self.filename + ".bai", "rb") as stream:
+            data = stream.read()
+        with open("SamBam/ex1_header.bam.bai", "rb") as stream:
+            self.assertEqual(data, stream.read())
+        with Align.parse(self.filename, "bam") as alignments:
+            self.check_search(alignments)
+            # searching does not affect the iterator
+            names = [name for name, rname, start, end in self.positions]
+            alignment = next(alignments)
+            self.assertEqual(alignment.query.id, names[0])
+            i = 1
+            for alignment in alignments.search("chr2", 100, 200):
+                self.assertEqual(next(alignments).query.id, names[i])
+                i += 1
+            self.assertEqual(i, 79)
+            self.assertEqual(next(alignments).query.id, names[i])
+
+    def test_index_file(self):
+        # ex1_header.bam.bai was created using samtools
+        with Align.parse("SamBam/ex1_header.bam", "bam") as alignments:
+            self.check_search(alignments)
+
+    def test_csi_file(self):
+        # ex1_header.bam.csi was created using samtools, with a single level
+        # of bins as the references are short
+        with bam.AlignmentIterator(
+            "SamBam/ex1_header.bam", index="SamBam/ex1_header.bam.csi"
+        ) as alignments:
+            self.check_search(alignments)
+
+    def test_csi(self):
+        bam.write_index(self.filename, "csi", min_shift=10, depth=6)
+        self.assertTrue(os.path.exists(self.filename + ".csi"))
+        with Align.parse(self.filename, "bam") as alignments:
+            self.check_search(alignments)
+        index = os.path.join(self.directory, "index.csi")
+        os.rename(self.filename + ".csi", index)
+        with bam.AlignmentIterator(self.filename, index=index) as alignments:
+            self.check_search(alignments)
+
+    def test_unsorted(self):
+        alignments = Align.parse(self.filename, "bam")
+        mapped = Align.Alignments(
+            alignment for alignment in alignments if alignment.coordinates is not None
+        )
+        mapped.reverse()
+        mapped.targets = alignments.targets
+        Align.write(mapped, self.filename, "bam")
+        self.assertRaises(ValueError, bam.write_index, self.filename)
+        self.assertRaises(ValueError, bam.write_index, self.filename, "bai", 10)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -7800,6 +7800,32 @@ class TestAlign_sambam(unittest.TestCase):
         self.assertEqual(alignment.annotations["H0"], 0)
         self.assertEqual(alignment.annotations["H1"], 1)
 
+    def test_tlen(self):
+        """Test writing the observed template length (TLEN)."""
+        # the SAM writer does not write unmapped reads
+        with open("SamBam/ex1_header.sam") as stream:
+            lines = [
+                line
+                for line in stream
+                if not line.startswith("@") and not int(line.split("\t")[1]) & 0x4
+            ]
+        alignments = Align.parse("SamBam/ex1_header.sam", "sam")
+        alignments = [a for a in alignments if a.coordinates is not None]
+        stream = StringIO()
+        Align.write(alignments, stream, "sam")
+        stream.seek(0)
+        output = [line for line in stream if not line.startswith("@")]
+        self.assertEqual(len(output), len(lines))
+        tlens = [line.split("\t")[8] for line in lines]
+        self.assertEqual([line.split("\t")[8] for line in output], tlens)
+        self.assertIn("-219", tlens)
+        # alignments without a tlen attribute have TLEN 0
+        alignment = alignments[-1]
+        self.assertEqual(alignment.tlen, -219)
+        del alignment.tlen
+        line = alignment.format("sam")
+        self.assertEqual(line.split("\t")[8], "0")
+
     def test_sam1(self):
         alignments = Align.parse("SamBam/sam1.sam", "sam")
         self.assertEqual(len(alignments.targets), 1)
@@ -6,8 +6,11 @@
 """Unit tests for the Bio.Phylo.Consensus module."""
 
 import os
+import pickle
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 
 # from io import StringIO
 from Bio import Align
@@ -48,6 +51,21 @@ class BitStringTest(unittest.TestCase):
         self.assertTrue(bitstr2.iscompatible(bitstr4))
         self.assertTrue(bitstr3.iscompatible(bitstr4))
 
+    def test_bitstring_int(self):
+        bitstr = _BitString("0011000")
+        self.assertEqual(int(bitstr), 0b0011000)
+        self.assertEqual(len(bitstr), 7)
+        self.assertEqual(str(bitstr), "0011000")
+        self.assertEqual(str(bitstr | _BitString("0000001")), "0011001")
+        self.assertEqual(bitstr.count("1"), 2)
+        self.assertEqual(bitstr.count("0"), 5)
+        self.assertEqual(bitstr.index_one(), [2, 3])
+        self.assertEqual(bitstr.index_zero(), [0, 1, 4, 5, 6])
+        self.assertEqual(_BitString.from_bool([False, True, True]), _BitString("011"))
+        copied = pickle.loads(pickle.dumps(bitstr))
+        self.assertEqual(copied, bitstr)
+        self.assertEqual(str(copied), "0011000")
+
 
 class ConsensusTest(unittest.TestCase):
     """Test for consensus methods."""
@@ -66,6 +84,24 @@ class ConsensusTest(unittest.TestCase):
         self.assertEqual(bitstr_counts[_BitString("00011")][0], 1)
         self.assertEqual(bitstr_counts[_BitString("01111")][0], 1)
 
+    def test_count_clades_terminal_order(self):
+        # The same topologies written with their terminals in another order
+        # must give the same clade counts.
+        trees = [
+            Phylo.read(StringIO("((A,B),(C,(D,E)));"), "newick"),
+            Phylo.read(StringIO("(((E,D),C),(B,A));"), "newick"),
+            Phylo.read(StringIO("((C,(E,D)),(A,B));"), "newick"),
+        ]
+        bitstr_counts, len_trees = Consensus._count_clades(trees)
+        self.assertEqual(len_trees, 3)
+        self.assertEqual(len(bitstr_counts), 4)
+        self.assertEqual(bitstr_counts[_BitString("11111")][0], 3)
+        self.assertEqual(bitstr_counts[_BitString("11000")][0], 3)
+        self.assertEqual(bitstr_counts[_BitString("00111")][0], 3)
+        self.assertEqual(bitstr_counts[_BitString("00011")][0], 3)
+        consensus_tree = Consensus.strict_consensus(trees)
+        self.assertTrue(Consensus._equal_topology(consensus_tree, trees[0]))
+
     def test_strict_consensus(self):
         ref_trees = list(Phylo.parse("./TreeConstruction/strict_refs.tre", "newick"))
         # three trees
@@ -157,6 +193,44 @@ class BootstrapTest(unittest.TestCase):
         self.assertEqual(len(trees), 100)
         self.assertIsInstance(trees[0], BaseTree.Tree)
 
+    def test_bootstrap_trees_seed(self):
+        calculator = DistanceCalculator("blosum62")
+        constructor = DistanceTreeConstructor(calculator)
+
+        def newick(trees):
+            return [tree.format("newick") for tree in trees]
+
+        expected = newick(
+            Consensus.bootstrap_trees(self.alignment, 10, constructor, seed=7)
+        )
+        trees = Consensus.bootstrap_trees(self.alignment, 10, constructor, seed=7)
+        self.assertEqual(newick(trees), expected)
+        # a different seed gives different replicates
+        trees = Consensus.bootstrap_trees(self.alignment, 10, constructor, seed=8)
+        self.assertNotEqual(newick(trees), expected)
+        # building the trees in parallel gives the same trees, but possibly
+        # in a different order
+        trees = Consensus.bootstrap_trees(
+            self.alignment, 10, constructor, workers=2, seed=7
+        )
+        self.assertEqual(sorted(newick(trees)), sorted(expected))
+
+    def test_bootstrap_trees_parallel(self):
+        calculator = DistanceCalculator("blosum62")
+        constructor = DistanceTreeConstructor(calculator)
+
+        def newick(trees):
+            return sorted(tree.format("newick") for tree in trees)
+
+        expected = newick(Consensus.bootstrap_trees(self.msa, 20, constructor, seed=11))
+        trees = Consensus.bootstrap_trees(self.msa, 20, constructor, workers=2, seed=11)
+        self.assertEqual(newick(trees), expected)
+        with ThreadPoolExecutor(2) as executor:
+            trees = Consensus.bootstrap_trees(
+                self.alignment, 20, constructor, executor=executor, seed=11
+            )
+            self.assertEqual(newick(trees), expected)
+
     def test_bootstrap_consensus_msa(self):
         calculator = DistanceCalculator("blosum62")
         constructor = DistanceTreeConstructor(calculator, "nj")
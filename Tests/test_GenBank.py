@@ -25,6 +25,8 @@ from Bio import GenBank
 from Bio import SeqIO
 from Bio.Seq import Seq
 from Bio.Seq import UndefinedSequenceError
+from Bio.SeqFeature import SeqFeature
+from Bio.SeqFeature import SimpleLocation
 from Bio.SeqRecord import SeqRecord
 
 
@@ -8623,6 +8625,73 @@ class GenBankScannerTests(unittest.TestCase):
         self.assertEqual(len(l_embl_r[0].features), 29)
 
 
+class TestLazyFeatures(unittest.TestCase):
+    """Test lazy feature parsing and filtering by feature type."""
+
+    def compare_features(self, filename, fmt):
+        records = list(SeqIO.parse(filename, fmt))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", BiopythonParserWarning)
+            lazy_records = list(SeqIO.parse(filename, fmt, lazy_features=True))
+            self.assertEqual(len(lazy_records), len(records))
+            for record, lazy_record in zip(records, lazy_records):
+                self.assertEqual(record.id, lazy_record.id)
+                self.assertEqual(record.seq, lazy_record.seq)
+                self.assertEqual(len(lazy_record.features), len(record.features))
+                for feature, lazy_feature in zip(record.features, lazy_record.features):
+                    self.assertEqual(feature, lazy_feature)
+                    self.assertEqual(str(feature.location), str(lazy_feature.location))
+                    self.assertEqual(feature.qualifiers, lazy_feature.qualifiers)
+            types = {"CDS", "gene"}
+            for lazy in (False, True):
+                filtered_records = SeqIO.parse(
+                    filename, fmt, lazy_features=lazy, feature_types=types
+                )
+                for record, filtered_record in zip(records, filtered_records):
+                    features = [f for f in record.features if f.type in types]
+                    self.assertEqual(filtered_record.features, features)
+
+    def test_genbank(self):
+        self.compare_features("GenBank/NC_005816.gb", "gb")
+        self.compare_features("GenBank/cor6_6.gb", "gb")
+        # circular record with features spanning the origin
+        self.compare_features("GenBank/addgene-plasmid-39296-sequence-49545.gbk", "gb")
+
+    def test_embl(self):
+        self.compare_features("EMBL/AE017046.embl", "embl")
+        self.compare_features("EMBL/epo_prt_selection.embl", "embl")
+
+    def test_parse_on_access(self):
+        record = SeqIO.read("GenBank/NC_005816.gb", "gb", lazy_features=True)
+        features = record.features
+        self.assertEqual(len(features), 41)
+        self.assertNotIsInstance(features._items[3], SeqFeature)
+        feature = features[3]
+        self.assertEqual(feature.type, "CDS")
+        self.assertEqual(feature.qualifiers["locus_tag"], ["YP_pPCP01"])
+        self.assertIs(features._items[3], feature)
+        self.assertIs(features[3], feature)
+        self.assertNotIsInstance(features._items[4], SeqFeature)
+        # slices and copies are ordinary lists
+        self.assertIsInstance(features[:2], list)
+        self.assertEqual(len(record[:1000].features), 3)
+        # the features can be modified like a list
+        feature = SeqFeature(SimpleLocation(0, 10), type="misc_feature")
+        features.append(feature)
+        self.assertIs(features[-1], feature)
+        del features[0]
+        self.assertEqual(len(features), 41)
+        self.assertEqual(features[0].type, "repeat_region")
+        types = sorted(f.type for f in features)
+        features.sort(key=lambda f: f.type)
+        self.assertEqual([f.type for f in features], types)
+
+    def test_only_sequence(self):
+        record = SeqIO.read("GenBank/NC_005816.gb", "gb", feature_types=())
+        self.assertEqual(record.features, [])
+        self.assertEqual(len(record.seq), 9609)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
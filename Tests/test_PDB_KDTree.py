@@ -65,6 +65,65 @@ class NeighborTest(unittest.TestCase):
         self.assertEqual([], ns.search(x, 5.0, "M"))
         self.assertEqual([], ns.search(x, 5.0, "S"))
 
+    def test_contacts(self):
+        """NeighborSearch: Find contacts as index arrays."""
+
+        class RandomAtom:
+            def __init__(self):
+                self.coord = 100 * random(3)
+
+            def get_coord(self):
+                return self.coord
+
+        atoms = [RandomAtom() for j in range(500)]
+        ns = NeighborSearch(atoms)
+        pairs = ns.contacts(10.0)
+        self.assertEqual(pairs.shape[1], 2)
+        expected = {
+            tuple(sorted((atoms.index(a1), atoms.index(a2))))
+            for a1, a2 in ns.search_all(10.0)
+        }
+        self.assertEqual({(int(i), int(j)) for i, j in pairs}, expected)
+        others = [RandomAtom() for j in range(50)]
+        pairs = ns.contacts(10.0, others)
+        expected = set()
+        for i, a1 in enumerate(others):
+            for j, a2 in enumerate(atoms):
+                v = a1.coord - a2.coord
+                if sqrt(dot(v, v)) <= 10.0:
+                    expected.add((i, j))
+        self.assertEqual({(int(i), int(j)) for i, j in pairs}, expected)
+        self.assertEqual(
+            ns.contacts(10.0, array([[500.0, 500.0, 500.0]])).shape, (0, 2)
+        )
+        with self.assertRaises(ValueError):
+            ns.contacts(10.0, array([1.0, 2.0, 3.0]))
+
+    def test_update(self):
+        """NeighborSearch: Update the coordinates of the atoms."""
+
+        class RandomAtom:
+            def __init__(self):
+                self.coord = 100 * random(3)
+
+            def get_coord(self):
+                return self.coord
+
+        atoms = [RandomAtom() for j in range(200)]
+        ns = NeighborSearch(atoms)
+        for atom in atoms:
+            atom.coord = atom.coord + 500
+        self.assertEqual([], ns.search(array([550, 550, 550]), 30.0))
+        ns.update()
+        self.assertNotEqual([], ns.search(array([550, 550, 550]), 30.0))
+        self.assertEqual(
+            len(ns.search_all(5.0)), len(NeighborSearch(atoms).search_all(5.0))
+        )
+        ns.update(array([atom.coord - 500 for atom in atoms]))
+        self.assertEqual([], ns.search(array([550, 550, 550]), 30.0))
+        with self.assertRaises(ValueError):
+            ns.update(random((10, 3)))
+
 
 class KDTreeTest(unittest.TestCase):
     nr_points = 5000  # number of points used in test
@@ -186,6 +245,33 @@ class KDTreeTest(unittest.TestCase):
                     self.assertEqual(neighbor1.index2, neighbor2.index2)
                     self.assertAlmostEqual(neighbor1.radius, neighbor2.radius)
 
+    def test_KDTree_indices(self):
+        """Test the searches returning index pairs, and updating the tree."""
+        bucket_size = self.bucket_size
+        nr_points = self.nr_points
+        radius = self.radius
+        coords = random((nr_points, 3))
+        kdt = kdtrees.KDTree(coords, bucket_size)
+        for i in range(3):
+            pairs = memoryview(kdt.neighbor_search_indices(radius)).cast("n")
+            pairs = set(zip(pairs[::2], pairs[1::2]))
+            neighbors = kdt.neighbor_search(radius)
+            expected = {(neighbor.index1, neighbor.index2) for neighbor in neighbors}
+            self.assertEqual(pairs, expected)
+            centers = random((10, 3))
+            pairs = memoryview(kdt.search_indices(centers, radius)).cast("n")
+            pairs = set(zip(pairs[::2], pairs[1::2]))
+            expected = set()
+            for j, center in enumerate(centers):
+                for point in kdt.search(center, radius):
+                    expected.add((j, point.index))
+            self.assertEqual(pairs, expected)
+            kdt.update(random((nr_points, 3)))
+        with self.assertRaises(ValueError):
+            kdt.update(random((nr_points + 1, 3)))
+        with self.assertRaises(ValueError):
+            kdt.update(random((nr_points, 3)) * 1e7)
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
@@ -13,6 +13,7 @@ import unittest
 import warnings
 
 from Bio.PDB import PDBParser
+from Bio.PDB import SASA
 from Bio.PDB.SASA import ShrakeRupley
 
 DATADIR = pathlib.Path(__file__).parent / "PDB"
@@ -104,6 +105,33 @@ class TestShrakeRupley(unittest.TestCase):
             atom_sum = sum(a.sasa for a in c.get_atoms())
             self.assertAlmostEqual(atom_sum, c.sasa, places=2)
 
+    def test_workers(self):
+        """Run Shrake-Rupley in a pool of processes."""
+        m = copy.deepcopy(self.model)  # modifies atom.sasa
+
+        sasa = ShrakeRupley()
+        sasa.compute(m)
+        expected = [a.sasa for a in m.get_atoms()]
+        sasa.compute(m, workers=2)
+        result = [a.sasa for a in m.get_atoms()]
+        self.assertEqual(result, expected)
+
+    def test_small_blocks(self):
+        """Run Shrake-Rupley on many small blocks of atoms."""
+        m = copy.deepcopy(self.model)  # modifies atom.sasa
+
+        sasa = ShrakeRupley()
+        sasa.compute(m)
+        expected = [a.sasa for a in m.get_atoms()]
+        block_size = SASA._BLOCK_SIZE
+        try:
+            SASA._BLOCK_SIZE = 1000
+            sasa.compute(m)
+        finally:
+            SASA._BLOCK_SIZE = block_size
+        result = [a.sasa for a in m.get_atoms()]
+        self.assertEqual(result, expected)
+
     # Exceptions
     def test_fail_probe_radius(self):
         """Raise exception on bad probe_radius parameter."""
@@ -13,6 +13,7 @@
 
 """Generic unit tests for the SMCRA classes of the Bio.PDB module."""
 
+import pickle
 import unittest
 import warnings
 from copy import deepcopy
@@ -593,6 +594,181 @@ class CenterOfMassTests(unittest.TestCase):
             s.center_of_mass()
 
 
+class ColumnarTests(unittest.TestCase):
+    """Tests storing the atoms of a structure in NumPy arrays."""
+
+    def setUp(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            self.s = PDBParser(PERMISSIVE=True).get_structure(
+                "X", "PDB/a_structure.pdb"
+            )
+        # reference copy of the structure, without columns
+        self.ref = deepcopy(self.s)
+        self.columns = self.s.make_columnar()
+
+    def get_coords(self, entity):
+        """Coordinates of all atoms, including alternative locations."""
+        return np.array(
+            [
+                atom.coord
+                for chain in entity.get_chains()
+                for residue in chain.get_unpacked_list()
+                for atom in residue.get_unpacked_list()
+            ]
+        )
+
+    def test_columns(self):
+        """Test the columns and atom views."""
+        columns = self.columns
+        atoms = columns.atoms
+        self.assertEqual(len(columns), len(atoms))
+        self.assertEqual(columns.coord.shape, (len(atoms), 3))
+        self.assertTrue(np.allclose(self.get_coords(self.s), columns.coord))
+        for i, atom in enumerate(atoms):
+            self.assertTrue(np.shares_memory(atom.coord, columns.coord))
+            self.assertEqual(columns.element[i], atom.element)
+            self.assertEqual(columns.bfactor[i], atom.bfactor)
+            residue = columns.residues[columns.residue_index[i]]
+            self.assertIs(atom.get_parent(), residue)
+            self.assertIs(residue.get_parent(), columns.chains[columns.chain_index[i]])
+        self.assertEqual(len(columns.models), 2)
+        chain = self.s[1]["A"]
+        self.assertEqual(columns.index(self.s), slice(0, len(atoms)))
+        self.assertEqual(
+            columns.select(columns.index(chain)),
+            list(columns.select(columns.chain_index == 1)),
+        )
+        atom = columns.atoms[5]
+        self.assertEqual(columns.index(atom), 5)
+        atom.set_coord(np.array((1.0, 2.0, 3.0)))
+        self.assertEqual(columns.coord[5].tolist(), [1.0, 2.0, 3.0])
+        columns.coord[5] = (4.0, 5.0, 6.0)
+        self.assertEqual(atom.coord.tolist(), [4.0, 5.0, 6.0])
+        hits = columns.select(columns.within(atom.coord, 3.0))
+        self.assertIn(atom, hits)
+        for other in atoms:
+            self.assertEqual(other in hits, other - atom <= 3.0)
+
+    def test_coord_assignment(self):
+        """Assigning to Atom.coord updates the columns."""
+        columns = self.columns
+        atom = columns.atoms[5]
+        atom.coord = np.array((1.0, 2.0, 3.0))
+        self.assertEqual(columns.coord[5].tolist(), [1.0, 2.0, 3.0])
+        self.assertTrue(np.shares_memory(atom.coord, columns.coord))
+        self.assertIn(5, columns.within(np.array((1.0, 2.0, 3.0)), 0.1))
+        # copies and pickles no longer use the columns
+        for other in (atom.copy(), pickle.loads(pickle.dumps(atom))):
+            other.coord = np.array((4.0, 5.0, 6.0))
+            self.assertEqual(columns.coord[5].tolist(), [1.0, 2.0, 3.0])
+            self.assertEqual(other.coord.tolist(), [4.0, 5.0, 6.0])
+
+    def test_internal_coords(self):
+        """Internal coordinates replace the coordinates by their own views."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", PDBConstructionWarning)
+            s = PDBParser(PERMISSIVE=True).get_structure("X", "PDB/1A8O.pdb")
+        ref = deepcopy(s)
+        columns = s.make_columnar()
+        chain = s[0]["A"]
+        chain.atom_to_internal_coordinates()
+        with self.assertRaises(ValueError):
+            columns.index(chain)
+        chain.internal_to_atom_coordinates()
+        self.assertTrue(
+            np.allclose(self.get_coords(s), self.get_coords(ref), atol=1e-3)
+        )
+
+    def test_transform(self):
+        """Transform entities with and without columns."""
+        rotation = rotmat(Vector(1, 3, 5), Vector(1, 0, 0))
+        translation = np.array((2.4, 0, 1), "f")
+        for s in (self.s, self.ref):
+            chain = s[1]["A"]
+            chain.transform(rotation, translation)
+            s.transform(rotation, translation)
+            chain.child_list[0].transform(rotation, translation)
+        self.assertTrue(
+            np.allclose(self.get_coords(self.s), self.get_coords(self.ref), atol=1e-3)
+        )
+        self.assertTrue(np.allclose(self.get_coords(self.s), self.columns.coord))
+
+    def test_nested(self):
+        """Making a child columnar stops the parents from using the columns."""
+        chain = self.s[1]["A"]
+        columns = chain.make_columnar()
+        self.assertEqual(columns.index(chain), slice(0, len(columns)))
+        for entity in (self.s[1], self.s):
+            with self.assertRaises(ValueError):
+                self.columns.index(entity)
+        # transform and center_of_mass use the atoms of the chain again
+        translation = np.array((1.0, 0.0, 0.0))
+        self.s.transform(np.identity(3), translation)
+        self.ref.transform(np.identity(3), translation)
+        self.assertTrue(
+            np.allclose(self.get_coords(self.s), self.get_coords(self.ref), atol=1e-3)
+        )
+        coords = [
+            atom.coord
+            for residue in chain.get_unpacked_list()
+            for atom in residue.get_unpacked_list()
+        ]
+        self.assertTrue(np.allclose(coords, columns.coord))
+        self.assertTrue(
+            np.allclose(
+                self.s.center_of_mass(), self.ref.center_of_mass(), equal_nan=True
+            )
+        )
+        # the columns keep the float32 type of the parsed coordinates
+        self.assertEqual(columns.coord.dtype, np.float32)
+
+    def test_center_of_mass(self):
+        """Calculate center of mass with and without columns."""
+        for geometric in (False, True):
+            for s, ref in ((self.s, self.ref), (self.s[1]["A"], self.ref[1]["A"])):
+                self.assertTrue(
+                    np.allclose(
+                        s.center_of_mass(geometric=geometric),
+                        ref.center_of_mass(geometric=geometric),
+                        equal_nan=True,
+                    )
+                )
+
+    def test_changes(self):
+        """Adding or removing atoms stops using the columns."""
+        columns = self.columns
+        chain = self.s[1]["A"]
+        residue = chain.child_list[1]
+        other = chain.child_list[2]
+        atom = residue.child_list[0]
+        residue.detach_child(atom.id)
+        for entity in (residue, chain, self.s[1], self.s):
+            with self.assertRaises(ValueError):
+                columns.index(entity)
+        self.assertIsNotNone(columns.index(other))
+        rotation = rotmat(Vector(1, 3, 5), Vector(1, 0, 0))
+        translation = np.array((2.4, 0, 1), "f")
+        old = atom.coord.copy()
+        self.s.transform(rotation, translation)
+        self.assertTrue(np.allclose(atom.coord, old))
+        self.ref[1]["A"].child_list[1].detach_child(atom.id)
+        self.ref.transform(rotation, translation)
+        self.assertTrue(
+            np.allclose(self.get_coords(self.s), self.get_coords(self.ref), atol=1e-3)
+        )
+
+    def test_copy(self):
+        """Copies of a structure do not share the columns."""
+        for s in (deepcopy(self.s), self.s.copy()):
+            atom = next(s.get_atoms())
+            self.assertFalse(np.shares_memory(atom.coord, self.columns.coord))
+            s.transform(np.identity(3), np.array((1.0, 0.0, 0.0)))
+            self.assertTrue(
+                np.allclose(self.get_coords(s), self.get_coords(self.s) + (1, 0, 0))
+            )
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -27,6 +27,7 @@ from Bio.Restriction import NdeI
 from Bio.Restriction import NonComm
 from Bio.Restriction import Restriction
 from Bio.Restriction import RestrictionBatch
+from Bio.Restriction import SiteMatcher
 from Bio.Restriction import SmaI
 from Bio.Restriction import SnaI
 from Bio.Restriction import SphI
@@ -524,6 +525,61 @@ class RestrictionBatches(unittest.TestCase):
         search = seq / NonComm
         self.assertEqual(search[McrI], [28])
 
+    def test_site_matcher(self):
+        """Test searching all enzymes at once with a SiteMatcher."""
+        seq = Seq(
+            "GAATTCAAGGATCCAAAAAAAAGAGACCAAAAAAAAAGGTCTCAAAAAAAAAAGACTTAGTCNAA"
+            "CCATGGAATTCGCGGCCGCAAAGTCGACNNNGCTAGCTTTTCTCGAGrycGATATCaaatttaaaG"
+        )
+        matcher = SiteMatcher(AllEnzymes)
+        for linear in (True, False):
+            fseq = FormattedSeq(seq, linear)
+            results = matcher.search(fseq)
+            self.assertEqual(len(results), len(AllEnzymes))
+            for enzyme in AllEnzymes:
+                self.assertEqual(results[enzyme], enzyme.search(fseq), msg=enzyme)
+            # the search method of large batches uses a SiteMatcher as well
+            self.assertEqual(
+                AllEnzymes.search(seq, linear=linear),
+                {enzyme: enzyme.search(fseq) for enzyme in AllEnzymes},
+            )
+        # sites spanning the end of a circular sequence
+        seq = Seq("AATTCAAAAAAAAAAAAAAAAAAGGATCCAAAAAAAAAAAAAAAAG")
+        matcher = SiteMatcher([EcoRI, BamHI, BsaI, EcoRV])
+        results = matcher.search(seq, linear=False)
+        self.assertEqual(results, {EcoRI: [1], BamHI: [25], BsaI: [], EcoRV: []})
+        self.assertEqual(
+            matcher.search(seq), {EcoRI: [], BamHI: [25], BsaI: [], EcoRV: []}
+        )
+
+    def test_lazy_enzymes(self):
+        """Test the enzymes and batches created on first use."""
+        import Bio.Restriction
+
+        self.assertIs(Restriction.EcoRI, EcoRI)
+        self.assertIs(Bio.Restriction.AllEnzymes, Restriction.AllEnzymes)
+        self.assertIs(Restriction.AllEnzymes, AllEnzymes)
+        self.assertIn("Zsp2I", Restriction.__all__)
+        self.assertIn("Zsp2I", dir(Restriction))
+        self.assertIn("Zsp2I", dir(Bio.Restriction))
+        self.assertIs(Bio.Restriction.Zsp2I, Restriction.Zsp2I)
+        self.assertIn(Restriction.Zsp2I, AllEnzymes)
+        self.assertEqual(len(AllEnzymes), len(CommOnly) + len(NonComm))
+        self.assertEqual(CommOnly | NonComm, AllEnzymes)
+        for module, name in (
+            (Bio.Restriction, "EcoRJ"),
+            (Bio.Restriction, "Palindromic"),
+            (Restriction, "EcoRJ"),
+        ):
+            with self.assertRaises(AttributeError):
+                getattr(module, name)
+        rb = RestrictionBatch(["EcoRI", "Zsp2I"])
+        self.assertEqual(rb, {EcoRI, Restriction.Zsp2I})
+        self.assertTrue(rb.is_restriction("EcoRV"))
+        self.assertFalse(rb.is_restriction("EcoRJ"))
+        with self.assertRaises(ValueError):
+            rb.format("EcoRJ")
+
     def test_analysis_restrictions(self):
         """Test Fancier restriction analysis."""
         new_seq = Seq("TTCAAAAAAAAAAAAAAAAAAAAAAAAAAAAGAA")
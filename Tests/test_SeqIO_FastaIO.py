@@ -5,12 +5,19 @@
 # as part of this package.
 """Tests for Bio.SeqIO.FastaIO module."""
 
+import os
+import pickle
+import re
+import tempfile
 import unittest
 from io import StringIO
 
+from Bio import bgzf
 from Bio import SeqIO
+from Bio.SeqIO.FastaIO import FaidxReader
 from Bio.SeqIO.FastaIO import FastaTwoLineParser
 from Bio.SeqIO.FastaIO import SimpleFastaParser
+from Bio.SeqIO.FastaIO import write_faidx
 
 from Bio import BiopythonDeprecationWarning
 
@@ -232,6 +239,151 @@ class TestFastaWithComments(unittest.TestCase):
             record = SeqIO.read("Fasta/aster_blast.pro", "fasta")
 
 
+class TestFaidx(unittest.TestCase):
+    """Test random access to FASTA files using a .fai index."""
+
+    data = """\
+>one first sequence
+ACGTACGTAC
+GTACGTACGT
+ACG
+>two
+TTTTTGGGGG
+>three
+
+>four
+aaccggttaa
+cc
+"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.sequences = {
+            title.split()[0]: seq
+            for title, seq in SimpleFastaParser(StringIO(self.data))
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, data, compressed=False):
+        filename = os.path.join(self.directory.name, "test.fa")
+        if compressed:
+            filename += ".gz"
+            with bgzf.BgzfWriter(filename) as stream:
+                stream.write(data.encode())
+        else:
+            with open(filename, "wb") as stream:
+                stream.write(data.encode())
+        return filename
+
+    def check(self, filename, mmap=False):
+        with FaidxReader(filename, mmap=mmap) as fasta:
+            self.assertEqual(list(fasta), ["one", "two", "three", "four"])
+            self.assertEqual(len(fasta), 4)
+            self.assertIn("two", fasta)
+            self.assertNotIn("five", fasta)
+            self.assertEqual(
+                fasta.lengths(), {"one": 23, "two": 10, "three": 0, "four": 12}
+            )
+            for name, seq in self.sequences.items():
+                record = fasta[name]
+                self.assertEqual(record.id, name)
+                self.assertEqual(len(record.seq), len(seq))
+                self.assertEqual(record.seq, seq)
+                for start in range(len(seq) + 1):
+                    for end in range(start, len(seq) + 1):
+                        self.assertEqual(fasta.fetch(name, start, end), seq[start:end])
+                    self.assertEqual(record.seq[start::3], seq[start::3])
+                    self.assertEqual(record.seq[start::-2], seq[start::-2])
+            self.assertEqual(fasta["one"].seq[-1], "G")
+            self.assertEqual(fasta.fetch("one", 8, 12)[1:3], "CG")
+            self.assertRaises(KeyError, fasta.fetch, "five")
+            seq = fasta["one"].seq
+        if mmap:
+            # the memory-mapped sequence data remain available
+            self.assertEqual(seq[:5], "ACGTA")
+            return
+        with self.assertRaises(ValueError) as cm:
+            seq[:5]
+        self.assertEqual(str(cm.exception), "cannot retrieve sequence: file is closed")
+
+    def test_plain(self):
+        # the last line does not need to end with a newline
+        filename = self.write(self.data.rstrip())
+        self.assertEqual(write_faidx(filename), 4)
+        with open(filename + ".fai") as stream:
+            self.assertEqual(
+                stream.read(),
+                """\
+one\t23\t20\t10\t11
+two\t10\t51\t10\t11
+three\t0\t69\t0\t0
+four\t12\t76\t10\t11
+""",
+            )
+        self.check(filename)
+
+    def test_crlf(self):
+        filename = self.write(self.data.replace("\n", "\r\n"))
+        self.check(filename)
+        with open(filename + ".fai") as stream:
+            self.assertEqual(stream.readline(), "one\t23\t21\t10\t12\n")
+
+    def test_bgzf(self):
+        # rename the sequences to make the names unique
+        data = "".join(
+            re.sub(">([a-z]+)", rf">\g<1>{i}", self.data) for i in range(3000)
+        )
+        filename = self.write(data, compressed=True)
+        self.assertEqual(write_faidx(filename), 12000)
+        self.assertTrue(os.path.exists(filename + ".gzi"))
+        with FaidxReader(filename) as fasta:
+            self.assertEqual(fasta.fetch("two2999", 2, 8), "TTTGGG")
+            self.assertEqual(fasta["one1500"].seq, self.sequences["one"])
+        # without the .gzi file, the BGZF blocks are found by scanning
+        os.remove(filename + ".gzi")
+        with FaidxReader(filename) as fasta:
+            self.assertEqual(fasta.fetch("two2999", 2, 8), "TTTGGG")
+            self.assertEqual(fasta["one1500"].seq, self.sequences["one"])
+
+    def test_bgzf_small(self):
+        filename = self.write(self.data.replace("four", "four extra"), compressed=True)
+        # the .fai index is created automatically
+        self.check(filename)
+        self.assertTrue(os.path.exists(filename + ".fai"))
+
+    def test_mmap(self):
+        filename = self.write(self.data.rstrip())
+        self.check(filename, mmap=True)
+        os.remove(filename + ".fai")
+        filename = self.write(self.data.replace("\n", "\r\n"))
+        self.check(filename, mmap=True)
+        with FaidxReader(filename, mmap=True) as fasta:
+            seq = fasta["one"].seq
+            # slices do not read any data
+            region = seq[3:21][2:15]
+            self.assertEqual(region._data.start, 5)
+            self.assertEqual(len(region), 13)
+            self.assertEqual(region, self.sequences["one"][5:18])
+            self.assertEqual(region[::-1], self.sequences["one"][17:4:-1])
+            self.assertEqual(pickle.loads(pickle.dumps(region)), region)
+        filename = self.write(self.data, compressed=True)
+        self.assertRaises(ValueError, FaidxReader, filename, mmap=True)
+
+    def test_line_lengths(self):
+        filename = self.write(">one\nACGT\nACG\nACGT\n")
+        self.assertRaises(ValueError, write_faidx, filename)
+        filename = self.write(">one\nACGT\nACGTA\n")
+        self.assertRaises(ValueError, write_faidx, filename)
+        filename = self.write(">one\nACGT\n\nACGT\n")
+        self.assertRaises(ValueError, write_faidx, filename)
+        filename = self.write(">one\nACGT\nACGT\n\n>two\nAC\n")
+        self.assertEqual(write_faidx(filename), 2)
+        filename = self.write(">one\nACGT\n>one\nACGT\n")
+        self.assertRaises(ValueError, write_faidx, filename)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -10,6 +10,7 @@ import warnings
 from io import BytesIO
 from io import StringIO
 
+import numpy as np
 from test_SeqIO import SeqIOConverterTestBaseClass
 from test_SeqIO import SeqIOTestBaseClass
 
@@ -349,6 +350,157 @@ BB!!!<!!21!=9,!'!!!>!)>9!!))!5!.!!).!=+9!+!!!%!!('
         )
 
 
+class TestFastqArray(unittest.TestCase):
+    """Test the FASTQ parsers storing the qualities as NumPy arrays."""
+
+    def compare(self, filename, fmt, iterator, chunk_size):
+        records1 = list(SeqIO.parse(filename, fmt))
+        with open(filename, "rb") as stream:
+            records2 = list(iterator(stream, chunk_size=chunk_size))
+        self.assertEqual(len(records1), len(records2))
+        for record1, record2 in zip(records1, records2):
+            self.assertEqual(record1.id, record2.id)
+            self.assertEqual(record1.description, record2.description)
+            self.assertEqual(record1.seq, record2.seq)
+            qualities = record2.letter_annotations["phred_quality"]
+            self.assertEqual(qualities.dtype, np.uint8)
+            self.assertEqual(
+                record1.letter_annotations["phred_quality"], qualities.tolist()
+            )
+        # the writer uses the arrays directly
+        output1 = StringIO()
+        SeqIO.write(records1, output1, fmt)
+        output2 = StringIO()
+        SeqIO.write(records2, output2, fmt)
+        self.assertEqual(output1.getvalue(), output2.getvalue())
+
+    def test_sanger(self):
+        for filename in os.listdir("Quality"):
+            if filename.endswith("sanger.fastq") or filename in (
+                "example.fastq",
+                "example_dos.fastq",
+                "tricky.fastq",
+                "sanger_93.fastq",
+                "sanger_faked.fastq",
+                "zero_length.fastq",
+            ):
+                path = os.path.join("Quality", filename)
+                for chunk_size in (7, 1048576):
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore", BiopythonWarning)
+                        self.compare(
+                            path,
+                            "fastq",
+                            QualityIO.FastqPhredArrayIterator,
+                            chunk_size,
+                        )
+
+    def test_illumina(self):
+        for filename in os.listdir("Quality"):
+            if filename.endswith("illumina.fastq"):
+                path = os.path.join("Quality", filename)
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", BiopythonWarning)
+                    self.compare(
+                        path,
+                        "fastq-illumina",
+                        QualityIO.FastqIlluminaArrayIterator,
+                        100,
+                    )
+
+    def test_errors(self):
+        tests = [
+            ("Quality/error_diff_ids.fastq", 2),
+            ("Quality/error_no_qual.fastq", 0),
+            ("Quality/error_long_qual.fastq", 3),
+            ("Quality/error_short_qual.fastq", 2),
+            ("Quality/error_double_seq.fastq", 3),
+            ("Quality/error_double_qual.fastq", 2),
+            ("Quality/error_tabs.fastq", 0),
+            ("Quality/error_spaces.fastq", 0),
+            ("Quality/error_trunc_in_title.fastq", 4),
+            ("Quality/error_trunc_in_seq.fastq", 4),
+            ("Quality/error_trunc_in_plus.fastq", 4),
+            ("Quality/error_trunc_in_qual.fastq", 4),
+            ("Quality/error_trunc_at_seq.fastq", 4),
+            ("Quality/error_trunc_at_plus.fastq", 4),
+            ("Quality/error_trunc_at_qual.fastq", 4),
+            ("Quality/error_qual_del.fastq", 3),
+            ("Quality/error_qual_space.fastq", 3),
+            ("Quality/error_qual_vtab.fastq", 0),
+            ("Quality/error_qual_escape.fastq", 4),
+            ("Quality/error_qual_unit_sep.fastq", 2),
+            ("Quality/error_qual_tab.fastq", 4),
+            ("Quality/error_qual_null.fastq", 0),
+        ]
+        for path, good_count in tests:
+            records = QualityIO.FastqPhredArrayIterator(path, chunk_size=50)
+            for i in range(good_count):
+                record = next(records)
+                self.assertIsInstance(record, SeqRecord)
+            self.assertRaises(ValueError, next, records)
+
+    def test_mixed_layout(self):
+        # a line-wrapped record, parsed line by line, followed by records of
+        # four lines each, which should be parsed in one go again
+        data = (
+            b"@wrapped\nACGT\nAC\n+\nIIII\nII\n"
+            b"@r1\nACGT\n+\nIIII\n@r2\nGGCC\n+\n@@II\n@r3\nTT\n+\nII\n"
+        )
+        expected = list(SeqIO.parse(StringIO(data.decode()), "fastq"))
+        for chunk_size in (1, 7, 1048576):
+            records = QualityIO.FastqPhredArrayIterator(
+                BytesIO(data), chunk_size=chunk_size
+            )
+            count = 0
+            for record, expected_record in zip(records, expected):
+                count += 1
+                self.assertEqual(record.id, expected_record.id)
+                self.assertEqual(record.seq, expected_record.seq)
+                qualities = record.letter_annotations["phred_quality"]
+                self.assertEqual(
+                    qualities.tolist(),
+                    expected_record.letter_annotations["phred_quality"],
+                )
+                # records parsed in one go are views on the chunk
+                self.assertEqual(
+                    qualities.base is records._qualities, record.id != "wrapped"
+                )
+            self.assertEqual(count, 4)
+
+    def test_add(self):
+        records = QualityIO.FastqPhredArrayIterator("Quality/example.fastq")
+        record1 = next(records)
+        record2 = next(records)
+        record = record1 + record2
+        self.assertEqual(len(record), 50)
+        self.assertEqual(
+            record.letter_annotations["phred_quality"].tolist(),
+            record1.letter_annotations["phred_quality"].tolist()
+            + record2.letter_annotations["phred_quality"].tolist(),
+        )
+
+    def test_add_mixed(self):
+        records = QualityIO.FastqPhredArrayIterator("Quality/example.fastq")
+        record1 = next(records)
+        record2 = next(SeqIO.parse("Quality/example.fastq", "fastq"))
+        qualities1 = record1.letter_annotations["phred_quality"].tolist()
+        qualities2 = record2.letter_annotations["phred_quality"]
+        self.assertIsInstance(qualities2, list)
+        record = record1 + record2
+        self.assertEqual(len(record), 50)
+        self.assertEqual(
+            record.letter_annotations["phred_quality"].tolist(),
+            qualities1 + qualities2,
+        )
+        record = record2 + record1
+        self.assertEqual(len(record), 50)
+        self.assertEqual(
+            record.letter_annotations["phred_quality"].tolist(),
+            qualities2 + qualities1,
+        )
+
+
 class TestReadWrite(unittest.TestCase):
     """Test can read and write back files."""
 
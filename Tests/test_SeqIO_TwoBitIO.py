@@ -1,11 +1,15 @@
 """Tests for SeqIO TwoBitIO module."""
 
+import pickle
 import unittest
+from io import BytesIO
 
 from Bio import SeqIO
 from Bio.Seq import MutableSeq
 from Bio.Seq import Seq
 from Bio.Seq import UndefinedSequenceError
+from Bio.SeqIO.TwoBitIO import PackedSequenceData
+from Bio.SeqIO.TwoBitIO import TwoBitIterator
 from Bio.SeqRecord import SeqRecord
 
 
@@ -62,6 +66,85 @@ class Parsing(unittest.TestCase):
             )
 
 
+class TestPackedSequenceData(unittest.TestCase):
+    """Test sequences stored as packed sequence data."""
+
+    def setUp(self):
+        path = "TwoBit/sequence.fa"
+        records = SeqIO.parse(path, "fasta")
+        self.records = list(records)
+
+    def check(self, seq1, seq2, step=41):
+        self.assertIsInstance(seq2._data, PackedSequenceData)
+        self.assertEqual(seq1, seq2)
+        self.assertEqual(seq1.upper(), seq2.upper())
+        self.assertEqual(seq1.lower(), seq2.lower())
+        self.assertEqual(seq1.complement(), seq2.complement())
+        self.assertEqual(seq1.reverse_complement(), seq2.reverse_complement())
+        self.assertIsInstance(seq2.reverse_complement()._data, PackedSequenceData)
+        n = len(seq1)
+        for i in range(0, n, step):
+            for j in range(i, n, step):
+                self.assertEqual(seq1[i:j], seq2[i:j])
+                self.assertEqual(seq1[j:i:-1], seq2[j:i:-1])
+                self.assertEqual(
+                    seq1[i:j].reverse_complement(), seq2[i:j].reverse_complement()
+                )
+                for letter in "ACGTNacgtn":
+                    self.assertEqual(seq1.count(letter, i, j), seq2.count(letter, i, j))
+        self.assertEqual(seq1[::3], seq2[::3])
+        self.assertEqual(seq1[::-2], seq2[::-2])
+        self.assertEqual(seq1.count("GC"), seq2.count("GC"))
+        self.assertEqual(seq1.count("X"), seq2.count("X"))
+
+    def test_twobit(self):
+        path = "TwoBit/sequence.littleendian.2bit"
+        with open(path, "rb") as stream:
+            records = TwoBitIterator(stream, packed=True)
+        # the sequence data are in memory, so the file can be closed
+        self.assertEqual(len(records), len(self.records))
+        for record1, record2 in zip(self.records, records):
+            self.assertEqual(record1.id, record2.id)
+            self.check(record1.seq, record2.seq)
+
+    def test_mmap(self):
+        path = "TwoBit/sequence.bigendian.2bit"
+        records = TwoBitIterator(path, mmap=True)
+        self.assertEqual(len(records), len(self.records))
+        for record1, record2 in zip(self.records, records):
+            self.assertEqual(record1.id, record2.id)
+            self.check(record1.seq, record2.seq)
+            # slices are pickled by their position in the mapped file
+            seq = record2.seq[3:-3]
+            seq = pickle.loads(pickle.dumps(seq))
+            self.assertEqual(seq, record1.seq[3:-3])
+            self.assertIsInstance(seq._data.packed.base, memoryview)
+        with open(path, "rb") as stream:
+            data = stream.read()
+        with self.assertRaises(ValueError) as cm:
+            TwoBitIterator(BytesIO(data), mmap=True)
+        self.assertEqual(str(cm.exception), "memory mapping requires a file on disk")
+
+    def test_sequence(self):
+        for record in self.records:
+            seq = Seq(PackedSequenceData(bytes(record.seq)))
+            self.check(record.seq, seq)
+        seq = Seq(PackedSequenceData("acgtNNNNgTaCnnAT"))
+        self.assertEqual(seq, "acgtNNNNgTaCnnAT")
+        self.assertEqual(len(seq._data.packed), 4)
+        self.assertEqual(seq._data.nBlocks.tolist(), [[4, 8], [12, 14]])
+        self.assertEqual(
+            seq._data.maskBlocks.tolist(), [[0, 4], [8, 9], [10, 11], [12, 14]]
+        )
+        self.assertEqual(seq[5:15].reverse_complement(), "TnnGtAcNNN")
+        self.assertEqual(Seq(PackedSequenceData("")), "")
+        with self.assertRaises(ValueError) as cm:
+            PackedSequenceData("ACGU")
+        self.assertEqual(
+            str(cm.exception), "letter 'U' cannot be stored in packed form"
+        )
+
+
 class TestComparisons(unittest.TestCase):
     """Test comparisons of sequences read from 2bit files to Seq and other objects."""
 
@@ -12,6 +12,8 @@ except ImportError:
 
 import gzip
 import os
+import pickle
+import shutil
 import tempfile
 import threading
 import unittest
@@ -451,8 +453,18 @@ class IndexDictTests(SeqRecordTestBaseClass, SeqIOTestBaseClass):
 
             rec_dict = SeqIO.index(filename, fmt)
             self.check_dict_methods(rec_dict, id_list, id_list, msg=msg)
+            keys = list(rec_dict)
             rec_dict.close()
 
+            # Using a memory-mapped index file, which is created first and
+            # then reused
+            for i in range(2):
+                rec_dict = SeqIO.index(filename, fmt, index_filename=self.index_tmp)
+                self.check_dict_methods(rec_dict, id_list, id_list, msg=msg)
+                self.assertEqual(list(rec_dict), keys, msg=msg)
+                rec_dict.close()
+            os.remove(self.index_tmp)
+
             if not sqlite3:
                 return
 
@@ -528,6 +540,16 @@ class IndexDictTests(SeqRecordTestBaseClass, SeqIOTestBaseClass):
             self.check_dict_methods(rec_dict, key_list, id_list, msg=msg)
             rec_dict.close()
 
+            rec_dict = SeqIO.index(
+                filename,
+                fmt,
+                key_function=self.add_prefix,
+                index_filename=self.index_tmp,
+            )
+            self.check_dict_methods(rec_dict, key_list, id_list, msg=msg)
+            rec_dict.close()
+            os.remove(self.index_tmp)
+
             if not sqlite3:
                 return
 
@@ -764,6 +786,111 @@ class IndexDictTests(SeqRecordTestBaseClass, SeqIOTestBaseClass):
                 self.get_raw_check(Path(filename2), fmt, comp)
 
 
+class IndexFileTests(unittest.TestCase):
+    """Tests for Bio.SeqIO.index() with an index file."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.index_filename = os.path.join(self.directory, "index.idx")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_reuse(self):
+        filename = os.path.join(self.directory, "example.fasta")
+        shutil.copyfile("Fasta/f002", filename)
+        records = SeqIO.index(filename, "fasta", index_filename=self.index_filename)
+        self.assertEqual(len(records), 3)
+        records.close()
+        mtime = os.stat(self.index_filename).st_mtime_ns
+        records = SeqIO.index(filename, "fasta", index_filename=self.index_filename)
+        self.assertEqual(
+            records.get_raw("gi|1348917|gb|G26685|G26685")[:29],
+            b">gi|1348917|gb|G26685|G26685 ",
+        )
+        records.close()
+        self.assertEqual(os.stat(self.index_filename).st_mtime_ns, mtime)
+        # the index file is rebuilt if the indexed file was modified
+        with open(filename, "a") as stream:
+            stream.write("\n>extra\nACGT\n")
+        records = SeqIO.index(filename, "fasta", index_filename=self.index_filename)
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records["extra"].seq, "ACGT")
+        records.close()
+        # the index file is written to a temporary file first
+        self.assertEqual(
+            sorted(os.listdir(self.directory)), ["example.fasta", "index.idx"]
+        )
+
+    def test_key_function(self):
+        filename = "GenBank/cor6_6.gb"
+        records = SeqIO.index(filename, "gb", index_filename=self.index_filename)
+        self.assertIn("X62281.1", records)
+        records.close()
+        # the index file is rebuilt if the key function changes
+        records = SeqIO.index(
+            filename, "gb", key_function=str.lower, index_filename=self.index_filename
+        )
+        self.assertEqual(records["x62281.1"].id, "X62281.1")
+        self.assertNotIn("X62281.1", records)
+        self.assertTrue(all(key == key.lower() for key in records))
+        records.close()
+        records = SeqIO.index(filename, "gb", index_filename=self.index_filename)
+        self.assertEqual(records["X62281.1"].id, "X62281.1")
+        records.close()
+        # an index file written by an earlier version is rebuilt
+        with open(self.index_filename, "r+b") as stream:
+            stream.write(b"BioIdx\x00\x01")
+        records = SeqIO.index(filename, "gb", index_filename=self.index_filename)
+        self.assertEqual(len(records), 6)
+        records.close()
+
+    def test_pickle(self):
+        filename = "GenBank/cor6_6.gb"
+        records = SeqIO.index(
+            filename, "gb", key_function=str.lower, index_filename=self.index_filename
+        )
+        data = pickle.dumps(records)
+        self.assertLess(len(data), 1000)
+        records2 = pickle.loads(data)
+        self.assertEqual(list(records), list(records2))
+        for key in records:
+            self.assertEqual(records[key].seq, records2[key].seq)
+        self.assertEqual(records2["x62281.1"].id, "X62281.1")
+        records.close()
+        records2.close()
+
+    def test_errors(self):
+        self.assertRaises(
+            ValueError,
+            SeqIO.index,
+            "Fasta/dups.fasta",
+            "fasta",
+            index_filename=self.index_filename,
+        )
+        self.assertFalse(os.path.exists(self.index_filename))
+        self.assertRaises(
+            TypeError,
+            SeqIO.index,
+            "Fasta/f002",
+            "fasta",
+            key_function=len,
+            index_filename=self.index_filename,
+        )
+        # do not overwrite a file which is not an index file
+        with open(self.index_filename, "w") as stream:
+            stream.write("This is not an index file" * 10)
+        self.assertRaises(
+            ValueError,
+            SeqIO.index,
+            "Fasta/f002",
+            "fasta",
+            index_filename=self.index_filename,
+        )
+        with open(self.index_filename) as stream:
+            self.assertEqual(stream.read(), "This is not an index file" * 10)
+
+
 class IndexOrderingSingleFile(unittest.TestCase):
     f = "GenBank/NC_000932.faa"
     ids = [r.id for r in SeqIO.parse(f, "fasta")]
@@ -0,0 +1,110 @@
+# Copyright 2026 by the Biopython contributors.  All rights reserved.
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Unit tests for the Bio.SeqIO.parse_parallel(...) function."""
+
+import os
+import tempfile
+import unittest
+from io import StringIO
+
+from Bio import SeqIO
+from Bio.SeqIO._parallel import _split_file
+from Bio.SeqUtils import gc_fraction
+
+
+def record_summary(record):
+    """Return the identifier, sequence, and annotations of a record."""
+    return record.id, str(record.seq), record.letter_annotations
+
+
+class TestParseParallel(unittest.TestCase):
+    def check(self, filename, fmt, chunk_size):
+        expected = [record_summary(record) for record in SeqIO.parse(filename, fmt)]
+        chunks = list(_split_file(filename, fmt, chunk_size))
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], os.path.getsize(filename))
+        for (start1, end1), (start2, end2) in zip(chunks, chunks[1:]):
+            self.assertEqual(end1, start2)
+            self.assertLess(start1, end1)
+        values = list(
+            SeqIO.parse_parallel(
+                filename, fmt, record_summary, workers=2, chunk_size=chunk_size
+            )
+        )
+        self.assertEqual(values, expected)
+        values = SeqIO.parse_parallel(
+            filename,
+            fmt,
+            record_summary,
+            workers=2,
+            ordered=False,
+            chunk_size=chunk_size,
+        )
+        self.assertEqual(sorted(values, key=expected.index), expected)
+        return len(chunks)
+
+    def test_fasta(self):
+        self.assertEqual(self.check("Fasta/f002", "fasta", 100), 3)
+        self.assertEqual(self.check("Fasta/f002", "fasta", 10000), 1)
+
+    def test_fastq(self):
+        # quality lines starting with "@" must not be taken as record starts,
+        # and the line-wrapped last record stays in the same chunk as the
+        # record before it
+        self.assertEqual(self.check("Quality/tricky.fastq", "fastq", 50), 3)
+        self.assertEqual(self.check("Quality/tricky.fastq", "fastq", 1), 3)
+        self.check("Quality/example_dos.fastq", "fastq", 1)
+        self.check("Quality/solexa_faked.fastq", "fastq-solexa", 1)
+
+    def test_genbank(self):
+        self.assertEqual(self.check("GenBank/cor6_6.gb", "genbank", 1000), 6)
+
+    def test_pir(self):
+        # the record marker is a regular expression for this format
+        self.assertEqual(self.check("NBRF/B_nuc.pir", "pir", 300), 444)
+        self.assertEqual(self.check("NBRF/Cw_prot.pir", "pir", 1000), 35)
+
+    def test_records(self):
+        filename = "GenBank/cor6_6.gb"
+        records = list(SeqIO.parse_parallel(filename, "gb", workers=2))
+        for record1, record2 in zip(records, SeqIO.parse(filename, "gb")):
+            self.assertEqual(record1.id, record2.id)
+            self.assertEqual(record1.seq, record2.seq)
+            self.assertEqual(len(record1.features), len(record2.features))
+        self.assertEqual(len(records), 6)
+
+    def test_large(self):
+        records = SeqIO.parse("Quality/example.fastq", "fastq")
+        stream = StringIO()
+        SeqIO.write(list(records) * 1000, stream, "fastq")
+        with tempfile.NamedTemporaryFile("w", suffix=".fastq", delete=False) as f:
+            f.write(stream.getvalue())
+        try:
+            values = list(
+                SeqIO.parse_parallel(
+                    f.name, "fastq", gc_fraction, workers=3, chunk_size=1000
+                )
+            )
+        finally:
+            os.remove(f.name)
+        self.assertEqual(len(values), 3000)
+        stream.seek(0)
+        self.assertEqual(
+            values, [gc_fraction(record) for record in SeqIO.parse(stream, "fastq")]
+        )
+
+    def test_errors(self):
+        self.assertRaises(ValueError, SeqIO.parse_parallel, "Fasta/f002", "sff")
+        self.assertRaises(ValueError, SeqIO.parse_parallel, "Fasta/f002", "uniprot-xml")
+        self.assertRaises(
+            ValueError, SeqIO.parse_parallel, "Fasta/f002", "fasta", chunk_size=0
+        )
+        with open("Fasta/f002") as handle:
+            self.assertRaises(TypeError, SeqIO.parse_parallel, handle, "fasta")
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -9,6 +9,7 @@ import os
 import unittest
 
 from Bio import SeqIO
+from Bio.Data import CodonTable
 from Bio.Seq import MutableSeq
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
@@ -23,6 +24,9 @@ from Bio.SeqUtils.CheckSum import gcg
 from Bio.SeqUtils.CheckSum import seguid
 from Bio.SeqUtils.lcc import lcc_mult
 from Bio.SeqUtils.lcc import lcc_simp
+from Bio.SeqUtils.orf import find_orfs
+from Bio.SeqUtils.orf import find_orfs_in_records
+from Bio.SeqUtils.orf import orf_features
 
 
 class SeqUtilsTests(unittest.TestCase):
@@ -427,6 +431,111 @@ TTT	0.886
         self.assertAlmostEqual(llc_lst[0], 0.9528, places=4)
 
 
+class OrfTests(unittest.TestCase):
+    def find_orfs_slowly(self, sequence, table, min_length):
+        """Find the ORFs of a linear sequence codon by codon."""
+        orfs = []
+        n = len(sequence)
+        strands = ((1, sequence), (-1, sequence.reverse_complement()))
+        for strand, strand_sequence in strands:
+            for frame in range(3):
+                start = None
+                for i in range(frame, n - 2, 3):
+                    codon = strand_sequence[i : i + 3]
+                    if codon in table.stop_codons:
+                        if start is not None and i + 3 - start >= min_length:
+                            if strand == 1:
+                                orfs.append([start, i + 3, 1])
+                            else:
+                                orfs.append([n - i - 3, n - start, -1])
+                        start = None
+                    elif start is None and codon in table.start_codons:
+                        start = i
+        return sorted(orfs)
+
+    def test_find_orfs(self):
+        record = SeqIO.read("GenBank/NC_005816.gb", "genbank")
+        table = CodonTable.unambiguous_dna_by_id[11]
+        orfs = find_orfs(record.seq, table=11, min_length=90)
+        self.assertEqual(orfs.tolist(), self.find_orfs_slowly(record.seq, table, 90))
+        self.assertEqual(len(orfs), 155)
+        # the same ORFs are found in the sequence as a string, and in RNA
+        self.assertEqual(find_orfs(str(record.seq), 11, 90).tolist(), orfs.tolist())
+        rna = record.seq.transcribe()
+        self.assertEqual(find_orfs(rna, 11, 90).tolist(), orfs.tolist())
+        # each annotated gene ends at the stop codon of an ORF, which may
+        # start further upstream
+        orfs = {
+            (end, strand) if strand == 1 else (start, strand): (start, end)
+            for start, end, strand in orfs.tolist()
+        }
+        features = [f for f in record.features if f.type == "CDS"]
+        self.assertEqual(len(features), 10)
+        for feature in features:
+            start = feature.location.start
+            end = feature.location.end
+            if feature.location.strand == 1:
+                orf_start, orf_end = orfs[(end, 1)]
+                self.assertLessEqual(orf_start, start)
+            else:
+                orf_start, orf_end = orfs[(start, -1)]
+                self.assertGreaterEqual(orf_end, end)
+
+    def test_circular(self):
+        record = SeqIO.read("GenBank/NC_005816.gb", "genbank")
+        n = len(record)
+        linear = find_orfs(record.seq, table=11, min_length=90).tolist()
+        circular = find_orfs(record.seq, table=11, min_length=90, circular=True)
+        circular = circular.tolist()
+        # rotating the sequence gives the same ORFs, rotated
+        shift = 1000
+        rotated = find_orfs(
+            record.seq[shift:] + record.seq[:shift],
+            table=11,
+            min_length=90,
+            circular=True,
+        )
+        rotated = sorted(
+            [(start + shift) % n, (start + shift) % n + end - start, strand]
+            for start, end, strand in rotated.tolist()
+        )
+        self.assertEqual(rotated, circular)
+        # ORFs not spanning the origin are also found in the linear sequence,
+        # where the ORFs spanning the origin are cut short
+        spanning = [orf for orf in circular if orf[1] > n]
+        self.assertEqual(
+            spanning, [[9264, 9687, -1], [9380, 9683, -1], [9520, 9643, -1]]
+        )
+        for orf in circular:
+            if orf not in spanning:
+                self.assertIn(orf, linear)
+        features = orf_features(record.seq, table=11, min_length=90, circular=True)
+        self.assertEqual(len(features), len(circular))
+        for feature, (start, end, strand) in zip(features, circular):
+            self.assertEqual(len(feature), end - start)
+            self.assertEqual(feature.location.strand, strand)
+            protein = feature.extract(record.seq).translate(table=11, cds=True)
+            self.assertEqual(len(protein), (end - start) // 3 - 1)
+
+    def test_find_orfs_in_records(self):
+        records = list(SeqIO.parse("GenBank/cor6_6.gb", "genbank"))
+        for record in records:
+            record.features = []
+        result = find_orfs_in_records(
+            records, min_length=60, workers=2, batch_size=1000
+        )
+        self.assertEqual(list(result), records)
+        for record in records:
+            features = orf_features(record.seq, min_length=60)
+            self.assertEqual(
+                [f.location for f in record.features],
+                [f.location for f in features],
+            )
+        self.assertEqual(
+            [len(record.features) for record in records], [6, 12, 6, 1, 3, 8]
+        )
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
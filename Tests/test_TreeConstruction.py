@@ -11,6 +11,8 @@ import unittest
 from io import StringIO
 from itertools import combinations
 
+import numpy as np
+
 from Bio import Align
 from Bio import AlignIO
 from Bio import Phylo
@@ -106,6 +108,24 @@ class DistanceMatrixTest(unittest.TestCase):
         self.assertEqual(dm.names, ["Beta", "Gamma", "Delta", "Alpha"])
         self.assertEqual(dm.matrix, [[0], [3, 0], [5, 6, 0], [1, 2, 4, 0]])
 
+    def test_negative_index(self):
+        dm = DistanceMatrix(self.names, self.matrix)
+        self.assertEqual(dm[-1], [4, 5, 6, 0])
+        self.assertEqual(dm[-1, 0], 4)
+        self.assertEqual(dm[1, -2], 3)
+        dm[-1, -2] = 7
+        self.assertEqual(dm["Gamma", "Delta"], 7)
+        dm[-3] = [10, 0, 30, 50]
+        self.assertEqual(dm["Beta"], [10, 0, 30, 50])
+        self.assertRaises(IndexError, dm.__getitem__, -5)
+        self.assertRaises(IndexError, dm.__getitem__, (0, -5))
+        del dm[-1]
+        self.assertEqual(dm.names, ["Alpha", "Beta", "Gamma"])
+        self.assertEqual(dm.matrix, [[0], [10, 0], [2, 30, 0]])
+        dm.insert("Delta", [4, 50, 0, 7], -1)
+        self.assertEqual(dm.names, ["Alpha", "Beta", "Delta", "Gamma"])
+        self.assertEqual(dm.matrix, [[0], [10, 0], [4, 50, 0], [2, 30, 7, 0]])
+
     def test_bad_manipulation(self):
         dm = DistanceMatrix(self.names, self.matrix)
         # getitem
@@ -127,6 +147,48 @@ class DistanceMatrixTest(unittest.TestCase):
         self.assertRaises(TypeError, dm.__setitem__, ("Alpha", "Beta"), "a")
         self.assertRaises(TypeError, dm.__setitem__, "Alpha", ["a", "b", "c"])
 
+    def test_array_construction(self):
+        condensed = np.array([1, 2, 4, 3, 5, 6])
+        dm = DistanceMatrix(self.names, condensed)
+        self.assertEqual(dm.matrix, self.matrix)
+        self.assertEqual(dm["Beta", "Delta"], 5)
+        self.assertEqual(dm[3], [4, 5, 6, 0])
+        square = np.array(dm)
+        self.assertEqual(square.shape, (4, 4))
+        self.assertTrue((square == square.T).all())
+        self.assertEqual(square[2, 3], 6)
+        dm = DistanceMatrix(list(self.names), square)
+        self.assertTrue((dm.condensed == condensed).all())
+        dm["Alpha", "Beta"] = 0.5
+        self.assertEqual(dm[1, 0], 0.5)
+        self.assertEqual(dm.condensed[0], 0.5)
+        del dm["Gamma"]
+        self.assertEqual(dm.matrix, [[0], [0.5, 0], [4, 5, 0]])
+        self.assertRaises(ValueError, DistanceMatrix, self.names, condensed[:5])
+        self.assertRaises(ValueError, DistanceMatrix, self.names, square[:3, :3])
+
+    def test_matrix_view(self):
+        dm = DistanceMatrix(self.names, self.matrix)
+        self.assertEqual(len(dm.matrix), 4)
+        self.assertEqual(dm.matrix[-1], [4, 5, 6, 0])
+        # assignments to the rows update the distance matrix
+        dm.matrix[2][1] = 7
+        self.assertEqual(dm["Beta", "Gamma"], 7)
+        row = dm.matrix[3]
+        row[0:2] = [8, 9]
+        row[-1] = 10  # diagonal, ignored
+        self.assertEqual(row, [8, 9, 6, 0])
+        self.assertEqual(dm[3], [8, 9, 6, 0])
+        dm.matrix[1] = [0.5, 0]
+        self.assertEqual(dm.matrix, [[0], [0.5, 0], [2, 7, 0], [8, 9, 6, 0]])
+        self.assertEqual(dm.condensed.tolist(), [0.5, 2, 8, 7, 9, 6])
+        # rows cannot be resized
+        self.assertRaises(TypeError, dm.matrix[1].append, 3)
+        self.assertRaises(TypeError, dm.matrix[1].__delitem__, 0)
+        self.assertRaises(ValueError, dm.matrix.__setitem__, 1, [1, 2, 0])
+        self.assertRaises(IndexError, dm.matrix.__getitem__, 4)
+        self.assertRaises(TypeError, dm.matrix[2].__setitem__, 0, "a")
+
     def test_format_phylip(self):
         dm = DistanceMatrix(self.names, self.matrix)
         handle = StringIO()
@@ -203,6 +265,33 @@ class DistanceCalculatorTest(unittest.TestCase):
         self.assertEqual(dmat["Alpha", "Alpha"], 0.0)
         self.assertAlmostEqual(dmat["Alpha", "Gamma"], 4.0 / 5.0)
 
+    def test_bad_letter(self):
+        aln = Align.read(StringIO(">Alpha\nAC-A\n>Beta\nAJ-A\n"), "fasta")
+        calculator = DistanceCalculator("blosum62")
+        with self.assertRaises(ValueError) as cm:
+            calculator.get_distance(aln)
+        self.assertEqual(
+            str(cm.exception), "Bad letter 'J' in sequence 'Beta' at position '1'"
+        )
+
+    def test_same_as_pairwise(self):
+        class PairwiseCalculator(DistanceCalculator):
+            def _pairwise(self, seq1, seq2):
+                return DistanceCalculator._pairwise(self, seq1, seq2)
+
+        msa = AlignIO.read("TreeConstruction/msa.phy", "phylip")
+        for model in ("identity", "blastn", "trans", "blosum62", "pam250"):
+            expected = PairwiseCalculator(model).get_distance(msa)
+            calculator = DistanceCalculator(model)
+            dm = calculator.get_distance(msa)
+            self.assertEqual(dm.names, expected.names)
+            self.assertEqual(dm.matrix, expected.matrix)
+            dm = calculator.get_distance(msa, workers=2)
+            self.assertEqual(dm.names, expected.names)
+            for row, expected_row in zip(dm.matrix, expected.matrix):
+                for value, expected_value in zip(row, expected_row):
+                    self.assertAlmostEqual(value, expected_value)
+
 
 class DistanceTreeConstructorTest(unittest.TestCase):
     """Test DistanceTreeConstructor."""
@@ -241,6 +330,19 @@ class DistanceTreeConstructorTest(unittest.TestCase):
         ):
             self.assertAlmostEqual(len1, len2)
 
+    def test_upgma_ties(self):
+        # In case of ties, the last pair of the lower triangular matrix is
+        # joined first, as in earlier versions of Biopython
+        dm = DistanceMatrix(list("ABCD"), [[0], [1, 0], [2, 2, 0], [2, 2, 2, 0]])
+        tree = self.constructor.upgma(dm)
+        handle = StringIO()
+        Phylo.write(tree, handle, "newick")
+        self.assertEqual(
+            handle.getvalue(),
+            "((D:1.00000,C:1.00000)Inner2:0.00000,"
+            "(B:0.50000,A:0.50000)Inner1:0.50000)Inner3:0.00000;\n",
+        )
+
     def test_nj_msa(self):
         tree = self.constructor.nj(self.dm_msa)
         self.assertIsInstance(tree, BaseTree.Tree)
@@ -283,6 +385,32 @@ class DistanceTreeConstructorTest(unittest.TestCase):
         ref_min_tree = Phylo.read("./TreeConstruction/nj_min.tre", "newick")
         self.assertTrue(Consensus._equal_topology(min_tree, ref_min_tree))
 
+    def test_rapidnj(self):
+        tree = self.constructor.rapidnj(self.dm)
+        ref_tree = Phylo.read("./TreeConstruction/nj.tre", "newick")
+        self.assertTrue(Consensus._equal_topology(tree, ref_tree))
+        constructor = DistanceTreeConstructor(DistanceCalculator("blosum62"), "rapidnj")
+        tree = constructor.build_tree(self.alignment)
+        self.assertTrue(Consensus._equal_topology(tree, ref_tree))
+
+    def test_large_matrix(self):
+        # compare the bounded search of rapidnj to the full search of nj
+        rng = np.random.default_rng(1)
+        points = rng.random((80, 3))
+        square = np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(-1))
+        names = [f"taxon{i}" for i in range(len(points))]
+        dm = DistanceMatrix(names, square)
+        nj_tree = self.constructor.nj(dm)
+        rapidnj_tree = self.constructor.rapidnj(dm)
+        self.assertTrue(Consensus._equal_topology(nj_tree, rapidnj_tree))
+        self.assertEqual(dm.matrix, DistanceMatrix(names, square).matrix)
+        tree = self.constructor.upgma(dm)
+        self.assertEqual(len(tree.get_terminals()), len(names))
+        # all terminals of an UPGMA tree are at the same depth
+        depths = [tree.distance(terminal) for terminal in tree.get_terminals()]
+        for depth in depths:
+            self.assertAlmostEqual(depth, depths[0])
+
     def test_built_tree_msa(self):
         tree = self.constructor.build_tree(self.msa)
         self.assertIsInstance(tree, BaseTree.Tree)
@@ -168,7 +168,7 @@ class BgzfTests(unittest.TestCase):
                 )
                 self.assertEqual(old, new)
 
-    def check_random(self, filename):
+    def check_random(self, filename, threads=1):
         """Check BGZF random access by reading blocks in forward & reverse order."""
         with gzip.open(filename, "rb") as h:
             old = h.read()
@@ -178,7 +178,7 @@ class BgzfTests(unittest.TestCase):
 
         # Forward, using explicit open/close
         new = b""
-        h = bgzf.BgzfReader(filename, "rb")
+        h = bgzf.BgzfReader(filename, "rb", threads=threads)
         self.assertTrue(h.seekable())
         self.assertFalse(h.isatty())
         self.assertEqual(h.fileno(), h._handle.fileno())
@@ -195,7 +195,7 @@ class BgzfTests(unittest.TestCase):
 
         # Reverse, using with statement
         new = b""
-        with bgzf.BgzfReader(filename, "rb") as h:
+        with bgzf.BgzfReader(filename, "rb", threads=threads) as h:
             for start, raw_len, data_start, data_len in blocks[::-1]:
                 h.seek(bgzf.make_virtual_offset(start, 0))
                 data = h.read(data_len)
@@ -207,7 +207,7 @@ class BgzfTests(unittest.TestCase):
 
         # Jump back - non-sequential seeking
         if len(blocks) >= 3:
-            h = bgzf.BgzfReader(filename, "rb", max_cache=1)
+            h = bgzf.BgzfReader(filename, "rb", max_cache=1, threads=threads)
             # Seek to a late block in the file,
             # half way into the third last block
             start, raw_len, data_start, data_len = blocks[-3]
@@ -240,7 +240,7 @@ class BgzfTests(unittest.TestCase):
                 real_offset = data_start + within_offset
                 v_offsets.append((voffset, real_offset))
         shuffle(v_offsets)
-        h = bgzf.BgzfReader(filename, "rb", max_cache=1)
+        h = bgzf.BgzfReader(filename, "rb", max_cache=1, threads=threads)
         for voffset, real_offset in v_offsets:
             h.seek(0)
             self.assertTrue(voffset >= 0 and real_offset >= 0)
@@ -263,6 +263,10 @@ class BgzfTests(unittest.TestCase):
         """Check random access to SamBam/ex1_header.bam."""
         self.check_random("SamBam/ex1_header.bam")
 
+    def test_random_bam_ex1_threads(self):
+        """Check random access to SamBam/ex1.bam using threads."""
+        self.check_random("SamBam/ex1.bam", threads=3)
+
     def test_random_wnts_xml(self):
         """Check random access to Blast/wnts.xml.bgz."""
         self.check_random("Blast/wnts.xml.bgz")
@@ -400,6 +404,31 @@ class BgzfTests(unittest.TestCase):
             self.assertEqual(offset1, h.tell())
             self.assertEqual(h.read(5), "Magic")
 
+    def test_write_threads(self):
+        """Check compressing blocks in a thread pool gives identical output."""
+        with open("Quality/example.fastq", "rb") as stream:
+            lines = stream.readlines() * 1000
+        outputs = []
+        offsets = []
+        for threads in (1, 4):
+            stream = io.BytesIO()
+            h = bgzf.BgzfWriter(fileobj=stream, threads=threads)
+            offsets.append([])
+            for i, line in enumerate(lines):
+                if i % 97 == 0:
+                    offsets[-1].append(h.tell())
+                h.write(line)
+            h.flush()
+            outputs.append(stream.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(offsets[0], offsets[1])
+        with bgzf.BgzfReader(fileobj=io.BytesIO(outputs[1]), mode="rb", threads=4) as h:
+            self.assertEqual(list(h), lines)
+            for i, offset in zip(range(0, len(lines), 97), offsets[1]):
+                h.seek(offset)
+                self.assertEqual(h.readline(), lines[i])
+        self.assertRaises(ValueError, bgzf.BgzfWriter, self.temp_file, threads=0)
+
     def test_append_mode(self):
         with bgzf.open(self.temp_file, "wb") as h:
             h.write(b">hello\n")
@@ -11,6 +11,7 @@
 import math
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import numpy as np
@@ -22,6 +23,7 @@ except ImportError:
     ) from None
 
 from Bio import motifs
+from Bio.motifs.matrix import search
 from Bio.Seq import Seq
 
 
@@ -5149,6 +5151,69 @@ class MotifTestPWM(unittest.TestCase):
         self.assertAlmostEqual(result[5], -25.18009186, places=5)
         self.assertTrue(math.isnan(result[6]), f"Expected nan, not {result[6]!r}")
 
+    def test_search(self):
+        """Test searching both strands with a PSSM."""
+        pssm = self.m.counts.normalize(pseudocounts=0.25).log_odds()
+        sequence = Seq("ACCATATAAGGCGTAGTACCTTATATGGAAGGACGCCTATATACGTGTAN")
+        hits = list(pssm.search(sequence, threshold=5.0))
+        self.assertEqual([int(position) for position, score in hits], [-49, 16, -32])
+        self.assertAlmostEqual(hits[0][1], 11.25223, places=5)
+        self.assertAlmostEqual(hits[1][1], 15.05729, places=5)
+        self.assertAlmostEqual(hits[2][1], 13.31295, places=5)
+        hits = list(pssm.search(sequence, threshold=5.0, both=False))
+        self.assertEqual([int(position) for position, score in hits], [16])
+        # search in small chunks
+        hits = list(pssm.search(sequence, threshold=5.0, chunksize=3))
+        self.assertEqual([int(position) for position, score in hits], [-49, 16, -32])
+
+    def test_search_many(self):
+        """Test searching several sequences with several PSSMs."""
+        pssm1 = self.m.counts.normalize(pseudocounts=0.25).log_odds()
+        pssm2 = motifs.create(["GATTA", "GATCA", "GATTA"]).pssm
+        pssms = [pssm1, pssm2]
+        sequences = [
+            Seq("ACCATATAAGGCGTAGTACCTTATATGGAAGGACGCCTATATACGTGTAN"),
+            "ggtgattaggtacac",
+            b"TAATCGATTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA",
+            "",
+        ]
+        thresholds = [5.0, 3.0]
+        for chunksize in (10**6, 7):
+            results = list(
+                search(pssms, sequences, threshold=thresholds, chunksize=chunksize)
+            )
+            self.assertEqual(len(results), len(sequences))
+            for sequence, hits in zip(sequences, results):
+                self.assertEqual(len(hits), len(pssms))
+                for pssm, threshold, (positions, scores) in zip(
+                    pssms, thresholds, hits
+                ):
+                    if len(sequence) < pssm.length:
+                        expected = []
+                    else:
+                        expected = list(pssm.search(sequence, threshold))
+                    self.assertEqual(
+                        positions.tolist(), [position for position, _ in expected]
+                    )
+                    self.assertEqual(scores.tolist(), [score for _, score in expected])
+        positions, scores = results[1][1]
+        self.assertEqual(positions.tolist(), [3])
+        positions, scores = results[2][1]
+        self.assertEqual(positions.tolist(), [-50, 5])
+        with ThreadPoolExecutor(2) as executor:
+            results2 = list(
+                search(pssms, sequences, threshold=thresholds, executor=executor)
+            )
+        for hits1, hits2 in zip(results, results2):
+            for (positions1, scores1), (positions2, scores2) in zip(hits1, hits2):
+                self.assertEqual(positions1.tolist(), positions2.tolist())
+                self.assertEqual(scores1.tolist(), scores2.tolist())
+        with self.assertRaises(ValueError):
+            search(pssms, sequences, threshold=[1.0, 2.0, 3.0])
+        protein = motifs.create(["ACDE", "ACDF"], alphabet="ACDEF").pssm
+        with self.assertRaises(ValueError):
+            search([protein], sequences)
+
     def test_calculate_pseudocounts(self):
         pseudocounts = motifs.jaspar.calculate_pseudocounts(self.m)
         self.assertAlmostEqual(pseudocounts["A"], 1.695582495781317, places=5)
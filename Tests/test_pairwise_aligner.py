@@ -22437,6 +22437,285 @@ AlignmentCounts object with
         )
 
 
+class TestScoreMany(unittest.TestCase):
+    query = "GAACTTGCAGTCAG"
+    targets = ["GAACT", "TTGCAGAACT", "A", "CTGACTGCAAGTTC", "GGGGGGGGGGGGGGGGGG"]
+
+    def check_scores(self, aligner):
+        for strand in "+-":
+            expected = [
+                aligner.score(self.query, target, strand) for target in self.targets
+            ]
+            scores = aligner.score_many(self.query, self.targets, strand)
+            self.assertIsInstance(scores, np.ndarray)
+            self.assertEqual(scores.tolist(), expected)
+            scores = aligner.score_many(self.query, self.targets, strand, threads=2)
+            self.assertEqual(scores.tolist(), expected)
+
+    def test_needlemanwunsch_smithwaterman(self):
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        aligner.gap_score = -2
+        for mode in ("global", "local"):
+            aligner.mode = mode
+            self.check_scores(aligner)
+
+    def test_gotoh(self):
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        aligner.open_gap_score = -3
+        aligner.extend_gap_score = -1
+        for mode in ("global", "local"):
+            aligner.mode = mode
+            self.check_scores(aligner)
+
+    def test_watermansmithbeyer(self):
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        aligner.gap_score = lambda x, y: -2 - y
+        for mode in ("global", "local"):
+            aligner.mode = mode
+            self.check_scores(aligner)
+
+    def test_fogsaa(self):
+        aligner = Align.PairwiseAligner(mode="fogsaa")
+        self.check_scores(aligner)
+
+    def test_substitution_matrix(self):
+        aligner = Align.PairwiseAligner(scoring="blastn")
+        self.check_scores(aligner)
+        # the input arrays are not modified by mapping the letters
+        query = np.frombuffer(bytearray(self.query, "utf-32-le"), np.int32).copy()
+        targets = [np.array([ord(letter) for letter in "GAACT"], np.int32)]
+        aligner.score_many(query, targets)
+        self.assertEqual(query.tobytes().decode("utf-32-le"), self.query)
+        self.assertEqual(bytes(targets[0].astype(np.uint8)), b"GAACT")
+
+    def test_empty(self):
+        aligner = Align.PairwiseAligner()
+        scores = aligner.score_many(self.query, [], threads=4)
+        self.assertEqual(scores.shape, (0,))
+        with self.assertRaises(ValueError):
+            aligner.score_many(self.query, ["GAACT", ""])
+
+
+class TestStripedScore(unittest.TestCase):
+    """Check the score calculated without a traceback against align."""
+
+    def setUp(self):
+        rng = np.random.default_rng(seed=12)
+        letters = np.array(list("ACGT"))
+        self.sequences = [
+            "".join(rng.choice(letters, size=n)) for n in (1, 7, 300, 1000)
+        ]
+        # similar sequences, so that local scores exceed the 8-bit range
+        target = self.sequences[-1]
+        self.sequences.append(target[:400] + "GATTACA" + target[410:])
+
+    def check_scores(self, aligner):
+        for mode in ("global", "local"):
+            aligner.mode = mode
+            for seqA in self.sequences:
+                for seqB in self.sequences:
+                    if len(seqA) * len(seqB) > 1000 * 300:
+                        continue
+                    for strand in "+-":
+                        score = aligner.score(seqA, seqB, strand)
+                        alignments = aligner.align(seqA, seqB, strand)
+                        self.assertEqual(score, alignments.score)
+        aligner.mode = "local"
+        seqA = self.sequences[-2]
+        seqB = self.sequences[-1]
+        self.assertEqual(aligner.score(seqA, seqB), aligner.align(seqA, seqB).score)
+
+    def test_match_mismatch(self):
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-3)
+        aligner.gap_score = -5
+        self.check_scores(aligner)
+        aligner.wildcard = "N"
+        aligner.open_gap_score = -7
+        aligner.extend_gap_score = -2
+        self.check_scores(aligner)
+
+    def test_substitution_matrix(self):
+        aligner = Align.PairwiseAligner(scoring="blastn")
+        self.check_scores(aligner)
+        aligner.gap_score = 0
+        self.check_scores(aligner)
+
+    def test_end_gaps(self):
+        aligner = Align.PairwiseAligner(match_score=1, mismatch_score=-1)
+        aligner.open_gap_score = -2
+        aligner.extend_gap_score = -1
+        aligner.end_gap_score = 0
+        self.check_scores(aligner)
+
+    def test_nonintegral_scores(self):
+        aligner = Align.PairwiseAligner(match_score=1.5, mismatch_score=-1)
+        aligner.gap_score = -2.5
+        self.check_scores(aligner)
+
+
+class TestLinearMemory(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=13)
+        letters = np.array(list("ACGT"))
+        target = rng.choice(letters, size=1500)
+        query = target.copy()
+        positions = rng.choice(len(query), size=150, replace=False)
+        query[positions] = rng.choice(letters, size=150)
+        query = np.concatenate([query[:400], query[420:1000], letters, query[1000:]])
+        self.target = "".join(target)
+        self.query = "".join(query)
+
+    def check_alignment(self, aligner, target, query, strand="+"):
+        alignments = aligner.align(target, query, strand, linear_memory=True)
+        self.assertEqual(len(alignments), 1)
+        alignment = alignments[0]
+        score = aligner.score(target, query, strand)
+        self.assertAlmostEqual(alignments.score, score)
+        self.assertAlmostEqual(alignment.score, score)
+        self.assertAlmostEqual(alignment.counts(aligner).score, score)
+        return alignment
+
+    def test_short(self):
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        aligner.open_gap_score = -2
+        aligner.extend_gap_score = -0.5
+        for mode in ("global", "local"):
+            aligner.mode = mode
+            for target, query in (("GAACT", "GAT"), ("TACCG", "ACG"), ("A", "A")):
+                alignment = self.check_alignment(aligner, target, query)
+                self.assertIn(alignment, list(aligner.align(target, query)))
+
+    def test_global(self):
+        aligner = Align.PairwiseAligner(scoring="blastn")
+        for strand in "+-":
+            if strand == "+":
+                query = self.query
+            else:
+                query = reverse_complement(self.query)
+            alignment = self.check_alignment(aligner, self.target, query, strand)
+            coordinates = alignment.coordinates
+            self.assertEqual(coordinates[0, 0], 0)
+            self.assertEqual(coordinates[0, -1], len(self.target))
+            if strand == "+":
+                self.assertEqual(coordinates[1, 0], 0)
+                self.assertEqual(coordinates[1, -1], len(query))
+            else:
+                self.assertEqual(coordinates[1, 0], len(query))
+                self.assertEqual(coordinates[1, -1], 0)
+        aligner.end_gap_score = 0
+        self.check_alignment(aligner, self.target[100:], self.query[:-100])
+        # FOGSAA finds global alignments
+        aligner.end_gap_score = -4
+        score = aligner.score(self.target, self.query)
+        aligner.mode = "fogsaa"
+        alignments = aligner.align(self.target, self.query, linear_memory=True)
+        self.assertAlmostEqual(alignments.score, score)
+
+    def test_local(self):
+        aligner = Align.PairwiseAligner(mode="local", scoring="blastn")
+        query = "GGGGGGGGGG" + self.query[200:1200] + "CCCCCCCCCC"
+        alignment = self.check_alignment(aligner, self.target, query)
+        self.assertGreaterEqual(alignment.coordinates[0, 0], 190)
+        self.assertLessEqual(alignment.coordinates[0, -1], 1230)
+        aligner.gap_score = -3
+        self.check_alignment(aligner, self.target, query)
+        aligner.mismatch_score = -1
+        alignments = aligner.align("AAAA", "TTT", linear_memory=True)
+        self.assertEqual(len(alignments), 0)
+        self.assertEqual(alignments.score, 0)
+
+    def test_gap_function(self):
+        aligner = Align.PairwiseAligner()
+        aligner.gap_score = lambda x, y: -2 - y
+        with self.assertRaises(ValueError):
+            aligner.align(self.target, self.query, linear_memory=True)
+
+
+class TestBanded(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(seed=14)
+        letters = np.array(list("ACGT"))
+        target = rng.choice(letters, size=1000)
+        query = target.copy()
+        positions = rng.choice(len(query), size=100, replace=False)
+        query[positions] = rng.choice(letters, size=100)
+        query = np.concatenate([query[:300], query[305:700], letters, query[700:]])
+        self.target = "".join(target)
+        self.query = "".join(query)
+
+    def check_band(self, aligner, target, query, strand="+"):
+        score = aligner.score(target, query, strand)
+        alignments = aligner.align(target, query, strand)
+        self.assertEqual(len(alignments), 1)
+        alignment = alignments[0]
+        self.assertAlmostEqual(alignments.score, score)
+        self.assertAlmostEqual(alignment.counts(aligner).score, score)
+        coordinates = alignment.coordinates.copy()
+        if strand == "-":
+            coordinates[1, :] = len(query) - coordinates[1, :]
+        offsets = coordinates[1, :] - coordinates[0, :]
+        difference = len(query) - len(target)
+        self.assertGreaterEqual(min(offsets), min(0, difference) - aligner.band_width)
+        self.assertLessEqual(max(offsets), max(0, difference) + aligner.band_width)
+        return score
+
+    def test_global(self):
+        aligner = Align.PairwiseAligner(scoring="blastn")
+        score = aligner.score(self.target, self.query)
+        aligner.band_width = 10
+        self.assertEqual(self.check_band(aligner, self.target, self.query), score)
+        query = reverse_complement(self.query)
+        self.assertEqual(self.check_band(aligner, self.target, query, "-"), score)
+        aligner.band_width = 2
+        self.assertLess(self.check_band(aligner, self.target, self.query), score)
+        aligner.band_width = 0
+        self.check_band(aligner, self.target, self.query)
+
+    def test_local(self):
+        aligner = Align.PairwiseAligner(mode="local", scoring="blastn")
+        # the local alignment is on the diagonal j - i = 50
+        query = "G" * 150 + self.query[100:900] + "C" * 50
+        score = aligner.score(self.target, query)
+        aligner.band_width = 100
+        self.assertEqual(self.check_band(aligner, self.target, query), score)
+        aligner.band_width = 20
+        self.assertLess(self.check_band(aligner, self.target, query), score)
+        alignments = aligner.align("AAAA", "TTT")
+        self.assertEqual(len(alignments), 0)
+
+    def test_score_many(self):
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        aligner.gap_score = -2
+        aligner.band_width = 1
+        queries = ["GAACT", "TTGCAGAACT", "CTGACTGCAAGTTC"]
+        scores = aligner.score_many("GAACTTGCAGTCAG", queries)
+        expected = [aligner.score("GAACTTGCAGTCAG", query) for query in queries]
+        self.assertEqual(scores.tolist(), expected)
+
+    def test_attribute(self):
+        aligner = Align.PairwiseAligner()
+        self.assertIsNone(aligner.band_width)
+        self.assertNotIn("band_width", str(aligner))
+        aligner.band_width = 5
+        self.assertEqual(aligner.band_width, 5)
+        self.assertIn("band_width: 5", str(aligner))
+        state = aligner.__getstate__()
+        other = Align.PairwiseAligner()
+        other.__setstate__(state)
+        self.assertEqual(other.band_width, 5)
+        with self.assertRaises(ValueError):
+            aligner.band_width = -1
+        with self.assertRaises(TypeError):
+            aligner.band_width = 2.5
+        aligner.gap_score = lambda x, y: -2 - y
+        with self.assertRaises(ValueError):
+            aligner.score("GAACT", "GAT")
+        with self.assertRaises(ValueError):
+            aligner.align("GAACT", "GAT")
+        aligner.band_width = None
+        self.assertEqual(aligner.score("GAACT", "GAT"), -1)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
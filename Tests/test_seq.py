@@ -1203,6 +1203,57 @@ class TestTranslating(unittest.TestCase):
             self.assertTrue(message.startswith("This table contains"))
             self.assertTrue(message.endswith("be translated as amino acid."))
 
+    def test_translation_of_long_sequences(self):
+        """Check invalid codons, stop codons, and gaps in the same sequence."""
+        seq = "ATGAARNNNTAR" * 100 + "AA?" + "TGA"
+        with self.assertRaises(TranslationError) as cm:
+            Seq.translate(seq)
+        self.assertEqual(str(cm.exception), "Codon 'AA?' is invalid")
+        self.assertEqual(Seq.translate(seq, to_stop=True), "MKX")
+        with self.assertRaises(TranslationError) as cm:
+            Seq.translate("ATG" + seq, cds=True)
+        self.assertEqual(str(cm.exception), "Extra in frame stop codon 'TAR' found.")
+        seq = seq.replace("?", "A").lower() + "---"
+        self.assertEqual(Seq.translate(seq[:-3]), "MKX*" * 100 + "K*")
+        self.assertEqual(Seq.translate(seq, gap="-"), "MKX*" * 100 + "K*-")
+        self.assertEqual(
+            Seq.translate(seq, stop_symbol="@", gap="-"), "MKX@" * 100 + "K@-"
+        )
+        # stop symbols of more than one character are also accepted
+        self.assertEqual(
+            Seq.translate(seq, stop_symbol="[]", gap="-"), "MKX[]" * 100 + "K[]-"
+        )
+
+    def test_translate_six_frames(self):
+        sequences = [
+            "ATGGCCATTGTAATGGGCCGCTGA",
+            Seq.Seq("AUGGCCAUUGUAAUGGGCCGCUGA"),
+            Seq.MutableSeq("atggccattgtaatgggccgctgann"),
+            "",
+            "AC",
+        ]
+        results = Seq.translate_six_frames(sequences)
+        self.assertEqual(len(results), len(sequences))
+        for sequence, frames in zip(sequences, results):
+            n = len(sequence)
+            rc = Seq.reverse_complement(sequence)
+            expected = [
+                Seq.translate(strand[i : i + (n - i) // 3 * 3])
+                for strand in (sequence, rc)
+                for i in range(3)
+            ]
+            self.assertEqual(list(frames), expected)
+            for frame in frames:
+                self.assertIsInstance(frame, type(expected[0]))
+        self.assertEqual(
+            Seq.translate_six_frames(["ATGTGACCC"], table=2, stop_symbol="@"),
+            [("MWP", "CD", "VT", "GSH", "GH", "VT")],
+        )
+        results = Seq.translate_six_frames(["------"], gap="-")
+        self.assertEqual(results, [("--", "-", "-", "--", "-", "-")])
+        self.assertRaises(TranslationError, Seq.translate_six_frames, ["ATG---TAA"])
+        self.assertRaises(TypeError, Seq.translate_six_frames, "ATGTGA")
+
 
 class TestStopCodons(unittest.TestCase):
     def setUp(self):